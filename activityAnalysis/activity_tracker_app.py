@@ -1,7 +1,6 @@
 import os
 import re
 import sys
-import tempfile
 
 import streamlit as st
 
@@ -72,6 +71,24 @@ from officials_analysis_models import (
     Appointments,
     Assignment,
 )
+try:
+    from activityAnalysis.query_cache import (
+        ASSIGNMENT_TABLES,
+        DIRECTORY_TABLES,
+        PROTOCOL_TABLES,
+        TABLE_APPOINTMENTS,
+        cached_query,
+        query_cache,
+    )
+except ModuleNotFoundError:
+    from query_cache import (
+        ASSIGNMENT_TABLES,
+        DIRECTORY_TABLES,
+        PROTOCOL_TABLES,
+        TABLE_APPOINTMENTS,
+        cached_query,
+        query_cache,
+    )
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -79,10 +96,15 @@ from datetime import date, datetime
 
 engine = get_engine()
 
-# Streamlit ``st.cache_data`` expiry (seconds) for DB-backed loaders in this app.
-# Capped TTL keeps new competitions/assignments visible without restarting; raise if DB is
-# quiet and you want fewer queries. Use sidebar **Refresh data now** to invalidate immediately.
+# Streamlit ``st.cache_data`` expiry (seconds) for the qualifying availability page.
+# The report loaders below use the shared ``query_cache`` instead: entries are reused
+# across sessions until a write bumps one of the tables they read. Use sidebar
+# **Refresh data now** to drop every entry immediately.
 _ACTIVITY_CACHE_TTL_SEC = 120
+# Tables read by the loaders: directory + assignments, plus protocol panels for the
+# segment-based reports (NQS, total activity, per-person segment activity).
+_DIRECTORY_ASSIGNMENT_TABLES = DIRECTORY_TABLES + ASSIGNMENT_TABLES
+_ALL_ACTIVITY_TABLES = _DIRECTORY_ASSIGNMENT_TABLES + PROTOCOL_TABLES
 
 NATIONAL_LEVEL_ID = 7
 SYNCHRO_DISCIPLINE_ID = 2
@@ -608,6 +630,12 @@ def _activity_stop() -> None:
     st.stop()
 
 
+st.sidebar.caption(query_cache.stats_caption())
+if st.sidebar.button("Refresh data now"):
+    query_cache.clear()
+    st.rerun()
+
+
 report_mode = st.radio(
     "Report",
     options=_ACTIVITY_REPORT_OPTIONS,
@@ -640,7 +668,7 @@ SUMMARY_COMPETITION_TYPES = {
 }
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query((TABLE_APPOINTMENTS,))
 def load_appt_data_date():
     """Most recent achieved_date across all appointments — used as the data currency note."""
     from sqlalchemy import func as sqlfunc
@@ -651,14 +679,14 @@ def load_appt_data_date():
     return result
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(DIRECTORY_TABLES)
 def load_appointments_achieved_date_report(start_d, end_d, active_only: bool):
     return get_appointments_by_achieved_date_range(
         start_d, end_d, active_only=active_only
     )
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(DIRECTORY_TABLES)
 def load_all_appt_types(active_appointments_only: bool = True):
     with Session(engine) as session:
         q = (
@@ -674,7 +702,7 @@ def load_all_appt_types(active_appointments_only: bool = True):
     return {name: id_ for id_, name in rows}
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_DIRECTORY_ASSIGNMENT_TABLES)
 def load_disciplines_for_appt_type(
     appointment_type_id,
     include_sectional_appointment_levels: bool,
@@ -767,7 +795,7 @@ def load_disciplines_for_appt_type(
     return result
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_ALL_ACTIVITY_TABLES)
 def load_nqs_activity_table(
     official_type: str,
     discipline: str,
@@ -789,7 +817,7 @@ def load_nqs_activity_table(
     )
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_ALL_ACTIVITY_TABLES)
 def load_total_activity_across_seasons_table(
     official_type: str,
     discipline: str,
@@ -1422,7 +1450,7 @@ def normalize_df(df):
     return df, year_cols
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_DIRECTORY_ASSIGNMENT_TABLES)
 def load_matrix(
     discipline_id,
     appointment_type_id,
@@ -1440,7 +1468,7 @@ def load_matrix(
     )
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_DIRECTORY_ASSIGNMENT_TABLES)
 def load_matrix_sectionals(
     discipline_id,
     appointment_type_id,
@@ -1455,7 +1483,7 @@ def load_matrix_sectionals(
     )
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_DIRECTORY_ASSIGNMENT_TABLES)
 def load_sectional_region_rows(
     discipline_id,
     appointment_type_id,
@@ -1470,7 +1498,7 @@ def load_sectional_region_rows(
     )
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_DIRECTORY_ASSIGNMENT_TABLES)
 def load_any_role_data(official_ids_tuple, competition_scope, include_lower_levels):
     return get_any_role_years(
         list(official_ids_tuple),
@@ -1479,7 +1507,7 @@ def load_any_role_data(official_ids_tuple, competition_scope, include_lower_leve
     )
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_DIRECTORY_ASSIGNMENT_TABLES)
 def load_chief_data(
     official_ids_tuple,
     discipline_id,
@@ -1496,7 +1524,7 @@ def load_chief_data(
     )
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_DIRECTORY_ASSIGNMENT_TABLES)
 def load_all_lower_level_only_years(
     official_ids_tuple,
     discipline_id,
@@ -1511,27 +1539,27 @@ def load_all_lower_level_only_years(
     )
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_DIRECTORY_ASSIGNMENT_TABLES)
 def load_appt_has_chiefs(appointment_type_id):
     return appointment_type_has_chiefs(appointment_type_id)
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_DIRECTORY_ASSIGNMENT_TABLES)
 def load_assigned_summary(competition_type_ids_tuple):
     return get_assigned_competition_counts(list(competition_type_ids_tuple))
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_DIRECTORY_ASSIGNMENT_TABLES)
 def load_competition_count(competition_type_ids_tuple):
     return get_competition_count_for_types(list(competition_type_ids_tuple))
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_DIRECTORY_ASSIGNMENT_TABLES)
 def load_referee_discipline_options(comp_group_name):
     return get_referee_discipline_options_for_comp_group(comp_group_name)
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_DIRECTORY_ASSIGNMENT_TABLES)
 def load_referee_competition_count(
     competition_type_ids_tuple, discipline_id_sentinel, comp_group_name
 ):
@@ -1544,7 +1572,7 @@ def load_referee_competition_count(
     )
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_DIRECTORY_ASSIGNMENT_TABLES)
 def load_referee_yearly_report(
     competition_type_ids_tuple,
     discipline_id_sentinel,
@@ -1561,32 +1589,32 @@ def load_referee_yearly_report(
     )
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(DIRECTORY_TABLES)
 def load_all_directory_officials():
     return get_all_directory_officials()
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_DIRECTORY_ASSIGNMENT_TABLES)
 def load_person_assignment_rows(official_id: int):
     return get_official_assignment_detail_rows(int(official_id))
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_ALL_ACTIVITY_TABLES)
 def load_person_segment_official_activity_detail(official_id: int):
     return get_official_segment_official_activity_detail(int(official_id))
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(DIRECTORY_TABLES)
 def load_person_appointment_rows(official_id: int, *, active_only: bool = True):
     return get_official_appointment_rows(int(official_id), active_only=active_only)
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_DIRECTORY_ASSIGNMENT_TABLES)
 def load_competitions_report_dropdown():
     return get_competitions_for_report_dropdown()
 
 
-@st.cache_data(ttl=_ACTIVITY_CACHE_TTL_SEC)
+@cached_query(_DIRECTORY_ASSIGNMENT_TABLES)
 def load_competition_assignment_rows(competition_id: int):
     return get_competition_assignment_rows(int(competition_id))
 
@@ -0,0 +1,292 @@
+"""
+Set-based assignment import for the activity tracker's Excel loaders.
+
+A loader resolves its sheet into one typed frame (competition year / name / type,
+official, discipline, appointment type, chief and lower-levels flags). Planning matches
+that frame against existing competitions and assignments with one query each and marks
+every row ``insert``, ``update`` (flags changed) or ``unchanged``. The plan doubles as
+the dry-run diff. Applying it bulk inserts missing competitions and new assignments,
+bulk updates changed flags and refreshes the touched competitions' activity facts in
+the caller's transaction (no commit).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pandas as pd
+from sqlalchemy import insert, select, update
+
+try:
+    from activityAnalysis.officials_analysis_models import Assignment, Competition
+    from activityAnalysis.official_activity_fact import refresh_assignment_facts
+except ModuleNotFoundError:
+    from officials_analysis_models import Assignment, Competition  # type: ignore[no-redef]
+    from official_activity_fact import refresh_assignment_facts  # type: ignore[no-redef]
+
+IMPORT_ACTION_INSERT = "insert"
+IMPORT_ACTION_UPDATE = "update"
+IMPORT_ACTION_UNCHANGED = "unchanged"
+
+ASSIGNMENT_IMPORT_COLUMNS = [
+    "year",
+    "competition_name",
+    "competition_type_id",
+    "official_id",
+    "discipline_id",
+    "appointment_type_id",
+    "chief",
+    "lower_levels_only",
+]
+_ASSIGNMENT_KEY = ["competition_id", "official_id", "discipline_id", "appointment_type_id"]
+_INT_COLUMNS = [
+    "year",
+    "competition_type_id",
+    "official_id",
+    "discipline_id",
+    "appointment_type_id",
+]
+
+
+@dataclass
+class AssignmentImportPlan:
+    """Import rows with their ``action``; ``new_competitions`` are created on apply."""
+
+    rows: pd.DataFrame
+    new_competitions: pd.DataFrame
+    match_competitions_by_type_and_year: bool = False
+
+    def counts(self) -> dict[str, int]:
+        actions = self.rows["action"].value_counts()
+        return {
+            "insert": int(actions.get(IMPORT_ACTION_INSERT, 0)),
+            "update": int(actions.get(IMPORT_ACTION_UPDATE, 0)),
+            "unchanged": int(actions.get(IMPORT_ACTION_UNCHANGED, 0)),
+            "new_competitions": len(self.new_competitions),
+        }
+
+    def changes(self) -> pd.DataFrame:
+        """Inserted and updated rows (the diff shown by dry runs)."""
+        return self.rows.loc[self.rows["action"] != IMPORT_ACTION_UNCHANGED].reset_index(
+            drop=True
+        )
+
+
+def _competition_key_columns(match_by_type_and_year: bool) -> list[str]:
+    if match_by_type_and_year:
+        return ["year", "competition_type_id"]
+    return ["year", "competition_name", "competition_type_id"]
+
+
+def _typed_import_frame(pending: pd.DataFrame) -> pd.DataFrame:
+    frame = pending[ASSIGNMENT_IMPORT_COLUMNS].copy()
+    for col in _INT_COLUMNS:
+        frame[col] = pd.to_numeric(frame[col], errors="raise").astype("int64")
+    frame["competition_name"] = frame["competition_name"].astype(str)
+    for col in ("chief", "lower_levels_only"):
+        frame[col] = frame[col].fillna(False).astype(bool)
+    return frame
+
+
+def _existing_competitions(session, frame: pd.DataFrame) -> pd.DataFrame:
+    rows = session.execute(
+        select(
+            Competition.id.label("competition_id"),
+            Competition.year,
+            Competition.name.label("competition_name"),
+            Competition.competition_type_id,
+        )
+        .where(
+            Competition.year.in_(sorted(frame["year"].unique().tolist())),
+            Competition.competition_type_id.in_(
+                sorted(frame["competition_type_id"].unique().tolist())
+            ),
+        )
+        .order_by(Competition.id)
+    ).all()
+    comps = pd.DataFrame(
+        rows, columns=["competition_id", "year", "competition_name", "competition_type_id"]
+    )
+    return comps.astype(
+        {"competition_id": "int64", "year": "int64", "competition_type_id": "int64"}
+    )
+
+
+def _existing_assignments(session, competition_ids: list[int]) -> pd.DataFrame:
+    cols = ["assignment_id", *_ASSIGNMENT_KEY, "current_chief", "current_lower_levels_only"]
+    if not competition_ids:
+        return pd.DataFrame(columns=cols)
+    rows = session.execute(
+        select(
+            Assignment.id,
+            Assignment.competition_id,
+            Assignment.official_id,
+            Assignment.discipline_id,
+            Assignment.appointment_type_id,
+            Assignment.chief,
+            Assignment.lower_levels_only,
+        ).where(Assignment.competition_id.in_(competition_ids))
+    ).all()
+    return pd.DataFrame(rows, columns=cols)
+
+
+def plan_assignment_import(
+    session,
+    pending: pd.DataFrame,
+    *,
+    match_competitions_by_type_and_year: bool = False,
+) -> AssignmentImportPlan:
+    """
+    Classify ``pending`` rows (``ASSIGNMENT_IMPORT_COLUMNS``) against the database.
+
+    Competitions match on (year, name, type), or on (year, type) for sectional sheets
+    where several column titles describe the same event (first existing id wins, as in
+    ``get_or_create_competition``). Repeated assignment keys keep the first row.
+    """
+    frame = _typed_import_frame(pending)
+    comp_key = _competition_key_columns(match_competitions_by_type_and_year)
+    if frame.empty:
+        return AssignmentImportPlan(
+            rows=frame.assign(competition_id=pd.NA, assignment_id=pd.NA, action=None),
+            new_competitions=pd.DataFrame(columns=comp_key),
+            match_competitions_by_type_and_year=match_competitions_by_type_and_year,
+        )
+
+    comps = _existing_competitions(session, frame)
+    comps = comps.drop_duplicates(subset=comp_key, keep="first")
+    frame = frame.merge(comps[[*comp_key, "competition_id"]], on=comp_key, how="left")
+    frame["competition_id"] = frame["competition_id"].astype("Int64")
+
+    new_competitions = (
+        frame.loc[
+            frame["competition_id"].isna(), ["year", "competition_name", "competition_type_id"]
+        ]
+        .drop_duplicates(subset=comp_key, keep="first")
+        .reset_index(drop=True)
+    )
+
+    # New competitions get their id on apply; key rows on the competition key meanwhile.
+    frame = frame.drop_duplicates(
+        subset=[*comp_key, "official_id", "discipline_id", "appointment_type_id"],
+        keep="first",
+    ).reset_index(drop=True)
+
+    existing = _existing_assignments(
+        session, sorted(frame["competition_id"].dropna().astype(int).unique().tolist())
+    )
+    if existing.empty:
+        frame["assignment_id"] = pd.Series(pd.NA, index=frame.index, dtype="Int64")
+        frame["action"] = IMPORT_ACTION_INSERT
+    else:
+        existing = existing.astype(
+            {
+                **{c: "Int64" for c in ["assignment_id", *_ASSIGNMENT_KEY]},
+                "current_chief": "boolean",
+                "current_lower_levels_only": "boolean",
+            }
+        )
+        frame = frame.merge(existing, on=_ASSIGNMENT_KEY, how="left")
+        found = frame["assignment_id"].notna()
+        changed = found & (
+            (frame["current_chief"].fillna(False).astype(bool) != frame["chief"])
+            | (
+                frame["current_lower_levels_only"].fillna(False).astype(bool)
+                != frame["lower_levels_only"]
+            )
+        )
+        frame["action"] = IMPORT_ACTION_INSERT
+        frame.loc[found, "action"] = IMPORT_ACTION_UNCHANGED
+        frame.loc[changed, "action"] = IMPORT_ACTION_UPDATE
+        frame = frame.drop(columns=["current_chief", "current_lower_levels_only"])
+
+    return AssignmentImportPlan(
+        rows=frame,
+        new_competitions=new_competitions,
+        match_competitions_by_type_and_year=match_competitions_by_type_and_year,
+    )
+
+
+def apply_assignment_import(session, plan: AssignmentImportPlan) -> dict[str, int]:
+    """
+    Write ``plan``: bulk insert competitions and assignments, bulk update changed flags,
+    refresh activity facts for the touched competitions. Flushes; does not commit.
+    """
+    rows = plan.rows.copy()
+    comp_key = _competition_key_columns(plan.match_competitions_by_type_and_year)
+    if not plan.new_competitions.empty:
+        created = session.execute(
+            insert(Competition).returning(
+                Competition.id, Competition.year, Competition.name, Competition.competition_type_id
+            ),
+            [
+                {
+                    "year": int(r.year),
+                    "name": str(r.competition_name),
+                    "competition_type_id": int(r.competition_type_id),
+                }
+                for r in plan.new_competitions.itertuples(index=False)
+            ],
+        ).all()
+        created_df = pd.DataFrame(
+            created,
+            columns=["new_competition_id", "year", "competition_name", "competition_type_id"],
+        ).astype({"year": "int64", "competition_type_id": "int64"})
+        rows = rows.merge(created_df[[*comp_key, "new_competition_id"]], on=comp_key, how="left")
+        rows["competition_id"] = rows["competition_id"].fillna(rows["new_competition_id"])
+        rows = rows.drop(columns=["new_competition_id"])
+
+    inserts = rows.loc[rows["action"] == IMPORT_ACTION_INSERT]
+    if not inserts.empty:
+        session.execute(
+            insert(Assignment),
+            [
+                {
+                    "competition_id": int(r.competition_id),
+                    "official_id": int(r.official_id),
+                    "discipline_id": int(r.discipline_id),
+                    "appointment_type_id": int(r.appointment_type_id),
+                    "chief": bool(r.chief),
+                    "lower_levels_only": bool(r.lower_levels_only),
+                }
+                for r in inserts.itertuples(index=False)
+            ],
+        )
+    updates = rows.loc[rows["action"] == IMPORT_ACTION_UPDATE]
+    if not updates.empty:
+        session.execute(
+            update(Assignment),
+            [
+                {
+                    "id": int(r.assignment_id),
+                    "chief": bool(r.chief),
+                    "lower_levels_only": bool(r.lower_levels_only),
+                }
+                for r in updates.itertuples(index=False)
+            ],
+        )
+    competition_ids = set(rows["competition_id"].dropna().astype(int).tolist())
+    if competition_ids:
+        refresh_assignment_facts(session, competition_ids)
+    session.flush()
+    counts = plan.counts()
+    counts["competitions_touched"] = len(competition_ids)
+    return counts
+
+
+def import_assignments(
+    session,
+    pending: pd.DataFrame,
+    *,
+    match_competitions_by_type_and_year: bool = False,
+    dry_run: bool = False,
+) -> AssignmentImportPlan:
+    """Plan ``pending`` and, unless ``dry_run``, apply it. Returns the plan (diff)."""
+    plan = plan_assignment_import(
+        session,
+        pending,
+        match_competitions_by_type_and_year=match_competitions_by_type_and_year,
+    )
+    if not dry_run:
+        apply_assignment_import(session, plan)
+    return plan
+
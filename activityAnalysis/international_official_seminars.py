@@ -18,6 +18,7 @@ try:
     )
     from activityAnalysis.international_officials_data import _nullable_int_for_sql
     from activityAnalysis.load_activity_data import activity_database_is_postgresql, engine
+    from activityAnalysis.query_cache import TABLE_ISU_OFFICIAL_SEMINAR, bump_table_versions
 except ModuleNotFoundError:
     from international_listing_seasons import (
         competition_year_matches_seasons,
@@ -26,6 +27,7 @@ except ModuleNotFoundError:
     )
     from international_officials_data import _nullable_int_for_sql
     from load_activity_data import activity_database_is_postgresql, engine
+    from query_cache import TABLE_ISU_OFFICIAL_SEMINAR, bump_table_versions  # type: ignore[no-redef]
 
 SINGLES_PAIRS_DISCIPLINE_IDS: frozenset[int] = frozenset({1, 8, 9})
 DISCIPLINE_ID_SINGLES = 1
@@ -434,6 +436,7 @@ def insert_seminar_row(
     }
     with Session(engine) as session:
         new_id = session.execute(stmt, params).scalar_one()
+        bump_table_versions(session, (TABLE_ISU_OFFICIAL_SEMINAR,))
         session.commit()
     return int(new_id)
 
@@ -481,6 +484,7 @@ def update_seminar_row(
             ),
             params,
         )
+        bump_table_versions(session, (TABLE_ISU_OFFICIAL_SEMINAR,))
         session.commit()
 
 
@@ -496,5 +500,6 @@ def delete_seminar_rows(seminar_ids: list[int]) -> int:
     ).bindparams(bindparam("ids", expanding=True))
     with Session(engine) as session:
         result = session.execute(stmt, {"ids": ids})
+        bump_table_versions(session, (TABLE_ISU_OFFICIAL_SEMINAR,))
         session.commit()
         return int(result.rowcount or 0)
@@ -8,6 +8,7 @@ Run:
 
 from __future__ import annotations
 
+import io
 import os
 import sys
 
@@ -96,10 +97,10 @@ from activityAnalysis.international_officials_detail import (
     render_detail_appointment_nav,
     switch_to_summary_view,
 )
-from activityAnalysis.international_officials_report import (
-    build_bulk_appointment_reports_zip,
-    bulk_reports_zip_filename,
+from activityAnalysis.international_officials_bulk_reports import (
+    write_bulk_appointment_reports_zip,
 )
+from activityAnalysis.international_officials_report import bulk_reports_zip_filename
 from activityAnalysis.international_segment_eligibility import (
     enrich_panel_with_rule411_eligibility,
 )
@@ -111,6 +112,16 @@ from activityAnalysis.international_requirements import (
 )
 from activityAnalysis.load_activity_data import activity_database_is_postgresql, get_engine
 from activityAnalysis.officials_analysis_models import Appointments
+from activityAnalysis.query_cache import (
+    DIRECTORY_TABLES,
+    PROTOCOL_TABLES,
+    TABLE_APPOINTMENTS,
+    TABLE_ISU_OFFICIAL,
+    TABLE_ISU_OFFICIAL_SEMINAR,
+    TABLE_REQUIREMENT_RULES,
+    cached_query,
+    query_cache,
+)
 from sqlalchemy import func as sqlfunc, select
 from sqlalchemy.orm import Session
 
@@ -120,7 +131,13 @@ st.set_page_config(
     layout="wide",
 )
 
-_CACHE_TTL_SEC = 120
+# Tables read by the cached loaders (shared ``query_cache``, invalidated per table).
+_PANEL_TABLES = DIRECTORY_TABLES + PROTOCOL_TABLES
+_SUMMARY_TABLES = _PANEL_TABLES + (
+    TABLE_ISU_OFFICIAL,
+    TABLE_ISU_OFFICIAL_SEMINAR,
+    TABLE_REQUIREMENT_RULES,
+)
 _ALL_LABEL = "(All)"
 _INTL_QP_FLAG = "_intl_officials_qp_tuple"
 
@@ -135,12 +152,12 @@ def _sync_intl_query_params(**params) -> None:
     _mark_intl_query_params()
 
 
-@st.cache_data(ttl=_CACHE_TTL_SEC)
+@cached_query(DIRECTORY_TABLES)
 def _load_appointment_type_options():
     return get_international_appointment_type_options()
 
 
-@st.cache_data(ttl=_CACHE_TTL_SEC)
+@cached_query(DIRECTORY_TABLES)
 def _load_discipline_options(
     appointment_type_id: int | None,
     level_id: int | None,
@@ -153,7 +170,7 @@ def _load_discipline_options(
     )
 
 
-@st.cache_data(ttl=_CACHE_TTL_SEC)
+@cached_query(DIRECTORY_TABLES)
 def _load_level_options(
     appointment_type_id: int | None,
     discipline_id: int | None,
@@ -166,7 +183,7 @@ def _load_level_options(
     )
 
 
-@st.cache_data(ttl=_CACHE_TTL_SEC)
+@cached_query(DIRECTORY_TABLES)
 def _load_official_options(
     appointment_type_id: int | None,
     discipline_id: int | None,
@@ -189,7 +206,7 @@ def _load_official_options(
     )
 
 
-@st.cache_data(ttl=_CACHE_TTL_SEC)
+@cached_query(_SUMMARY_TABLES)
 def _load_summary(
     appointment_type_id: int | None,
     discipline_id: int | None,
@@ -272,8 +289,12 @@ def _build_bulk_appointment_reports_zip(
     listing_season_code: int,
     report_season_window: int,
     active_only: bool,
+    progress=None,
 ) -> tuple[bytes, str]:
-    """One PDF per summary row, packaged as a ZIP (requirements always included)."""
+    """
+    One PDF per summary row (requirements always included), rendered in parallel and
+    streamed into an in-memory ZIP. Returns ``(zip bytes, download name)``.
+    """
     zip_name = bulk_reports_zip_filename(
         listing_season_code=listing_season_code,
         report_season_window=report_season_window,
@@ -285,18 +306,26 @@ def _build_bulk_appointment_reports_zip(
     panel = load_international_panel_segments_bulk(
         official_ids, season_codes=report_season_codes
     )
-    zip_bytes = build_bulk_appointment_reports_zip(
+    buf = io.BytesIO()
+    n = write_bulk_appointment_reports_zip(
         summary,
+        buf,
         listing_season_code=listing_season_code,
         report_season_codes=report_season_codes,
-        report_season_window=report_season_window,
         active_only=active_only,
         panel_bulk=panel,
+        progress=progress,
     )
-    return zip_bytes, zip_name
+    return (buf.getvalue() if n else b""), zip_name
+
 
+def _drop_bulk_zip() -> None:
+    st.session_state.pop("intl_bulk_zip", None)
+    st.session_state.pop("intl_bulk_zip_name", None)
+    st.session_state.pop("intl_bulk_zip_key", None)
 
-@st.cache_data(ttl=_CACHE_TTL_SEC)
+
+@cached_query(_PANEL_TABLES)
 def _load_segment_detail(
     appointment_type_id: int | None,
     discipline_id: int | None,
@@ -341,20 +370,20 @@ def _load_segment_detail(
     )
 
 
-@st.cache_data(ttl=_CACHE_TTL_SEC)
+@cached_query(DIRECTORY_TABLES)
 def _load_detail_nav_appointments(active_only: bool):
     return get_international_officials_for_filters(
         active_appointments_only=active_only,
     )
 
 
-@st.cache_data(ttl=_CACHE_TTL_SEC)
+@cached_query((TABLE_APPOINTMENTS,))
 def _load_appointment_data_date():
     with Session(get_engine()) as session:
         return session.execute(select(sqlfunc.max(Appointments.achieved_date))).scalar()
 
 
-@st.cache_data(ttl=_CACHE_TTL_SEC)
+@cached_query(_PANEL_TABLES)
 def _load_major_event_matrix(
     event_key: str,
     appointment_type_id: int | None,
@@ -526,8 +555,9 @@ if not activity_database_is_postgresql():
     st.stop()
 
 if st.sidebar.button("Refresh data"):
-    st.cache_data.clear()
+    query_cache.clear()
     st.rerun()
+st.sidebar.caption(query_cache.stats_caption())
 
 _on_detail_page = qp_get("view") == "appointment"
 
@@ -1202,8 +1232,7 @@ with dl_col:
         total_appointments,
     )
     if st.session_state.get("intl_bulk_zip_key") != bulk_zip_key:
-        st.session_state.pop("intl_bulk_zip", None)
-        st.session_state.pop("intl_bulk_zip_name", None)
+        _drop_bulk_zip()
 
     try:
         if st.button(
@@ -1216,22 +1245,25 @@ with dl_col:
                 "Includes full requirement breakdowns."
             ),
         ):
-            with st.spinner("Building PDF reports…"):
-                zip_bytes, zip_name = _build_bulk_appointment_reports_zip(
-                    summary,
-                    report_season_codes,
-                    listing_season_code=int(listing_season_code),
-                    report_season_window=int(report_season_window),
-                    active_only=active_only,
-                )
+            _drop_bulk_zip()
+            bar = st.progress(0.0, text="Building PDF reports…")
+
+            def _bulk_progress(done: int, total: int, name: str) -> None:
+                bar.progress(done / max(1, total), text=f"{done} / {total} reports")
+
+            zip_bytes, zip_name = _build_bulk_appointment_reports_zip(
+                summary,
+                report_season_codes,
+                listing_season_code=int(listing_season_code),
+                report_season_window=int(report_season_window),
+                active_only=active_only,
+                progress=_bulk_progress,
+            )
+            bar.empty()
             if zip_bytes:
                 st.session_state["intl_bulk_zip"] = zip_bytes
                 st.session_state["intl_bulk_zip_name"] = zip_name
                 st.session_state["intl_bulk_zip_key"] = bulk_zip_key
-            else:
-                st.session_state.pop("intl_bulk_zip", None)
-                st.session_state.pop("intl_bulk_zip_name", None)
-                st.session_state.pop("intl_bulk_zip_key", None)
 
         zip_bytes = st.session_state.get("intl_bulk_zip")
         zip_name = st.session_state.get("intl_bulk_zip_name")
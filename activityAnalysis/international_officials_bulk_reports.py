@@ -0,0 +1,209 @@
+"""
+Parallel bulk export of appointment detail PDFs into a streaming ZIP.
+
+The parent loads the shared bulk inputs once (panel segments, seminars, birthdates,
+grade dates) and hands them to each worker process when it starts. Workers build the
+appointment context (requirement evaluation) and render the fpdf2 PDF for one summary
+row at a time. The parent writes every finished PDF straight into the ZIP and drops it,
+so at most ``2 × workers`` PDFs are held in memory. The ZIP target can be a path or any
+writable binary stream; unseekable streams (e.g. an HTTP response) are supported.
+
+Worker processes are spawned, not forked (the Streamlit server is multithreaded), and
+read the activity database URL resolved by the parent. Heavy modules are imported
+lazily so that URL is in place before ``load_activity_data`` creates its engine.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Any, Callable
+
+import pandas as pd
+
+DEFAULT_BULK_REPORT_WORKERS = 2
+# Parent-side cap on queued + running jobs, per worker.
+_IN_FLIGHT_PER_WORKER = 2
+
+ProgressCallback = Callable[[int, int, str], None]
+
+# Worker-process state set by ``_init_worker``.
+_WORKER_SHARED: dict[str, Any] | None = None
+
+
+def default_bulk_report_workers() -> int:
+    """``INTL_BULK_REPORT_WORKERS`` or ``DEFAULT_BULK_REPORT_WORKERS``, capped at the CPU count."""
+    raw = os.environ.get("INTL_BULK_REPORT_WORKERS", "").strip()
+    try:
+        n = int(raw) if raw else DEFAULT_BULK_REPORT_WORKERS
+    except ValueError:
+        n = DEFAULT_BULK_REPORT_WORKERS
+    return max(1, min(n, os.cpu_count() or 1))
+
+
+def _report_module():
+    try:
+        import activityAnalysis.international_officials_report as report
+    except ModuleNotFoundError:
+        import international_officials_report as report  # type: ignore[no-redef]
+    return report
+
+
+def _seminars_module():
+    try:
+        import activityAnalysis.international_official_seminars as seminars
+    except ModuleNotFoundError:
+        import international_official_seminars as seminars  # type: ignore[no-redef]
+    return seminars
+
+
+def load_bulk_report_shared(
+    summary: pd.DataFrame,
+    *,
+    listing_season_code: int,
+    report_season_codes: list[int],
+    active_only: bool,
+    panel_bulk: pd.DataFrame | None = None,
+) -> dict[str, Any]:
+    """Bulk inputs every row's context draws from (one query per data set)."""
+    report = _report_module()
+    official_ids = summary["official_id"].astype(int).unique().tolist()
+    panel = panel_bulk
+    if panel is None:
+        panel = report.load_international_panel_segments_bulk(
+            official_ids, season_codes=report_season_codes
+        )
+    panel_by_official: dict[int, pd.DataFrame] | None = None
+    if panel is not None and not panel.empty:
+        panel_by_official = {
+            int(oid): group for oid, group in panel.groupby("official_id", sort=False)
+        }
+    grade_keys = [
+        (
+            int(r["official_id"]),
+            int(r["appointment_type_id"]),
+            report._nullable_int_for_sql(r.get("discipline_id")),
+        )
+        for _, r in summary.iterrows()
+    ]
+    return {
+        "listing_season_code": int(listing_season_code),
+        "report_season_codes": list(report_season_codes),
+        "active_only": bool(active_only),
+        "panel_by_official": panel_by_official,
+        "seminars_bulk": _seminars_module().load_official_seminars_bulk(official_ids),
+        "birthdates": report.load_official_birthdates(official_ids),
+        "grade_dates": report.load_grade_dates_for_appointments(grade_keys),
+    }
+
+
+def render_appointment_report(row: pd.Series, shared: dict[str, Any]) -> tuple[str, bytes]:
+    """Context + PDF for one summary row; returns ``(zip entry name, pdf bytes)``."""
+    report = _report_module()
+    sub_panel = None
+    if shared["panel_by_official"] is not None:
+        sub_panel = shared["panel_by_official"].get(int(row["official_id"]))
+    ctx = report.build_appointment_detail_context(
+        row,
+        listing_season_code=shared["listing_season_code"],
+        report_season_codes=shared["report_season_codes"],
+        active_only=shared["active_only"],
+        panel_bulk=sub_panel,
+        seminars_bulk=shared["seminars_bulk"],
+        birthdates=shared["birthdates"],
+        grade_dates=shared["grade_dates"],
+    )
+    return report.appointment_detail_pdf_filename(ctx), report.build_appointment_detail_pdf(ctx)
+
+
+def _init_worker(database_url: str | None, shared: dict[str, Any]) -> None:
+    global _WORKER_SHARED
+    if database_url:
+        os.environ["DATABASE_URL"] = database_url
+    _WORKER_SHARED = shared
+
+
+def _render_in_worker(row: pd.Series) -> tuple[str, bytes]:
+    assert _WORKER_SHARED is not None, "worker not initialized"
+    return render_appointment_report(row, _WORKER_SHARED)
+
+
+def _activity_database_url() -> str | None:
+    try:
+        from activityAnalysis.load_activity_data import _resolve_database_url
+    except ModuleNotFoundError:
+        from load_activity_data import _resolve_database_url  # type: ignore[no-redef]
+    return _resolve_database_url()
+
+
+def write_bulk_appointment_reports_zip(
+    summary: pd.DataFrame,
+    dest: str | os.PathLike | IO[bytes],
+    *,
+    listing_season_code: int,
+    report_season_codes: list[int],
+    active_only: bool,
+    panel_bulk: pd.DataFrame | None = None,
+    workers: int | None = None,
+    progress: ProgressCallback | None = None,
+    mp_context: str = "spawn",
+) -> int:
+    """
+    Write one PDF per ``summary`` row into a ZIP at ``dest``; returns the entry count.
+
+    ``workers`` defaults to :func:`default_bulk_report_workers`; ``1`` renders in this
+    process. Entries are written in ``summary`` order. ``progress(done, total, name)``
+    is called after each entry. A failing row aborts the export and re-raises.
+    """
+    if summary.empty:
+        return 0
+    total = len(summary)
+    shared = load_bulk_report_shared(
+        summary,
+        listing_season_code=listing_season_code,
+        report_season_codes=report_season_codes,
+        active_only=active_only,
+        panel_bulk=panel_bulk,
+    )
+    n_workers = default_bulk_report_workers() if workers is None else max(1, int(workers))
+    n_workers = min(n_workers, total)
+    rows = (row for _, row in summary.iterrows())
+    done = 0
+
+    with zipfile.ZipFile(dest, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+
+        def _emit(name: str, pdf_bytes: bytes) -> None:
+            nonlocal done
+            zf.writestr(name, pdf_bytes)
+            done += 1
+            if progress is not None:
+                progress(done, total, name)
+
+        if n_workers == 1:
+            for row in rows:
+                _emit(*render_appointment_report(row, shared))
+            return done
+
+        pool = ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context(mp_context),
+            initializer=_init_worker,
+            initargs=(_activity_database_url(), shared),
+        )
+        try:
+            # In-order window: a slow row holds back later entries, not the pool.
+            window: deque = deque()
+            for row in rows:
+                window.append(pool.submit(_render_in_worker, row))
+                if len(window) >= n_workers * _IN_FLIGHT_PER_WORKER:
+                    _emit(*window.popleft().result())
+            while window:
+                _emit(*window.popleft().result())
+        except BaseException:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        pool.shutdown(wait=True)
+    return done
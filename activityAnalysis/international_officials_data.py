@@ -6,6 +6,7 @@ Junior and Senior segments only, with discipline aligned to each appointment.
 
 from __future__ import annotations
 
+import time
 from typing import Any
 
 import pandas as pd
@@ -56,6 +57,7 @@ from officials_competition_types import (
     OFFICIALS_COMPETITION_TYPE_IDS_ADULT_COLLEGIATE,
     OFFICIALS_COMPETITION_TYPE_IDS_INTERNATIONAL,
 )
+from segment_rule411 import segment_rule411_table_exists
 
 # Directory ``appointment_types.id`` for international roles (USFS directory).
 INTERNATIONAL_APPOINTMENT_TYPE_IDS: tuple[int, ...] = (12, 13, 14, 15, 16)
@@ -529,6 +531,52 @@ def competition_scope_label(competition_type_id: Any, competition_qualifying: An
     return "Other"
 
 
+# Seconds before a missing Rule 411 table is probed again (the app outlives migrations).
+_RULE411_TABLE_RECHECK_SEC = 60.0
+_rule411_table_ready = False
+_rule411_table_checked_at: float | None = None
+
+
+def _segment_rule411_table_ready() -> bool:
+    """
+    ``public.segment_rule411_eligibility`` exists (scripts/migrations/012).
+
+    A positive answer is kept for the process; a negative one for
+    ``_RULE411_TABLE_RECHECK_SEC``, so a running app picks the table up after migrating.
+    """
+    global _rule411_table_ready, _rule411_table_checked_at
+    if _rule411_table_ready:
+        return True
+    now = time.monotonic()
+    if (
+        _rule411_table_checked_at is not None
+        and now - _rule411_table_checked_at < _RULE411_TABLE_RECHECK_SEC
+    ):
+        return False
+    with Session(engine) as session:
+        _rule411_table_ready = segment_rule411_table_exists(session)
+    _rule411_table_checked_at = now
+    return _rule411_table_ready
+
+
+def _segment_rule411_join_sql() -> tuple[str, str]:
+    """Select list + join for stored Rule 411 columns on international segments."""
+    if not _segment_rule411_table_ready():
+        return "", ""
+    intl_list = ", ".join(str(x) for x in sorted(OFFICIALS_COMPETITION_TYPE_IDS_INTERNATIONAL))
+    select_sql = """,
+                r.eligible AS rule411_eligible,
+                r.entry_count AS rule411_entry_count,
+                r.distinct_noc_count AS rule411_distinct_noc_count,
+                r.status AS rule411_status,
+                r.detail AS rule411_detail"""
+    join_sql = f"""
+            LEFT JOIN public.segment_rule411_eligibility r
+                ON r.segment_id = s.id
+               AND c.officials_analysis_competition_type_id IN ({intl_list})"""
+    return select_sql, join_sql
+
+
 def load_international_panel_segments_bulk(
     official_ids: list[int],
     *,
@@ -538,7 +586,9 @@ def load_international_panel_segments_bulk(
     One query: Junior/Senior panel segments at international competitions (types 15–17)
     and US national qualifying competitions (``competition.qualifying = true``).
 
-    Only ``segment_official`` rows with ``official_id`` set are included.
+    Only ``segment_official`` rows with ``official_id`` set are included. International
+    rows carry stored Rule 411 columns when ``segment_rule411_eligibility`` has them
+    (``NA`` otherwise; ``enrich_panel_with_rule411_eligibility`` fills the gaps).
     """
     cols = [
         "official_id",
@@ -570,6 +620,7 @@ def load_international_panel_segments_bulk(
         season_sql = season_year_sql_predicate("c")
 
     nat_qual_or = _national_qualifying_competition_sql_or()
+    rule411_select, rule411_join = _segment_rule411_join_sql()
     stmt = (
         text(
             f"""
@@ -589,11 +640,11 @@ def load_international_panel_segments_bulk(
                 s.name AS segment_name,
                 s.level AS segment_level,
                 dt.name AS segment_discipline,
-                so.role
+                so.role{rule411_select}
             FROM public.segment_official so
             INNER JOIN public.segment s ON s.id = so.segment_id
             INNER JOIN public.competition c ON c.id = s.competition_id
-            LEFT JOIN public.discipline_type dt ON dt.id = s.discipline_type_id
+            LEFT JOIN public.discipline_type dt ON dt.id = s.discipline_type_id{rule411_join}
             WHERE so.official_id IS NOT NULL
               AND so.official_id IN :official_ids
               AND s.level IN :segment_levels
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import io
 import re
-import zipfile
 from dataclasses import dataclass, field
 from datetime import date
 from typing import Any
@@ -37,7 +36,6 @@ try:
         split_panel_detail_by_scope,
     )
     from activityAnalysis.international_official_seminars import (
-        load_official_seminars_bulk,
         seminars_display_for_appointment,
     )
     from activityAnalysis.international_requirements import (
@@ -79,7 +77,6 @@ except ModuleNotFoundError:
         split_panel_detail_by_scope,
     )
     from international_official_seminars import (
-        load_official_seminars_bulk,
         seminars_display_for_appointment,
     )
     from international_requirements import (
@@ -995,52 +992,29 @@ def build_bulk_appointment_reports_zip(
     report_season_window: int,
     active_only: bool,
     panel_bulk: pd.DataFrame | None = None,
+    workers: int | None = 1,
 ) -> bytes:
+    """
+    In-memory ZIP of every row's PDF. Large exports should stream to disk with
+    :func:`international_officials_bulk_reports.write_bulk_appointment_reports_zip`.
+    """
     if summary.empty:
         return b""
-
-    panel = panel_bulk
-    if panel is None:
-        official_ids = summary["official_id"].astype(int).unique().tolist()
-        panel = load_international_panel_segments_bulk(
-            official_ids, season_codes=report_season_codes
-        )
-    panel_by_official: dict[int, pd.DataFrame] | None = None
-    if panel is not None and not panel.empty:
-        panel_by_official = {
-            int(oid): group for oid, group in panel.groupby("official_id", sort=False)
-        }
-
-    official_ids = summary["official_id"].astype(int).unique().tolist()
-    birthdates = load_official_birthdates(official_ids)
-    grade_keys = [
-        (
-            int(r["official_id"]),
-            int(r["appointment_type_id"]),
-            _nullable_int_for_sql(r.get("discipline_id")),
+    try:
+        from activityAnalysis.international_officials_bulk_reports import (
+            write_bulk_appointment_reports_zip,
         )
-        for _, r in summary.iterrows()
-    ]
-    grade_dates = load_grade_dates_for_appointments(grade_keys)
-    seminars_bulk = load_official_seminars_bulk(official_ids)
+    except ModuleNotFoundError:
+        from international_officials_bulk_reports import write_bulk_appointment_reports_zip
 
     buf = io.BytesIO()
-    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for _, row in summary.iterrows():
-            oid = int(row["official_id"])
-            sub_panel = None
-            if panel_by_official is not None:
-                sub_panel = panel_by_official.get(oid)
-            ctx = build_appointment_detail_context(
-                row,
-                listing_season_code=listing_season_code,
-                report_season_codes=report_season_codes,
-                active_only=active_only,
-                panel_bulk=sub_panel,
-                seminars_bulk=seminars_bulk,
-                birthdates=birthdates,
-                grade_dates=grade_dates,
-            )
-            pdf_bytes = build_appointment_detail_pdf(ctx)
-            zf.writestr(appointment_detail_pdf_filename(ctx), pdf_bytes)
+    write_bulk_appointment_reports_zip(
+        summary,
+        buf,
+        listing_season_code=listing_season_code,
+        report_season_codes=report_season_codes,
+        active_only=active_only,
+        panel_bulk=panel_bulk,
+        workers=workers,
+    )
     return buf.getvalue()
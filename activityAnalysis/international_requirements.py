@@ -13,7 +13,7 @@ from datetime import date
 import functools
 import json
 import re
-from typing import Any, Literal
+from typing import Any, Callable, Literal
 
 import pandas as pd
 from sqlalchemy import bindparam, select, text
@@ -53,6 +53,7 @@ try:
         Appointments,
         Levels,
     )
+    from activityAnalysis.query_cache import TABLE_REQUIREMENT_RULES, bump_table_versions
 except ModuleNotFoundError:
     from international_officials_data import (
         COUNTABLE_SEGMENT_LEVELS,
@@ -87,6 +88,7 @@ except ModuleNotFoundError:
         Appointments,
         Levels,
     )
+    from query_cache import TABLE_REQUIREMENT_RULES, bump_table_versions  # type: ignore[no-redef]
 
 from officials_competition_types import (
     OFFICIALS_COMPETITION_TYPE_ID_ISU_CHAMPIONSHIP,
@@ -1001,12 +1003,12 @@ def _requirements_coverable_distinct(reqs: list[tuple[int, set[int]]]) -> bool:
     return dfs(0, set())
 
 
+ScopeCompetitionIds = Callable[[str], set[int]]
+
+
 def _branch_meets_international_including_championship(
-    branch_panel: pd.DataFrame,
+    scope_ids: ScopeCompetitionIds,
     requirements: list[dict[str, Any]],
-    *,
-    season_codes: list[int],
-    segment_levels: frozenset[str],
 ) -> tuple[bool, list[str]] | None:
     """
     ``international_all`` + ``isu_championship``: N international including M championships.
@@ -1028,18 +1030,8 @@ def _branch_meets_international_including_championship(
     except (TypeError, ValueError):
         return None
 
-    intl_ids = _competition_ids_for_scope(
-        branch_panel,
-        "international_all",
-        season_codes=season_codes,
-        segment_levels=segment_levels,
-    )
-    champ_ids = _competition_ids_for_scope(
-        branch_panel,
-        "isu_championship",
-        season_codes=season_codes,
-        segment_levels=segment_levels,
-    )
+    intl_ids = scope_ids("international_all")
+    champ_ids = scope_ids("isu_championship")
     among = intl_ids & champ_ids
     parts = [
         f"{len(intl_ids)}/{intl_min} International",
@@ -1050,18 +1042,12 @@ def _branch_meets_international_including_championship(
 
 
 def _branch_meets_requirements(
-    branch_panel: pd.DataFrame,
+    scope_ids: ScopeCompetitionIds,
     requirements: list[dict[str, Any]],
-    *,
-    season_codes: list[int],
-    segment_levels: frozenset[str],
 ) -> tuple[bool, list[str]]:
     if len(requirements) > 1:
         included = _branch_meets_international_including_championship(
-            branch_panel,
-            requirements,
-            season_codes=season_codes,
-            segment_levels=segment_levels,
+            scope_ids, requirements
         )
         if included is not None:
             return included
@@ -1075,12 +1061,7 @@ def _branch_meets_requirements(
             min_n = int(req.get("min", 0))
         except (TypeError, ValueError):
             min_n = 0
-        comp_ids = _competition_ids_for_scope(
-            branch_panel,
-            scope,
-            season_codes=season_codes,
-            segment_levels=segment_levels,
-        )
+        comp_ids = scope_ids(scope)
         count = len(comp_ids)
         ok = count >= min_n
         per_scope_ok = per_scope_ok and ok
@@ -1096,18 +1077,18 @@ def _branch_meets_requirements(
     return distinct_ok, parts
 
 
-def _evaluate_competition_alternatives(
-    panel: pd.DataFrame,
+def _evaluate_competition_alternatives_with(
     metric_config: Any,
+    branch_scope_ids: Callable[[tuple[int, ...] | None], ScopeCompetitionIds],
     *,
-    season_codes: list[int],
-    segment_levels: frozenset[str],
     intl_appointment_type_id: int | None = None,
 ) -> tuple[bool, str, str]:
     """
-    Evaluate OR branches; each branch is AND of scoped competition minimums.
+    OR-branch evaluation over any competition source.
 
-    Returns (met, via_label, detail).
+    ``branch_scope_ids(role_ids)`` returns the scope → competition ids lookup for one
+    branch: ``None`` = the appointment's whole panel, ``()`` = no rows, otherwise the
+    panel rows in those national roles.
     """
     config = _parse_metric_config(metric_config)
     alternatives = config.get("alternatives") or []
@@ -1125,17 +1106,14 @@ def _evaluate_competition_alternatives(
         label = str(alt.get("label") or "Option")
         role_ids = alt.get("role_ids")
         if role_ids:
-            branch_panel = _panel_for_alternative_roles(panel, role_ids)
+            branch_roles: tuple[int, ...] | None = tuple(sorted({int(x) for x in role_ids}))
         elif role_scoped:
-            branch_panel = panel.iloc[0:0]
+            branch_roles = ()
         else:
-            branch_panel = panel
+            branch_roles = None
         requirements = alt.get("requirements") or []
         branch_ok, parts = _branch_meets_requirements(
-            branch_panel,
-            requirements,
-            season_codes=season_codes,
-            segment_levels=segment_levels,
+            branch_scope_ids(branch_roles), requirements
         )
         summary = f"{label}: {', '.join(parts)}"
         branch_summaries.append(summary)
@@ -1153,6 +1131,41 @@ def _evaluate_competition_alternatives(
     return False, "", "Need one of: " + "; ".join(branch_summaries)
 
 
+def _evaluate_competition_alternatives(
+    panel: pd.DataFrame,
+    metric_config: Any,
+    *,
+    season_codes: list[int],
+    segment_levels: frozenset[str],
+    intl_appointment_type_id: int | None = None,
+) -> tuple[bool, str, str]:
+    """
+    Evaluate OR branches; each branch is AND of scoped competition minimums.
+
+    Returns (met, via_label, detail).
+    """
+
+    def branch_scope_ids(role_ids: tuple[int, ...] | None) -> ScopeCompetitionIds:
+        if role_ids is None:
+            branch_panel = panel
+        elif role_ids:
+            branch_panel = _panel_for_alternative_roles(panel, role_ids)
+        else:
+            branch_panel = panel.iloc[0:0]
+        return lambda scope: _competition_ids_for_scope(
+            branch_panel,
+            scope,
+            season_codes=season_codes,
+            segment_levels=segment_levels,
+        )
+
+    return _evaluate_competition_alternatives_with(
+        metric_config,
+        branch_scope_ids,
+        intl_appointment_type_id=intl_appointment_type_id,
+    )
+
+
 def format_competition_alternatives_detail(detail: str, *, met: bool) -> list[str]:
     """Split competition_alternatives progress text into display lines."""
     if not detail:
@@ -1246,31 +1259,26 @@ def _count_competitions_with_segment_discipline_type(
     return int(df["competition_id"].nunique())
 
 
-def _evaluate_judge_promote_isu(
-    panel: pd.DataFrame,
+JudgePromoteCount = Callable[[str, Any, list[int]], int]
+
+
+def _judge_promote_isu_outcome(
     metric_config: Any,
     *,
     season_codes: list[int],
-    segment_levels: frozenset[str],
-    competition_type_ids: tuple[int, ...],
-    include_qualifying_national: bool,
+    total: int,
+    count_for_requirement: JudgePromoteCount,
 ) -> tuple[bool, str]:
     """
-    Judge promotion to ISU: minimum international competitions plus required mix
-    (Senior/Junior segments, optional Pairs, ISU Event in last season).
+    Judge ISU promotion checks given the total count and a per-requirement counter.
+
+    ``count_for_requirement(kind, value, season_codes)`` counts competitions for one
+    ``segment_level`` / ``segment_discipline_type_id`` / ``scope`` requirement.
     """
     config = _parse_metric_config(metric_config)
     min_total = int(config.get("min_competitions", 0))
     requirements = config.get("required") or []
 
-    total = _competition_count_from_panel(
-        panel,
-        season_codes=season_codes,
-        competition_type_ids=competition_type_ids,
-        segment_levels=segment_levels,
-        include_qualifying_national=include_qualifying_national,
-    )
-
     parts: list[str] = [f"{total}/{min_total} international competitions"]
     checks: list[bool] = [total >= min_total]
 
@@ -1278,40 +1286,19 @@ def _evaluate_judge_promote_isu(
         kind = str(req.get("kind") or "")
         min_n = int(req.get("min_competitions", 1))
         last_only = bool(req.get("last_season_only"))
+        codes = [season_codes[-1]] if last_only and season_codes else list(season_codes)
 
         if kind == "segment_level":
             level = str(req.get("level") or "")
-            count = _count_competitions_with_segment_level(
-                panel,
-                level,
-                season_codes=season_codes,
-                segment_levels=segment_levels,
-                competition_type_ids=competition_type_ids,
-                include_qualifying_national=include_qualifying_national,
-                last_season_only=last_only,
-            )
+            count = count_for_requirement(kind, level, codes)
             label = f"{level} segment"
         elif kind == "segment_discipline_type_id":
             disc_type_id = int(req.get("discipline_type_id", 0))
-            count = _count_competitions_with_segment_discipline_type(
-                panel,
-                disc_type_id,
-                season_codes=season_codes,
-                segment_levels=segment_levels,
-                competition_type_ids=competition_type_ids,
-                include_qualifying_national=include_qualifying_national,
-                last_season_only=last_only,
-            )
+            count = count_for_requirement(kind, disc_type_id, codes)
             label = "Pairs segment" if disc_type_id == 2 else f"discipline type {disc_type_id}"
         elif kind == "scope":
             scope = str(req.get("scope") or "")
-            codes = [season_codes[-1]] if last_only and season_codes else season_codes
-            count = _count_competitions_for_scope(
-                panel,
-                scope,
-                season_codes=codes,
-                segment_levels=segment_levels,
-            )
+            count = count_for_requirement(kind, scope, codes)
             label = _scope_display_name(scope)
             if last_only:
                 label += " (last season)"
@@ -1326,6 +1313,80 @@ def _evaluate_judge_promote_isu(
     return met, detail
 
 
+def _evaluate_judge_promote_isu(
+    panel: pd.DataFrame,
+    metric_config: Any,
+    *,
+    season_codes: list[int],
+    segment_levels: frozenset[str],
+    competition_type_ids: tuple[int, ...],
+    include_qualifying_national: bool,
+) -> tuple[bool, str]:
+    """
+    Judge promotion to ISU: minimum international competitions plus required mix
+    (Senior/Junior segments, optional Pairs, ISU Event in last season).
+    """
+    total = _competition_count_from_panel(
+        panel,
+        season_codes=season_codes,
+        competition_type_ids=competition_type_ids,
+        segment_levels=segment_levels,
+        include_qualifying_national=include_qualifying_national,
+    )
+
+    def count_for_requirement(kind: str, value: Any, codes: list[int]) -> int:
+        if kind == "segment_level":
+            return _count_competitions_with_segment_level(
+                panel,
+                value,
+                season_codes=codes,
+                segment_levels=segment_levels,
+                competition_type_ids=competition_type_ids,
+                include_qualifying_national=include_qualifying_national,
+            )
+        if kind == "segment_discipline_type_id":
+            return _count_competitions_with_segment_discipline_type(
+                panel,
+                value,
+                season_codes=codes,
+                segment_levels=segment_levels,
+                competition_type_ids=competition_type_ids,
+                include_qualifying_national=include_qualifying_national,
+            )
+        return _count_competitions_for_scope(
+            panel,
+            value,
+            season_codes=codes,
+            segment_levels=segment_levels,
+        )
+
+    return _judge_promote_isu_outcome(
+        metric_config,
+        season_codes=season_codes,
+        total=total,
+        count_for_requirement=count_for_requirement,
+    )
+
+
+def _tc_ts_promote_isu_outcome(
+    metric_config: Any,
+    *,
+    total: int,
+    intl_only: int,
+) -> tuple[bool, str]:
+    config = _parse_metric_config(metric_config)
+    min_total = int(config.get("min_competitions", 3))
+    min_intl = int(config.get("min_international_competition", 1))
+
+    met = total >= min_total and intl_only >= min_intl
+    detail = (
+        f"{total}/{min_total} competitions, "
+        f"{intl_only}/{min_intl} International Competition(s) "
+        "(ISU Event or International Competition)"
+    )
+    return met, detail
+
+
 def _evaluate_tc_ts_promote_isu(
     panel: pd.DataFrame,
     metric_config: Any,
@@ -1341,10 +1402,6 @@ def _evaluate_tc_ts_promote_isu(
     Per ISU Rule 411, "International Competition" includes ISU Events (types 15–16) and
     International Senior/Junior Competitions (type 17), not type 17 alone.
     """
-    config = _parse_metric_config(metric_config)
-    min_total = int(config.get("min_competitions", 3))
-    min_intl = int(config.get("min_international_competition", 1))
-
     total = _competition_count_after_rule411(
         panel,
         season_codes=season_codes,
@@ -1358,14 +1415,7 @@ def _evaluate_tc_ts_promote_isu(
         segment_levels=segment_levels,
         scope="international_all",
     )
-
-    met = total >= min_total and intl_only >= min_intl
-    detail = (
-        f"{total}/{min_total} competitions, "
-        f"{intl_only}/{min_intl} International Competition(s) "
-        "(ISU Event or International Competition)"
-    )
-    return met, detail
+    return _tc_ts_promote_isu_outcome(metric_config, total=total, intl_only=intl_only)
 
 
 def get_panel_competitions_for_requirements(
@@ -2674,6 +2724,62 @@ def _rule_set_applies(
     return True, ""
 
 
+def _not_applicable_requirement_evaluation(
+    rule_set_id: int,
+    head: pd.Series,
+    purpose: Purpose,
+    *,
+    season_codes: list[int],
+    reason: str,
+) -> RequirementEvaluation:
+    return RequirementEvaluation(
+        rule_set_id=int(rule_set_id),
+        isu_rule_ref=str(head["isu_rule_ref"]),
+        purpose=purpose,
+        label=str(head["label"]),
+        listing_tier=str(head["listing_tier"]),
+        season_window=int(head["season_window"]),
+        season_codes=season_codes,
+        meets=False,
+        summary_note=reason,
+        not_applicable=True,
+        not_applicable_reason=reason,
+    )
+
+
+def _requirement_evaluation_from_results(
+    rule_set_id: int,
+    head: pd.Series,
+    purpose: Purpose,
+    *,
+    season_codes: list[int],
+    rule_results: list[RuleCheckResult],
+) -> RequirementEvaluation:
+    """Meets flag + summary note (first three failed rule details) for one rule set."""
+    meets = all(r.met for r in rule_results)
+    failed = [r for r in rule_results if not r.met]
+    if meets:
+        summary = "Meets requirements"
+    else:
+        summary = "; ".join(r.detail for r in failed[:3])
+        if len(failed) > 3:
+            summary += f" (+{len(failed) - 3} more)"
+
+    return RequirementEvaluation(
+        rule_set_id=int(rule_set_id),
+        isu_rule_ref=str(head["isu_rule_ref"]),
+        purpose=purpose,
+        label=str(head["label"]),
+        listing_tier=str(head["listing_tier"]),
+        season_window=int(head["season_window"]),
+        season_codes=season_codes,
+        meets=meets,
+        summary_note=summary,
+        rule_results=rule_results,
+        qualifying_activity=_union_qualifying_competitions(rule_results),
+    )
+
+
 def evaluate_requirements_for_appointment(
     official_id: int,
     appointment_type_id: int,
@@ -2774,18 +2880,12 @@ def evaluate_requirements_for_appointment(
 
         if not applies:
             out.append(
-                RequirementEvaluation(
-                    rule_set_id=int(rule_set_id),
-                    isu_rule_ref=str(head["isu_rule_ref"]),
-                    purpose=purpose,
-                    label=str(head["label"]),
-                    listing_tier=str(head["listing_tier"]),
-                    season_window=season_window,
+                _not_applicable_requirement_evaluation(
+                    int(rule_set_id),
+                    head,
+                    purpose,
                     season_codes=season_codes,
-                    meets=False,
-                    summary_note=skip_reason,
-                    not_applicable=True,
-                    not_applicable_reason=skip_reason,
+                    reason=skip_reason,
                 )
             )
             continue
@@ -2813,28 +2913,13 @@ def evaluate_requirements_for_appointment(
                 )
             )
 
-        meets = all(r.met for r in rule_results)
-        failed = [r for r in rule_results if not r.met]
-        if meets:
-            summary = "Meets requirements"
-        else:
-            summary = "; ".join(r.detail for r in failed[:3])
-            if len(failed) > 3:
-                summary += f" (+{len(failed) - 3} more)"
-
         out.append(
-            RequirementEvaluation(
-                rule_set_id=int(rule_set_id),
-                isu_rule_ref=str(head["isu_rule_ref"]),
-                purpose=purpose,
-                label=str(head["label"]),
-                listing_tier=str(head["listing_tier"]),
-                season_window=season_window,
+            _requirement_evaluation_from_results(
+                int(rule_set_id),
+                head,
+                purpose,
                 season_codes=season_codes,
-                meets=meets,
-                summary_note=summary,
                 rule_results=rule_results,
-                qualifying_activity=_union_qualifying_competitions(rule_results),
             )
         )
     return out
@@ -2964,11 +3049,16 @@ def evaluate_requirements_summary_df(
     include_maintain_promote: bool = True,
     include_seminar_columns: bool = True,
     summary_ctx: RequirementSummaryContext | None = None,
+    compiled: bool = True,
 ) -> pd.DataFrame:
     """
     Add maintain / promote and/or seminar summary columns.
 
     Expects columns: official_id, appointment_type_id, discipline_id.
+
+    ``compiled`` evaluates rules with ``CompiledRequirementEvaluator`` (masks and
+    groupbys over the whole panel); ``False`` runs ``evaluate_requirements_for_appointment``
+    per row. Both produce the same columns.
     """
     if summary.empty or not (include_maintain_promote or include_seminar_columns):
         return summary
@@ -3028,6 +3118,55 @@ def evaluate_requirements_summary_df(
     isu_level_id = summary_ctx.isu_level_id
 
     empty_seminars = seminars.iloc[0:0] if not seminars.empty else seminars
+    compiled_evaluator = None
+    if include_maintain_promote and compiled:
+        try:
+            from activityAnalysis.international_requirements_compiled import (
+                CompiledRequirementEvaluator,
+            )
+        except ModuleNotFoundError:
+            from international_requirements_compiled import CompiledRequirementEvaluator
+
+        compiled_evaluator = CompiledRequirementEvaluator(summary_ctx)
+
+    def evaluate_purpose(
+        oid: int,
+        atid: int,
+        disc: int | None,
+        purpose: Purpose,
+        *,
+        listing_tier: str,
+        seminars_for_appt: pd.DataFrame,
+    ) -> list[RequirementEvaluation]:
+        if compiled_evaluator is not None:
+            return compiled_evaluator.evaluate(
+                oid,
+                atid,
+                disc,
+                purpose,
+                listing_tier=listing_tier,
+                seminars_for_appointment=seminars_for_appt,
+            )
+        return evaluate_requirements_for_appointment(
+            oid,
+            atid,
+            disc,
+            purpose,
+            listing_season_code=listing_season_code,
+            rules_df=maintain_rules if purpose == "maintain" else promote_rules,
+            panel_bulk=panel,
+            panel_by_official=panel_by_official,
+            seminars_bulk=seminars,
+            seminars_for_appointment=seminars_for_appt,
+            appointment_contexts=appointment_contexts,
+            appointment_rows_by_official=appointment_rows_by_official,
+            isu_listing_keys=isu_listing_keys,
+            international_level_id=international_level_id,
+            isu_level_id=isu_level_id,
+            summary_ctx=summary_ctx,
+            listing_tier=listing_tier,
+        )
+
     maintain_notes: list[str] = []
     maintain_meets: list[str] = []
     promote_notes: list[str] = []
@@ -3055,24 +3194,13 @@ def evaluate_requirements_summary_df(
         )
 
         if include_maintain_promote:
-            maintain_evals = evaluate_requirements_for_appointment(
+            maintain_evals = evaluate_purpose(
                 oid,
                 atid,
                 disc,
                 "maintain",
-                listing_season_code=listing_season_code,
-                rules_df=maintain_rules,
-                panel_bulk=panel,
-                panel_by_official=panel_by_official,
-                seminars_bulk=seminars,
-                seminars_for_appointment=seminars_for_appt,
-                appointment_contexts=appointment_contexts,
-                appointment_rows_by_official=appointment_rows_by_official,
-                isu_listing_keys=isu_listing_keys,
-                international_level_id=international_level_id,
-                isu_level_id=isu_level_id,
-                summary_ctx=summary_ctx,
                 listing_tier=listing_tier,
+                seminars_for_appt=seminars_for_appt,
             )
             tier_rules = maintain_evals
             tier_applicable = [e for e in tier_rules if not e.not_applicable]
@@ -3130,24 +3258,13 @@ def evaluate_requirements_summary_df(
                 if include_seminar_columns:
                     seminar_promote.append("")
             else:
-                promote_evals = evaluate_requirements_for_appointment(
+                promote_evals = evaluate_purpose(
                     oid,
                     atid,
                     disc,
                     "promote",
-                    listing_season_code=listing_season_code,
-                    rules_df=promote_rules,
-                    panel_bulk=panel,
-                    panel_by_official=panel_by_official,
-                    seminars_bulk=seminars,
-                    seminars_for_appointment=seminars_for_appt,
-                    appointment_contexts=appointment_contexts,
-                    appointment_rows_by_official=appointment_rows_by_official,
-                    isu_listing_keys=isu_listing_keys,
-                    international_level_id=international_level_id,
-                    isu_level_id=isu_level_id,
-                    summary_ctx=summary_ctx,
                     listing_tier=listing_tier,
+                    seminars_for_appt=seminars_for_appt,
                 )
                 promote_primary = _primary_requirement_evaluation(promote_evals)
                 if promote_primary is not None and not promote_primary.not_applicable:
@@ -3332,6 +3449,7 @@ def update_requirement_rule_set(
             ),
             params,
         )
+        bump_table_versions(session, (TABLE_REQUIREMENT_RULES,))
         session.commit()
 
 
@@ -3380,4 +3498,5 @@ def update_requirement_rule(
             ),
             params,
         )
+        bump_table_versions(session, (TABLE_REQUIREMENT_RULES,))
         session.commit()
@@ -0,0 +1,645 @@
+"""
+Compiled requirement rules for the International Officials summary columns.
+
+``evaluate_requirements_summary_df`` used to run the per-appointment evaluator for every
+summary row: each rule re-sliced that official's panel, re-ran the row-wise scope checks
+and the Rule 411 eligibility lookup, and built qualifying-competition tables the summary
+never shows. Here the work is split in two:
+
+- Rule sets are compiled once per run (parsed rule rows, sorted, cached per
+  appointment type / discipline / listing tier).
+- The bulk panel is prepared once (Rule 411 enrichment for every official in one pass)
+  and each filter a rule needs (season window, segment levels, competition scope,
+  appointment roles and disciplines, …) becomes a cached boolean mask over all rows.
+  A rule's competitions for *every* official come from one ``groupby`` over the
+  combined mask, so each summary row only does dictionary lookups.
+
+Seminar and years-in-grade rules read per-appointment data, not the panel, and go
+through ``_evaluate_rule`` unchanged. Compiled results carry no
+``qualifying_competitions`` tables; detail pages and PDFs keep using
+``evaluate_requirements_for_appointment``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+try:
+    from activityAnalysis.international_officials_data import (
+        COUNTABLE_SEGMENT_LEVELS,
+        allowed_segment_discipline_type_ids,
+        national_segment_appointment_type_id,
+    )
+    from activityAnalysis.international_listing_seasons import (
+        competition_year_matches_seasons,
+    )
+    from activityAnalysis.international_requirements import (
+        Purpose,
+        RequirementEvaluation,
+        RequirementSummaryContext,
+        RuleCheckResult,
+        ScopeCompetitionIds,
+        _appointment_context_from_batch,
+        _competition_matches_scope,
+        _evaluate_competition_alternatives_with,
+        _evaluate_rule,
+        _filter_rule_rows_for_appointment,
+        _is_championship_or_olympic,
+        _judge_promote_isu_outcome,
+        _not_applicable_requirement_evaluation,
+        _requirement_evaluation_from_results,
+        _role_ids_for_metric,
+        _row_matches_competition_scope,
+        _rule_set_applies,
+        _tc_ts_promote_isu_outcome,
+        user_facing_requirement_label,
+    )
+    from activityAnalysis.load_activity_data import activity_database_is_postgresql
+except ModuleNotFoundError:
+    from international_officials_data import (  # type: ignore[no-redef]
+        COUNTABLE_SEGMENT_LEVELS,
+        allowed_segment_discipline_type_ids,
+        national_segment_appointment_type_id,
+    )
+    from international_listing_seasons import (  # type: ignore[no-redef]
+        competition_year_matches_seasons,
+    )
+    from international_requirements import (  # type: ignore[no-redef]
+        Purpose,
+        RequirementEvaluation,
+        RequirementSummaryContext,
+        RuleCheckResult,
+        ScopeCompetitionIds,
+        _appointment_context_from_batch,
+        _competition_matches_scope,
+        _evaluate_competition_alternatives_with,
+        _evaluate_rule,
+        _filter_rule_rows_for_appointment,
+        _is_championship_or_olympic,
+        _judge_promote_isu_outcome,
+        _not_applicable_requirement_evaluation,
+        _requirement_evaluation_from_results,
+        _role_ids_for_metric,
+        _row_matches_competition_scope,
+        _rule_set_applies,
+        _tc_ts_promote_isu_outcome,
+        user_facing_requirement_label,
+    )
+    from load_activity_data import activity_database_is_postgresql  # type: ignore[no-redef]
+
+from officials_competition_types import OFFICIALS_COMPETITION_TYPE_IDS_INTERNATIONAL
+
+# Metrics evaluated from appointment context / seminars only (no panel rows).
+_APPOINTMENT_ONLY_METRICS = frozenset(
+    {
+        "seminar_count",
+        "seminar_alternatives",
+        "seasons_since_appointed",
+        "years_in_grade",
+        "years_isu_judge",
+        "years_intl_referee",
+        "years_tc_prerequisite",
+    }
+)
+
+_PANEL_COLUMNS = (
+    "official_id",
+    "competition_id",
+    "competition_year",
+    "competition_name",
+    "competition_type_id",
+    "competition_qualifying",
+    "segment_level",
+    "segment_discipline_type_id",
+    "national_appointment_type_id",
+)
+
+# Row filters: ("types", competition_type_ids, include_qualifying_national) or
+# ("scope", isu_scope_name).
+CompetitionScope = tuple[Any, ...]
+_EMPTY_IDS: frozenset[int] = frozenset()
+
+
+@dataclass(frozen=True)
+class PanelFilter:
+    """Rule-level row filter; appointment roles/disciplines are applied separately."""
+
+    season_codes: tuple[int, ...]
+    segment_levels: frozenset[str]
+    scope: CompetitionScope | None = None
+    rule411: bool = True
+    championship_or_olympic_only: bool = False
+    segment_level: str | None = None
+    segment_discipline_type_id: int | None = None
+    # ``None`` = no extra role filter; ``()`` = no rows.
+    branch_role_ids: tuple[int, ...] | None = None
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    row: pd.Series
+    metric: str
+    min_value: int
+    display_label: str
+    role_ids: tuple[int, ...] | None
+    competition_type_ids: tuple[int, ...]
+    segment_levels: frozenset[str]
+    include_qualifying_national: bool
+    championship_or_olympic_only: bool
+    metric_config: Any
+
+
+@dataclass(frozen=True)
+class CompiledRuleSet:
+    rule_set_id: int
+    head: pd.Series
+    season_window: int
+    rules: tuple[CompiledRule, ...]
+
+
+def compile_rule(rule_row: pd.Series) -> CompiledRule:
+    """Parse one rule row the same way ``_evaluate_rule`` does."""
+    metric = str(rule_row["metric"])
+    roles = tuple(int(x) for x in (rule_row["role_appointment_type_ids"] or []) if x is not None)
+    return CompiledRule(
+        row=rule_row,
+        metric=metric,
+        min_value=int(rule_row["min_value"]),
+        display_label=user_facing_requirement_label(
+            str(rule_row["display_label"] or metric)
+        ),
+        role_ids=_role_ids_for_metric(metric, roles),
+        competition_type_ids=tuple(
+            int(x) for x in (rule_row["competition_type_ids"] or [15, 16, 17])
+        ),
+        segment_levels=frozenset(rule_row["segment_levels"] or list(COUNTABLE_SEGMENT_LEVELS)),
+        include_qualifying_national=bool(rule_row.get("include_qualifying_national")),
+        championship_or_olympic_only=bool(rule_row.get("require_championship_or_olympic"))
+        or metric == "judge_championship_or_olympic",
+        metric_config=rule_row.get("metric_config"),
+    )
+
+
+def compile_rule_set(rule_set_id: int, group: pd.DataFrame) -> CompiledRuleSet:
+    head = group.iloc[0]
+    rules = tuple(compile_rule(row) for _, row in group.sort_values("rule_sort_order").iterrows())
+    return CompiledRuleSet(
+        rule_set_id=int(rule_set_id),
+        head=head,
+        season_window=int(head["season_window"]),
+        rules=rules,
+    )
+
+
+class CompiledPanel:
+    """
+    Bulk panel rows with cached boolean masks and per-official competition id sets.
+
+    Row predicates reuse the scalar helpers from ``international_requirements``; each is
+    evaluated once per distinct column value (or value pair), not once per row and rule.
+    """
+
+    def __init__(self, panel: pd.DataFrame | None):
+        frame = panel if panel is not None else pd.DataFrame()
+        frame = frame.reset_index(drop=True)
+        for col in _PANEL_COLUMNS:
+            if col not in frame.columns:
+                frame[col] = None
+        self._frame = frame
+        self._n = len(frame)
+        official = pd.to_numeric(frame["official_id"], errors="coerce")
+        competition = pd.to_numeric(frame["competition_id"], errors="coerce")
+        self._has_keys = (official.notna() & competition.notna()).to_numpy(dtype=bool)
+        self._official = official.fillna(-1).astype("int64").to_numpy()
+        self._competition = competition.fillna(-1).astype("int64").to_numpy()
+        self._national_role = pd.to_numeric(
+            frame["national_appointment_type_id"], errors="coerce"
+        )
+        self._segment_discipline = pd.to_numeric(
+            frame["segment_discipline_type_id"], errors="coerce"
+        )
+        self._rule411_keep: np.ndarray | None = None
+        self._masks: dict[tuple[Any, ...], np.ndarray] = {}
+        self._appointment_keys: dict[tuple[Any, ...], tuple[Any, ...]] = {}
+        self._ids: dict[tuple[Any, ...], dict[int, frozenset[int]]] = {}
+
+    def _none(self) -> np.ndarray:
+        return np.zeros(self._n, dtype=bool)
+
+    def _cached(self, key: tuple[Any, ...], build: Callable[[], np.ndarray]) -> np.ndarray:
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = build()
+            self._masks[key] = mask
+        return mask
+
+    def _row_predicate(self, columns: list[str], fn: Callable[..., bool]) -> np.ndarray:
+        if self._n == 0:
+            return self._none()
+        sub = self._frame[columns]
+        group_ids = sub.groupby(columns, dropna=False, sort=False).ngroup().to_numpy()
+        ids, first_rows = np.unique(group_ids, return_index=True)
+        table = np.zeros(int(ids.max()) + 1, dtype=bool)
+        for gid, values in zip(
+            ids, sub.iloc[first_rows].itertuples(index=False, name=None)
+        ):
+            table[gid] = bool(fn(*values))
+        return table[group_ids]
+
+    def _season_mask(self, season_codes: tuple[int, ...]) -> np.ndarray:
+        codes = list(season_codes)
+        return self._cached(
+            ("season", season_codes),
+            lambda: self._row_predicate(
+                ["competition_year"],
+                lambda y: competition_year_matches_seasons(y, codes),
+            )
+            if codes
+            else self._none(),
+        )
+
+    def _level_mask(self, levels: frozenset[str]) -> np.ndarray:
+        return self._cached(
+            ("levels", levels),
+            lambda: self._frame["segment_level"].isin(levels).to_numpy(dtype=bool),
+        )
+
+    def _scope_mask(self, scope: CompetitionScope) -> np.ndarray:
+        if scope[0] == "types":
+            _, type_ids, include_qualifying_national = scope
+            return self._cached(
+                scope,
+                lambda: self._row_predicate(
+                    ["competition_type_id", "competition_qualifying"],
+                    lambda ct, qual: _competition_matches_scope(
+                        ct,
+                        qual,
+                        type_ids,
+                        include_qualifying_national=include_qualifying_national,
+                    ),
+                ),
+            )
+        name = scope[1]
+        return self._cached(
+            scope,
+            lambda: self._row_predicate(
+                ["competition_type_id", "competition_qualifying"],
+                lambda ct, qual: _row_matches_competition_scope(ct, qual, name),
+            ),
+        )
+
+    def _championship_mask(self) -> np.ndarray:
+        return self._cached(
+            ("championship",),
+            lambda: self._row_predicate(
+                ["competition_type_id", "competition_name"],
+                _is_championship_or_olympic,
+            ),
+        )
+
+    def _rule411_mask(self) -> np.ndarray:
+        """Rows kept by ``filter_panel_to_rule411_eligible`` (one enrichment pass)."""
+        if self._rule411_keep is None:
+            if self._n == 0:
+                self._rule411_keep = self._none()
+            else:
+                try:
+                    from activityAnalysis.international_segment_eligibility import (
+                        enrich_panel_with_rule411_eligibility,
+                    )
+                except ModuleNotFoundError:
+                    from international_segment_eligibility import (
+                        enrich_panel_with_rule411_eligibility,
+                    )
+
+                enriched = enrich_panel_with_rule411_eligibility(self._frame)
+                intl = self._row_predicate(
+                    ["competition_type_id"],
+                    lambda x: int(x) in OFFICIALS_COMPETITION_TYPE_IDS_INTERNATIONAL
+                    if pd.notna(x)
+                    else False,
+                )
+                eligible = (
+                    enriched["rule411_eligible"].fillna(False).astype(bool).to_numpy()
+                )
+                self._rule411_keep = (~intl) | eligible
+        return self._rule411_keep
+
+    def _role_mask(self, role_ids: tuple[int, ...]) -> np.ndarray:
+        return self._cached(
+            ("roles", role_ids),
+            lambda: self._national_role.isin(role_ids).to_numpy(dtype=bool),
+        )
+
+    def appointment_key(
+        self,
+        role_ids: tuple[int, ...] | None,
+        intl_appointment_type_id: int,
+        directory_discipline_id: Any,
+    ) -> tuple[Any, ...]:
+        """Normalized ``filter_panel_for_appointment`` arguments (many rows share one)."""
+        cache_key = (role_ids, int(intl_appointment_type_id), directory_discipline_id)
+        key = self._appointment_keys.get(cache_key)
+        if key is not None:
+            return key
+        if role_ids:
+            roles: tuple[int, ...] | None = tuple(sorted({int(x) for x in role_ids}))
+        else:
+            nat_at_id = national_segment_appointment_type_id(intl_appointment_type_id)
+            roles = (int(nat_at_id),) if nat_at_id is not None else None
+        allowed = allowed_segment_discipline_type_ids(
+            intl_appointment_type_id, directory_discipline_id
+        )
+        if roles is None or (allowed is not None and not allowed):
+            key = ("none",)
+        else:
+            key = ("appointment", roles, allowed)
+        self._appointment_keys[cache_key] = key
+        return key
+
+    def _appointment_mask(self, key: tuple[Any, ...]) -> np.ndarray:
+        if key[0] == "none":
+            return self._none()
+        _, roles, allowed = key
+
+        def build() -> np.ndarray:
+            mask = self._role_mask(roles)
+            if allowed is not None:
+                mask = mask & self._segment_discipline.isin(allowed).to_numpy(dtype=bool)
+            return mask
+
+        return self._cached(key, build)
+
+    def _filter_mask(self, f: PanelFilter) -> np.ndarray:
+        def build() -> np.ndarray:
+            if f.branch_role_ids == ():
+                return self._none()
+            mask = self._has_keys & self._season_mask(f.season_codes)
+            mask = mask & self._level_mask(f.segment_levels)
+            if f.scope is not None:
+                mask = mask & self._scope_mask(f.scope)
+            if f.championship_or_olympic_only:
+                mask = mask & self._championship_mask()
+            if f.segment_level is not None:
+                mask = mask & (self._frame["segment_level"] == f.segment_level).to_numpy(
+                    dtype=bool
+                )
+            if f.segment_discipline_type_id is not None:
+                mask = mask & (
+                    self._segment_discipline == int(f.segment_discipline_type_id)
+                ).to_numpy(dtype=bool)
+            if f.branch_role_ids is not None:
+                mask = mask & self._role_mask(f.branch_role_ids)
+            if f.rule411 and mask.any():
+                mask = mask & self._rule411_mask()
+            return mask
+
+        return self._cached(("filter", f), build)
+
+    def competition_ids(
+        self, official_id: int, appointment_key: tuple[Any, ...], f: PanelFilter
+    ) -> frozenset[int]:
+        """Distinct competitions for one official (all officials computed together)."""
+        cache_key = (appointment_key, f)
+        by_official = self._ids.get(cache_key)
+        if by_official is None:
+            mask = self._appointment_mask(appointment_key) & self._filter_mask(f)
+            by_official = {}
+            if mask.any():
+                grouped = pd.Series(self._competition[mask]).groupby(
+                    self._official[mask], sort=False
+                )
+                by_official = {
+                    int(oid): frozenset(int(c) for c in comps)
+                    for oid, comps in grouped.unique().items()
+                }
+            self._ids[cache_key] = by_official
+        return by_official.get(int(official_id), _EMPTY_IDS)
+
+
+class CompiledRequirementEvaluator:
+    """Summary-table requirement evaluation over a ``RequirementSummaryContext``."""
+
+    def __init__(self, summary_ctx: RequirementSummaryContext):
+        self._ctx = summary_ctx
+        self._panel = CompiledPanel(summary_ctx.panel)
+        self._rules_by_purpose = {
+            "maintain": summary_ctx.maintain_rules,
+            "promote": summary_ctx.promote_rules,
+        }
+        self._compiled_sets: dict[int, CompiledRuleSet] = {}
+        self._sets_for_appointment: dict[tuple[Any, ...], list[CompiledRuleSet]] = {}
+
+    def rule_sets_for(
+        self,
+        purpose: Purpose,
+        appointment_type_id: int,
+        directory_discipline_id: Any,
+        listing_tier: str | None,
+    ) -> list[CompiledRuleSet]:
+        key = (purpose, int(appointment_type_id), directory_discipline_id, listing_tier)
+        cached = self._sets_for_appointment.get(key)
+        if cached is not None:
+            return cached
+        rules = self._rules_by_purpose[purpose]
+        out: list[CompiledRuleSet] = []
+        if not rules.empty:
+            matched = _filter_rule_rows_for_appointment(
+                rules,
+                appointment_type_id=appointment_type_id,
+                directory_discipline_id=directory_discipline_id,
+                listing_tier=listing_tier,
+            )
+            for rule_set_id, group in matched.groupby("rule_set_id", sort=False):
+                compiled = self._compiled_sets.get(int(rule_set_id))
+                if compiled is None:
+                    compiled = compile_rule_set(int(rule_set_id), group)
+                    self._compiled_sets[int(rule_set_id)] = compiled
+                out.append(compiled)
+        self._sets_for_appointment[key] = out
+        return out
+
+    def evaluate(
+        self,
+        official_id: int,
+        appointment_type_id: int,
+        directory_discipline_id: Any,
+        purpose: Purpose,
+        *,
+        listing_tier: str | None,
+        seminars_for_appointment: pd.DataFrame,
+    ) -> list[RequirementEvaluation]:
+        """Same results as ``evaluate_requirements_for_appointment`` minus qualifying tables."""
+        if not activity_database_is_postgresql():
+            return []
+        rule_sets = self.rule_sets_for(
+            purpose, appointment_type_id, directory_discipline_id, listing_tier
+        )
+        if not rule_sets:
+            return []
+
+        ctx = self._ctx
+        appt_ctx = _appointment_context_from_batch(
+            ctx.appointment_contexts,
+            official_id,
+            appointment_type_id,
+            directory_discipline_id,
+        )
+        appointment_rows = ctx.appointment_rows_by_official.get(int(official_id), [])
+
+        out: list[RequirementEvaluation] = []
+        for rule_set in rule_sets:
+            applies, skip_reason = _rule_set_applies(
+                rule_set.head,
+                appointment_type_id=appointment_type_id,
+                directory_discipline_id=directory_discipline_id,
+                appointment_level_id=appt_ctx.get("level_id"),
+                international_level_id=ctx.international_level_id,
+                isu_level_id=ctx.isu_level_id,
+                purpose=purpose,
+                official_id=official_id,
+                isu_listing_keys=ctx.isu_listing_keys,
+            )
+            season_codes = ctx.season_codes_for_window(rule_set.season_window)
+            if not applies:
+                out.append(
+                    _not_applicable_requirement_evaluation(
+                        rule_set.rule_set_id,
+                        rule_set.head,
+                        purpose,
+                        season_codes=season_codes,
+                        reason=skip_reason,
+                    )
+                )
+                continue
+
+            rule_results = [
+                self._evaluate_rule(
+                    rule,
+                    official_id=int(official_id),
+                    appointment_type_id=int(appointment_type_id),
+                    directory_discipline_id=directory_discipline_id,
+                    season_codes=season_codes,
+                    appt_ctx=appt_ctx,
+                    appointment_rows=appointment_rows,
+                    seminars_for_appointment=seminars_for_appointment,
+                )
+                for rule in rule_set.rules
+            ]
+            out.append(
+                _requirement_evaluation_from_results(
+                    rule_set.rule_set_id,
+                    rule_set.head,
+                    purpose,
+                    season_codes=season_codes,
+                    rule_results=rule_results,
+                )
+            )
+        return out
+
+    def _evaluate_rule(
+        self,
+        rule: CompiledRule,
+        *,
+        official_id: int,
+        appointment_type_id: int,
+        directory_discipline_id: Any,
+        season_codes: list[int],
+        appt_ctx: dict[str, Any],
+        appointment_rows: list[dict[str, Any]],
+        seminars_for_appointment: pd.DataFrame,
+    ) -> RuleCheckResult:
+        metric = rule.metric
+        if metric in _APPOINTMENT_ONLY_METRICS:
+            return _evaluate_rule(
+                rule.row,
+                official_id=official_id,
+                appointment_type_id=appointment_type_id,
+                directory_discipline_id=directory_discipline_id,
+                season_codes=season_codes,
+                listing_season_code=self._ctx.listing_season_code,
+                appt_ctx=appt_ctx,
+                appointment_rows=appointment_rows,
+                international_level_id=int(self._ctx.international_level_id),
+                isu_level_id=int(self._ctx.isu_level_id),
+                seminars_for_appointment=seminars_for_appointment,
+            )
+
+        panel = self._panel
+        appt = panel.appointment_key(
+            rule.role_ids, appointment_type_id, directory_discipline_id
+        )
+        codes = tuple(int(c) for c in season_codes)
+        types_scope = ("types", rule.competition_type_ids, rule.include_qualifying_national)
+
+        def count(**kwargs: Any) -> int:
+            f = PanelFilter(segment_levels=rule.segment_levels, **kwargs)
+            return len(panel.competition_ids(official_id, appt, f))
+
+        if metric == "judge_promote_isu":
+            total = count(season_codes=codes, scope=types_scope, rule411=False)
+
+            def count_for_requirement(kind: str, value: Any, req_codes: list[int]) -> int:
+                req_season = tuple(int(c) for c in req_codes)
+                if kind == "segment_level":
+                    return count(season_codes=req_season, scope=types_scope, segment_level=value)
+                if kind == "segment_discipline_type_id":
+                    return count(
+                        season_codes=req_season,
+                        scope=types_scope,
+                        segment_discipline_type_id=int(value),
+                    )
+                return count(season_codes=req_season, scope=("scope", value))
+
+            met, detail = _judge_promote_isu_outcome(
+                rule.metric_config,
+                season_codes=season_codes,
+                total=total,
+                count_for_requirement=count_for_requirement,
+            )
+            return RuleCheckResult(metric, rule.display_label, 1, 1 if met else 0, met, detail)
+
+        if metric == "tc_ts_promote_isu":
+            met, detail = _tc_ts_promote_isu_outcome(
+                rule.metric_config,
+                total=count(season_codes=codes, scope=types_scope),
+                intl_only=count(season_codes=codes, scope=("scope", "international_all")),
+            )
+            return RuleCheckResult(metric, rule.display_label, 1, 1 if met else 0, met, detail)
+
+        if metric == "competition_alternatives":
+
+            def branch_scope_ids(role_ids: tuple[int, ...] | None) -> ScopeCompetitionIds:
+                def scope_ids(scope: str) -> set[int]:
+                    f = PanelFilter(
+                        season_codes=codes,
+                        segment_levels=rule.segment_levels,
+                        scope=("scope", scope),
+                        branch_role_ids=role_ids,
+                    )
+                    return set(panel.competition_ids(official_id, appt, f))
+
+                return scope_ids
+
+            met, _via, detail = _evaluate_competition_alternatives_with(
+                rule.metric_config,
+                branch_scope_ids,
+                intl_appointment_type_id=appointment_type_id,
+            )
+            return RuleCheckResult(metric, rule.display_label, 1, 1 if met else 0, met, detail)
+
+        actual = count(
+            season_codes=codes,
+            scope=types_scope,
+            championship_or_olympic_only=rule.championship_or_olympic_only,
+        )
+        met = actual >= rule.min_value
+        detail = (
+            f"{actual}/{rule.min_value} competitions "
+            f"({', '.join(str(c) for c in season_codes)})"
+        )
+        return RuleCheckResult(metric, rule.display_label, rule.min_value, actual, met, detail)
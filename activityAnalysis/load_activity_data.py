@@ -16,6 +16,22 @@ try:
         CompetitionType,
         AppointmentTypes,
         Levels,
+        OfficialActivityFact,
+    )
+    from activityAnalysis.official_activity_fact import (
+        ACTIVITY_SOURCE_ASSIGNMENT,
+        ACTIVITY_SOURCE_SEGMENT,
+        PANEL_ROLE_ALL,
+        official_activity_fact_is_empty,
+        panel_role_sql_predicate,
+        refresh_assignment_facts,
+    )
+    from activityAnalysis.assignment_import import (
+        IMPORT_ACTION_INSERT,
+        IMPORT_ACTION_UNCHANGED,
+        IMPORT_ACTION_UPDATE,
+        AssignmentImportPlan,
+        import_assignments,
     )
 except ModuleNotFoundError:
     from officials_analysis_models import (
@@ -28,10 +44,25 @@ except ModuleNotFoundError:
         CompetitionType,
         AppointmentTypes,
         Levels,
+        OfficialActivityFact,
+    )
+    from official_activity_fact import (
+        ACTIVITY_SOURCE_ASSIGNMENT,
+        ACTIVITY_SOURCE_SEGMENT,
+        PANEL_ROLE_ALL,
+        official_activity_fact_is_empty,
+        panel_role_sql_predicate,
+        refresh_assignment_facts,
+    )
+    from assignment_import import (
+        IMPORT_ACTION_INSERT,
+        IMPORT_ACTION_UNCHANGED,
+        IMPORT_ACTION_UPDATE,
+        AssignmentImportPlan,
+        import_assignments,
     )
 from sqlalchemy.orm import Session
-from sqlalchemy import create_engine, select, func, and_, or_, case, text, bindparam, tuple_
-import math
+from sqlalchemy import create_engine, select, func, and_, or_, case, text, bindparam
 import re
 from datetime import date, datetime
 
@@ -175,6 +206,17 @@ def _seed_local_sqlite_data_if_empty(db_engine):
                 assignment,
             ]
         )
+        session.flush()
+        refresh_assignment_facts(session)
+        session.commit()
+
+
+def _backfill_local_activity_facts(db_engine):
+    """Fill ``official_activity_fact`` for local SQLite databases created before it existed."""
+    with Session(db_engine) as session:
+        if not official_activity_fact_is_empty(session, ACTIVITY_SOURCE_ASSIGNMENT):
+            return
+        refresh_assignment_facts(session)
         session.commit()
 
 
@@ -191,6 +233,7 @@ def get_engine():
     if database_url.startswith("sqlite:"):
         Base.metadata.create_all(db_engine)
         _seed_local_sqlite_data_if_empty(db_engine)
+        _backfill_local_activity_facts(db_engine)
     return db_engine
 
 
@@ -467,27 +510,32 @@ def load_event(
     return final_df
 
 
-def find_missing_officials_names_and_positions(session, officials_df):
+RETIRED_OFFICIALS_FILE = "activityAnalysis/Retired_officials.xlsx"
+
+
+@lru_cache(maxsize=None)
+def retired_official_names(file: str = RETIRED_OFFICIALS_FILE) -> frozenset[str]:
+    """``Name`` column of the retired officials sheet (read once per process)."""
+    retired_df = pd.read_excel(file)
+    return frozenset(str(n) for n in retired_df["Name"] if pd.notna(n))
+
+
+def find_missing_officials_names_and_positions(session, officials_df, db_names=None):
     missing_positions_df = officials_df[officials_df["Discipline"].isnull()]
     if not missing_positions_df.empty:
         print("missing positions:")
         print(missing_positions_df)
 
-    results = session.query(Officials.full_name).all()
-
-    db_names = {
-        name
-        # normalize(name)
-        for (name,) in results
-        if name is not None
-    }
+    if db_names is None:
+        db_names = {
+            name
+            for (name,) in session.query(Officials.full_name).all()
+            if name is not None
+        }
 
     excel_names = set(officials_df["Person"])
 
-    retired_df = pd.read_excel("activityAnalysis/Retired_officials.xlsx")
-    retired_names = set(retired_df["Name"])
-
-    missing = excel_names - db_names - retired_names
+    missing = excel_names - set(db_names) - retired_official_names()
 
     print(f"Missing ({len(missing)}):")
     for name in sorted(missing):
@@ -542,200 +590,131 @@ def get_or_create_competition(
     return comp
 
 
-def insert_assignments(
-    session, assignments_df, officials, *, sectionals_dedupe_by_type_year: bool = False
-):
+def assignment_import_frame(assignments_df, officials) -> pd.DataFrame:
     """
-    Insert or lightly update assignment rows from a loaded event dataframe.
+    Typed ``assignment_import`` rows from a loaded event dataframe (``load_event``).
 
-    Uses batched SELECTs for existing rows and a single bulk insert for new rows
-    to reduce round-trips on remote PostgreSQL (the previous per-row existence
-    query was one SELECT per spreadsheet row).
+    Rows whose person is not in ``officials`` (name → id) or whose position has no
+    discipline / appointment type mapping are reported and dropped.
     """
-    retired_df = pd.read_excel("activityAnalysis/Retired_officials.xlsx")
-    retired_names = set(retired_df["Name"])
-
-    pending: list[dict[str, Any]] = []
-    for _, row in assignments_df.iterrows():
-        competiton_name = row["CompetitionName"]
-        competition_type_id = row["CompetitionType"]
-
-        official_id = officials.get(row["Person"])
-
-        if not official_id:
-            if row["Person"] not in retired_names:
-                print(f"Missing official: {row['Person']}")
-            continue
-
-        discipline_id = row.Discipline
-        appointment_type_id = row.Appointment_Type_Id
-
-        if not discipline_id or not appointment_type_id or math.isnan(discipline_id):
-            print(f"Missing mapping: {row}")
-            continue
-
-        try:
-            ctid = int(competition_type_id)
-            did = int(discipline_id)
-            atid = int(appointment_type_id)
-        except (TypeError, ValueError):
-            print(f"Missing mapping: {row}")
-            continue
-
-        pending.append(
-            {
-                "competition_name": competiton_name,
-                "year": row["Year"],
-                "competition_type_id": ctid,
-                "official_id": official_id,
-                "discipline_id": did,
-                "appointment_type_id": atid,
-                "chief": bool(row.get("Chief", False)),
-                "lower_levels_only": bool(row.get("Lower_Levels_Only", False)),
-            }
-        )
-
-    comp_cache: dict[tuple[Any, ...], Competition] = {}
-
-    def _cache_key(p: dict[str, Any]) -> tuple[Any, ...]:
-        if sectionals_dedupe_by_type_year:
-            return (p["year"], p["competition_type_id"])
-        return (p["year"], p["competition_name"], p["competition_type_id"])
-
-    def _get_comp(p: dict[str, Any]) -> Competition:
-        key = _cache_key(p)
-        if key not in comp_cache:
-            comp_cache[key] = get_or_create_competition(
-                session,
-                p["year"],
-                p["competition_name"],
-                p["competition_type_id"],
-                sectionals_match_by_type_and_year=sectionals_dedupe_by_type_year,
-            )
-        return comp_cache[key]
+    df = assignments_df
+    official_id = df["Person"].map(officials)
+    missing_official = official_id.isna()
+    retired_names = retired_official_names()
+    for person in df.loc[missing_official, "Person"]:
+        if person not in retired_names:
+            print(f"Missing official: {person}")
+
+    discipline_id = pd.to_numeric(df["Discipline"], errors="coerce")
+    appointment_type_id = pd.to_numeric(df["Appointment_Type_Id"], errors="coerce")
+    competition_type_id = pd.to_numeric(df["CompetitionType"], errors="coerce")
+    unmapped = ~missing_official & (
+        discipline_id.isna()
+        | (discipline_id == 0)
+        | appointment_type_id.isna()
+        | (appointment_type_id == 0)
+        | competition_type_id.isna()
+    )
+    for _, row in df.loc[unmapped].iterrows():
+        print(f"Missing mapping: {row}")
 
-    for p in pending:
-        p["competition_id"] = _get_comp(p).id
+    keep = ~missing_official & ~unmapped
+    false_col = pd.Series(False, index=df.index)
+    return pd.DataFrame(
+        {
+            "year": df.loc[keep, "Year"],
+            "competition_name": df.loc[keep, "CompetitionName"],
+            "competition_type_id": competition_type_id[keep],
+            "official_id": official_id[keep],
+            "discipline_id": discipline_id[keep],
+            "appointment_type_id": appointment_type_id[keep],
+            "chief": df.get("Chief", false_col)[keep],
+            "lower_levels_only": df.get("Lower_Levels_Only", false_col)[keep],
+        }
+    )
 
-    if not pending:
-        session.commit()
-        return
 
-    key_batch = 2000 if activity_database_is_postgresql() else 120
+def insert_assignments(
+    session,
+    assignments_df,
+    officials,
+    *,
+    sectionals_dedupe_by_type_year: bool = False,
+    dry_run: bool = False,
+    commit: bool = True,
+) -> AssignmentImportPlan:
+    """
+    Insert or lightly update assignment rows from a loaded event dataframe.
 
-    unique_keys: list[tuple[int, int, int, int]] = list(
-        dict.fromkeys(
-            (
-                p["competition_id"],
-                p["official_id"],
-                p["discipline_id"],
-                p["appointment_type_id"],
-            )
-            for p in pending
-        )
+    Competitions and existing assignments are matched with one query each and
+    writes are batched (see ``assignment_import``). ``dry_run`` only plans; the
+    returned plan lists inserts, flag updates and unchanged rows either way.
+    """
+    plan = import_assignments(
+        session,
+        assignment_import_frame(assignments_df, officials),
+        match_competitions_by_type_and_year=sectionals_dedupe_by_type_year,
+        dry_run=dry_run,
     )
+    if commit and not dry_run:
+        session.commit()
+    return plan
 
-    existing_map: dict[tuple[int, int, int, int], Assignment] = {}
-    for i in range(0, len(unique_keys), key_batch):
-        chunk = unique_keys[i : i + key_batch]
-        if not chunk:
-            continue
-        rows = session.execute(
-            select(Assignment).where(
-                tuple_(
-                    Assignment.competition_id,
-                    Assignment.official_id,
-                    Assignment.discipline_id,
-                    Assignment.appointment_type_id,
-                ).in_(chunk)
-            )
-        ).scalars().all()
-        for a in rows:
-            k = (a.competition_id, a.official_id, a.discipline_id, a.appointment_type_id)
-            existing_map[k] = a
-
-    staged_new: set[tuple[int, int, int, int]] = set()
-    to_insert: list[dict[str, Any]] = []
-    for p in pending:
-        k = (
-            p["competition_id"],
-            p["official_id"],
-            p["discipline_id"],
-            p["appointment_type_id"],
-        )
-        ex = existing_map.get(k)
-        if ex is not None:
-            if bool(ex.chief) != p["chief"] or bool(ex.lower_levels_only) != p[
-                "lower_levels_only"
-            ]:
-                ex.chief = p["chief"]
-                ex.lower_levels_only = p["lower_levels_only"]
-            continue
-        if k in staged_new:
-            continue
-        staged_new.add(k)
-        to_insert.append(
-            {
-                "competition_id": p["competition_id"],
-                "official_id": p["official_id"],
-                "discipline_id": p["discipline_id"],
-                "appointment_type_id": p["appointment_type_id"],
-                "chief": p["chief"],
-                "lower_levels_only": p["lower_levels_only"],
-            }
-        )
 
-    if to_insert:
-        session.bulk_insert_mappings(Assignment, to_insert)
+# (workbook, is_synchro, sectionals_dedupe_by_type_year) read by ``load_history``.
+HISTORY_WORKBOOKS: tuple[tuple[str, bool, bool], ...] = (
+    ("activityAnalysis/US_Champs.xlsx", False, False),
+    ("activityAnalysis/US_SYS_Champs.xlsx", True, False),
+    ("activityAnalysis/US_SYS_Sectionals.xlsx", True, True),
+    ("activityAnalysis/US_SPD_Sectionals.xlsx", False, True),
+)
 
-    session.commit()
 
+def load_history(write_to_database=False, *, dry_run=False):
+    """
+    Import assignment history from the ``HISTORY_WORKBOOKS`` in one transaction.
 
-def load_history(write_to_database=False):
+    Without ``write_to_database`` only missing officials / positions are reported.
+    ``dry_run`` plans every workbook and rolls back; the returned
+    ``{workbook: AssignmentImportPlan}`` is the diff.
+    """
     appointment_code_df = create_appointment_code_df()
-    us_champs_df = load_event(
-        appointment_code_df, file="activityAnalysis/US_Champs.xlsx"
-    )
-    us_synchro_champs_df = load_event(
-        appointment_code_df, file="activityAnalysis/US_SYS_Champs.xlsx", is_synchro=True
-    )
-    us_synchro_sectionals_df = load_event(
-        appointment_code_df,
-        file="activityAnalysis/US_SYS_Sectionals.xlsx",
-        is_synchro=True,
-    )
-    us_spd_sectionals_df = load_event(
-        appointment_code_df,
-        file="activityAnalysis/US_SPD_Sectionals.xlsx",
-        is_synchro=False,
-    )
+    events = [
+        (
+            file,
+            load_event(appointment_code_df, file=file, is_synchro=is_synchro),
+            dedupe_by_type_year,
+        )
+        for file, is_synchro, dedupe_by_type_year in HISTORY_WORKBOOKS
+    ]
 
+    plans: dict[str, AssignmentImportPlan] = {}
     with Session(engine) as session:
-        find_missing_officials_names_and_positions(session, us_champs_df)
-        find_missing_officials_names_and_positions(session, us_synchro_champs_df)
-        find_missing_officials_names_and_positions(session, us_synchro_sectionals_df)
-        find_missing_officials_names_and_positions(session, us_spd_sectionals_df)
-
         officials = {
             o.full_name: o.id for o in session.query(Officials).all() if o.full_name
         }
-
-        if write_to_database:
-            insert_assignments(session, us_champs_df, officials)
-            insert_assignments(session, us_synchro_champs_df, officials)
-            insert_assignments(
-                session,
-                us_synchro_sectionals_df,
-                officials,
-                sectionals_dedupe_by_type_year=True,
-            )
-            insert_assignments(
-                session,
-                us_spd_sectionals_df,
-                officials,
-                sectionals_dedupe_by_type_year=True,
+        for _, event_df, _ in events:
+            find_missing_officials_names_and_positions(
+                session, event_df, db_names=officials.keys()
             )
 
+        if write_to_database or dry_run:
+            for file, event_df, dedupe_by_type_year in events:
+                plans[file] = insert_assignments(
+                    session,
+                    event_df,
+                    officials,
+                    sectionals_dedupe_by_type_year=dedupe_by_type_year,
+                    dry_run=dry_run,
+                    commit=False,
+                )
+                print(f"{file}: {plans[file].counts()}", flush=True)
+            if dry_run:
+                session.rollback()
+            else:
+                session.commit()
+    return plans
+
 
 def get_assignments_for_person(person_name):
     with Session(engine) as session:
@@ -1058,7 +1037,7 @@ def _normalize_competition_type_ids(competition_type_id):
 
 def _lower_levels_only_clauses(include_lower_levels) -> list:
     """
-    Filter ``Assignment`` rows by ``lower_levels_only`` (championships / national work).
+    Filter assignment facts by ``lower_levels_only`` (championships / national work).
 
     * ``None`` — no extra filter (e.g. sectionals).
     * ``True`` — no extra filter (championships with “include lower level” work).
@@ -1066,7 +1045,30 @@ def _lower_levels_only_clauses(include_lower_levels) -> list:
     """
     if include_lower_levels is not False:
         return []
-    return [Assignment.lower_levels_only.is_(False)]
+    return [OfficialActivityFact.lower_levels_only.is_(False)]
+
+
+def _assignment_fact_filters(
+    *,
+    appointment_type_id=None,
+    competition_type_ids=None,
+    discipline_ids=None,
+    official_ids=None,
+) -> list:
+    """
+    ``official_activity_fact`` predicates for assignment history (see
+    ``activityAnalysis/official_activity_fact.py``); ``None`` skips a filter.
+    """
+    filters = [OfficialActivityFact.source == ACTIVITY_SOURCE_ASSIGNMENT]
+    if appointment_type_id is not None:
+        filters.append(OfficialActivityFact.appointment_type_id == appointment_type_id)
+    if competition_type_ids is not None:
+        filters.append(OfficialActivityFact.competition_type_id.in_(competition_type_ids))
+    if discipline_ids is not None:
+        filters.append(OfficialActivityFact.discipline_id.in_(discipline_ids))
+    if official_ids is not None:
+        filters.append(OfficialActivityFact.official_id.in_(list(official_ids)))
+    return filters
 
 
 # SPD sectionals (1–3) + synchronized sectionals (5–7, 9), aggregated by calendar year.
@@ -1136,20 +1138,18 @@ def get_assignment_years(
     ct_ids = _normalize_competition_type_ids(competition_type_id)
 
     with Session(engine) as session:
-        filters = [
-            Assignment.appointment_type_id == appointment_type_id,
-            Competition.competition_type_id.in_(ct_ids),
-        ]
-        if discipline_ids is not None:
-            filters.append(Assignment.discipline_id.in_(discipline_ids))
+        filters = _assignment_fact_filters(
+            appointment_type_id=appointment_type_id,
+            competition_type_ids=ct_ids,
+            discipline_ids=discipline_ids,
+        )
         filters.extend(_lower_levels_only_clauses(include_lower_levels))
 
         stmt = (
-            select(Assignment.official_id, Competition.year)
-            .join(Competition, Assignment.competition_id == Competition.id)
+            select(OfficialActivityFact.official_id, OfficialActivityFact.year)
             .where(*filters)
             .distinct()
-            .order_by(Competition.year.desc())
+            .order_by(OfficialActivityFact.year.desc())
         )
 
         rows = session.execute(stmt).all()
@@ -1172,23 +1172,18 @@ def get_years_all_lower_level_only_in_role(
     ct_ids = _normalize_competition_type_ids(competition_type_id)
 
     with Session(engine) as session:
-        filters = [
-            Assignment.appointment_type_id == appointment_type_id,
-            Competition.competition_type_id.in_(ct_ids),
-            Assignment.official_id.in_(list(official_ids)),
-        ]
-        if discipline_ids is not None:
-            filters.append(Assignment.discipline_id.in_(discipline_ids))
-
-        stmt = (
-            select(
-                Assignment.official_id,
-                Competition.year,
-                Assignment.lower_levels_only,
-            )
-            .join(Competition, Assignment.competition_id == Competition.id)
-            .where(*filters)
+        filters = _assignment_fact_filters(
+            appointment_type_id=appointment_type_id,
+            competition_type_ids=ct_ids,
+            discipline_ids=discipline_ids,
+            official_ids=official_ids,
         )
+
+        stmt = select(
+            OfficialActivityFact.official_id,
+            OfficialActivityFact.year,
+            OfficialActivityFact.lower_levels_only,
+        ).where(*filters)
         rows = session.execute(stmt).all()
 
     if not rows:
@@ -1383,25 +1378,27 @@ def get_any_role_years(official_ids, competition_type_id, include_lower_levels=N
         )
     ct_ids = _normalize_competition_type_ids(competition_type_id)
     with Session(engine) as session:
-        w = [
-            Competition.competition_type_id.in_(ct_ids),
-            Assignment.official_id.in_(official_ids),
-        ]
+        w = _assignment_fact_filters(
+            competition_type_ids=ct_ids,
+            official_ids=official_ids,
+        )
         w.extend(_lower_levels_only_clauses(include_lower_levels))
         stmt = (
             select(
-                Assignment.official_id,
-                Competition.year,
-                Competition.id.label("competition_id"),
-                Competition.competition_type_id,
+                OfficialActivityFact.official_id,
+                OfficialActivityFact.year,
+                OfficialActivityFact.competition_id,
+                OfficialActivityFact.competition_type_id,
                 AppointmentTypes.name.label("role"),
-                Assignment.discipline_id,
+                OfficialActivityFact.discipline_id,
+            )
+            .join(
+                AppointmentTypes,
+                OfficialActivityFact.appointment_type_id == AppointmentTypes.id,
             )
-            .join(Competition, Assignment.competition_id == Competition.id)
-            .join(AppointmentTypes, Assignment.appointment_type_id == AppointmentTypes.id)
             .where(*w)
             .distinct()
-            .order_by(Competition.year.desc(), AppointmentTypes.name)
+            .order_by(OfficialActivityFact.year.desc(), AppointmentTypes.name)
         )
         rows = session.execute(stmt).all()
     return pd.DataFrame(
@@ -1438,22 +1435,20 @@ def get_chief_years(
     ct_ids = _normalize_competition_type_ids(competition_type_id)
 
     with Session(engine) as session:
-        filters = [
-            Assignment.appointment_type_id == appointment_type_id,
-            Competition.competition_type_id.in_(ct_ids),
-            Assignment.official_id.in_(official_ids),
-            Assignment.chief.is_(True),
-        ]
-        if discipline_ids is not None:
-            filters.append(Assignment.discipline_id.in_(discipline_ids))
+        filters = _assignment_fact_filters(
+            appointment_type_id=appointment_type_id,
+            competition_type_ids=ct_ids,
+            discipline_ids=discipline_ids,
+            official_ids=official_ids,
+        )
+        filters.append(OfficialActivityFact.chief.is_(True))
         filters.extend(_lower_levels_only_clauses(include_lower_levels))
 
         stmt = (
-            select(Assignment.official_id, Competition.year)
-            .join(Competition, Assignment.competition_id == Competition.id)
+            select(OfficialActivityFact.official_id, OfficialActivityFact.year)
             .where(*filters)
             .distinct()
-            .order_by(Competition.year.desc())
+            .order_by(OfficialActivityFact.year.desc())
         )
         rows = session.execute(stmt).all()
 
@@ -1496,16 +1491,19 @@ def get_assigned_competition_counts(competition_type_ids):
                 Officials.id.label("official_id"),
                 Officials.full_name,
                 func.max(Officials.region).label("region"),
-                func.count(func.distinct(Competition.id)).label("competitions_assigned"),
-                func.max(Competition.year).label("most_recent_year"),
+                func.count(func.distinct(OfficialActivityFact.competition_id)).label(
+                    "competitions_assigned"
+                ),
+                func.max(OfficialActivityFact.year).label("most_recent_year"),
+            )
+            .join(OfficialActivityFact, OfficialActivityFact.official_id == Officials.id)
+            .where(
+                *_assignment_fact_filters(competition_type_ids=competition_type_ids)
             )
-            .join(Assignment, Assignment.official_id == Officials.id)
-            .join(Competition, Assignment.competition_id == Competition.id)
-            .where(Competition.competition_type_id.in_(competition_type_ids))
             .group_by(Officials.id, Officials.full_name)
             .order_by(
-                func.count(func.distinct(Competition.id)).desc(),
-                func.max(Competition.year).desc(),
+                func.count(func.distinct(OfficialActivityFact.competition_id)).desc(),
+                func.max(OfficialActivityFact.year).desc(),
                 Officials.full_name.asc(),
             )
         )
@@ -1635,24 +1633,23 @@ def get_referee_yearly_activity_report(
     assign_disc_ids = _ref_assignment_discipline_ids(comp_group_name, discipline_id)
 
     with Session(engine) as session:
-        filters = [
-            Competition.competition_type_id.in_(competition_type_ids),
-            Assignment.appointment_type_id == REFEREE_APPOINTMENT_TYPE_ID,
-            Assignment.discipline_id.in_(assign_disc_ids),
-            Officials.id.in_(eligible_ids),
-        ]
+        filters = _assignment_fact_filters(
+            appointment_type_id=REFEREE_APPOINTMENT_TYPE_ID,
+            competition_type_ids=competition_type_ids,
+            discipline_ids=assign_disc_ids,
+            official_ids=eligible_ids,
+        )
         stmt = (
             select(
                 Officials.id.label("official_id"),
                 Officials.full_name,
-                Competition.year,
-                Assignment.chief,
-                Assignment.discipline_id,
+                OfficialActivityFact.year,
+                OfficialActivityFact.chief,
+                OfficialActivityFact.discipline_id,
                 Disciplines.name.label("discipline_name"),
             )
-            .join(Assignment, Assignment.official_id == Officials.id)
-            .join(Competition, Assignment.competition_id == Competition.id)
-            .join(Disciplines, Assignment.discipline_id == Disciplines.id)
+            .join(OfficialActivityFact, OfficialActivityFact.official_id == Officials.id)
+            .join(Disciplines, OfficialActivityFact.discipline_id == Disciplines.id)
             .where(*filters)
         )
         rows = session.execute(stmt).all()
@@ -2465,6 +2462,10 @@ def get_competition_assignment_rows(competition_id: int):
     )
 
 
+# ``changes`` frame returned by the US Championships chief / referee loaders.
+_LOADER_CHANGE_COLUMNS = ["name", "year", "competition_id", "action"]
+
+
 def _parse_chiefed_years(value):
     if pd.isna(value):
         return []
@@ -2500,6 +2501,10 @@ def load_chief_scoring_officials_us_champs(
         appointment type "Scoring Official" at US Championships competitions.
       - If no matching assignment exists, record it in 'missing_assignment'
         for manual follow-up.
+
+    Existing assignments are fetched in one query. ``changes`` lists every
+    insert / update / unchanged assignment; with ``write_to_database=False`` the
+    session rolls back, so the result is a dry-run diff.
     """
     df = pd.read_excel(file_path, sheet_name=sheet_name)
     required_cols = {"First Name", "Last Name", "Chiefed US Champs"}
@@ -2542,6 +2547,21 @@ def load_chief_scoring_officials_us_champs(
         for comp in competitions:
             comp_by_year.setdefault(comp.year, []).append(comp)
 
+        # All Scoring Official assignments at US Championships, fetched once.
+        assignments_by_comp_official: dict[tuple[int, int], list[Assignment]] = {}
+        for assignment in session.scalars(
+            select(Assignment)
+            .join(Competition, Competition.id == Assignment.competition_id)
+            .where(
+                Competition.competition_type_id == US_CHAMPIONSHIPS_COMPETITION_TYPE_ID,
+                Assignment.appointment_type_id == scoring_official_appt.id,
+            )
+        ):
+            assignments_by_comp_official.setdefault(
+                (assignment.competition_id, assignment.official_id), []
+            ).append(assignment)
+        changes = []
+
         for _, row in df.iterrows():
             first = "" if pd.isna(row["First Name"]) else str(row["First Name"]).strip()
             last = "" if pd.isna(row["Last Name"]) else str(row["Last Name"]).strip()
@@ -2599,15 +2619,7 @@ def load_chief_scoring_officials_us_champs(
 
                 found_assignment = False
                 for comp in comps:
-                    assignments = (
-                        session.query(Assignment)
-                        .filter(
-                            Assignment.competition_id == comp.id,
-                            Assignment.official_id == official_id,
-                            Assignment.appointment_type_id == scoring_official_appt.id,
-                        )
-                        .all()
-                    )
+                    assignments = assignments_by_comp_official.get((comp.id, official_id))
                     if not assignments:
                         if create_missing_assignments:
                             # Chief accountants are loaded as Scoring Official
@@ -2622,16 +2634,37 @@ def load_chief_scoring_officials_us_champs(
                                 lower_levels_only=False,
                             )
                             session.add(new_assignment)
+                            assignments_by_comp_official[(comp.id, official_id)] = [
+                                new_assignment
+                            ]
                             stats["created_assignment"] += 1
+                            changes.append(
+                                {
+                                    "name": full_name,
+                                    "year": yr,
+                                    "competition_id": comp.id,
+                                    "action": IMPORT_ACTION_INSERT,
+                                }
+                            )
                             found_assignment = True
                         continue
                     found_assignment = True
                     for assignment in assignments:
                         if assignment.chief:
                             stats["already_chief"] += 1
+                            action = IMPORT_ACTION_UNCHANGED
                         else:
                             assignment.chief = True
                             stats["updated_to_chief"] += 1
+                            action = IMPORT_ACTION_UPDATE
+                        changes.append(
+                            {
+                                "name": full_name,
+                                "year": yr,
+                                "competition_id": comp.id,
+                                "action": action,
+                            }
+                        )
 
                 if not found_assignment:
                     stats["missing_assignment"] += 1
@@ -2640,11 +2673,18 @@ def load_chief_scoring_officials_us_champs(
                     )
 
         if write_to_database:
+            refresh_assignment_facts(
+                session, {c.id for comps in comp_by_year.values() for c in comps}
+            )
             session.commit()
         else:
             session.rollback()
 
-    return {"stats": stats, "missing_details": pd.DataFrame(missing_details)}
+    return {
+        "stats": stats,
+        "missing_details": pd.DataFrame(missing_details),
+        "changes": pd.DataFrame(changes, columns=_LOADER_CHANGE_COLUMNS),
+    }
 
 
 # US Championships referees (US_Champs_Referees.xlsx)
@@ -2688,7 +2728,9 @@ def load_us_champs_referees_assignments(
       - Assistant Referee: chief=False, discipline_id=9, appointment_type_id=4
       - Assistant Referee Dance: chief=False, discipline_id=4, appointment_type_id=4
 
-    Skips rows that already have the same (competition, official, discipline, type).
+    Skips rows that already have the same (competition, official, discipline, type);
+    existing keys are fetched in one query. ``changes`` lists inserted / unchanged
+    rows (a dry-run diff when ``write_to_database=False``).
     """
     df = pd.read_excel(file_path, sheet_name=sheet_name)
     required = {"Year", "Role", "Name"}
@@ -2710,12 +2752,8 @@ def load_us_champs_referees_assignments(
     }
     missing_details = []
 
-    retired_path = "activityAnalysis/Retired_officials.xlsx"
     try:
-        retired_df = pd.read_excel(retired_path)
-        retired_names = {
-            str(n).strip().lower() for n in retired_df["Name"] if pd.notna(n)
-        }
+        retired_names = {n.strip().lower() for n in retired_official_names()}
     except Exception:
         retired_names = set()
 
@@ -2749,6 +2787,24 @@ def load_us_champs_referees_assignments(
                 continue
             comp_by_year.setdefault(comp.year, []).append(comp)
 
+        # Existing referee assignment keys at US Championships, fetched once.
+        existing_keys = {
+            tuple(r)
+            for r in session.execute(
+                select(
+                    Assignment.competition_id,
+                    Assignment.official_id,
+                    Assignment.discipline_id,
+                )
+                .join(Competition, Competition.id == Assignment.competition_id)
+                .where(
+                    Competition.competition_type_id == US_CHAMPIONSHIPS_COMPETITION_TYPE_ID,
+                    Assignment.appointment_type_id == REFEREE_APPOINTMENT_TYPE_ID,
+                )
+            ).all()
+        }
+        changes = []
+
         for _, row in df.iterrows():
             name = "" if pd.isna(row["Name"]) else str(row["Name"]).strip()
             if not name:
@@ -2829,20 +2885,28 @@ def load_us_champs_referees_assignments(
                 )
                 continue
 
-            exists = (
-                session.query(Assignment)
-                .filter_by(
-                    competition_id=comp.id,
-                    official_id=official_id,
-                    discipline_id=discipline_id,
-                    appointment_type_id=REFEREE_APPOINTMENT_TYPE_ID,
-                )
-                .first()
-            )
-            if exists:
+            key = (comp.id, official_id, discipline_id)
+            if key in existing_keys:
                 stats["skipped_duplicate"] += 1
+                changes.append(
+                    {
+                        "name": name,
+                        "year": year,
+                        "competition_id": comp.id,
+                        "action": IMPORT_ACTION_UNCHANGED,
+                    }
+                )
                 continue
 
+            existing_keys.add(key)
+            changes.append(
+                {
+                    "name": name,
+                    "year": year,
+                    "competition_id": comp.id,
+                    "action": IMPORT_ACTION_INSERT,
+                }
+            )
             session.add(
                 Assignment(
                     competition_id=comp.id,
@@ -2856,11 +2920,18 @@ def load_us_champs_referees_assignments(
             stats["inserted"] += 1
 
         if write_to_database:
+            refresh_assignment_facts(
+                session, {c.id for comps in comp_by_year.values() for c in comps}
+            )
             session.commit()
         else:
             session.rollback()
 
-    return {"stats": stats, "missing_details": pd.DataFrame(missing_details)}
+    return {
+        "stats": stats,
+        "missing_details": pd.DataFrame(missing_details),
+        "changes": pd.DataFrame(changes, columns=_LOADER_CHANGE_COLUMNS),
+    }
 
 
 def get_sectional_in_role_distinct_competition_counts(
@@ -2876,20 +2947,18 @@ def get_sectional_in_role_distinct_competition_counts(
     ct_ids = list(sectional_competition_type_ids)
     discipline_ids = _resolve_discipline_ids(discipline_id, appointment_type_id)
     with Session(engine) as session:
-        filters = [
-            Assignment.official_id.in_(list(official_ids)),
-            Assignment.appointment_type_id == appointment_type_id,
-            Competition.competition_type_id.in_(ct_ids),
-        ]
-        if discipline_ids is not None:
-            filters.append(Assignment.discipline_id.in_(discipline_ids))
+        filters = _assignment_fact_filters(
+            appointment_type_id=appointment_type_id,
+            competition_type_ids=ct_ids,
+            discipline_ids=discipline_ids,
+            official_ids=official_ids,
+        )
         stmt = (
             select(
-                Assignment.official_id,
-                Competition.year,
-                Competition.id.label("competition_id"),
+                OfficialActivityFact.official_id,
+                OfficialActivityFact.year,
+                OfficialActivityFact.competition_id,
             )
-            .join(Competition, Assignment.competition_id == Competition.id)
             .where(*filters)
             .distinct()
         )
@@ -3016,20 +3085,18 @@ def get_sectional_assignment_region_rows(
     ct_ids = list(sectional_competition_type_ids)
     discipline_ids = _resolve_discipline_ids(discipline_id, appointment_type_id)
     with Session(engine) as session:
-        filters = [
-            Assignment.official_id.in_(list(official_ids)),
-            Assignment.appointment_type_id == appointment_type_id,
-            Competition.competition_type_id.in_(ct_ids),
-        ]
-        if discipline_ids is not None:
-            filters.append(Assignment.discipline_id.in_(discipline_ids))
+        filters = _assignment_fact_filters(
+            appointment_type_id=appointment_type_id,
+            competition_type_ids=ct_ids,
+            discipline_ids=discipline_ids,
+            official_ids=official_ids,
+        )
         stmt = (
             select(
-                Assignment.official_id,
-                Competition.year,
-                Competition.competition_type_id,
+                OfficialActivityFact.official_id,
+                OfficialActivityFact.year,
+                OfficialActivityFact.competition_type_id,
             )
-            .join(Competition, Assignment.competition_id == Competition.id)
             .where(*filters)
             .distinct()
         )
@@ -3142,23 +3209,14 @@ def _nqs_synchro_all_appointment_type_ids() -> tuple[int, ...]:
 
 def _nqs_panel_role_sql_predicate(panel_role_kind: str) -> str:
     """SQL boolean expression on ``so.role``; values are fixed internally (not user input)."""
-    if panel_role_kind == "judge":
-        return "LOWER(BTRIM(so.role)) LIKE 'judge%'"
-    if panel_role_kind == "referee":
-        return "LOWER(so.role) LIKE '%referee%'"
-    if panel_role_kind == "technical_controller":
-        return "LOWER(so.role) LIKE '%technical controller%'"
-    if panel_role_kind == "technical_specialist":
-        return "LOWER(so.role) LIKE '%technical specialist%'"
-    raise ValueError(f"Unknown panel role kind: {panel_role_kind!r}")
+    if panel_role_kind == PANEL_ROLE_ALL:
+        raise ValueError(f"Unknown panel role kind: {panel_role_kind!r}")
+    return panel_role_sql_predicate(panel_role_kind)
 
 
 def _nqs_panel_role_sql_predicate_all() -> str:
     """Any of judge / referee / technical controller / technical specialist panel role."""
-    return "(" + " OR ".join(
-        f"({_nqs_panel_role_sql_predicate(k)})"
-        for k in ("judge", "referee", "technical_controller", "technical_specialist")
-    ) + ")"
+    return panel_role_sql_predicate(PANEL_ROLE_ALL)
 
 
 def _get_appointment_type_id_by_name(name: str) -> int | None:
@@ -3559,20 +3617,6 @@ def _activity_bucket_sql_case(alias: str = "d") -> str:
     END"""
 
 
-def _junior_senior_segment_sql_expr(
-    *,
-    level_col: str = "segment_level",
-    team_col: str = "team_count",
-    junior_senior_min_team_count: int | None = None,
-) -> str:
-    level_pred = f"{level_col} IN ('Junior', 'Senior')"
-    if junior_senior_min_team_count is None:
-        return level_pred
-    return (
-        f"({level_pred} AND COALESCE({team_col}, 0) > {int(junior_senior_min_team_count)})"
-    )
-
-
 def _query_total_activity_aggregate_rows(
     official_ids: list[int],
     panel_role_kind: str,
@@ -3586,7 +3630,8 @@ def _query_total_activity_aggregate_rows(
     """
     Pre-aggregated activity metrics per official (period + per season).
 
-    Only ``segment_official.official_id`` rows are counted (linked at ingest).
+    Reads ``segment`` rows of ``official_activity_fact``, so only
+    ``segment_official.official_id`` rows are counted (linked at ingest).
     Returns rows: official_id, season_code, scope, rollup, bucket, competitions,
     segments, junior_senior_segments.
     """
@@ -3605,21 +3650,23 @@ def _query_total_activity_aggregate_rows(
     calendar_years = calendar_years_for_usfs_season_codes(season_year_codes)
     if not calendar_years:
         return pd.DataFrame(columns=cols)
+    if panel_role_kind != PANEL_ROLE_ALL:
+        # Same validation as the live predicate helpers.
+        _nqs_panel_role_sql_predicate(panel_role_kind)
 
-    role_pred = (
-        _nqs_panel_role_sql_predicate_all()
-        if panel_role_kind == "all"
-        else _nqs_panel_role_sql_predicate(panel_role_kind)
-    )
     qual_clause = ""
     if not include_qualifying_competitions:
-        qual_clause = "              AND COALESCE(c.qualifying, false) = false\n"
+        qual_clause = "              AND NOT f.qualifying\n"
 
-    season_expr = _competition_season_code_sql("c")
-    jr_expr = _junior_senior_segment_sql_expr(
-        junior_senior_min_team_count=junior_senior_min_team_count
-    )
-    bucket_case = _activity_bucket_sql_case("d")
+    season_expr = _competition_season_code_sql("f")
+    if junior_senior_min_team_count is None:
+        jr_expr = "f.junior_senior_segments"
+    else:
+        jr_expr = (
+            "(SELECT COUNT(*) FROM unnest(f.junior_senior_team_counts) AS jt(n) "
+            f"WHERE jt.n > {int(junior_senior_min_team_count)})::integer"
+        )
+    bucket_case = _activity_bucket_sql_case("f")
     named_buckets = list(TOTAL_ACTIVITY_NAMED_BUCKETS)
     if not include_nqs_bucket:
         named_buckets = [
@@ -3627,65 +3674,26 @@ def _query_total_activity_aggregate_rows(
         ]
     named_bucket_sql = ", ".join(f"'{b}'" for b in named_buckets)
 
-    if junior_senior_min_team_count is not None:
-        team_counts_cte = """
-        team_counts AS (
-            SELECT segment_id, COUNT(*)::integer AS team_count
-            FROM public.skater_segment
-            GROUP BY segment_id
-        ),
-        """
-        team_count_join = "LEFT JOIN team_counts tc ON tc.segment_id = s.id"
-        team_count_select = "COALESCE(tc.team_count, 0) AS team_count"
-    else:
-        team_counts_cte = ""
-        team_count_join = ""
-        team_count_select = "0 AS team_count"
-
     stmt = text(
         f"""
-        WITH {team_counts_cte}panel_rows AS (
+        WITH facts AS (
             SELECT
-                so.official_id AS official_id,
+                f.official_id,
                 {season_expr} AS season_code,
-                c.id AS competition_id,
-                s.id AS segment_id,
-                s.level AS segment_level,
-                {team_count_select},
-                COALESCE(c.international, false) AS international,
-                COALESCE(c.qualifying, false) AS qualifying,
-                COALESCE(c.nqs, false) AS nqs,
-                c.officials_analysis_competition_type_id AS competition_type_id
-            FROM public.segment_official so
-            INNER JOIN public.segment s ON s.id = so.segment_id
-            INNER JOIN public.competition c ON c.id = s.competition_id
-            {team_count_join}
-            WHERE so.official_id IN :official_ids
-{_segment_competition_year_sql_predicate()}{qual_clause}              AND s.discipline_type_id IN :discipline_type_ids
-              AND ({role_pred})
-        ),
-        deduped AS (
-            SELECT
-                official_id,
-                season_code,
-                competition_id,
-                segment_id,
-                MAX(segment_level) AS segment_level,
-                MAX(team_count) AS team_count,
-                BOOL_OR(international) AS international,
-                BOOL_OR(qualifying) AS qualifying,
-                BOOL_OR(nqs) AS nqs,
-                MAX(competition_type_id) AS competition_type_id
-            FROM panel_rows
-            WHERE season_code IS NOT NULL
-            GROUP BY official_id, season_code, competition_id, segment_id
-        ),
+                f.competition_id,
+                f.segments,
+                {jr_expr} AS junior_senior_segments,
+                f.international,
+                f.qualifying,
+                {bucket_case} AS activity_bucket
+            FROM officials_analysis.official_activity_fact f
+            WHERE f.source = '{ACTIVITY_SOURCE_SEGMENT}'
+              AND f.panel_role = :panel_role
+              AND f.official_id IN :official_ids
+              AND f.discipline_id IN :discipline_type_ids
+{qual_clause}        ),
         classified AS (
-            SELECT
-                d.*,
-                {bucket_case} AS activity_bucket,
-                CASE WHEN {jr_expr} THEN true ELSE false END AS is_junior_senior
-            FROM deduped d
+            SELECT * FROM facts WHERE season_code IS NOT NULL
         )
         SELECT official_id,
                season_code::integer AS season_code,
@@ -3693,9 +3701,8 @@ def _query_total_activity_aggregate_rows(
                'bucket'::text AS rollup,
                activity_bucket AS bucket,
                COUNT(DISTINCT competition_id)::integer AS competitions,
-               COUNT(DISTINCT segment_id)::integer AS segments,
-               COUNT(DISTINCT segment_id) FILTER (WHERE is_junior_senior)::integer
-                   AS junior_senior_segments
+               SUM(segments)::integer AS segments,
+               SUM(junior_senior_segments)::integer AS junior_senior_segments
         FROM classified
         WHERE activity_bucket IN ({named_bucket_sql})
         GROUP BY official_id, season_code, activity_bucket
@@ -3708,8 +3715,8 @@ def _query_total_activity_aggregate_rows(
                'bucket'::text AS rollup,
                activity_bucket AS bucket,
                COUNT(DISTINCT competition_id)::integer,
-               COUNT(DISTINCT segment_id)::integer,
-               COUNT(DISTINCT segment_id) FILTER (WHERE is_junior_senior)::integer
+               SUM(segments)::integer,
+               SUM(junior_senior_segments)::integer
         FROM classified
         WHERE activity_bucket IN ({named_bucket_sql})
         GROUP BY official_id, activity_bucket
@@ -3722,8 +3729,8 @@ def _query_total_activity_aggregate_rows(
                'qualifying'::text,
                NULL::text,
                COUNT(DISTINCT competition_id)::integer,
-               COUNT(DISTINCT segment_id)::integer,
-               COUNT(DISTINCT segment_id) FILTER (WHERE is_junior_senior)::integer
+               SUM(segments)::integer,
+               SUM(junior_senior_segments)::integer
         FROM classified
         WHERE NOT international AND qualifying
         GROUP BY official_id, season_code
@@ -3736,8 +3743,8 @@ def _query_total_activity_aggregate_rows(
                'qualifying'::text,
                NULL::text,
                COUNT(DISTINCT competition_id)::integer,
-               COUNT(DISTINCT segment_id)::integer,
-               COUNT(DISTINCT segment_id) FILTER (WHERE is_junior_senior)::integer
+               SUM(segments)::integer,
+               SUM(junior_senior_segments)::integer
         FROM classified
         WHERE NOT international AND qualifying
         GROUP BY official_id
@@ -3750,8 +3757,8 @@ def _query_total_activity_aggregate_rows(
                'overall'::text,
                NULL::text,
                COUNT(DISTINCT competition_id)::integer,
-               COUNT(DISTINCT segment_id)::integer,
-               COUNT(DISTINCT segment_id) FILTER (WHERE is_junior_senior)::integer
+               SUM(segments)::integer,
+               SUM(junior_senior_segments)::integer
         FROM classified
         GROUP BY official_id, season_code
 
@@ -3763,8 +3770,8 @@ def _query_total_activity_aggregate_rows(
                'overall'::text,
                NULL::text,
                COUNT(DISTINCT competition_id)::integer,
-               COUNT(DISTINCT segment_id)::integer,
-               COUNT(DISTINCT segment_id) FILTER (WHERE is_junior_senior)::integer
+               SUM(segments)::integer,
+               SUM(junior_senior_segments)::integer
         FROM classified
         GROUP BY official_id
         """
@@ -3775,6 +3782,7 @@ def _query_total_activity_aggregate_rows(
         bindparam("calendar_year_codes", expanding=True),
     )
     params: dict[str, Any] = {
+        "panel_role": panel_role_kind,
         "official_ids": official_ids,
         "discipline_type_ids": list(segment_discipline_type_ids),
         "season_year_codes": [int(x) for x in season_year_codes],
@@ -4231,6 +4239,14 @@ def _cli_main() -> None:
             "(long-running; use only when rebuilding assignment history)."
         ),
     )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help=(
+            "With --load-history-to-database or --load-qualifying-availability: report "
+            "inserts / updates / unchanged rows and roll back."
+        ),
+    )
     parser.add_argument(
         "--ping-database",
         action="store_true",
@@ -4271,7 +4287,14 @@ def _cli_main() -> None:
             "reading Excel files, then writing to the DB (this may take many minutes).",
             flush=True,
         )
-        load_history(write_to_database=True)
+        plans = load_history(write_to_database=True, dry_run=args.dry_run)
+        if args.dry_run:
+            for file, plan in plans.items():
+                changes = plan.changes()
+                if not changes.empty:
+                    print(f"\n{file}:", flush=True)
+                    print(changes.to_string(index=False), flush=True)
+            print("\nDry run: changes were not committed.", flush=True)
         print("load_history finished.", flush=True)
         return
     if args.load_qualifying_availability:
@@ -4293,6 +4316,7 @@ def _cli_main() -> None:
             sheet_name=sheet,
             only_complete_responses=not args.allow_partial_responses,
             allow_missing_completion_status=args.allow_partial_responses,
+            commit=not args.dry_run,
         )
         for k, v in stats.items():
             if k == "unmatched_member_numbers":
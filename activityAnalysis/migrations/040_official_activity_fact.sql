@@ -0,0 +1,50 @@
+-- Materialized activity for the activity tracker reports: one row per
+-- official × competition × role × discipline, from assignment history
+-- (source = 'assignment') and protocol panels in public.segment_official
+-- (source = 'segment'). See activityAnalysis/official_activity_fact.py.
+--
+--   psql "$DATABASE_URL" -f activityAnalysis/migrations/040_official_activity_fact.sql
+--   python scripts/refresh_official_activity_fact.py     # initial fill
+--
+-- Afterwards assignment loaders and the analytics cache rebuild worker keep it current.
+
+CREATE TABLE IF NOT EXISTS officials_analysis.official_activity_fact (
+    id integer GENERATED ALWAYS AS IDENTITY,
+    source text NOT NULL,
+    official_id integer NOT NULL,
+    competition_id integer NOT NULL,
+    competition_type_id integer,
+    year integer,
+    appointment_type_id integer,
+    panel_role text,
+    discipline_id integer,
+    chief boolean NOT NULL DEFAULT false,
+    lower_levels_only boolean NOT NULL DEFAULT false,
+    international boolean NOT NULL DEFAULT false,
+    qualifying boolean NOT NULL DEFAULT false,
+    nqs boolean NOT NULL DEFAULT false,
+    synchronized boolean NOT NULL DEFAULT false,
+    segments integer NOT NULL DEFAULT 0,
+    junior_senior_segments integer NOT NULL DEFAULT 0,
+    junior_senior_team_counts integer[],
+    refreshed_at timestamptz DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT official_activity_fact_pkey PRIMARY KEY (id),
+    CONSTRAINT official_activity_fact_source_check
+        CHECK (source IN ('assignment', 'segment'))
+);
+
+-- Per-competition refresh (delete + re-insert).
+CREATE INDEX IF NOT EXISTS ix_official_activity_fact_source_competition
+    ON officials_analysis.official_activity_fact (source, competition_id);
+
+-- Activity matrices / referee report: role + competition type(s), then officials.
+CREATE INDEX IF NOT EXISTS ix_official_activity_fact_assignment_role
+    ON officials_analysis.official_activity_fact
+        (source, appointment_type_id, competition_type_id, official_id);
+
+-- Total activity across seasons: panel role kind + official ids.
+CREATE INDEX IF NOT EXISTS ix_official_activity_fact_panel_role
+    ON officials_analysis.official_activity_fact (source, panel_role, official_id);
+
+COMMENT ON TABLE officials_analysis.official_activity_fact IS
+    'Activity tracker facts (official x competition x role x discipline); rebuilt per competition.';
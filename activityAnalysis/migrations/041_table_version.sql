@@ -0,0 +1,18 @@
+-- Write counters for the activity / international apps' shared query cache: one row
+-- per source table, bumped by writers in their own transaction. Cached loaders re-run
+-- only when a table they read has a newer version. See activityAnalysis/query_cache.py.
+--
+--   psql "$DATABASE_URL" -f activityAnalysis/migrations/041_table_version.sql
+--
+-- Rows are created on first bump; without this table the apps fall back to the
+-- cache's maximum entry age.
+
+CREATE TABLE IF NOT EXISTS officials_analysis.table_version (
+    table_name text NOT NULL,
+    version bigint NOT NULL DEFAULT 0,
+    updated_at timestamptz DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT table_version_pkey PRIMARY KEY (table_name)
+);
+
+COMMENT ON TABLE officials_analysis.table_version IS
+    'Per-table write counters; the apps'' query cache invalidates entries on a version change.';
@@ -0,0 +1,264 @@
+"""
+Materialized official activity (``officials_analysis.official_activity_fact``).
+
+The activity tracker reports (activity matrices, referee yearly report, total activity
+across seasons) filter and pivot this table instead of re-joining assignments, segment
+officials and competitions on every rerun. Rows come from two sources:
+
+- ``assignment``: one row per ``assignment`` with the competition's type and year
+  copied in. Portable SQL, so local SQLite databases are maintained too.
+- ``segment``: protocol panels from ``public.segment_official`` (officials linked at
+  ingest via ``official_id``), one row per official × ``public.competition`` × panel
+  role kind × segment discipline type with segment counts. PostgreSQL only.
+
+Refreshes delete and re-insert the rows of the touched competitions, bump the source
+tables' query cache versions (``query_cache.py``) and never commit; callers commit with
+their own write. Assignment loaders refresh in-line; protocol loads
+refresh through the analytics cache rebuild queue, and segment-officials writes and
+competition flag / type edits (``database_loader``) refresh in-line; ``scripts/refresh_official_activity_fact.py``
+rebuilds everything (e.g. after judge ↔ official link edits).
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from sqlalchemy import bindparam, delete, false, func, insert, literal, select, text
+
+try:
+    from activityAnalysis.officials_analysis_models import (
+        Assignment,
+        Competition,
+        OfficialActivityFact,
+    )
+    from activityAnalysis.query_cache import (
+        ASSIGNMENT_TABLES,
+        PROTOCOL_TABLES,
+        TABLE_OFFICIAL_ACTIVITY_FACT,
+        bump_table_versions,
+    )
+except ModuleNotFoundError:
+    from officials_analysis_models import (  # type: ignore[no-redef]
+        Assignment,
+        Competition,
+        OfficialActivityFact,
+    )
+    from query_cache import (  # type: ignore[no-redef]
+        ASSIGNMENT_TABLES,
+        PROTOCOL_TABLES,
+        TABLE_OFFICIAL_ACTIVITY_FACT,
+        bump_table_versions,
+    )
+
+ACTIVITY_SOURCE_ASSIGNMENT = "assignment"
+ACTIVITY_SOURCE_SEGMENT = "segment"
+
+PANEL_ROLE_KINDS = ("judge", "referee", "technical_controller", "technical_specialist")
+# Extra ``panel_role`` rows covering any of the kinds above, so "all roles" segment counts
+# stay distinct when one ``segment_official.role`` label matches several kinds.
+PANEL_ROLE_ALL = "all"
+
+
+def panel_role_sql_predicate(panel_role_kind: str, role_column: str = "so.role") -> str:
+    """SQL boolean expression on a panel role label; values are fixed internally."""
+    if panel_role_kind == "judge":
+        return f"LOWER(BTRIM({role_column})) LIKE 'judge%'"
+    if panel_role_kind == "referee":
+        return f"LOWER({role_column}) LIKE '%referee%'"
+    if panel_role_kind == "technical_controller":
+        return f"LOWER({role_column}) LIKE '%technical controller%'"
+    if panel_role_kind == "technical_specialist":
+        return f"LOWER({role_column}) LIKE '%technical specialist%'"
+    if panel_role_kind == PANEL_ROLE_ALL:
+        return "(" + " OR ".join(
+            f"({panel_role_sql_predicate(k, role_column)})" for k in PANEL_ROLE_KINDS
+        ) + ")"
+    raise ValueError(f"Unknown panel role kind: {panel_role_kind!r}")
+
+
+def _id_list(competition_ids: Iterable[int] | None) -> list[int] | None:
+    if competition_ids is None:
+        return None
+    return sorted({int(c) for c in competition_ids})
+
+
+def refresh_assignment_facts(session, competition_ids: Iterable[int] | None = None) -> int:
+    """
+    Rebuild ``assignment`` fact rows for ``competition_ids`` (every competition when
+    ``None``). Returns rows inserted. Flushes but does not commit.
+    """
+    ids = _id_list(competition_ids)
+    if ids is not None and not ids:
+        return 0
+    session.flush()
+
+    clear = delete(OfficialActivityFact).where(
+        OfficialActivityFact.source == ACTIVITY_SOURCE_ASSIGNMENT
+    )
+    src = (
+        select(
+            literal(ACTIVITY_SOURCE_ASSIGNMENT),
+            Assignment.official_id,
+            Assignment.competition_id,
+            Competition.competition_type_id,
+            Competition.year,
+            Assignment.appointment_type_id,
+            Assignment.discipline_id,
+            func.coalesce(Assignment.chief, false()),
+            func.coalesce(Assignment.lower_levels_only, false()),
+        )
+        .join(Competition, Assignment.competition_id == Competition.id)
+    )
+    if ids is not None:
+        clear = clear.where(OfficialActivityFact.competition_id.in_(ids))
+        src = src.where(Assignment.competition_id.in_(ids))
+
+    session.execute(clear)
+    result = session.execute(
+        insert(OfficialActivityFact).from_select(
+            [
+                "source",
+                "official_id",
+                "competition_id",
+                "competition_type_id",
+                "year",
+                "appointment_type_id",
+                "discipline_id",
+                "chief",
+                "lower_levels_only",
+            ],
+            src,
+        )
+    )
+    # Every assignment writer refreshes here, so this also covers assignment / competition.
+    bump_table_versions(session, ASSIGNMENT_TABLES)
+    return max(0, result.rowcount or 0)
+
+
+def _segment_role_join_sql() -> str:
+    kinds = (*PANEL_ROLE_KINDS, PANEL_ROLE_ALL)
+    values = ", ".join(f"('{k}')" for k in kinds)
+    whens = "\n".join(
+        f"                WHEN '{k}' THEN {panel_role_sql_predicate(k, 'p.role')}"
+        for k in kinds
+    )
+    return f"""
+            INNER JOIN (VALUES {values}) AS k(panel_role)
+              ON CASE k.panel_role
+{whens}
+                ELSE false
+              END"""
+
+
+def refresh_segment_facts(session, competition_ids: Iterable[int] | None = None) -> int:
+    """
+    Rebuild ``segment`` fact rows for ``public.competition`` ids (every competition when
+    ``None``). PostgreSQL only. Returns rows inserted. Does not commit.
+    """
+    ids = _id_list(competition_ids)
+    if ids is not None and not ids:
+        return 0
+    comp_filter = "AND c.id IN :competition_ids" if ids is not None else ""
+    team_filter = "WHERE s.competition_id IN :competition_ids" if ids is not None else ""
+    fact_filter = "AND competition_id IN :competition_ids" if ids is not None else ""
+
+    clear = text(
+        f"""
+        DELETE FROM officials_analysis.official_activity_fact
+        WHERE source = '{ACTIVITY_SOURCE_SEGMENT}' {fact_filter}
+        """
+    )
+    fill = text(
+        f"""
+        WITH team_counts AS (
+            SELECT ss.segment_id, COUNT(*)::integer AS team_count
+            FROM public.skater_segment ss
+            INNER JOIN public.segment s ON s.id = ss.segment_id
+            {team_filter}
+            GROUP BY ss.segment_id
+        ),
+        panel AS (
+            SELECT so.official_id,
+                   so.role,
+                   c.id AS competition_id,
+                   c.officials_analysis_competition_type_id AS competition_type_id,
+                   btrim(c.year::text)::integer AS year,
+                   s.discipline_type_id,
+                   s.id AS segment_id,
+                   s.level AS segment_level,
+                   COALESCE(tc.team_count, 0) AS team_count,
+                   COALESCE(c.international, false) AS international,
+                   COALESCE(c.qualifying, false) AS qualifying,
+                   COALESCE(c.nqs, false) AS nqs,
+                   COALESCE(c.synchronized, false) AS synchronized
+            FROM public.segment_official so
+            INNER JOIN public.segment s ON s.id = so.segment_id
+            INNER JOIN public.competition c ON c.id = s.competition_id
+            LEFT JOIN team_counts tc ON tc.segment_id = s.id
+            WHERE so.official_id IS NOT NULL
+              AND btrim(c.year::text) ~ '^[0-9]+$'
+              {comp_filter}
+        ),
+        per_segment AS (
+            SELECT p.official_id,
+                   p.competition_id,
+                   k.panel_role,
+                   p.discipline_type_id,
+                   p.segment_id,
+                   MAX(p.competition_type_id) AS competition_type_id,
+                   MAX(p.year) AS year,
+                   BOOL_OR(p.segment_level IN ('Junior', 'Senior')) AS is_junior_senior,
+                   MAX(p.team_count) AS team_count,
+                   BOOL_OR(p.international) AS international,
+                   BOOL_OR(p.qualifying) AS qualifying,
+                   BOOL_OR(p.nqs) AS nqs,
+                   BOOL_OR(p.synchronized) AS synchronized
+            FROM panel p{_segment_role_join_sql()}
+            GROUP BY p.official_id, p.competition_id, k.panel_role,
+                     p.discipline_type_id, p.segment_id
+        )
+        INSERT INTO officials_analysis.official_activity_fact (
+            source, official_id, competition_id, competition_type_id, year,
+            panel_role, discipline_id, international, qualifying, nqs, synchronized,
+            segments, junior_senior_segments, junior_senior_team_counts
+        )
+        SELECT '{ACTIVITY_SOURCE_SEGMENT}',
+               official_id,
+               competition_id,
+               MAX(competition_type_id),
+               MAX(year),
+               panel_role,
+               discipline_type_id,
+               BOOL_OR(international),
+               BOOL_OR(qualifying),
+               BOOL_OR(nqs),
+               BOOL_OR(synchronized),
+               COUNT(*)::integer,
+               COUNT(*) FILTER (WHERE is_junior_senior)::integer,
+               COALESCE(
+                   ARRAY_AGG(team_count) FILTER (WHERE is_junior_senior),
+                   ARRAY[]::integer[]
+               )
+        FROM per_segment
+        GROUP BY official_id, competition_id, panel_role, discipline_type_id
+        """
+    )
+    params = {}
+    if ids is not None:
+        clear = clear.bindparams(bindparam("competition_ids", expanding=True))
+        fill = fill.bindparams(bindparam("competition_ids", expanding=True))
+        params["competition_ids"] = ids
+    session.execute(clear, params)
+    result = session.execute(fill, params)
+    bump_table_versions(session, (TABLE_OFFICIAL_ACTIVITY_FACT, *PROTOCOL_TABLES))
+    return max(0, result.rowcount or 0)
+
+
+def official_activity_fact_is_empty(session, source: str) -> bool:
+    """True when no rows exist yet for ``source`` (table created but never filled)."""
+    row = session.execute(
+        select(OfficialActivityFact.id)
+        .where(OfficialActivityFact.source == source)
+        .limit(1)
+    ).first()
+    return row is None
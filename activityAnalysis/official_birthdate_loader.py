@@ -10,6 +10,7 @@ import pandas as pd
 
 from activityAnalysis.officials_directory_loader import get_conn
 from activityAnalysis.qualifying_availability_ingest import normalize_member_number_value
+from activityAnalysis.query_cache import TABLE_OFFICIALS, bump_table_versions_cursor
 
 
 def _normalize_ages_csv_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -147,6 +148,7 @@ def load_official_birthdates_from_csv(
     with get_conn() as conn:
         with conn.cursor() as cur:
             cur.executemany(sql, updates)
+            bump_table_versions_cursor(cur, (TABLE_OFFICIALS,))
         conn.commit()
 
     log_fn(f"Updated {len(updates)} official(s).")
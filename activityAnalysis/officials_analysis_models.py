@@ -1,6 +1,6 @@
 from typing import Any, List, Optional
 
-from sqlalchemy import JSON, Boolean, Date, DateTime, ForeignKeyConstraint, Identity, Integer, PrimaryKeyConstraint, String, Text, UniqueConstraint, text
+from sqlalchemy import ARRAY, JSON, BigInteger, Boolean, Date, DateTime, ForeignKeyConstraint, Identity, Index, Integer, PrimaryKeyConstraint, String, Text, UniqueConstraint, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 import datetime
 
@@ -512,3 +512,72 @@ class IsuOfficialSeminar(Base):
     official: Mapped['Officials'] = relationship('Officials', back_populates='isu_seminars')
     appointment_type: Mapped['AppointmentTypes'] = relationship('AppointmentTypes')
     discipline: Mapped[Optional['Disciplines']] = relationship('Disciplines')
+
+
+class OfficialActivityFact(Base):
+    """
+    Materialized activity at official × competition × role × discipline grain.
+
+    ``source = 'assignment'`` rows mirror ``assignment`` (role is ``appointment_type_id``,
+    discipline is ``disciplines.id``, year is the calendar year). ``source = 'segment'``
+    rows aggregate protocol panels from ``public.segment_official`` (role is the panel
+    role kind in ``panel_role``, discipline is the segment ``discipline_type_id``,
+    competition is ``public.competition.id``). Maintained by
+    ``activityAnalysis/official_activity_fact.py``.
+    """
+
+    __tablename__ = 'official_activity_fact'
+    __table_args__ = (
+        PrimaryKeyConstraint('id', name='official_activity_fact_pkey'),
+        Index('ix_official_activity_fact_source_competition', 'source', 'competition_id'),
+        Index(
+            'ix_official_activity_fact_assignment_role',
+            'source', 'appointment_type_id', 'competition_type_id', 'official_id',
+        ),
+        Index(
+            'ix_official_activity_fact_panel_role',
+            'source', 'panel_role', 'official_id',
+        ),
+        {'schema': 'officials_analysis'}
+    )
+
+    id: Mapped[int] = mapped_column(Integer, Identity(always=True, start=1, increment=1, minvalue=1, maxvalue=2147483647, cycle=False, cache=1), primary_key=True)
+    source: Mapped[str] = mapped_column(Text)
+    official_id: Mapped[int] = mapped_column(Integer)
+    competition_id: Mapped[int] = mapped_column(Integer)
+    competition_type_id: Mapped[Optional[int]] = mapped_column(Integer)
+    year: Mapped[Optional[int]] = mapped_column(Integer)
+    appointment_type_id: Mapped[Optional[int]] = mapped_column(Integer)
+    panel_role: Mapped[Optional[str]] = mapped_column(Text)
+    discipline_id: Mapped[Optional[int]] = mapped_column(Integer)
+    chief: Mapped[bool] = mapped_column(Boolean, server_default=text('false'))
+    lower_levels_only: Mapped[bool] = mapped_column(Boolean, server_default=text('false'))
+    international: Mapped[bool] = mapped_column(Boolean, server_default=text('false'))
+    qualifying: Mapped[bool] = mapped_column(Boolean, server_default=text('false'))
+    nqs: Mapped[bool] = mapped_column(Boolean, server_default=text('false'))
+    synchronized: Mapped[bool] = mapped_column(Boolean, server_default=text('false'))
+    segments: Mapped[int] = mapped_column(Integer, server_default=text('0'))
+    junior_senior_segments: Mapped[int] = mapped_column(Integer, server_default=text('0'))
+    # Team count of each Junior/Senior segment, for the adjustable minimum-starts filter.
+    junior_senior_team_counts: Mapped[Optional[list]] = mapped_column(ARRAY(Integer).with_variant(JSON(), 'sqlite'))
+    refreshed_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime(True), server_default=text('CURRENT_TIMESTAMP'))
+
+
+class TableVersion(Base):
+    """
+    Write counter per source table for the apps' shared query cache.
+
+    Writers bump ``version`` in their own transaction; cached loaders keyed on the
+    versions of the tables they read miss once a bump commits. Maintained by
+    ``activityAnalysis/query_cache.py``.
+    """
+
+    __tablename__ = 'table_version'
+    __table_args__ = (
+        PrimaryKeyConstraint('table_name', name='table_version_pkey'),
+        {'schema': 'officials_analysis'}
+    )
+
+    table_name: Mapped[str] = mapped_column(Text, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, server_default=text('0'))
+    updated_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime(True), server_default=text('CURRENT_TIMESTAMP'))
@@ -7,6 +7,11 @@ import psycopg2
 import psycopg2.extras
 from urllib.parse import urlparse
 
+try:
+    from activityAnalysis.query_cache import DIRECTORY_TABLES, bump_table_versions_cursor
+except ModuleNotFoundError:
+    from query_cache import DIRECTORY_TABLES, bump_table_versions_cursor  # type: ignore[no-redef]
+
 _conn_params_cache: Optional[dict] = None
 _conn_params_cache_url: Optional[str] = None
 
@@ -393,6 +398,12 @@ def run_officials_directory_import(
             conn.commit()
         _log(f"  done ({n_inactive} row(s) set inactive).")
 
+    # Steps above commit separately; invalidate the apps' cached directory reads once.
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            bump_table_versions_cursor(cur, DIRECTORY_TABLES)
+        conn.commit()
+
     _log("\nImport complete!")
     return {
         "logs": logs,
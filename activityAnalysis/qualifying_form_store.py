@@ -5,12 +5,11 @@ per-competition directory criteria, report using ``officials_analysis.appointmen
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from typing import Any, Optional
 
 import pandas as pd
-from sqlalchemy import and_, case, delete, func, literal, select, update
+from sqlalchemy import and_, case, delete, func, insert, literal, select, update
 from sqlalchemy.orm import Session
 
 try:
@@ -41,7 +40,7 @@ try:
         is_opt_out_all_qualifying_value,
         row_opts_out_all_qualifying,
         load_original_sheet,
-        normalize_member_number_value,
+        normalize_member_number,
         normalize_qualifying_availability_cell,
         parse_qualifying_competition_prompt,
         resolve_workbook_sheet_name,
@@ -76,7 +75,7 @@ except ModuleNotFoundError:
         is_opt_out_all_qualifying_value,
         row_opts_out_all_qualifying,
         load_original_sheet,
-        normalize_member_number_value,
+        normalize_member_number,
         normalize_qualifying_availability_cell,
         parse_qualifying_competition_prompt,
         resolve_workbook_sheet_name,
@@ -114,15 +113,6 @@ except ModuleNotFoundError:
     )
 
 
-def _row_to_response_json(row: pd.Series) -> dict[str, Any]:
-    out: dict[str, Any] = {}
-    for col in row.index:
-        if not isinstance(col, str):
-            continue
-        out[col] = _json_safe_qualifying_value(row[col])
-    return out
-
-
 # Per-competition ``raw_value`` when global opt-out (column G) — empty, not the long form text.
 _OPT_OUT_AVAILABILITY_RAW: str | None = ""
 
@@ -142,6 +132,11 @@ def load_qualifying_form_workbook(
     """
     Ingest a 2027-style workbook: one ``response_json`` per matched official,
     competitions from pipe-separated column headers, normalized availability rows.
+
+    The sheet is resolved column-wise against the directory and written with two bulk
+    inserts. ``result["diff"]`` counts inserted / updated / unchanged / deleted
+    responses and availability rows against the form previously stored under the same
+    label; with ``commit=False`` nothing is written, so that is a dry-run diff.
     """
     import os
 
@@ -190,6 +185,8 @@ def load_qualifying_form_workbook(
 
     with Session(db_engine) as session:
         comp_id_by_prompt: dict[str, int] = {}
+        previous_responses: dict[int, Any] = {}
+        previous_availability: dict[tuple[int, int], tuple[Any, Any]] = {}
         existing_form = None
         if replace_existing_label:
             existing_form = session.scalar(
@@ -204,6 +201,26 @@ def load_qualifying_form_workbook(
             existing_form.source_filename = os.path.basename(path)
             existing_form.loaded_at = datetime.now(timezone.utc)
 
+            previous_responses = {
+                int(oid): payload
+                for oid, payload in session.execute(
+                    select(
+                        QualifyingOfficialFormResponse.official_id,
+                        QualifyingOfficialFormResponse.response_json,
+                    ).where(QualifyingOfficialFormResponse.form_id == form_id)
+                ).all()
+            }
+            previous_availability = {
+                (int(oid), int(cid)): (code, raw)
+                for oid, cid, code, raw in session.execute(
+                    select(
+                        QualifyingOfficialCompetitionAvailability.official_id,
+                        QualifyingOfficialCompetitionAvailability.competition_id,
+                        QualifyingOfficialCompetitionAvailability.availability_code,
+                        QualifyingOfficialCompetitionAvailability.raw_value,
+                    ).where(QualifyingOfficialCompetitionAvailability.form_id == form_id)
+                ).all()
+            }
             session.execute(
                 delete(QualifyingOfficialFormResponse).where(
                     QualifyingOfficialFormResponse.form_id == form_id
@@ -294,67 +311,95 @@ def load_qualifying_form_workbook(
                 comp_id_by_prompt[prompt] = int(comp.id)
                 result["competitions_new"] += 1
 
-        mbr_to_id: dict[str, int] = {}
-        for oid, mbr in session.execute(
-            select(Officials.id, Officials.mbr_number)
-        ).all():
-            key = normalize_member_number_value(mbr)
-            if key:
-                mbr_to_id[key] = int(oid)
+        directory = pd.DataFrame(
+            session.execute(select(Officials.id, Officials.mbr_number)).all(),
+            columns=["official_id", "mbr_number"],
+        )
+        directory["member_number"] = normalize_member_number(directory["mbr_number"])
+        directory = directory.loc[directory["member_number"] != ""]
+        mbr_to_id = dict(
+            zip(directory["member_number"], directory["official_id"].astype(int))
+        )
 
+        members = normalize_member_number(df[mcol])
+        has_member = members != ""
+        result["skipped_empty_member"] = int((~has_member).sum())
         status_col = find_completion_status_column(df)
+        if status_col is not None:
+            complete = df[status_col].map(is_complete_response_status).astype(bool)
+        else:
+            complete = pd.Series(True, index=df.index)
+        result["skipped_incomplete"] = int((has_member & ~complete).sum())
+        candidates = has_member & complete
+        official_ids = members.map(mbr_to_id)
+        unmatched.update(members[candidates & official_ids.isna()].tolist())
+
+        matched = df.loc[candidates & official_ids.notna()]
+        matched_ids = official_ids[matched.index].astype(int)
+        opt_out = (
+            matched.apply(row_opts_out_all_qualifying, axis=1).astype(bool)
+            if not matched.empty
+            else pd.Series(False, index=matched.index)
+        )
 
-        for _, row in df.iterrows():
-            mbr = normalize_member_number_value(row[mcol])
-            if not mbr:
-                result["skipped_empty_member"] += 1
-                continue
-            if status_col is not None and not is_complete_response_status(
-                row.get(status_col)
-            ):
-                result["skipped_incomplete"] += 1
-                continue
-            oid = mbr_to_id.get(mbr)
-            if oid is None:
-                unmatched.add(mbr)
-                continue
-
-            not_interested_all = row_opts_out_all_qualifying(row)
-            payload = _row_to_response_json(row)
-            payload["_not_interested_all_qualifying"] = not_interested_all
+        response_rows: list[dict[str, Any]] = []
+        str_cols = [c for c in matched.columns if isinstance(c, str)]
+        for idx, record in zip(matched.index, matched[str_cols].to_dict("records")):
+            payload = {k: _json_safe_qualifying_value(v) for k, v in record.items()}
+            payload["_not_interested_all_qualifying"] = bool(opt_out[idx])
+            response_rows.append(
+                {
+                    "form_id": form_id,
+                    "official_id": int(matched_ids[idx]),
+                    "member_number": members[idx],
+                    "response_json": payload,
+                }
+            )
 
-            session.add(
-                QualifyingOfficialFormResponse(
-                    form_id=form_id,
-                    official_id=oid,
-                    member_number=mbr,
-                    response_json=payload,
+        availability_rows: list[dict[str, Any]] = []
+        for prompt, cid in comp_id_by_prompt.items():
+            if prompt not in matched.columns:
+                continue
+            cells = matched[prompt]
+            codes = cells.map(normalize_qualifying_availability_cell)
+            raws = cells.map(lambda v: None if pd.isna(v) else (str(v).strip() or None))
+            codes = codes.mask(opt_out, "not_available")
+            raws = raws.astype(object).mask(opt_out, _OPT_OUT_AVAILABILITY_RAW)
+            for oid, code, raw_text in zip(matched_ids, codes, raws):
+                availability_rows.append(
+                    {
+                        "form_id": form_id,
+                        "official_id": int(oid),
+                        "competition_id": cid,
+                        "availability_code": code,
+                        "raw_value": raw_text,
+                    }
                 )
+
+        if response_rows:
+            session.execute(insert(QualifyingOfficialFormResponse), response_rows)
+        if availability_rows:
+            session.execute(
+                insert(QualifyingOfficialCompetitionAvailability), availability_rows
             )
-            result["responses_stored"] += 1
-
-            for prompt, cid in comp_id_by_prompt.items():
-                if prompt not in row.index:
-                    continue
-                if not_interested_all:
-                    code = "not_available"
-                    raw_text = _OPT_OUT_AVAILABILITY_RAW
-                else:
-                    raw = row[prompt]
-                    code = normalize_qualifying_availability_cell(raw)
-                    raw_text = None
-                    if not pd.isna(raw):
-                        raw_text = str(raw).strip() or None
-                session.add(
-                    QualifyingOfficialCompetitionAvailability(
-                        form_id=form_id,
-                        official_id=oid,
-                        competition_id=cid,
-                        availability_code=code,
-                        raw_value=raw_text,
+        result["responses_stored"] = len(response_rows)
+        result["availability_rows"] = len(availability_rows)
+        result["diff"] = {
+            "responses": _diff_counts(
+                previous_responses,
+                {r["official_id"]: r["response_json"] for r in response_rows},
+            ),
+            "availability": _diff_counts(
+                previous_availability,
+                {
+                    (r["official_id"], r["competition_id"]): (
+                        r["availability_code"],
+                        r["raw_value"],
                     )
-                )
-                result["availability_rows"] += 1
+                    for r in availability_rows
+                },
+            ),
+        }
 
         result["availability_rows_repaired_opt_out"] = _repair_opt_out_availability_rows(
             session, form_id
@@ -366,6 +411,20 @@ def load_qualifying_form_workbook(
     return result
 
 
+def _diff_counts(previous: dict[Any, Any], current: dict[Any, Any]) -> dict[str, int]:
+    """Insert / update / unchanged / delete counts between two keyed row snapshots."""
+    counts = {"insert": 0, "update": 0, "unchanged": 0, "delete": 0}
+    for key, value in current.items():
+        if key not in previous:
+            counts["insert"] += 1
+        elif previous[key] == value:
+            counts["unchanged"] += 1
+        else:
+            counts["update"] += 1
+    counts["delete"] = sum(1 for key in previous if key not in current)
+    return counts
+
+
 def _repair_opt_out_availability_rows(session: Session, form_id: int) -> int:
     """
     After load, set ``not_available`` on all competition rows for officials who
@@ -487,38 +546,6 @@ def _appointment_name_to_id_map(session: Session) -> dict[str, int]:
     return {str(n or "").strip().casefold(): int(i) for i, n in rows}
 
 
-def _batch_held_appointment_type_ids(
-    session: Session,
-    official_ids: list[int],
-) -> dict[int, set[int]]:
-    """Active appointment type ids per official (one query)."""
-    out: dict[int, set[int]] = {int(oid): set() for oid in official_ids}
-    if not official_ids:
-        return out
-    rows = session.execute(
-        select(Appointments.official_id, Appointments.appointment_type_id)
-        .where(
-            Appointments.official_id.in_(list(official_ids)),
-            Appointments.active.is_(True),
-            Appointments.appointment_type_id.isnot(None),
-        )
-        .distinct()
-    ).all()
-    for oid, atid in rows:
-        out[int(oid)].add(int(atid))
-    return out
-
-
-def _merge_held_types_cache(
-    cache: dict[int, set[int]],
-    official_ids: list[int],
-    fetched: dict[int, set[int]],
-) -> None:
-    for oid in official_ids:
-        if oid not in cache:
-            cache[oid] = set(fetched.get(oid, set()))
-
-
 def _fetch_assignment_years_combined(
     session: Session,
     official_ids: list[int],
@@ -831,50 +858,6 @@ def _appointment_display_line(
     return label
 
 
-def _batch_official_active_appointment_lines(
-    session: Session,
-    official_ids: list[int],
-    appointment_type_id: int,
-    discipline_id: int,
-    level_id: int | None,
-) -> dict[int, list[str]]:
-    """Active directory appointment display lines per official (one query)."""
-    out: dict[int, list[str]] = {int(oid): [] for oid in official_ids}
-    if not official_ids:
-        return out
-    appt_filters = [
-        Appointments.official_id.in_(list(official_ids)),
-        Appointments.active.is_(True),
-        Appointments.appointment_type_id == int(appointment_type_id),
-    ]
-    disc_ids = _assignment_discipline_ids_for_report(
-        int(discipline_id), int(appointment_type_id)
-    )
-    if disc_ids is not None:
-        appt_filters.append(Appointments.discipline_id.in_(disc_ids))
-    stmt = (
-        select(
-            Appointments.official_id,
-            AppointmentTypes.name,
-            Disciplines.name,
-            Appointments.discipline_id,
-            Levels.name,
-        )
-        .select_from(Appointments)
-        .join(AppointmentTypes, Appointments.appointment_type_id == AppointmentTypes.id)
-        .join(Disciplines, Appointments.discipline_id == Disciplines.id)
-        .outerjoin(Levels, Appointments.level_id == Levels.id)
-        .where(*appt_filters)
-    )
-    if level_id is not None:
-        stmt = stmt.where(Appointments.level_id == int(level_id))
-    for oid, at, disc, disc_id, lvl in session.execute(stmt).all():
-        line = _appointment_display_line(at, disc, lvl, discipline_id=disc_id)
-        if line:
-            out[int(oid)].append(line)
-    return out
-
-
 def _batch_official_in_role_appointment_year(
     session: Session,
     official_ids: list[int],
@@ -921,110 +904,6 @@ def _batch_official_in_role_appointment_year(
     return out
 
 
-def _appointment_matches_competition_criterion(
-    appointment_type_id: int,
-    discipline_id: int | None,
-    level_id: int | None,
-    *,
-    criterion_at: int,
-    criterion_disc: int,
-    criterion_level: int | None,
-) -> bool:
-    """True when an active appointment row matches one configured competition criterion."""
-    if int(appointment_type_id) != int(criterion_at):
-        return False
-    disc_ids = _assignment_discipline_ids_for_report(
-        int(criterion_disc), int(criterion_at)
-    )
-    if disc_ids is not None:
-        if discipline_id is None:
-            return False
-        try:
-            if int(discipline_id) not in disc_ids:
-                return False
-        except (TypeError, ValueError):
-            return False
-    if criterion_level is not None:
-        if level_id is None:
-            return False
-        try:
-            if int(level_id) != int(criterion_level):
-                return False
-        except (TypeError, ValueError):
-            return False
-    return True
-
-
-def _batch_competition_directory_appointment_lines(
-    session: Session,
-    official_ids: list[int],
-    criteria_rows: list[tuple[int, int, int | None]],
-) -> dict[int, list[str]]:
-    """
-    Active directory appointment labels per official for this competition.
-
-    Unions appointments matching **any** configured criterion row on the competition
-    (not the report UI filters).
-    """
-    out: dict[int, list[str]] = {int(oid): [] for oid in official_ids}
-    if not official_ids:
-        return out
-    stmt = (
-        select(
-            Appointments.official_id,
-            AppointmentTypes.name,
-            Disciplines.name,
-            Appointments.discipline_id,
-            Levels.name,
-            Appointments.appointment_type_id,
-            Appointments.level_id,
-        )
-        .select_from(Appointments)
-        .join(AppointmentTypes, Appointments.appointment_type_id == AppointmentTypes.id)
-        .join(Disciplines, Appointments.discipline_id == Disciplines.id)
-        .outerjoin(Levels, Appointments.level_id == Levels.id)
-        .where(
-            Appointments.official_id.in_(list(official_ids)),
-            Appointments.active.is_(True),
-        )
-    )
-    for (
-        oid,
-        at_name,
-        disc_name,
-        disc_id,
-        lvl_name,
-        at_id,
-        lvl_id,
-    ) in session.execute(stmt).all():
-        oid = int(oid)
-        if not criteria_rows:
-            line = _appointment_display_line(
-                at_name, disc_name, lvl_name, discipline_id=disc_id
-            )
-            if line and line not in out[oid]:
-                out[oid].append(line)
-            continue
-        for crit_at, crit_disc, crit_lvl in criteria_rows:
-            if not _appointment_matches_competition_criterion(
-                int(at_id),
-                disc_id,
-                lvl_id,
-                criterion_at=crit_at,
-                criterion_disc=crit_disc,
-                criterion_level=crit_lvl,
-            ):
-                continue
-            line = _appointment_display_line(
-                at_name, disc_name, lvl_name, discipline_id=disc_id
-            )
-            if line and line not in out[oid]:
-                out[oid].append(line)
-    for oid in official_ids:
-        out[int(oid)] = sorted(out[int(oid)], key=str.casefold)
-    return out
-
-
 def _criteria_allow_filter(
     criteria_rows: list[tuple[int, int, int | None]],
     appointment_type_id: int,
@@ -1120,14 +999,6 @@ def _assignment_discipline_ids_for_report(
     return out
 
 
-@dataclass
-class _CriterionReportSegment:
-    appointment_type_id: int
-    discipline_id: int
-    level_id: int | None
-    pending: list[tuple[Any, str, dict[str, Any], bool]]
-
-
 def resolve_report_criteria_filters(
     crit_combos: pd.DataFrame,
     filter_at: str,
@@ -1161,31 +1032,170 @@ def resolve_report_criteria_filters(
     return out
 
 
-def _collect_pending_for_criterion(
+_REPORT_APPOINTMENT_COLUMNS = [
+    "official_id",
+    "appointment_type_id",
+    "discipline_id",
+    "level_id",
+    "appointment_date",
+    "appointment_type_row_id",
+    "appointment_type_name",
+    "discipline_row_id",
+    "discipline_name",
+    "level_name",
+]
+
+
+def _load_report_appointments(
     session: Session,
-    *,
-    form_id: int,
-    competition_id: int,
-    appointment_type_id: int,
-    discipline_id: int,
-    level_id: int | None,
-    include_available: bool,
-    include_no_reply: bool,
-    include_unavailable: bool,
-) -> _CriterionReportSegment | None:
-    appt_filters = [
+    appointment_type_ids: set[int],
+) -> pd.DataFrame:
+    """
+    Every active directory appointment of officials who hold an active appointment of
+    one of ``appointment_type_ids``, with display names (one query).
+
+    Criterion matching, held types, display lines and in-role appointment years are all
+    derived from this frame.
+    """
+    holders = select(Appointments.official_id).where(
         Appointments.active.is_(True),
-        Appointments.appointment_type_id == int(appointment_type_id),
+        Appointments.appointment_type_id.in_(sorted(appointment_type_ids)),
+    )
+    rows = session.execute(
+        select(
+            Appointments.official_id,
+            Appointments.appointment_type_id,
+            Appointments.discipline_id,
+            Appointments.level_id,
+            func.coalesce(Appointments.achieved_date, Appointments.appointed_date),
+            AppointmentTypes.id,
+            AppointmentTypes.name,
+            Disciplines.id,
+            Disciplines.name,
+            Levels.name,
+        )
+        .select_from(Appointments)
+        .outerjoin(AppointmentTypes, Appointments.appointment_type_id == AppointmentTypes.id)
+        .outerjoin(Disciplines, Appointments.discipline_id == Disciplines.id)
+        .outerjoin(Levels, Appointments.level_id == Levels.id)
+        .where(Appointments.active.is_(True), Appointments.official_id.in_(holders))
+    ).all()
+    appts = pd.DataFrame(rows, columns=_REPORT_APPOINTMENT_COLUMNS)
+    return appts.astype(
+        {
+            "official_id": "Int64",
+            "appointment_type_id": "Int64",
+            "discipline_id": "Int64",
+            "level_id": "Int64",
+        }
+    )
+
+
+def _criteria_frame(criteria: list[tuple[int, int, int | None]]) -> pd.DataFrame:
+    """One row per (criterion, allowed appointment discipline id)."""
+    rows: list[tuple[int, int, Any, bool, Any]] = []
+    for idx, (at_id, disc_id, lid) in enumerate(criteria):
+        disc_ids = _assignment_discipline_ids_for_report(int(disc_id), int(at_id))
+        level = pd.NA if lid is None else int(lid)
+        if disc_ids is None:
+            rows.append((idx, int(at_id), pd.NA, True, level))
+        else:
+            rows.extend((idx, int(at_id), int(d), False, level) for d in disc_ids)
+    return pd.DataFrame(
+        rows,
+        columns=[
+            "criterion",
+            "appointment_type_id",
+            "criterion_discipline_id",
+            "any_discipline",
+            "criterion_level_id",
+        ],
+    ).astype(
+        {
+            "appointment_type_id": "Int64",
+            "criterion_discipline_id": "Int64",
+            "criterion_level_id": "Int64",
+        }
+    )
+
+
+def _appointments_matching_criteria(
+    appts: pd.DataFrame,
+    criteria: list[tuple[int, int, int | None]],
+) -> pd.Series:
+    """
+    Boolean mask over ``appts`` rows matching **any** criterion: same appointment type,
+    discipline among the criterion's report disciplines, same level when one is set.
+    """
+    crit = _criteria_frame(criteria)
+    pairs = (
+        appts[["appointment_type_id", "discipline_id", "level_id"]]
+        .rename_axis("appt_row")
+        .reset_index()
+        .merge(crit, on="appointment_type_id")
+    )
+    disc_ok = pairs["any_discipline"] | (
+        pairs["discipline_id"] == pairs["criterion_discipline_id"]
+    ).fillna(False).astype(bool)
+    level_ok = pairs["criterion_level_id"].isna() | (
+        pairs["level_id"] == pairs["criterion_level_id"]
+    ).fillna(False).astype(bool)
+    matched = pairs.loc[disc_ok & level_ok, "appt_row"].unique()
+    return pd.Series(appts.index.isin(matched), index=appts.index)
+
+
+def _directory_lines_by_official(appts: pd.DataFrame) -> dict[int, str]:
+    """``Directory appointments`` cell per official: distinct labels, casefold-sorted."""
+    shown = appts.loc[
+        appts["appointment_type_row_id"].notna() & appts["discipline_row_id"].notna()
     ]
+    labels: dict[int, set[str]] = {}
+    for oid, at_name, disc_name, disc_id, lvl_name in zip(
+        shown["official_id"],
+        shown["appointment_type_name"],
+        shown["discipline_name"],
+        shown["discipline_id"],
+        shown["level_name"],
+    ):
+        line = _appointment_display_line(
+            at_name,
+            disc_name,
+            lvl_name,
+            discipline_id=None if pd.isna(disc_id) else int(disc_id),
+        )
+        if line:
+            labels.setdefault(int(oid), set()).add(line)
+    return {oid: "; ".join(sorted(lines, key=str.casefold)) for oid, lines in labels.items()}
+
+
+def _in_role_appointment_years(
+    appts: pd.DataFrame,
+    appointment_type_id: int,
+    discipline_id: int,
+) -> dict[int, int]:
+    """Same as ``_batch_official_in_role_appointment_year``, from the loaded frame."""
+    mask = appts["appointment_type_id"] == int(appointment_type_id)
     disc_ids = _assignment_discipline_ids_for_report(
         int(discipline_id), int(appointment_type_id)
     )
     if disc_ids is not None:
-        appt_filters.append(Appointments.discipline_id.in_(disc_ids))
-    if level_id is not None:
-        appt_filters.append(Appointments.level_id == int(level_id))
+        mask &= appts["discipline_id"].isin(disc_ids)
+    dated = appts.loc[mask.fillna(False).astype(bool) & appts["appointment_date"].notna()]
+    if dated.empty:
+        return {}
+    years = pd.to_datetime(dated["appointment_date"]).dt.year
+    latest = years.groupby(dated["official_id"]).max()
+    return {int(oid): int(yr) for oid, yr in latest.items()}
 
-    stmt = (
+
+def _load_report_officials(
+    session: Session,
+    form_id: int,
+    competition_id: int,
+    official_ids: list[int],
+) -> list[Any]:
+    """Directory fields, form response and competition availability per official."""
+    return session.execute(
         select(
             Officials.id,
             Officials.full_name,
@@ -1194,15 +1204,10 @@ def _collect_pending_for_criterion(
             Officials.state,
             Officials.email,
             QualifyingOfficialCompetitionAvailability.availability_code,
-            QualifyingOfficialCompetitionAvailability.raw_value,
             QualifyingOfficialFormResponse.id.label("form_response_id"),
             QualifyingOfficialFormResponse.response_json,
         )
         .select_from(Officials)
-        .join(
-            Appointments,
-            and_(Appointments.official_id == Officials.id, *appt_filters),
-        )
         .outerjoin(
             QualifyingOfficialFormResponse,
             and_(
@@ -1219,183 +1224,9 @@ def _collect_pending_for_criterion(
                 == int(competition_id),
             ),
         )
-        .distinct()
-        .order_by(Officials.full_name.asc().nulls_last())
-    )
-    executed = session.execute(stmt).all()
-
-    pending: list[tuple[Any, str, dict[str, Any], bool]] = []
-    seen: set[int] = set()
-
-    for row in executed:
-        oid = int(row.id)
-        if oid in seen:
-            continue
-        seen.add(oid)
-
-        response_json = row.response_json if row.form_response_id is not None else {}
-        payload = (
-            response_json
-            if isinstance(response_json, dict)
-            else (dict(response_json) if response_json else {})
-        )
-        form_is_complete = (
-            row.form_response_id is not None and response_json_is_complete(payload)
-        )
-        not_interested_all = (
-            form_is_complete and response_json_not_interested_all(payload)
-        )
-        bucket = _availability_bucket(
-            has_form_response=row.form_response_id is not None,
-            form_is_complete=form_is_complete,
-            not_interested_all=not_interested_all,
-            availability_code=row.availability_code,
-        )
-        if bucket is None:
-            continue
-        if bucket == "available" and not include_available:
-            continue
-        if bucket == "no_reply" and not include_no_reply:
-            continue
-        if bucket == "unavailable" and not include_unavailable:
-            continue
-        pending.append((row, bucket, payload, form_is_complete))
-
-    if not pending:
-        return None
-    return _CriterionReportSegment(
-        appointment_type_id=int(appointment_type_id),
-        discipline_id=int(discipline_id),
-        level_id=level_id,
-        pending=pending,
-    )
-
-
-def _rows_from_criterion_segment(
-    segment: _CriterionReportSegment,
-    *,
-    overall_years: dict[int, tuple[int | None, int | None]],
-    in_role_years: dict[int, tuple[int | None, int | None]],
-    other_comp_cache: dict[int, int],
-    in_role_other_comp_cache: dict[int, int] | None,
-    in_role_appointment_year_cache: dict[int, int | None] | None,
-    held_types_cache: dict[int, set[int]],
-    competition_appt_lines_by_official: dict[int, list[str]],
-    appointment_name_to_id: dict[str, int],
-) -> list[dict[str, Any]]:
-    rows_out: list[dict[str, Any]] = []
-    for row, bucket, payload, form_is_complete in segment.pending:
-        oid = int(row.id)
-
-        notes = ""
-        conflicts = ""
-        role_priority = ""
-        if row.form_response_id is not None and form_is_complete:
-            notes = extract_qualifying_form_notes(payload)
-            conflicts = extract_qualifying_form_conflicts(payload)
-            role_priority = extract_qualifying_role_priority(
-                payload,
-                held_appointment_type_ids=held_types_cache.get(oid, set()),
-                appointment_name_to_id=appointment_name_to_id,
-            )
-
-        ir_champ, ir_sect = in_role_years.get(oid, (None, None))
-        ov_champ, ov_sect = overall_years.get(oid, (None, None))
-        other_count = other_comp_cache.get(oid, 0)
-
-        row_out: dict[str, Any] = {
-            "_official_id": oid,
-            "official_id": oid,
-            "Name": (row.full_name or "").strip() or f"Official {oid}",
-            "Member #": (row.mbr_number or "").strip(),
-            "Region": (row.region or row.state or "").strip(),
-            "Email": (row.email or "").strip(),
-            "Status": _BUCKET_LABELS.get(bucket, bucket),
-            "Role priority": role_priority,
-            "Last champs (in role)": ir_champ,
-            "Last sectionals (in role)": ir_sect,
-            "Last champs (overall)": ov_champ,
-            "Last sectionals (overall)": ov_sect,
-            "Total comps (2 yr)": other_count,
-            "Directory appointments": "; ".join(
-                competition_appt_lines_by_official.get(oid, [])
-            ),
-            "Notes": notes,
-            "Conflicts": conflicts,
-        }
-        if in_role_appointment_year_cache is not None:
-            row_out["Appointment year"] = in_role_appointment_year_cache.get(oid)
-        if in_role_other_comp_cache is not None:
-            row_out["Total comps (2 yr, in role)"] = in_role_other_comp_cache.get(
-                oid, 0
-            )
-        rows_out.append(row_out)
-    return rows_out
-
-
-def _merge_year_cells(a: Any, b: Any) -> Any:
-    vals = []
-    for v in (a, b):
-        if v is None or v == "":
-            continue
-        try:
-            vals.append(int(v))
-        except (TypeError, ValueError):
-            continue
-    return max(vals) if vals else None
-
-
-def _merge_notes_cells(a: Any, b: Any) -> str:
-    parts: list[str] = []
-    for text in (str(a or "").strip(), str(b or "").strip()):
-        if text and text not in parts:
-            parts.append(text)
-    return "\n\n".join(parts)
-
-
-def _merge_report_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """One row per official; union directory appointment labels and merge notes/years."""
-    by_id: dict[int, dict[str, Any]] = {}
-    for row in rows:
-        oid = int(row.pop("_official_id"))
-        if oid not in by_id:
-            by_id[oid] = row
-            continue
-        existing = by_id[oid]
-        parts = {
-            p.strip()
-            for p in (
-                str(existing.get("Directory appointments") or "").split(";")
-                + str(row.get("Directory appointments") or "").split(";")
-            )
-            if p.strip()
-        }
-        existing["Directory appointments"] = "; ".join(sorted(parts, key=str.casefold))
-        if not str(existing.get("Role priority") or "").strip():
-            existing["Role priority"] = row.get("Role priority") or ""
-        existing["Notes"] = _merge_notes_cells(
-            existing.get("Notes"), row.get("Notes")
-        )
-        existing["Conflicts"] = _merge_notes_cells(
-            existing.get("Conflicts"), row.get("Conflicts")
-        )
-        for col in (
-            "Appointment year",
-            "Last champs (in role)",
-            "Last sectionals (in role)",
-            "Last champs (overall)",
-            "Last sectionals (overall)",
-        ):
-            existing[col] = _merge_year_cells(existing.get(col), row.get(col))
-        existing["Total comps (2 yr)"] = _merge_year_cells(
-            existing.get("Total comps (2 yr)"), row.get("Total comps (2 yr)")
-        )
-        if "Total comps (2 yr, in role)" in row:
-            existing["Total comps (2 yr, in role)"] = _merge_year_cells(
-                existing.get("Total comps (2 yr, in role)"),
-                row.get("Total comps (2 yr, in role)"),
-            )
-    return list(by_id.values())
+        .where(Officials.id.in_(official_ids))
+        .order_by(Officials.id)
+    ).all()
 
 
 def _order_report_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -1420,7 +1251,11 @@ def build_qualifying_availability_report(
     Officials with matching **active directory** appointments for one form competition.
 
     ``criteria_filters`` is one or more ``(appointment_type_id, discipline_id, level_id)``
-    rows (from configured criteria, including when UI selects ``(All)``).
+    rows (from configured criteria, including when UI selects ``(All)``). An official
+    matching several rows appears once.
+
+    Appointments are loaded once for every criterion and matched in pandas, so the
+    number of queries does not grow with the number of criteria.
     """
     db_engine = engine or get_engine()
     meta: dict[str, Any] = {
@@ -1437,7 +1272,12 @@ def build_qualifying_availability_report(
         meta["no_buckets_selected"] = True
         return pd.DataFrame(), meta
 
-    all_rows: list[dict[str, Any]] = []
+    include_bucket = {
+        "available": include_available,
+        "no_reply": include_no_reply,
+        "unavailable": include_unavailable,
+    }
+    rows_out: list[dict[str, Any]] = []
 
     with Session(db_engine) as session:
         comp = session.get(QualifyingAvailabilityCompetition, int(competition_id))
@@ -1447,47 +1287,60 @@ def build_qualifying_availability_report(
         meta["prompt_key"] = comp.prompt_key
         meta["competition_group"] = comp.competition_group
 
-        n_crit = session.scalar(
-            select(QualifyingCompetitionCriteria.id)
-            .where(QualifyingCompetitionCriteria.competition_id == int(competition_id))
-            .limit(1)
-        )
-        meta["criteria_configured"] = n_crit is not None
-
-        meta["other_comp_season_codes"] = other_comps_segment_season_year_codes()
-        appt_name_to_id = _appointment_name_to_id_map(session)
         criteria_rows = _load_competition_criteria_triples(session, int(competition_id))
+        meta["criteria_configured"] = bool(criteria_rows)
+        season_codes = other_comps_segment_season_year_codes()
+        meta["other_comp_season_codes"] = season_codes
 
-        segments: list[_CriterionReportSegment] = []
         for at_id, disc_id, lid in criteria_filters:
             if not _criteria_allow_filter(criteria_rows, at_id, disc_id, lid):
                 meta["criteria_match"] = False
                 return pd.DataFrame(), meta
-            seg = _collect_pending_for_criterion(
-                session,
-                form_id=int(form_id),
-                competition_id=int(competition_id),
-                appointment_type_id=at_id,
-                discipline_id=disc_id,
-                level_id=lid,
-                include_available=include_available,
-                include_no_reply=include_no_reply,
-                include_unavailable=include_unavailable,
+
+        appts = _load_report_appointments(
+            session, {int(at_id) for at_id, _, _ in criteria_filters}
+        )
+        matched = appts.loc[_appointments_matching_criteria(appts, criteria_filters)]
+        candidate_oids = sorted(int(oid) for oid in matched["official_id"].dropna().unique())
+        if not candidate_oids:
+            return pd.DataFrame(), meta
+
+        pending: list[tuple[Any, str, dict[str, Any], bool]] = []
+        seen: set[int] = set()
+        for row in _load_report_officials(
+            session, int(form_id), int(competition_id), candidate_oids
+        ):
+            oid = int(row.id)
+            if oid in seen:
+                continue
+            seen.add(oid)
+            response_json = row.response_json if row.form_response_id is not None else {}
+            payload = (
+                response_json
+                if isinstance(response_json, dict)
+                else (dict(response_json) if response_json else {})
+            )
+            form_is_complete = (
+                row.form_response_id is not None and response_json_is_complete(payload)
+            )
+            not_interested_all = (
+                form_is_complete and response_json_not_interested_all(payload)
             )
-            if seg is not None:
-                segments.append(seg)
+            bucket = _availability_bucket(
+                has_form_response=row.form_response_id is not None,
+                form_is_complete=form_is_complete,
+                not_interested_all=not_interested_all,
+                availability_code=row.availability_code,
+            )
+            if bucket is None or not include_bucket[bucket]:
+                continue
+            pending.append((row, bucket, payload, form_is_complete))
 
-        if not segments:
+        if not pending:
             return pd.DataFrame(), meta
 
-        report_oids: list[int] = []
-        seen_oid: set[int] = set()
-        for seg in segments:
-            for row, _, _, _ in seg.pending:
-                oid = int(row.id)
-                if oid not in seen_oid:
-                    seen_oid.add(oid)
-                    report_oids.append(oid)
+        report_oids = [int(row.id) for row, _, _, _ in pending]
+        appts = appts.loc[appts["official_id"].isin(report_oids)]
 
         overall_years, in_role_years = _fetch_assignment_years_combined(
             session,
@@ -1496,7 +1349,6 @@ def build_qualifying_availability_report(
             in_role_appointment_type_id=in_role_appointment_type_id,
             in_role_discipline_id=in_role_discipline_id,
         )
-        season_codes = other_comps_segment_season_year_codes()
         meta["other_comp_calendar_years"] = calendar_years_for_usfs_season_codes(
             season_codes
         )
@@ -1505,16 +1357,13 @@ def build_qualifying_availability_report(
             season_year_codes=season_codes,
         )
         in_role_other_comp_cache: dict[int, int] | None = None
-        in_role_appointment_year_cache: dict[int, int | None] | None = None
+        in_role_appointment_years: dict[int, int] | None = None
         if (
             in_role_appointment_type_id is not None
             and in_role_discipline_id is not None
         ):
-            in_role_appointment_year_cache = _batch_official_in_role_appointment_year(
-                session,
-                report_oids,
-                int(in_role_appointment_type_id),
-                int(in_role_discipline_id),
+            in_role_appointment_years = _in_role_appointment_years(
+                appts, int(in_role_appointment_type_id), int(in_role_discipline_id)
             )
             in_role_other_comp_cache = count_official_segment_competitions_batch(
                 report_oids,
@@ -1527,37 +1376,66 @@ def build_qualifying_availability_report(
             )
             meta["show_in_role_columns"] = True
             meta["show_total_comps_in_role"] = True
-        held_types_cache = _batch_held_appointment_type_ids(session, report_oids)
-        competition_appt_lines = _batch_competition_directory_appointment_lines(
-            session,
-            report_oids,
-            criteria_rows,
+
+        held = appts.loc[appts["appointment_type_id"].notna()]
+        held_types: dict[int, set[int]] = {
+            int(oid): {int(t) for t in types}
+            for oid, types in held.groupby("official_id")["appointment_type_id"]
+        }
+        # Directory column lists every appointment matching the competition's configured
+        # criteria (not the report UI filters); all active ones when none are configured.
+        line_appts = (
+            appts.loc[_appointments_matching_criteria(appts, criteria_rows)]
+            if criteria_rows
+            else appts
         )
+        directory_lines = _directory_lines_by_official(line_appts)
+        appt_name_to_id = _appointment_name_to_id_map(session)
 
-        for seg in segments:
-            all_rows.extend(
-                _rows_from_criterion_segment(
-                    seg,
-                    overall_years=overall_years,
-                    in_role_years=in_role_years,
-                    other_comp_cache=other_comp_cache,
-                    in_role_other_comp_cache=in_role_other_comp_cache,
-                    in_role_appointment_year_cache=in_role_appointment_year_cache,
-                    held_types_cache=held_types_cache,
-                    competition_appt_lines_by_official=competition_appt_lines,
-                    appointment_name_to_id=appt_name_to_id,
-                )
+    for row, bucket, payload, form_is_complete in pending:
+        oid = int(row.id)
+        notes = ""
+        conflicts = ""
+        role_priority = ""
+        if form_is_complete:
+            notes = extract_qualifying_form_notes(payload)
+            conflicts = extract_qualifying_form_conflicts(payload)
+            role_priority = extract_qualifying_role_priority(
+                payload,
+                held_appointment_type_ids=held_types.get(oid, set()),
+                appointment_name_to_id=appt_name_to_id,
             )
+        ir_champ, ir_sect = in_role_years.get(oid, (None, None))
+        ov_champ, ov_sect = overall_years.get(oid, (None, None))
+        row_out: dict[str, Any] = {
+            "official_id": oid,
+            "Name": (row.full_name or "").strip() or f"Official {oid}",
+            "Member #": (row.mbr_number or "").strip(),
+            "Region": (row.region or row.state or "").strip(),
+            "Email": (row.email or "").strip(),
+            "Status": _BUCKET_LABELS.get(bucket, bucket),
+            "Role priority": role_priority,
+            "Last champs (in role)": ir_champ,
+            "Last sectionals (in role)": ir_sect,
+            "Last champs (overall)": ov_champ,
+            "Last sectionals (overall)": ov_sect,
+            "Total comps (2 yr)": other_comp_cache.get(oid, 0),
+            "Directory appointments": directory_lines.get(oid, ""),
+            "Notes": notes,
+            "Conflicts": conflicts,
+        }
+        if in_role_appointment_years is not None:
+            row_out["Appointment year"] = in_role_appointment_years.get(oid)
+        if in_role_other_comp_cache is not None:
+            row_out["Total comps (2 yr, in role)"] = in_role_other_comp_cache.get(oid, 0)
+        rows_out.append(row_out)
 
-    report_rows = _merge_report_rows(all_rows)
-    df = pd.DataFrame(report_rows)
-    if not df.empty:
-        df = (
-            df.sort_values("Name", kind="mergesort")
-            .reset_index(drop=True)
-            .pipe(_order_report_columns)
-        )
-    return df, meta
+    df = pd.DataFrame(rows_out)
+    return (
+        df.sort_values(["Name", "official_id"], kind="mergesort")
+        .reset_index(drop=True)
+        .pipe(_order_report_columns)
+    ), meta
 
 
 def get_official_form_response(
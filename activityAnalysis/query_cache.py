@@ -0,0 +1,458 @@
+"""
+Shared in-process result cache for the activity tracker and international officials apps.
+
+Loaders decorated with :func:`cached_query` declare the tables they read. Their results
+are kept once per process (not per Streamlit session), keyed on the function and its
+normalized arguments, and returned without copying: DataFrames / Series (also inside
+dict / list / tuple results) come back as shallow copies over read-only numpy blocks, so
+callers may add, drop or rename columns but an in-place element write raises instead of
+corrupting the shared entry.
+
+Invalidation is per table. Writers call :func:`bump_table_versions` in their own
+transaction, which increments ``officials_analysis.table_version`` rows; an entry is
+reused only while the versions of its tables match those it was computed under. The
+version table is polled at most every ``_VERSION_POLL_SEC`` seconds. Without the table
+(migration ``041_table_version.sql`` not applied) entries expire after
+``FALLBACK_TTL_SEC`` like the old ``st.cache_data`` TTL.
+
+Entries are evicted least-recently-used once the byte budget is exceeded
+(``ACTIVITY_QUERY_CACHE_MB``, default 256). :meth:`QueryCache.stats` reports hits,
+misses, invalidations and evictions for the sidebar.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import math
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+try:
+    from activityAnalysis.officials_analysis_models import TableVersion
+except ModuleNotFoundError:
+    from officials_analysis_models import TableVersion  # type: ignore[no-redef]
+
+# Version-table keys (``schema.table``) of the tables the apps' loaders read.
+TABLE_OFFICIALS = "officials_analysis.officials"
+TABLE_APPOINTMENTS = "officials_analysis.appointments"
+TABLE_ASSIGNMENT = "officials_analysis.assignment"
+TABLE_ACTIVITY_COMPETITION = "officials_analysis.competition"
+TABLE_OFFICIAL_ACTIVITY_FACT = "officials_analysis.official_activity_fact"
+TABLE_ISU_OFFICIAL = "officials_analysis.isu_official"
+TABLE_ISU_OFFICIAL_SEMINAR = "officials_analysis.isu_official_seminar"
+TABLE_REQUIREMENT_RULES = "officials_analysis.international_requirement_rule"
+TABLE_SEGMENT_OFFICIAL = "public.segment_official"
+TABLE_JUDGE_OFFICIAL_LINK = "public.judge_official_link"
+TABLE_SEGMENT_RULE411 = "public.segment_rule411_eligibility"
+
+DIRECTORY_TABLES = (TABLE_OFFICIALS, TABLE_APPOINTMENTS)
+ASSIGNMENT_TABLES = (TABLE_ASSIGNMENT, TABLE_ACTIVITY_COMPETITION, TABLE_OFFICIAL_ACTIVITY_FACT)
+# Protocol panels (competition loads), the judge ↔ directory links that attach them and
+# the stored Rule 411 flags joined onto them.
+PROTOCOL_TABLES = (TABLE_SEGMENT_OFFICIAL, TABLE_JUDGE_OFFICIAL_LINK, TABLE_SEGMENT_RULE411)
+
+DEFAULT_BUDGET_MB = 256
+# Safety net when versions are tracked; a bump normally invalidates long before this.
+DEFAULT_MAX_AGE_SEC = 3600.0
+FALLBACK_TTL_SEC = 120.0
+# Entries larger than this share of the budget are returned but not kept.
+_MAX_ENTRY_SHARE = 0.25
+_VERSION_POLL_SEC = 2.0
+
+# Engine URLs whose database has no ``table_version`` (bumps and polls are skipped).
+_versions_missing: set[str] = set()
+
+
+def _bind_key(bind) -> str:
+    engine = getattr(bind, "engine", bind)
+    return str(engine.url)
+
+
+# ── writers ─────────────────────────────────────────────────────────────────
+
+
+def bump_table_versions(session, tables: Iterable[str]) -> bool:
+    """
+    Increment the version of each of ``tables`` in ``session``'s transaction (a Session
+    or Connection). Does not commit. Returns ``False`` when the version table is missing
+    or the dialect has no upsert; the write itself is never affected.
+    """
+    names = sorted({str(t) for t in tables})
+    if not names:
+        return False
+    bind = session.get_bind() if isinstance(session, Session) else session
+    key = _bind_key(bind)
+    if key in _versions_missing:
+        return False
+    dialect = bind.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        return False
+    stmt = dialect_insert(TableVersion).values(
+        [{"table_name": name, "version": 1} for name in names]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TableVersion.table_name],
+        set_={"version": TableVersion.version + 1, "updated_at": func.now()},
+    )
+    try:
+        with session.begin_nested():
+            session.execute(stmt)
+    except SQLAlchemyError:
+        _versions_missing.add(key)
+        return False
+    query_cache.expire_versions()
+    return True
+
+
+_BUMP_CURSOR_SQL = """
+    INSERT INTO officials_analysis.table_version (table_name, version, updated_at)
+    VALUES (%s, 1, now())
+    ON CONFLICT (table_name) DO UPDATE SET
+        version = officials_analysis.table_version.version + 1,
+        updated_at = EXCLUDED.updated_at
+"""
+
+
+def bump_table_versions_cursor(cur, tables: Iterable[str]) -> bool:
+    """:func:`bump_table_versions` for a psycopg2 cursor (directory / birthdate loaders)."""
+    names = sorted({str(t) for t in tables})
+    if not names:
+        return False
+    cur.execute("SAVEPOINT table_version_bump")
+    try:
+        cur.executemany(_BUMP_CURSOR_SQL, [(name,) for name in names])
+    except Exception:
+        cur.execute("ROLLBACK TO SAVEPOINT table_version_bump")
+        return False
+    cur.execute("RELEASE SAVEPOINT table_version_bump")
+    query_cache.expire_versions()
+    return True
+
+
+def read_table_versions(engine) -> dict[str, int] | None:
+    """All ``table_version`` rows, or ``None`` when the table is missing."""
+    key = _bind_key(engine)
+    if key in _versions_missing:
+        return None
+    try:
+        with Session(engine) as session:
+            rows = session.execute(select(TableVersion.table_name, TableVersion.version)).all()
+    except SQLAlchemyError:
+        _versions_missing.add(key)
+        return None
+    return {str(name): int(version) for name, version in rows}
+
+
+def _activity_engine():
+    try:
+        from activityAnalysis.load_activity_data import get_engine
+    except ModuleNotFoundError:
+        from load_activity_data import get_engine  # type: ignore[no-redef]
+    return get_engine()
+
+
+# ── keys and values ─────────────────────────────────────────────────────────
+
+
+def normalize_cache_arg(value: Any) -> Any:
+    """
+    Hashable, type-stable form of a loader argument: numpy scalars become Python values,
+    NaN / NA become ``None``, lists and tuples become tuples, sets are sorted and dict
+    items are sorted by key. ``1``, ``np.int64(1)`` and ``1.0`` share one key.
+    """
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, float):
+        if math.isnan(value):
+            return None
+        return int(value) if value.is_integer() else value
+    if isinstance(value, (int, str, bytes)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize_cache_arg(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted((normalize_cache_arg(v) for v in value), key=repr))
+    if isinstance(value, dict):
+        return tuple(
+            sorted(((str(k), normalize_cache_arg(v)) for k, v in value.items()), key=repr)
+        )
+    try:
+        hash(value)
+    except TypeError as e:
+        raise TypeError(
+            f"cached_query arguments must be hashable; got {type(value).__name__}"
+        ) from e
+    return value
+
+
+def estimate_nbytes(value: Any, _depth: int = 0) -> int:
+    """Approximate memory held by a cached value (deep for frames and containers)."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    size = sys.getsizeof(value)
+    if _depth > 4:
+        return size
+    if isinstance(value, dict):
+        return size + sum(
+            estimate_nbytes(k, _depth + 1) + estimate_nbytes(v, _depth + 1)
+            for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_nbytes(v, _depth + 1) for v in value)
+    return size
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Mark frame / series / array buffers read-only in place; returns ``value``.
+
+    Deep ``memory_usage`` on a frozen object column raises, so size entries first.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        for arr in getattr(value._mgr, "arrays", ()):
+            if isinstance(arr, np.ndarray):
+                arr.flags.writeable = False
+    elif isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, (tuple, list)):
+        for v in value:
+            _freeze(v)
+    elif isinstance(value, dict):
+        for v in value.values():
+            _freeze(v)
+    return value
+
+
+def _share(value: Any) -> Any:
+    """
+    Per-call handle on a cached value: new frame / container objects at every level,
+    shared (read-only) data.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=False)
+    if isinstance(value, tuple):
+        return tuple(_share(v) for v in value)
+    if isinstance(value, list):
+        return [_share(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _share(v) for k, v in value.items()}
+    if isinstance(value, set):
+        return value.copy()
+    return value
+
+
+# ── cache ───────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class _Entry:
+    value: Any
+    versions: tuple[int, ...] | None
+    nbytes: int
+    created: float
+
+
+def _budget_bytes_from_env() -> int:
+    raw = os.environ.get("ACTIVITY_QUERY_CACHE_MB", "").strip()
+    try:
+        mb = float(raw) if raw else DEFAULT_BUDGET_MB
+    except ValueError:
+        mb = DEFAULT_BUDGET_MB
+    return max(0, int(mb * 1024 * 1024))
+
+
+class QueryCache:
+    """LRU of loader results with per-table version checks and a byte budget."""
+
+    def __init__(
+        self,
+        *,
+        budget_bytes: int | None = None,
+        version_reader: Callable[[], dict[str, int] | None] | None = None,
+        max_age_sec: float = DEFAULT_MAX_AGE_SEC,
+        fallback_ttl_sec: float = FALLBACK_TTL_SEC,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.budget_bytes = _budget_bytes_from_env() if budget_bytes is None else budget_bytes
+        self._version_reader = version_reader or (lambda: read_table_versions(_activity_engine()))
+        self.max_age_sec = max_age_sec
+        self.fallback_ttl_sec = fallback_ttl_sec
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        self._key_locks: dict[tuple, threading.Lock] = {}
+        self._bytes = 0
+        self._versions: dict[str, int] | None = None
+        self._versions_read_at: float | None = None
+        self._counts = dict.fromkeys(
+            ("hits", "misses", "invalidations", "evictions", "oversize"), 0
+        )
+
+    # versions
+
+    def expire_versions(self) -> None:
+        """Re-read the version table on the next lookup (called after local bumps)."""
+        with self._lock:
+            self._versions_read_at = None
+
+    def _current_versions(self) -> dict[str, int] | None:
+        now = self._clock()
+        with self._lock:
+            if self._versions_read_at is not None and now - self._versions_read_at < _VERSION_POLL_SEC:
+                return self._versions
+        versions = self._version_reader()
+        with self._lock:
+            self._versions = versions
+            self._versions_read_at = now
+        return versions
+
+    @staticmethod
+    def _versions_for(versions: dict[str, int] | None, tables: tuple[str, ...]):
+        if versions is None:
+            return None
+        return tuple(versions.get(t, 0) for t in tables)
+
+    # lookups
+
+    def _lookup(self, key: tuple, wanted: tuple[int, ...] | None) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            max_age = self.fallback_ttl_sec if wanted is None else self.max_age_sec
+            if entry.versions != wanted or self._clock() - entry.created > max_age:
+                self._drop(key)
+                self._counts["invalidations"] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._counts["hits"] += 1
+            return True, entry.value
+
+    def _drop(self, key: tuple) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.nbytes
+
+    def _store(self, key: tuple, value: Any, versions: tuple[int, ...] | None) -> None:
+        nbytes = estimate_nbytes(value)
+        _freeze(value)
+        with self._lock:
+            self._drop(key)
+            if nbytes > self.budget_bytes * _MAX_ENTRY_SHARE:
+                self._counts["oversize"] += 1
+                return
+            self._entries[key] = _Entry(value, versions, nbytes, self._clock())
+            self._bytes += nbytes
+            while self._bytes > self.budget_bytes and self._entries:
+                self._drop(next(iter(self._entries)))
+                self._counts["evictions"] += 1
+
+    def get_or_compute(self, key: tuple, tables: tuple[str, ...], compute: Callable[[], Any]):
+        """Cached value for ``key`` under the current versions of ``tables``."""
+        wanted = self._versions_for(self._current_versions(), tables)
+        found, value = self._lookup(key, wanted)
+        if found:
+            return _share(value)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # One computation per key; concurrent sessions wait for it instead of re-querying.
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry.versions == wanted:
+                    self._entries.move_to_end(key)
+                    self._counts["hits"] += 1
+                    return _share(entry.value)
+                self._counts["misses"] += 1
+            try:
+                value = compute()
+                self._store(key, value, wanted)
+            finally:
+                with self._lock:
+                    self._key_locks.pop(key, None)
+        return _share(value)
+
+    def clear(self) -> None:
+        """Drop every entry and re-read versions (also retries a missing version table)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._versions_read_at = None
+        _versions_missing.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            out: dict[str, Any] = dict(self._counts)
+            out["entries"] = len(self._entries)
+            out["bytes"] = self._bytes
+            out["budget_bytes"] = self.budget_bytes
+            out["versions_tracked"] = self._versions is not None
+        lookups = out["hits"] + out["misses"]
+        out["hit_rate"] = out["hits"] / lookups if lookups else 0.0
+        return out
+
+    def stats_caption(self) -> str:
+        """One-line summary for app sidebars."""
+        s = self.stats()
+        return (
+            f"Query cache: {s['hit_rate']:.0%} hits ({s['hits']}/{s['hits'] + s['misses']}), "
+            f"{s['entries']} entries, {s['bytes'] / 2**20:.1f} / "
+            f"{s['budget_bytes'] / 2**20:.0f} MB"
+        )
+
+
+query_cache = QueryCache()
+
+
+def cached_query(
+    tables: Iterable[str], *, cache: QueryCache | None = None
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Cache a loader in the shared :data:`query_cache`, invalidated by writes to ``tables``.
+
+    Arguments are bound to the signature (defaults applied) and normalized with
+    :func:`normalize_cache_arg`, so positional / keyword spellings share an entry.
+    Returned frames are read-only; copy before writing cells.
+    """
+    table_key = tuple(sorted({str(t) for t in tables}))
+
+    def decorate(fn: Callable[..., Any]) -> Callable[..., Any]:
+        sig = inspect.signature(fn)
+        name = f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (name, tuple((k, normalize_cache_arg(v)) for k, v in bound.arguments.items()))
+            target = cache if cache is not None else query_cache
+            return target.get_or_compute(key, table_key, lambda: fn(*args, **kwargs))
+
+        wrapper.tables = table_key  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorate
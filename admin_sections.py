@@ -195,6 +195,85 @@ def render_public_competition_officials_types_breakdown() -> None:
     st.dataframe(display, width="stretch", hide_index=True)
 
 
+def render_cache_rebuild_queue() -> None:
+    from cache_rebuild_queue import (
+        JOB_DONE,
+        JOB_FAILED,
+        JOB_QUEUED,
+        JOB_RUNNING,
+        enqueue_competition_rebuild,
+        queue_status_counts,
+        recent_jobs,
+        retry_failed_jobs,
+    )
+
+    st.subheader("Cache rebuild queue")
+    st.caption(
+        "Competition loads queue a rebuild of cross-judge shards, judge excess rows, "
+        "element / PCS mark shards, σ̂ and summaries. Jobs run in "
+        "``python scripts/run_cache_rebuild_worker.py`` (polls; use ``--once`` from cron). "
+        "Failed attempts retry with backoff; repeat loads of a queued competition coalesce."
+    )
+    analytics = get_analytics_safe()
+    session = analytics.session
+    try:
+        counts = queue_status_counts(session)
+        jobs = recent_jobs(session)
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        st.error(
+            f"Could not read ``cache_rebuild_job``: {e}. Apply "
+            "**scripts/migrations/011_cache_rebuild_job.sql** if the table is missing."
+        )
+        return
+
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Queued", counts.get(JOB_QUEUED, 0))
+    c2.metric("Running", counts.get(JOB_RUNNING, 0))
+    c3.metric("Failed", counts.get(JOB_FAILED, 0))
+    c4.metric("Done (kept 14 days)", counts.get(JOB_DONE, 0))
+
+    b1, b2 = st.columns([1, 2])
+    with b1:
+        if st.button(
+            "Retry failed jobs",
+            disabled=not counts.get(JOB_FAILED),
+            key="admin_cache_queue_retry",
+        ):
+            try:
+                n = retry_failed_jobs(session)
+                session.commit()
+                st.success(f"Requeued {n} job(s).")
+                st.rerun()
+            except Exception as e:
+                session.rollback()
+                st.error(f"Retry failed: {e}")
+    with b2:
+        competitions = analytics.get_competitions()
+        comp_labels = {f"{name} ({year})": cid for cid, name, year in competitions}
+        pick = st.selectbox(
+            "Queue a rebuild for",
+            [""] + list(comp_labels),
+            key="admin_cache_queue_pick",
+        )
+        if st.button("Queue rebuild", disabled=not pick, key="admin_cache_queue_add"):
+            try:
+                enqueue_competition_rebuild(
+                    session, comp_labels[pick], reason="admin: manual rebuild"
+                )
+                session.commit()
+                st.rerun()
+            except Exception as e:
+                session.rollback()
+                st.error(f"Could not queue rebuild: {e}")
+
+    if not jobs:
+        st.info("No cache rebuild jobs yet.")
+        return
+    st.dataframe(pd.DataFrame(jobs), width="stretch", hide_index=True)
+
+
 def render_manage_judge_emails() -> None:
     from email_reports import ensure_email_table, get_email_list, upsert_email_list, delete_email_entry
 
@@ -266,7 +345,8 @@ def render_email_competition_reports() -> None:
     from email_reports import (
         DEFAULT_EMAIL_BODY,
         DEFAULT_EMAIL_SUBJECT,
-        build_report_for_judge,
+        SmtpReportSender,
+        build_reports_for_competition,
         get_email_list,
         match_judge_to_email,
         send_report_email,
@@ -449,28 +529,45 @@ def render_email_competition_reports() -> None:
         _analytics = get_analytics_safe()
         results = []
         prog = st.progress(0)
-        for i, row in enumerate(matched):
-            _step = "building report"
-            try:
-                html_bytes, _ = build_report_for_judge(
-                    _analytics, int(row["judge_id"]), int(selected_comp_id)
-                )
-                _step = "sending email"
-                send_report_email(
-                    _smtp_cfg,
-                    row["Email"],
-                    row["Judge"],
-                    selected_comp_name,
-                    html_bytes,
-                    subject_template=_email_subject,
-                    body_template=_email_body,
-                )
-                results.append((row["Judge"], row["Email"], True, "", ""))
-            except Exception as _exc:
-                results.append(
-                    (row["Judge"], row["Email"], False, f"[{_step}] {_exc}", _tb.format_exc())
-                )
-            prog.progress((i + 1) / len(matched))
+        _build_status = st.empty()
+
+        def _on_built(done, total):
+            _build_status.caption(f"Built {done} of {total} report(s)…")
+
+        with st.spinner("Building reports…"):
+            _reports = build_reports_for_competition(
+                _analytics,
+                [int(row["judge_id"]) for row in matched],
+                int(selected_comp_id),
+                progress_callback=_on_built,
+            )
+        _build_status.empty()
+
+        with SmtpReportSender(_smtp_cfg) as _sender:
+            for i, row in enumerate(matched):
+                _step = "building report"
+                try:
+                    _built = _reports[int(row["judge_id"])]
+                    if isinstance(_built, Exception):
+                        raise _built
+                    html_bytes, _ = _built
+                    _step = "sending email"
+                    send_report_email(
+                        _smtp_cfg,
+                        row["Email"],
+                        row["Judge"],
+                        selected_comp_name,
+                        html_bytes,
+                        subject_template=_email_subject,
+                        body_template=_email_body,
+                        sender=_sender,
+                    )
+                    results.append((row["Judge"], row["Email"], True, "", ""))
+                except Exception as _exc:
+                    results.append(
+                        (row["Judge"], row["Email"], False, f"[{_step}] {_exc}", _tb.format_exc())
+                    )
+                prog.progress((i + 1) / len(matched))
 
         sent = [r for r in results if r[2]]
         failed = [r for r in results if not r[2]]
@@ -0,0 +1,33 @@
+"""
+Page modules for ``analysis_app.py``.
+
+Each sidebar page lives in its own module and is imported only when selected, so a
+cold start (Individual Judge Analysis) does not load scipy, the ranking pipelines or
+plotting code that only other pages use.
+"""
+
+import importlib
+
+# Sidebar label → (module, render function). Order is the sidebar order.
+PAGE_MODULES = {
+    "Individual Judge Analysis": ("analysis_pages.individual_judge", "individual_judge_analysis_page"),
+    "Cross-Judge Benchmarking": ("analysis_pages.cross_judge", "cross_judge_benchmarking_page"),
+    "PCS Quality Analysis": ("analysis_pages.pcs_quality", "pcs_quality_analysis_page"),
+    "PCS Deviation Analysis": ("analysis_pages.pcs_deviation", "pcs_deviation_analysis_page"),
+    "Element Deviation Ranking Analysis": ("analysis_pages.element_ranking", "element_deviation_ranking_page"),
+    "Temporal Trend Analysis": ("analysis_pages.temporal", "temporal_trend_analysis_page"),
+    "Panel size benchmarks": ("analysis_pages.panel_size", "panel_size_benchmarks_page"),
+    "Rule Errors Analysis": ("analysis_pages.rule_errors", "rule_errors_analysis_page"),
+    "Competition Analysis": ("analysis_pages.competition", "competition_analysis_page"),
+    "Load Competition": ("analysis_pages.load_competition", "load_competition_page"),
+}
+
+
+def render_page(page: str) -> bool:
+    """Import and render ``page``; returns False when the label is unknown."""
+    entry = PAGE_MODULES.get(page)
+    if entry is None:
+        return False
+    module_name, func_name = entry
+    getattr(importlib.import_module(module_name), func_name)()
+    return True
@@ -0,0 +1,79 @@
+"""
+Helpers shared by several analysis pages (scope labels, downloads, identity selects).
+
+Kept free of heavy imports so the landing page does not pay for other pages' dependencies.
+"""
+
+import os
+
+import streamlit as st
+
+from officials_competition_types import (
+    COMPETITION_SCOPE_ALL,
+    COMPETITION_SCOPE_CHAMPIONSHIPS_ONLY,
+    COMPETITION_SCOPE_INTERNATIONAL,
+    COMPETITION_SCOPE_NQS,
+    COMPETITION_SCOPE_QUALIFYING,
+    COMPETITION_SCOPE_SECTIONALS_AND_CHAMPIONSHIPS,
+)
+
+# Paths relative to the repo root so cwd does not hide "Load Competition".
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DOWNLOAD_RESULTS_PY = os.path.join(REPO_ROOT, "downloadResults.py")
+
+COMPETITION_SCOPE_LABELS = (
+    "All competitions",
+    "Qualifying only",
+    "NQS only",
+    "Sectionals & championships",
+    "Championships only",
+    "International",
+)
+
+COMPETITION_SCOPE_LABEL_TO_KEY = {
+    "All competitions": COMPETITION_SCOPE_ALL,
+    "Qualifying only": COMPETITION_SCOPE_QUALIFYING,
+    "NQS only": COMPETITION_SCOPE_NQS,
+    "Sectionals & championships": COMPETITION_SCOPE_SECTIONALS_AND_CHAMPIONSHIPS,
+    "Championships only": COMPETITION_SCOPE_CHAMPIONSHIPS_ONLY,
+    "International": COMPETITION_SCOPE_INTERNATIONAL,
+}
+
+
+def competition_scope_key(scope_label: str) -> str:
+    """Map sidebar label to analytics ``competition_scope`` string."""
+    return COMPETITION_SCOPE_LABEL_TO_KEY.get(scope_label, COMPETITION_SCOPE_ALL)
+
+
+def streamlit_download(
+    label: str,
+    *,
+    data: bytes,
+    file_name: str,
+    mime: str,
+    key: str,
+) -> None:
+    """Download without app rerun (avoids races with URL sync and large reports)."""
+    st.download_button(
+        label=label,
+        data=data,
+        file_name=file_name,
+        mime=mime,
+        key=key,
+        on_click="ignore",
+    )
+
+
+def competition_results_index_url(results_url: str | None) -> str | None:
+    """USFS/IJS results page URL for links (see ``ijs_results_urls.results_page_url``)."""
+    from ijs_results_urls import results_page_url
+
+    return results_page_url(results_url)
+
+
+def identity_group_options(analytics):
+    """Labels and judge-id lists for selects; merges aliases sharing one directory official."""
+    groups = analytics.get_judge_analysis_identity_groups()
+    labels = [g["label"] for g in groups]
+    label_to_ids = {g["label"]: g["judge_ids"] for g in groups}
+    return labels, label_to_ids
@@ -0,0 +1,626 @@
+"""
+Competition Analysis page.
+"""
+
+import streamlit as st
+import pandas as pd
+from analytics_connection import (
+    get_analytics_safe,
+    isolated_analytics_session,
+)
+from models import (
+    Competition,
+    Segment,
+    DisciplineType,
+    Judge,
+    PcsScorePerJudge,
+    ElementScorePerJudge,
+    Element,
+    SkaterSegment,
+)
+from sqlalchemy import (
+    func,
+    case,
+)
+from analysis_pages.common import competition_results_index_url
+
+
+@st.cache_data(ttl=300)
+def _cached_competition_segment_officials(competition_id: int):
+    with isolated_analytics_session() as analytics:
+        return analytics.get_competition_segment_officials_display(competition_id)
+
+
+def _streamlit_safe_judge_pivot_display(grid: pd.DataFrame) -> pd.DataFrame:
+    """
+    Judge × segment pivot tables used to mix int counts with '' after replacing zeros,
+    which breaks PyArrow when Streamlit serializes the dataframe (column names are judge names).
+    Normalize every cell to str: blank for zero / NA, else decimal digits only.
+    """
+    def cell(v):
+        if pd.isna(v):
+            return ""
+        try:
+            iv = int(v)
+            return "" if iv == 0 else str(iv)
+        except (TypeError, ValueError):
+            s = str(v).strip()
+            return "" if s in ("", "0", "0.0") else s
+
+    return grid.apply(lambda col: col.map(cell))
+
+
+def _format_competition_event_dates(start, end) -> str | None:
+    if start is None and end is None:
+        return None
+    if start is not None and end is not None and start != end:
+        return f"{start.isoformat()} – {end.isoformat()}"
+    d = start if start is not None else end
+    return d.isoformat() if d is not None else None
+
+
+def _render_competition_analysis_header(comp: Competition) -> None:
+    """Dates, location, and results link when present in the database."""
+    meta: list[str] = []
+    dates = _format_competition_event_dates(comp.start_date, comp.end_date)
+    if dates:
+        meta.append(dates)
+    location = (comp.location or "").strip()
+    if location:
+        meta.append(location)
+    if meta:
+        st.markdown(" · ".join(meta))
+    results_href = competition_results_index_url(comp.results_url)
+    if results_href:
+        st.markdown(f"[Competition results]({results_href})")
+
+
+def competition_analysis_page() -> None:
+    st.header("Competition Analysis")
+
+    # Competition selection
+    analytics = get_analytics_safe()
+    competitions = analytics.get_competitions()
+    if not competitions:
+        st.error("No competitions found in database")
+        st.stop()
+
+    competition_options = {
+        f"{name} ({year})": comp_id
+        for comp_id, name, year in competitions
+    }
+    selected_competition = st.selectbox(
+        "Select Competition",
+        list(competition_options.keys()),
+        key="competition_analysis_select",
+    )
+
+    if selected_competition:
+        competition_id = competition_options[selected_competition]
+        st.session_state["competition_analysis_id"] = competition_id
+
+        comp = analytics.session.get(Competition, competition_id)
+        if comp is not None:
+            st.subheader(comp.name)
+            _render_competition_analysis_header(comp)
+
+        st.subheader("Competition officials")
+        st.caption(
+            "One row per official per discipline. Roles lists distinct appointments/protocol roles "
+            "for that segment category only (directory appointment names when linked, else short IJS-style labels)."
+        )
+        with st.spinner("Loading officials..."):
+            officials_df = _cached_competition_segment_officials(competition_id)
+        if officials_df.empty:
+            st.info(
+                "No segment_official rows for this competition. "
+                "Import or backfill protocol panel data to populate this list."
+            )
+        else:
+            display_off = (
+                officials_df[
+                    ["official", "mbr_number", "discipline", "panel_roles"]
+                ]
+                .rename(
+                    columns={
+                        "official": "Official",
+                        "mbr_number": "Member #",
+                        "discipline": "Discipline",
+                        "panel_roles": "Roles",
+                    }
+                )
+            )
+            st.dataframe(
+                display_off,
+                width="stretch",
+                hide_index=True,
+                column_config={
+                    "Official": st.column_config.TextColumn(
+                        "Official",
+                        width="medium",
+                    ),
+                    "Member #": st.column_config.TextColumn(
+                        "Member #",
+                        width="small",
+                    ),
+                    "Discipline": st.column_config.TextColumn(
+                        "Discipline",
+                        width="small",
+                        help="Segment discipline_type (e.g. Singles, Pairs).",
+                    ),
+                    "Roles": st.column_config.TextColumn(
+                        "Roles",
+                        width="large",
+                        help="Distinct roles this official held in this discipline at this competition.",
+                    ),
+                },
+            )
+
+        # Get segment statistics for all judges in this competition efficiently
+        with st.spinner("Loading competition data..."):
+            segment_stats = st.cache_data(
+                analytics.get_competition_segment_statistics,
+                ttl=300  # Cache for 5 minutes
+            )(competition_id)
+
+        if segment_stats.empty:
+            st.warning("No segment statistics found for this competition")
+        else:
+            # Calculate allowed errors function
+            def calculate_allowed_errors(skater_count):
+                if skater_count <= 10:
+                    return 1
+                elif skater_count <= 20:
+                    return 2
+                else:
+                    return 3
+
+            # Build the judge-segment grid
+            st.subheader(f"Judge Performance Grid - {selected_competition}")
+            # Calculate allowed and excess anomalies
+            segment_stats['allowed_errors'] = segment_stats['skater_count'].apply(calculate_allowed_errors)
+            segment_stats['excess_anomalies'] = (segment_stats['total_anomalies'] - segment_stats['allowed_errors']).apply(lambda x: max(0, x))
+
+            # Create the main grid showing total anomalies
+            anomalies_grid = segment_stats.pivot_table(
+                index=['discipline', 'segment_name'],
+                columns='judge_name',
+                values='total_anomalies',
+                fill_value=0,
+                aggfunc='sum'
+            )
+
+            # Create grid for excess anomalies
+            excess_grid = segment_stats.pivot_table(
+                index=['discipline', 'segment_name'],
+                columns='judge_name',
+                values='excess_anomalies',
+                fill_value=0,
+                aggfunc='sum'
+            )
+
+            # Blank cells for zeros; all-string cells so PyArrow can serialize judge columns
+            anomalies_grid_display = _streamlit_safe_judge_pivot_display(anomalies_grid)
+            excess_grid_display = _streamlit_safe_judge_pivot_display(excess_grid)
+
+            # Display total anomalies grid
+            st.subheader("Total Anomalies by Judge and Segment")
+            if not anomalies_grid.empty:
+                st.dataframe(anomalies_grid_display, width="stretch")
+
+                # Add judge totals for total anomalies
+                st.subheader("Judge Totals - Total Anomalies")
+                judge_totals_anomalies = anomalies_grid.sum().sort_values(ascending=False)
+                judge_totals_df_anomalies = pd.DataFrame({
+                    'Judge': judge_totals_anomalies.index,
+                    'Total Anomalies': judge_totals_anomalies.values
+                })
+                st.dataframe(judge_totals_df_anomalies, width="stretch")
+            else:
+                st.info("No anomalies data available for grid display")
+
+            # Display excess anomalies grid
+            st.subheader("Excess Anomalies by Judge and Segment")
+            if not excess_grid.empty:
+                st.dataframe(excess_grid_display, width="stretch")
+
+                # Add judge totals for excess anomalies
+                st.subheader("Judge Totals - Excess Anomalies")
+                judge_totals_excess = excess_grid.sum().sort_values(ascending=False)
+                judge_totals_df_excess = pd.DataFrame({
+                    'Judge': judge_totals_excess.index,
+                    'Total Excess Anomalies': judge_totals_excess.values
+                })
+                st.dataframe(judge_totals_df_excess, width="stretch")
+            else:
+                st.info("No excess anomalies data available for grid display")
+
+            # Rule Errors Summary and List
+            st.subheader("Rule Errors Analysis")
+            with st.spinner("Loading rule errors data..."):
+                rule_errors_df = analytics.get_all_rule_errors(
+                    competition_ids=[competition_id]
+                )
+
+            if not rule_errors_df.empty:
+                # Rule errors summary
+                col1, col2, col3 = st.columns(3)
+
+                with col1:
+                    total_rule_errors = len(rule_errors_df)
+                    st.metric("Total Rule Errors", total_rule_errors)
+
+                with col2:
+                    pcs_rule_errors = len(rule_errors_df[rule_errors_df['element_name'] == ''])
+                    st.metric("PCS Rule Errors", pcs_rule_errors)
+
+                with col3:
+                    element_rule_errors = len(rule_errors_df[rule_errors_df['element_name'] != ''])
+                    st.metric("Element Rule Errors", element_rule_errors)
+
+                # Judge breakdown
+                rule_error_judge_summary = rule_errors_df.groupby('judge_name').size().sort_values(ascending=False)
+                st.subheader("Rule Errors by Judge")
+                judge_rule_error_df = pd.DataFrame({
+                    'Judge': rule_error_judge_summary.index,
+                    'Rule Errors': rule_error_judge_summary.values
+                })
+                st.dataframe(judge_rule_error_df, width="stretch")
+
+                # Detailed rule errors table
+                st.subheader("Detailed Rule Errors")
+                display_rule_errors = rule_errors_df[[
+                    'judge_name', 'segment_name', 'discipline_name', 'skater_name',
+                    'element_name', 'element_type', 'element_notes', 'max_goe_allowed',
+                    'judge_score', 'panel_average', 'deviation'
+                ]].copy()
+
+                # Add a score type column based on whether element_name is empty
+                display_rule_errors['score_type'] = display_rule_errors['element_name'].apply(
+                    lambda x: 'PCS' if x == '' else 'Element'
+                )
+
+                # Fill NaN values for better display
+                display_rule_errors['element_name'] = display_rule_errors['element_name'].fillna('N/A')
+                display_rule_errors['element_type'] = display_rule_errors['element_type'].fillna('N/A')
+
+                # Reorder columns to include score_type
+                display_rule_errors = display_rule_errors[[
+                    'judge_name', 'segment_name', 'discipline_name', 'skater_name',
+                    'score_type', 'element_name', 'element_type',
+                    'element_notes', 'max_goe_allowed',
+                    'judge_score', 'panel_average', 'deviation'
+                ]]
+
+                display_rule_errors.columns = [
+                    'Judge', 'Segment', 'Discipline', 'Skater', 'Score Type',
+                    'Element Name', 'Element Type', 'Element Notes', 'Max GOE Allowed',
+                    'Judge Score', 'Panel Average', 'Deviation'
+                ]
+
+                st.dataframe(display_rule_errors, width="stretch")
+            else:
+                st.info("No rule errors found for this competition")
+
+            # Anomalies Analysis
+            st.subheader("Anomalies Analysis")
+
+            # Get all judges for this competition from segment stats
+            competition_judges = [int(judge_id) for judge_id in segment_stats['judge_id'].unique()]
+
+            # Collect all anomalies data for this competition
+            with st.spinner("Loading anomalies data..."):
+                all_pcs_anomalies = []
+                all_element_anomalies = []
+
+                # Get judge names mapping
+                judges = analytics.get_judges()
+                judge_names = {judge_id: judge_name for judge_id, judge_name, _ in judges}
+
+                for judge_id in competition_judges:
+                    # Get PCS anomalies for this judge and competition
+                    judge_pcs = analytics.get_judge_pcs_stats(
+                        judge_id, competition_ids=[competition_id]
+                    )
+                    if not judge_pcs.empty:
+                        pcs_anomalies = judge_pcs[judge_pcs['anomaly'] == True]
+                        if not pcs_anomalies.empty:
+                            pcs_anomalies = pcs_anomalies.copy()
+                            pcs_anomalies['judge_id'] = judge_id
+                            pcs_anomalies['judge_name'] = judge_names.get(judge_id, 'Unknown')
+                            all_pcs_anomalies.append(pcs_anomalies)
+
+                    # Get element anomalies for this judge and competition
+                    judge_elements = analytics.get_judge_element_stats(
+                        judge_id, competition_ids=[competition_id]
+                    )
+                    if not judge_elements.empty:
+                        element_anomalies = judge_elements[judge_elements['anomaly'] == True]
+                        if not element_anomalies.empty:
+                            element_anomalies = element_anomalies.copy()
+                            element_anomalies['judge_id'] = judge_id
+                            element_anomalies['judge_name'] = judge_names.get(judge_id, 'Unknown')
+                            all_element_anomalies.append(element_anomalies)
+
+                # Combine all anomalies
+                pcs_anomalies_df = pd.concat(all_pcs_anomalies, ignore_index=True) if all_pcs_anomalies else pd.DataFrame()
+                element_anomalies_df = pd.concat(all_element_anomalies, ignore_index=True) if all_element_anomalies else pd.DataFrame()
+
+            if not pcs_anomalies_df.empty or not element_anomalies_df.empty:
+
+                # Display PCS anomalies
+                if not pcs_anomalies_df.empty:
+                    st.subheader("PCS Anomalies")
+
+                    # Filter PCS data based on issue types
+                    filtered_pcs = pcs_anomalies_df.copy()
+
+                    if not filtered_pcs.empty:
+                        def get_issue_type_pcs(row):
+                            issues = []
+                            if row['anomaly'] and abs(row['deviation']) >= 1.5:
+                                direction = 'High' if row['deviation'] > 0 else 'Low'
+                                issues.append(f'Anomaly ({direction})')
+                            if row['is_rule_error']:
+                                issues.append('Rule Error')
+                            return ', '.join(issues)
+
+                        filtered_pcs['issue_type'] = filtered_pcs.apply(get_issue_type_pcs, axis=1)
+
+                        display_pcs_anomalies = filtered_pcs[[
+                            'judge_name', 'segment_name', 'discipline_name', 'skater_name',
+                            'pcs_type_name', 'judge_score', 'panel_average', 'deviation', 'issue_type'
+                        ]].copy()
+
+                        display_pcs_anomalies.columns = [
+                            'Judge', 'Segment', 'Discipline', 'Skater', 'PCS Component',
+                            'Judge Score', 'Panel Average', 'Deviation', 'Issue Type'
+                        ]
+
+                        st.dataframe(display_pcs_anomalies, width="stretch")
+                    else:
+                        st.info("No PCS anomalies match the selected filters")
+
+                # Display element anomalies
+                if not element_anomalies_df.empty:
+                    st.subheader("Element Anomalies")
+
+                    # Filter element data based on issue types
+                    filtered_elements = element_anomalies_df.copy()
+
+                    if not filtered_elements.empty:
+                        def get_issue_type_elem(row):
+                            issues = []
+                            if row['anomaly'] and abs(row['deviation']) >= 2.0:
+                                direction = 'High' if row['deviation'] > 0 else 'Low'
+                                issues.append(f'Anomaly ({direction})')
+                            if row['is_rule_error']:
+                                issues.append('Rule Error')
+                            return ', '.join(issues)
+
+                        filtered_elements['issue_type'] = filtered_elements.apply(get_issue_type_elem, axis=1)
+
+                        display_element_anomalies = filtered_elements[[
+                            'judge_name', 'segment_name', 'discipline_name', 'skater_name',
+                            'element_name', 'element_type_name', 'judge_score', 'panel_average', 'deviation', 'issue_type'
+                        ]].copy()
+
+                        display_element_anomalies.columns = [
+                            'Judge', 'Segment', 'Discipline', 'Skater', 'Element Name',
+                            'Element Type', 'Judge Score', 'Panel Average', 'Deviation', 'Issue Type'
+                        ]
+
+                        st.dataframe(display_element_anomalies, width="stretch")
+                    else:
+                        st.info("No element anomalies match the selected filters")
+            else:
+                st.info("No anomalies found for this competition")
+
+        # Judge Performance Summary Table
+        st.markdown("---")
+        st.subheader("Judge Performance Summary")
+        st.markdown("Throwout and anomaly rates for all judges at this competition")
+        
+        with st.spinner("Calculating judge performance metrics..."):
+            # Get all segments for this competition
+            segments = analytics.session.query(
+                Segment.id, Segment.name, DisciplineType.name.label('discipline')
+            ).join(
+                DisciplineType, Segment.discipline_type_id == DisciplineType.id
+            ).filter(
+                Segment.competition_id == competition_id
+            ).all()
+            
+            segment_ids = [s.id for s in segments]
+            segment_info = {s.id: {'name': s.name, 'discipline': s.discipline} for s in segments}
+            
+            if segment_ids:
+                # Calculate PCS stats per judge with high/low breakdown
+                from sqlalchemy import and_
+                pcs_stats = analytics.session.query(
+                    PcsScorePerJudge.judge_id,
+                    Judge.name.label('judge_name'),
+                    func.count().label('total_pcs'),
+                    func.sum(case((PcsScorePerJudge.thrown_out, 1), else_=0)).label('pcs_throwouts'),
+                    func.sum(case((and_(PcsScorePerJudge.thrown_out, PcsScorePerJudge.deviation > 0), 1), else_=0)).label('pcs_throwouts_high'),
+                    func.sum(case((and_(PcsScorePerJudge.thrown_out, PcsScorePerJudge.deviation < 0), 1), else_=0)).label('pcs_throwouts_low'),
+                    func.sum(case((func.abs(PcsScorePerJudge.deviation) >= 1.5, 1), else_=0)).label('pcs_anomalies'),
+                    func.sum(case((PcsScorePerJudge.deviation >= 1.5, 1), else_=0)).label('pcs_anomalies_high'),
+                    func.sum(case((PcsScorePerJudge.deviation <= -1.5, 1), else_=0)).label('pcs_anomalies_low'),
+                    func.sum(case((PcsScorePerJudge.is_rule_error, 1), else_=0)).label('pcs_rule_errors')
+                ).join(
+                    Judge, PcsScorePerJudge.judge_id == Judge.id
+                ).join(
+                    SkaterSegment, PcsScorePerJudge.skater_segment_id == SkaterSegment.id
+                ).filter(
+                    SkaterSegment.segment_id.in_(segment_ids)
+                ).group_by(
+                    PcsScorePerJudge.judge_id, Judge.name
+                ).all()
+                
+                # Calculate element stats per judge with high/low breakdown
+                element_stats = analytics.session.query(
+                    ElementScorePerJudge.judge_id,
+                    Judge.name.label('judge_name'),
+                    func.count().label('total_elements'),
+                    func.sum(case((ElementScorePerJudge.thrown_out, 1), else_=0)).label('element_throwouts'),
+                    func.sum(case((and_(ElementScorePerJudge.thrown_out, ElementScorePerJudge.deviation > 0), 1), else_=0)).label('element_throwouts_high'),
+                    func.sum(case((and_(ElementScorePerJudge.thrown_out, ElementScorePerJudge.deviation < 0), 1), else_=0)).label('element_throwouts_low'),
+                    func.sum(case((func.abs(ElementScorePerJudge.deviation) >= 2.0, 1), else_=0)).label('element_anomalies'),
+                    func.sum(case((ElementScorePerJudge.deviation >= 2.0, 1), else_=0)).label('element_anomalies_high'),
+                    func.sum(case((ElementScorePerJudge.deviation <= -2.0, 1), else_=0)).label('element_anomalies_low'),
+                    func.sum(case((ElementScorePerJudge.is_rule_error, 1), else_=0)).label('element_rule_errors')
+                ).join(
+                    Judge, ElementScorePerJudge.judge_id == Judge.id
+                ).join(
+                    Element, ElementScorePerJudge.element_id == Element.id
+                ).join(
+                    SkaterSegment, Element.skater_segment_id == SkaterSegment.id
+                ).filter(
+                    SkaterSegment.segment_id.in_(segment_ids)
+                ).group_by(
+                    ElementScorePerJudge.judge_id, Judge.name
+                ).all()
+                
+                # Combine into summary
+                pcs_dict = {s.judge_id: s for s in pcs_stats}
+                elem_dict = {s.judge_id: s for s in element_stats}
+                all_judge_ids = set(pcs_dict.keys()) | set(elem_dict.keys())
+                
+                summary_rows = []
+                for judge_id in all_judge_ids:
+                    pcs = pcs_dict.get(judge_id)
+                    elem = elem_dict.get(judge_id)
+                    
+                    judge_name = pcs.judge_name if pcs else elem.judge_name
+                    
+                    total_pcs = pcs.total_pcs if pcs else 0
+                    pcs_throwouts = pcs.pcs_throwouts if pcs else 0
+                    pcs_throwouts_high = pcs.pcs_throwouts_high if pcs else 0
+                    pcs_throwouts_low = pcs.pcs_throwouts_low if pcs else 0
+                    pcs_anomalies = pcs.pcs_anomalies if pcs else 0
+                    pcs_anomalies_high = pcs.pcs_anomalies_high if pcs else 0
+                    pcs_anomalies_low = pcs.pcs_anomalies_low if pcs else 0
+                    
+                    total_elements = elem.total_elements if elem else 0
+                    elem_throwouts = elem.element_throwouts if elem else 0
+                    elem_throwouts_high = elem.element_throwouts_high if elem else 0
+                    elem_throwouts_low = elem.element_throwouts_low if elem else 0
+                    elem_anomalies = elem.element_anomalies if elem else 0
+                    elem_anomalies_high = elem.element_anomalies_high if elem else 0
+                    elem_anomalies_low = elem.element_anomalies_low if elem else 0
+                    
+                    summary_rows.append({
+                        'Judge': judge_name,
+                        'PCS Scores': total_pcs,
+                        'PCS Throw %': round(pcs_throwouts / total_pcs * 100, 2) if total_pcs > 0 else 0,
+                        'PCS Throw High %': round(pcs_throwouts_high / total_pcs * 100, 2) if total_pcs > 0 else 0,
+                        'PCS Throw Low %': round(pcs_throwouts_low / total_pcs * 100, 2) if total_pcs > 0 else 0,
+                        'PCS Anom %': round(pcs_anomalies / total_pcs * 100, 2) if total_pcs > 0 else 0,
+                        'PCS Anom High %': round(pcs_anomalies_high / total_pcs * 100, 2) if total_pcs > 0 else 0,
+                        'PCS Anom Low %': round(pcs_anomalies_low / total_pcs * 100, 2) if total_pcs > 0 else 0,
+                        'Elem Scores': total_elements,
+                        'Elem Throw %': round(elem_throwouts / total_elements * 100, 2) if total_elements > 0 else 0,
+                        'Elem Throw High %': round(elem_throwouts_high / total_elements * 100, 2) if total_elements > 0 else 0,
+                        'Elem Throw Low %': round(elem_throwouts_low / total_elements * 100, 2) if total_elements > 0 else 0,
+                        'Elem Anom %': round(elem_anomalies / total_elements * 100, 2) if total_elements > 0 else 0,
+                        'Elem Anom High %': round(elem_anomalies_high / total_elements * 100, 2) if total_elements > 0 else 0,
+                        'Elem Anom Low %': round(elem_anomalies_low / total_elements * 100, 2) if total_elements > 0 else 0
+                    })
+                
+                if summary_rows:
+                    summary_df = pd.DataFrame(summary_rows)
+                    summary_df = summary_df.sort_values('PCS Throw %', ascending=False)
+                    st.dataframe(summary_df, width="stretch")
+                    
+                    # Per-segment breakdown toggle
+                    if st.checkbox("Show per-segment breakdown"):
+                        st.subheader("Judge Performance by Segment")
+                        
+                        for seg_id, seg_info in segment_info.items():
+                            with st.expander(f"{seg_info['discipline']} - {seg_info['name']}"):
+                                # PCS stats for this segment with high/low
+                                from sqlalchemy import and_
+                                seg_pcs = analytics.session.query(
+                                    Judge.name.label('judge_name'),
+                                    func.count().label('total'),
+                                    func.sum(case((and_(PcsScorePerJudge.thrown_out, PcsScorePerJudge.deviation > 0), 1), else_=0)).label('throw_high'),
+                                    func.sum(case((and_(PcsScorePerJudge.thrown_out, PcsScorePerJudge.deviation < 0), 1), else_=0)).label('throw_low'),
+                                    func.sum(case((PcsScorePerJudge.deviation >= 1.5, 1), else_=0)).label('anom_high'),
+                                    func.sum(case((PcsScorePerJudge.deviation <= -1.5, 1), else_=0)).label('anom_low')
+                                ).join(
+                                    Judge, PcsScorePerJudge.judge_id == Judge.id
+                                ).join(
+                                    SkaterSegment, PcsScorePerJudge.skater_segment_id == SkaterSegment.id
+                                ).filter(
+                                    SkaterSegment.segment_id == seg_id
+                                ).group_by(Judge.name).all()
+                                
+                                # Element stats for this segment with high/low
+                                seg_elem = analytics.session.query(
+                                    Judge.name.label('judge_name'),
+                                    func.count().label('total'),
+                                    func.sum(case((and_(ElementScorePerJudge.thrown_out, ElementScorePerJudge.deviation > 0), 1), else_=0)).label('throw_high'),
+                                    func.sum(case((and_(ElementScorePerJudge.thrown_out, ElementScorePerJudge.deviation < 0), 1), else_=0)).label('throw_low'),
+                                    func.sum(case((ElementScorePerJudge.deviation >= 2.0, 1), else_=0)).label('anom_high'),
+                                    func.sum(case((ElementScorePerJudge.deviation <= -2.0, 1), else_=0)).label('anom_low')
+                                ).join(
+                                    Judge, ElementScorePerJudge.judge_id == Judge.id
+                                ).join(
+                                    Element, ElementScorePerJudge.element_id == Element.id
+                                ).join(
+                                    SkaterSegment, Element.skater_segment_id == SkaterSegment.id
+                                ).filter(
+                                    SkaterSegment.segment_id == seg_id
+                                ).group_by(Judge.name).all()
+                                
+                                pcs_dict_seg = {r.judge_name: r for r in seg_pcs}
+                                elem_dict_seg = {r.judge_name: r for r in seg_elem}
+                                all_judges_seg = set(pcs_dict_seg.keys()) | set(elem_dict_seg.keys())
+                                
+                                seg_rows = []
+                                for jn in all_judges_seg:
+                                    p = pcs_dict_seg.get(jn)
+                                    e = elem_dict_seg.get(jn)
+                                    
+                                    pcs_total = p.total if p else 0
+                                    pcs_throw_h = p.throw_high if p else 0
+                                    pcs_throw_l = p.throw_low if p else 0
+                                    pcs_anom_h = p.anom_high if p else 0
+                                    pcs_anom_l = p.anom_low if p else 0
+                                    elem_total = e.total if e else 0
+                                    elem_throw_h = e.throw_high if e else 0
+                                    elem_throw_l = e.throw_low if e else 0
+                                    elem_anom_h = e.anom_high if e else 0
+                                    elem_anom_l = e.anom_low if e else 0
+                                    
+                                    pcs_throw_total = pcs_throw_h + pcs_throw_l
+                                    pcs_anom_total = pcs_anom_h + pcs_anom_l
+                                    elem_throw_total = elem_throw_h + elem_throw_l
+                                    elem_anom_total = elem_anom_h + elem_anom_l
+                                    
+                                    seg_rows.append({
+                                        'Judge': jn,
+                                        'PCS Scores': pcs_total,
+                                        'PCS Throw %': round(pcs_throw_total / pcs_total * 100, 2) if pcs_total > 0 else 0,
+                                        'PCS Throw High %': round(pcs_throw_h / pcs_total * 100, 2) if pcs_total > 0 else 0,
+                                        'PCS Throw Low %': round(pcs_throw_l / pcs_total * 100, 2) if pcs_total > 0 else 0,
+                                        'PCS Anom %': round(pcs_anom_total / pcs_total * 100, 2) if pcs_total > 0 else 0,
+                                        'PCS Anom High %': round(pcs_anom_h / pcs_total * 100, 2) if pcs_total > 0 else 0,
+                                        'PCS Anom Low %': round(pcs_anom_l / pcs_total * 100, 2) if pcs_total > 0 else 0,
+                                        'Elem Scores': elem_total,
+                                        'Elem Throw %': round(elem_throw_total / elem_total * 100, 2) if elem_total > 0 else 0,
+                                        'Elem Throw High %': round(elem_throw_h / elem_total * 100, 2) if elem_total > 0 else 0,
+                                        'Elem Throw Low %': round(elem_throw_l / elem_total * 100, 2) if elem_total > 0 else 0,
+                                        'Elem Anom %': round(elem_anom_total / elem_total * 100, 2) if elem_total > 0 else 0,
+                                        'Elem Anom High %': round(elem_anom_h / elem_total * 100, 2) if elem_total > 0 else 0,
+                                        'Elem Anom Low %': round(elem_anom_l / elem_total * 100, 2) if elem_total > 0 else 0
+                                    })
+                                
+                                if seg_rows:
+                                    seg_df = pd.DataFrame(seg_rows)
+                                    st.dataframe(seg_df, width="stretch")
+                else:
+                    st.info("No judge performance data available for this competition")
+            else:
+                st.info("No segments found for this competition")
@@ -0,0 +1,650 @@
+"""
+Cross-Judge Benchmarking page: pooled metrics and judge heatmaps from cross-judge shards.
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import numpy as np
+from scipy import stats
+from analytics_connection import (
+    get_analytics_safe,
+    isolated_analytics_session,
+    us_linked_identity_labels_for_ui,
+)
+from officials_competition_types import COMPETITION_SCOPE_ALL
+from analysis_pages.common import (
+    COMPETITION_SCOPE_LABELS,
+    competition_scope_key,
+)
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_pooled_cross_judge_metrics(
+    score_type: str,
+    year_filter,
+    competition_ids_tuple,
+    discipline_ids_tuple,
+    competition_scope: str,
+    event_start_iso: str | None,
+    event_end_iso: str | None,
+    include_excess: bool,
+):
+    from datetime import date as _date
+
+    with isolated_analytics_session() as analytics:
+        event_start = _date.fromisoformat(event_start_iso) if event_start_iso else None
+        event_end = _date.fromisoformat(event_end_iso) if event_end_iso else None
+        return analytics.get_pooled_cross_judge_metrics(
+            score_type=score_type,
+            year_filter=year_filter,
+            competition_ids=list(competition_ids_tuple) if competition_ids_tuple else None,
+            discipline_type_ids=list(discipline_ids_tuple) if discipline_ids_tuple else None,
+            competition_scope=competition_scope,
+            include_excess=include_excess,
+            event_start_date=event_start,
+            event_end_date=event_end,
+        )
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_cross_judge_heatmap_data(
+    metric: str,
+    score_type: str,
+    year_filter,
+    competition_ids_tuple,
+    discipline_ids_tuple,
+    competition_scope_key: str,
+    event_start_iso_key: str | None,
+    event_end_iso_key: str | None,
+):
+    from datetime import date as _date
+
+    with isolated_analytics_session() as analytics:
+        event_start = (
+            _date.fromisoformat(event_start_iso_key) if event_start_iso_key else None
+        )
+        event_end = _date.fromisoformat(event_end_iso_key) if event_end_iso_key else None
+        return analytics.get_judge_performance_heatmap_data(
+            metric=metric,
+            score_type=score_type,
+            year_filter=year_filter,
+            competition_ids=list(competition_ids_tuple) if competition_ids_tuple else None,
+            discipline_type_ids=list(discipline_ids_tuple) if discipline_ids_tuple else None,
+            competition_scope=competition_scope_key,
+            event_start_date=event_start,
+            event_end_date=event_end,
+        )
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_cross_judge_competition_heatmap(
+    metric: str,
+    score_type: str,
+    competition_scope_key: str,
+    event_start_iso_key: str | None,
+    event_end_iso_key: str | None,
+):
+    from datetime import date as _date
+
+    with isolated_analytics_session() as analytics:
+        event_start = (
+            _date.fromisoformat(event_start_iso_key) if event_start_iso_key else None
+        )
+        event_end = _date.fromisoformat(event_end_iso_key) if event_end_iso_key else None
+        return analytics.get_judge_competition_heatmap_data(
+            metric=metric,
+            score_type=score_type,
+            competition_scope=competition_scope_key,
+            event_start_date=event_start,
+            event_end_date=event_end,
+        )
+
+
+def _cross_judge_pooled_metrics_df(pm: dict, score_type: str) -> pd.DataFrame:
+    """Single-table display for score-weighted pooled benchmark metrics."""
+    rows = []
+    rows.append(("Total scores", pm["total_scores"]))
+    if score_type in ("both", "pcs"):
+        rows.append(("PCS scores (in pool)", pm["pcs_scores"]))
+    if score_type in ("both", "element"):
+        rows.append(("Element scores (in pool)", pm["element_scores"]))
+    rows.extend(
+        [
+            ("Throwouts (count)", pm["throwouts"]),
+            ("Throwout rate (%)", round(pm["throwout_rate_pct"], 4)),
+            ("Anomalies (count)", pm["anomalies"]),
+            ("Anomaly rate (%)", round(pm["anomaly_rate_pct"], 4)),
+            ("Rule errors (count)", pm["rule_errors"]),
+            ("Rule error rate (%)", round(pm["rule_error_rate_pct"], 4)),
+            ("Mean |deviation| per score", round(pm["avg_abs_deviation"], 6)),
+        ]
+    )
+    if "total_excess_anomalies" in pm:
+        rows.append(
+            (
+                "Total excess anomalies (summed across judges)",
+                pm["total_excess_anomalies"],
+            )
+        )
+    return pd.DataFrame(rows, columns=["Metric", "Value"])
+
+
+def _render_pooled_benchmark_block(pm: dict, score_type: str) -> None:
+    st.subheader("Pooled metrics (score-weighted)")
+    st.caption(
+        "Rates use total counts divided by total PCS/element scores in scope — "
+        "each score counts equally (judges with more segments weigh more)."
+    )
+    st.dataframe(
+        _cross_judge_pooled_metrics_df(pm, score_type),
+        width="stretch",
+        hide_index=True,
+    )
+
+
+def _heatmap_metric_distribution_summary(series: pd.Series, count_label: str) -> pd.DataFrame:
+    """Descriptive stats for the metric column in cross-judge views."""
+    s = pd.to_numeric(series, errors="coerce").dropna()
+    if s.empty:
+        return pd.DataFrame()
+    std = float(s.std(ddof=1)) if len(s) > 1 else 0.0
+    rows = [
+        (count_label, int(len(s))),
+        ("Mean", round(float(s.mean()), 4)),
+        ("Median", round(float(s.median()), 4)),
+        ("Std dev", round(std, 4)),
+        ("Min", round(float(s.min()), 4)),
+        ("Max", round(float(s.max()), 4)),
+        ("25th percentile", round(float(s.quantile(0.25)), 4)),
+        ("75th percentile", round(float(s.quantile(0.75)), 4)),
+    ]
+    return pd.DataFrame(rows, columns=["Statistic", "Value"])
+
+
+def _plot_summary_normal_curve(values: pd.Series, metric_label: str) -> None:
+    """Normal curve N(sample mean, sample SD) with σ markers and observation rug."""
+    s = pd.to_numeric(values, errors="coerce").dropna()
+    if s.empty:
+        return
+
+    n = int(len(s))
+    mu = float(s.mean())
+    sigma = float(s.std(ddof=1)) if n > 1 else 0.0
+    ymax_ref = 1.0
+
+    fig = go.Figure()
+
+    if n < 2 or sigma <= 0:
+        fig.add_trace(
+            go.Scatter(
+                x=s.values,
+                y=np.zeros(n),
+                mode="markers",
+                marker=dict(size=10, color="#c0392b"),
+                name="Values",
+            )
+        )
+        fig.update_layout(
+            title=f"{metric_label}: single value or zero spread — no Gaussian fit (n={n})",
+            xaxis_title=metric_label,
+            yaxis=dict(showticklabels=False, showgrid=False, zeroline=False),
+            showlegend=False,
+        )
+        st.plotly_chart(fig, width="stretch")
+        return
+
+    lo = min(float(s.min()), mu - 3.6 * sigma)
+    hi = max(float(s.max()), mu + 3.6 * sigma)
+    xs = np.linspace(lo, hi, 500)
+    ys = stats.norm.pdf(xs, mu, sigma)
+    ymax_ref = float(np.max(ys))
+
+    fig.add_trace(
+        go.Scatter(
+            x=xs,
+            y=ys,
+            mode="lines",
+            name="Normal N(μ̂, σ̂)",
+            fill="tozeroy",
+            fillcolor="rgba(192, 57, 43, 0.14)",
+            line=dict(color="#c0392b", width=2.4),
+            hovertemplate="x=%{x:.4g}<br>density=%{y:.5g}<extra></extra>",
+        )
+    )
+
+    # Mean and ±1σ … ±3σ vertical guides (in σ units from μ)
+    sigma_styles = [
+        (0, "solid", "#2c3e50", 2.6, "μ (mean)"),
+        (1, "dot", "#2980b9", 1.35, None),
+        (2, "dash", "#8e44ad", 1.0, None),
+        (3, "dash", "#7f8c8d", 0.75, None),
+    ]
+    for k, dash, color, width, label in sigma_styles:
+        if k == 0:
+            fig.add_shape(
+                type="line",
+                x0=mu,
+                x1=mu,
+                y0=0,
+                y1=ymax_ref * 1.08,
+                line=dict(color=color, width=width, dash=dash),
+            )
+            fig.add_annotation(
+                x=mu,
+                y=ymax_ref * 1.06,
+                text=label,
+                showarrow=False,
+                font=dict(size=11, color=color),
+                yshift=0,
+            )
+        else:
+            for sign in (-1, 1):
+                xv = mu + sign * k * sigma
+                fig.add_shape(
+                    type="line",
+                    x0=xv,
+                    x1=xv,
+                    y0=0,
+                    y1=ymax_ref * 1.02,
+                    line=dict(color=color, width=width, dash=dash),
+                )
+                fig.add_annotation(
+                    x=xv,
+                    y=ymax_ref * (1.02 + 0.05 * (4 - k)),
+                    text=f"{sign * k:+d}σ",
+                    showarrow=False,
+                    font=dict(size=10, color=color),
+                )
+
+    # Rug: actual observations along the x-axis
+    rug_y = -0.06 * ymax_ref
+    fig.add_trace(
+        go.Scatter(
+            x=s.values,
+            y=np.full(n, rug_y),
+            mode="markers",
+            marker=dict(
+                symbol="line-ns-open",
+                line=dict(width=1.5, color="rgba(44, 62, 80, 0.55)"),
+                size=14,
+            ),
+            name="Observations",
+        )
+    )
+
+    z_min = (float(s.min()) - mu) / sigma
+    z_max = (float(s.max()) - mu) / sigma
+    z_med = (float(s.median()) - mu) / sigma
+
+    fig.update_layout(
+        title=f"Normal approximation — {metric_label} "
+        f"(μ̂={mu:.4g}, σ̂={sigma:.4g}, n={n})",
+        xaxis_title=metric_label,
+        yaxis_title="Probability density",
+        yaxis=dict(range=[rug_y * 2.2, ymax_ref * 1.22]),
+        showlegend=True,
+        legend=dict(yanchor="top", y=0.99, xanchor="right", x=0.99),
+        margin=dict(t=56),
+    )
+
+    st.plotly_chart(fig, width="stretch")
+    st.caption(
+        f"Curve uses the sample mean and sample standard deviation of the values in this view. "
+        f"Vertical marks show the mean (μ) and ±1σ … ±3σ. Distance from mean in σ: "
+        f"min ≈ {z_min:+.2f}, median ≈ {z_med:+.2f}, max ≈ {z_max:+.2f}."
+    )
+
+
+def cross_judge_benchmarking_page() -> None:
+    """Cross-judge metrics: judge-level bars or judge×competition matrix."""
+    st.header("Cross-judge benchmarking")
+    st.caption(
+        "Compare judges using the same metric definitions as elsewhere in this app. "
+        "Judges linked to the same directory official in **Admin → Judge ↔ directory matcher** "
+        "are combined into one row (same as Individual Judge Analysis). "
+        "Average deviation uses absolute panel mean deviation per judge "
+        "(PCS and elements combined with score-weighted averaging when both are selected). "
+        "Optional competition scope filters linked officials types on each competition. "
+        "When any scope other than all competitions is selected, discipline filters use "
+        "Singles / Pairs / Ice Dance / Synchronized only."
+    )
+
+    # Heatmap configuration
+    st.subheader("Configuration")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        heatmap_type = st.selectbox(
+            "View",
+            ["Judge Overview", "Judge vs Competition"],
+            key="cross_judge_view",
+        )
+
+    with col2:
+        metric = st.selectbox("Performance Metric", [
+            "throwout_rate", "anomaly_rate", "rule_error_rate", "avg_deviation", "excess_anomalies", "rule_errors"
+        ],
+                              key="cross_judge_metric",
+                              format_func=lambda x: {
+                                  "throwout_rate": "Throwout Rate (%)",
+                                  "anomaly_rate": "Anomaly Rate (%)",
+                                  "rule_error_rate": "Rule Error Rate (%)",
+                                  "avg_deviation": "Avg deviation (abs panel mean)",
+                                  "excess_anomalies": "Total Excess Anomalies",
+                                  "rule_errors": "Total Rule Errors"
+                              }[x])
+
+    with col3:
+        score_type = st.selectbox(
+            "Score Type",
+            ["both", "pcs", "element"],
+            key="cross_judge_score_type",
+            format_func=lambda x: {
+                                      "both": "Combined (PCS + Elements)",
+                                      "pcs": "PCS Only",
+                                      "element": "Elements Only"
+                                  }[x])
+
+    competition_scope_label = st.selectbox(
+        "Competition scope",
+        list(COMPETITION_SCOPE_LABELS),
+        index=0,
+        key="cross_judge_competition_scope",
+        help=(
+            "Qualifying: linked officials type is set and not id 11 (nonqualifying). "
+            "NQS: linked officials type id 10. "
+            "Sectionals & championships: types 1–9 (excludes NQS and nonqualifying). "
+            "Championships only: types 4 (US Championships) and 8 (US Synchro Championships)."
+        ),
+    )
+    competition_scope = competition_scope_key(competition_scope_label)
+
+    use_event_dates = st.checkbox(
+        "Filter by competition event dates",
+        key="cross_judge_use_event_dates",
+        help=(
+            "Uses each competition's start date when set, otherwise its end date. "
+            "Events with neither date are excluded when this filter is on."
+        ),
+    )
+    cross_event_start = None
+    cross_event_end = None
+    if use_event_dates:
+        analytics_dates = get_analytics_safe()
+        date_min, date_max = analytics_dates.get_competition_event_date_bounds(
+            competition_scope=competition_scope,
+        )
+        date_col1, date_col2 = st.columns(2)
+        with date_col1:
+            cross_event_start = st.date_input(
+                "Event on or after",
+                value=date_min,
+                min_value=date_min,
+                max_value=date_max,
+                key="cross_judge_start_date",
+            )
+        with date_col2:
+            cross_event_end = st.date_input(
+                "Event on or before",
+                value=date_max,
+                min_value=date_min,
+                max_value=date_max,
+                key="cross_judge_end_date",
+            )
+        if cross_event_start > cross_event_end:
+            st.warning("Start date is after end date; results may be empty.")
+
+    event_start_iso = (
+        cross_event_start.isoformat()
+        if use_event_dates and cross_event_start
+        else None
+    )
+    event_end_iso = (
+        cross_event_end.isoformat() if use_event_dates and cross_event_end else None
+    )
+
+    metric_names = {
+        "throwout_rate": "Throwout Rate (%)",
+        "anomaly_rate": "Anomaly Rate (%)",
+        "rule_error_rate": "Rule Error Rate (%)",
+        "avg_deviation": "Avg deviation (abs panel mean)",
+        "excess_anomalies": "Total Excess Anomalies",
+        "rule_errors": "Total Rule Errors"
+    }
+
+    us_officials_only = st.checkbox(
+        "US directory officials only",
+        key="cross_judge_us_officials_only",
+        help=(
+            "Charts and tables show only judges linked to a USFS official. "
+            "Pooled benchmarks still use the full judge pool."
+        ),
+    )
+
+    if heatmap_type == "Judge Overview":
+        # Filters for judge overview
+        st.subheader("Filters")
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            analytics = get_analytics_safe()
+            years = analytics.get_years()
+            year_filter = st.selectbox(
+                "Filter by Year",
+                ["All Years"] + years,
+                key="cross_judge_year",
+            )
+            year_filter = None if year_filter == "All Years" else year_filter
+
+        with col2:
+            competitions = analytics.get_competitions(
+                competition_scope=competition_scope,
+                event_start_date=cross_event_start if use_event_dates else None,
+                event_end_date=cross_event_end if use_event_dates else None,
+            )
+            competition_names = [
+                f"{name} ({year})" for comp_id, name, year in competitions
+            ]
+            selected_competitions = st.multiselect(
+                "Filter by Competitions",
+                competition_names,
+                key="cross_judge_competitions",
+            )
+            competition_ids = [
+                comp_id for comp_id, name, year in competitions
+                if f"{name} ({year})" in selected_competitions
+            ] if selected_competitions else None
+
+        with col3:
+            discipline_types = (
+                analytics.qualifying_event_segment_discipline_types()
+                if competition_scope != COMPETITION_SCOPE_ALL
+                else analytics.get_discipline_types()
+            )
+            discipline_names = [name for dt_id, name in discipline_types]
+            selected_disciplines = st.multiselect(
+                "Filter by Discipline Type",
+                discipline_names,
+                key="cross_judge_disciplines",
+            )
+            discipline_ids = [
+                dt_id for dt_id, name in discipline_types
+                if name in selected_disciplines
+            ] if selected_disciplines else None
+
+        comp_ids_tuple = tuple(competition_ids) if competition_ids else None
+        disc_ids_tuple = tuple(discipline_ids) if discipline_ids else None
+        include_excess = metric == "excess_anomalies"
+
+        with st.spinner("Loading data…"):
+            pm = _cached_pooled_cross_judge_metrics(
+                score_type,
+                year_filter,
+                comp_ids_tuple,
+                disc_ids_tuple,
+                competition_scope,
+                event_start_iso,
+                event_end_iso,
+                include_excess,
+            )
+            heatmap_df = _cached_cross_judge_heatmap_data(
+                metric,
+                score_type,
+                year_filter,
+                comp_ids_tuple,
+                disc_ids_tuple,
+                competition_scope,
+                event_start_iso,
+                event_end_iso,
+            )
+        _render_pooled_benchmark_block(pm, score_type)
+
+        if us_officials_only:
+            from judge_official_display_filter import filter_cross_judge_dataframe
+
+            n_before = len(heatmap_df)
+            heatmap_df = filter_cross_judge_dataframe(
+                heatmap_df, us_linked_identity_labels_for_ui()
+            )
+            if n_before and len(heatmap_df) < n_before:
+                st.caption(
+                    f"US officials display filter: **{len(heatmap_df)}** of {n_before} "
+                    "judges are linked to the USFS directory."
+                )
+
+        if heatmap_df.empty:
+            st.warning("No data found for selected filters")
+            return
+
+        # Sort by metric value for better visualization
+        heatmap_df_sorted = heatmap_df.sort_values('metric_value',
+                                                   ascending=True)
+
+        summary_df = _heatmap_metric_distribution_summary(
+            heatmap_df_sorted["metric_value"], "Judges (count)"
+        )
+        if not summary_df.empty:
+            st.subheader("Summary statistics")
+            st.dataframe(summary_df, width="stretch", hide_index=True)
+            _plot_summary_normal_curve(
+                heatmap_df_sorted["metric_value"], metric_names[metric]
+            )
+
+        fig = px.bar(
+            heatmap_df_sorted,
+            x='metric_value',
+            y='judge_name',
+            orientation='h',
+            title=
+            f"Judge overview: {metric_names[metric]} ({score_type.upper()})",
+            labels={
+                'metric_value': metric_names[metric],
+                'judge_name': 'Judge'
+            },
+            color='metric_value',
+            color_continuous_scale='Reds')
+
+        fig.update_layout(height=max(400, len(heatmap_df_sorted) * 25))
+        st.plotly_chart(fig, width="stretch")
+
+        # Show data table
+        st.subheader("Judge-level data")
+        display_df = heatmap_df_sorted[[
+            'judge_name', 'metric_value', 'total_scores'
+        ]].copy()
+        display_df.columns = [
+            'Judge', metric_names[metric], 'Total Scores'
+        ]
+        st.dataframe(display_df, width="stretch")
+
+    else:  # Judge vs Competition
+        include_excess = metric == "excess_anomalies"
+        with st.spinner("Loading judge vs competition data…"):
+            pm_jc = _cached_pooled_cross_judge_metrics(
+                score_type,
+                None,
+                None,
+                None,
+                competition_scope,
+                event_start_iso,
+                event_end_iso,
+                include_excess,
+            )
+            heatmap_df = _cached_cross_judge_competition_heatmap(
+                metric,
+                score_type,
+                competition_scope,
+                event_start_iso,
+                event_end_iso,
+            )
+        _render_pooled_benchmark_block(pm_jc, score_type)
+
+        if us_officials_only:
+            from judge_official_display_filter import filter_cross_judge_dataframe
+
+            analytics_jc = get_analytics_safe()
+            n_cells_before = len(heatmap_df)
+            n_judges_before = (
+                int(heatmap_df["judge_name"].nunique()) if not heatmap_df.empty else 0
+            )
+            heatmap_df = filter_cross_judge_dataframe(
+                heatmap_df, us_linked_identity_labels_for_ui()
+            )
+            n_judges_after = (
+                int(heatmap_df["judge_name"].nunique()) if not heatmap_df.empty else 0
+            )
+            if n_cells_before and n_judges_after < n_judges_before:
+                st.caption(
+                    f"US officials display filter: **{n_judges_after}** of {n_judges_before} "
+                    "judges are linked to the USFS directory."
+                )
+
+        if heatmap_df.empty:
+            st.warning("No data found for judge vs competition analysis")
+            return
+
+        summary_df = _heatmap_metric_distribution_summary(
+            heatmap_df["metric_value"], "Judge × competition cells (count)"
+        )
+        if not summary_df.empty:
+            st.subheader("Summary statistics")
+            st.dataframe(summary_df, width="stretch", hide_index=True)
+            _plot_summary_normal_curve(
+                heatmap_df["metric_value"], metric_names[metric]
+            )
+
+        # Create pivot table for heatmap
+        pivot_df = heatmap_df.pivot(index='judge_name',
+                                    columns='competition',
+                                    values='metric_value')
+
+        # Create heatmap
+        fig = px.imshow(
+            pivot_df.values,
+            x=pivot_df.columns,
+            y=pivot_df.index,
+            aspect='auto',
+            color_continuous_scale='Reds',
+            title=
+            f"Judge vs competition: {metric_names[metric]} ({score_type.upper()})"
+        )
+
+        fig.update_xaxes(side="bottom")
+        fig.update_layout(xaxis={'categoryorder': 'category ascending'},
+                          yaxis={'categoryorder': 'category ascending'},
+                          height=max(400,
+                                     len(pivot_df.index) * 25))
+
+        st.plotly_chart(fig, width="stretch")
+
+        # Show raw data
+        st.subheader("Cell-level data")
+        display_df = heatmap_df[[
+            'judge_name', 'competition', 'metric_value', 'total_scores'
+        ]].copy()
+        display_df.columns = [
+            'Judge', 'Competition', metric_names[metric], 'Total Scores'
+        ]
+        st.dataframe(display_df, width="stretch")
@@ -0,0 +1,1510 @@
+"""
+Element Deviation Ranking Analysis page (optionally computed in a subprocess job).
+"""
+
+import os
+import tempfile
+import time
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from database import get_database_url
+from analytics_connection import (
+    get_analytics_safe,
+    isolated_analytics_session,
+    run_with_isolated_analytics,
+    us_linked_identity_labels_for_ui,
+)
+from analytics import JudgeAnalytics
+from officials_competition_types import COMPETITION_SCOPE_ALL
+from element_deviation_ranking import (
+    FLOOR_SIGMA as _ELEM_RANK_FLOOR_SIGMA,
+    MIN_BIN_COUNT as _ELEM_RANK_MIN_BIN_COUNT,
+    MIN_ELEMENT_MARKING_EVENT_DATE,
+    apply_min_marks_to_ranking_result,
+    attach_judge_identities,
+    compute_judge_detail_for_identity,
+    control_scores_by_element,
+    ELEMENT_RANKING_LEVEL_FILTER_ALL,
+    ELEMENT_RANKING_LEVEL_FILTER_LABELS,
+    element_ranking_discipline_types,
+    element_ranking_discipline_names_for_scope,
+    filter_element_ranking_season_years,
+    unpack_element_ranking_run_params,
+    memory_efficient_mode,
+    benchmark_competition_scope,
+    benchmark_season_bounds,
+    run_params_compute_key,
+    run_params_ranking_compute_key,
+    run_params_same_sigma_and_ranking_scope,
+    uses_separate_benchmark_pool,
+    validate_element_ranking_scope,
+)
+from element_ranking_cache import (
+    collect_marks_for_run,
+    element_ranking_filter_kwargs,
+    element_ranking_scope_kwargs,
+    load_cached_rankings,
+    load_cached_sigma_params_for_run,
+    load_control_by_element_for_ranking_scope,
+    try_save_element_ranking_cache,
+)
+from element_deviation_ranking_job import (
+    cleanup_ranking_artifacts,
+    execute_element_deviation_rankings,
+    load_control_by_element,
+    load_ranking_params,
+    load_ranking_result,
+    rehydrate_packaged_ranking_result,
+    package_element_ranking_result,
+    read_ranking_error,
+    start_ranking_subprocess,
+    terminate_ranking_subprocess,
+)
+from analysis_pages.common import (
+    COMPETITION_SCOPE_LABELS,
+    COMPETITION_SCOPE_LABEL_TO_KEY,
+    competition_scope_key,
+    streamlit_download,
+)
+
+
+def _finalize_element_ranking_job() -> None:
+    """If a background ranking process finished, load or record its outcome."""
+    proc = st.session_state.get("element_ranking_proc")
+    if proc is None or proc.is_alive():
+        return
+
+    pickle_path = st.session_state.get("element_ranking_pickle_path")
+    exitcode = proc.exitcode
+    st.session_state.element_ranking_proc = None
+
+    if exitcode == 0 and pickle_path and os.path.isfile(pickle_path):
+        loaded = load_ranking_result(pickle_path)
+        rp = st.session_state.get("element_ranking_run_params")
+        if rp is not None:
+            loaded = run_with_isolated_analytics(
+                _enrich_ranking_result_for_drilldown,
+                rp,
+                loaded,
+            )
+        st.session_state.element_ranking_result = loaded
+        _persist_element_ranking_judge_summary_pool(
+            loaded, run_params=rp
+        )
+        st.session_state.element_ranking_status = "done"
+        st.session_state.pop("element_ranking_error_msg", None)
+        if rp is not None:
+
+            def _persist_ranking_cache(analytics, run_params, ranking_result):
+                return try_save_element_ranking_cache(
+                    analytics.session,
+                    analytics,
+                    run_params,
+                    ranking_result,
+                )
+
+            ok, err = run_with_isolated_analytics(
+                _persist_ranking_cache,
+                rp,
+                st.session_state.element_ranking_result,
+            )
+            if ok:
+                st.session_state.element_ranking_cache_saved = True
+            elif err:
+                st.session_state.element_ranking_cache_error = err
+    elif exitcode is not None and exitcode < 0:
+        st.session_state.element_ranking_status = "cancelled"
+        st.session_state.pop("element_ranking_result", None)
+    else:
+        st.session_state.element_ranking_status = "error"
+        st.session_state.pop("element_ranking_result", None)
+        err = read_ranking_error(pickle_path) if pickle_path else None
+        st.session_state.element_ranking_error_msg = (
+            err or f"Analysis process exited with code {exitcode}."
+        )
+
+    handle = st.session_state.get("element_ranking_proc")
+    params_path = getattr(handle, "params_path", None) if handle else None
+    cleanup_ranking_artifacts(pickle_path, params_path)
+    st.session_state.element_ranking_proc = None
+    st.session_state.element_ranking_pickle_path = None
+
+
+def _stop_element_ranking_process() -> None:
+    """Terminate child process and remove temp files without changing UI status."""
+    handle = st.session_state.get("element_ranking_proc")
+    terminate_ranking_subprocess(handle)
+    pickle_path = st.session_state.get("element_ranking_pickle_path")
+    params_path = getattr(handle, "params_path", None) if handle else None
+    cleanup_ranking_artifacts(pickle_path, params_path)
+    st.session_state.element_ranking_proc = None
+    st.session_state.element_ranking_pickle_path = None
+
+
+def _persist_element_ranking_judge_summary_pool(
+    result: dict | None,
+    *,
+    run_params: tuple | None = None,
+) -> None:
+    """Keep the unfiltered judge pool for minimum-marks re-filtering without a re-run."""
+    if not result:
+        return
+    judge_all = result.get("judge_summary_all")
+    if isinstance(judge_all, pd.DataFrame) and not judge_all.empty:
+        st.session_state["element_ranking_judge_summary_all"] = judge_all
+        if run_params is not None:
+            st.session_state["element_ranking_judge_summary_scope_key"] = (
+                run_params_ranking_compute_key(run_params)
+            )
+        return
+    marking = result.get("marking")
+    if isinstance(marking, pd.DataFrame) and not marking.empty:
+        from element_deviation_ranking import judge_summary_from_marking_display
+
+        rebuilt = judge_summary_from_marking_display(marking)
+        if rebuilt is not None and not rebuilt.empty:
+            st.session_state["element_ranking_judge_summary_all"] = rebuilt
+            if run_params is not None:
+                st.session_state["element_ranking_judge_summary_scope_key"] = (
+                    run_params_ranking_compute_key(run_params)
+                )
+
+
+def _element_ranking_scoped_judge_summary_pool(
+    base_result: dict,
+    run_params: tuple,
+) -> pd.DataFrame | None:
+    """
+    Session fallback pool for minimum-marks re-filtering.
+
+    Only used when the saved result lacks ``judge_summary_all`` and the pool was
+    recorded for the same ranking scope (segment levels, seasons, etc.).
+    """
+    existing = base_result.get("judge_summary_all")
+    if isinstance(existing, pd.DataFrame) and not existing.empty:
+        return None
+    pool = st.session_state.get("element_ranking_judge_summary_all")
+    if not isinstance(pool, pd.DataFrame) or pool.empty:
+        return None
+    pool_scope = st.session_state.get("element_ranking_judge_summary_scope_key")
+    if pool_scope != run_params_ranking_compute_key(run_params):
+        return None
+    return pool
+
+
+def _cancel_element_ranking_job() -> None:
+    _stop_element_ranking_process()
+    st.session_state.element_ranking_status = "cancelled"
+    st.session_state.pop("element_ranking_result", None)
+    st.session_state.pop("element_ranking_error_msg", None)
+
+
+def _element_ranking_use_subprocess() -> bool:
+    """
+    Run analysis in a child process (keeps Streamlit responsive; child RAM is freed on exit).
+
+    Two Heroku **web** dynos do not add memory for one request — each dyno still has its own
+    limit. Set ``ELEMENT_RANKING_NO_SUBPROCESS=1`` to run in-process instead.
+    """
+    if os.environ.get("ELEMENT_RANKING_NO_SUBPROCESS", "").strip().lower() in (
+        "1",
+        "true",
+        "yes",
+    ):
+        return False
+    return True
+
+
+def _run_element_ranking_compute(run_params: tuple, *, package: bool = True) -> dict:
+    """Run rankings in-process; skip ``st.cache_data`` on memory-limited hosts."""
+    if memory_efficient_mode():
+        result = execute_element_deviation_rankings(run_params)
+    else:
+        result = _cached_element_deviation_rankings(run_params)
+    if package:
+        base = st.session_state.get("element_ranking_pickle_path")
+        if not base:
+            fd, base = tempfile.mkstemp(prefix="elem_rank_", suffix=".pkl")
+            os.close(fd)
+            st.session_state.element_ranking_pickle_path = base
+        return package_element_ranking_result(result, base)
+    return result
+
+
+@st.cache_data(ttl=300)
+def _cached_element_deviation_rankings(run_params: tuple):
+    from element_deviation_ranking import compute_element_deviation_rankings_from_run_params
+
+    with isolated_analytics_session() as analytics:
+        return compute_element_deviation_rankings_from_run_params(analytics, run_params)
+
+
+def _element_ranking_rankings_column_config() -> dict:
+    return {
+        "rank": st.column_config.NumberColumn(
+            "Rank",
+            format="%d",
+            help="Order by marking score (1 = lowest M = closest to the control-score model).",
+        ),
+        "Marking score": st.column_config.NumberColumn(
+            "Marking score",
+            format="%.4f",
+            help=(
+                "M = √(mean(m²)) over element marks, with m = (GOE − panel median) / σ̂. "
+                "Lower means closer to the panel-median / σ̂ model (not necessarily "
+                "“better” judging in absolute terms)."
+            ),
+        ),
+        "Element marks": st.column_config.NumberColumn(
+            "Element marks",
+            format="%d",
+            help="Number of element GOE marks for this judge identity after filters.",
+        ),
+        "Mean GOE bias": st.column_config.NumberColumn(
+            "Mean GOE bias",
+            format="%+.3f",
+            help=(
+                "Signed average GOE − panel median. Positive = tends to mark above "
+                "the panel median; negative = tends to mark below."
+            ),
+        ),
+        "Mean |error|": st.column_config.NumberColumn(
+            "Mean |error|",
+            format="%.3f",
+            help=(
+                "Average |GOE − panel median GOE| in raw GOE units (before σ̂ normalization)."
+            ),
+        ),
+        "Mean σ̂": st.column_config.NumberColumn(
+            "Mean σ̂",
+            format="%.3f",
+            help=(
+                "Average intrinsic spread σ̂ applied to this judge’s marks (fitted bin, "
+                "neighbor bin, or fallback)."
+            ),
+        ),
+        "Mean |m|": st.column_config.NumberColumn(
+            "Mean |m|",
+            format="%.3f",
+            help=(
+                "Average |m| where m = (GOE − panel median) / σ̂. Complements marking score "
+                "(which uses RMS of m)."
+            ),
+        ),
+    }
+
+
+def _element_ranking_sigma_bins_column_config() -> dict:
+    return {
+        "Control GOE": st.column_config.NumberColumn(
+            "Control GOE",
+            format="%d",
+            help="Panel median GOE for the bin, rounded to the nearest integer.",
+        ),
+        "Marks in bin": st.column_config.NumberColumn(
+            "Marks in bin",
+            format="%d",
+            help=(
+                "Element marks in the filtered data for this discipline, element type, "
+                "and control GOE (all judges combined)."
+            ),
+        ),
+        "Error stdev (all marks)": st.column_config.NumberColumn(
+            "Error stdev (all marks)",
+            format="%.4f",
+            help=(
+                "Sample standard deviation of (judge GOE − panel median GOE) within the bin."
+            ),
+        ),
+        "σ̂ used in model": st.column_config.NumberColumn(
+            "σ̂ used in model",
+            format="%.4f",
+            help=(
+                "σ̂ fitted for this bin when it meets the minimum mark count (floored at "
+                "Floor σ̂). Empty if the bin was not included in the model."
+            ),
+        ),
+        "In model": st.column_config.CheckboxColumn(
+            "In model",
+            help=(
+                "Checked when this bin had enough marks to fit σ̂ and that value is used "
+                "for marks in the bin (before neighbor / fallback lookup)."
+            ),
+        ),
+    }
+
+
+def _element_ranking_control_table(
+    result: dict,
+    analytics: JudgeAnalytics,
+    run_params: tuple,
+) -> pd.DataFrame:
+    """Panel median GOE per element (sidecar, embedded, or rebuilt from ranking-scope marks)."""
+    ctrl = load_control_by_element(result)
+    if not ctrl.empty:
+        return ctrl
+
+    cache_key = ("element_ranking_control", run_params_compute_key(run_params))
+    cached = st.session_state.get(cache_key)
+    if isinstance(cached, pd.DataFrame) and not cached.empty:
+        return cached
+
+    ctrl = load_control_by_element_for_ranking_scope(
+        analytics.session, analytics, run_params
+    )
+    if not ctrl.empty:
+        st.session_state[cache_key] = ctrl
+        return ctrl
+
+    marks = collect_marks_for_run(
+        analytics,
+        **element_ranking_scope_kwargs(run_params),
+        cache_only=False,
+        persist_shards=False,
+    )
+    if marks.empty:
+        return pd.DataFrame()
+    if "judge_id" in marks.columns:
+        marks = attach_judge_identities(marks, analytics)
+    ctrl = control_scores_by_element(marks)
+    if not ctrl.empty:
+        st.session_state[cache_key] = ctrl
+    return ctrl
+
+
+def _element_ranking_sigma_params(
+    result: dict,
+    run_params: tuple | None,
+) -> dict:
+    """σ̂ bin lookup table for drill-down (inline, sidecar, or DB cache)."""
+    params = load_ranking_params(result)
+    if params:
+        return params
+    rehydrated = rehydrate_packaged_ranking_result(result)
+    params = load_ranking_params(rehydrated)
+    if params:
+        return params
+    if run_params is None:
+        return {}
+    cached = run_with_isolated_analytics(
+        lambda analytics, rp: load_cached_sigma_params_for_run(
+            analytics.session, analytics, rp
+        ),
+        run_params,
+    )
+    return cached if isinstance(cached, dict) else {}
+
+
+def _enrich_ranking_result_for_drilldown(
+    analytics: JudgeAnalytics,
+    run_params: tuple,
+    ranking_result: dict | None,
+) -> dict | None:
+    """Attach panel control scores when missing (Heroku runs)."""
+    if not ranking_result or ranking_result.get("error"):
+        return ranking_result
+    if not load_control_by_element(ranking_result).empty:
+        return ranking_result
+    if ranking_result.get("_from_summary_cache"):
+        # Rendered from judge-summary parts alone; the control part is fetched when a
+        # judge breakdown is opened (``_element_ranking_control_table``).
+        return ranking_result
+    ctrl = load_control_by_element_for_ranking_scope(
+        analytics.session, analytics, run_params
+    )
+    if ctrl.empty:
+        return ranking_result
+    enriched = dict(ranking_result)
+    enriched["control_by_element"] = ctrl
+    return enriched
+
+
+def _element_ranking_breakdown_failure_hint(
+    result: dict,
+    run_params: tuple,
+    pick_judge: str,
+) -> str:
+    if not _element_ranking_sigma_params(result, run_params):
+        return (
+            "σ̂ parameters are missing from the saved run. "
+            "Click **Run analysis** to refresh results."
+        )
+    cache_key = ("element_ranking_control", run_params_compute_key(run_params))
+    ctrl = load_control_by_element(result)
+    cached_ctrl = st.session_state.get(cache_key)
+    if ctrl.empty and not (
+        isinstance(cached_ctrl, pd.DataFrame) and not cached_ctrl.empty
+    ):
+        return (
+            "Panel control scores could not be loaded for this filter set "
+            "(needed for per-judge drill-down). If you use **precomputed cache** on "
+            "Heroku, re-run "
+            "`precompute_element_ranking_cache.py --all-scopes --sigma-benchmark --summaries`, "
+            "then **Run analysis** again."
+        )
+    return (
+        f"No element marks found for **{pick_judge}** under the current filters, "
+        "or that identity could not be resolved. "
+        "Click **Run analysis** after changing season, scope, or model parameters."
+    )
+
+
+def _element_ranking_load_judge_breakdown(
+    result: dict,
+    run_params: tuple,
+    pick_judge: str,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """On-demand per-judge tables (discipline, element type, control GOE bins)."""
+    empty = pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+
+    params = _element_ranking_sigma_params(result, run_params)
+    if not params:
+        return empty
+    if not result.get("params"):
+        patched = dict(result)
+        patched["params"] = params
+        st.session_state.element_ranking_result = patched
+        result = patched
+
+    detail_key = (
+        "element_ranking_judge_detail",
+        run_params_compute_key(run_params),
+        pick_judge,
+    )
+    cached = st.session_state.get(detail_key)
+    if isinstance(cached, tuple) and len(cached) >= 2:
+        jd_c = cached[0] if isinstance(cached[0], pd.DataFrame) else pd.DataFrame()
+        je_c = cached[1] if isinstance(cached[1], pd.DataFrame) else pd.DataFrame()
+        jg_c = (
+            cached[2]
+            if len(cached) >= 3 and isinstance(cached[2], pd.DataFrame)
+            else pd.DataFrame()
+        )
+        if not jg_c.empty and (not jd_c.empty or not je_c.empty or not jg_c.empty):
+            return jd_c, je_c, jg_c
+        if not jd_c.empty or not je_c.empty:
+            if len(cached) >= 3:
+                return jd_c, je_c, jg_c
+
+    def _compute_judge_breakdown(analytics, ranking_result, rp, judge_name):
+        control_tbl = _element_ranking_control_table(ranking_result, analytics, rp)
+        if control_tbl.empty:
+            return empty
+        return compute_judge_detail_for_identity(
+            analytics,
+            judge_name,
+            control_tbl,
+            params,
+            **element_ranking_filter_kwargs(rp),
+        )
+
+    with st.spinner(f"Loading breakdown for {pick_judge}…"):
+        detail = run_with_isolated_analytics(
+            _compute_judge_breakdown, result, run_params, pick_judge
+        )
+    if len(detail) == 2:
+        detail = (*detail, pd.DataFrame())
+    if detail[0].empty and detail[1].empty and detail[2].empty:
+        return detail
+    st.session_state[detail_key] = detail
+    return detail
+
+
+def _element_ranking_report_discipline_names(
+    analytics: JudgeAnalytics, run_params: tuple
+) -> list[str]:
+    """Discipline labels included in the current ranking report scope."""
+    rp = unpack_element_ranking_run_params(run_params)
+    disc_tuple = rp[2]
+    scope_key = rp[3]
+    if disc_tuple:
+        id_to_name = {
+            int(dt_id): name
+            for dt_id, name in element_ranking_discipline_types(analytics, scope_key)
+        }
+        return [
+            id_to_name[int(dt_id)]
+            for dt_id in disc_tuple
+            if int(dt_id) in id_to_name
+        ]
+    return element_ranking_discipline_names_for_scope(analytics, scope_key)
+
+
+def _control_goe_chart_series_label(discipline: str, element_type: str) -> str:
+    return f"{discipline} — {element_type}"
+
+
+def _control_goe_chart_series_options(element_detail: pd.DataFrame) -> list[str]:
+    """Ordered discipline × element-type labels for the control-GOE chart multiselect."""
+    if element_detail.empty or not {"Discipline", "Element type"}.issubset(
+        element_detail.columns
+    ):
+        return []
+    sort_col = (
+        "Partial marking score"
+        if "Partial marking score" in element_detail.columns
+        else "Element marks"
+    )
+    scored = element_detail.sort_values(sort_col, ascending=False)
+    seen: set[str] = set()
+    out: list[str] = []
+    for _, row in scored.iterrows():
+        label = _control_goe_chart_series_label(
+            str(row["Discipline"]), str(row["Element type"])
+        )
+        if label not in seen:
+            seen.add(label)
+            out.append(label)
+    return out
+
+
+def _element_ranking_control_goe_chart(
+    control_goe_detail: pd.DataFrame,
+    element_detail: pd.DataFrame,
+    *,
+    min_bin_marks: int = 10,
+    series_keys: list[str] | None = None,
+    max_types: int = 3,
+):
+    """Line chart: partial marking score vs control GOE for selected element-type series."""
+    if control_goe_detail.empty:
+        return None
+    if "Control GOE" not in control_goe_detail.columns:
+        return None
+
+    if series_keys:
+        plot_series = list(series_keys)
+    elif not element_detail.empty and {"Discipline", "Element type"}.issubset(
+        element_detail.columns
+    ):
+        plot_series = _control_goe_chart_series_options(element_detail)[:max_types]
+    else:
+        return None
+
+    if not plot_series:
+        return None
+
+    parts: list[pd.DataFrame] = []
+    for label in plot_series:
+        if " — " not in label:
+            continue
+        disc, etype = label.split(" — ", 1)
+        mask = (control_goe_detail["Discipline"] == disc) & (
+            control_goe_detail["Element type"] == etype
+        )
+        if min_bin_marks > 0:
+            mask = mask & (control_goe_detail["Element marks"] >= min_bin_marks)
+        subset = control_goe_detail.loc[mask].copy()
+        if subset.empty:
+            continue
+        subset["Series"] = label
+        parts.append(subset)
+
+    if not parts:
+        return None
+
+    plot_df = pd.concat(parts, ignore_index=True)
+    fig = px.line(
+        plot_df.sort_values(["Series", "Control GOE"]),
+        x="Control GOE",
+        y="Partial marking score",
+        color="Series",
+        markers=True,
+        title="Partial marking score by panel-median (control) GOE",
+        labels={
+            "Control GOE": "Rounded panel median GOE",
+            "Partial marking score": "Partial marking score √(mean(m²))",
+        },
+    )
+    fig.update_layout(hovermode="x unified")
+    return fig
+
+
+def _element_ranking_judge_detail_column_config() -> dict:
+    return {
+        "Element marks": st.column_config.NumberColumn(
+            "Element marks",
+            format="%d",
+            help="Element marks for this judge in the row’s discipline (and element type, if shown).",
+        ),
+        "Partial marking score": st.column_config.NumberColumn(
+            "Partial marking score",
+            format="%.4f",
+            help=(
+                "√(mean(m²)) using only marks in this row’s slice (same formula as overall "
+                "marking score, scoped to discipline or element type)."
+            ),
+        ),
+        "Mean GOE bias": st.column_config.NumberColumn(
+            "Mean GOE bias",
+            format="%+.3f",
+            help="Signed mean GOE − panel median in this slice; positive = above median.",
+        ),
+        "Mean |error|": st.column_config.NumberColumn(
+            "Mean |error|",
+            format="%.3f",
+            help="Average |GOE − panel median| in this slice (raw GOE units).",
+        ),
+        "Mean σ̂": st.column_config.NumberColumn(
+            "Mean σ̂",
+            format="%.3f",
+            help="Average σ̂ applied to marks in this discipline slice.",
+        ),
+        "Control GOE": st.column_config.NumberColumn(
+            "Control GOE",
+            format="%+d",
+            help="Panel median GOE for the element, rounded (σ̂ model bin).",
+        ),
+    }
+
+
+def _mark_element_ranking_benchmark_customized() -> None:
+    st.session_state["element_ranking_benchmark_customized"] = True
+
+
+def _element_ranking_segment_level_session_value(preset: str | None) -> str:
+    return preset or ELEMENT_RANKING_LEVEL_FILTER_ALL
+
+
+def _sync_element_ranking_benchmark_pool(
+    start_season: str,
+    end_season: str,
+    scope_label: str,
+    segment_level_preset: str | None,
+) -> None:
+    """
+    Mirror ranking season years, competition scope, and segment levels into the
+    σ̂ benchmark pool until the user edits the benchmark widgets.
+    """
+    seg_session = _element_ranking_segment_level_session_value(segment_level_preset)
+    main_key = (start_season, end_season, scope_label, seg_session)
+    prev_main = st.session_state.get("element_ranking_ranking_filters_for_benchmark")
+    customized = st.session_state.get("element_ranking_benchmark_customized", False)
+
+    if prev_main != main_key and (prev_main is None or not customized):
+        st.session_state["element_ranking_benchmark_start_season"] = start_season
+        st.session_state["element_ranking_benchmark_end_season"] = end_season
+        st.session_state["element_ranking_benchmark_competition_scope"] = scope_label
+        st.session_state["element_ranking_benchmark_segment_levels"] = seg_session
+
+    st.session_state["element_ranking_ranking_filters_for_benchmark"] = main_key
+
+
+def element_deviation_ranking_page() -> None:
+    """Element GOE marking scores vs panel-median control (sigma-normalized)."""
+    st.header("Element Deviation Ranking Analysis")
+    st.caption(
+        "Ranks judges by how closely their element GOEs track a **panel control score** "
+        "(median GOE per element), after normalizing spread by discipline, element type, "
+        "and rounded control GOE. **Lower marking score = closer to the model** "
+        "(not necessarily “better” judging in absolute terms)."
+    )
+
+    with st.expander("Methodology", expanded=False):
+        st.markdown(
+            """
+**1. Data** — Element GOE marks from competitions on or after **2018-07-01**
+(current scale). Judges linked to the same directory official are merged
+(same identity groups as Individual Judge / Cross-Judge).
+
+**2. Control score** — For each element, the panel **median** GOE across judges.
+**Error** = judge GOE − control score.
+
+**3. Intrinsic spread σ̂** — For each combination of *(discipline, element type,
+rounded control GOE)* with at least ``min_bin_count`` marks, estimate σ̂ as the
+sample standard deviation of errors in that bin. If a mark’s bin is missing, try
+neighboring integer GOE levels (±1, ±2), else a global fallback σ (with a floor).
+
+**4. Normalized mark** — ``m = error / σ̂`` (per mark).
+
+**5. Marking score** — Per judge identity:
+``M = √(mean(m²))``. Ranked ascending (rank 1 = lowest M).
+
+PCS scores are not part of this model.
+            """
+        )
+
+    analytics = get_analytics_safe()
+
+    st.subheader("Filters")
+    scope_label = st.selectbox(
+        "Competition scope",
+        list(COMPETITION_SCOPE_LABELS),
+        index=0,
+        key="element_ranking_competition_scope",
+        help="Filters competitions via linked officials competition type.",
+    )
+    scope_key = competition_scope_key(scope_label)
+
+    years = filter_element_ranking_season_years(analytics.get_years())
+    if not years:
+        st.error("No competition seasons found in the database.")
+        return
+    start_season_year = None
+    end_season_year = None
+    event_start_iso = None
+    event_end_iso = None
+
+    col_y1, col_y2 = st.columns(2)
+    with col_y1:
+        start_season = st.selectbox(
+            "Season year from",
+            ["Any"] + years,
+            key="element_ranking_start_season",
+        )
+        start_season_year = None if start_season == "Any" else start_season
+    with col_y2:
+        end_season = st.selectbox(
+            "Season year to",
+            ["Any"] + years,
+            key="element_ranking_end_season",
+        )
+        end_season_year = None if end_season == "Any" else end_season
+
+    st.caption(
+        f"Element marks are limited to competitions on or after "
+        f"**{MIN_ELEMENT_MARKING_EVENT_DATE.isoformat()}** (current GOE scale)."
+    )
+    use_event_dates = st.checkbox(
+        "Narrow by competition event dates",
+        key="element_ranking_use_event_dates",
+        help=(
+            "Further restrict rankings by event date (not applied to the σ̂ benchmark pool). "
+            "Events with neither date are excluded."
+        ),
+    )
+    if use_event_dates:
+        date_min, date_max = analytics.get_competition_event_date_bounds(
+            competition_scope=scope_key,
+        )
+        date_min = max(date_min, MIN_ELEMENT_MARKING_EVENT_DATE)
+        date_max = max(date_max, date_min)
+        default_start = max(date_min, MIN_ELEMENT_MARKING_EVENT_DATE)
+        dc1, dc2 = st.columns(2)
+        with dc1:
+            event_start = st.date_input(
+                "Event on or after",
+                value=default_start,
+                min_value=MIN_ELEMENT_MARKING_EVENT_DATE,
+                max_value=date_max,
+                key="element_ranking_start_date",
+            )
+        with dc2:
+            event_end = st.date_input(
+                "Event on or before",
+                value=date_max,
+                min_value=MIN_ELEMENT_MARKING_EVENT_DATE,
+                max_value=date_max,
+                key="element_ranking_end_date",
+            )
+        if event_start > event_end:
+            st.warning("Start date is after end date; results may be empty.")
+        event_start_iso = event_start.isoformat()
+        event_end_iso = event_end.isoformat()
+
+    col_d, col_levels, col_cache = st.columns([2, 1, 1])
+    with col_d:
+        discipline_types = element_ranking_discipline_types(analytics, scope_key)
+        discipline_names = [name for _id, name in discipline_types]
+        selected_disciplines = st.multiselect(
+            "Discipline types",
+            discipline_names,
+            key="element_ranking_disciplines",
+        )
+        discipline_ids = [
+            dt_id for dt_id, name in discipline_types if name in selected_disciplines
+        ] if selected_disciplines else None
+    with col_levels:
+        segment_level_preset = st.selectbox(
+            "Segment levels",
+            list(ELEMENT_RANKING_LEVEL_FILTER_LABELS),
+            format_func=lambda key: ELEMENT_RANKING_LEVEL_FILTER_LABELS[key],
+            key="element_ranking_segment_levels",
+            help=(
+                "Restrict element marks by ``segment.level``. Novice = Novice and "
+                "Advanced Novice only; Junior = Junior only; Senior = Senior only "
+                "(no Excel or International). Other levels are excluded unless you "
+                "choose All segment levels."
+            ),
+        )
+        if segment_level_preset == ELEMENT_RANKING_LEVEL_FILTER_ALL:
+            segment_level_preset = None
+    with col_cache:
+        use_precomputed_cache = st.checkbox(
+            "Use precomputed cache",
+            value=True,
+            key="element_ranking_use_cache",
+            help=(
+                "Load cached season×discipline shards and assemble (missing shards are computed)."
+            ),
+        )
+
+    _sync_element_ranking_benchmark_pool(
+        start_season, end_season, scope_label, segment_level_preset
+    )
+
+    benchmark_start_season_year = None
+    benchmark_end_season_year = None
+    benchmark_scope_key = COMPETITION_SCOPE_ALL
+    benchmark_segment_level_preset = None
+    with st.expander("σ̂ benchmark pool", expanded=False):
+        st.caption(
+            "Seasons, competition scope, and segment levels used only to fit "
+            "intrinsic spread (σ̂). Defaults to the same values as the ranking "
+            "filters above; change these to use a custom σ̂ pool. Event dates "
+            "apply to rankings only, not to this pool."
+        )
+        bc1, bc2 = st.columns(2)
+        with bc1:
+            bench_start_pick = st.selectbox(
+                "Season year from",
+                ["Any"] + years,
+                key="element_ranking_benchmark_start_season",
+                on_change=_mark_element_ranking_benchmark_customized,
+            )
+            benchmark_start_season_year = (
+                None if bench_start_pick == "Any" else bench_start_pick
+            )
+        with bc2:
+            bench_end_pick = st.selectbox(
+                "Season year to",
+                ["Any"] + years,
+                key="element_ranking_benchmark_end_season",
+                on_change=_mark_element_ranking_benchmark_customized,
+            )
+            benchmark_end_season_year = (
+                None if bench_end_pick == "Any" else bench_end_pick
+            )
+        bench_scope_label = st.selectbox(
+            "Competition scope",
+            list(COMPETITION_SCOPE_LABELS),
+            key="element_ranking_benchmark_competition_scope",
+            help="Officials competition-type filter for σ̂ fitting only.",
+            on_change=_mark_element_ranking_benchmark_customized,
+        )
+        benchmark_scope_key = competition_scope_key(bench_scope_label)
+        bench_segment_level_pick = st.selectbox(
+            "Segment levels",
+            list(ELEMENT_RANKING_LEVEL_FILTER_LABELS),
+            format_func=lambda key: ELEMENT_RANKING_LEVEL_FILTER_LABELS[key],
+            key="element_ranking_benchmark_segment_levels",
+            help=(
+                "Restrict element marks used for σ̂ fitting by ``segment.level``. "
+                "Same presets as the ranking filter above."
+            ),
+            on_change=_mark_element_ranking_benchmark_customized,
+        )
+        if bench_segment_level_pick == ELEMENT_RANKING_LEVEL_FILTER_ALL:
+            benchmark_segment_level_preset = None
+        else:
+            benchmark_segment_level_preset = bench_segment_level_pick
+
+    st.subheader("Model parameters")
+    p1, p2, p3 = st.columns(3)
+    with p1:
+        if "element_ranking_min_marks" not in st.session_state:
+            st.session_state["element_ranking_min_marks"] = 0
+        min_marks = st.number_input(
+            "Minimum element marks per judge",
+            min_value=0,
+            step=50,
+            key="element_ranking_min_marks",
+            help=(
+                "Exclude identities with fewer marks after filters. "
+                "Changing only this reuses the last computation (no full re-run)."
+            ),
+        )
+    with p2:
+        floor_sigma = st.number_input(
+            "Floor σ̂",
+            min_value=0.01,
+            max_value=1.0,
+            value=float(_ELEM_RANK_FLOOR_SIGMA),
+            step=0.01,
+            format="%.2f",
+            key="element_ranking_floor_sigma",
+            help=(
+                "Minimum intrinsic spread σ̂ applied to every element mark. "
+                "Fitted bin standard deviations and the global fallback σ are "
+                "raised to this floor so m = (GOE − control) / σ̂ does not "
+                "inflate when a bin’s spread is very small."
+            ),
+        )
+    with p3:
+        min_bin_count = st.number_input(
+            "Min marks per σ̂ bin",
+            min_value=5,
+            max_value=200,
+            value=int(_ELEM_RANK_MIN_BIN_COUNT),
+            step=5,
+            key="element_ranking_min_bin_count",
+            help="(discipline, element type, rounded control GOE) buckets with fewer marks are skipped.",
+        )
+
+    us_officials_only = st.checkbox(
+        "US directory officials only",
+        key="element_ranking_us_officials_only",
+        help=(
+            "Show rankings only for judges linked to a USFS official "
+            "(Admin → Judge ↔ directory matcher). σ̂ and panel medians still use all judges."
+        ),
+    )
+
+    disc_tuple = tuple(discipline_ids) if discipline_ids else None
+    run_params = (
+        start_season_year,
+        end_season_year,
+        disc_tuple,
+        scope_key,
+        event_start_iso,
+        event_end_iso,
+        int(min_marks),
+        float(floor_sigma),
+        int(min_bin_count),
+        benchmark_start_season_year,
+        benchmark_end_season_year,
+        benchmark_scope_key,
+        segment_level_preset,
+        benchmark_segment_level_preset,
+    )
+    _finalize_element_ranking_job()
+    job_status = st.session_state.get("element_ranking_status", "idle")
+    job_running = job_status == "running"
+
+    btn_col_run, btn_col_cancel = st.columns(2)
+    with btn_col_run:
+        run_clicked = st.button(
+            "Run analysis",
+            type="primary",
+            key="element_ranking_run_btn",
+            disabled=job_running,
+            help="Loads element marks and fits σ̂ bins. Can take a minute on wide filters.",
+        )
+    with btn_col_cancel:
+        cancel_clicked = st.button(
+            "Cancel analysis",
+            key="element_ranking_cancel_btn",
+            disabled=not job_running,
+            help="Stops the background job (may take a few seconds).",
+        )
+
+    if cancel_clicked and job_running:
+        _cancel_element_ranking_job()
+        st.rerun()
+
+    scope_err = validate_element_ranking_scope(
+        start_season_year,
+        end_season_year,
+        available_years=years,
+    )
+    if scope_err:
+        st.error(scope_err)
+
+    if run_clicked and not job_running and not scope_err:
+        _stop_element_ranking_process()
+        st.session_state.element_ranking_run_params = run_params
+        st.session_state.pop("element_ranking_result", None)
+        st.session_state.pop("element_ranking_error_msg", None)
+        st.session_state.pop("element_ranking_cache_saved", None)
+        st.session_state.pop("element_ranking_cache_error", None)
+        st.session_state.pop("element_ranking_judge_summary_all", None)
+        st.session_state.pop("element_ranking_judge_summary_scope_key", None)
+        for _k in list(st.session_state.keys()):
+            if isinstance(_k, tuple) and _k[:1] in (
+                "element_ranking_judge_detail",
+                "element_ranking_control",
+            ):
+                del st.session_state[_k]
+        if use_precomputed_cache:
+            cached = run_with_isolated_analytics(
+                lambda cache_analytics, rp: load_cached_rankings(
+                    cache_analytics.session, cache_analytics, rp
+                ),
+                run_params,
+            )
+            if cached is not None:
+                cached = run_with_isolated_analytics(
+                    _enrich_ranking_result_for_drilldown,
+                    run_params,
+                    cached,
+                )
+                st.session_state.element_ranking_result = cached
+                _persist_element_ranking_judge_summary_pool(
+                    cached, run_params=run_params
+                )
+                st.session_state.element_ranking_status = "done"
+                st.success("Loaded precomputed cache for this filter set.")
+                st.rerun()
+        if _element_ranking_use_subprocess():
+            fd, pickle_path = tempfile.mkstemp(prefix="elem_rank_", suffix=".pkl")
+            os.close(fd)
+            st.session_state.element_ranking_pickle_path = pickle_path
+            proc = start_ranking_subprocess(
+                run_params, pickle_path, database_url=get_database_url()
+            )
+            st.session_state.element_ranking_proc = proc
+            st.session_state.element_ranking_status = "running"
+            st.rerun()
+        else:
+            fd, pickle_path = tempfile.mkstemp(prefix="elem_rank_", suffix=".pkl")
+            os.close(fd)
+            st.session_state.element_ranking_pickle_path = pickle_path
+            with st.spinner("Computing rankings…"):
+                computed = rehydrate_packaged_ranking_result(
+                    _run_element_ranking_compute(run_params)
+                )
+            enriched = run_with_isolated_analytics(
+                _enrich_ranking_result_for_drilldown,
+                run_params,
+                computed,
+            )
+            st.session_state.element_ranking_result = enriched
+            _persist_element_ranking_judge_summary_pool(
+                enriched, run_params=run_params
+            )
+            st.session_state.element_ranking_status = "done"
+            ok, err = run_with_isolated_analytics(
+                lambda cache_analytics, rp, ranking_result: try_save_element_ranking_cache(
+                    cache_analytics.session,
+                    cache_analytics,
+                    rp,
+                    ranking_result,
+                ),
+                run_params,
+                st.session_state.element_ranking_result,
+            )
+            if ok:
+                st.session_state.element_ranking_cache_saved = True
+                st.session_state.pop("element_ranking_cache_error", None)
+            elif err:
+                st.session_state.element_ranking_cache_error = err
+            st.rerun()
+
+    if job_running:
+        st.warning(
+            "Analysis is running in a separate process. You can switch pages; "
+            "return here and click **Cancel analysis** to stop it."
+        )
+        time.sleep(0.8)
+        st.rerun()
+
+    if job_status == "cancelled":
+        st.info("Analysis cancelled.")
+        return
+
+    if job_status == "error":
+        st.error(
+            st.session_state.get(
+                "element_ranking_error_msg", "Analysis failed."
+            )
+        )
+        return
+
+    stored_params = st.session_state.get("element_ranking_run_params")
+    base_result = st.session_state.get("element_ranking_result")
+    if base_result is None:
+        st.info(
+            "Set filters and click **Run analysis**. "
+            "Rankings are not computed automatically so navigation stays responsive."
+        )
+        return
+    _persist_element_ranking_judge_summary_pool(
+        base_result, run_params=stored_params
+    )
+
+    compute_match = (
+        stored_params is not None
+        and run_params_same_sigma_and_ranking_scope(stored_params, run_params)
+    )
+    if not compute_match:
+        st.warning(
+            "Filters or model parameters changed since the last run. "
+            "Click **Run analysis** to refresh results."
+        )
+        return
+
+    if stored_params is not None and load_control_by_element(base_result).empty:
+        enriched = run_with_isolated_analytics(
+            _enrich_ranking_result_for_drilldown,
+            stored_params,
+            base_result,
+        )
+        if enriched is not base_result:
+            st.session_state.element_ranking_result = enriched
+            base_result = enriched
+
+    result = apply_min_marks_to_ranking_result(
+        base_result,
+        int(min_marks),
+        judge_summary_all=_element_ranking_scoped_judge_summary_pool(
+            base_result, run_params
+        ),
+    )
+    min_marks_changed = (
+        stored_params is not None
+        and run_params_same_sigma_and_ranking_scope(stored_params, run_params)
+        and int(stored_params[6] or 0) != int(min_marks)
+    )
+    if min_marks_changed:
+        st.caption(
+            "Minimum marks filter updated — reusing the last σ̂ fit and panel medians."
+        )
+    if int(min_marks) > 0 and not result.get("_min_marks_filter_applied", False):
+        st.warning(
+            "Could not apply the minimum element marks filter to the saved results. "
+            "Click **Run analysis** to refresh rankings."
+        )
+
+    if us_officials_only:
+        from judge_official_display_filter import (
+            apply_us_officials_display_filter_to_ranking_result,
+        )
+
+        n_before_us = len(result.get("marking", pd.DataFrame()))
+        result = apply_us_officials_display_filter_to_ranking_result(
+            result, us_linked_identity_labels_for_ui()
+        )
+        n_after_us = len(result.get("marking", pd.DataFrame()))
+        if n_before_us and n_after_us < n_before_us:
+            st.caption(
+                f"US officials display filter: **{n_after_us}** of {n_before_us} ranked "
+                "identities are linked to the USFS directory."
+            )
+
+    if result["error"]:
+        st.warning(result["error"])
+        return
+
+    cache_err = st.session_state.get("element_ranking_cache_error")
+    if cache_err:
+        st.warning(
+            "Rankings completed but could not be saved for reuse: "
+            f"{cache_err}"
+        )
+    elif st.session_state.get("element_ranking_cache_saved"):
+        st.caption("Results saved for this filter set (will load faster next time).")
+
+    st.subheader("Run summary")
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric(
+        "Element marks (filtered)",
+        f"{result['n_raw_marks']:,}",
+        help="All element GOE marks in the filtered dataset (before per-judge minimum).",
+    )
+    m2.metric(
+        "σ̂ bins fitted",
+        f"{result['n_sigma_buckets']:,}",
+        help=(
+            "Count of (discipline, element type, rounded control GOE) bins with at least "
+            "the minimum marks used to estimate σ̂."
+        ),
+    )
+    m3.metric(
+        "Judges ranked",
+        len(result["marking"]),
+        help="Judge identities meeting the minimum element marks threshold.",
+    )
+    m4.metric(
+        "Floor σ̂",
+        f"{floor_sigma:.2f}",
+        help="Minimum σ̂ used when normalizing marks (see Model parameters).",
+    )
+    if uses_separate_benchmark_pool(run_params):
+        bench_start, bench_end = benchmark_season_bounds(run_params)
+        bench_scope = benchmark_competition_scope(run_params)
+        bench_levels = benchmark_segment_level_preset(run_params)
+        rank_start, rank_end = start_season_year, end_season_year
+        scope_labels = {v: k for k, v in COMPETITION_SCOPE_LABEL_TO_KEY.items()}
+        bench_scope_label = scope_labels.get(bench_scope, bench_scope)
+        rank_scope_label = scope_labels.get(scope_key, scope_key)
+        def _level_label(preset: str | None) -> str:
+            return ELEMENT_RANKING_LEVEL_FILTER_LABELS.get(
+                preset or ELEMENT_RANKING_LEVEL_FILTER_ALL, "All"
+            )
+
+        st.caption(
+            f"σ̂ benchmark pool: seasons **{bench_start or 'Any'}**–**{bench_end or 'Any'}**, "
+            f"scope **{bench_scope_label}**, levels **{_level_label(bench_levels)}**. "
+            f"Rankings: seasons **{rank_start or 'Any'}**–**{rank_end or 'Any'}**, "
+            f"scope **{rank_scope_label}**, levels **{_level_label(segment_level_preset)}**"
+            + (
+                f", events **{event_start_iso}**–**{event_end_iso}**"
+                if event_start_iso and event_end_iso
+                else ""
+            )
+            + " (cached shards and σ̂ reused when available)."
+        )
+
+    if result["marking"].empty:
+        st.info("No judges remain after filters and minimum marks threshold.")
+        return
+
+    marking = result["marking"]
+
+    st.subheader("Distribution of marking scores")
+    if not result["summary"].empty:
+        st.dataframe(
+            result["summary"],
+            width="stretch",
+            hide_index=True,
+            column_config={
+                "Statistic": st.column_config.TextColumn(
+                    "Statistic",
+                    help="Summary stats across judges’ marking scores (M = √(mean(m²))).",
+                ),
+                "Value": st.column_config.NumberColumn(
+                    "Value",
+                    format="%.6f",
+                    help="Value of the statistic for the judge population in this run.",
+                ),
+            },
+        )
+    fig = px.histogram(
+        marking,
+        x="Marking score",
+        nbins=min(40, max(10, len(marking) // 5)),
+        title="Marking scores across judges (lower = closer to control-score model)",
+    )
+    fig.update_layout(bargap=0.05)
+    st.plotly_chart(fig, width="stretch")
+
+    st.subheader("Rankings")
+    st.caption(
+        "**Marking score** = √(mean(m²)) over element marks, with m = (GOE − panel median) / σ̂. "
+        "**Mean GOE bias** is the signed average raw GOE − panel median (+ above, − below). "
+        "**Mean |m|** is the average absolute normalized mark."
+    )
+    st.dataframe(
+        marking,
+        width="stretch",
+        hide_index=True,
+        column_config=_element_ranking_rankings_column_config(),
+    )
+    streamlit_download(
+        "Download rankings CSV",
+        data=marking.to_csv(index=False).encode("utf-8"),
+        file_name="element_deviation_rankings.csv",
+        mime="text/csv",
+        key="element_ranking_rankings_download",
+    )
+
+    st.subheader("σ̂ parameters (by discipline, element type, control GOE)")
+    st.caption(
+        "For each bin with at least **min marks per σ̂ bin** panel marks in the filtered data, "
+        "**Error stdev** is the sample SD of (GOE − median). **σ̂ used in model** is that value "
+        "(floored at the configured minimum) when the bin is included; otherwise a neighbor or "
+        "fallback σ is used per mark."
+    )
+    sigma_bins = result.get("sigma_bins", pd.DataFrame())
+    if sigma_bins.empty:
+        st.info("No σ̂ bins to display for the current filters.")
+    else:
+        st.dataframe(
+            sigma_bins,
+            width="stretch",
+            hide_index=True,
+            column_config=_element_ranking_sigma_bins_column_config(),
+        )
+        streamlit_download(
+            "Download σ̂ parameters CSV",
+            data=sigma_bins.to_csv(index=False).encode("utf-8"),
+            file_name="element_sigma_parameters.csv",
+            mime="text/csv",
+            key="element_ranking_sigma_download",
+        )
+
+    judge_names = marking["Judge"].tolist() if "Judge" in marking.columns else []
+    if judge_names:
+        st.subheader("How a judge’s score breaks down")
+        pick_judge = st.selectbox(
+            "Select judge",
+            judge_names,
+            key="element_ranking_detail_judge",
+        )
+        judge_row = marking.loc[marking["Judge"] == pick_judge]
+        if not judge_row.empty and "Mean GOE bias" in judge_row.columns:
+            bias = float(judge_row["Mean GOE bias"].iloc[0])
+            bias_label = (
+                "above panel median"
+                if bias > 0.005
+                else "below panel median"
+                if bias < -0.005
+                else "near panel median"
+            )
+            st.metric(
+                "Overall mean GOE bias",
+                f"{bias:+.3f}",
+                help=(
+                    "Signed average of (judge GOE − panel median GOE) over all element "
+                    "marks for this judge. Positive = systematically higher GOEs than "
+                    "the panel median; negative = systematically lower."
+                ),
+            )
+            st.caption(
+                f"On average this judge marks **{bias_label}** "
+                f"({bias:+.3f} GOE vs panel median per element mark)."
+            )
+        _detail_col_config = _element_ranking_judge_detail_column_config()
+        jd, je, jg = _element_ranking_load_judge_breakdown(
+            result, run_params, pick_judge
+        )
+        if jd.empty and je.empty and jg.empty:
+            st.info(
+                _element_ranking_breakdown_failure_hint(
+                    result, run_params, pick_judge
+                )
+            )
+        else:
+            from element_ranking_takeaways import (
+                build_element_ranking_judge_takeaways,
+                detail_filter_options,
+                filter_judge_detail_tables,
+            )
+
+            disc_options, et_options = detail_filter_options(jd, je, jg)
+            report_disciplines = _element_ranking_report_discipline_names(
+                analytics, run_params
+            )
+            discipline_choices = sorted(set(report_disciplines) | set(disc_options))
+            default_disciplines = [
+                d for d in report_disciplines if d in discipline_choices
+            ]
+            judge_filter_key = pick_judge.replace(" ", "_")[:48]
+            with st.expander("Drill-down filters", expanded=False):
+                filt_c1, filt_c2, filt_c3 = st.columns(3)
+                with filt_c1:
+                    detail_min_marks = st.number_input(
+                        "Minimum marks per row",
+                        min_value=0,
+                        value=0,
+                        step=5,
+                        key=f"element_ranking_detail_min_marks_{judge_filter_key}",
+                        help="Hide breakdown rows with fewer element marks than this.",
+                    )
+                with filt_c2:
+                    detail_disciplines = st.multiselect(
+                        "Discipline",
+                        discipline_choices,
+                        default=default_disciplines,
+                        key=f"element_ranking_detail_disciplines_{judge_filter_key}",
+                        help=(
+                            "Defaults to all disciplines in the report scope. "
+                            "Clear all to include every discipline present in this breakdown."
+                        ),
+                    )
+                with filt_c3:
+                    detail_element_types = st.multiselect(
+                        "Element type",
+                        et_options,
+                        default=et_options,
+                        key=f"element_ranking_detail_element_types_{judge_filter_key}",
+                        help=(
+                            "Defaults to all element types for this judge. "
+                            "Clear all to include every element type in the breakdown."
+                        ),
+                    )
+
+            jd_f, je_f, jg_f = filter_judge_detail_tables(
+                jd,
+                je,
+                jg,
+                min_marks=int(detail_min_marks) if int(detail_min_marks) > 0 else None,
+                disciplines=detail_disciplines or None,
+                element_types=detail_element_types or None,
+            )
+            if jd_f.empty and je_f.empty and jg_f.empty:
+                st.warning(
+                    "No breakdown rows match the drill-down filters. "
+                    "Lower the minimum marks or clear discipline / element-type filters."
+                )
+            else:
+                judge_row_series = (
+                    judge_row.iloc[0]
+                    if not judge_row.empty
+                    else None
+                )
+                takeaway_min = max(30, int(detail_min_marks or 0))
+                takeaways = build_element_ranking_judge_takeaways(
+                    pick_judge,
+                    judge_row_series,
+                    jd_f,
+                    je_f,
+                    jg_f,
+                    min_marks=takeaway_min,
+                    min_bin_marks=max(15, min(30, takeaway_min)),
+                )
+                if takeaways:
+                    st.markdown("**Takeaways**")
+                    for line in takeaways:
+                        st.markdown(f"- {line}")
+
+                if not jd_f.empty:
+                    jd_one = jd_f.sort_values("Partial marking score")
+                    st.markdown(
+                        "**By discipline** "
+                        "(partial score = √(mean(m²)) within that discipline; σ̂-scaled)"
+                    )
+                    st.dataframe(
+                        jd_one,
+                        width="stretch",
+                        hide_index=True,
+                        column_config=_detail_col_config,
+                    )
+                if not je_f.empty:
+                    je_one = je_f.sort_values("Partial marking score", ascending=False)
+                    st.markdown(
+                        "**By discipline and element type** "
+                        "(largest normalized partial scores first)"
+                    )
+                    st.dataframe(
+                        je_one,
+                        width="stretch",
+                        hide_index=True,
+                        column_config=_detail_col_config,
+                    )
+                if not jg_f.empty:
+                    jg_one = jg_f.sort_values("Partial marking score", ascending=False)
+                    st.markdown(
+                        "**By control GOE range** "
+                        "(discipline × element type × rounded panel median GOE)"
+                    )
+                    st.caption(
+                        "Each row is one σ̂ bin. Partial score is √(mean(m²)) using "
+                        "normalized marks m = (GOE − panel median) / σ̂."
+                    )
+                    chart_series_options = _control_goe_chart_series_options(
+                        je_f if not je_f.empty else jg_one
+                    )
+                    default_chart_series = chart_series_options[:3]
+                    chart_series = st.multiselect(
+                        "Chart series (discipline × element type)",
+                        chart_series_options,
+                        default=default_chart_series,
+                        key=f"element_ranking_chart_series_{judge_filter_key}",
+                        help=(
+                            "Each line is partial marking score vs rounded panel "
+                            "median GOE. Points match the drill-down filters above "
+                            "(minimum marks, discipline, element type)."
+                        ),
+                    )
+                    goe_fig = _element_ranking_control_goe_chart(
+                        jg_one,
+                        je_f if not je_f.empty else jg_one,
+                        min_bin_marks=0,
+                        series_keys=chart_series or None,
+                    )
+                    if goe_fig is not None:
+                        st.plotly_chart(goe_fig, width="stretch")
+                    elif chart_series:
+                        st.caption(
+                            "No chart: selected series have no rows under the "
+                            "current drill-down filters."
+                        )
+                    st.dataframe(
+                        jg_one,
+                        width="stretch",
+                        hide_index=True,
+                        column_config=_detail_col_config,
+                    )
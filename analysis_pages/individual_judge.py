@@ -0,0 +1,762 @@
+"""
+Individual Judge Analysis page (the app landing page).
+"""
+
+import streamlit as st
+import pandas as pd
+from analytics_connection import get_analytics_safe
+from report_html import build_judge_report_html
+from officials_competition_types import COMPETITION_SCOPE_ALL
+from analysis_pages.common import (
+    COMPETITION_SCOPE_LABELS,
+    competition_scope_key,
+    streamlit_download,
+    identity_group_options,
+    competition_results_index_url,
+)
+
+
+def _individual_judge_protocol_competition_pairs(
+    judge_competitions,
+    pcs_df,
+    element_df,
+    year_filter,
+    competition_ids,
+):
+    """Pairs for the protocol-roles table: scored comps plus judge comps after year/competition filters."""
+    pairs = set()
+    for df in (pcs_df, element_df):
+        if df is None or df.empty:
+            continue
+        if "competition_name" not in df.columns or "year" not in df.columns:
+            continue
+        sub = df[["competition_name", "year"]].drop_duplicates()
+        for _, r in sub.iterrows():
+            pairs.add((str(r["competition_name"]), str(r["year"])))
+
+    for comp_id, name, year in judge_competitions:
+        if year_filter is not None and str(year) != str(year_filter):
+            continue
+        if competition_ids is not None and comp_id not in competition_ids:
+            continue
+        pairs.add((str(name), str(year)))
+
+    def sort_key(p):
+        try:
+            yi = int(p[1])
+        except (TypeError, ValueError):
+            yi = 0
+        return (-yi, p[0].lower())
+
+    return sorted(pairs, key=sort_key)
+
+
+def individual_judge_analysis_page() -> None:
+    st.header("Individual Judge Analysis")
+
+    # Judge selection
+    analytics = get_analytics_safe()
+    ig_labels, ig_map = identity_group_options(analytics)
+    if not ig_labels:
+        st.error("No judges found in database")
+        st.stop()
+
+    selected_judge_display = st.selectbox(
+        "Select Judge",
+        ig_labels,
+        key="individual_judge_select",
+    )
+    selected_judge_ids = ig_map[selected_judge_display]
+
+    # Filters
+    st.subheader("Filters")
+    individual_scope_label = st.selectbox(
+        "Competition scope",
+        list(COMPETITION_SCOPE_LABELS),
+        index=0,
+        key="individual_judge_competition_scope",
+        help=(
+            "Qualifying: linked officials type is set and not id 11 (nonqualifying). "
+            "NQS: linked officials type id 10. "
+            "Sectionals & championships: types 1–9 (excludes NQS and nonqualifying). "
+            "Championships only: types 4 (US Championships) and 8 (US Synchro Championships)."
+        ),
+    )
+    individual_competition_scope = competition_scope_key(individual_scope_label)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        years = analytics.get_judge_years(
+            selected_judge_ids,
+            competition_scope=individual_competition_scope,
+        )
+        year_filter = st.selectbox(
+            "Filter by season year",
+            ["All Years"] + years,
+            key="individual_judge_year",
+            help=(
+                "USFS season year on each competition record (``competition.year``), "
+                "for events this judge scored or appeared on in protocol data."
+            ),
+        )
+        year_filter = None if year_filter == "All Years" else year_filter
+
+    with col2:
+        discipline_types = (
+            analytics.qualifying_event_segment_discipline_types()
+            if individual_competition_scope != COMPETITION_SCOPE_ALL
+            else analytics.get_discipline_types()
+        )
+        discipline_names = [name for dt_id, name in discipline_types]
+        selected_disciplines = st.multiselect(
+            "Filter by Discipline Type",
+            discipline_names,
+            key="individual_judge_disciplines",
+            help="Also limits the competition list and protocol roles to these segment disciplines.",
+        )
+        discipline_ids = [
+            dt_id for dt_id, name in discipline_types
+            if name in selected_disciplines
+        ] if selected_disciplines else None
+
+    use_event_dates = st.checkbox(
+        "Filter by competition event dates",
+        key="individual_judge_use_event_dates",
+        help=(
+            "Uses each competition's start date when set, otherwise its end date. "
+            "Events with neither date are excluded when this filter is on."
+        ),
+    )
+    event_start_date = None
+    event_end_date = None
+    if use_event_dates:
+        date_min, date_max = analytics.get_competition_event_date_bounds(
+            selected_judge_ids,
+            competition_scope=individual_competition_scope,
+            discipline_type_ids=discipline_ids,
+        )
+        date_col1, date_col2 = st.columns(2)
+        with date_col1:
+            event_start_date = st.date_input(
+                "Event on or after",
+                value=date_min,
+                min_value=date_min,
+                max_value=date_max,
+                key="individual_judge_start_date",
+            )
+        with date_col2:
+            event_end_date = st.date_input(
+                "Event on or before",
+                value=date_max,
+                min_value=date_min,
+                max_value=date_max,
+                key="individual_judge_end_date",
+            )
+        if event_start_date > event_end_date:
+            st.warning("Start date is after end date; results may be empty.")
+
+    judge_competitions = analytics.get_judge_competitions(
+        selected_judge_ids,
+        competition_scope=individual_competition_scope,
+        discipline_type_ids=discipline_ids,
+        event_start_date=event_start_date if use_event_dates else None,
+        event_end_date=event_end_date if use_event_dates else None,
+    )
+    competition_names = [
+        f"{name} ({year})" for comp_id, name, year in judge_competitions
+    ]
+    selected_competitions = st.multiselect(
+        "Filter by Competitions",
+        competition_names,
+        help="Ordered by event date (start date, or end date if missing), newest first. "
+        "Includes scored events and protocol appearances (segment_official) in the "
+        "selected discipline types. Only competitions matching the competition scope above "
+        "are listed.",
+    )
+    competition_ids = [
+        comp_id for comp_id, name, year in judge_competitions
+        if f"{name} ({year})" in selected_competitions
+    ] if selected_competitions else None
+
+    # Get data
+    with st.spinner("Loading judge data..."):
+        pcs_df = analytics.get_judge_pcs_stats(
+            selected_judge_ids,
+            year_filter,
+            competition_ids,
+            discipline_ids,
+            competition_scope=individual_competition_scope,
+            event_start_date=event_start_date if use_event_dates else None,
+            event_end_date=event_end_date if use_event_dates else None,
+        )
+        element_df = analytics.get_judge_element_stats(
+            selected_judge_ids,
+            year_filter,
+            competition_ids,
+            discipline_ids,
+            competition_scope=individual_competition_scope,
+            event_start_date=event_start_date if use_event_dates else None,
+            event_end_date=event_end_date if use_event_dates else None,
+        )
+        segment_df = analytics.get_judge_segment_stats(
+            selected_judge_ids,
+            year_filter,
+            competition_ids,
+            discipline_ids,
+            competition_scope=individual_competition_scope,
+            event_start_date=event_start_date if use_event_dates else None,
+            event_end_date=event_end_date if use_event_dates else None,
+        )
+
+    comp_pairs = _individual_judge_protocol_competition_pairs(
+        judge_competitions,
+        pcs_df,
+        element_df,
+        year_filter,
+        competition_ids,
+    )
+
+    if pcs_df.empty and element_df.empty:
+        st.warning(
+            "No PCS or element score data for this judge with the selected filters. "
+            "The protocol roles table below may still list protocol appearances in the "
+            "selected disciplines when segment_official data exists."
+        )
+
+    if comp_pairs:
+        st.subheader("Competitions & protocol roles")
+        roles_df, roles_cap = analytics.get_judge_competition_protocol_roles_rows(
+            selected_judge_ids,
+            comp_pairs,
+            competition_scope=individual_competition_scope,
+            discipline_type_ids=discipline_ids,
+        )
+        if roles_cap:
+            st.caption(roles_cap)
+        st.dataframe(
+            roles_df,
+            width="stretch",
+            hide_index=True,
+            column_config={
+                "Distinct protocol roles": st.column_config.TextColumn(
+                    "Distinct protocol roles",
+                    width="large",
+                    help="Distinct appointment/protocol roles from segment_official for this judge's "
+                    "linked official (or, if unlinked, rows whose protocol official_name matches the "
+                    "judge name), sorted alphabetically within each competition.",
+                ),
+            },
+        )
+        st.caption(
+            "Rows ordered by competition event date (start, else end), newest first; missing dates "
+            "last. Roles within a row are alphabetical and limited to the selected discipline "
+            "types (same as PCS/element stats). Includes competitions from score filters plus "
+            "protocol-only events in the competition filter."
+        )
+
+    # Summary statistics
+    stats = analytics.calculate_judge_summary_stats(pcs_df, element_df)
+
+    st.subheader("Summary Statistics")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.write("**PCS Statistics**")
+        st.metric("Total PCS Scores", stats['pcs_total_scores'])
+        st.metric("PCS Throwout Rate",
+                  f"{stats['pcs_throwout_rate']:.1f}%")
+        st.metric("PCS Anomaly Rate", f"{stats['pcs_anomaly_rate']:.1f}%")
+        st.metric("PCS Rule Error Rate",
+                  f"{stats['pcs_rule_error_rate']:.1f}%")
+
+    with col2:
+        st.write("**Element Statistics**")
+        st.metric("Total Element Scores", stats['element_total_scores'])
+        st.metric("Element Throwout Rate",
+                  f"{stats['element_throwout_rate']:.1f}%")
+        st.metric("Element Anomaly Rate",
+                  f"{stats['element_anomaly_rate']:.1f}%")
+        st.metric("Element Rule Error Rate",
+                  f"{stats['element_rule_error_rate']:.1f}%")
+
+    # Analysis Tables - Elements first, then PCS
+    if not element_df.empty:
+        st.subheader("Element Analysis")
+
+        # Element analysis by type with high/low breakdown
+        def analyze_element_issues(group):
+            total_scores = len(group)
+            throwouts = group['thrown_out'].sum()
+            anomalies = group['anomaly'].sum()
+            rule_errors = group['is_rule_error'].sum()
+
+            # High/Low breakdown for throwouts and anomalies
+            throwout_high = ((group['thrown_out'] == True) &
+                             (group['deviation'] > 0)).sum()
+            throwout_low = ((group['thrown_out'] == True) &
+                            (group['deviation'] < 0)).sum()
+            anomaly_high = ((group['anomaly'] == True) &
+                            (group['deviation'] > 0)).sum()
+            anomaly_low = ((group['anomaly'] == True) &
+                           (group['deviation'] < 0)).sum()
+
+            return pd.Series({
+                'total_scores': total_scores,
+                'throwouts': throwouts,
+                'throwout_high': throwout_high,
+                'throwout_low': throwout_low,
+                'anomalies': anomalies,
+                'anomaly_high': anomaly_high,
+                'anomaly_low': anomaly_low,
+                'rule_errors': rule_errors
+            })
+
+        element_summary = element_df.groupby('element_type_name').apply(
+            analyze_element_issues, include_groups=False).reset_index()
+        element_summary['throwout_rate'] = (
+            element_summary['throwouts'] /
+            element_summary['total_scores']) * 100
+        element_summary['anomaly_rate'] = (
+            element_summary['anomalies'] /
+            element_summary['total_scores']) * 100
+        element_summary['rule_error_rate'] = (
+            element_summary['rule_errors'] /
+            element_summary['total_scores']) * 100
+
+        # Display as table with high/low breakdown
+        st.subheader("Element Rates by Element Type")
+        display_summary = element_summary[[
+            'element_type_name', 'total_scores', 'throwouts',
+            'throwout_high', 'throwout_low', 'throwout_rate', 'anomalies',
+            'anomaly_high', 'anomaly_low', 'anomaly_rate', 'rule_errors',
+            'rule_error_rate'
+        ]].copy()
+        display_summary.columns = [
+            'Element Type', 'Total Scores', 'Throwouts', 'High Throwouts',
+            'Low Throwouts', 'Throwout Rate (%)', 'Anomalies (>2.0)',
+            'High Anomalies', 'Low Anomalies', 'Anomaly Rate (%)',
+            'Rule Errors', 'Rule Error Rate (%)'
+        ]
+        for col in [
+                'Throwout Rate (%)', 'Anomaly Rate (%)',
+                'Rule Error Rate (%)'
+        ]:
+            display_summary[col] = display_summary[col].round(1)
+        st.dataframe(
+            display_summary,
+            width="stretch",
+            hide_index=True,
+            column_config={
+                "Element Type": st.column_config.TextColumn(
+                    "Element Type",
+                    pinned=True,
+                ),
+            },
+        )
+
+        # Detailed element scores with issues
+        st.subheader("Element Score Details")
+
+        # Issue type filters
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            show_thrown_out = st.checkbox("Thrown Out",
+                                          value=True,
+                                          key="elem_thrown_out")
+        with col2:
+            show_anomalies = st.checkbox("Anomalies",
+                                         value=True,
+                                         key="elem_anomalies")
+        with col3:
+            show_rule_errors = st.checkbox("Rule Errors",
+                                           value=True,
+                                           key="elem_rule_errors")
+
+        # Filter based on selected issue types
+        issue_filter = ((element_df['thrown_out'] & show_thrown_out) |
+                        (element_df['anomaly'] & show_anomalies) |
+                        (element_df['is_rule_error'] & show_rule_errors))
+        problem_elements = element_df[issue_filter].copy()
+
+        if not problem_elements.empty:
+
+            def get_issue_type(row):
+                issues = []
+                if row['thrown_out']:
+                    direction = 'High' if row['deviation'] > 0 else 'Low'
+                    issues.append(f'Thrown Out ({direction})')
+                if row['anomaly']:
+                    direction = 'High' if row['deviation'] > 0 else 'Low'
+                    issues.append(f'Anomaly ({direction})')
+                if row['is_rule_error']:
+                    issues.append('Rule Error')
+                return ', '.join(issues)
+
+            problem_elements['issue_type'] = problem_elements.apply(
+                get_issue_type, axis=1)
+
+            # Create display dataframe with proper competition links
+            display_df = problem_elements[[
+                'competition_name', 'competition_url', 'year',
+                'segment_name', 'skater_name', 'element_name',
+                'element_type_name', 'judge_score', 'panel_average',
+                'deviation', 'issue_type'
+            ]].copy()
+            display_df = display_df.drop(columns=['competition_url']).rename(
+                columns={
+                    'competition_name': 'Competition',
+                    'year': 'Year',
+                    'segment_name': 'Segment',
+                    'skater_name': 'Skater',
+                    'element_name': 'Element Name',
+                    'element_type_name': 'Element Type',
+                    'judge_score': 'Judge Score',
+                    'panel_average': 'Panel Average',
+                    'deviation': 'Deviation',
+                    'issue_type': 'Issue Type',
+                }
+            )
+
+            st.dataframe(
+                display_df,
+                width="stretch",
+                hide_index=True,
+                column_config={
+                    "Element Type": st.column_config.TextColumn(
+                        "Element Type",
+                        pinned=True,
+                    ),
+                },
+            )
+
+            # Show competition links separately
+            if 'competition_url' in problem_elements.columns and not problem_elements['competition_url'].isna().all():
+                st.subheader("Competition Links")
+                unique_competitions = problem_elements[[
+                    'competition_name', 'competition_url'
+                ]].drop_duplicates()
+                for _, row in unique_competitions.iterrows():
+                    if pd.notna(row['competition_url']) and row['competition_url']:
+                        href = competition_results_index_url(row['competition_url'])
+                        if href:
+                            st.markdown(
+                                f"[{row['competition_name']}]({href})"
+                            )
+        else:
+            st.info(
+                "No element scores with issues found for selected filters")
+
+    if not pcs_df.empty:
+        st.subheader("PCS Analysis")
+
+        # PCS throwout and deviation rates by type with high/low breakdown
+        def analyze_pcs_issues(group):
+            total_scores = len(group)
+            throwouts = group['thrown_out'].sum()
+            anomalies = group['anomaly'].sum()
+            rule_errors = group['is_rule_error'].sum()
+
+            # High/Low breakdown for throwouts and anomalies
+            throwout_high = ((group['thrown_out'] == True) &
+                             (group['deviation'] > 0)).sum()
+            throwout_low = ((group['thrown_out'] == True) &
+                            (group['deviation'] < 0)).sum()
+            anomaly_high = ((group['anomaly'] == True) &
+                            (group['deviation'] > 0)).sum()
+            anomaly_low = ((group['anomaly'] == True) &
+                           (group['deviation'] < 0)).sum()
+
+            return pd.Series({
+                'total_scores': total_scores,
+                'throwouts': throwouts,
+                'throwout_high': throwout_high,
+                'throwout_low': throwout_low,
+                'anomalies': anomalies,
+                'anomaly_high': anomaly_high,
+                'anomaly_low': anomaly_low,
+                'rule_errors': rule_errors
+            })
+
+        pcs_summary = pcs_df.groupby('pcs_type_name').apply(
+            analyze_pcs_issues, include_groups=False).reset_index()
+        pcs_summary['throwout_rate'] = (pcs_summary['throwouts'] /
+                                        pcs_summary['total_scores']) * 100
+        pcs_summary['anomaly_rate'] = (pcs_summary['anomalies'] /
+                                       pcs_summary['total_scores']) * 100
+        pcs_summary['rule_error_rate'] = (
+            pcs_summary['rule_errors'] / pcs_summary['total_scores']) * 100
+
+        # Display as table with high/low breakdown
+        st.subheader("PCS Rates by Component Type")
+        display_summary = pcs_summary[[
+            'pcs_type_name', 'total_scores', 'throwouts', 'throwout_high',
+            'throwout_low', 'throwout_rate', 'anomalies', 'anomaly_high',
+            'anomaly_low', 'anomaly_rate', 'rule_errors', 'rule_error_rate'
+        ]].copy()
+        display_summary.columns = [
+            'PCS Component', 'Total Scores', 'Throwouts', 'High Throwouts',
+            'Low Throwouts', 'Throwout Rate (%)', 'Anomalies (>1.5)',
+            'High Anomalies', 'Low Anomalies', 'Anomaly Rate (%)',
+            'Rule Errors', 'Rule Error Rate (%)'
+        ]
+        for col in [
+                'Throwout Rate (%)', 'Anomaly Rate (%)',
+                'Rule Error Rate (%)'
+        ]:
+            display_summary[col] = display_summary[col].round(1)
+        st.dataframe(
+            display_summary,
+            width="stretch",
+            hide_index=True,
+            column_config={
+                "PCS Component": st.column_config.TextColumn(
+                    "PCS Component",
+                    pinned=True,
+                ),
+            },
+        )
+
+        # Detailed PCS scores with issues
+        st.subheader("PCS Score Details")
+
+        # Issue type filters
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            show_thrown_out_pcs = st.checkbox("Thrown Out",
+                                              value=True,
+                                              key="pcs_thrown_out")
+        with col2:
+            show_anomalies_pcs = st.checkbox("Anomalies",
+                                             value=True,
+                                             key="pcs_anomalies")
+        with col3:
+            show_rule_errors_pcs = st.checkbox("Rule Errors",
+                                               value=True,
+                                               key="pcs_rule_errors")
+
+        # Filter based on selected issue types
+        issue_filter_pcs = (
+            (pcs_df['thrown_out'] & show_thrown_out_pcs) |
+            (pcs_df['anomaly'] & show_anomalies_pcs) |
+            (pcs_df['is_rule_error'] & show_rule_errors_pcs))
+        problem_pcs = pcs_df[issue_filter_pcs].copy()
+
+        if not problem_pcs.empty:
+
+            def get_issue_type(row):
+                issues = []
+                if row['thrown_out']:
+                    direction = 'High' if row['deviation'] > 0 else 'Low'
+                    issues.append(f'Thrown Out ({direction})')
+                if row['anomaly']:
+                    direction = 'High' if row['deviation'] > 0 else 'Low'
+                    issues.append(f'Anomaly ({direction})')
+                if row['is_rule_error']:
+                    issues.append('Rule Error')
+                return ', '.join(issues)
+
+            problem_pcs['issue_type'] = problem_pcs.apply(get_issue_type,
+                                                          axis=1)
+
+            # Create display dataframe with proper competition links
+            display_df_pcs = problem_pcs[[
+                'competition_name', 'competition_url', 'year',
+                'segment_name', 'skater_name', 'pcs_type_name',
+                'judge_score', 'panel_average', 'deviation', 'issue_type'
+            ]].copy()
+            display_df_pcs = display_df_pcs.drop(columns=['competition_url']).rename(
+                columns={
+                    'competition_name': 'Competition',
+                    'year': 'Year',
+                    'segment_name': 'Segment',
+                    'skater_name': 'Skater',
+                    'pcs_type_name': 'PCS Component',
+                    'judge_score': 'Judge Score',
+                    'panel_average': 'Panel Average',
+                    'deviation': 'Deviation',
+                    'issue_type': 'Issue Type',
+                }
+            )
+
+            st.dataframe(
+                display_df_pcs,
+                width="stretch",
+                hide_index=True,
+                column_config={
+                    "PCS Component": st.column_config.TextColumn(
+                        "PCS Component",
+                        pinned=True,
+                    ),
+                },
+            )
+
+            # Show competition links separately
+            if 'competition_url' in problem_pcs.columns and not problem_pcs['competition_url'].isna().all():
+                st.subheader("Competition Links")
+                unique_competitions_pcs = problem_pcs[[
+                    'competition_name', 'competition_url'
+                ]].drop_duplicates()
+                for _, row in unique_competitions_pcs.iterrows():
+                    if pd.notna(row['competition_url']) and row['competition_url']:
+                        href = competition_results_index_url(row['competition_url'])
+                        if href:
+                            st.markdown(
+                                f"[{row['competition_name']}]({href})"
+                            )
+        else:
+            st.info("No PCS scores with issues found for selected filters")
+
+    # Segment Statistics
+    if not segment_df.empty:
+        st.subheader("Segment Statistics")
+        st.write("Performance summary for segments judged by this judge:")
+
+        # Sort by total anomalies + rule errors descending
+        segment_display = segment_df.copy()
+        segment_display['total_issues'] = segment_display['total_anomalies'] + segment_display['total_rule_errors']
+        segment_display = segment_display.sort_values('total_issues', ascending=False)
+
+        # Calculate allowed errors and excess
+        def calculate_allowed_errors(skater_count):
+            if skater_count <= 10:
+                return 1
+            elif skater_count <= 20:
+                return 2
+            elif skater_count <= 30:
+                return 3
+            elif skater_count <= 40:
+                return 4
+            return 5
+
+        segment_display['allowed_errors'] = segment_display['skater_count'].apply(calculate_allowed_errors)
+        segment_display['excess_anomalies'] = segment_display['total_anomalies'] - segment_display['allowed_errors']
+        segment_display['excess_anomalies'] = segment_display['excess_anomalies'].apply(lambda x: max(0, x))
+
+        # Format the display columns
+        segment_display_cols = segment_display[[
+            'competition_name', 'competition_year', 'discipline', 'segment_name',
+            'skater_count', 'allowed_errors', 'total_anomalies', 'excess_anomalies',
+            'pcs_anomalies', 'element_anomalies', 'total_rule_errors', 
+            'pcs_rule_errors', 'element_rule_errors'
+        ]].copy()
+
+        segment_display_cols.columns = [
+            'Competition', 'Year', 'Discipline', 'Segment',
+            'Skaters', 'Allowed Errors', 'Total Anomalies', 'Excess Anomalies',
+            'PCS Anomalies', 'Element Anomalies', 'Total Rule Errors', 
+            'PCS Rule Errors', 'Element Rule Errors'
+        ]
+
+        # Add totals row
+        totals_row = pd.DataFrame([{
+            'Competition': 'TOTAL',
+            'Year': '',
+            'Discipline': '',
+            'Segment': '',
+            'Skaters': segment_display_cols['Skaters'].sum(),
+            'Allowed Errors': segment_display_cols['Allowed Errors'].sum(),
+            'Total Anomalies': segment_display_cols['Total Anomalies'].sum(),
+            'Excess Anomalies': segment_display_cols['Excess Anomalies'].sum(),
+            'PCS Anomalies': segment_display_cols['PCS Anomalies'].sum(),
+            'Element Anomalies': segment_display_cols['Element Anomalies'].sum(),
+            'Total Rule Errors': segment_display_cols['Total Rule Errors'].sum(),
+            'PCS Rule Errors': segment_display_cols['PCS Rule Errors'].sum(),
+            'Element Rule Errors': segment_display_cols['Element Rule Errors'].sum()
+        }])
+
+        segment_display_with_totals = pd.concat([segment_display_cols, totals_row], ignore_index=True)
+
+        st.dataframe(segment_display_with_totals, width="stretch")
+    else:
+        st.info("No segment data found for selected filters")
+
+    # Download Report
+    st.divider()
+    st.subheader("Download Judge Report")
+    st.write(
+        "Download a report for this judge containing only their data — "
+        "safe to share without exposing other judges' information."
+    )
+
+    safe_name = selected_judge_display.replace(' ', '_').replace('/', '_')
+    single_competition_display_name = None
+    report_filter_lines = None
+    if competition_ids is not None and len(competition_ids) == 1:
+        _cid = competition_ids[0]
+        for comp_id, name, year in judge_competitions:
+            if comp_id == _cid:
+                single_competition_display_name = f"{name} ({year})"
+                break
+    else:
+        scope_summary_line = f"Competition scope: {individual_scope_label}"
+        report_filter_lines = [scope_summary_line]
+        if year_filter is not None:
+            report_filter_lines.append(f"Season year: {year_filter}")
+        else:
+            report_filter_lines.append("Season year: All years")
+        if use_event_dates and event_start_date and event_end_date:
+            report_filter_lines.append(
+                f"Event dates: {event_start_date.isoformat()} – {event_end_date.isoformat()}"
+            )
+        if selected_competitions:
+            report_filter_lines.append(
+                "Competitions: " + ", ".join(selected_competitions)
+            )
+        else:
+            report_filter_lines.append(
+                "Competitions: All (this judge's events)"
+            )
+        if selected_disciplines:
+            report_filter_lines.append(
+                "Discipline types: " + ", ".join(selected_disciplines)
+            )
+        else:
+            report_filter_lines.append("Discipline types: All")
+
+    report_cache_key = (
+        selected_judge_display,
+        year_filter,
+        individual_competition_scope,
+        tuple(selected_disciplines) if selected_disciplines else (),
+        tuple(sorted(competition_ids)) if competition_ids else (),
+        event_start_date.isoformat()
+        if use_event_dates and event_start_date
+        else None,
+        event_end_date.isoformat()
+        if use_event_dates and event_end_date
+        else None,
+        stats.get("pcs_total_scores"),
+        stats.get("element_total_scores"),
+        len(pcs_df),
+        len(element_df),
+        len(segment_df),
+    )
+    if st.session_state.get("individual_judge_report_cache_key") != report_cache_key:
+        st.session_state["individual_judge_report_cache_key"] = report_cache_key
+        st.session_state["individual_judge_report_bytes"] = build_judge_report_html(
+            selected_judge_display,
+            stats,
+            pcs_df,
+            element_df,
+            segment_df,
+            single_competition_display_name=single_competition_display_name,
+            filter_summary_lines=report_filter_lines,
+        )
+    html_bytes = st.session_state["individual_judge_report_bytes"]
+    _dn_comp = ""
+    if single_competition_display_name:
+        _dn_comp = (
+            "_"
+            + single_competition_display_name.replace(" ", "_")
+            .replace("/", "_")
+            .replace("(", "")
+            .replace(")", "")
+        )
+    streamlit_download(
+        "Download Interactive HTML Report",
+        data=html_bytes,
+        file_name=f"judge_report_{safe_name}{_dn_comp}.html",
+        mime="text/html",
+        key="individual_judge_report_download",
+    )
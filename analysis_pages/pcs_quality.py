@@ -0,0 +1,900 @@
+"""
+PCS Quality Analysis page.
+"""
+
+import streamlit as st
+import pandas as pd
+from analytics_connection import (
+    get_analytics_safe,
+    isolated_analytics_session,
+    run_with_isolated_analytics,
+    us_linked_identity_labels_for_ui,
+)
+from officials_competition_types import COMPETITION_SCOPE_ALL
+from analysis_pages.common import (
+    COMPETITION_SCOPE_LABELS,
+    competition_scope_key,
+    streamlit_download,
+)
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_pcs_quality_analysis(
+    start_season_year: str | None,
+    end_season_year: str | None,
+    event_start_iso: str | None,
+    event_end_iso: str | None,
+    discipline_ids_tuple: tuple[int, ...],
+    competition_scope: str,
+):
+    from datetime import date as _date
+
+    from pcs_quality_analysis import run_pcs_quality_analysis
+
+    with isolated_analytics_session() as analytics:
+        event_start = _date.fromisoformat(event_start_iso) if event_start_iso else None
+        event_end = _date.fromisoformat(event_end_iso) if event_end_iso else None
+        return run_pcs_quality_analysis(
+            analytics,
+            start_season_year=start_season_year,
+            end_season_year=end_season_year,
+            event_start_date=event_start,
+            event_end_date=event_end,
+            discipline_type_ids=list(discipline_ids_tuple),
+            competition_scope=competition_scope,
+        )
+
+
+def _pcs_quality_methodology_text(topic: str) -> str:
+    """Markdown for the PCS quality methodology dropdown."""
+    texts = {
+        "Overview": """
+**Data** — PCS marks from competitions with event date on or after **2022-07-01**.
+Judges linked to the same directory official are one identity (same as other pages).
+
+**Per skater × segment × PCS component** — Panel reference is the **median** of all
+judges’ PCS on that line. Metrics are computed separately for each judge identity,
+discipline, and PCS component (SS, TR, PE, CO, etc.) present in the **filtered** window.
+
+**Component set per discipline** — For each discipline, only PCS components that
+appear somewhere in the filtered marks are used (not a fixed historical list).
+
+**Minimum PCS marks** — Optional filter: exclude judge identities with fewer than
+*N* PCS marks in the filtered range (each skater × component line counts as one mark).
+
+**Three alignment measures (per judge × discipline × PCS component)** — Each is scaled
+to 0–1 (higher = closer to the panel). They are reported and ranked **separately**;
+there is no combined overall score.
+
+| Measure | What it captures |
+| --- | --- |
+| Ranking | Per segment, does skater rank order match the panel? (mean across segments) |
+| Bias | Are your PCS systematically high or low vs the panel? |
+| Differentiation | Is your spread of marks similar to the panel’s spread? |
+
+**Judge-level scores** — Equal weight across PCS components in each discipline, then
+mark-weighted across disciplines. Each measure has its own ranking table.
+
+""",
+        "Ranking correlation score": """
+For one judge, one discipline, one PCS component: each **segment** (short program,
+free skate, etc.) is one **event**. Within that segment, rank all skaters on that
+component and compute Spearman **ρ** between the judge’s ranks and panel medians
+(needs at least **3 skaters** in the segment).
+
+Per segment:
+
+``segment_ranking = max(0, (ρ − 0.7) / 0.3)``  
+
+**Ranking sub-score** = equal-weight mean of ``segment_ranking`` over segments the
+judge marked (segments with &lt;3 skaters are skipped). **Spearman ρ** in the detail
+table is the mean ρ across those segments. Bias and differentiation are separate
+measures (not combined with ranking).
+""",
+        "Bias score": """
+Per skater-line: ``bias = judge_PCS − panel_median_PCS``.
+
+``average_bias = mean(bias)`` over skater-lines in that judge × discipline × component.
+
+``bias_score = max(0, 1 − |average_bias| / 0.5)``  
+
+0 average bias → 1; |average bias| ≥ 0.5 → 0.
+""",
+        "Differentiation score": """
+Compare spread of judge PCS vs spread of panel medians across skater-lines (same slice).
+
+``judge_variance = variance(judge_PCS)``  
+``panel_variance = variance(panel_median)``  
+
+``diff_score = max(0, min(1, 1 − |log(judge_variance / panel_variance)|))``  
+
+1 when variances match; penalizes much wider or narrower marking than the panel.
+
+``bias_tendency`` and ``spread_tendency`` summarize direction (lenient/harsh; wider/narrower).
+""",
+        "Judge-level aggregation": """
+For each measure, **discipline score** = equal-weight mean over PCS components the
+judge marked in that discipline (among components present in the filtered period).
+
+**Judge score** = mark-weighted mean across disciplines:
+
+``judge_score = Σ (discipline_score × PCS_marks_in_discipline) / Σ PCS_marks``  
+
+The three measures are independent; rankings are computed separately for each.
+""",
+    }
+    return texts.get(topic, "")
+
+
+def _pcs_quality_metric_ranking_column_config(metric_label: str) -> dict:
+    cfg = {
+        "Rank": st.column_config.NumberColumn(
+            "Rank",
+            format="%d",
+            width="small",
+            help=f"Order by {metric_label} (1 = highest).",
+        ),
+        "Judge": st.column_config.TextColumn(
+            "Judge",
+            width="medium",
+            help="Official identity (directory-linked judges grouped).",
+        ),
+        metric_label: st.column_config.NumberColumn(
+            metric_label,
+            format="%.4f",
+            width="small",
+            help=f"{metric_label} in [0, 1]; higher = closer to the panel on this measure.",
+        ),
+        "Disciplines": st.column_config.NumberColumn(
+            "Disciplines",
+            format="%d",
+            width="small",
+            help="Number of discipline types this judge scored in the filtered range.",
+        ),
+        "PCS marks": st.column_config.NumberColumn(
+            "PCS marks",
+            format="%d",
+            width="small",
+            help="PCS lines (judge × skater × segment × component) in the filtered range.",
+        ),
+    }
+    if metric_label == "Ranking score":
+        cfg["Mean Spearman ρ"] = st.column_config.NumberColumn(
+            "Mean Spearman ρ",
+            format="%.3f",
+            width="small",
+            help="Mean segment-level Spearman ρ across components and disciplines.",
+        )
+    if metric_label == "Bias score":
+        cfg["Mean bias"] = st.column_config.NumberColumn(
+            "Mean bias",
+            format="%+.3f",
+            width="small",
+            help="Average judge PCS − panel median; positive = lenient, negative = harsh.",
+        )
+        cfg["Tendency"] = st.column_config.TextColumn(
+            "Tendency",
+            width="medium",
+            help="Lenient, harsh, or neutral from mean bias (|mean| ≤ 0.05 → neutral).",
+        )
+    if metric_label == "Differentiation score":
+        cfg["Var ratio"] = st.column_config.NumberColumn(
+            "Var ratio",
+            format="%.2f",
+            width="small",
+            help="Judge mark variance ÷ panel median variance (>1 wider, <1 narrower).",
+        )
+        cfg["Spread vs panel"] = st.column_config.TextColumn(
+            "Spread vs panel",
+            width="medium",
+            help="Wider, narrower, or similar spread vs panel (ratio outside 0.9–1.1).",
+        )
+    return cfg
+
+
+_PCS_METRIC_RANKING_UI: tuple[tuple[str, str, str, str], ...] = (
+    (
+        "ranking",
+        "Ranking score",
+        "Ranking — rank order vs panel",
+        "Per segment, how well skater rank order on each PCS component matches "
+        "the panel (segments with fewer than 3 skaters are skipped).",
+    ),
+    (
+        "bias",
+        "Bias score",
+        "Bias — systematic PCS vs panel",
+        "Whether PCS marks are systematically above or below panel medians, "
+        "averaged across all lines in scope. A higher score means marks are "
+        "generally closer to the panel median (less systematic leniency or harshness).",
+    ),
+    (
+        "differentiation",
+        "Differentiation score",
+        "Differentiation — mark spread vs panel",
+        "Whether the spread of this judge's PCS matches the panel's spread. "
+        "See **Spread vs panel** (wider / narrower / similar) and **Var ratio** "
+        "(judge variance ÷ panel variance). A higher score means spread is closer to the panel.",
+    ),
+)
+
+
+def _pcs_quality_format_discipline_summary(disc_sub: pd.DataFrame) -> pd.DataFrame:
+    """Compact columns for the per-judge discipline table."""
+    if disc_sub.empty:
+        return disc_sub
+    out = disc_sub.copy()
+    out = out.rename(
+        columns={
+            "discipline": "Discipline",
+            "ranking_score": "Ranking",
+            "bias_score": "Bias",
+            "mean_bias": "Mean bias",
+            "bias_tendency": "Tendency",
+            "diff_score": "Differentiation",
+            "variance_ratio": "Var ratio",
+            "spread_tendency": "Spread",
+            "n_components_scored": "Components",
+            "PCS marks": "Marks",
+        }
+    )
+    for col in ("Ranking", "Bias", "Differentiation", "Var ratio"):
+        if col in out.columns:
+            out[col] = pd.to_numeric(out[col], errors="coerce").round(4)
+    if "Mean bias" in out.columns:
+        out["Mean bias"] = pd.to_numeric(out["Mean bias"], errors="coerce").round(3)
+    display_cols = [
+        "Discipline",
+        "Ranking",
+        "Bias",
+        "Mean bias",
+        "Tendency",
+        "Differentiation",
+        "Var ratio",
+        "Spread",
+        "Components",
+        "Marks",
+    ]
+    return out[[c for c in display_cols if c in out.columns]]
+
+
+def _pcs_quality_discipline_column_config() -> dict:
+    return {
+        "Discipline": st.column_config.TextColumn(
+            "Discipline",
+            width="medium",
+            help="Discipline type for this block of PCS marks.",
+        ),
+        "Ranking": st.column_config.NumberColumn(
+            "Ranking",
+            format="%.4f",
+            width="small",
+            help="Equal-weight mean ranking score across PCS components in this discipline.",
+        ),
+        "Bias": st.column_config.NumberColumn(
+            "Bias",
+            format="%.4f",
+            width="small",
+            help="Equal-weight mean bias score in this discipline.",
+        ),
+        "Mean bias": st.column_config.NumberColumn(
+            "Mean bias",
+            format="%+.3f",
+            width="small",
+            help="Mark-weighted mean judge − panel in this discipline.",
+        ),
+        "Tendency": st.column_config.TextColumn(
+            "Tendency",
+            width="medium",
+            help="Lenient, harsh, or neutral from mean bias.",
+        ),
+        "Differentiation": st.column_config.NumberColumn(
+            "Differentiation",
+            format="%.4f",
+            width="small",
+            help="Equal-weight mean differentiation score in this discipline.",
+        ),
+        "Var ratio": st.column_config.NumberColumn(
+            "Var ratio",
+            format="%.2f",
+            width="small",
+            help="Mark-weighted variance ratio in this discipline.",
+        ),
+        "Spread": st.column_config.TextColumn(
+            "Spread",
+            width="medium",
+            help="Wider, narrower, or similar vs panel spread.",
+        ),
+        "Components": st.column_config.NumberColumn(
+            "Components",
+            format="%d",
+            width="small",
+            help=(
+                "PCS components this judge marked in this discipline "
+                "(among components present in the filtered period)."
+            ),
+        ),
+        "Marks": st.column_config.NumberColumn(
+            "Marks",
+            format="%d",
+            width="small",
+            help="PCS lines for this judge in this discipline within the filters.",
+        ),
+    }
+
+
+def _pcs_quality_component_column_config() -> dict:
+    return {
+        "Discipline": st.column_config.TextColumn(
+            "Discipline",
+            width="medium",
+            help="Discipline type for this PCS component block.",
+        ),
+        "Component": st.column_config.TextColumn(
+            "Component",
+            width="small",
+            help="PCS component code (SS, TR, PE, CO, PR, TI, …).",
+        ),
+        "Spearman ρ": st.column_config.NumberColumn(
+            "Spearman ρ",
+            format="%.3f",
+            width="small",
+            help=(
+                "Mean Spearman ρ across segments: within each segment, judge vs panel "
+                "skater rank order on this component (segments with <3 skaters skipped)."
+            ),
+        ),
+        "Segments ranked": st.column_config.NumberColumn(
+            "Segments ranked",
+            format="%d",
+            width="small",
+            help=(
+                "Segments with ≥3 skaters where rank correlation was computed "
+                "(each segment is one event)."
+            ),
+        ),
+        "Ranking score": st.column_config.NumberColumn(
+            "Ranking score",
+            format="%.3f",
+            width="small",
+            help=(
+                "Equal-weight mean of per-segment rank scores: each segment maps "
+                "ρ to max(0, (ρ−0.7)/0.3)."
+            ),
+        ),
+        "Mean bias": st.column_config.NumberColumn(
+            "Mean bias",
+            format="%+.3f",
+            width="small",
+            help="Average (judge PCS − panel median). Positive = tends above the panel.",
+        ),
+        "Tendency": st.column_config.TextColumn(
+            "Tendency",
+            width="medium",
+            help="Lenient, harsh, or neutral from mean bias.",
+        ),
+        "Bias score": st.column_config.NumberColumn(
+            "Bias score",
+            format="%.3f",
+            width="small",
+            help="Scaled bias score in [0, 1].",
+        ),
+        "Differentiation score": st.column_config.NumberColumn(
+            "Differentiation score",
+            format="%.3f",
+            width="small",
+            help="Scaled match of mark spread vs panel.",
+        ),
+        "Var ratio": st.column_config.NumberColumn(
+            "Var ratio",
+            format="%.2f",
+            width="small",
+            help="Judge variance ÷ panel variance for this component.",
+        ),
+        "Spread": st.column_config.TextColumn(
+            "Spread",
+            width="medium",
+            help="Wider, narrower, or similar vs panel.",
+        ),
+        "PCS marks": st.column_config.NumberColumn(
+            "PCS marks",
+            format="%d",
+            width="small",
+            help="Skater-segment lines for this judge × discipline × component.",
+        ),
+    }
+
+
+def _pcs_quality_format_component_detail(detail: pd.DataFrame) -> pd.DataFrame:
+    if detail.empty:
+        return detail
+    out = detail.copy()
+    out = out.sort_values(
+        ["discipline", "ranking_score", "component"],
+        ascending=[True, False, True],
+    )
+    out = out.rename(
+        columns={
+            "discipline": "Discipline",
+            "component": "Component",
+            "spearman_rho": "Spearman ρ",
+            "n_segments_ranked": "Segments ranked",
+            "ranking_score": "Ranking score",
+            "mean_bias": "Mean bias",
+            "bias_score": "Bias score",
+            "bias_tendency": "Tendency",
+            "diff_score": "Differentiation score",
+            "variance_ratio": "Var ratio",
+            "spread_tendency": "Spread",
+            "n_marks": "PCS marks",
+        }
+    )
+    display_cols = [
+        "Discipline",
+        "Component",
+        "Spearman ρ",
+        "Segments ranked",
+        "Ranking score",
+        "Mean bias",
+        "Tendency",
+        "Bias score",
+        "Differentiation score",
+        "Var ratio",
+        "Spread",
+        "PCS marks",
+    ]
+    if "Var ratio" in out.columns:
+        out["Var ratio"] = pd.to_numeric(out["Var ratio"], errors="coerce").round(2)
+    for col in (
+        "Spearman ρ",
+        "Ranking score",
+        "Mean bias",
+        "Bias score",
+        "Differentiation score",
+    ):
+        if col in out.columns:
+            out[col] = pd.to_numeric(out[col], errors="coerce").round(4)
+    if "Mean bias" in out.columns:
+        out["Mean bias"] = out["Mean bias"].round(3)
+    return out[[c for c in display_cols if c in out.columns]]
+
+
+def pcs_quality_analysis_page() -> None:
+    """PCS judge quality vs panel medians for post-2022-07-01 competitions."""
+    from pcs_quality_analysis import MIN_PCS_ANALYSIS_EVENT_DATE
+
+    st.header("PCS Quality Analysis")
+    from pcs_quality_analysis import PCS_QUALITY_MAX_MARKS
+
+    st.caption(
+        "Three separate alignment measures vs **panel medians** on PCS (ranking, bias, "
+        "differentiation). Each has its own ranking table — they are not "
+        "combined into one score. **Discipline** is required (defaults to Singles). "
+        "Components per discipline are equal-weighted; disciplines "
+        "are mark-weighted. Only competitions on or after "
+        f"**{MIN_PCS_ANALYSIS_EVENT_DATE.isoformat()}** are included. "
+        f"Large filters load up to **{PCS_QUALITY_MAX_MARKS:,}** PCS marks "
+        "(set ``PCS_QUALITY_MAX_MARKS`` on the server to raise the cap). "
+        "Warm shards with ``scripts/precompute_pcs_quality_cache.py`` "
+        "(add ``--summaries`` for cache-only loads without loading all marks)."
+    )
+
+    with st.expander("How scores are calculated", expanded=False):
+        methodology_topic = st.selectbox(
+            "Topic",
+            [
+                "Overview",
+                "Ranking correlation score",
+                "Bias score",
+                "Differentiation score",
+                "Judge-level aggregation",
+            ],
+            index=0,
+            key="pcs_quality_methodology",
+            help="Reference only — there is no alternate scoring model on this page.",
+        )
+        st.markdown(_pcs_quality_methodology_text(methodology_topic))
+
+    analytics = get_analytics_safe()
+
+    scope_label = st.selectbox(
+        "Competition scope",
+        list(COMPETITION_SCOPE_LABELS),
+        index=0,
+        key="pcs_quality_competition_scope",
+        help="Filters competitions via linked officials competition type.",
+    )
+    scope_key = competition_scope_key(scope_label)
+
+    years = sorted(
+        {str(y) for y in analytics.get_years() if y},
+        reverse=True,
+    )
+    col_y1, col_y2 = st.columns(2)
+    with col_y1:
+        start_season = st.selectbox(
+            "Season year from",
+            ["Any"] + years,
+            key="pcs_quality_start_season",
+        )
+        start_season_year = None if start_season == "Any" else start_season
+    with col_y2:
+        end_season = st.selectbox(
+            "Season year to",
+            ["Any"] + years,
+            key="pcs_quality_end_season",
+        )
+        end_season_year = None if end_season == "Any" else end_season
+
+    if start_season_year is None and end_season_year is None:
+        st.warning(
+            "Season year is **Any** for both bounds — this loads every PCS mark since "
+            "2022-07-01 and may time out or crash on small servers. Prefer a season range "
+            "or enable event dates."
+        )
+
+    use_event_dates = st.checkbox(
+        "Narrow by competition event dates",
+        key="pcs_quality_use_event_dates",
+        help=(
+            "Further restrict by event date (still at least "
+            f"{MIN_PCS_ANALYSIS_EVENT_DATE.isoformat()})."
+        ),
+    )
+    event_start_date = None
+    event_end_date = None
+    if use_event_dates:
+        date_min, date_max = analytics.get_competition_event_date_bounds(
+            competition_scope=scope_key,
+        )
+        date_min = max(date_min, MIN_PCS_ANALYSIS_EVENT_DATE)
+        date_max = max(date_max, date_min)
+        dc1, dc2 = st.columns(2)
+        with dc1:
+            event_start_date = st.date_input(
+                "Event on or after",
+                value=date_min,
+                min_value=MIN_PCS_ANALYSIS_EVENT_DATE,
+                max_value=date_max,
+                key="pcs_quality_start_date",
+            )
+        with dc2:
+            event_end_date = st.date_input(
+                "Event on or before",
+                value=date_max,
+                min_value=MIN_PCS_ANALYSIS_EVENT_DATE,
+                max_value=date_max,
+                key="pcs_quality_end_date",
+            )
+        if event_start_date > event_end_date:
+            st.warning("Start date is after end date; results may be empty.")
+
+    event_start_iso = (
+        event_start_date.isoformat()
+        if use_event_dates and event_start_date
+        else None
+    )
+    event_end_iso = (
+        event_end_date.isoformat() if use_event_dates and event_end_date else None
+    )
+
+    if scope_key != COMPETITION_SCOPE_ALL:
+        discipline_types = analytics.qualifying_event_segment_discipline_types()
+    else:
+        discipline_types = analytics.get_discipline_types()
+    discipline_names = [name for _id, name in discipline_types if name]
+
+    def _pcs_quality_default_discipline_selection() -> list[str]:
+        if "Singles" in discipline_names:
+            return ["Singles"]
+        return [discipline_names[0]] if discipline_names else []
+
+    if "pcs_quality_disciplines" not in st.session_state:
+        st.session_state["pcs_quality_disciplines"] = (
+            _pcs_quality_default_discipline_selection()
+        )
+    else:
+        valid = [
+            n
+            for n in st.session_state["pcs_quality_disciplines"]
+            if n in discipline_names
+        ]
+        if not valid:
+            st.session_state["pcs_quality_disciplines"] = (
+                _pcs_quality_default_discipline_selection()
+            )
+        elif valid != st.session_state["pcs_quality_disciplines"]:
+            st.session_state["pcs_quality_disciplines"] = valid
+
+    selected_disciplines = st.multiselect(
+        "Discipline types",
+        discipline_names,
+        key="pcs_quality_disciplines",
+        help="Required. Defaults to Singles. Analysis includes only the selected segment disciplines.",
+    )
+    discipline_ids = [
+        dt_id for dt_id, name in discipline_types if name in selected_disciplines
+    ]
+    disciplines_ok = bool(selected_disciplines)
+    if not disciplines_ok:
+        st.warning("Select at least one discipline type to run or view results.")
+
+    col_pcs_cache = st.columns([2, 1])[1]
+    with col_pcs_cache:
+        use_pcs_precomputed_cache = st.checkbox(
+            "Use precomputed cache",
+            value=True,
+            key="pcs_quality_use_cache",
+            help=(
+                "Load cached season×discipline PCS shards (missing shards are computed)."
+            ),
+        )
+
+    if "pcs_quality_min_pcs_marks" not in st.session_state:
+        st.session_state["pcs_quality_min_pcs_marks"] = 0
+    min_pcs_marks = st.number_input(
+        "Minimum PCS marks per judge",
+        min_value=0,
+        step=10,
+        key="pcs_quality_min_pcs_marks",
+        help=(
+            "Exclude judge identities with fewer PCS marks in the filtered range. "
+            "Changing only this re-filters the last run (no reload)."
+        ),
+    )
+    us_officials_only = st.checkbox(
+        "US directory officials only",
+        key="pcs_quality_us_officials_only",
+        help=(
+            "Show rankings only for judges linked to a USFS official. "
+            "PCS quality scores still use the full judge pool."
+        ),
+    )
+
+    run_clicked = st.button("Run analysis", type="primary", key="pcs_quality_run_btn")
+
+    if run_clicked:
+        if not disciplines_ok:
+            st.error("Select at least one discipline type before running.")
+        else:
+            from datetime import date as _date
+
+            from pcs_quality_cache import load_cached_pcs_quality
+
+            event_start = (
+                _date.fromisoformat(event_start_iso) if event_start_iso else None
+            )
+            event_end = _date.fromisoformat(event_end_iso) if event_end_iso else None
+            if use_pcs_precomputed_cache:
+
+                def _load_pcs_cache(
+                    cache_analytics,
+                    *,
+                    start_sy,
+                    end_sy,
+                    ev_start,
+                    ev_end,
+                    disc_ids,
+                    scope,
+                ):
+                    return load_cached_pcs_quality(
+                        cache_analytics.session,
+                        cache_analytics,
+                        start_season_year=start_sy,
+                        end_season_year=end_sy,
+                        event_start_date=ev_start,
+                        event_end_date=ev_end,
+                        discipline_type_ids=disc_ids,
+                        competition_scope=scope,
+                    )
+
+                cached = run_with_isolated_analytics(
+                    _load_pcs_cache,
+                    start_sy=start_season_year,
+                    end_sy=end_season_year,
+                    ev_start=event_start,
+                    ev_end=event_end,
+                    disc_ids=discipline_ids,
+                    scope=scope_key,
+                )
+                if cached is not None:
+                    st.session_state.pcs_quality_result = cached
+                    st.success("Loaded precomputed PCS cache for this filter set.")
+                    st.rerun()
+            with st.spinner("Loading PCS marks and computing judge profiles…"):
+                st.session_state.pcs_quality_result = _cached_pcs_quality_analysis(
+                    start_season_year,
+                    end_season_year,
+                    event_start_iso,
+                    event_end_iso,
+                    tuple(discipline_ids),
+                    scope_key,
+                )
+
+    base_result = st.session_state.get("pcs_quality_result")
+    if not disciplines_ok:
+        return
+    if base_result is None:
+        st.info("Set filters and click **Run analysis**.")
+        return
+
+    from pcs_quality_analysis import apply_min_pcs_marks_to_result
+
+    # Drop legacy huge ``marks`` payloads from session (pre-perf runs).
+    if isinstance(base_result, dict) and "marks" in base_result:
+        base_result = {k: v for k, v in base_result.items() if k != "marks"}
+        st.session_state.pcs_quality_result = base_result
+
+    result = apply_min_pcs_marks_to_result(base_result, int(min_pcs_marks))
+    if us_officials_only:
+        from judge_official_display_filter import (
+            apply_us_officials_display_filter_to_pcs_result,
+        )
+
+        n_before_us = len(result.get("profiles", pd.DataFrame()))
+        result = apply_us_officials_display_filter_to_pcs_result(
+            result, us_linked_identity_labels_for_ui()
+        )
+        n_after_us = len(result.get("profiles", pd.DataFrame()))
+        if n_before_us and n_after_us < n_before_us:
+            st.caption(
+                f"US officials display filter: **{n_after_us}** of {n_before_us} ranked "
+                "identities are linked to the USFS directory."
+            )
+
+    if result.get("error") and result["profiles"].empty:
+        err = result["error"]
+        if "exceeds limit" in err.lower():
+            st.error(err)
+        else:
+            st.warning(err)
+        return
+
+    profiles = result["profiles"]
+    component_detail = result.get("component_detail", pd.DataFrame())
+    discipline_summary = result.get("discipline_summary", pd.DataFrame())
+    n_marks = int(result.get("n_raw_marks") or 0)
+
+    n_before = result.get("n_judges_before_min_filter")
+    excluded = (
+        int(n_before) - len(profiles)
+        if n_before is not None and int(min_pcs_marks) > 0
+        else 0
+    )
+
+    if int(min_pcs_marks) > 0:
+        m1, m2, m3 = st.columns(3)
+        m1.metric("PCS marks in scope", f"{n_marks:,}")
+        m2.metric("Judges ranked", len(profiles))
+        m3.metric(
+            "Excluded (below min marks)",
+            excluded,
+            help=f"Judges with fewer than {int(min_pcs_marks)} PCS marks in scope",
+        )
+    else:
+        m1, m2 = st.columns(2)
+        m1.metric("PCS marks in scope", f"{n_marks:,}")
+        m2.metric("Judges ranked", len(profiles))
+
+    if profiles.empty:
+        n_before = base_result.get("n_judges") or 0
+        if int(min_pcs_marks) > 0 and n_before > 0:
+            st.warning(
+                f"No judges meet the minimum of **{int(min_pcs_marks)}** PCS marks "
+                f"({n_before} judge(s) had marks in scope)."
+            )
+        else:
+            st.info("No judge profiles could be built for the selected filters.")
+        return
+
+    with st.expander("What do the three measures mean?", expanded=False):
+        st.markdown(
+            """
+Each **PCS component** (SS, TR, PE, CO, …) is scored separately against **panel medians**
+on the same skater-segment lines. **Ranking** is computed per segment (event), then
+averaged. Three scores (0–1, higher is better) are reported **independently**:
+
+- **Ranking** — Per segment, rank-order agreement vs panel; mean across segments (≥3 skaters each)  
+- **Bias** — Average PCS above/below panel (penalizes systematic leniency/harshness)  
+- **Differentiation** — Whether your mark spread matches the panel’s spread  
+
+Within each discipline: equal weight across components you marked.  
+Across disciplines: mark-weighted. Open **How scores are calculated** above for formulas.
+            """
+        )
+
+    metric_rankings = result.get("metric_rankings") or {}
+    st.subheader("Rankings by measure")
+    st.caption(
+        "Higher scores (closer to 1) indicate closer alignment with the panel on that measure."
+    )
+    for slug, label, title, description in _PCS_METRIC_RANKING_UI:
+        rank_df = metric_rankings.get(slug, pd.DataFrame())
+        if rank_df is None or rank_df.empty:
+            continue
+        st.markdown(f"#### {title}")
+        st.caption(description)
+        st.dataframe(
+            rank_df,
+            width="stretch",
+            hide_index=True,
+            column_config=_pcs_quality_metric_ranking_column_config(label),
+        )
+        streamlit_download(
+            f"Download {slug} rankings CSV",
+            data=rank_df.to_csv(index=False).encode("utf-8"),
+            file_name=f"pcs_quality_{slug}_rankings.csv",
+            mime="text/csv",
+            key=f"pcs_quality_{slug}_rankings_download",
+        )
+
+    judge_names = sorted(profiles["Judge"].tolist(), key=str.lower)
+    pick = st.selectbox("Judge detail", judge_names, key="pcs_quality_detail_judge")
+    if pick:
+        judge_row = profiles.loc[profiles["Judge"] == pick]
+        if not judge_row.empty:
+            jr = judge_row.iloc[0]
+            st.subheader(f"Summary — {pick}")
+            s1, s2, s3 = st.columns(3)
+            s1.metric("Ranking score", f"{jr.get('ranking_score', 0):.4f}")
+            s2.metric("Bias score", f"{jr.get('bias_score', 0):.4f}")
+            s3.metric("Differentiation score", f"{jr.get('diff_score', 0):.4f}")
+            if jr.get("bias_tendency"):
+                st.caption(
+                    f"Bias tendency: **{jr['bias_tendency']}** "
+                    f"(mean bias {float(jr.get('mean_bias', 0)):+.3f})"
+                )
+            if jr.get("spread_tendency"):
+                st.caption(
+                    f"Spread: **{jr['spread_tendency']}** "
+                    f"(variance ratio {float(jr.get('variance_ratio', 0)):.2f})"
+                )
+            rho = jr.get("Mean Spearman ρ")
+            if rho is not None and pd.notna(rho):
+                st.caption(f"Mean Spearman ρ (ranking): {float(rho):.3f}")
+            st.caption(f"PCS marks in scope: {int(jr.get('PCS marks', 0)):,}")
+
+        if not discipline_summary.empty:
+            disc_sub = discipline_summary.loc[
+                discipline_summary["identity"] == pick
+            ].copy()
+            if not disc_sub.empty:
+                st.subheader(f"By discipline — {pick}")
+                st.caption(
+                    "Equal-weight mean of each measure across PCS components in that discipline."
+                )
+                disc_display = _pcs_quality_format_discipline_summary(disc_sub)
+                st.dataframe(
+                    disc_display,
+                    width="stretch",
+                    hide_index=True,
+                    column_config=_pcs_quality_discipline_column_config(),
+                )
+
+        if not component_detail.empty:
+            comp_sub = component_detail.loc[
+                component_detail["identity"] == pick
+            ].copy()
+            if not comp_sub.empty:
+                st.subheader(f"By PCS component — {pick}")
+                st.caption(
+                    "One row per discipline × component the judge marked. Scores are in [0, 1] "
+                    "(higher = closer to the panel on that measure). Scroll horizontally for all columns."
+                )
+                comp_display = _pcs_quality_format_component_detail(comp_sub)
+                st.dataframe(
+                    comp_display,
+                    width="stretch",
+                    hide_index=True,
+                    column_config=_pcs_quality_component_column_config(),
+                )
+                from app_query_params import label_to_query_slug
+
+                _pick_slug = label_to_query_slug(pick)
+                streamlit_download(
+                    f"Download component detail CSV ({pick})",
+                    data=comp_display.to_csv(index=False).encode("utf-8"),
+                    file_name=f"pcs_quality_{_pick_slug}_components.csv",
+                    mime="text/csv",
+                    key=f"pcs_quality_comp_dl_{_pick_slug}",
+                )
@@ -0,0 +1,146 @@
+"""
+Rule Errors Analysis page.
+"""
+
+import streamlit as st
+import pandas as pd
+from analytics_connection import get_analytics_safe
+from analysis_pages.common import (
+    COMPETITION_SCOPE_LABELS,
+    competition_scope_key,
+    identity_group_options,
+    competition_results_index_url,
+)
+
+
+def rule_errors_analysis_page() -> None:
+    st.header("Rule Errors Analysis")
+
+    analytics = get_analytics_safe()
+
+    # Filters
+    st.subheader("Filters")
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        years = analytics.get_years()
+        year_filter = st.selectbox("Filter by Year", ["All Years"] + years, key="rule_errors_year")
+        year_filter = None if year_filter == "All Years" else year_filter
+
+    with col2:
+        qualifying_scope_label = st.selectbox(
+            "Competition scope",
+            list(COMPETITION_SCOPE_LABELS),
+            index=0,
+            key="rule_errors_qualifying",
+            help=(
+                "Qualifying: linked officials type is set and not id 11. "
+                "NQS: linked officials type id 10. "
+                "Sectionals & championships: types 1–9. "
+                "Championships only: types 4 and 8."
+            ),
+        )
+        rule_errors_competition_scope = competition_scope_key(qualifying_scope_label)
+
+    with col3:
+        competitions = analytics.get_competitions(
+            competition_scope=rule_errors_competition_scope
+        )
+        competition_names = [f"{name} ({year})" for comp_id, name, year in competitions]
+        selected_competitions = st.multiselect("Filter by Competitions", competition_names, key="rule_errors_comps")
+        competition_ids = [
+            comp_id for comp_id, name, year in competitions
+            if f"{name} ({year})" in selected_competitions
+        ] if selected_competitions else None
+
+    with col4:
+        _re_labels, _re_map = identity_group_options(analytics)
+        selected_judge_identities = st.multiselect(
+            "Filter by Judges",
+            _re_labels,
+            key="rule_errors_judges",
+        )
+        judge_ids = sorted(
+            {jid for lab in selected_judge_identities for jid in _re_map[lab]}
+        ) if selected_judge_identities else None
+
+    # Get rule errors data
+    with st.spinner("Loading rule errors data..."):
+        rule_errors_df = analytics.get_all_rule_errors(
+            year_filter,
+            competition_ids,
+            judge_ids,
+            competition_scope=rule_errors_competition_scope,
+        )
+
+    if rule_errors_df.empty:
+        st.warning("No rule errors found with selected filters")
+    else:
+        # Summary statistics
+        st.subheader("Rule Errors Summary")
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.metric("Total Rule Errors", len(rule_errors_df))
+
+        with col2:
+            pcs_errors = len(rule_errors_df[rule_errors_df['element_name'] == ''])
+            st.metric("PCS Rule Errors", pcs_errors)
+
+        with col3:
+            element_errors = len(rule_errors_df[rule_errors_df['element_name'] != ''])
+            st.metric("Element Rule Errors", element_errors)
+
+        with col4:
+            unique_judges = rule_errors_df['judge_name'].nunique()
+            st.metric("Judges with Rule Errors", unique_judges)
+
+        # Rule errors by judge
+        st.subheader("Rule Errors by Judge")
+        judge_summary = rule_errors_df.groupby('judge_name').agg({
+            'judge_id': 'first',
+            'element_name': 'count'
+        }).rename(columns={'element_name': 'total_rule_errors'})
+
+        # Count PCS vs Element errors (using element_type column to distinguish)
+        pcs_errors_count = rule_errors_df[rule_errors_df['element_name'] == ''].groupby('judge_name').size().fillna(0)
+        element_errors_count = rule_errors_df[rule_errors_df['element_name'] != ''].groupby('judge_name').size().fillna(0)
+
+        judge_summary['pcs_errors'] = pcs_errors_count
+        judge_summary['element_errors'] = element_errors_count
+        judge_summary = judge_summary.sort_values('total_rule_errors', ascending=False).reset_index()
+
+        judge_summary_display = judge_summary[['judge_name', 'total_rule_errors', 'pcs_errors', 'element_errors']].copy()
+        judge_summary_display.columns = ['Judge', 'Total Rule Errors', 'PCS Errors', 'Element Errors']
+
+        st.dataframe(judge_summary_display, width="stretch")
+
+        # Detailed rule errors table
+        st.subheader("Detailed Rule Errors")
+
+        # Create display dataframe with proper competition links
+        display_df = rule_errors_df[[
+            'judge_name', 'competition_name', 'competition_url', 'competition_year',
+            'segment_name', 'discipline_name', 'skater_name', 'element_name', 'element_type',
+            'element_notes', 'max_goe_allowed',
+            'judge_score', 'panel_average', 'deviation'
+        ]].copy()
+
+        display_df.columns = [
+            'Judge', 'Competition', 'Competition URL', 'Year',
+            'Segment', 'Discipline', 'Skater', 'Element Name', 'Element Type',
+            'Element Notes', 'Max GOE Allowed',
+            'Judge Score', 'Panel Average', 'Deviation'
+        ]
+
+        st.dataframe(display_df.drop('Competition URL', axis=1), width="stretch")
+
+        # Show competition links
+        if 'Competition URL' in display_df.columns and not display_df['Competition URL'].isna().all():
+            st.subheader("Competition Links")
+            unique_competitions = display_df[['Competition', 'Competition URL']].drop_duplicates()
+            for _, row in unique_competitions.iterrows():
+                if pd.notna(row['Competition URL']) and row['Competition URL']:
+                    href = competition_results_index_url(row["Competition URL"])
+                    if href:
+                        st.markdown(f"[{row['Competition']}]({href})")
@@ -0,0 +1,339 @@
+"""
+Temporal Trend Analysis page.
+"""
+
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+from analytics_connection import get_analytics_safe
+from analytics import JudgeAnalytics
+from analysis_pages.common import (
+    COMPETITION_SCOPE_LABELS,
+    competition_scope_key,
+    identity_group_options,
+)
+
+
+def temporal_trend_analysis_page() -> None:
+    """Temporal Trend Analysis for Judge Consistency"""
+    st.header("Temporal Trend Analysis")
+
+    # Analysis configuration
+    st.subheader("Analysis Configuration")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        analysis_type = st.selectbox(
+            "Analysis Type",
+            [
+                "Individual Judge Trends",
+                "Overall System Trends",
+                "Judge Consistency Ranking",
+            ],
+            key="temporal_analysis_type",
+        )
+
+    with col2:
+        metric = st.selectbox(
+            "Performance Metric",
+            [
+                "throwout_rate",
+                "anomaly_rate",
+                "rule_error_rate",
+                "avg_deviation",
+            ],
+            key="temporal_metric",
+                              format_func=lambda x: {
+                                  "throwout_rate": "Throwout Rate (%)",
+                                  "anomaly_rate": "Anomaly Rate (%)",
+                                  "rule_error_rate": "Rule Error Rate (%)",
+                                  "avg_deviation": "Average Deviation"
+                              }[x])
+
+    with col3:
+        score_type = st.selectbox(
+            "Score Type",
+            ["both", "pcs", "element"],
+            key="temporal_score_type",
+            format_func=lambda x: {
+                                      "both": "Combined (PCS + Elements)",
+                                      "pcs": "PCS Only",
+                                      "element": "Elements Only"
+                                  }[x])
+
+    temporal_scope_label = st.selectbox(
+        "Competition scope",
+        list(COMPETITION_SCOPE_LABELS),
+        index=0,
+        key="temporal_competition_scope",
+        help=(
+            "Restricts scores to competitions whose linked officials type matches the scope "
+            "(same as Cross-Judge and Individual Judge). Scoped modes use Singles / Pairs / "
+            "Ice Dance / Synchronized segments only."
+        ),
+    )
+    temporal_competition_scope = competition_scope_key(temporal_scope_label)
+
+    metric_names = {
+        "throwout_rate": "Throwout Rate (%)",
+        "anomaly_rate": "Anomaly Rate (%)",
+        "rule_error_rate": "Rule Error Rate (%)",
+        "avg_deviation": "Average Deviation"
+    }
+
+    if analysis_type == "Individual Judge Trends":
+        # Judge selection
+        analytics = get_analytics_safe()
+        ig_labels, ig_map = identity_group_options(analytics)
+        if not ig_labels:
+            st.error("No judges found in database")
+            return
+
+        selected_judge_display = st.selectbox(
+            "Select Judge",
+            ig_labels,
+            key="temporal_judge_select",
+        )
+        selected_judge_ids = ig_map[selected_judge_display]
+
+        # Get temporal trends data
+        with st.spinner("Loading temporal trends data..."):
+            trends_df = analytics.get_temporal_trends_data(
+                judge_id=selected_judge_ids,
+                period='year',
+                metric=metric,
+                score_type=score_type,
+                competition_scope=temporal_competition_scope,
+            )
+            consistency_metrics = JudgeAnalytics.consistency_metrics_from_trends_df(
+                trends_df
+            )
+
+        if trends_df.empty:
+            st.warning("No temporal data found for selected judge")
+            return
+
+        # Display consistency metrics
+        st.subheader("Consistency Metrics")
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            trend_direction = consistency_metrics['trend_direction']
+            direction_emoji = {
+                "increasing": "📈",
+                "decreasing": "📉",
+                "stable": "➖",
+                "insufficient_data": "❓"
+            }
+            st.metric(
+                "Trend Direction",
+                f"{direction_emoji.get(trend_direction, '❓')} {trend_direction.title()}"
+            )
+
+        with col2:
+            st.metric("Consistency Score",
+                      f"{consistency_metrics['consistency_score']:.1f}%")
+
+        with col3:
+            st.metric("Trend Strength",
+                      f"{consistency_metrics['trend_strength']:.3f}")
+
+        with col4:
+            st.metric("Coefficient of Variation",
+                      f"{consistency_metrics['coefficient_variation']:.1f}%")
+
+        # Create temporal trend chart
+        fig = px.line(
+            trends_df,
+            x='time_period',
+            y='metric_value',
+            title=f"{selected_judge_display}: {metric_names[metric]} Over Time",
+            labels={
+                'time_period': 'Year',
+                'metric_value': metric_names[metric]
+            },
+            markers=True)
+
+        # Add trend line
+        if len(trends_df) > 1:
+            slope = consistency_metrics['slope']
+            intercept = trends_df['metric_value'].iloc[0]
+            trend_line = [intercept + slope * i for i in range(len(trends_df))]
+
+            fig.add_scatter(x=trends_df['time_period'],
+                            y=trend_line,
+                            mode='lines',
+                            name='Trend Line',
+                            line=dict(dash='dash', color='red'))
+
+        fig.update_layout(height=500)
+        st.plotly_chart(fig, width="stretch")
+
+        # Show detailed data
+        st.subheader("Detailed Trends Data")
+        display_df = trends_df[[
+            'time_period', 'metric_value', 'total_scores', 'pcs_scores',
+            'element_scores'
+        ]].copy()
+        display_df.columns = [
+            'Year', metric_names[metric], 'Total Scores', 'PCS Scores',
+            'Element Scores'
+        ]
+        st.dataframe(display_df, width="stretch")
+
+    elif analysis_type == "Overall System Trends":
+        # Get system-wide temporal trends
+        with st.spinner("Loading system-wide trends data..."):
+            analytics = get_analytics_safe()
+            trends_df = analytics.get_temporal_trends_data(
+                judge_id=None,
+                period='year',
+                metric=metric,
+                score_type=score_type,
+                competition_scope=temporal_competition_scope,
+            )
+
+        if trends_df.empty:
+            st.warning("No system-wide temporal data found")
+            return
+
+        # Create multi-line chart for system trends
+        fig = go.Figure()
+
+        fig.add_trace(
+            go.Scatter(x=trends_df['time_period'],
+                       y=trends_df['avg_metric_value'],
+                       mode='lines+markers',
+                       name='Average',
+                       line=dict(color='blue', width=3)))
+
+        fig.add_trace(
+            go.Scatter(x=trends_df['time_period'],
+                       y=trends_df['median_metric_value'],
+                       mode='lines+markers',
+                       name='Median',
+                       line=dict(color='green', width=2)))
+
+        # Add error bars for standard deviation
+        fig.add_trace(
+            go.Scatter(x=trends_df['time_period'],
+                       y=trends_df['avg_metric_value'] +
+                       trends_df['std_metric_value'],
+                       mode='lines',
+                       line=dict(width=0),
+                       showlegend=False,
+                       hoverinfo='skip'))
+
+        fig.add_trace(
+            go.Scatter(x=trends_df['time_period'],
+                       y=trends_df['avg_metric_value'] -
+                       trends_df['std_metric_value'],
+                       mode='lines',
+                       line=dict(width=0),
+                       fill='tonexty',
+                       fillcolor='rgba(0,100,80,0.2)',
+                       name='±1 Std Dev',
+                       hoverinfo='skip'))
+
+        fig.update_layout(
+            title=f"System-Wide {metric_names[metric]} Trends Over Time",
+            xaxis_title='Year',
+            yaxis_title=metric_names[metric],
+            height=500)
+
+        st.plotly_chart(fig, width="stretch")
+
+        # System statistics
+        st.subheader("System Statistics")
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            overall_avg = trends_df['avg_metric_value'].mean()
+            st.metric("Overall Average", f"{overall_avg:.2f}")
+
+        with col2:
+            overall_trend = "Improving" if trends_df['avg_metric_value'].iloc[
+                -1] < trends_df['avg_metric_value'].iloc[0] else "Worsening"
+            st.metric("Overall Trend", overall_trend)
+
+        with col3:
+            avg_judges_per_year = trends_df['total_judges'].mean()
+            st.metric("Avg Judges/Year", f"{avg_judges_per_year:.0f}")
+
+        with col4:
+            total_scores = trends_df['total_scores'].sum()
+            st.metric("Total Scores Analyzed", f"{total_scores:,}")
+
+        # Show detailed system data
+        st.subheader("System Trends Data")
+        display_df = trends_df[[
+            'time_period', 'avg_metric_value', 'median_metric_value',
+            'std_metric_value', 'total_judges', 'total_scores'
+        ]].copy()
+        display_df.columns = [
+            'Year', f'Avg {metric_names[metric]}',
+            f'Median {metric_names[metric]}', 'Std Dev', 'Total Judges',
+            'Total Scores'
+        ]
+        for col in [
+                f'Avg {metric_names[metric]}',
+                f'Median {metric_names[metric]}', 'Std Dev'
+        ]:
+            display_df[col] = display_df[col].round(2)
+        st.dataframe(display_df, width="stretch")
+
+    else:  # Judge Consistency Ranking
+        # One row per identity group (merged judge names sharing one directory official)
+        analytics = get_analytics_safe()
+        ig_labels, ig_map = identity_group_options(analytics)
+        if not ig_labels:
+            st.error("No judges found in database")
+            return
+
+        with st.spinner("Calculating consistency metrics for all judges..."):
+            consistency_df = analytics.get_identity_group_consistency_ranking(
+                ig_map,
+                metric=metric,
+                score_type=score_type,
+                competition_scope=temporal_competition_scope,
+            )
+
+        if consistency_df.empty:
+            st.warning("No consistency data found")
+            return
+
+        consistency_df = consistency_df.sort_values('consistency_score',
+                                                    ascending=False)
+
+        # Create consistency ranking chart
+        fig = px.bar(
+            consistency_df.head(20),  # Top 20 most consistent judges
+            x='consistency_score',
+            y='judge_name',
+            orientation='h',
+            title=f"Top 20 Most Consistent Judges: {metric_names[metric]}",
+            labels={
+                'consistency_score': 'Consistency Score (%)',
+                'judge_name': 'Judge'
+            },
+            color='consistency_score',
+            color_continuous_scale='Greens')
+
+        fig.update_layout(height=max(400, len(consistency_df.head(20)) * 25))
+        st.plotly_chart(fig, width="stretch")
+
+        # Show consistency ranking table
+        st.subheader("Judge Consistency Rankings")
+        display_df = consistency_df[[
+            'judge_name', 'location', 'consistency_score', 'trend_direction',
+            'coefficient_variation', 'years_active', 'total_scores'
+        ]].copy()
+        display_df.columns = [
+            'Judge', 'Location', 'Consistency Score (%)', 'Trend Direction',
+            'Coeff. of Variation (%)', 'Years Active', 'Total Scores'
+        ]
+        display_df['Consistency Score (%)'] = display_df[
+            'Consistency Score (%)'].round(1)
+        display_df['Coeff. of Variation (%)'] = display_df[
+            'Coeff. of Variation (%)'].round(1)
+        st.dataframe(display_df, width="stretch")
@@ -7,8 +7,6 @@ import re
 import unicodedata
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_, text, select, case
-from scipy import stats
-from scipy.stats import linregress
 from collections import defaultdict
 from models import (
     Judge,
@@ -1680,8 +1678,14 @@ class JudgeAnalytics:
         competition_scope: str = COMPETITION_SCOPE_ALL,
         event_start_date: date | None = None,
         event_end_date: date | None = None,
+        include_ids: bool = False,
     ):
-        """PCS statistics for one judge id or merged identities (multiple ids)."""
+        """
+        PCS statistics for one judge id or merged identities (multiple ids).
+
+        ``include_ids`` adds ``judge_id`` and ``segment_id`` columns so callers loading
+        several judges at once can partition the rows per judge and per segment.
+        """
         ids = self.normalize_judge_ids(judge_ids)
         core_disc = self._qualifying_core_disciplines_active(competition_scope)
         seg_discipline_ids = self._merged_segment_discipline_ids(
@@ -1699,7 +1703,9 @@ class JudgeAnalytics:
             Competition.year,
             Segment.name.label('segment_name'),
             DisciplineType.name.label('discipline_name'),
-            Skater.name.label('skater_name')
+            Skater.name.label('skater_name'),
+            Judge.id.label('judge_id'),
+            Segment.id.label('segment_id'),
         ).join(Judge, PcsScorePerJudge.judge_id == Judge.id)\
          .join(PcsType, PcsScorePerJudge.pcs_type_id == PcsType.id)\
          .join(SkaterSegment, PcsScorePerJudge.skater_segment_id == SkaterSegment.id)\
@@ -1739,7 +1745,8 @@ class JudgeAnalytics:
             'segment_name': r.segment_name,
             'discipline_name': r.discipline_name or 'Unknown',
             'skater_name': r.skater_name,
-            'anomaly': abs(float(r.deviation)) >= 1.5 or r.is_rule_error
+            'anomaly': abs(float(r.deviation)) >= 1.5 or r.is_rule_error,
+            **({'judge_id': r.judge_id, 'segment_id': r.segment_id} if include_ids else {}),
         } for r in results])
 
         return df
@@ -1753,8 +1760,9 @@ class JudgeAnalytics:
         competition_scope: str = COMPETITION_SCOPE_ALL,
         event_start_date: date | None = None,
         event_end_date: date | None = None,
+        include_ids: bool = False,
     ):
-        """Element statistics for one judge id or merged identities."""
+        """Element statistics for one judge id or merged identities (see ``include_ids`` on PCS)."""
         ids = self.normalize_judge_ids(judge_ids)
         core_disc = self._qualifying_core_disciplines_active(competition_scope)
         seg_discipline_ids = self._merged_segment_discipline_ids(
@@ -1774,7 +1782,9 @@ class JudgeAnalytics:
             Competition.year,
             Segment.name.label('segment_name'),
             DisciplineType.name.label('discipline_name'),
-            Skater.name.label('skater_name')
+            Skater.name.label('skater_name'),
+            Judge.id.label('judge_id'),
+            Segment.id.label('segment_id'),
         ).join(Judge, ElementScorePerJudge.judge_id == Judge.id)\
          .join(Element, ElementScorePerJudge.element_id == Element.id)\
          .outerjoin(ElementType, Element.element_type_id == ElementType.id)\
@@ -1817,7 +1827,8 @@ class JudgeAnalytics:
             'segment_name': r.segment_name,
             'discipline_name': r.discipline_name or 'Unknown',
             'skater_name': r.skater_name,
-            'anomaly': abs(float(r.deviation)) >= 2.0 or r.is_rule_error
+            'anomaly': abs(float(r.deviation)) >= 2.0 or r.is_rule_error,
+            **({'judge_id': r.judge_id, 'segment_id': r.segment_id} if include_ids else {}),
         } for r in results])
 
         return df
@@ -3019,13 +3030,30 @@ class JudgeAnalytics:
         competition_scope: str,
         judge_ids_filter: Optional[set[int]] = None,
     ) -> dict:
-        """Map (judge_id, season_year) -> {\"pcs\": tuple | None, \"elem\": tuple | None}."""
+        """
+        Map (judge_id, season_year) -> {\"pcs\": tuple | None, \"elem\": tuple | None}.
+
+        Summed from the per-competition cross-judge shards when they are built (one
+        grouped read over judge × competition rows, plus the marks of in-scope
+        competitions without shards); otherwise aggregated from marks.
+        """
         if judge_ids_filter is not None and not judge_ids_filter:
             return {}
 
         core_disc = self._qualifying_core_disciplines_active(competition_scope)
         seg_discipline_ids = self._merged_segment_discipline_ids(core_disc, None)
 
+        from cross_judge_cache import load_judge_season_aggregates
+
+        cached = load_judge_season_aggregates(
+            self,
+            competition_scope=competition_scope,
+            judge_ids=judge_ids_filter,
+            seg_discipline_ids=seg_discipline_ids,
+        )
+        if cached is not None:
+            return cached
+
         pcs_q = (
             select(
                 PcsScorePerJudge.judge_id,
@@ -3183,6 +3211,8 @@ class JudgeAnalytics:
         values = trends_df["metric_value"].values
         time_periods = range(len(values))
 
+        from scipy.stats import linregress
+
         try:
             slope, _intercept, r_value, p_value, _std_err = linregress(
                 time_periods, values
@@ -3380,6 +3410,9 @@ class JudgeAnalytics:
 
     def calculate_statistical_significance(self, judge_ids, competition_ids=None, discipline_type_ids=None, year_filter=None):
         """Statistical significance tests; judge_ids may be one id or merged identities."""
+        # scipy is imported here, not at module load, to keep app cold start light.
+        from scipy import stats
+
         ids = self.normalize_judge_ids(judge_ids)
 
         # Get judge data
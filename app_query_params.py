@@ -358,7 +358,7 @@ PCS_DEVIATION_SCOPE_LABEL_TO_SLUG = {
     v: k for k, v in PCS_DEVIATION_SCOPE_SLUG_TO_LABEL.items()
 }
 
-# Mirrors analysis_app ``_COMPETITION_SCOPE_LABEL_TO_KEY`` (scope label → analytics key).
+# Mirrors ``analysis_pages.common.COMPETITION_SCOPE_LABEL_TO_KEY`` (scope label → analytics key).
 from officials_competition_types import (  # noqa: E402
     COMPETITION_SCOPE_ALL,
     COMPETITION_SCOPE_CHAMPIONSHIPS_ONLY,
@@ -0,0 +1,584 @@
+"""
+Durable analytics cache rebuild queue (``cache_rebuild_job``).
+
+Competition loads call ``enqueue_competition_rebuild`` in the load transaction instead of
+rebuilding caches inline. A worker (``scripts/run_cache_rebuild_worker.py``) claims jobs
+and rebuilds, in dependency order: cross-judge shards, judge excess rows, element / PCS
+mark shards for the competition's season, benchmark σ̂, per-shard summaries, and finally
+the competition's protocol rows in the activity tracker's ``official_activity_fact``.
+
+Repeat events for a competition coalesce into its single queued job. Every step is
+idempotent and committed on its own, so a job interrupted halfway (worker crash, DB
+restart) is simply run again: failed jobs retry with exponential backoff, and jobs left
+``running`` by a dead worker are requeued once they go stale.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Sequence
+
+from sqlalchemy import and_, delete, exists, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+
+from models import CacheRebuildJob, Competition, Segment
+from officials_competition_types import COMPETITION_SCOPE_ALL
+
+_LOG = logging.getLogger("cache_rebuild")
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+# A failed attempt whose retry was folded into a newer queued job for the competition.
+JOB_SUPERSEDED = "superseded"
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_RETRY_BACKOFF_S = 60.0
+DEFAULT_STALE_AFTER_S = 6 * 3600.0
+DEFAULT_POLL_INTERVAL_S = 10.0
+DEFAULT_KEEP_FINISHED_DAYS = 14
+# Scopes warmed for mark shards / σ̂ / summaries; others rebuild lazily on first read.
+DEFAULT_REBUILD_SCOPES: tuple[str, ...] = (COMPETITION_SCOPE_ALL,)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def ensure_cache_rebuild_queue_table(session: Session) -> None:
+    from database import ensure_orm_tables
+
+    ensure_orm_tables(session, CacheRebuildJob.__table__)
+
+
+# ── producers ───────────────────────────────────────────────────────────────
+
+
+def bump_protocol_table_versions(session: Session) -> None:
+    """
+    Invalidate the activity / international apps' cached protocol panel reads
+    (``segment_official``, judge links, Rule 411 flags) in ``session``'s transaction.
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    from activityAnalysis.query_cache import PROTOCOL_TABLES, bump_table_versions
+
+    bump_table_versions(session, PROTOCOL_TABLES)
+
+
+def refresh_protocol_activity_facts(session: Session, competition_ids: Sequence[int]) -> None:
+    """
+    Rebuild the activity tracker's protocol panel facts (``official_activity_fact``) for
+    ``competition_ids`` in ``session``'s transaction. No-op outside PostgreSQL.
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    from activityAnalysis.official_activity_fact import refresh_segment_facts
+
+    refresh_segment_facts(session, competition_ids)
+
+
+def enqueue_competition_rebuild(
+    session: Session, competition_id: int, *, reason: str | None = None
+) -> int:
+    """
+    Record that ``competition_id`` changed; returns the queued job id.
+
+    Does not commit, so the event lands atomically with the caller's load. A queued job
+    for the same competition absorbs the event (``events`` is incremented).
+    """
+    ensure_cache_rebuild_queue_table(session)
+    competition_id = int(competition_id)
+    bump_protocol_table_versions(session)
+    for _ in range(3):
+        job_id = session.execute(
+            update(CacheRebuildJob)
+            .where(CacheRebuildJob.competition_id == competition_id)
+            .where(CacheRebuildJob.status == JOB_QUEUED)
+            .values(
+                events=CacheRebuildJob.events + 1,
+                reason=reason if reason is not None else CacheRebuildJob.reason,
+            )
+            .returning(CacheRebuildJob.id)
+        ).scalar_one_or_none()
+        if job_id is not None:
+            return int(job_id)
+        now = _now()
+        try:
+            with session.begin_nested():
+                job = CacheRebuildJob(
+                    competition_id=competition_id,
+                    status=JOB_QUEUED,
+                    events=1,
+                    attempts=0,
+                    reason=reason,
+                    enqueued_at=now,
+                    run_after=now,
+                )
+                session.add(job)
+            return int(job.id)
+        except IntegrityError:
+            # Another loader queued the same competition between our UPDATE and INSERT.
+            continue
+    raise RuntimeError(f"Could not enqueue cache rebuild for competition {competition_id}")
+
+
+# ── worker-side queue operations ────────────────────────────────────────────
+
+
+def claim_next_job(session: Session, worker_id: str) -> CacheRebuildJob | None:
+    """
+    Lock and mark the oldest due queued job ``running`` (caller commits).
+
+    Skips competitions another worker is already rebuilding, so two workers never race on
+    the same shards.
+    """
+    ensure_cache_rebuild_queue_table(session)
+    running = aliased(CacheRebuildJob)
+    job = session.execute(
+        select(CacheRebuildJob)
+        .where(CacheRebuildJob.status == JOB_QUEUED)
+        .where(CacheRebuildJob.run_after <= _now())
+        .where(
+            ~exists().where(
+                and_(
+                    running.competition_id == CacheRebuildJob.competition_id,
+                    running.status == JOB_RUNNING,
+                )
+            )
+        )
+        .order_by(CacheRebuildJob.run_after, CacheRebuildJob.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    ).scalar_one_or_none()
+    if job is None:
+        return None
+    job.status = JOB_RUNNING
+    job.attempts = int(job.attempts or 0) + 1
+    job.worker = worker_id
+    job.started_at = _now()
+    job.finished_at = None
+    job.current_step = None
+    session.flush()
+    return job
+
+
+def _requeue_or_supersede(
+    session: Session, job: CacheRebuildJob, *, run_after: datetime
+) -> None:
+    newer = session.execute(
+        select(CacheRebuildJob.id)
+        .where(CacheRebuildJob.competition_id == job.competition_id)
+        .where(CacheRebuildJob.status == JOB_QUEUED)
+        .where(CacheRebuildJob.id != job.id)
+    ).scalar_one_or_none()
+    if newer is not None:
+        job.status = JOB_SUPERSEDED
+        job.finished_at = _now()
+        return
+    job.status = JOB_QUEUED
+    job.run_after = run_after
+
+
+def retry_delay_s(attempts: int, backoff_s: float = DEFAULT_RETRY_BACKOFF_S) -> float:
+    """Exponential backoff: ``backoff_s``, 2×, 4×, … after the 1st, 2nd, 3rd failure."""
+    return float(backoff_s) * (2 ** max(0, int(attempts) - 1))
+
+
+def complete_job(session: Session, job_id: int) -> None:
+    job = session.get(CacheRebuildJob, job_id)
+    if job is None:
+        return
+    job.status = JOB_DONE
+    job.finished_at = _now()
+    job.current_step = None
+    job.last_error = None
+    session.flush()
+
+
+def fail_job(
+    session: Session,
+    job_id: int,
+    error: str,
+    *,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    backoff_s: float = DEFAULT_RETRY_BACKOFF_S,
+) -> str:
+    """Requeue with backoff, or mark ``failed`` after ``max_attempts``. Returns new status."""
+    job = session.get(CacheRebuildJob, job_id)
+    if job is None:
+        return JOB_FAILED
+    job.last_error = (error or "")[:4000]
+    if int(job.attempts or 0) >= int(max_attempts):
+        job.status = JOB_FAILED
+        job.finished_at = _now()
+    else:
+        _requeue_or_supersede(
+            session,
+            job,
+            run_after=_now() + timedelta(seconds=retry_delay_s(job.attempts, backoff_s)),
+        )
+    session.flush()
+    return job.status
+
+
+def set_job_step(session: Session, job_id: int, step: str) -> None:
+    session.execute(
+        update(CacheRebuildJob)
+        .where(CacheRebuildJob.id == job_id)
+        .values(current_step=step)
+    )
+
+
+def requeue_stale_jobs(
+    session: Session, *, stale_after_s: float = DEFAULT_STALE_AFTER_S
+) -> int:
+    """Put ``running`` jobs whose worker stopped reporting back on the queue."""
+    ensure_cache_rebuild_queue_table(session)
+    cutoff = _now() - timedelta(seconds=float(stale_after_s))
+    stale = (
+        session.execute(
+            select(CacheRebuildJob)
+            .where(CacheRebuildJob.status == JOB_RUNNING)
+            .where(CacheRebuildJob.started_at < cutoff)
+            .with_for_update(skip_locked=True)
+        )
+        .scalars()
+        .all()
+    )
+    for job in stale:
+        job.last_error = f"worker {job.worker or '?'} stopped during step {job.current_step or '?'}"
+        _requeue_or_supersede(session, job, run_after=_now())
+    session.flush()
+    return len(stale)
+
+
+def retry_failed_jobs(session: Session) -> int:
+    """Admin action: requeue every ``failed`` job (attempt counters reset)."""
+    ensure_cache_rebuild_queue_table(session)
+    failed = (
+        session.execute(
+            select(CacheRebuildJob)
+            .where(CacheRebuildJob.status == JOB_FAILED)
+            .order_by(CacheRebuildJob.id)
+        )
+        .scalars()
+        .all()
+    )
+    for job in failed:
+        job.attempts = 0
+        _requeue_or_supersede(session, job, run_after=_now())
+        session.flush()
+    return len(failed)
+
+
+def purge_finished_jobs(
+    session: Session, *, older_than_days: int = DEFAULT_KEEP_FINISHED_DAYS
+) -> int:
+    cutoff = _now() - timedelta(days=int(older_than_days))
+    result = session.execute(
+        delete(CacheRebuildJob)
+        .where(CacheRebuildJob.status.in_((JOB_DONE, JOB_SUPERSEDED)))
+        .where(CacheRebuildJob.finished_at < cutoff)
+    )
+    return int(result.rowcount or 0)
+
+
+def queue_status_counts(session: Session) -> dict[str, int]:
+    ensure_cache_rebuild_queue_table(session)
+    rows = session.execute(
+        select(CacheRebuildJob.status, func.count()).group_by(CacheRebuildJob.status)
+    ).all()
+    return {str(status): int(n) for status, n in rows}
+
+
+def recent_jobs(session: Session, *, limit: int = 200) -> list[dict[str, Any]]:
+    """Newest jobs first, with competition name/year for the admin table."""
+    ensure_cache_rebuild_queue_table(session)
+    rows = session.execute(
+        select(CacheRebuildJob, Competition.name, Competition.year)
+        .outerjoin(Competition, Competition.id == CacheRebuildJob.competition_id)
+        .order_by(CacheRebuildJob.id.desc())
+        .limit(int(limit))
+    ).all()
+    out = []
+    for job, name, year in rows:
+        out.append(
+            {
+                "id": job.id,
+                "competition_id": job.competition_id,
+                "competition": f"{name} ({year})" if name else None,
+                "status": job.status,
+                "events": job.events,
+                "attempts": job.attempts,
+                "current_step": job.current_step,
+                "reason": job.reason,
+                "last_error": job.last_error,
+                "worker": job.worker,
+                "enqueued_at": job.enqueued_at,
+                "run_after": job.run_after,
+                "started_at": job.started_at,
+                "finished_at": job.finished_at,
+            }
+        )
+    return out
+
+
+# ── rebuild steps (dependency order) ────────────────────────────────────────
+
+
+def _step_invalidate(session, analytics, competition_id, season_year, scopes) -> None:
+    from element_ranking_cache import invalidate_element_ranking_cache_for_competition
+    from judge_excess_cache import invalidate_judge_excess_cache_for_competition
+    from pcs_deviation_cache import invalidate_pcs_deviation_cache_for_competition
+    from pcs_quality_cache import invalidate_pcs_quality_cache_for_competition
+
+    invalidate_judge_excess_cache_for_competition(session, competition_id)
+    invalidate_element_ranking_cache_for_competition(session, competition_id)
+    invalidate_pcs_quality_cache_for_competition(session, competition_id)
+    invalidate_pcs_deviation_cache_for_competition(session, competition_id)
+
+
+def _step_cross_judge_shards(session, analytics, competition_id, season_year, scopes) -> None:
+    from cross_judge_cache import build_cross_judge_shards_for_competition
+
+    build_cross_judge_shards_for_competition(session, competition_id)
+
+
+def _step_judge_excess(session, analytics, competition_id, season_year, scopes) -> None:
+    from judge_excess_cache import ensure_judge_excess_cache
+
+    segment_ids = list(
+        session.execute(
+            select(Segment.id).where(Segment.competition_id == competition_id)
+        ).scalars()
+    )
+    # One pass writes pcs, element and both rows for each segment.
+    ensure_judge_excess_cache(session, segment_ids, "both")
+
+
+def _season_in(season_year: str, filter_fn: Callable[[list[str]], list[str]]) -> bool:
+    return bool(season_year) and bool(filter_fn([season_year]))
+
+
+def _step_mark_shards(session, analytics, competition_id, season_year, scopes) -> None:
+    from element_deviation_ranking import filter_element_ranking_season_years
+    from element_ranking_cache import precompute_element_ranking_shards
+    from pcs_deviation_analysis import filter_pcs_deviation_season_years
+    from pcs_deviation_cache import precompute_pcs_deviation_shards
+    from pcs_quality_analysis import filter_pcs_quality_season_years
+    from pcs_quality_cache import precompute_pcs_quality_shards
+
+    for scope in scopes:
+        if _season_in(season_year, filter_element_ranking_season_years):
+            precompute_element_ranking_shards(
+                session, analytics, competition_scope=scope, season_years=[season_year]
+            )
+        if _season_in(season_year, filter_pcs_quality_season_years):
+            precompute_pcs_quality_shards(
+                session, analytics, competition_scope=scope, season_years=[season_year]
+            )
+        if _season_in(season_year, filter_pcs_deviation_season_years):
+            precompute_pcs_deviation_shards(
+                session, analytics, competition_scope=scope, season_years=[season_year]
+            )
+
+
+def _step_sigma(session, analytics, competition_id, season_year, scopes) -> None:
+    from element_ranking_cache import (
+        build_precompute_element_ranking_run_params,
+        precompute_element_ranking_sigma,
+    )
+    from pcs_deviation_cache import (
+        build_precompute_pcs_deviation_run_params,
+        precompute_pcs_deviation_sigma,
+    )
+
+    for scope in scopes:
+        precompute_element_ranking_sigma(
+            session, analytics, build_precompute_element_ranking_run_params(scope)
+        )
+        precompute_pcs_deviation_sigma(
+            session, analytics, build_precompute_pcs_deviation_run_params(scope)
+        )
+
+
+def _step_summaries(session, analytics, competition_id, season_year, scopes) -> None:
+    from element_ranking_cache import (
+        build_precompute_element_ranking_run_params,
+        precompute_element_ranking_shard_summaries,
+    )
+    from pcs_deviation_cache import (
+        build_precompute_pcs_deviation_run_params,
+        precompute_pcs_deviation_shard_summaries,
+    )
+    from pcs_quality_analysis import filter_pcs_quality_season_years
+    from pcs_quality_cache import precompute_pcs_quality_summaries
+
+    for scope in scopes:
+        precompute_element_ranking_shard_summaries(
+            session, analytics, build_precompute_element_ranking_run_params(scope)
+        )
+        precompute_pcs_deviation_shard_summaries(
+            session, analytics, build_precompute_pcs_deviation_run_params(scope)
+        )
+        if _season_in(season_year, filter_pcs_quality_season_years):
+            precompute_pcs_quality_summaries(
+                session, analytics, competition_scope=scope, season_years=[season_year]
+            )
+
+
+def _step_activity_facts(session, analytics, competition_id, season_year, scopes) -> None:
+    # Protocol panels feed the activity tracker fact table (officials_analysis schema).
+    refresh_protocol_activity_facts(session, [competition_id])
+
+
+# (name, fn(session, analytics, competition_id, season_year, scopes)); each commits on its own.
+REBUILD_STEPS: tuple[tuple[str, Callable[..., None]], ...] = (
+    ("invalidate", _step_invalidate),
+    ("cross_judge_shards", _step_cross_judge_shards),
+    ("judge_excess", _step_judge_excess),
+    ("mark_shards", _step_mark_shards),
+    ("sigma", _step_sigma),
+    ("summaries", _step_summaries),
+    ("activity_facts", _step_activity_facts),
+)
+
+
+def rebuild_competition_caches(
+    session: Session,
+    competition_id: int,
+    *,
+    scopes: Sequence[str] = DEFAULT_REBUILD_SCOPES,
+    steps: Sequence[tuple[str, Callable[..., None]]] = REBUILD_STEPS,
+    on_step: Callable[[str], None] | None = None,
+) -> None:
+    """Run every rebuild step for one competition, committing after each."""
+    from analytics import JudgeAnalytics
+
+    season_year = session.execute(
+        select(Competition.year).where(Competition.id == competition_id)
+    ).scalar_one_or_none()
+    if season_year is None:
+        _LOG.warning("Competition %s no longer exists; nothing to rebuild", competition_id)
+        return
+    analytics = JudgeAnalytics(session)
+    for name, fn in steps:
+        if on_step is not None:
+            on_step(name)
+        t0 = time.perf_counter()
+        fn(session, analytics, competition_id, str(season_year), tuple(scopes))
+        session.commit()
+        _LOG.info(
+            "competition %s: %s done in %.1fs", competition_id, name, time.perf_counter() - t0
+        )
+
+
+# ── worker loop ─────────────────────────────────────────────────────────────
+
+
+def run_one_job(
+    session_factory: Callable[[], Session],
+    *,
+    worker_id: str,
+    scopes: Sequence[str] = DEFAULT_REBUILD_SCOPES,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    backoff_s: float = DEFAULT_RETRY_BACKOFF_S,
+    stale_after_s: float = DEFAULT_STALE_AFTER_S,
+    rebuild: Callable[..., None] = rebuild_competition_caches,
+) -> CacheRebuildJob | None:
+    """
+    Claim and run one due job; returns the (detached) job or None when the queue is idle.
+
+    Queue bookkeeping uses its own session, so a rebuild failure rolled back on the work
+    session never loses the job's status.
+    """
+    queue_session = session_factory()
+    try:
+        if requeue_stale_jobs(queue_session, stale_after_s=stale_after_s):
+            queue_session.commit()
+        job = claim_next_job(queue_session, worker_id)
+        queue_session.commit()
+        if job is None:
+            return None
+        job_id, competition_id = job.id, job.competition_id
+        _LOG.info(
+            "Rebuilding caches for competition %s (job %s, attempt %s, %s event(s))",
+            competition_id,
+            job_id,
+            job.attempts,
+            job.events,
+        )
+
+        def _on_step(step: str) -> None:
+            set_job_step(queue_session, job_id, step)
+            queue_session.commit()
+
+        work_session = session_factory()
+        try:
+            rebuild(work_session, competition_id, scopes=scopes, on_step=_on_step)
+        except Exception as exc:
+            work_session.rollback()
+            status = fail_job(
+                queue_session,
+                job_id,
+                f"{type(exc).__name__}: {exc}",
+                max_attempts=max_attempts,
+                backoff_s=backoff_s,
+            )
+            _LOG.exception("Cache rebuild job %s failed (now %s)", job_id, status)
+        else:
+            complete_job(queue_session, job_id)
+        finally:
+            work_session.close()
+        queue_session.commit()
+        queue_session.refresh(job)
+        queue_session.expunge(job)
+        return job
+    finally:
+        queue_session.close()
+
+
+def run_worker(
+    session_factory: Callable[[], Session],
+    *,
+    worker_id: str | None = None,
+    once: bool = False,
+    poll_interval_s: float = DEFAULT_POLL_INTERVAL_S,
+    max_jobs: int | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+    **job_kwargs: Any,
+) -> int:
+    """
+    Drain the queue; returns jobs processed.
+
+    ``once`` stops when no job is due; otherwise the worker polls every
+    ``poll_interval_s``. Extra keyword arguments go to ``run_one_job``.
+    """
+    worker_id = worker_id or default_worker_id()
+    processed = 0
+    last_purge = 0.0
+    while max_jobs is None or processed < max_jobs:
+        if time.monotonic() - last_purge > 3600:
+            with session_factory() as s:
+                purge_finished_jobs(s)
+                s.commit()
+            last_purge = time.monotonic()
+        job = run_one_job(session_factory, worker_id=worker_id, **job_kwargs)
+        if job is not None:
+            processed += 1
+            continue
+        if once:
+            break
+        sleep(poll_interval_s)
+    return processed
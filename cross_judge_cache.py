@@ -11,6 +11,7 @@ from collections import defaultdict
 from datetime import date, datetime, timezone
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from sqlalchemy import case, delete, func, or_, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
@@ -32,10 +33,12 @@ _SHARD_INT_COLS = (
     "pcs_throwouts",
     "pcs_anomalies",
     "pcs_rule_errors",
+    "pcs_deviation_count",
     "elem_total",
     "elem_throwouts",
     "elem_anomalies",
     "elem_rule_errors",
+    "elem_deviation_count",
 )
 _SHARD_FLOAT_COLS = (
     "pcs_sum_deviation",
@@ -113,8 +116,8 @@ def invalidate_cross_judge_cache_for_competition(
     return int(result.rowcount or 0)
 
 
-def _pcs_agg_rows(session: Session, competition_id: int | None) -> list:
-    q = (
+def _pcs_agg_select():
+    return (
         select(
             Competition.id.label("competition_id"),
             Competition.year.label("competition_year"),
@@ -143,6 +146,7 @@ def _pcs_agg_rows(session: Session, competition_id: int | None) -> list:
             func.sum(func.abs(PcsScorePerJudge.deviation)).label(
                 "pcs_sum_abs_deviation"
             ),
+            func.count(PcsScorePerJudge.deviation).label("pcs_deviation_count"),
         )
         .select_from(PcsScorePerJudge)
         .join(SkaterSegment, PcsScorePerJudge.skater_segment_id == SkaterSegment.id)
@@ -155,13 +159,17 @@ def _pcs_agg_rows(session: Session, competition_id: int | None) -> list:
             PcsScorePerJudge.judge_id,
         )
     )
+
+
+def _pcs_agg_rows(session: Session, competition_id: int | None) -> list:
+    q = _pcs_agg_select()
     if competition_id is not None:
         q = q.filter(Competition.id == competition_id)
     return list(session.execute(q).all())
 
 
-def _elem_agg_rows(session: Session, competition_id: int | None) -> list:
-    q = (
+def _elem_agg_select():
+    return (
         select(
             Competition.id.label("competition_id"),
             Competition.year.label("competition_year"),
@@ -190,6 +198,7 @@ def _elem_agg_rows(session: Session, competition_id: int | None) -> list:
             func.sum(func.abs(ElementScorePerJudge.deviation)).label(
                 "elem_sum_abs_deviation"
             ),
+            func.count(ElementScorePerJudge.deviation).label("elem_deviation_count"),
         )
         .select_from(ElementScorePerJudge)
         .join(Element, ElementScorePerJudge.element_id == Element.id)
@@ -203,6 +212,10 @@ def _elem_agg_rows(session: Session, competition_id: int | None) -> list:
             ElementScorePerJudge.judge_id,
         )
     )
+
+
+def _elem_agg_rows(session: Session, competition_id: int | None) -> list:
+    q = _elem_agg_select()
     if competition_id is not None:
         q = q.filter(Competition.id == competition_id)
     return list(session.execute(q).all())
@@ -226,15 +239,10 @@ def _merge_agg_into_shard_map(
                 "competition_year": str(row.competition_year),
             },
         )
-        for field in (
-            "total",
-            "throwouts",
-            "anomalies",
-            "rule_errors",
-            "sum_deviation",
-            "sum_abs_deviation",
-        ):
+        for field in ("total", "throwouts", "anomalies", "rule_errors", "deviation_count"):
             bucket[f"{prefix}_{field}"] = int(getattr(row, f"{prefix}_{field}") or 0)
+        for field in ("sum_deviation", "sum_abs_deviation"):
+            bucket[f"{prefix}_{field}"] = float(getattr(row, f"{prefix}_{field}") or 0)
 
 
 def build_cross_judge_shards_for_competition(
@@ -368,15 +376,8 @@ def _scoped_competition_ids(
     )
 
 
-def _shard_agg_select(*, by_competition: bool):
-    cols = [CrossJudgeCompetitionShard.judge_id]
-    if by_competition:
-        cols = [
-            CrossJudgeCompetitionShard.competition_id,
-            CrossJudgeCompetitionShard.judge_id,
-        ]
-    return select(
-        *cols,
+def _shard_sum_columns() -> list:
+    return [
         func.sum(CrossJudgeCompetitionShard.pcs_total).label("pcs_total"),
         func.sum(CrossJudgeCompetitionShard.pcs_throwouts).label("pcs_throwouts"),
         func.sum(CrossJudgeCompetitionShard.pcs_anomalies).label("pcs_anomalies"),
@@ -393,7 +394,17 @@ def _shard_agg_select(*, by_competition: bool):
         func.sum(CrossJudgeCompetitionShard.elem_sum_abs_deviation).label(
             "elem_sum_abs_deviation"
         ),
-    )
+    ]
+
+
+def _shard_agg_select(*, by_competition: bool):
+    cols = [CrossJudgeCompetitionShard.judge_id]
+    if by_competition:
+        cols = [
+            CrossJudgeCompetitionShard.competition_id,
+            CrossJudgeCompetitionShard.judge_id,
+        ]
+    return select(*cols, *_shard_sum_columns())
 
 
 def _bucket_from_agg_row(row, prefix: str) -> dict[str, Any]:
@@ -409,17 +420,12 @@ def _bucket_from_agg_row(row, prefix: str) -> dict[str, Any]:
     }
 
 
-def _load_shard_judge_aggregates_sql(
-    session: Session,
+def _shard_judge_aggregate_query(
     comp_ids: list[int],
     seg_discipline_ids: list[int] | None,
     *,
     by_competition: bool,
-) -> tuple[dict[Any, dict], dict[Any, dict]]:
-    """Sum shard rows in SQL (per judge, or per competition×judge)."""
-    if not comp_ids:
-        return {}, {}
-
+):
     q = _shard_agg_select(by_competition=by_competition).where(
         CrossJudgeCompetitionShard.competition_id.in_(comp_ids)
     )
@@ -433,8 +439,23 @@ def _load_shard_judge_aggregates_sql(
             CrossJudgeCompetitionShard.competition_id,
             CrossJudgeCompetitionShard.judge_id,
         ]
-    q = q.group_by(*group_cols)
+    return q.group_by(*group_cols)
 
+
+def _load_shard_judge_aggregates_sql(
+    session: Session,
+    comp_ids: list[int],
+    seg_discipline_ids: list[int] | None,
+    *,
+    by_competition: bool,
+) -> tuple[dict[Any, dict], dict[Any, dict]]:
+    """Sum shard rows in SQL (per judge, or per competition×judge)."""
+    if not comp_ids:
+        return {}, {}
+
+    q = _shard_judge_aggregate_query(
+        comp_ids, seg_discipline_ids, by_competition=by_competition
+    )
     pcs_raw: dict[Any, dict] = {}
     elem_raw: dict[Any, dict] = {}
     for row in session.execute(q).all():
@@ -446,6 +467,145 @@ def _load_shard_judge_aggregates_sql(
     return pcs_raw, elem_raw
 
 
+_SEASON_SUM_FIELDS = tuple(
+    f"{prefix}_{field}"
+    for prefix in ("pcs", "elem")
+    for field in (
+        "total",
+        "throwouts",
+        "anomalies",
+        "rule_errors",
+        "sum_deviation",
+        "deviation_count",
+    )
+)
+
+
+def _season_aggregate_tuple(sums: dict[str, float], prefix: str) -> tuple | None:
+    """
+    ``(total, throwouts, anomalies, rule_errors, avg_deviation)`` or None without marks.
+
+    The average is over non-NULL deviations, like ``AVG(deviation)`` in the mark scan.
+    """
+    total = int(sums[f"{prefix}_total"])
+    if not total:
+        return None
+    n_dev = int(sums[f"{prefix}_deviation_count"])
+    return (
+        total,
+        int(sums[f"{prefix}_throwouts"]),
+        int(sums[f"{prefix}_anomalies"]),
+        int(sums[f"{prefix}_rule_errors"]),
+        float(sums[f"{prefix}_sum_deviation"]) / n_dev if n_dev else None,
+    )
+
+
+def _competition_ids_without_shards(analytics, competition_scope: str) -> list[int]:
+    """In-scope competitions with no shard rows (not precomputed yet, or no marks)."""
+    has_shard = (
+        select(CrossJudgeCompetitionShard.competition_id)
+        .where(CrossJudgeCompetitionShard.competition_id == Competition.id)
+        .exists()
+    )
+    q = select(Competition.id).where(~has_shard)
+    q = analytics._filter_select_competition_scope(q, competition_scope)
+    return [int(cid) for cid in analytics.session.execute(q).scalars()]
+
+
+def _add_mark_season_sums(
+    sums: dict[tuple[int, str], dict[str, float]],
+    session: Session,
+    comp_ids: list[int],
+    *,
+    judge_ids: set[int] | None,
+    seg_discipline_ids: list[int] | None,
+) -> None:
+    """Add mark-table aggregates (the shard build queries) for competitions without shards."""
+    for q, score in (
+        (_pcs_agg_select(), PcsScorePerJudge),
+        (_elem_agg_select(), ElementScorePerJudge),
+    ):
+        q = q.where(Competition.id.in_(comp_ids))
+        if judge_ids is not None:
+            q = q.where(score.judge_id.in_(sorted(judge_ids)))
+        if seg_discipline_ids is not None:
+            q = q.where(Segment.discipline_type_id.in_(seg_discipline_ids))
+        for row in session.execute(q).all():
+            bucket = sums[(int(row.judge_id), row.competition_year)]
+            for col, value in row._mapping.items():
+                if col in bucket:
+                    bucket[col] += float(value or 0)
+
+
+def load_judge_season_aggregates(
+    analytics,
+    *,
+    competition_scope: str,
+    judge_ids: set[int] | None = None,
+    seg_discipline_ids: list[int] | None = None,
+) -> dict[tuple[int, str], dict[str, tuple | None]] | None:
+    """
+    Judge × season PCS/element aggregates summed from shard rows.
+
+    Same shape as ``JudgeAnalytics._yearly_pcs_elem_combined_map``:
+    ``(judge_id, year) -> {"pcs": tuple | None, "elem": tuple | None}``. Competition
+    scope is applied through ``competition`` at read time, so relinking a competition's
+    type needs no rebuild. In-scope competitions without shard rows are aggregated from
+    their marks. Returns None when shards have not been built.
+    """
+    session = analytics.session
+    if not shard_cache_populated(session):
+        return None
+    shard = CrossJudgeCompetitionShard
+    q = (
+        select(
+            shard.judge_id,
+            Competition.year.label("competition_year"),
+            *_shard_sum_columns(),
+            # Rows built before the counts existed fall back to every mark.
+            func.sum(func.coalesce(shard.pcs_deviation_count, shard.pcs_total)).label(
+                "pcs_deviation_count"
+            ),
+            func.sum(func.coalesce(shard.elem_deviation_count, shard.elem_total)).label(
+                "elem_deviation_count"
+            ),
+        )
+        .select_from(shard)
+        .join(Competition, Competition.id == shard.competition_id)
+    )
+    if judge_ids is not None:
+        q = q.where(shard.judge_id.in_(sorted(judge_ids)))
+    if seg_discipline_ids is not None:
+        q = q.where(shard.discipline_type_id.in_(seg_discipline_ids))
+    q = analytics._filter_select_competition_scope(q, competition_scope)
+    q = q.group_by(shard.judge_id, Competition.year)
+
+    sums: dict[tuple[int, str], dict[str, float]] = defaultdict(
+        lambda: dict.fromkeys(_SEASON_SUM_FIELDS, 0.0)
+    )
+    for row in session.execute(q).all():
+        bucket = sums[(int(row.judge_id), row.competition_year)]
+        for col in _SEASON_SUM_FIELDS:
+            bucket[col] += float(getattr(row, col) or 0)
+
+    missing = _competition_ids_without_shards(analytics, competition_scope)
+    if missing:
+        _add_mark_season_sums(
+            sums,
+            session,
+            missing,
+            judge_ids=judge_ids,
+            seg_discipline_ids=seg_discipline_ids,
+        )
+    return {
+        key: {
+            "pcs": _season_aggregate_tuple(bucket, "pcs"),
+            "elem": _season_aggregate_tuple(bucket, "elem"),
+        }
+        for key, bucket in sums.items()
+    }
+
+
 def _load_shard_pooled_totals_sql(
     session: Session,
     comp_ids: list[int],
@@ -495,58 +655,151 @@ def _load_shard_pooled_totals_sql(
     }
 
 
-def _metric_value(
-    metric: str,
-    score_type: str,
+def _load_shard_judge_aggregate_frame(
+    session: Session,
+    comp_ids: list[int],
+    seg_discipline_ids: list[int] | None,
     *,
-    pcs: dict,
-    elem: dict,
-    excess: int = 0,
-) -> float | None:
-    if score_type == "pcs":
-        total = int(pcs.get("total") or 0)
-        throwouts = int(pcs.get("throwouts") or 0)
-        anomalies = int(pcs.get("anomalies") or 0)
-        rule_errors = int(pcs.get("rule_errors") or 0)
-        pcs_n = int(pcs.get("total") or 0)
-        elem_n = 0
-    elif score_type == "element":
-        total = int(elem.get("total") or 0)
-        throwouts = int(elem.get("throwouts") or 0)
-        anomalies = int(elem.get("anomalies") or 0)
-        rule_errors = int(elem.get("rule_errors") or 0)
-        pcs_n = 0
-        elem_n = int(elem.get("total") or 0)
+    by_competition: bool,
+) -> pd.DataFrame:
+    """Same sums as ``_load_shard_judge_aggregates_sql``, one DataFrame row per group."""
+    result = session.execute(
+        _shard_judge_aggregate_query(
+            comp_ids, seg_discipline_ids, by_competition=by_competition
+        )
+    )
+    df = pd.DataFrame(result.all(), columns=list(result.keys()))
+    sums = [c for c in df.columns if c not in ("competition_id", "judge_id")]
+    df[sums] = df[sums].apply(pd.to_numeric).fillna(0)
+    return df
+
+
+def _judge_identity_index(
+    judge_id_to_label: dict[int, str],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    ``(judge ids ascending, identity code per id, label per code)`` for vectorized merges.
+
+    Judges without a label are left out, as in ``_merge_per_judge_stat_dicts_by_identity``.
+    """
+    items = [(int(jid), label) for jid, label in judge_id_to_label.items() if label]
+    if not items:
+        return np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0, object)
+    judge_ids = np.fromiter((jid for jid, _ in items), dtype=np.int64, count=len(items))
+    codes, labels = pd.factorize(pd.Series([label for _, label in items], dtype=object))
+    order = np.argsort(judge_ids, kind="stable")
+    return judge_ids[order], codes[order].astype(np.int64), np.asarray(labels, dtype=object)
+
+
+def _identity_codes(judge_ids, identity) -> np.ndarray:
+    """Identity code for each judge id; ``-1`` for judges without a label."""
+    sorted_ids, codes, _labels = identity
+    judge_ids = np.asarray(judge_ids, dtype=np.int64)
+    if not len(sorted_ids):
+        return np.full(len(judge_ids), -1, dtype=np.int64)
+    pos = np.minimum(np.searchsorted(sorted_ids, judge_ids), len(sorted_ids) - 1)
+    return np.where(sorted_ids[pos] == judge_ids, codes[pos], -1)
+
+
+def _merge_aggregates_by_identity(
+    agg: pd.DataFrame, identity, *, by_competition: bool
+) -> pd.DataFrame:
+    """Sum shard aggregates per identity (and competition) with one groupby."""
+    keys = ["competition_id", "identity"] if by_competition else ["identity"]
+    sums = [c for c in agg.columns if c not in ("competition_id", "judge_id")]
+    agg = agg.assign(identity=_identity_codes(agg["judge_id"], identity))
+    merged = (
+        agg[agg["identity"] >= 0]
+        .groupby(keys, sort=False)[sums]
+        .sum()
+        .reset_index()
+    )
+    merged["judge_name"] = identity[2][merged["identity"].to_numpy(dtype=np.int64)]
+    return merged
+
+
+def _merge_excess_by_identity(
+    excess_raw: dict, identity, *, by_competition: bool
+) -> pd.Series:
+    """
+    Excess anomaly counts summed per identity code.
+
+    ``excess_raw`` is keyed by judge id, or by ``(judge_id, competition_id)`` when
+    ``by_competition``; the result is indexed the same way with identity codes.
+    """
+    keys = ["competition_id", "identity"] if by_competition else ["identity"]
+    if by_competition:
+        frame = pd.DataFrame(
+            [(int(j), int(c), int(v or 0)) for (j, c), v in excess_raw.items()],
+            columns=["judge_id", "competition_id", "excess"],
+        )
     else:
-        total = int(pcs.get("total") or 0) + int(elem.get("total") or 0)
-        throwouts = int(pcs.get("throwouts") or 0) + int(elem.get("throwouts") or 0)
-        anomalies = int(pcs.get("anomalies") or 0) + int(elem.get("anomalies") or 0)
-        rule_errors = int(pcs.get("rule_errors") or 0) + int(elem.get("rule_errors") or 0)
-        pcs_n = int(pcs.get("total") or 0)
-        elem_n = int(elem.get("total") or 0)
-
-    if total <= 0:
-        return None
+        frame = pd.DataFrame(
+            [(int(j), int(v or 0)) for j, v in excess_raw.items()],
+            columns=["judge_id", "excess"],
+        )
+    frame["identity"] = _identity_codes(frame["judge_id"], identity)
+    return frame[frame["identity"] >= 0].groupby(keys)["excess"].sum()
 
-    if metric == "throwout_rate":
-        return (throwouts / total * 100) if total else 0.0
-    if metric == "anomaly_rate":
-        return (anomalies / total * 100) if total else 0.0
-    if metric == "rule_error_rate":
-        return (rule_errors / total * 100) if total else 0.0
-    if metric == "rule_errors":
-        return float(rule_errors) if rule_errors else None
-    if metric == "excess_anomalies":
-        return float(excess) if excess else None
-    if metric == "avg_deviation":
-        pcs_mean = float(pcs.get("avg_dev") or 0)
-        elem_mean = float(elem.get("avg_dev") or 0)
-        if score_type == "pcs":
-            return abs(pcs_mean) if pcs_n else None
-        if score_type == "element":
-            return abs(elem_mean) if elem_n else None
-        return (abs(pcs_mean) * pcs_n + abs(elem_mean) * elem_n) / total
-    return None
+
+def _metric_values(
+    metric: str, score_type: str, merged: pd.DataFrame
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    ``(metric value, total scores)`` per merged row for the selected score type.
+
+    The value is NaN where the heatmap leaves the cell out: no scores, an unknown
+    metric, or a zero count for ``rule_errors`` / ``excess_anomalies``.
+    """
+    prefixes = {"pcs": ("pcs",), "element": ("elem",)}.get(score_type, ("pcs", "elem"))
+
+    def summed(field: str) -> np.ndarray:
+        return sum(
+            merged[f"{p}_{field}"].to_numpy(dtype=np.float64) for p in prefixes
+        )
+
+    total = summed("total")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if metric == "throwout_rate":
+            value = summed("throwouts") / total * 100
+        elif metric == "anomaly_rate":
+            value = summed("anomalies") / total * 100
+        elif metric == "rule_error_rate":
+            value = summed("rule_errors") / total * 100
+        elif metric == "rule_errors":
+            value = summed("rule_errors")
+            value[value == 0] = np.nan
+        elif metric == "excess_anomalies":
+            value = merged["excess"].to_numpy(dtype=np.float64).copy()
+            value[value == 0] = np.nan
+        elif metric == "avg_deviation":
+            # |mean| weighted by count per score type is |sum of deviations| per type.
+            value = (
+                sum(
+                    np.abs(merged[f"{p}_sum_deviation"].to_numpy(dtype=np.float64))
+                    for p in prefixes
+                )
+                / total
+            )
+        else:
+            value = np.full(len(merged), np.nan)
+    value[total <= 0] = np.nan
+    return value, total
+
+
+def _heatmap_rows(
+    metric: str, score_type: str, merged: pd.DataFrame
+) -> pd.DataFrame:
+    """Merged identity rows with ``metric_value`` / ``total_scores``; empty cells dropped."""
+    value, total = _metric_values(metric, score_type, merged)
+    keep = ~np.isnan(value)
+    rows = merged.loc[keep].copy()
+    rows["metric_value"] = np.round(value[keep], 4 if metric == "avg_deviation" else 2)
+    rows["total_scores"] = total[keep].astype(np.int64)
+    rows["pcs_scores"] = rows["pcs_total"].astype(np.int64)
+    rows["element_scores"] = rows["elem_total"].astype(np.int64)
+    rows["_sort_name"] = rows["judge_name"].str.lower()
+    return rows
 
 
 def assemble_judge_overview_heatmap(
@@ -579,20 +832,14 @@ def assemble_judge_overview_heatmap(
     if not comp_ids:
         return _empty_overview_heatmap_df()
 
-    judge_id_to_label = analytics.get_judge_id_to_identity_label()
-    pcs_raw, elem_raw = _load_shard_judge_aggregates_sql(
+    identity = _judge_identity_index(analytics.get_judge_id_to_identity_label())
+    agg = _load_shard_judge_aggregate_frame(
         session, comp_ids, seg_discipline_ids, by_competition=False
     )
-    if not pcs_raw and not elem_raw:
+    merged = _merge_aggregates_by_identity(agg, identity, by_competition=False)
+    if merged.empty:
         return _empty_overview_heatmap_df()
-    pcs_dict = analytics._merge_per_judge_stat_dicts_by_identity(
-        pcs_raw, judge_id_to_label
-    )
-    elem_dict = analytics._merge_per_judge_stat_dicts_by_identity(
-        elem_raw, judge_id_to_label
-    )
 
-    excess_anomalies: dict[str, int] | None = None
     if metric == "excess_anomalies":
         excess_raw = analytics._calculate_all_judge_excess_anomalies(
             year_filter=year_filter,
@@ -604,46 +851,12 @@ def assemble_judge_overview_heatmap(
             event_start_date=event_start_date,
             event_end_date=event_end_date,
         )
-        excess_anomalies = analytics._merge_excess_map_by_identity(
-            excess_raw, judge_id_to_label, by_competition=False
-        )
+        excess = _merge_excess_by_identity(excess_raw, identity, by_competition=False)
+        merged["excess"] = merged["identity"].map(excess).fillna(0)
 
-    heatmap_data = []
-    for judge_name in sorted(pcs_dict.keys() | elem_dict.keys(), key=str.lower):
-        pcs = pcs_dict.get(judge_name, {})
-        elem = elem_dict.get(judge_name, {})
-        exc = (
-            int(excess_anomalies.get(judge_name, 0))
-            if excess_anomalies is not None
-            else 0
-        )
-        value = _metric_value(
-            metric, score_type, pcs=pcs, elem=elem, excess=exc
-        )
-        if value is None:
-            continue
-        if metric in ("rule_errors", "excess_anomalies") and value == 0:
-            continue
-
-        total_scores = int(pcs.get("total", 0) or 0) + int(elem.get("total", 0) or 0)
-        if score_type == "pcs":
-            total_scores = int(pcs.get("total", 0) or 0)
-        elif score_type == "element":
-            total_scores = int(elem.get("total", 0) or 0)
-
-        heatmap_data.append(
-            {
-                "judge_name": judge_name,
-                "metric_value": round(value, 4)
-                if metric == "avg_deviation"
-                else round(value, 2),
-                "total_scores": total_scores,
-                "pcs_scores": int(pcs.get("total", 0) or 0),
-                "element_scores": int(elem.get("total", 0) or 0),
-            }
-        )
-
-    return pd.DataFrame(heatmap_data)
+    rows = _heatmap_rows(metric, score_type, merged)
+    rows = rows.sort_values("_sort_name", kind="stable")
+    return rows[_OVERVIEW_HEATMAP_COLUMNS].reset_index(drop=True)
 
 
 def assemble_judge_competition_heatmap(
@@ -673,25 +886,18 @@ def assemble_judge_competition_heatmap(
     comp_q = select(Competition.id, Competition.name, Competition.year).where(
         Competition.id.in_(comp_ids)
     )
-    comp_by_id = {
-        int(r.id): (str(r.name), str(r.year))
-        for r in session.execute(comp_q).all()
+    comp_labels = {
+        int(r.id): f"{r.name} ({r.year})" for r in session.execute(comp_q).all()
     }
 
-    judge_id_to_label = analytics.get_judge_id_to_identity_label()
-    pcs_raw, elem_raw = _load_shard_judge_aggregates_sql(
+    identity = _judge_identity_index(analytics.get_judge_id_to_identity_label())
+    agg = _load_shard_judge_aggregate_frame(
         session, comp_ids, seg_discipline_ids, by_competition=True
     )
-    if not pcs_raw and not elem_raw:
+    merged = _merge_aggregates_by_identity(agg, identity, by_competition=True)
+    if merged.empty:
         return _empty_competition_heatmap_df()
-    pcs_dict = analytics._merge_competition_judge_stat_dicts_by_identity(
-        pcs_raw, judge_id_to_label
-    )
-    elem_dict = analytics._merge_competition_judge_stat_dicts_by_identity(
-        elem_raw, judge_id_to_label
-    )
 
-    excess_anomalies = None
     if metric == "excess_anomalies":
         excess_raw = analytics._calculate_all_judge_excess_anomalies(
             year_filter=None,
@@ -703,43 +909,14 @@ def assemble_judge_competition_heatmap(
             event_start_date=event_start_date,
             event_end_date=event_end_date,
         )
-        excess_anomalies = analytics._merge_excess_map_by_identity(
-            excess_raw, judge_id_to_label, by_competition=True
-        )
+        excess = _merge_excess_by_identity(excess_raw, identity, by_competition=True)
+        merged = merged.join(excess, on=["competition_id", "identity"])
+        merged["excess"] = merged["excess"].fillna(0)
 
-    heatmap_data = []
-    for comp_id, judge_name in sorted(
-        pcs_dict.keys() | elem_dict.keys(),
-        key=lambda k: (k[0], k[1].lower()),
-    ):
-        comp_name, comp_year = comp_by_id.get(comp_id, ("", ""))
-        pcs = pcs_dict.get((comp_id, judge_name), {})
-        elem = elem_dict.get((comp_id, judge_name), {})
-        exc = 0
-        if excess_anomalies is not None:
-            exc = int(excess_anomalies.get((judge_name, comp_id), 0))
-        value = _metric_value(metric, score_type, pcs=pcs, elem=elem, excess=exc)
-        if value is None:
-            continue
-        if metric in ("rule_errors", "excess_anomalies") and value == 0:
-            continue
-        total_scores = int(pcs.get("total", 0) or 0) + int(elem.get("total", 0) or 0)
-        if score_type == "pcs":
-            total_scores = int(pcs.get("total", 0) or 0)
-        elif score_type == "element":
-            total_scores = int(elem.get("total", 0) or 0)
-        heatmap_data.append(
-            {
-                "judge_name": judge_name,
-                "competition": f"{comp_name} ({comp_year})",
-                "metric_value": round(value, 4)
-                if metric == "avg_deviation"
-                else round(value, 2),
-                "total_scores": total_scores,
-            }
-        )
-
-    return pd.DataFrame(heatmap_data)
+    rows = _heatmap_rows(metric, score_type, merged)
+    rows["competition"] = rows["competition_id"].map(comp_labels).fillna(" ()")
+    rows = rows.sort_values(["competition_id", "_sort_name"], kind="stable")
+    return rows[_COMP_HEATMAP_COLUMNS].reset_index(drop=True)
 
 
 def assemble_pooled_cross_judge_metrics(
@@ -821,11 +998,9 @@ def assemble_pooled_cross_judge_metrics(
             event_start_date=event_start_date,
             event_end_date=event_end_date,
         )
-        id_to_label = analytics.get_judge_id_to_identity_label()
-        excess_map = analytics._merge_excess_map_by_identity(
-            excess_raw, id_to_label, by_competition=False
-        )
-        total_excess = int(sum(excess_map.values()))
+        identity = _judge_identity_index(analytics.get_judge_id_to_identity_label())
+        excess = _merge_excess_by_identity(excess_raw, identity, by_competition=False)
+        total_excess = int(excess.sum())
 
     if total_scores <= 0:
         return {
@@ -202,6 +202,11 @@ def ensure_database_for_streamlit() -> str:
     return url
 
 
+def bind_database_url(url: str, source: str = "explicit") -> None:
+    """Bind the shared engine to an already-resolved URL (e.g. in a worker process)."""
+    _bind_engine(url, source)
+
+
 def get_database_url() -> str:
     ensure_database_for_streamlit()
     return _active_url or resolve_database_url()[0]
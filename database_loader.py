@@ -4,12 +4,16 @@ import datetime
 import decimal
 import re
 import unicodedata
-from sqlalchemy import select, tuple_, update
+import weakref
+from collections.abc import Iterator, Mapping
+from typing import NamedTuple
+from sqlalchemy import event, select, tuple_, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.sql import bindparam, text
 import pandas as pd
 from sqlalchemy.orm import Session
 from models import Judge, Competition, Segment, Skater, SkaterSegment, Element, ElementScorePerJudge, PcsScorePerJudge, PcsType, ElementType, DisciplineType, SegmentOfficial
+from cache_rebuild_queue import bump_protocol_table_versions, refresh_protocol_activity_facts
 from database import get_db_session, test_connection
 from pcs_fall_rule_errors import (
     max_pcs_for_fall_count,
@@ -23,18 +27,29 @@ from rule_errors_policy import (
     should_flag_pcs_fall_rule_errors,
     should_flag_rule_errors,
 )
+from segment_rule411 import (
+    refresh_segment_rule411_eligibility,
+    segment_rule411_table_exists,
+)
 
 try:
     from judge_official_link_core import (
+        FuzzyNameMatcher,
         normalize_name,
         protocol_person_match_key,
         suggest_matches,
     )
 except ImportError:  # pragma: no cover
+    FuzzyNameMatcher = None  # type: ignore[misc, assignment]
     normalize_name = None  # type: ignore[misc, assignment]
     protocol_person_match_key = None  # type: ignore[misc, assignment]
     suggest_matches = None  # type: ignore[misc, assignment]
 
+# Directory / ISU fuzzy auto-match: candidates >= MIN, best >= ACCEPT and ahead by MARGIN.
+FUZZY_OFFICIAL_MIN_SCORE = 88
+FUZZY_OFFICIAL_ACCEPT_SCORE = 92
+FUZZY_OFFICIAL_MIN_MARGIN = 3
+
 
 def coerce_competition_date(value: object) -> datetime.date | None:
     """Map scrape/metadata values to ``date`` or ``None`` (never empty string)."""
@@ -109,10 +124,6 @@ def select_canonical_judge_ids_per_match_key(
     return out
 
 
-def _judge_match_key_sql_expr() -> str:
-    return "lower(regexp_replace(trim(name), '\\\\s+', ' ', 'g'))"
-
-
 def _normalize_skater_name_key(name: str) -> str:
     if not name:
         return ""
@@ -123,27 +134,190 @@ def _normalize_skater_name_key(name: str) -> str:
     return t.strip()
 
 
+def _skater_name_match_key(name: str) -> tuple[str, ...]:
+    """Hashable form of ``_skater_names_equivalent``: equal keys iff equivalent names."""
+    return tuple(sorted(_normalize_skater_name_key(name).split()))
+
+
 def _skater_names_equivalent(parsed_name: str, db_name: str) -> bool:
     """Match protocol skater labels to ``public.skater.name`` across case/order variants."""
-    ka = _normalize_skater_name_key(parsed_name)
-    kb = _normalize_skater_name_key(db_name)
-    if not ka or not kb:
-        return ka == kb
-    if ka == kb:
-        return True
-    return sorted(ka.split()) == sorted(kb.split())
+    return _skater_name_match_key(parsed_name) == _skater_name_match_key(db_name)
+
+
+def _skater_match_key_index(
+    skater_dict: dict[str, int], match_key=_skater_name_match_key
+) -> dict[tuple[str, ...], str]:
+    """Match key → first equivalent DB name (in ``skater_dict`` order)."""
+    index: dict[tuple[str, ...], str] = {}
+    for db_name in skater_dict:
+        index.setdefault(match_key(db_name), db_name)
+    return index
 
 
 def _resolve_skater_dict_key(
-    skater_dict: dict[str, int], parsed_name: str
+    skater_dict: dict[str, int],
+    parsed_name: str,
+    skater_keys: dict[tuple[str, ...], str] | None = None,
 ) -> str | None:
+    """
+    DB skater name for a parsed label: exact key, else an equivalent name.
+
+    Pass ``skater_keys`` (``_skater_match_key_index``) when resolving many labels
+    against one segment so each miss is a single hash probe.
+    """
     text = str(parsed_name)
     if text in skater_dict:
         return text
-    for db_name in skater_dict:
-        if _skater_names_equivalent(text, db_name):
-            return db_name
-    return None
+    if skater_keys is None:
+        skater_keys = _skater_match_key_index(skater_dict)
+    return skater_keys.get(_skater_name_match_key(text))
+
+
+class SegmentScoreMaps(NamedTuple):
+    """Name / id keys for matching parsed protocol rows to one segment's element rows."""
+
+    skater_dict: dict[str, int]
+    ss_map: dict[int, int]
+    elem_id_by_pair: dict[tuple[int, str], int]
+    skater_keys: dict[tuple[str, ...], str]
+
+
+def _segment_score_maps_from_rows(rows, match_key=_skater_name_match_key) -> SegmentScoreMaps:
+    skater_dict: dict[str, int] = {}
+    ss_map: dict[int, int] = {}
+    elem_id_by_pair: dict[tuple[int, str], int] = {}
+    for skater_name, skater_id, ss_id, el_name, el_id in rows:
+        skater_dict[str(skater_name)] = int(skater_id)
+        ss_map[int(skater_id)] = int(ss_id)
+        elem_id_by_pair[(int(ss_id), str(el_name))] = int(el_id)
+    return SegmentScoreMaps(
+        skater_dict,
+        ss_map,
+        elem_id_by_pair,
+        _skater_match_key_index(skater_dict, match_key),
+    )
+
+
+class CompetitionScoreMaps(Mapping):
+    """
+    ``segment_id → SegmentScoreMaps`` for one competition, built per segment on first use.
+
+    Rows come from one query ordered by segment; a segment's maps are only built when a
+    backfill reaches it. Skater match keys are computed once per distinct name and shared
+    across segments (short and free programs list the same skaters).
+    """
+
+    __slots__ = ("_rows", "_ranges", "_built", "_match_keys")
+
+    def __init__(self, rows) -> None:
+        self._rows = rows
+        self._ranges: dict[int, tuple[int, int]] = {}
+        for i, row in enumerate(rows):
+            sid = int(row[0])
+            start, _stop = self._ranges.get(sid, (i, i))
+            self._ranges[sid] = (start, i + 1)
+        self._built: dict[int, SegmentScoreMaps] = {}
+        self._match_keys: dict[str, tuple[str, ...]] = {}
+
+    def _match_key(self, name: str) -> tuple[str, ...]:
+        key = self._match_keys.get(name)
+        if key is None:
+            key = self._match_keys[name] = _skater_name_match_key(name)
+        return key
+
+    def __getitem__(self, segment_id: int) -> SegmentScoreMaps:
+        segment_id = int(segment_id)
+        maps = self._built.get(segment_id)
+        if maps is None:
+            start, stop = self._ranges[segment_id]
+            maps = _segment_score_maps_from_rows(
+                (row[1:] for row in self._rows[start:stop]), self._match_key
+            )
+            self._built[segment_id] = maps
+        return maps
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ranges)
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+
+class _DimensionCache:
+    """
+    Key → id for one dimension table, kept for the loader's lifetime.
+
+    Ids of rows inserted in the open transaction stay ``pending`` until the session
+    commits and are dropped if it rolls back.
+    """
+
+    __slots__ = ("ids", "pending")
+
+    def __init__(self) -> None:
+        self.ids: dict = {}
+        self.pending: dict = {}
+
+    def get(self, key) -> int | None:
+        found = self.pending.get(key)
+        return found if found is not None else self.ids.get(key)
+
+    def missing(self, keys) -> list:
+        return [
+            k for k in dict.fromkeys(keys) if k not in self.ids and k not in self.pending
+        ]
+
+    def add(self, key, id_, *, new: bool = False) -> None:
+        if new:
+            self.pending[key] = int(id_)
+        else:
+            self.ids.setdefault(key, int(id_))
+
+    def after_commit(self) -> None:
+        self.ids.update(self.pending)
+        self.pending.clear()
+
+    def after_rollback(self) -> None:
+        self.pending.clear()
+
+
+_DIMENSION_CACHE_NAMES = (
+    "judge",
+    "skater",
+    "element_type",
+    "pcs_type",
+    "discipline_type",
+    "segment",
+)
+
+
+# ``session.info`` key: loaders whose dimension caches follow that session's transactions.
+_DIMENSION_CACHE_LOADERS = "dimension_cache_loaders"
+
+
+@event.listens_for(Session, "after_commit")
+def _promote_dimension_caches(session) -> None:
+    for loader in list(session.info.get(_DIMENSION_CACHE_LOADERS, ())):
+        for cache in loader._dimension_caches.values():
+            cache.after_commit()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending_dimension_caches(session) -> None:
+    for loader in list(session.info.get(_DIMENSION_CACHE_LOADERS, ())):
+        for cache in loader._dimension_caches.values():
+            cache.after_rollback()
+
+
+def _listen_dimension_cache_transactions(loader: "DatabaseLoader") -> None:
+    """
+    Promote / drop pending cache ids with the session's transaction.
+
+    The listeners above are registered once for every ``Session``; this only adds the
+    loader to the session's weak set, so repeated loaders on one session add nothing.
+    """
+    if not isinstance(loader.session, Session):
+        return
+    loader.session.info.setdefault(_DIMENSION_CACHE_LOADERS, weakref.WeakSet()).add(loader)
 
 
 _ELEMENT_MARKING_TOKEN_RE = re.compile(r"^[F*<!>qnscuSCUex,b|]+$", re.IGNORECASE)
@@ -188,6 +362,15 @@ def _resolve_element_dict_key(
     return None
 
 
+# ``competition`` flag column → lower-cased ``discipline_type.name`` values that set it.
+_COMPETITION_DISCIPLINE_FLAG_NAMES: dict[str, tuple[str, ...]] = {
+    "singles": ("singles",),
+    "pairs": ("pairs",),
+    "dance": ("ice dance", "solo dance"),
+    "synchronized": ("synchronized",),
+}
+
+
 def _competition_flags_from_discipline_type_name(
     name: str | None,
 ) -> tuple[bool, bool, bool, bool]:
@@ -198,12 +381,56 @@ def _competition_flags_from_discipline_type_name(
     if not name or not str(name).strip():
         return False, False, False, False
     key = str(name).strip().lower()
-    singles = key == "singles"
-    pairs = key == "pairs"
-    dance = key in ("ice dance", "solo dance")
-    synchronized = key == "synchronized"
+    singles, pairs, dance, synchronized = (
+        key in names for names in _COMPETITION_DISCIPLINE_FLAG_NAMES.values()
+    )
     return singles, pairs, dance, synchronized
 
+
+def competition_discipline_flags_update(competition_ids=None):
+    """
+    One ``UPDATE competition … FROM (aggregate)`` setting every discipline flag from
+    its segments' discipline types. Competitions without segments get all ``false``;
+    rows whose flags already match are not touched. ``competition_ids`` limits the set.
+    """
+    from sqlalchemy import case, false, func, or_
+
+    type_key = func.lower(func.trim(DisciplineType.name))
+    flags = (
+        select(
+            Competition.id.label("competition_id"),
+            *(
+                func.coalesce(
+                    func.max(case((type_key.in_(names), 1), else_=0)), 0
+                ).label(column)
+                for column, names in _COMPETITION_DISCIPLINE_FLAG_NAMES.items()
+            ),
+        )
+        .select_from(Competition)
+        .outerjoin(Segment, Segment.competition_id == Competition.id)
+        .outerjoin(DisciplineType, DisciplineType.id == Segment.discipline_type_id)
+        .group_by(Competition.id)
+    )
+    if competition_ids is not None:
+        flags = flags.where(Competition.id.in_(sorted({int(c) for c in competition_ids})))
+    flags = flags.subquery("discipline_flags")
+    target = Competition.__table__
+    new_values = {column: flags.c[column] == 1 for column in _COMPETITION_DISCIPLINE_FLAG_NAMES}
+    return (
+        update(target)
+        .where(target.c.id == flags.c.competition_id)
+        .where(
+            or_(
+                *(
+                    func.coalesce(target.c[column], false()).is_distinct_from(value)
+                    for column, value in new_values.items()
+                )
+            )
+        )
+        .values(new_values)
+    )
+
+
 # Initialize connection.
 # conn = st.connection("postgresql", type="sql")
 
@@ -237,6 +464,35 @@ class DatabaseLoader:
         self.session = session
         self.defer_commits = defer_commits
         self._isu_official_schema_cache: bool | None = None
+        self._segment_rule411_table_cache: bool | None = None
+        # Roster matchers are built once per loader (batch loads reuse them per segment).
+        self._directory_matcher = None
+        self._isu_matcher = None
+        # Scraped official name → (official_id, isu_official_id); see ``_resolve_official_ids``.
+        self._official_ids_by_name: dict[str, tuple[int | None, int | None]] = {}
+        # Judge / skater / type / segment ids; see ``warm_dimension_caches``.
+        self._dimension_caches = {name: _DimensionCache() for name in _DIMENSION_CACHE_NAMES}
+        self._segment_competitions_cached: set[int] = set()
+        _listen_dimension_cache_transactions(self)
+
+    def warm_dimension_caches(self) -> None:
+        """
+        Load every judge, skater, element/PCS/discipline type id in one query each so a
+        batch load resolves names without per-segment lookups. Segments are cached per
+        competition on first use.
+        """
+        self._cache_judge_ids_by_match_key(None)
+        skaters = self._dimension_caches["skater"]
+        for row in self.session.execute(
+            select(Skater.id, Skater.match_key)
+            .where(Skater.match_key.isnot(None))
+            .order_by(Skater.id)
+        ):
+            skaters.add(str(row.match_key), row.id)
+        for model in (ElementType, PcsType, DisciplineType):
+            cache = self._dimension_caches[model.__tablename__]
+            for row in self.session.execute(select(model.id, model.name).order_by(model.id)):
+                cache.add(str(row.name), row.id)
 
     def commit(self) -> None:
         """Flush pending ORM work and commit (used at end of batch scrapes)."""
@@ -268,53 +524,150 @@ class DatabaseLoader:
 
         ``appointment_type_id`` follows role labels.
         """
-        if not rows:
-            return
+        self.replace_competition_segment_officials({segment_id: rows})
+
+    def replace_competition_segment_officials(self, rows_by_segment: dict[int, list]) -> int:
+        """
+        ``replace_segment_officials`` for several segments (usually one competition's
+        panels): one delete, names resolved once across all panels, one upsert, then the
+        touched competitions' protocol activity facts are rebuilt.
+        Returns ``segment_official`` rows written.
+        """
+        rows_by_segment = {int(sid): rows for sid, rows in rows_by_segment.items() if rows}
+        if not rows_by_segment:
+            return 0
+        names_by_segment = {
+            sid: [normalize_scraped_judge_name(r["name"]) for r in rows]
+            for sid, rows in rows_by_segment.items()
+        }
+        all_names = [n for names in names_by_segment.values() for n in names]
+        if not all(all_names):
+            raise ValueError("replace_segment_officials: empty name after normalization")
+        judge_ids = self._ensure_judges_by_name(all_names)
+        self._resolve_official_ids(all_names, [judge_ids[n] for n in all_names])
+
         self.session.query(SegmentOfficial).filter(
-            SegmentOfficial.segment_id == segment_id
+            SegmentOfficial.segment_id.in_(list(rows_by_segment))
         ).delete(synchronize_session=False)
-        choices_cache: dict[int, str] | None = None
-        isu_choices_cache: dict[int, str] | None = None
-        for r in rows:
-            official_name = normalize_scraped_judge_name(r["name"])
-            role = r["role"]
-            judge_id = self.insert_judge(official_name)
-            appt_type_id = appointment_type_id_for_ijs_role(role)
-            oid = self._official_id_from_judge_id(judge_id)
-            if oid is None:
-                oid = self._official_id_from_name_alias(official_name)
-            if oid is None:
-                oid = self._official_id_from_exact_directory_name(official_name)
-            if oid is None:
-                if choices_cache is None:
-                    choices_cache = self._load_official_directory_choices()
-                oid = self._official_id_from_fuzzy_directory_name(
-                    official_name, choices_cache
-                )
-            isu_oid = None
-            if oid is None and self._isu_official_schema_ready():
-                isu_oid = self._isu_official_id_from_judge_id(judge_id)
-                if isu_oid is None:
-                    isu_oid = self._isu_official_id_from_name_alias(official_name)
-                if isu_oid is None:
-                    isu_oid = self._isu_official_id_from_exact_name(official_name)
-                if isu_oid is None:
-                    if isu_choices_cache is None:
-                        isu_choices_cache = self._load_isu_official_choices()
-                    isu_oid = self._isu_official_id_from_fuzzy_name(
-                        official_name, isu_choices_cache
-                    )
-            self.session.add(
-                SegmentOfficial(
-                    segment_id=segment_id,
-                    official_name=official_name,
-                    official_id=oid,
-                    isu_official_id=isu_oid,
-                    role=role,
-                    appointment_type_id=appt_type_id,
-                )
-            )
+        # Keyed like ``segment_official_segment_role_uniq``; a repeated role keeps its last row.
+        by_role: dict[tuple[int, str], dict] = {}
+        for sid, rows in rows_by_segment.items():
+            for r, official_name in zip(rows, names_by_segment[sid]):
+                oid, isu_oid = self._official_ids_by_name[official_name]
+                role = r["role"]
+                by_role[(sid, role)] = {
+                    "segment_id": sid,
+                    "official_name": official_name,
+                    "official_id": oid,
+                    "isu_official_id": isu_oid,
+                    "role": role,
+                    "appointment_type_id": appointment_type_id_for_ijs_role(role),
+                }
+        self._pg_bulk_upsert(
+            SegmentOfficial,
+            list(by_role.values()),
+            "segment_official_segment_role_uniq",
+            update_columns=(
+                "official_name",
+                "official_id",
+                "isu_official_id",
+                "appointment_type_id",
+            ),
+        )
+        # Loads without ``rebuild_analytics_caches`` and the backfill enqueue nothing.
+        bump_protocol_table_versions(self.session)
+        competition_ids = self.session.execute(
+            select(Segment.competition_id)
+            .where(Segment.id.in_(list(rows_by_segment)))
+            .distinct()
+        ).scalars().all()
+        refresh_protocol_activity_facts(self.session, competition_ids)
         self._persist()
+        return len(by_role)
+
+    def _resolve_official_ids(self, names: list[str], judge_ids: list[int]) -> None:
+        """
+        Add ``(official_id, isu_official_id)`` to ``_official_ids_by_name`` for names this
+        loader has not resolved yet, in ``replace_segment_officials`` order. Each step is
+        one set-based query over the names still unmatched; fuzzy is one bulk pass per roster.
+        """
+        judge_by_name: dict[str, int] = {}
+        for name, judge_id in zip(names, judge_ids):
+            if name not in self._official_ids_by_name:
+                judge_by_name.setdefault(name, int(judge_id))
+        if not judge_by_name:
+            return
+        norms = {name: _normalize_person_name(name) for name in judge_by_name}
+        judge_of, norm_of = judge_by_name.__getitem__, norms.__getitem__
+
+        def resolve(pending: list[str], steps, matcher) -> list[int | None]:
+            ids: list[int | None] = [None] * len(pending)
+            for ids_by_key, key_of in steps:
+                missing = [i for i, v in enumerate(ids) if v is None]
+                if not missing:
+                    break
+                keys = sorted({key_of(pending[i]) for i in missing} - {""})
+                found = ids_by_key(keys) if keys else {}
+                for i in missing:
+                    ids[i] = found.get(key_of(pending[i]))
+            self._fill_fuzzy_ids(ids, pending, matcher)
+            return ids
+
+        todo = list(judge_by_name)
+        oids = resolve(
+            todo,
+            (
+                (self._official_ids_by_judge_id, judge_of),
+                (self._official_ids_by_name_alias, norm_of),
+                (self._official_ids_by_exact_directory_name, norm_of),
+            ),
+            self._official_directory_matcher(),
+        )
+        isu_by_name: dict[str, int | None] = {}
+        no_us = [name for name, oid in zip(todo, oids) if oid is None]
+        if no_us and self._isu_official_schema_ready():
+            isu_oids = resolve(
+                no_us,
+                (
+                    (self._isu_official_ids_by_judge_id, judge_of),
+                    (self._isu_official_ids_by_name_alias, norm_of),
+                    (self._isu_official_ids_by_exact_name, norm_of),
+                ),
+                self._isu_official_matcher(),
+            )
+            isu_by_name = dict(zip(no_us, isu_oids))
+        for name, oid in zip(todo, oids):
+            self._official_ids_by_name[name] = (oid, isu_by_name.get(name))
+
+    @staticmethod
+    def _fill_fuzzy_ids(ids: list[int | None], names: list[str], matcher) -> None:
+        """Fill ``None`` slots of ``ids`` with confident fuzzy matches (one bulk pass)."""
+        todo = [i for i, v in enumerate(ids) if v is None]
+        if not todo or matcher is None or not len(matcher):
+            return
+        found = matcher.confident_ids(
+            [names[i] for i in todo],
+            min_score=FUZZY_OFFICIAL_MIN_SCORE,
+            accept_score=FUZZY_OFFICIAL_ACCEPT_SCORE,
+            min_margin=FUZZY_OFFICIAL_MIN_MARGIN,
+        )
+        for i, oid in zip(todo, found):
+            if oid is not None:
+                ids[i] = oid
+
+    def _official_directory_matcher(self):
+        """Blocked bulk matcher over the US directory, built once per loader."""
+        if self._directory_matcher is None and FuzzyNameMatcher is not None:
+            self._directory_matcher = FuzzyNameMatcher(
+                self._load_official_directory_choices()
+            )
+        return self._directory_matcher
+
+    def _isu_official_matcher(self):
+        """Blocked bulk matcher over the ISU roster, built once per loader."""
+        if self._isu_matcher is None and FuzzyNameMatcher is not None:
+            self._isu_matcher = FuzzyNameMatcher(self._load_isu_official_choices())
+        return self._isu_matcher
 
     def _flush(self) -> None:
         """Persist pending work to the DB without ending the transaction (fast for bulk loads)."""
@@ -399,71 +752,73 @@ class DatabaseLoader:
         ).all()
         return {int(row.judge_id): int(row.total) for row in rows}
 
+    def _cache_judge_ids_by_match_key(self, keys: list[str] | None) -> None:
+        """Cache the canonical ``judge.id`` per match key (``None`` = every judge)."""
+        if keys is not None and not keys:
+            return
+        stmt = select(Judge.id, Judge.match_key).where(Judge.match_key.isnot(None))
+        if keys is not None:
+            stmt = stmt.where(Judge.match_key.in_(keys))
+        candidates: dict[str, list[int]] = {}
+        for row in self.session.execute(stmt.order_by(Judge.id)).all():
+            candidates.setdefault(str(row.match_key), []).append(int(row.id))
+        dup_ids = [
+            jid for jid_list in candidates.values() if len(jid_list) > 1 for jid in jid_list
+        ]
+        score_counts = self._judge_score_counts(dup_ids) if dup_ids else {}
+        cache = self._dimension_caches["judge"]
+        for key, jid in select_canonical_judge_ids_per_match_key(
+            candidates, score_counts
+        ).items():
+            cache.add(key, jid)
+
     def _ensure_judges_by_name(self, names: list[str]) -> dict[str, int]:
         displays = [normalize_scraped_judge_name(str(n)) for n in names]
         unique_displays = list(dict.fromkeys(d for d in displays if d))
         if not unique_displays:
             return {}
         keys = {d: judge_person_match_key(d) for d in unique_displays}
-        unique_keys = list(dict.fromkeys(keys.values()))
-        by_key: dict[str, int] = {}
-        if unique_keys:
-            match_key_expr = _judge_match_key_sql_expr()
-            rows = self.session.execute(
-                text(f"""
-                    SELECT id, name, {match_key_expr} AS match_key
-                    FROM judge
-                    WHERE {match_key_expr} IN :keys
-                    ORDER BY id
-                """).bindparams(bindparam("keys", expanding=True)),
-                {"keys": unique_keys},
-            ).all()
-            candidates: dict[str, list[int]] = {}
-            for row in rows:
-                mk = str(row.match_key)
-                candidates.setdefault(mk, []).append(int(row.id))
-            dup_ids = [
-                jid for jid_list in candidates.values() if len(jid_list) > 1 for jid in jid_list
-            ]
-            score_counts = self._judge_score_counts(dup_ids) if dup_ids else {}
-            by_key = select_canonical_judge_ids_per_match_key(
-                candidates, score_counts
-            )
+        cache = self._dimension_caches["judge"]
+        self._cache_judge_ids_by_match_key(cache.missing(keys.values()))
         by_name: dict[str, int] = {}
         for display in unique_displays:
             mk = keys[display]
-            if mk in by_key:
-                by_name[display] = by_key[mk]
+            cached = cache.get(mk)
+            if cached is not None:
+                by_name[display] = cached
                 continue
-            self.session.add(Judge(name=display))
+            judge = Judge(name=display, match_key=mk)
+            self.session.add(judge)
             self.session.flush()
-            by_name[display] = int(
-                self.session.execute(
-                    select(Judge.id).where(Judge.name == display)
-                ).scalar_one()
-            )
-            by_key[mk] = by_name[display]
+            by_name[display] = int(judge.id)
+            cache.add(mk, judge.id, new=True)
         return by_name
 
     def _ensure_skaters_by_name(self, names: list[str]) -> dict[str, int]:
+        """Protocol skater name → ``skater.id``, matching on the indexed ``match_key``."""
         unique = list(dict.fromkeys(names))
         if not unique:
             return {}
-        rows = self.session.execute(
-            select(Skater.id, Skater.name).where(Skater.name.in_(unique))
-        ).all()
-        by_name = {str(r.name): int(r.id) for r in rows}
-        missing = [n for n in unique if n not in by_name]
-        for n in missing:
-            self.session.add(Skater(name=n))
+        keys = {n: _normalize_skater_name_key(n) for n in unique}
+        cache = self._dimension_caches["skater"]
+        missing = cache.missing(keys.values())
         if missing:
+            for row in self.session.execute(
+                select(Skater.id, Skater.match_key)
+                .where(Skater.match_key.in_(missing))
+                .order_by(Skater.id)
+            ):
+                cache.add(str(row.match_key), row.id)
+        new_rows: dict[str, Skater] = {}
+        for n in unique:
+            if cache.get(keys[n]) is None and keys[n] not in new_rows:
+                new_rows[keys[n]] = Skater(name=n, match_key=keys[n])
+        if new_rows:
+            self.session.add_all(new_rows.values())
             self.session.flush()
-            rows = self.session.execute(
-                select(Skater.id, Skater.name).where(Skater.name.in_(missing))
-            ).all()
-            for r in rows:
-                by_name[str(r.name)] = int(r.id)
-        return by_name
+            for key, skater in new_rows.items():
+                cache.add(key, skater.id, new=True)
+        return {n: cache.get(keys[n]) for n in unique}
 
     def _ensure_skater_segments_map(
         self, segment_id: int, skater_ids: list[int],
@@ -496,49 +851,31 @@ class DatabaseLoader:
                 out[int(r.skater_id)] = int(r.id)
         return out
 
-    def _ensure_element_types_by_name(self, names: list[str]) -> dict[str, int]:
+    def _ensure_dimension_ids_by_name(self, model, names: list[str]) -> dict[str, int]:
+        """``name`` → id for a small lookup table (element / PCS / discipline types)."""
         unique = list(dict.fromkeys(names))
         if not unique:
             return {}
-        rows = self.session.execute(
-            select(ElementType.id, ElementType.name).where(
-                ElementType.name.in_(unique)
-            )
-        ).all()
-        by_name = {str(r.name): int(r.id) for r in rows}
-        missing = [n for n in unique if n not in by_name]
-        for n in missing:
-            self.session.add(ElementType(name=n))
+        cache = self._dimension_caches[model.__tablename__]
+        missing = cache.missing(unique)
         if missing:
+            for row in self.session.execute(
+                select(model.id, model.name).where(model.name.in_(missing)).order_by(model.id)
+            ):
+                cache.add(str(row.name), row.id)
+        new_rows = [model(name=n) for n in cache.missing(unique)]
+        if new_rows:
+            self.session.add_all(new_rows)
             self.session.flush()
-            rows = self.session.execute(
-                select(ElementType.id, ElementType.name).where(
-                    ElementType.name.in_(missing)
-                )
-            ).all()
-            for r in rows:
-                by_name[str(r.name)] = int(r.id)
-        return by_name
+            for row in new_rows:
+                cache.add(row.name, row.id, new=True)
+        return {n: cache.get(n) for n in unique}
+
+    def _ensure_element_types_by_name(self, names: list[str]) -> dict[str, int]:
+        return self._ensure_dimension_ids_by_name(ElementType, names)
 
     def _ensure_pcs_types_by_name(self, names: list[str]) -> dict[str, int]:
-        unique = list(dict.fromkeys(names))
-        if not unique:
-            return {}
-        rows = self.session.execute(
-            select(PcsType.id, PcsType.name).where(PcsType.name.in_(unique))
-        ).all()
-        by_name = {str(r.name): int(r.id) for r in rows}
-        missing = [n for n in unique if n not in by_name]
-        for n in missing:
-            self.session.add(PcsType(name=n))
-        if missing:
-            self.session.flush()
-            rows = self.session.execute(
-                select(PcsType.id, PcsType.name).where(PcsType.name.in_(missing))
-            ).all()
-            for r in rows:
-                by_name[str(r.name)] = int(r.id)
-        return by_name
+        return self._ensure_dimension_ids_by_name(PcsType, names)
 
     def _pg_bulk_insert_ignore(
         self, table, rows: list[dict], constraint: str,
@@ -582,24 +919,44 @@ class DatabaseLoader:
         ``segment_official`` rows, load ``rows``. Used when ``scrape`` skips score
         processing (e.g. ``event_regex``) but panel data is available.
         """
-        if not rows or not segment_name:
-            return False
-        segment = (
-            self.session.query(Segment)
-            .filter_by(competition_id=competition_id, name=segment_name)
-            .first()
+        return bool(
+            self.ensure_competition_segment_officials_if_empty(
+                competition_id, {segment_name: rows}
+            )
         )
-        if segment is None:
-            return False
-        existing = (
-            self.session.query(SegmentOfficial)
-            .filter(SegmentOfficial.segment_id == segment.id)
-            .count()
+
+    def ensure_competition_segment_officials_if_empty(
+        self, competition_id: int, rows_by_segment_name: dict[str, list]
+    ) -> int:
+        """
+        ``ensure_segment_officials_if_empty`` for many segments of one competition in a
+        fixed number of queries. Returns how many segments were loaded.
+        """
+        wanted = {name: rows for name, rows in rows_by_segment_name.items() if name and rows}
+        if not wanted:
+            return 0
+        segment_ids = dict(
+            self.session.execute(
+                select(Segment.name, Segment.id)
+                .where(Segment.competition_id == competition_id)
+                .where(Segment.name.in_(list(wanted)))
+                .order_by(Segment.id.desc())
+            ).all()
         )
-        if existing > 0:
-            return False
-        self.replace_segment_officials(segment.id, rows)
-        return True
+        if not segment_ids:
+            return 0
+        filled = set(
+            self.session.execute(
+                select(SegmentOfficial.segment_id)
+                .where(SegmentOfficial.segment_id.in_(list(segment_ids.values())))
+                .distinct()
+            ).scalars()
+        )
+        todo = {
+            sid: wanted[name] for name, sid in segment_ids.items() if sid not in filled
+        }
+        self.replace_competition_segment_officials(todo)
+        return len(todo)
 
     def _load_official_directory_choices(self) -> dict[int, str]:
         try:
@@ -614,73 +971,81 @@ class DatabaseLoader:
             return {}
         return {int(r["id"]): str(r["full_name"]) for r in rows}
 
-    def _official_id_from_exact_directory_name(self, official_name: str) -> int | None:
-        norm = _normalize_person_name(official_name)
-        if not norm:
-            return None
-        try:
-            rows = self.session.execute(
-                text("""
-                    SELECT id FROM officials_analysis.officials
-                    WHERE full_name IS NOT NULL AND TRIM(full_name) <> ''
-                      AND lower(regexp_replace(trim(full_name), '\\s+', ' ', 'g')) = :norm
-                    LIMIT 2
-                """),
-                {"norm": norm},
-            ).fetchall()
-        except Exception:
-            return None
-        if len(rows) != 1:
-            return None
-        return int(rows[0][0])
-
     def _official_id_from_fuzzy_directory_name(
         self, official_name: str, choices: dict[int, str]
     ) -> int | None:
         if not suggest_matches or not choices:
             return None
-        matches = suggest_matches(official_name, choices, top=3, min_score=88)
+        matches = suggest_matches(
+            official_name, choices, top=3, min_score=FUZZY_OFFICIAL_MIN_SCORE
+        )
         if not matches:
             return None
         best_id, best_score, _ = matches[0]
-        if best_score < 92:
+        if best_score < FUZZY_OFFICIAL_ACCEPT_SCORE:
             return None
-        if len(matches) > 1 and (best_score - matches[1][1]) < 3:
+        if len(matches) > 1 and (best_score - matches[1][1]) < FUZZY_OFFICIAL_MIN_MARGIN:
             return None
         return int(best_id)
 
-    def _official_id_from_judge_id(self, judge_id: int) -> int | None:
+    def _id_rows_for_keys(self, sql: str, keys: list) -> list:
+        """Rows of ``sql`` (filtered with ``IN :keys``); empty when the table is missing."""
         try:
-            row = self.session.execute(
-                text(
-                    "SELECT official_id FROM judge_official_link "
-                    "WHERE judge_id = :jid AND status = 'linked' LIMIT 1"
-                ),
-                {"jid": judge_id},
-            ).first()
+            return self.session.execute(
+                text(sql).bindparams(bindparam("keys", expanding=True)),
+                {"keys": keys},
+            ).all()
         except Exception:
-            return None
-        if not row or row[0] is None:
-            return None
-        return int(row[0])
+            return []
 
-    def _official_id_from_name_alias(self, official_name: str) -> int | None:
-        norm = _normalize_person_name(official_name)
-        if not norm:
-            return None
-        try:
-            row = self.session.execute(
-                text(
-                    "SELECT official_id FROM public.official_name_alias "
-                    "WHERE alias_normalized = :n LIMIT 1"
-                ),
-                {"n": norm},
-            ).first()
-        except Exception:
-            return None
-        if not row or row[0] is None:
-            return None
-        return int(row[0])
+    @staticmethod
+    def _first_id_per_key(rows) -> dict:
+        out: dict = {}
+        for key, id_ in rows:
+            if id_ is not None:
+                out.setdefault(key, int(id_))
+        return out
+
+    @staticmethod
+    def _unique_id_per_key(rows) -> dict:
+        """Key → id for keys matched by exactly one roster row (exact-name lookups)."""
+        ids: dict = {}
+        for key, id_ in rows:
+            ids.setdefault(key, set()).add(int(id_))
+        return {key: next(iter(found)) for key, found in ids.items() if len(found) == 1}
+
+    def _official_ids_by_judge_id(self, judge_ids: list[int]) -> dict[int, int]:
+        return self._first_id_per_key(
+            self._id_rows_for_keys(
+                "SELECT judge_id, official_id FROM judge_official_link "
+                "WHERE judge_id IN :keys AND status = 'linked' ORDER BY judge_id",
+                judge_ids,
+            )
+        )
+
+    def _official_ids_by_name_alias(self, norms: list[str]) -> dict[str, int]:
+        return self._first_id_per_key(
+            self._id_rows_for_keys(
+                "SELECT alias_normalized, official_id FROM public.official_name_alias "
+                "WHERE alias_normalized IN :keys",
+                norms,
+            )
+        )
+
+    def _official_ids_by_exact_directory_name(self, norms: list[str]) -> dict[str, int]:
+        return self._unique_id_per_key(
+            self._id_rows_for_keys(
+                """
+                SELECT norm, id FROM (
+                    SELECT id, lower(regexp_replace(trim(full_name), '\\s+', ' ', 'g')) AS norm
+                    FROM officials_analysis.officials
+                    WHERE full_name IS NOT NULL AND TRIM(full_name) <> ''
+                ) o
+                WHERE norm IN :keys
+                """,
+                norms,
+            )
+        )
 
     def _isu_official_schema_ready(self) -> bool:
         """True when migration 013 objects exist (``officials_analysis.isu_official``)."""
@@ -704,6 +1069,20 @@ class DatabaseLoader:
         self._isu_official_schema_cache = ready
         return ready
 
+    def refresh_segment_rule411_eligibility(self, segment_id: int | None) -> None:
+        """
+        Store ISU Rule 411 entry / member stats for a segment whose results were just
+        written (``public.segment_rule411_eligibility``, migration 012).
+        """
+        if segment_id is None:
+            return
+        if self._segment_rule411_table_cache is None:
+            self._segment_rule411_table_cache = segment_rule411_table_exists(self.session)
+        if not self._segment_rule411_table_cache:
+            return
+        refresh_segment_rule411_eligibility(self.session, [segment_id])
+        self._persist()
+
     def _load_isu_official_choices(self) -> dict[int, str]:
         try:
             rows = self.session.execute(
@@ -717,58 +1096,42 @@ class DatabaseLoader:
             return {}
         return {int(r["id"]): str(r["full_name"]) for r in rows}
 
-    def _isu_official_id_from_judge_id(self, judge_id: int) -> int | None:
-        try:
-            row = self.session.execute(
-                text(
-                    "SELECT isu_official_id FROM judge_isu_official_link "
-                    "WHERE judge_id = :jid LIMIT 1"
-                ),
-                {"jid": judge_id},
-            ).first()
-        except Exception:
-            return None
-        if not row or row[0] is None:
-            return None
-        return int(row[0])
+    def _isu_official_ids_by_judge_id(self, judge_ids: list[int]) -> dict[int, int]:
+        return self._first_id_per_key(
+            self._id_rows_for_keys(
+                "SELECT judge_id, isu_official_id FROM judge_isu_official_link "
+                "WHERE judge_id IN :keys ORDER BY judge_id",
+                judge_ids,
+            )
+        )
 
-    def _isu_official_id_from_name_alias(self, official_name: str) -> int | None:
-        norm = _normalize_person_name(official_name)
-        if not norm:
-            return None
-        try:
-            row = self.session.execute(
-                text(
-                    "SELECT isu_official_id FROM public.isu_official_name_alias "
-                    "WHERE alias_normalized = :n LIMIT 1"
-                ),
-                {"n": norm},
-            ).first()
-        except Exception:
-            return None
-        if not row or row[0] is None:
-            return None
-        return int(row[0])
+    def _isu_official_ids_by_name_alias(self, norms: list[str]) -> dict[str, int]:
+        return self._first_id_per_key(
+            self._id_rows_for_keys(
+                "SELECT alias_normalized, isu_official_id FROM public.isu_official_name_alias "
+                "WHERE alias_normalized IN :keys",
+                norms,
+            )
+        )
 
-    def _isu_official_id_from_exact_name(self, official_name: str) -> int | None:
-        norm = _normalize_person_name(official_name)
-        if not norm:
-            return None
-        try:
-            rows = self.session.execute(
-                text("""
-                    SELECT id FROM officials_analysis.isu_official
-                    WHERE name_normalized = :norm
-                       OR lower(regexp_replace(trim(full_name), '\\s+', ' ', 'g')) = :norm
-                    LIMIT 2
-                """),
-                {"norm": norm},
-            ).fetchall()
-        except Exception:
-            return None
-        if len(rows) != 1:
-            return None
-        return int(rows[0][0])
+    def _isu_official_ids_by_exact_name(self, norms: list[str]) -> dict[str, int]:
+        rows = self._id_rows_for_keys(
+            """
+            SELECT id, name_normalized, full_norm FROM (
+                SELECT id, name_normalized,
+                       lower(regexp_replace(trim(full_name), '\\s+', ' ', 'g')) AS full_norm
+                FROM officials_analysis.isu_official
+            ) o
+            WHERE name_normalized IN :keys OR full_norm IN :keys
+            """,
+            norms,
+        )
+        wanted = set(norms)
+        return self._unique_id_per_key(
+            (key, row[0])
+            for row in rows
+            for key in {row[1], row[2]} & wanted
+        )
 
     def _isu_official_id_from_fuzzy_name(
         self, official_name: str, choices: dict[int, str]
@@ -813,6 +1176,13 @@ class DatabaseLoader:
             raise ValueError(
                 f"updateCompetition: no competition with results_url={url!r}"
             )
+        # Activity facts copy these columns from the competition.
+        fact_columns = (
+            existing.qualifying,
+            existing.nqs,
+            existing.international,
+            existing.officials_analysis_competition_type_id,
+        )
         if name is not None:
             existing.name = name
         existing.location = coerce_competition_location(location)
@@ -830,6 +1200,14 @@ class DatabaseLoader:
             )
         if international is not None:
             existing.international = international
+        if fact_columns != (
+            existing.qualifying,
+            existing.nqs,
+            existing.international,
+            existing.officials_analysis_competition_type_id,
+        ):
+            self.session.flush()
+            refresh_protocol_activity_facts(self.session, [existing.id])
         self._persist()
 
     def refresh_competition_discipline_flags(self, competition_id: int) -> None:
@@ -837,38 +1215,44 @@ class DatabaseLoader:
         Set ``competition.singles`` / ``pairs`` / ``dance`` / ``synchronized`` from distinct
         segment discipline types for this competition (no ``commit``).
         """
-        rows = (
-            self.session.query(DisciplineType.name)
-            .join(Segment, Segment.discipline_type_id == DisciplineType.id)
-            .filter(
-                Segment.competition_id == competition_id,
-                Segment.discipline_type_id.isnot(None),
-            )
-            .distinct()
-            .all()
-        )
-        singles = pairs = dance = synchronized = False
-        for (name,) in rows:
-            s, p, d, sy = _competition_flags_from_discipline_type_name(name)
-            singles |= s
-            pairs |= p
-            dance |= d
-            synchronized |= sy
-        comp = self.session.query(Competition).filter_by(id=competition_id).first()
-        if comp:
-            comp.singles = singles
-            comp.pairs = pairs
-            comp.dance = dance
-            comp.synchronized = synchronized
-
-    def refresh_all_competition_discipline_flags(self) -> int:
-        """Recompute discipline flags for every competition; ``commit`` once. Returns row count."""
-        ids = [int(r[0]) for r in self.session.query(Competition.id).all()]
-        for cid in ids:
-            self.refresh_competition_discipline_flags(cid)
+        self._refresh_competition_discipline_flags([competition_id])
+
+    def refresh_all_competition_discipline_flags(self, competition_ids=None) -> int:
+        """
+        Repair discipline flags for every competition (or ``competition_ids``) in one
+        set-based ``UPDATE``; ``commit`` once. Returns the number of rows changed.
+
+        ``insert_segment`` keeps the flags current, so this is only needed after bulk
+        SQL edits to ``segment`` / ``discipline_type``.
+        """
+        changed = self._refresh_competition_discipline_flags(competition_ids)
         self.session.commit()
-        return len(ids)
-    
+        return changed
+
+    def _refresh_competition_discipline_flags(self, competition_ids) -> int:
+        if competition_ids is not None:
+            competition_ids = {int(c) for c in competition_ids}
+        self._flush()
+        result = self.session.execute(
+            competition_discipline_flags_update(competition_ids),
+            execution_options={"synchronize_session": False},
+        )
+        # Loaded ``Competition`` rows may hold the old flags.
+        for obj in list(self.session.identity_map.values()):
+            if isinstance(obj, Competition) and (
+                competition_ids is None or obj.id in competition_ids
+            ):
+                self.session.expire(obj, list(_COMPETITION_DISCIPLINE_FLAG_NAMES))
+        return int(result.rowcount or 0)
+
+    def _add_segment_discipline_flags(self, comp: Competition, discipline_type_id) -> None:
+        """Turn on the competition flag for a newly added segment's discipline (no query)."""
+        dtype = self.session.get(DisciplineType, discipline_type_id)
+        turned_on = _competition_flags_from_discipline_type_name(dtype.name if dtype else None)
+        for column, on in zip(_COMPETITION_DISCIPLINE_FLAG_NAMES, turned_on):
+            if on and not getattr(comp, column):
+                setattr(comp, column, True)
+
     def getSegmentNamesForCompetition(self, url):
         competition = self._competition_by_results_url(url)
         if not competition:
@@ -947,13 +1331,21 @@ class DatabaseLoader:
         elif "compulsory" in segment_name.lower():
             type="Athlete Development"
 
-        existing = self.session.query(DisciplineType).filter_by(name=type).first()
-        if not existing:
-            new = DisciplineType(name=type)
-            self.session.add(new)
-            self._flush()
-            return new.id
-        return existing.id
+        return self._ensure_dimension_ids_by_name(DisciplineType, [type])[type]
+
+    def _cached_segment_id(self, segment_name: str, competition_id: int) -> int | None:
+        """Segment id by name; the competition's segments are loaded in one query."""
+        cid = int(competition_id)
+        cache = self._dimension_caches["segment"]
+        if cid not in self._segment_competitions_cached:
+            for row in self.session.execute(
+                select(Segment.id, Segment.name)
+                .where(Segment.competition_id == cid)
+                .order_by(Segment.id)
+            ):
+                cache.add((cid, str(row.name)), row.id)
+            self._segment_competitions_cached.add(cid)
+        return cache.get((cid, segment_name))
 
     def insert_segment(self, segment_name, competition_id):
         from segment_level import classify_segment_level_for_row
@@ -967,7 +1359,8 @@ class DatabaseLoader:
             comp.international if comp is not None else False,
             discipline_type_id=discipline_type_id,
         )
-        existing = self.session.query(Segment).filter_by(name=segment_name, competition_id=competition_id).first()
+        existing_id = self._cached_segment_id(segment_name, competition_id)
+        existing = self.session.get(Segment, existing_id) if existing_id is not None else None
         if not existing:
             new = Segment(
                 name=segment_name,
@@ -979,66 +1372,36 @@ class DatabaseLoader:
             )
             self.session.add(new)
             self._flush()
-            self.refresh_competition_discipline_flags(competition_id)
+            self._dimension_caches["segment"].add(
+                (int(competition_id), segment_name), new.id, new=True
+            )
+            if comp is not None:
+                self._add_segment_discipline_flags(comp, discipline_type_id)
             self._persist()
             return new.id
+        discipline_changed = existing.discipline_type_id != discipline_type_id
         existing.discipline_type_id = discipline_type_id
         existing.freeskate = is_freeskate
         existing.level = level_result.level
         existing.level_source = level_result.source
         self._flush()
-        self.refresh_competition_discipline_flags(competition_id)
+        if discipline_changed:
+            # The old discipline may have been the competition's only one of its kind.
+            self.refresh_competition_discipline_flags(competition_id)
         self._persist()
         return existing.id
 
     def get_segment_id(self, segment_name: str, competition_id: int) -> int | None:
-        row = (
-            self.session.query(Segment)
-            .filter_by(name=segment_name, competition_id=competition_id)
-            .first()
-        )
-        return int(row.id) if row else None
-
-
-    def _judge_id_for_match_key(self, match_key: str) -> int | None:
-        if not match_key:
-            return None
-        row = self.session.execute(
-            text(
-                """
-                SELECT id FROM judge
-                WHERE lower(regexp_replace(trim(name), '\\s+', ' ', 'g')) = :k
-                ORDER BY id
-                LIMIT 1
-                """
-            ),
-            {"k": match_key},
-        ).first()
-        if not row:
-            return None
-        return int(row[0])
+        return self._cached_segment_id(segment_name, competition_id)
 
     def insert_judge(self, judge_name):
         judge_name = normalize_scraped_judge_name(judge_name)
         if not judge_name:
             raise ValueError("insert_judge: empty name after normalization")
-        match_key = _normalize_person_name(judge_name)
-        existing_id = self._judge_id_for_match_key(match_key)
-        if existing_id is not None:
-            return existing_id
-        new_judge = Judge(name=judge_name)
-        self.session.add(new_judge)
-        self._flush()
-        return int(new_judge.id)
+        return self._ensure_judges_by_name([judge_name])[judge_name]
 
     def insert_skater(self, skater_name):
-        existing = self.session.query(Skater).filter_by(name=skater_name).first()
-        if not existing:
-            new = Skater(name=skater_name)
-            self.session.add(new)
-            self._flush()
-            return new.id
-        return existing.id
+        return self._ensure_skaters_by_name([skater_name])[skater_name]
 
 
     def insert_skater_segment(self, segment_id, skater_id):
@@ -1051,22 +1414,10 @@ class DatabaseLoader:
         return existing.id
 
     def insert_element_type(self, element_name):
-        existing = self.session.query(ElementType).filter_by(name=element_name).first()
-        if not existing:
-            new = ElementType(name=element_name)
-            self.session.add(new)
-            self._flush()
-            return new.id
-        return existing.id
-        
+        return self._ensure_element_types_by_name([element_name])[element_name]
+
     def insert_pcs_type(self, pcs_name):
-        existing = self.session.query(PcsType).filter_by(name=pcs_name).first()
-        if not existing:
-            new = PcsType(name=pcs_name)
-            self.session.add(new)
-            self._flush()
-            return new.id
-        return existing.id
+        return self._ensure_pcs_types_by_name([pcs_name])[pcs_name]
 
     def insert_element(self,element_name, element_type, skater_segment_id):
         element_type_id= self.insert_element_type(element_type)
@@ -1296,21 +1647,7 @@ class DatabaseLoader:
             return True
         return segment_supports_pcs_fall_rule_errors(str(segment_name or ""))
 
-    def _build_segment_element_score_maps_from_rows(
-        self, rows
-    ) -> tuple[dict[str, int], dict[int, int], dict[tuple[int, str], int]]:
-        skater_dict: dict[str, int] = {}
-        ss_map: dict[int, int] = {}
-        elem_id_by_pair: dict[tuple[int, str], int] = {}
-        for skater_name, skater_id, ss_id, el_name, el_id in rows:
-            skater_dict[str(skater_name)] = int(skater_id)
-            ss_map[int(skater_id)] = int(ss_id)
-            elem_id_by_pair[(int(ss_id), str(el_name))] = int(el_id)
-        return skater_dict, ss_map, elem_id_by_pair
-
-    def _segment_element_score_maps(
-        self, segment_id: int
-    ) -> tuple[dict[str, int], dict[int, int], dict[tuple[int, str], int]]:
+    def _segment_element_score_maps(self, segment_id: int) -> SegmentScoreMaps:
         """Skater name → id, skater id → skater_segment id, (ss_id, element name) → element id."""
         rows = self.session.execute(
             select(
@@ -1324,12 +1661,12 @@ class DatabaseLoader:
             .join(Element, Element.skater_segment_id == SkaterSegment.id)
             .where(SkaterSegment.segment_id == segment_id)
         ).all()
-        return self._build_segment_element_score_maps_from_rows(rows)
+        return _segment_score_maps_from_rows(rows)
 
     def segment_element_score_maps_for_competition(
         self, competition_id: int
-    ) -> dict[int, tuple[dict[str, int], dict[int, int], dict[tuple[int, str], int]]]:
-        """Preload score maps for every segment in a competition (one query)."""
+    ) -> CompetitionScoreMaps:
+        """Score maps for every segment in a competition (one query, built lazily)."""
         rows = self.session.execute(
             select(
                 SkaterSegment.segment_id,
@@ -1343,16 +1680,9 @@ class DatabaseLoader:
             .join(Element, Element.skater_segment_id == SkaterSegment.id)
             .join(Segment, Segment.id == SkaterSegment.segment_id)
             .where(Segment.competition_id == competition_id)
+            .order_by(SkaterSegment.segment_id)
         ).all()
-        by_segment: dict[int, list] = {}
-        for segment_id, skater_name, skater_id, ss_id, el_name, el_id in rows:
-            by_segment.setdefault(int(segment_id), []).append(
-                (skater_name, skater_id, ss_id, el_name, el_id)
-            )
-        return {
-            sid: self._build_segment_element_score_maps_from_rows(seg_rows)
-            for sid, seg_rows in by_segment.items()
-        }
+        return CompetitionScoreMaps(rows)
 
     def _reset_element_rule_errors_for_segment(self, segment_id: int) -> None:
         element_ids = self.session.execute(
@@ -1386,9 +1716,7 @@ class DatabaseLoader:
         segment_id: int,
         element_metadata: dict[tuple[str, str], dict],
         *,
-        score_maps: (
-            tuple[dict[str, int], dict[int, int], dict[tuple[int, str], int]] | None
-        ) = None,
+        score_maps: SegmentScoreMaps | None = None,
     ) -> int:
         """
         Set ``element.notes`` and ``element.max_goe_allowed`` from parsed protocol data.
@@ -1399,14 +1727,11 @@ class DatabaseLoader:
         if not element_metadata:
             return 0
         if score_maps is None:
-            skater_dict, ss_map, elem_id_by_pair = self._segment_element_score_maps(
-                segment_id
-            )
-        else:
-            skater_dict, ss_map, elem_id_by_pair = score_maps
+            score_maps = self._segment_element_score_maps(segment_id)
+        skater_dict, ss_map, elem_id_by_pair, skater_keys = score_maps
         resolved: list[tuple[int, dict]] = []
         for (skater_name, element_name), meta in element_metadata.items():
-            db_skater = _resolve_skater_dict_key(skater_dict, str(skater_name))
+            db_skater = _resolve_skater_dict_key(skater_dict, str(skater_name), skater_keys)
             if db_skater is None:
                 continue
             skater_id = skater_dict[db_skater]
@@ -1476,7 +1801,10 @@ class DatabaseLoader:
         ss_map: dict[int, int],
         elem_id_by_pair: dict[tuple[int, str], int],
         judge_dict: dict[str, int],
+        skater_keys: dict[tuple[str, ...], str] | None = None,
     ) -> tuple[list[tuple[int, int]], list[dict]]:
+        if skater_keys is None:
+            skater_keys = _skater_match_key_index(skater_dict)
         pairs: list[tuple[int, int]] = []
         unresolved: list[dict] = []
         for rule_error in rule_errors:
@@ -1488,7 +1816,7 @@ class DatabaseLoader:
                 "element": element_label,
                 "judge": judge_label,
             }
-            db_skater = _resolve_skater_dict_key(skater_dict, skater_label)
+            db_skater = _resolve_skater_dict_key(skater_dict, skater_label, skater_keys)
             if db_skater is None:
                 unresolved.append({**base, "reason": "skater not in segment"})
                 continue
@@ -1521,24 +1849,19 @@ class DatabaseLoader:
         rule_errors: list,
         *,
         panel_judge_names: list[str] | None = None,
-        score_maps: (
-            tuple[dict[str, int], dict[int, int], dict[tuple[int, str], int]] | None
-        ) = None,
+        score_maps: SegmentScoreMaps | None = None,
     ) -> dict:
         """Resolve parsed rule errors without writing; for dry-run reporting."""
         if not rule_errors:
             return {"flagged": 0, "unresolved": []}
         if score_maps is None:
-            skater_dict, ss_map, elem_id_by_pair = self._segment_element_score_maps(
-                segment_id
-            )
-        else:
-            skater_dict, ss_map, elem_id_by_pair = score_maps
+            score_maps = self._segment_element_score_maps(segment_id)
+        skater_dict, ss_map, elem_id_by_pair, skater_keys = score_maps
         judge_dict = self._judge_dict_for_rule_errors(
             rule_errors, panel_judge_names or []
         )
         uniq, unresolved = self._resolve_rule_error_pairs(
-            rule_errors, skater_dict, ss_map, elem_id_by_pair, judge_dict
+            rule_errors, skater_dict, ss_map, elem_id_by_pair, judge_dict, skater_keys
         )
         return {"flagged": len(uniq), "unresolved": unresolved}
 
@@ -1566,9 +1889,7 @@ class DatabaseLoader:
         rule_errors: list,
         *,
         panel_judge_names: list[str] | None = None,
-        score_maps: (
-            tuple[dict[str, int], dict[int, int], dict[tuple[int, str], int]] | None
-        ) = None,
+        score_maps: SegmentScoreMaps | None = None,
         apply_rule_errors: bool | None = None,
     ) -> dict:
         """
@@ -1591,21 +1912,16 @@ class DatabaseLoader:
             self._maybe_flush()
             return {"flagged": 0, "unresolved": []}
         if score_maps is None:
-            skater_dict, ss_map, elem_id_by_pair = self._segment_element_score_maps(
-                segment_id
-            )
-        else:
-            skater_dict, ss_map, elem_id_by_pair = score_maps
+            score_maps = self._segment_element_score_maps(segment_id)
+        skater_dict, ss_map, elem_id_by_pair, skater_keys = score_maps
         judge_dict = self._judge_dict_for_rule_errors(
             rule_errors, panel_judge_names or []
         )
-        flagged = self._apply_rule_errors_bulk(
-            rule_errors, skater_dict, ss_map, elem_id_by_pair, judge_dict
+        uniq, unresolved = self._resolve_rule_error_pairs(
+            rule_errors, skater_dict, ss_map, elem_id_by_pair, judge_dict, skater_keys
         )
+        flagged = self._flag_element_rule_error_pairs(uniq)
         self._maybe_flush()
-        _, unresolved = self._resolve_rule_error_pairs(
-            rule_errors, skater_dict, ss_map, elem_id_by_pair, judge_dict
-        )
         return {"flagged": flagged, "unresolved": unresolved}
 
     def _apply_rule_errors_bulk(
@@ -1621,6 +1937,10 @@ class DatabaseLoader:
         uniq, _unresolved = self._resolve_rule_error_pairs(
             rule_errors, skater_dict, ss_map, elem_id_by_pair, judge_dict
         )
+        return self._flag_element_rule_error_pairs(uniq)
+
+    def _flag_element_rule_error_pairs(self, uniq: list[tuple[int, int]]) -> int:
+        """Set ``is_rule_error`` on ``(element_id, judge_id)`` score rows."""
         step = 500
         for i in range(0, len(uniq), step):
             chunk = uniq[i : i + step]
@@ -2000,7 +2320,7 @@ class DatabaseLoader:
         """Legacy per-row path; prefer rule errors applied in insert_element_scores."""
         if not rule_errors or not self._should_apply_rule_errors_for_segment(segment_id):
             return
-        _, _ss_map, elem_id_by_pair = self._segment_element_score_maps(segment_id)
+        elem_id_by_pair = self._segment_element_score_maps(segment_id).elem_id_by_pair
         for rule_error in rule_errors:
             skater_id = (
                 self.session.query(Skater)
@@ -2151,11 +2471,13 @@ def fetch_duplicate_judge_groups(session: Session) -> list[dict]:
     Each group dict has ``match_key``, ``canonical_id``, and ``members`` (list of
     ``{id, name, element_scores, pcs_scores, total_scores}``).
     """
-    match_key_expr = _judge_match_key_sql_expr()
     rows = session.execute(
-        text(f"""
-            SELECT id, name, {match_key_expr} AS match_key
+        text("""
+            SELECT id, name, match_key
             FROM judge
+            WHERE match_key IN (
+                SELECT match_key FROM judge GROUP BY match_key HAVING COUNT(*) > 1
+            )
             ORDER BY match_key, id
         """)
     ).all()
@@ -5,7 +5,6 @@ import judgingParsing
 from judgingParsing import autofit_worksheet
 from sharedJudgingAnalysis import format_out_of_range_sheets
 import requests
-from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from openpyxl.utils import get_column_letter
 import pandas as pd
@@ -41,6 +40,8 @@ from google.cloud import storage
 from gcp_interactions_helper import write_file_to_gcp
 from gcp_interactions_helper import save_gcp_workbook
 from ijs_index_parse import ijs_index_start_end_and_location
+from pdf_render_service import get_pdf_render_service, write_pdf_bytes
+from scrape_http import scrape_http_session
 
 _LOG = logging.getLogger("ijs.scrape")
 
@@ -88,11 +89,7 @@ async def generate_pdf(url, pdf_path, use_gcp=False, browser=None):
             {"waitUntil": "domcontentloaded", "timeout": 90_000},
         )
         pdf_data = await page.pdf({"format": "A4"})
-        if use_gcp:
-            write_file_to_gcp(pdf_data, pdf_path)
-        else:
-            with open(pdf_path, "wb") as f:
-                f.write(pdf_data)
+        write_pdf_bytes(pdf_data, pdf_path, use_gcp=use_gcp)
     finally:
         await page.close()
         if close_browser:
@@ -114,8 +111,7 @@ def processEvent(
     use_html=True,
     judge_filter="",
     isFSM=False,
-    pdf_browser=None,
-    pdf_loop=None,
+    pdf_renderer=None,
     http_session=None,
     write_excel=True,
     competition_start_date=None,
@@ -165,10 +161,8 @@ def processEvent(
             competition_end_date=competition_end_date,
             competition_year=competition_year,
         )
-    if pdf_browser is not None and pdf_loop is not None:
-        pdf_loop.run_until_complete(
-            generate_pdf(url, pdf_path, use_gcp=use_gcp, browser=pdf_browser)
-        )
+    if pdf_renderer is not None:
+        pdf_renderer.render_to_path(url, pdf_path, use_gcp=use_gcp)
     else:
         asyncio.run(generate_pdf(url, pdf_path, use_gcp=use_gcp))
     return judgingParsing.extract_judge_scores(
@@ -208,18 +202,8 @@ def get_page_contents(url, session=None):
 
 
 def _scrape_http_session() -> requests.Session:
-    """Session tuned for many sequential IJS fetches: keep-alive, no urllib3 retries."""
-    s = requests.Session()
-    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
-    s.mount("https://", adapter)
-    s.mount("http://", adapter)
-    s.headers.update(
-        {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/107.0.0.0 Safari/537.36"
-        }
-    )
-    return s
+    """Shared pooled scrape session (per-host adaptive limits, retries, conditional GETs)."""
+    return scrape_http_session()
 
 
 #### FSM parsing ####
@@ -833,6 +817,7 @@ def scrape(
     competition_metadata: Mapping[str, Any] | None = None,
     commit_per_segment: bool = True,
     rebuild_analytics_caches: bool = True,
+    pdf_render_service=None,
     quiet: bool = False,
     verbose: bool = False,
     log_file: str | None = None,
@@ -860,15 +845,19 @@ def scrape(
 
     When ``write_excel`` is false, per-event deviation sheets and the final workbook are not
     written (faster when loading the database only). HTTP uses a shared ``requests.Session``;
-    non-HTML PDF mode reuses one headless browser for the whole competition.
+    non-HTML PDF mode renders through ``pdf_render_service`` (default: the process-wide
+    ``pdf_render_service.get_pdf_render_service()``), so Chromium is launched once and its
+    warm tabs are reused across competitions.
 
     Batch loaders may pass ``http_session``, ``db_session``, and ``database_loader`` to reuse
     connections across many competitions. ``competition_metadata`` (``start_date``, ``end_date``,
     ``location``) avoids an extra index fetch when already known (e.g. from discover CSV).
-    When ``rebuild_analytics_caches`` is false, skip judge-excess / element-ranking invalidation
-    and cross-judge shard rebuild at the end (saves time and DB connections; run
-    ``scripts/precompute_cross_judge_cache.py``, ``scripts/precompute_element_ranking_cache.py``,
-    and ``scripts/precompute_pcs_quality_cache.py`` separately).
+    When ``rebuild_analytics_caches`` is true, the competition's cached rows are invalidated
+    and a ``cache_rebuild_job`` is queued in the same commit; ``scripts/run_cache_rebuild_worker.py``
+    rebuilds cross-judge shards, excess rows, mark shards, σ̂ and summaries in the background.
+    When false, caches are left untouched (run ``scripts/precompute_cross_judge_cache.py``,
+    ``scripts/precompute_element_ranking_cache.py``, and ``scripts/precompute_pcs_quality_cache.py``
+    separately).
 
     When ``commit_per_segment`` is false, the DB commits once at the end of this scrape
   (``DatabaseLoader(defer_commits=True)``); apps leave the default true.
@@ -903,8 +892,7 @@ def scrape(
         )
 
     try:
-        pdf_loop = None
-        pdf_browser = None
+        pdf_renderer = None
 
         from ijs_results_urls import (
             competition_index_fetch_url,
@@ -920,20 +908,10 @@ def scrape(
         url = competition_index_fetch_url(stored_url)
         page_contents = get_page_contents(url, session=http_session)
         _LOG.debug("GET %s", url)
-        # Launch Chromium only after index succeeds and only for classic PDF mode (not FSM).
-        # Starting the browser before the first HTTP made runs feel slower than the old flow.
+        # Classic PDF mode (not FSM) renders through the shared warm-browser pool; Chromium
+        # starts on the first render and stays up across scrapes in this process.
         if page_contents and (not use_html) and (not isFSM):
-            pdf_loop = asyncio.new_event_loop()
-            pdf_browser = pdf_loop.run_until_complete(
-                launch(
-                    {
-                        "autoClose": False,
-                        "handleSIGINT": False,
-                        "handleSIGTERM": False,
-                        "handleSIGHUP": False,
-                    }
-                )
-            )
+            pdf_renderer = pdf_render_service or get_pdf_render_service()
         workbook = openpyxl.Workbook()
         agg_all_element_df = None
         agg_all_pcs_df = None
@@ -1011,8 +989,7 @@ def scrape(
                             judge_filter=judge_filter,
                             use_html=use_html,
                             isFSM=True,
-                            pdf_browser=pdf_browser,
-                            pdf_loop=pdf_loop,
+                            pdf_renderer=pdf_renderer,
                             http_session=http_session,
                             write_excel=write_excel,
                             competition_start_date=competition_start_date,
@@ -1144,8 +1121,7 @@ def scrape(
                         or write_to_database,
                         judge_filter=judge_filter,
                         use_html=use_html,
-                        pdf_browser=pdf_browser,
-                        pdf_loop=pdf_loop,
+                        pdf_renderer=pdf_renderer,
                         http_session=http_session,
                         write_excel=write_excel,
                         competition_start_date=competition_start_date,
@@ -1235,7 +1211,10 @@ def scrape(
             from pcs_deviation_cache import (
                 invalidate_pcs_deviation_cache_for_competition,
             )
+            from cache_rebuild_queue import enqueue_competition_rebuild
 
+            # Deletes stay inline (these caches refill on read); cross-judge shards and the
+            # warm rebuild run in the cache rebuild worker, queued in this same transaction.
             invalidate_judge_excess_cache_for_competition(
                 database_obj.session, competition_id
             )
@@ -1248,10 +1227,8 @@ def scrape(
             invalidate_pcs_deviation_cache_for_competition(
                 database_obj.session, competition_id
             )
-            from cross_judge_cache import build_cross_judge_shards_for_competition
-
-            build_cross_judge_shards_for_competition(
-                database_obj.session, competition_id
+            enqueue_competition_rebuild(
+                database_obj.session, competition_id, reason=f"load {report_name}"
             )
             database_obj.commit()
         warnings = pop_warnings()
@@ -1268,14 +1245,6 @@ def scrape(
         pop_warnings()
         raise
     finally:
-        if pdf_loop is not None:
-            try:
-                if pdf_browser is not None:
-                    pdf_loop.run_until_complete(pdf_browser.close())
-            except Exception:
-                pass
-            finally:
-                pdf_loop.close()
         if own_db_session and db_session is not None:
             db_session.close()
 
@@ -1366,6 +1335,7 @@ def handleEventResults(report_name, write_to_database, judge_filter, agg_all_ele
                         judgesNames, all_element_dict, segment_id, rule_errors)
             database_obj.insert_pcs_scores(
                         judgesNames, all_pcs_dict, segment_id)
+            database_obj.refresh_segment_rule411_eligibility(segment_id)
             proccessed_segments.append(db_segment_name)
         else:
             if segment_stats is not None:
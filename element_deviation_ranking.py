@@ -245,10 +245,68 @@ def compute_element_ranking_data_fingerprint(
         stmt, effective_start, event_end_date
     )
     mark_count, max_mark_id, comp_count = session.execute(stmt).one()
+    return _mark_count_fingerprint(mark_count, max_mark_id, comp_count)
+
+
+def _mark_count_fingerprint(mark_count, max_mark_id, comp_count) -> str:
     payload = f"{int(mark_count or 0)}:{int(max_mark_id or 0)}:{int(comp_count or 0)}"
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
+def compute_element_ranking_shard_fingerprints(
+    session: Session,
+    analytics: JudgeAnalytics,
+    *,
+    season_years: Iterable[str],
+    discipline_type_ids: Iterable[int],
+    event_start_date: date | None = None,
+    event_end_date: date | None = None,
+    segment_levels: Optional[Iterable[str]] = None,
+    competition_scope: str = COMPETITION_SCOPE_ALL,
+) -> dict[tuple[str, int], str]:
+    """
+    ``compute_element_ranking_data_fingerprint`` for every (season, discipline) pair in
+    one grouped query; pairs without marks get the same checksum as a per-shard call.
+    """
+    years = sorted({str(y) for y in season_years})
+    disc_ids = sorted({int(d) for d in discipline_type_ids})
+    if not years or not disc_ids:
+        return {}
+    where_clause = build_element_mark_filters(None, None, disc_ids, segment_levels)
+    stmt = (
+        select(
+            Competition.year,
+            Segment.discipline_type_id,
+            func.count(ElementScorePerJudge.id),
+            func.coalesce(func.max(ElementScorePerJudge.id), 0),
+            func.count(func.distinct(Segment.competition_id)),
+        )
+        .select_from(ElementScorePerJudge)
+        .join(Element, ElementScorePerJudge.element_id == Element.id)
+        .join(SkaterSegment, Element.skater_segment_id == SkaterSegment.id)
+        .join(Segment, SkaterSegment.segment_id == Segment.id)
+        .join(Competition, Segment.competition_id == Competition.id)
+        .where(where_clause, Competition.year.in_(years))
+    )
+    stmt = analytics._filter_select_competition_scope(stmt, competition_scope)
+    effective_start = MIN_ELEMENT_MARKING_EVENT_DATE
+    if event_start_date is not None:
+        effective_start = max(event_start_date, MIN_ELEMENT_MARKING_EVENT_DATE)
+    stmt = analytics._apply_competition_event_date_range(
+        stmt, effective_start, event_end_date
+    )
+    stmt = stmt.group_by(Competition.year, Segment.discipline_type_id)
+    counts = {
+        (str(year), int(dt_id)): (n, max_id, n_comp)
+        for year, dt_id, n, max_id, n_comp in session.execute(stmt).all()
+    }
+    return {
+        (year, dt_id): _mark_count_fingerprint(*counts.get((year, dt_id), (0, 0, 0)))
+        for year in years
+        for dt_id in disc_ids
+    }
+
+
 def control_scores_by_element(df: pd.DataFrame) -> pd.DataFrame:
     """One row per element_id with panel median GOE (for low-memory judge drill-down)."""
     return (
@@ -546,6 +604,33 @@ def compute_mergeable_judge_summary(work: pd.DataFrame) -> pd.DataFrame:
     ).reset_index()
 
 
+_MERGEABLE_SUM_COLUMNS = [
+    "n_marks",
+    "sum_m2",
+    "sum_error",
+    "sum_abs_error",
+    "sum_sigma",
+    "sum_abs_m",
+]
+
+
+def fold_mergeable_judge_summaries(
+    total: pd.DataFrame | None, part: pd.DataFrame | None
+) -> pd.DataFrame | None:
+    """Add one shard's mergeable judge sums into a running total (still mergeable)."""
+    frames = [p for p in (total, part) if p is not None and not p.empty]
+    if not frames:
+        return total
+    if len(frames) == 1:
+        return frames[0]
+    return (
+        pd.concat(frames, ignore_index=True)
+        .groupby("judge_name", sort=False)[_MERGEABLE_SUM_COLUMNS]
+        .sum()
+        .reset_index()
+    )
+
+
 def merge_mergeable_judge_summaries(parts: list[pd.DataFrame]) -> pd.DataFrame:
     """Combine shard-level judge stats into one summary table."""
     parts = [p for p in parts if p is not None and not p.empty]
@@ -1278,10 +1363,18 @@ def compute_judge_detail_for_identity(
     event_end_date: date | None = None,
     discipline_type_ids: Optional[list[int]] = None,
     segment_levels: Optional[Iterable[str]] = None,
+    segment_level_preset: str | None = None,
     competition_scope: str = COMPETITION_SCOPE_ALL,
     floor_sigma: float = FLOOR_SIGMA,
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    """Load one identity's marks and build drill-down tables (uses precomputed panel medians)."""
+    """
+    Load one identity's marks and build drill-down tables (uses precomputed panel medians).
+
+    Reads the judge's slice of each cached mark shard when every shard in scope is indexed
+    (``segment_level_preset`` names the shards); otherwise a judge-filtered SQL load.
+    """
+    from element_ranking_cache import load_judge_marks_from_shards
+
     judge_ids = judge_ids_for_identity_label(analytics, judge_name)
     if not judge_ids or control_by_element.empty:
         return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
@@ -1290,18 +1383,30 @@ def compute_judge_detail_for_identity(
     disc_map = {int(i): n for i, n in analytics.get_discipline_types()}
     elem_map = {int(i): n for i, n in analytics.get_element_types()}
 
-    df = load_element_marking_data(
-        session,
+    df = load_judge_marks_from_shards(
         analytics,
+        judge_ids,
         start_season_year=start_season_year,
         end_season_year=end_season_year,
         event_start_date=event_start_date,
         event_end_date=event_end_date,
         discipline_type_ids=discipline_type_ids,
-        segment_levels=segment_levels,
         competition_scope=competition_scope,
-        judge_ids=judge_ids,
+        segment_level_preset=segment_level_preset,
     )
+    if df is None:
+        df = load_element_marking_data(
+            session,
+            analytics,
+            start_season_year=start_season_year,
+            end_season_year=end_season_year,
+            event_start_date=event_start_date,
+            event_end_date=event_end_date,
+            discipline_type_ids=discipline_type_ids,
+            segment_levels=segment_levels,
+            competition_scope=competition_scope,
+            judge_ids=judge_ids,
+        )
     if df.empty:
         return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
 
@@ -2,13 +2,15 @@
 Database-backed cache for element deviation ranking.
 
 **Shard cache** (primary): one row per (season, discipline, competition scope, event dates)
-with pickled element marks. Ranking and σ̂ benchmark pools each concatenate matching shards.
+with judge-sorted element marks (``mark_shard_index``). Ranking and σ̂ benchmark pools each
+concatenate matching shards; judge drill-down reads one judge's slice per shard.
 
 **σ̂ cache**: fitted bin parameters for a benchmark season window (reused when ranking
 scope is narrower).
 
 **Summary shard cache**: mergeable per-judge stats per season×discipline at a fixed σ̂ fit
-(skips re-loading raw marks when σ̂ and summaries are warm).
+(skips re-loading raw marks when σ̂ and summaries are warm). The panel control table is a
+separate part, loaded only for judge drill-down.
 
 **Full-run cache** (legacy): exact filter-set blob; still checked first for old rows.
 """
@@ -46,11 +48,13 @@ from element_deviation_ranking import (
     build_sigma_bins_dataframe,
     compute_control_scores,
     compute_element_ranking_data_fingerprint,
+    compute_element_ranking_shard_fingerprints,
     compute_mergeable_judge_summary,
     control_scores_by_element,
     discipline_ids_for_element_ranking,
     finish_element_deviation_rankings_from_marks,
     fit_sigma_params_from_marks,
+    fold_mergeable_judge_summaries,
     iter_element_ranking_shards,
     load_element_marking_data,
     marking_score_summary,
@@ -72,11 +76,25 @@ from models import (
     ElementDeviationRankingShardSummaryCache,
     ElementDeviationRankingSigmaCache,
 )
+from mark_shard_index import (
+    decode_judge_sorted_marks,
+    encode_judge_sorted_marks,
+    load_judge_slices,
+)
+from ranking_shard_pool import iter_shard_results, resolve_ranking_shard_workers
 
 _log = logging.getLogger(__name__)
 
 _BENCHMARK_SEGMENT_LEVEL_UNSET = object()
 
+# Separately loadable parts of a shard summary row → payload column.
+SUMMARY_PART_JUDGE = "mergeable_summary"
+SUMMARY_PART_CONTROL = "control_by_element"
+_SUMMARY_PART_COLUMNS = {
+    SUMMARY_PART_JUDGE: ElementDeviationRankingShardSummaryCache.summary_payload,
+    SUMMARY_PART_CONTROL: ElementDeviationRankingShardSummaryCache.control_payload,
+}
+
 
 
 def run_params_cache_key(run_params: tuple) -> str:
@@ -141,6 +159,7 @@ def element_ranking_filter_kwargs(run_params: tuple) -> dict[str, Any]:
     rp = unpack_element_ranking_run_params(run_params)
     return {
         **element_ranking_mark_load_kwargs(run_params),
+        "segment_level_preset": rp[12],
         "floor_sigma": float(rp[7]),
     }
 
@@ -186,7 +205,7 @@ def _benchmark_pool_fingerprint(
         return compute_element_ranking_data_fingerprint(
             session, analytics, **fp_scope
         )
-    parts = sorted(_shard_fingerprint(session, analytics, s) for s in shards)
+    parts = sorted(_shard_fingerprints(session, analytics, shards).values())
     digest = hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
     return digest[:64]
 
@@ -269,12 +288,14 @@ def get_or_fit_benchmark_sigma_params(
     cache_only: bool = False,
     persist_shards: bool = True,
     persist_sigma: bool = True,
+    workers: int = 1,
 ) -> tuple[dict, pd.DataFrame | None, bool] | None:
     """
     Load or fit σ̂ on the benchmark mark pool.
 
     Returns ``(params, sigma_reference_df, from_cache)`` or ``None`` when
-    ``cache_only=True`` and σ̂ or required shards are missing.
+    ``cache_only=True`` and σ̂ or required shards are missing. ``workers`` > 1 loads
+    benchmark shards in a process pool.
     """
     rp = unpack_element_ranking_run_params(run_params)
     bench_scope = benchmark_scope_kwargs_from_run_params(run_params)
@@ -294,6 +315,7 @@ def get_or_fit_benchmark_sigma_params(
                 **bench_scope,
                 cache_only=cache_only,
                 persist_shards=persist_shards and not cache_only,
+                workers=workers,
             )
             if sigma_ref is None:
                 return None
@@ -307,6 +329,7 @@ def get_or_fit_benchmark_sigma_params(
         **bench_scope,
         cache_only=False,
         persist_shards=persist_shards,
+        workers=workers,
     )
     if bench_marks.empty:
         return {}, bench_marks, False
@@ -322,55 +345,23 @@ def get_or_fit_benchmark_sigma_params(
     return params, sigma_ref, False
 
 
-def _parse_shard_summary_row(
-    session: Session,
-    analytics: JudgeAnalytics,
-    shard: ElementRankingShard,
-    row: ElementDeviationRankingShardSummaryCache,
-    *,
-    floor_sigma: float,
-    validate_fingerprint: bool,
-) -> dict[str, Any] | None:
-    if float(row.floor_sigma) != float(floor_sigma):
-        session.expunge(row)
-        return None
-    if validate_fingerprint:
-        expected = _shard_fingerprint(session, analytics, shard)
-        if row.data_fingerprint != expected:
-            session.expunge(row)
+def _summary_row_parts(row, parts: tuple[str, ...]) -> dict[str, Any] | None:
+    """Unpickle the requested parts of a selected summary row (``None`` if any is unusable)."""
+    out: dict[str, Any] = {}
+    for part in parts:
+        blob = getattr(row, part)
+        if blob is None:
             return None
-    try:
-        payload = pickle.loads(row.summary_payload)
-    except Exception:
-        session.expunge(row)
-        return None
-    if not isinstance(payload, dict):
-        return None
-    return payload
-
-
-def _load_shard_summary_row(
-    session: Session,
-    analytics: JudgeAnalytics,
-    shard: ElementRankingShard,
-    *,
-    sigma_key: str,
-    floor_sigma: float,
-    validate_fingerprint: bool = True,
-) -> dict[str, Any] | None:
-    sk = shard_cache_key(shard)
-    key = shard_summary_cache_key(sk, sigma_key, floor_sigma)
-    row = session.get(ElementDeviationRankingShardSummaryCache, key)
-    if row is None:
-        return None
-    return _parse_shard_summary_row(
-        session,
-        analytics,
-        shard,
-        row,
-        floor_sigma=floor_sigma,
-        validate_fingerprint=validate_fingerprint,
-    )
+        try:
+            value = pickle.loads(blob)
+        except Exception:
+            return None
+        if part == SUMMARY_PART_JUDGE:
+            value = value.get(part) if isinstance(value, dict) else None
+        if not isinstance(value, pd.DataFrame):
+            return None
+        out[part] = value
+    return out
 
 
 def load_shard_summary_payloads_for_scope(
@@ -380,8 +371,13 @@ def load_shard_summary_payloads_for_scope(
     *,
     validate_fingerprint: bool = False,
     require_all: bool = True,
+    parts: tuple[str, ...] = (SUMMARY_PART_JUDGE, SUMMARY_PART_CONTROL),
 ) -> list[tuple[ElementRankingShard, dict[str, Any]]] | None:
-    """Batch-load shard summary payloads for a ranking scope (one query)."""
+    """
+    Batch-load shard summary ``parts`` for a ranking scope (one query; only the requested
+    payload columns are fetched). ``validate_fingerprint`` checks every shard against one
+    grouped fingerprint query.
+    """
     rank_scope = ranking_scope_kwargs_from_run_params(run_params)
     rp = unpack_element_ranking_run_params(run_params)
     floor_sigma = float(rp[7])
@@ -398,40 +394,37 @@ def load_shard_summary_payloads_for_scope(
         for shard in shards
     ]
     cache_keys = [ck for _, ck in shard_entries]
-    rows = (
-        session.execute(
-            select(ElementDeviationRankingShardSummaryCache).where(
-                ElementDeviationRankingShardSummaryCache.cache_key.in_(cache_keys)
-            )
-        )
-        .scalars()
-        .all()
+    table = ElementDeviationRankingShardSummaryCache
+    rows = session.execute(
+        select(
+            table.cache_key,
+            table.floor_sigma,
+            table.data_fingerprint,
+            *(_SUMMARY_PART_COLUMNS[part].label(part) for part in parts),
+        ).where(table.cache_key.in_(cache_keys))
+    ).all()
+    by_cache_key = {
+        row.cache_key: row for row in rows if float(row.floor_sigma) == floor_sigma
+    }
+    if require_all and len(by_cache_key) != len(shard_entries):
+        return None
+    expected = (
+        _shard_fingerprints(session, analytics, shards) if validate_fingerprint else {}
     )
-    by_cache_key = {row.cache_key: row for row in rows}
 
     out: list[tuple[ElementRankingShard, dict[str, Any]]] = []
     for shard, ck in shard_entries:
         row = by_cache_key.get(ck)
-        if row is None:
-            if require_all:
-                return None
-            continue
-        payload = _parse_shard_summary_row(
-            session,
-            analytics,
-            shard,
-            row,
-            floor_sigma=floor_sigma,
-            validate_fingerprint=validate_fingerprint,
-        )
+        payload = None
+        if row is not None and (
+            not validate_fingerprint or row.data_fingerprint == expected[shard]
+        ):
+            payload = _summary_row_parts(row, parts)
         if payload is None:
             if require_all:
                 return None
             continue
         out.append((shard, payload))
-
-    if require_all and len(out) != len(shard_entries):
-        return None
     return out
 
 
@@ -451,11 +444,7 @@ def _save_shard_summary_row(
     key = shard_summary_cache_key(sk, sigma_key, floor_sigma)
     fingerprint = _shard_fingerprint(session, analytics, shard)
     payload = pickle.dumps(
-        {
-            "mergeable_summary": mergeable_summary,
-            "control_by_element": control_by_element,
-        },
-        protocol=pickle.HIGHEST_PROTOCOL,
+        {SUMMARY_PART_JUDGE: mergeable_summary}, protocol=pickle.HIGHEST_PROTOCOL
     )
     now = datetime.now(timezone.utc)
     row = {
@@ -465,6 +454,9 @@ def _save_shard_summary_row(
         "floor_sigma": float(floor_sigma),
         "data_fingerprint": fingerprint,
         "summary_payload": payload,
+        "control_payload": pickle.dumps(
+            control_by_element, protocol=pickle.HIGHEST_PROTOCOL
+        ),
         "n_marks": n_marks,
         "computed_at": now,
     }
@@ -484,6 +476,50 @@ def _save_shard_summary_row(
         write_session.close()
 
 
+def _summarize_shard(
+    session: Session,
+    analytics: JudgeAnalytics,
+    shard: ElementRankingShard,
+    shared: dict[str, Any],
+) -> dict[str, Any] | None:
+    """
+    Annotate one shard's marks with σ̂ and compute its mergeable judge summary
+    (saved to the summary cache when ``shared["persist_summaries"]``).
+
+    ``None`` when the shard has no marks (or no cached marks with ``cache_only_marks``).
+    """
+    marks = _load_shard_row(session, analytics, shard)
+    if marks is None:
+        if shared.get("cache_only_marks"):
+            return None
+        marks = _load_marks_from_db(session, analytics, shard)
+    if marks.empty:
+        return None
+    work = annotate_normalized_marks(
+        compute_control_scores(marks.copy()),
+        shared["params"],
+        floor_sigma=shared["floor_sigma"],
+    )
+    mergeable = compute_mergeable_judge_summary(work)
+    control = control_scores_by_element(marks)
+    if shared.get("persist_summaries"):
+        _save_shard_summary_row(
+            session,
+            analytics,
+            shard,
+            sigma_key=shared["sigma_key"],
+            floor_sigma=shared["floor_sigma"],
+            mergeable_summary=mergeable,
+            control_by_element=control,
+            n_marks=len(marks),
+        )
+    return {
+        "mergeable_summary": mergeable,
+        "control_by_element": control,
+        "n_marks": len(marks),
+    }
+
+
 def _persist_shard_summaries_for_scope(
     session: Session,
     analytics: JudgeAnalytics,
@@ -493,34 +529,27 @@ def _persist_shard_summaries_for_scope(
     *,
     floor_sigma: float,
     cache_only_marks: bool = False,
+    workers: int = 1,
 ) -> None:
     if not params:
         return
     ensure_element_ranking_cache_tables(session)
-    sigma_key = benchmark_sigma_cache_key(run_params)
-    for shard in iter_element_ranking_shards(analytics, **rank_scope):
-        marks = _load_shard_row(session, analytics, shard)
-        if marks is None:
-            if cache_only_marks:
-                continue
-            marks = _load_marks_from_db(session, analytics, shard)
-        if marks.empty:
-            continue
-        work = annotate_normalized_marks(
-            compute_control_scores(marks.copy()), params, floor_sigma=floor_sigma
-        )
-        mergeable = compute_mergeable_judge_summary(work)
-        control = control_scores_by_element(marks)
-        _save_shard_summary_row(
-            session,
-            analytics,
-            shard,
-            sigma_key=sigma_key,
-            floor_sigma=floor_sigma,
-            mergeable_summary=mergeable,
-            control_by_element=control,
-            n_marks=len(marks),
-        )
+    shared = {
+        "params": params,
+        "floor_sigma": float(floor_sigma),
+        "sigma_key": benchmark_sigma_cache_key(run_params),
+        "persist_summaries": True,
+        "cache_only_marks": cache_only_marks,
+    }
+    for _shard, _summary in iter_shard_results(
+        session,
+        analytics,
+        iter_element_ranking_shards(analytics, **rank_scope),
+        _summarize_shard,
+        shared,
+        workers=workers,
+    ):
+        pass
 
 
 def _try_assemble_ranking_from_shard_summaries(
@@ -538,30 +567,52 @@ def _try_assemble_ranking_from_shard_summaries(
     if not iter_element_ranking_shards(analytics, **rank_scope):
         return None
 
+    # Judge-summary part only: the control table is fetched on drill-down
+    # (``load_control_by_element_for_ranking_scope``).
     shard_payloads = load_shard_summary_payloads_for_scope(
         session,
         analytics,
         run_params,
         validate_fingerprint=False,
         require_all=True,
+        parts=(SUMMARY_PART_JUDGE,),
     )
     if shard_payloads is None:
         return None
 
     mergeable_parts: list[pd.DataFrame] = []
-    control_parts: list[pd.DataFrame] = []
     n_raw = 0
     for _shard, payload in shard_payloads:
-        mergeable = payload.get("mergeable_summary")
-        control = payload.get("control_by_element")
-        if not isinstance(mergeable, pd.DataFrame):
-            return None
+        mergeable = payload[SUMMARY_PART_JUDGE]
         mergeable_parts.append(mergeable)
-        if isinstance(control, pd.DataFrame) and not control.empty:
-            control_parts.append(control)
         n_raw += int(mergeable["n_marks"].sum()) if not mergeable.empty else 0
 
-    judge_summary_all = merge_mergeable_judge_summaries(mergeable_parts)
+    return _ranking_result_from_summaries(
+        analytics,
+        run_params,
+        params,
+        merge_mergeable_judge_summaries(mergeable_parts),
+        [],
+        n_raw,
+        min_bin_count=min_bin_count,
+        include_judge_detail=include_judge_detail,
+        sigma_reference_df=sigma_reference_df,
+    )
+
+
+def _ranking_result_from_summaries(
+    analytics: JudgeAnalytics,
+    run_params: tuple,
+    params: dict,
+    judge_summary_all: pd.DataFrame,
+    control_parts: list[pd.DataFrame],
+    n_raw: int,
+    *,
+    min_bin_count: int,
+    include_judge_detail: bool | None,
+    sigma_reference_df: pd.DataFrame | None,
+) -> dict[str, Any]:
+    """Ranking result from merged shard summaries (no per-judge detail frames)."""
     if judge_summary_all.empty:
         return _empty_ranking_error("No element score rows found for the selected filters.")
 
@@ -634,8 +685,16 @@ def run_element_deviation_ranking_pipeline(
     benchmark_segment_level_preset: str | None | object = _BENCHMARK_SEGMENT_LEVEL_UNSET,
     cache_only: bool = False,
     persist_shards: bool = True,
+    workers: int | None = None,
 ) -> dict[str, Any]:
-    """Assemble ranking-scope marks; apply σ̂ from benchmark pool (cached when possible)."""
+    """
+    Assemble ranking-scope marks; apply σ̂ from benchmark pool (cached when possible).
+
+    ``workers`` > 1 (``None``: ``RANKING_SHARD_WORKERS``; ``0``: all cores) loads shards
+    in a process pool. Without judge detail (``include_judge_detail=False``, or low-memory
+    mode) the workers also summarize their shards and the merged result has the same
+    shape as one assembled from the summary cache; with detail, marks are ranked here.
+    """
     bench_levels = (
         segment_level_preset
         if benchmark_segment_level_preset is _BENCHMARK_SEGMENT_LEVEL_UNSET
@@ -701,11 +760,33 @@ def run_element_deviation_ranking_pipeline(
             if summary_result is not None:
                 return apply_min_marks_to_ranking_result(summary_result, int(min_marks))
 
+    n_workers = resolve_ranking_shard_workers(workers)
+    want_detail = (
+        include_judge_detail
+        if include_judge_detail is not None
+        else not memory_efficient_mode()
+    )
+    if n_workers > 1 and not cache_only and not want_detail:
+        pooled = _rank_shards_in_pool(
+            session,
+            analytics,
+            run_params,
+            rank_scope,
+            floor_sigma=floor_sigma,
+            min_bin_count=min_bin_count,
+            include_judge_detail=include_judge_detail,
+            persist_shards=persist_shards,
+            workers=n_workers,
+        )
+        if pooled is not None:
+            return apply_min_marks_to_ranking_result(pooled, int(min_marks))
+
     ranking_marks = collect_marks_for_run(
         analytics,
         **rank_scope,
         cache_only=cache_only,
         persist_shards=persist_shards and not cache_only,
+        workers=n_workers,
     )
     if ranking_marks is None:
         return _empty_ranking_error("Missing or stale shard cache for ranking scope.")
@@ -719,6 +800,7 @@ def run_element_deviation_ranking_pipeline(
             cache_only=cache_only,
             persist_shards=persist_shards,
             persist_sigma=persist_shards,
+            workers=n_workers,
         )
         if sigma_out is None:
             return _empty_ranking_error(
@@ -771,6 +853,99 @@ def run_element_deviation_ranking_pipeline(
     return apply_min_marks_to_ranking_result(result, int(min_marks))
 
 
+def _rank_shards_in_pool(
+    session: Session,
+    analytics: JudgeAnalytics,
+    run_params: tuple,
+    rank_scope: dict[str, Any],
+    *,
+    floor_sigma: float,
+    min_bin_count: int,
+    include_judge_detail: bool | None,
+    persist_shards: bool,
+    workers: int,
+) -> dict[str, Any] | None:
+    """
+    Resolve σ̂, then summarize every ranking shard in a process pool and merge the
+    mergeable judge summaries as they complete. ``None`` when no σ̂ could be fitted
+    (the serial path reports the empty / error result).
+
+    Like a summary-cache result there are no judge detail frames, so the result keeps
+    ``_from_summary_cache`` and drill-downs load detail on demand.
+    """
+    ranking_marks: pd.DataFrame | None = None
+    if uses_separate_benchmark_pool(run_params):
+        sigma_out = get_or_fit_benchmark_sigma_params(
+            session,
+            analytics,
+            run_params,
+            persist_shards=persist_shards,
+            persist_sigma=persist_shards,
+            workers=workers,
+        )
+        if sigma_out is None:
+            return None
+        params, sigma_ref, _from_sigma_cache = sigma_out
+    else:
+        params = _load_sigma_cache_row(session, analytics, run_params)
+        if params is None:
+            ranking_marks = collect_marks_for_run(
+                analytics,
+                **rank_scope,
+                persist_shards=persist_shards,
+                workers=workers,
+            )
+            params = fit_sigma_params_from_marks(
+                ranking_marks, min_bin_count=int(min_bin_count)
+            )
+            if persist_shards and params:
+                _save_sigma_cache_row(
+                    session, analytics, run_params, params, n_marks=len(ranking_marks)
+                )
+        sigma_ref = ranking_marks
+    if not params:
+        return None
+
+    shared = {
+        "params": params,
+        "floor_sigma": float(floor_sigma),
+        "sigma_key": benchmark_sigma_cache_key(run_params),
+        "persist_summaries": persist_shards,
+        "cache_only_marks": False,
+    }
+    total: pd.DataFrame | None = None
+    control_parts: list[pd.DataFrame] = []
+    n_raw = 0
+    for _shard, summary in iter_shard_results(
+        session,
+        analytics,
+        iter_element_ranking_shards(analytics, **rank_scope),
+        _summarize_shard,
+        shared,
+        workers=workers,
+    ):
+        if summary is None:
+            continue
+        total = fold_mergeable_judge_summaries(total, summary["mergeable_summary"])
+        if not summary["control_by_element"].empty:
+            control_parts.append(summary["control_by_element"])
+        n_raw += summary["n_marks"]
+
+    if sigma_ref is not None and not sigma_ref.empty:
+        sigma_ref = compute_control_scores(sigma_ref.copy())
+    return _ranking_result_from_summaries(
+        analytics,
+        run_params,
+        params,
+        merge_mergeable_judge_summaries([total]),
+        control_parts,
+        n_raw,
+        min_bin_count=min_bin_count,
+        include_judge_detail=include_judge_detail,
+        sigma_reference_df=sigma_ref,
+    )
+
+
 def _empty_ranking_error(message: str) -> dict[str, Any]:
     from element_deviation_ranking import memory_efficient_mode
 
@@ -811,6 +986,38 @@ def _shard_fingerprint(
     )
 
 
+def _shard_fingerprints(
+    session: Session, analytics: JudgeAnalytics, shards: list[ElementRankingShard]
+) -> dict[ElementRankingShard, str]:
+    """``_shard_fingerprint`` for many shards: one grouped query per shared filter set."""
+    from element_deviation_ranking import segment_levels_for_ranking_preset
+
+    groups: dict[tuple, list[ElementRankingShard]] = {}
+    for shard in shards:
+        key = (
+            shard.competition_scope,
+            shard.event_start_iso,
+            shard.event_end_iso,
+            shard.segment_level_preset,
+        )
+        groups.setdefault(key, []).append(shard)
+    out: dict[ElementRankingShard, str] = {}
+    for (scope, start_iso, end_iso, preset), members in groups.items():
+        by_pair = compute_element_ranking_shard_fingerprints(
+            session,
+            analytics,
+            season_years=[s.season_year for s in members],
+            discipline_type_ids=[s.discipline_type_id for s in members],
+            event_start_date=date.fromisoformat(start_iso) if start_iso else None,
+            event_end_date=date.fromisoformat(end_iso) if end_iso else None,
+            segment_levels=segment_levels_for_ranking_preset(preset),
+            competition_scope=scope,
+        )
+        for shard in members:
+            out[shard] = by_pair[(shard.season_year, shard.discipline_type_id)]
+    return out
+
+
 def _normalize_shard_marks(
     df: pd.DataFrame, session: Session, analytics: JudgeAnalytics
 ) -> pd.DataFrame:
@@ -878,7 +1085,10 @@ def _load_shard_row(
             session.expunge(row)
             return None
     try:
-        df = pickle.loads(row.marks_payload)
+        if row.judge_index is not None:
+            df = decode_judge_sorted_marks(row.marks_payload, row.judge_index)
+        else:
+            df = pickle.loads(row.marks_payload)
     except Exception:
         session.expunge(row)
         return None
@@ -895,7 +1105,7 @@ def _save_shard_row(
 ) -> None:
     _require_postgres(session.get_bind())
     key = shard_cache_key(shard)
-    payload = pickle.dumps(marks, protocol=pickle.HIGHEST_PROTOCOL)
+    payload, judge_index = encode_judge_sorted_marks(marks)
     fingerprint = _shard_fingerprint(session, analytics, shard)
     now = datetime.now(timezone.utc)
     row = {
@@ -907,6 +1117,7 @@ def _save_shard_row(
         "event_end_iso": shard.event_end_iso,
         "data_fingerprint": fingerprint,
         "marks_payload": payload,
+        "judge_index": judge_index,
         "n_marks": len(marks),
         "computed_at": now,
     }
@@ -926,6 +1137,51 @@ def _save_shard_row(
         write_session.close()
 
 
+def load_judge_marks_from_shards(
+    analytics: JudgeAnalytics,
+    judge_ids: list[int],
+    *,
+    start_season_year: str | None = None,
+    end_season_year: str | None = None,
+    event_start_date: date | None = None,
+    event_end_date: date | None = None,
+    discipline_type_ids: list[int] | None = None,
+    competition_scope: str,
+    segment_level_preset: str | None = None,
+) -> pd.DataFrame | None:
+    """
+    One identity's element marks from the cached shards' judge index (drill-down).
+
+    ``None`` when any shard in scope is missing or predates the index (caller loads
+    from SQL instead).
+    """
+    shards = iter_element_ranking_shards(
+        analytics,
+        start_season_year=start_season_year,
+        end_season_year=end_season_year,
+        discipline_type_ids=discipline_type_ids,
+        competition_scope=competition_scope,
+        event_start_date=event_start_date,
+        event_end_date=event_end_date,
+        segment_level_preset=segment_level_preset,
+    )
+    if not shards:
+        return None
+    session = analytics.session
+    parts = load_judge_slices(
+        session,
+        ElementDeviationRankingShardCache,
+        [shard_cache_key(s) for s in shards],
+        judge_ids,
+    )
+    if parts is None:
+        return None
+    parts = [p for p in parts if not p.empty]
+    if not parts:
+        return pd.DataFrame(columns=list(SHARD_MARK_COLUMNS))
+    return _normalize_shard_marks(pd.concat(parts, ignore_index=True), session, analytics)
+
+
 def load_control_by_element_for_ranking_scope(
     session: Session,
     analytics: JudgeAnalytics,
@@ -934,7 +1190,7 @@ def load_control_by_element_for_ranking_scope(
     """
     Panel median GOE per element for the ranking scope, from shard caches.
 
-    Tries summary-cache ``control_by_element`` slices first, then mark shards, without
+    Tries the summary-cache control part first, then mark shards, without
     concatenating full mark DataFrames for every judge (needed for Heroku drill-down).
     """
     control_parts: list[pd.DataFrame] = []
@@ -944,11 +1200,12 @@ def load_control_by_element_for_ranking_scope(
         run_params,
         validate_fingerprint=False,
         require_all=False,
+        parts=(SUMMARY_PART_CONTROL,),
     )
     if shard_payloads:
         for _shard, payload in shard_payloads:
-            control = payload.get("control_by_element")
-            if isinstance(control, pd.DataFrame) and not control.empty:
+            control = payload[SUMMARY_PART_CONTROL]
+            if not control.empty:
                 control_parts.append(control)
 
     if control_parts:
@@ -984,12 +1241,14 @@ def collect_marks_for_run(
     segment_level_preset: str | None = None,
     cache_only: bool = False,
     persist_shards: bool = False,
+    workers: int = 1,
 ) -> pd.DataFrame:
     """
     Load marks for every (season × discipline) shard; optionally read/write shard cache.
 
     Returns empty DataFrame if no marks. Returns ``None`` when ``cache_only=True`` and
-    any required shard is missing or stale.
+    any required shard is missing or stale. ``workers`` > 1 loads shards in a process
+    pool; parts are still concatenated in shard order.
     """
     session = analytics.session
     if persist_shards or not cache_only:
@@ -1007,25 +1266,41 @@ def collect_marks_for_run(
     if not shards:
         return pd.DataFrame()
 
-    parts: list[pd.DataFrame] = []
-    for shard in shards:
-        marks = _load_shard_row(
-            session, analytics, shard, validate_fingerprint=not cache_only
-        )
+    shared = {"cache_only": cache_only, "persist_shards": persist_shards}
+    by_shard: dict[ElementRankingShard, pd.DataFrame] = {}
+    for shard, marks in iter_shard_results(
+        session, analytics, shards, _load_shard_marks, shared, workers=workers
+    ):
         if marks is None:
-            if cache_only:
-                return None
-            marks = _load_marks_from_db(session, analytics, shard)
-            if persist_shards:
-                _save_shard_row(session, analytics, shard, marks)
-        if not marks.empty:
-            parts.append(marks)
+            return None
+        by_shard[shard] = marks
 
+    parts = [by_shard[s] for s in shards if not by_shard[s].empty]
     if not parts:
         return pd.DataFrame()
     return pd.concat(parts, ignore_index=True)
 
 
+def _load_shard_marks(
+    session: Session,
+    analytics: JudgeAnalytics,
+    shard: ElementRankingShard,
+    shared: dict[str, Any],
+) -> pd.DataFrame | None:
+    """Shard marks from the shard cache, else the database (``None``: cache-only miss)."""
+    cache_only = shared["cache_only"]
+    marks = _load_shard_row(
+        session, analytics, shard, validate_fingerprint=not cache_only
+    )
+    if marks is None:
+        if cache_only:
+            return None
+        marks = _load_marks_from_db(session, analytics, shard)
+        if shared["persist_shards"]:
+            _save_shard_row(session, analytics, shard, marks)
+    return marks
+
+
 def _load_legacy_full_cache(
     session: Session,
     analytics: JudgeAnalytics,
@@ -1314,8 +1589,13 @@ def precompute_element_ranking_shard_summaries(
     *,
     rank_scope: dict[str, Any] | None = None,
     summaries_only: bool = False,
+    workers: int = 1,
 ) -> int:
-    """Warm per-shard judge summary rows for a benchmark σ̂ fit. Returns rows written."""
+    """
+    Warm per-shard judge summary rows for a benchmark σ̂ fit. Returns rows written.
+
+    ``workers`` > 1 summarizes shards in a process pool (see ``ranking_shard_pool``).
+    """
     sigma_out = get_or_fit_benchmark_sigma_params(
         session,
         analytics,
@@ -1340,6 +1620,7 @@ def precompute_element_ranking_shard_summaries(
         scope,
         floor_sigma=float(rp[7]),
         cache_only_marks=summaries_only,
+        workers=workers,
     )
     return len(shards)
 
@@ -6,8 +6,10 @@ HTML reports via SMTP.
 """
 
 import smtplib
+import time
 import unicodedata
 import email.policy
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from email.message import EmailMessage
 
 import pandas as pd
@@ -134,6 +136,147 @@ def build_report_for_judge(analytics, judge_id: int, competition_id: int):
     return html_bytes, judge_name
 
 
+_SEGMENT_STATS_COLUMNS = [
+    "segment_id", "competition_name", "competition_year", "discipline",
+    "segment_name", "skater_count", "total_anomalies", "pcs_anomalies",
+    "element_anomalies", "total_rule_errors", "pcs_rule_errors",
+    "element_rule_errors",
+]
+
+
+def _segment_anomaly_counts(df: pd.DataFrame, prefix: str) -> pd.DataFrame:
+    """Per-segment anomaly / rule-error counts for one judge's marks (``anomaly`` already includes rule errors)."""
+    if df.empty:
+        return pd.DataFrame(
+            columns=["segment_id", f"{prefix}_anomalies", f"{prefix}_rule_errors"]
+        )
+    flagged = df[df["anomaly"].astype(bool)]
+    return (
+        flagged.groupby("segment_id")
+        .agg(**{
+            f"{prefix}_anomalies": ("anomaly", "size"),
+            f"{prefix}_rule_errors": ("is_rule_error", lambda s: int(s.astype(bool).sum())),
+        })
+        .reset_index()
+    )
+
+
+def segment_stats_from_marks(pcs_df: pd.DataFrame, elem_df: pd.DataFrame,
+                             skater_counts: dict) -> pd.DataFrame:
+    """
+    Rebuild ``JudgeAnalytics.get_judge_segment_stats`` rows for one judge from marks
+    already loaded with ``include_ids=True``, instead of re-querying per judge.
+    """
+    meta_cols = ["segment_id", "competition_name", "year", "discipline_name", "segment_name"]
+    frames = [d[meta_cols] for d in (pcs_df, elem_df) if not d.empty]
+    if not frames:
+        return pd.DataFrame()
+    seg = (
+        pd.concat(frames, ignore_index=True)
+        .drop_duplicates("segment_id")
+        .rename(columns={"year": "competition_year", "discipline_name": "discipline"})
+    )
+    seg = seg[seg["segment_id"].isin(skater_counts.keys())]
+    if seg.empty:
+        return pd.DataFrame()
+    seg["skater_count"] = seg["segment_id"].map(skater_counts)
+    for part in (_segment_anomaly_counts(pcs_df, "pcs"),
+                 _segment_anomaly_counts(elem_df, "element")):
+        seg = seg.merge(part, on="segment_id", how="left")
+    for col in ("pcs_anomalies", "pcs_rule_errors", "element_anomalies", "element_rule_errors"):
+        seg[col] = seg[col].fillna(0).astype(int)
+    seg["total_anomalies"] = seg["pcs_anomalies"] + seg["element_anomalies"]
+    seg["total_rule_errors"] = seg["pcs_rule_errors"] + seg["element_rule_errors"]
+    return seg[_SEGMENT_STATS_COLUMNS].reset_index(drop=True)
+
+
+def _judge_slice(df: pd.DataFrame, groups: dict, judge_id: int) -> pd.DataFrame:
+    idx = groups.get(judge_id)
+    if idx is None:
+        return pd.DataFrame()
+    return df.loc[idx].reset_index(drop=True)
+
+
+def build_reports_for_competition(analytics, judge_ids, competition_id: int,
+                                  max_workers: int = 4, progress_callback=None):
+    """
+    Build HTML reports for many judges of one competition in a single pass.
+
+    Loads the competition's PCS and element marks for all ``judge_ids`` once
+    (two queries), plus skater counts and judge names (two more), partitions the
+    rows per judge in memory and renders the reports in a thread pool.
+    Rendering does not touch the DB session, so workers share nothing but
+    read-only frames.
+
+    Returns ``{judge_id: (html_bytes, judge_name) | Exception}``; a failed render
+    for one judge does not stop the others. ``progress_callback(done, total)``
+    is called from the calling thread as reports finish.
+    """
+    ids = [int(j) for j in dict.fromkeys(judge_ids)]
+    if not ids:
+        return {}
+    comp_ids = [int(competition_id)]
+    pcs_all = analytics.get_judge_pcs_stats(ids, competition_ids=comp_ids, include_ids=True)
+    elem_all = analytics.get_judge_element_stats(ids, competition_ids=comp_ids, include_ids=True)
+
+    session = analytics.session
+    skater_counts = dict(session.execute(
+        sqlt("""
+            SELECT ss.segment_id, COUNT(*)
+            FROM skater_segment ss
+            JOIN segment s ON s.id = ss.segment_id
+            WHERE s.competition_id = :cid
+            GROUP BY ss.segment_id
+        """),
+        {"cid": int(competition_id)},
+    ).fetchall())
+    judge_names = dict(session.execute(
+        sqlt("SELECT id, name FROM judge WHERE id = ANY(:ids)"), {"ids": ids}
+    ).fetchall())
+
+    from models import Competition
+    comp = session.get(Competition, int(competition_id))
+    single_comp_display = (
+        f"{comp.name} ({comp.year})" if comp and comp.name else None
+    )
+
+    pcs_groups = pcs_all.groupby("judge_id").groups if not pcs_all.empty else {}
+    elem_groups = elem_all.groupby("judge_id").groups if not elem_all.empty else {}
+
+    def _render(judge_id: int):
+        pcs_df = _judge_slice(pcs_all, pcs_groups, judge_id)
+        elem_df = _judge_slice(elem_all, elem_groups, judge_id)
+        seg_df = segment_stats_from_marks(pcs_df, elem_df, skater_counts)
+        # Report frames match the single-judge loaders (no id columns).
+        pcs_df = pcs_df.drop(columns=["judge_id", "segment_id"], errors="ignore")
+        elem_df = elem_df.drop(columns=["judge_id", "segment_id"], errors="ignore")
+        stats = analytics.calculate_judge_summary_stats(pcs_df, elem_df)
+        judge_name = judge_names.get(judge_id) or f"Judge #{judge_id}"
+        html_bytes = build_judge_report_html(
+            judge_name,
+            stats,
+            pcs_df,
+            elem_df,
+            seg_df,
+            single_competition_display_name=single_comp_display,
+            filter_summary_lines=None,
+        )
+        return html_bytes, judge_name
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, int(max_workers))) as pool:
+        futures = {pool.submit(_render, jid): jid for jid in ids}
+        for done, fut in enumerate(as_completed(futures), start=1):
+            jid = futures[fut]
+            try:
+                results[jid] = fut.result()
+            except Exception as exc:
+                results[jid] = exc
+            if progress_callback is not None:
+                progress_callback(done, len(ids))
+    return results
+
+
 # ── SMTP sending ──────────────────────────────────────────────────────────────
 
 
@@ -154,16 +297,24 @@ def _ascii_filename(s: str) -> str:
     return "".join(c if ord(c) < 128 else "_" for c in nfkd)
 
 
-def send_report_email(smtp_config: dict, to_email: str, judge_name: str,
-                      competition_name: str, html_bytes: bytes,
-                      subject_template: str = DEFAULT_EMAIL_SUBJECT,
-                      body_template: str = DEFAULT_EMAIL_BODY):
+def _ascii_cred(s: str) -> str:
+    """
+    Normalise credentials: replace non-breaking spaces / other Unicode
+    whitespace variants that may appear when copy-pasting (e.g. Gmail App
+    Passwords show groups separated by \xa0 in the browser).
     """
-    Send one judge report via SMTP using the modern EmailMessage API,
+    return unicodedata.normalize("NFKC", s).replace("\xa0", " ").replace("\u2011", "-")
+
+
+def build_report_message(smtp_config: dict, to_email: str, judge_name: str,
+                         competition_name: str, html_bytes: bytes,
+                         subject_template: str = DEFAULT_EMAIL_SUBJECT,
+                         body_template: str = DEFAULT_EMAIL_BODY) -> EmailMessage:
+    """
+    Build one judge report message using the modern EmailMessage API,
     which handles Unicode subjects, bodies, and names natively.
     subject_template and body_template support {judge_name},
     {competition_name}, and {from_name} placeholders.
-    Raises smtplib exceptions on failure.
     """
     subs = {
         "judge_name": judge_name,
@@ -188,24 +339,131 @@ def send_report_email(smtp_config: dict, to_email: str, judge_name: str,
         subtype="html",
         filename=filename,
     )
+    return msg
+
+
+# Connection-level failures worth reconnecting for; 5xx replies are permanent.
+_SMTP_RETRYABLE = (
+    smtplib.SMTPServerDisconnected,
+    smtplib.SMTPConnectError,
+    ConnectionError,
+    TimeoutError,
+)
+
+
+def _smtp_error_is_transient(exc: Exception) -> bool:
+    if isinstance(exc, _SMTP_RETRYABLE):
+        return True
+    code = getattr(exc, "smtp_code", None)
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        codes = [c for c, _ in exc.recipients.values()]
+        return bool(codes) and all(400 <= c < 500 for c in codes)
+    return isinstance(code, int) and 400 <= code < 500
 
-    # Normalise credentials: replace non-breaking spaces / other Unicode
-    # whitespace variants that may appear when copy-pasting (e.g. Gmail App
-    # Passwords show groups separated by \xa0 in the browser).
-    def _ascii_cred(s: str) -> str:
-        return unicodedata.normalize("NFKC", s).replace("\xa0", " ").replace("\u2011", "-")
-
-    smtp_user = _ascii_cred(smtp_config["user"])
-    smtp_pass = _ascii_cred(smtp_config["password"])
-
-    port = smtp_config["port"]
-    if port == 465:
-        with smtplib.SMTP_SSL(smtp_config["host"], port) as server:
-            server.login(smtp_user, smtp_pass)
-            server.send_message(msg)
-    else:
-        with smtplib.SMTP(smtp_config["host"], port) as server:
+
+class SmtpReportSender:
+    """
+    One SMTP connection reused for a batch of report emails.
+
+    Use as a context manager. ``send`` waits at least ``min_interval`` seconds
+    between messages (provider rate limits), and on disconnects or 4xx replies
+    reconnects and retries up to ``max_retries`` times with exponential backoff.
+    ``smtp_config`` is the dict used by ``send_report_email``; optional keys
+    ``starttls`` (default True) and ``timeout`` (seconds) are honoured, and
+    login is skipped when no password is set.
+    """
+
+    def __init__(self, smtp_config: dict, *, min_interval: float = 0.5,
+                 max_retries: int = 3, backoff: float = 1.0,
+                 sleep=time.sleep, clock=time.monotonic):
+        self.smtp_config = smtp_config
+        self.min_interval = float(min_interval)
+        self.max_retries = int(max_retries)
+        self.backoff = float(backoff)
+        self._sleep = sleep
+        self._clock = clock
+        self._server = None
+        self._last_send = None
+        self.connections_opened = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _connect(self):
+        cfg = self.smtp_config
+        port = int(cfg["port"])
+        timeout = cfg.get("timeout", 30)
+        if port == 465:
+            server = smtplib.SMTP_SSL(cfg["host"], port, timeout=timeout)
+        else:
+            server = smtplib.SMTP(cfg["host"], port, timeout=timeout)
             server.ehlo()
-            server.starttls()
-            server.login(smtp_user, smtp_pass)
-            server.send_message(msg)
+            if cfg.get("starttls", True):
+                server.starttls()
+                server.ehlo()
+        if cfg.get("password"):
+            server.login(_ascii_cred(cfg["user"]), _ascii_cred(cfg["password"]))
+        self._server = server
+        self.connections_opened += 1
+
+    def close(self):
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except smtplib.SMTPException:
+            self._server.close()
+        except OSError:
+            pass
+        self._server = None
+
+    def _throttle(self):
+        if self._last_send is None or self.min_interval <= 0:
+            return
+        wait = self.min_interval - (self._clock() - self._last_send)
+        if wait > 0:
+            self._sleep(wait)
+
+    def send(self, msg: EmailMessage):
+        """Send one message on the pooled connection; raises after the last retry."""
+        attempt = 0
+        while True:
+            self._throttle()
+            try:
+                if self._server is None:
+                    self._connect()
+                self._server.send_message(msg)
+                self._last_send = self._clock()
+                return
+            except Exception as exc:
+                self._last_send = self._clock()
+                if attempt >= self.max_retries or not _smtp_error_is_transient(exc):
+                    raise
+                # Drop the (possibly half-open) connection and retry on a fresh one.
+                self.close()
+                self._sleep(self.backoff * (2 ** attempt))
+                attempt += 1
+
+
+def send_report_email(smtp_config: dict, to_email: str, judge_name: str,
+                      competition_name: str, html_bytes: bytes,
+                      subject_template: str = DEFAULT_EMAIL_SUBJECT,
+                      body_template: str = DEFAULT_EMAIL_BODY,
+                      sender: SmtpReportSender | None = None):
+    """
+    Send one judge report via SMTP. Pass ``sender`` to reuse a pooled
+    connection for a batch; otherwise a connection is opened for this message.
+    Raises smtplib exceptions on failure.
+    """
+    msg = build_report_message(
+        smtp_config, to_email, judge_name, competition_name, html_bytes,
+        subject_template=subject_template, body_template=body_template,
+    )
+    if sender is not None:
+        sender.send(msg)
+        return
+    with SmtpReportSender(smtp_config, min_interval=0, max_retries=0) as one_shot:
+        one_shot.send(msg)
@@ -13,8 +13,9 @@ import os
 import re
 import threading
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterable
 
+import numpy as np
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.engine import RowMapping
@@ -392,28 +393,223 @@ def suggest_matches(
     return out
 
 
+_NAME_TOKEN_RE = re.compile(r"[^\W\d_]{2,}")
+
+
+def name_block_tokens(normalized: str) -> set[str]:
+    """
+    Blocking keys for a normalized name: its alphabetic tokens (2+ letters).
+
+    Every token is a key, not only the surname, so a typo in one part of the name still
+    finds candidates through the other part and ``Last First`` protocol order works.
+    """
+    return set(_NAME_TOKEN_RE.findall(normalized or ""))
+
+
+class FuzzyNameMatcher:
+    """
+    Bulk ``token_set_ratio`` matcher over one roster (directory or ISU labels).
+
+    Scores many protocol names at once with RapidFuzz's multi-threaded ``cdist`` /
+    ``cpdist``. With ``use_blocking`` (default) only choices sharing a name token with the
+    query are scored, so work grows with block size rather than roster size. Result
+    ordering and scores match ``suggest_matches`` for the candidates that are scored.
+    """
+
+    def __init__(
+        self,
+        choices: dict[int, str],
+        normalized_choices: dict[int, str] | None = None,
+    ):
+        self.choices = choices
+        norm = normalized_choices or normalize_name_choices(choices)
+        self._ids = np.fromiter((int(k) for k in norm.keys()), dtype=np.int64, count=len(norm))
+        self._names = list(norm.values())
+        blocks: dict[str, list[int]] = {}
+        for pos, name in enumerate(self._names):
+            for tok in name_block_tokens(name):
+                blocks.setdefault(tok, []).append(pos)
+        self._blocks = {tok: np.asarray(pos, dtype=np.int64) for tok, pos in blocks.items()}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _candidates(self, query: str) -> np.ndarray:
+        hits = [self._blocks[t] for t in name_block_tokens(query) if t in self._blocks]
+        if not hits:
+            return np.empty(0, dtype=np.int64)
+        if len(hits) == 1:
+            return hits[0]
+        return np.unique(np.concatenate(hits))
+
+    def _score_pairs(
+        self, queries: list[str], use_blocking: bool, workers: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return flat ``(query_index, choice_position, score)`` arrays."""
+        if not use_blocking:
+            matrix = process.cdist(
+                queries,
+                self._names,
+                scorer=fuzz.token_set_ratio,
+                dtype=np.float64,
+                workers=workers,
+            )
+            q_idx, c_pos = np.indices(matrix.shape)
+            return q_idx.ravel(), c_pos.ravel(), matrix.ravel()
+        cand = [self._candidates(q) for q in queries]
+        sizes = np.fromiter((len(c) for c in cand), dtype=np.int64, count=len(cand))
+        if not sizes.sum():
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0, dtype=np.float64)
+        q_idx = np.repeat(np.arange(len(queries), dtype=np.int64), sizes)
+        c_pos = np.concatenate([c for c in cand if len(c)])
+        scores = process.cpdist(
+            [queries[i] for i in q_idx],
+            [self._names[p] for p in c_pos],
+            scorer=fuzz.token_set_ratio,
+            dtype=np.float64,
+            workers=workers,
+        )
+        return q_idx, c_pos, np.asarray(scores, dtype=np.float64)
+
+    def _top_k(
+        self,
+        protocol_names: Iterable[str | None],
+        *,
+        top: int,
+        min_score: float,
+        use_blocking: bool,
+        workers: int,
+    ) -> tuple[int, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        keys = [protocol_person_match_key(n or "") for n in protocol_names]
+        live = [i for i, k in enumerate(keys) if k]
+        empty_i = np.empty(0, dtype=np.int64)
+        if not live or not self._names:
+            return len(keys), empty_i, empty_i, np.empty(0), empty_i
+        q_idx, c_pos, scores = self._score_pairs(
+            [keys[i] for i in live], use_blocking, workers
+        )
+        keep = scores >= min_score
+        q_idx, c_pos, scores = q_idx[keep], c_pos[keep], scores[keep]
+        # Best-first per query; ties keep roster order like ``process.extract``.
+        order = np.lexsort((c_pos, -scores, q_idx))
+        q_idx, c_pos, scores = q_idx[order], c_pos[order], scores[order]
+        starts = np.searchsorted(q_idx, q_idx, side="left")
+        rank = np.arange(len(q_idx)) - starts
+        keep = rank < top
+        live_arr = np.asarray(live, dtype=np.int64)
+        return len(keys), live_arr[q_idx[keep]], c_pos[keep], scores[keep], rank[keep]
+
+    def best_matches(
+        self,
+        protocol_names: Iterable[str | None],
+        *,
+        top: int = 8,
+        min_score: float = 0.0,
+        use_blocking: bool = True,
+        workers: int = -1,
+    ) -> list[list[tuple[int, float, str]]]:
+        """``suggest_matches`` for every name at once: ``[(official_id, score, label), ...]`` per name."""
+        n, name_idx, c_pos, scores, _rank = self._top_k(
+            protocol_names,
+            top=top,
+            min_score=min_score,
+            use_blocking=use_blocking,
+            workers=workers,
+        )
+        out: list[list[tuple[int, float, str]]] = [[] for _ in range(n)]
+        for i, pos, sc in zip(name_idx.tolist(), c_pos.tolist(), scores.tolist()):
+            oid = int(self._ids[pos])
+            out[i].append((oid, float(sc), self.choices.get(oid, "?")))
+        return out
+
+    def confident_ids(
+        self,
+        protocol_names: Iterable[str | None],
+        *,
+        min_score: float,
+        accept_score: float | None = None,
+        min_margin: float = 0.0,
+        use_blocking: bool = True,
+        workers: int = -1,
+    ) -> list[int | None]:
+        """
+        Best id per name when it clears the thresholds, else ``None``.
+
+        Candidates below ``min_score`` are dropped; the best must reach ``accept_score``
+        (default ``min_score``) and beat the runner-up (if any survived) by ``min_margin``.
+        """
+        accept = min_score if accept_score is None else accept_score
+        n, name_idx, c_pos, scores, rank = self._top_k(
+            protocol_names,
+            top=2,
+            min_score=min_score,
+            use_blocking=use_blocking,
+            workers=workers,
+        )
+        best = np.full(n, -np.inf)
+        second = np.full(n, -np.inf)
+        best_pos = np.full(n, -1, dtype=np.int64)
+        first = rank == 0
+        best[name_idx[first]] = scores[first]
+        best_pos[name_idx[first]] = c_pos[first]
+        second[name_idx[~first]] = scores[~first]
+        with np.errstate(invalid="ignore"):  # -inf - -inf for names with no candidate
+            ok = (best_pos >= 0) & (best >= accept) & ((best - second) >= min_margin)
+        return [
+            int(self._ids[pos]) if good else None
+            for pos, good in zip(best_pos.tolist(), ok.tolist())
+        ]
+
+
+_UPSERT_LINK_SQL = text(
+    """
+    INSERT INTO judge_official_link (judge_id, official_id, status, note, updated_at)
+    VALUES (:jid, :oid, 'linked', :note, :ts)
+    ON CONFLICT (judge_id) DO UPDATE SET
+        official_id = EXCLUDED.official_id,
+        status = 'linked',
+        note = COALESCE(EXCLUDED.note, judge_official_link.note),
+        updated_at = EXCLUDED.updated_at
+    """
+)
+
+
+def bump_link_table_version(conn: Connection) -> None:
+    """Invalidate the activity apps' cached reads of ``judge_official_link`` (no commit)."""
+    from activityAnalysis.query_cache import TABLE_JUDGE_OFFICIAL_LINK, bump_table_versions
+
+    bump_table_versions(conn, (TABLE_JUDGE_OFFICIAL_LINK,))
+
+
 def upsert_link(
     engine: Engine,
     judge_id: int,
     official_id: int,
     note: str | None = None,
 ) -> None:
+    upsert_links(engine, [(judge_id, official_id)], note=note)
+
+
+def upsert_links(
+    engine: Engine,
+    links: list[tuple[int, int]],
+    note: str | None = None,
+) -> int:
+    """Write many ``(judge_id, official_id)`` US links in one transaction; returns the count."""
+    if not links:
+        return 0
     now = datetime.now(timezone.utc)
     with engine.begin() as conn:
         conn.execute(
-            text(
-                """
-                INSERT INTO judge_official_link (judge_id, official_id, status, note, updated_at)
-                VALUES (:jid, :oid, 'linked', :note, :ts)
-                ON CONFLICT (judge_id) DO UPDATE SET
-                    official_id = EXCLUDED.official_id,
-                    status = 'linked',
-                    note = COALESCE(EXCLUDED.note, judge_official_link.note),
-                    updated_at = EXCLUDED.updated_at
-                """
-            ),
-            {"jid": judge_id, "oid": official_id, "note": note, "ts": now},
+            _UPSERT_LINK_SQL,
+            [
+                {"jid": int(jid), "oid": int(oid), "note": note, "ts": now}
+                for jid, oid in links
+            ],
         )
+        bump_link_table_version(conn)
+    return len(links)
 
 
 def upsert_outside(engine: Engine, judge_id: int, note: str | None = None) -> None:
@@ -433,6 +629,7 @@ def upsert_outside(engine: Engine, judge_id: int, note: str | None = None) -> No
             ),
             {"jid": judge_id, "note": note, "ts": now},
         )
+        bump_link_table_version(conn)
 
 
 def auto_link_by_score(
@@ -445,28 +642,16 @@ def auto_link_by_score(
 ) -> tuple[int, int]:
     """
     For each unmapped judge, if top fuzzy match >= min_score, write link.
+    All judges are scored in one ``FuzzyNameMatcher`` pass and linked in one transaction.
     Returns (linked_count, skipped_count).
     """
-    linked = 0
-    skipped = 0
-    norm = normalized_officials or normalize_name_choices(officials)
     with engine.connect() as conn:
         judges = fetch_unmapped_judges(conn, limit=limit_judges)
-    for j in judges:
-        matches = suggest_matches(
-            j["name"],
-            officials,
-            top=1,
-            min_score=min_score,
-            normalized_choices=norm,
-        )
-        if not matches:
-            skipped += 1
-            continue
-        oid, _score, _ = matches[0]
-        upsert_link(engine, int(j["id"]), oid, note=None)
-        linked += 1
-    return linked, skipped
+    matcher = FuzzyNameMatcher(officials, normalized_officials)
+    ids = matcher.confident_ids([j["name"] for j in judges], min_score=min_score)
+    links = [(int(j["id"]), oid) for j, oid in zip(judges, ids) if oid is not None]
+    linked = upsert_links(engine, links)
+    return linked, len(judges) - linked
 
 
 def upsert_isu_link(
@@ -475,17 +660,31 @@ def upsert_isu_link(
     isu_official_id: int,
     note: str | None = None,
 ) -> None:
+    upsert_isu_links(engine, [(judge_id, isu_official_id)], note=note)
+
+
+def upsert_isu_links(
+    engine: Engine,
+    links: list[tuple[int, int]],
+    note: str | None = None,
+) -> int:
+    """
+    Write many ``(judge_id, isu_official_id)`` links in one transaction, clearing any
+    ``outside_directory`` US marker for those judges. Returns the count.
+    """
+    if not links:
+        return 0
     now = datetime.now(timezone.utc)
     with engine.begin() as conn:
         conn.execute(
             text(
                 """
                 DELETE FROM judge_official_link
-                WHERE judge_id = :jid
+                WHERE judge_id = ANY(:jids)
                   AND status = 'outside_directory'
                 """
             ),
-            {"jid": judge_id},
+            {"jids": [int(jid) for jid, _ in links]},
         )
         conn.execute(
             text(
@@ -498,8 +697,12 @@ def upsert_isu_link(
                     updated_at = EXCLUDED.updated_at
                 """
             ),
-            {"jid": judge_id, "ioid": isu_official_id, "note": note, "ts": now},
+            [
+                {"jid": int(jid), "ioid": int(ioid), "note": note, "ts": now}
+                for jid, ioid in links
+            ],
         )
+    return len(links)
 
 
 def auto_link_isu_by_score(
@@ -512,25 +715,13 @@ def auto_link_isu_by_score(
 ) -> tuple[int, int]:
     """
     For judges still needing a link, if top ISU fuzzy match >= min_score, write ISU link.
-    Skips judges that already have a US linked official.
+    Skips judges that already have a US linked official. Bulk-scored and written in one
+    transaction like ``auto_link_by_score``.
     """
-    linked = 0
-    skipped = 0
-    norm = normalized_isu_officials or normalize_name_choices(isu_officials)
     with engine.connect() as conn:
         judges = fetch_judges_needing_link(conn, limit=limit_judges)
-    for j in judges:
-        matches = suggest_matches(
-            j["name"],
-            isu_officials,
-            top=1,
-            min_score=min_score,
-            normalized_choices=norm,
-        )
-        if not matches:
-            skipped += 1
-            continue
-        ioid, _score, _ = matches[0]
-        upsert_isu_link(engine, int(j["id"]), ioid, note=None)
-        linked += 1
-    return linked, skipped
+    matcher = FuzzyNameMatcher(isu_officials, normalized_isu_officials)
+    ids = matcher.confident_ids([j["name"] for j in judges], min_score=min_score)
+    links = [(int(j["id"]), ioid) for j, ioid in zip(judges, ids) if ioid is not None]
+    linked = upsert_isu_links(engine, links)
+    return linked, len(judges) - linked
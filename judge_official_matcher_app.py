@@ -100,15 +100,17 @@ def _build_review_table(
     us_normalized: dict[int, str] | None = None,
     isu_normalized: dict[int, str] | None = None,
 ) -> pd.DataFrame:
-    us_norm = us_normalized or core.normalize_name_choices(labels)
-    isu_norm = isu_normalized or core.normalize_name_choices(isu_labels)
+    names = [j.get("name") or "" for j in judges]
+    # Full (unblocked) matrices so low-score suggestions still show up for review.
+    us_best_all = core.FuzzyNameMatcher(labels, us_normalized).best_matches(
+        names, top=1, use_blocking=False
+    )
+    isu_best_all = core.FuzzyNameMatcher(isu_labels, isu_normalized).best_matches(
+        names, top=1, use_blocking=False
+    )
     rows_out: list[dict] = []
-    for j in judges:
+    for j, name, best, isu_best in zip(judges, names, us_best_all, isu_best_all):
         jid = int(j["id"])
-        name = j.get("name") or ""
-        best = core.suggest_matches(
-            name, labels, top=1, min_score=0.0, normalized_choices=us_norm
-        )
         if best:
             oid, sc, lbl = best[0]
             official_id: int | None = int(oid)
@@ -121,9 +123,6 @@ def _build_review_table(
             us_directory_name = ""
             us_directory_official = ""
 
-        isu_best = core.suggest_matches(
-            name, isu_labels, top=1, min_score=0.0, normalized_choices=isu_norm
-        )
         if isu_best:
             ioid, isu_sc, isu_lbl = isu_best[0]
             isu_official_id: int | None = int(ioid)
@@ -184,14 +183,13 @@ def _build_outside_bulk_table(
     us_normalized: dict[int, str] | None = None,
 ) -> pd.DataFrame:
     """Checkboxes + minimal columns for bulk ``outside_directory`` marking."""
-    us_norm = us_normalized or core.normalize_name_choices(labels)
+    names = [j.get("name") or "" for j in judges]
+    best_all = core.FuzzyNameMatcher(labels, us_normalized).best_matches(
+        names, top=1, use_blocking=False
+    )
     rows_out: list[dict] = []
-    for j in judges:
+    for j, name, best in zip(judges, names, best_all):
         jid = int(j["id"])
-        name = j.get("name") or ""
-        best = core.suggest_matches(
-            name, labels, top=1, min_score=0.0, normalized_choices=us_norm
-        )
         if best:
             _oid, sc, lbl = best[0]
             score = round(float(sc), 1)
@@ -0,0 +1,141 @@
+"""
+Judge-sorted columnar layout for cached mark shards, with a judge_id → row-range index.
+
+Used by ``element_ranking_cache`` and ``pcs_deviation_cache``. A shard's marks are sorted
+by ``judge_id`` and every column is stored as one contiguous fixed-width buffer in
+``marks_payload`` (text columns as category codes). The small ``judge_index`` header
+records each column's dtype and byte offset plus, per judge, the first row and row count.
+
+A full shard load is one ``np.frombuffer`` per column. A judge drill-down reads the header
+and then only that judge's byte ranges (``substr`` on the payload column), so its cost
+depends on the judge's mark count, not on the shard size.
+
+Rows written before the index existed keep a pickled DataFrame and ``judge_index`` NULL;
+callers fall back to their previous load for those.
+"""
+
+from __future__ import annotations
+
+import pickle
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+# Identity columns are re-attached from ``judge_id`` on every load; not stored.
+_UNSTORED_COLUMNS = frozenset({"judge_name", "judge_ids"})
+_INDEX_VERSION = 1
+
+
+def encode_judge_sorted_marks(marks: pd.DataFrame) -> tuple[bytes, bytes]:
+    """``(marks_payload, judge_index)`` for one shard's marks (requires ``judge_id``)."""
+    columns = [c for c in marks.columns if c not in _UNSTORED_COLUMNS]
+    df = marks[columns].sort_values("judge_id", kind="stable")
+    judge_ids = df["judge_id"].to_numpy(dtype=np.int64)
+    uniq, starts, counts = np.unique(judge_ids, return_index=True, return_counts=True)
+
+    buffers: list[bytes] = []
+    layout: list[tuple[str, str, int, list | None]] = []
+    offset = 0
+    for col in columns:
+        values = df[col]
+        categories = None
+        if values.dtype == object or isinstance(values.dtype, pd.CategoricalDtype):
+            cat = pd.Categorical(values)
+            categories = list(cat.categories)
+            arr = np.ascontiguousarray(cat.codes, dtype=np.int32)
+        else:
+            arr = np.ascontiguousarray(values.to_numpy())
+        layout.append((col, arr.dtype.str, offset, categories))
+        buffers.append(arr.tobytes())
+        offset += arr.nbytes
+
+    index = {
+        "version": _INDEX_VERSION,
+        "n_rows": len(df),
+        "columns": layout,
+        "judge_ids": uniq,
+        "starts": starts.astype(np.int64),
+        "counts": counts.astype(np.int64),
+    }
+    return b"".join(buffers), pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _column(values: np.ndarray, categories: list | None) -> Any:
+    if categories is None:
+        return values
+    return pd.Categorical.from_codes(values, categories=categories).astype(object)
+
+
+def decode_judge_sorted_marks(payload: bytes, judge_index: bytes) -> pd.DataFrame:
+    """Full shard DataFrame from ``encode_judge_sorted_marks`` output."""
+    index = pickle.loads(judge_index)
+    buf = bytearray(payload)
+    n = int(index["n_rows"])
+    data = {}
+    for col, dtype, offset, categories in index["columns"]:
+        values = np.frombuffer(buf, dtype=np.dtype(dtype), count=n, offset=offset)
+        data[col] = _column(values, categories)
+    return pd.DataFrame(data)
+
+
+def _judge_row_ranges(index: dict, judge_ids: Iterable[int]) -> list[tuple[int, int]]:
+    ids = index["judge_ids"]
+    out = []
+    for jid in sorted({int(j) for j in judge_ids}):
+        pos = int(np.searchsorted(ids, jid))
+        if pos < len(ids) and int(ids[pos]) == jid:
+            out.append((int(index["starts"][pos]), int(index["counts"][pos])))
+    return out
+
+
+def load_judge_slices(
+    session: Session,
+    model: type,
+    shard_keys: list[str],
+    judge_ids: Iterable[int],
+) -> list[pd.DataFrame] | None:
+    """
+    ``judge_ids``' marks from every shard in ``shard_keys`` via the judge index.
+
+    One query for the index headers, then one ``substr`` query per shard that holds the
+    judges. ``None`` when a shard is missing or was stored without an index.
+    """
+    judge_ids = {int(j) for j in judge_ids}
+    if not shard_keys or not judge_ids:
+        return []
+    headers = dict(
+        session.execute(
+            select(model.shard_key, model.judge_index).where(
+                model.shard_key.in_(shard_keys)
+            )
+        ).all()
+    )
+    if len(headers) != len(set(shard_keys)) or any(h is None for h in headers.values()):
+        return None
+
+    parts: list[pd.DataFrame] = []
+    for key in shard_keys:
+        index = pickle.loads(headers[key])
+        ranges = _judge_row_ranges(index, judge_ids)
+        if not ranges:
+            continue
+        exprs = []
+        for _col, dtype, offset, _cats in index["columns"]:
+            size = np.dtype(dtype).itemsize
+            exprs.extend(
+                # substr is 1-based on both PostgreSQL (bytea) and SQLite (blob).
+                func.substr(model.marks_payload, offset + start * size + 1, count * size)
+                for start, count in ranges
+            )
+        chunks = session.execute(select(*exprs).where(model.shard_key == key)).one()
+        data = {}
+        pos = 0
+        for col, dtype, _offset, categories in index["columns"]:
+            blob = b"".join(bytes(chunks[pos + i]) for i in range(len(ranges)))
+            pos += len(ranges)
+            data[col] = _column(np.frombuffer(blob, dtype=np.dtype(dtype)).copy(), categories)
+        parts.append(pd.DataFrame(data))
+    return parts
@@ -86,11 +86,14 @@ class Judge(Base):
     __tablename__ = 'judge'
     __table_args__ = (
         PrimaryKeyConstraint('id', name='judge_pkey'),
+        Index('idx_judge_match_key', 'match_key'),
     )
 
     id: Mapped[int] = mapped_column(Integer, Identity(always=True, start=1, increment=1, minvalue=1, maxvalue=2147483647, cycle=False, cache=1), primary_key=True)
     name: Mapped[str] = mapped_column(String)
     location: Mapped[Optional[str]] = mapped_column(String)
+    # ``database_loader.judge_person_match_key(name)``; migration 014.
+    match_key: Mapped[Optional[str]] = mapped_column(Text)
 
     judge_excess_anomalies_cache: Mapped[List['JudgeExcessAnomaliesCache']] = relationship('JudgeExcessAnomaliesCache', back_populates='judge')
     pcs_score_per_judge: Mapped[List['PcsScorePerJudge']] = relationship('PcsScorePerJudge', back_populates='judge')
@@ -164,6 +167,8 @@ class CrossJudgeCompetitionShard(Base):
     pcs_sum_abs_deviation: Mapped[float] = mapped_column(
         Double, server_default=text("0")
     )
+    # Marks with a non-NULL deviation; NULL on rows built before migration 017.
+    pcs_deviation_count: Mapped[Optional[int]] = mapped_column(Integer)
     elem_total: Mapped[int] = mapped_column(Integer, server_default=text("0"))
     elem_throwouts: Mapped[int] = mapped_column(Integer, server_default=text("0"))
     elem_anomalies: Mapped[int] = mapped_column(Integer, server_default=text("0"))
@@ -174,11 +179,66 @@ class CrossJudgeCompetitionShard(Base):
     elem_sum_abs_deviation: Mapped[float] = mapped_column(
         Double, server_default=text("0")
     )
+    elem_deviation_count: Mapped[Optional[int]] = mapped_column(Integer)
     computed_at: Mapped[Optional[datetime.datetime]] = mapped_column(
         DateTime(timezone=True), server_default=text("now()")
     )
 
 
+class CacheRebuildJob(Base):
+    """Durable "competition changed" event; drained by ``cache_rebuild_queue`` workers."""
+
+    __tablename__ = "cache_rebuild_job"
+    __table_args__ = (
+        PrimaryKeyConstraint("id", name="cache_rebuild_job_pkey"),
+        # At most one queued job per competition: repeat loads coalesce into it.
+        Index(
+            "uq_cache_rebuild_job_queued_competition",
+            "competition_id",
+            unique=True,
+            postgresql_where=text("status = 'queued'"),
+            sqlite_where=text("status = 'queued'"),
+        ),
+        Index("idx_cache_rebuild_job_status_run_after", "status", "run_after"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    competition_id: Mapped[int] = mapped_column(Integer)
+    status: Mapped[str] = mapped_column(String(16), server_default=text("'queued'"))
+    events: Mapped[int] = mapped_column(Integer, server_default=text("1"))
+    attempts: Mapped[int] = mapped_column(Integer, server_default=text("0"))
+    reason: Mapped[Optional[str]] = mapped_column(Text)
+    last_error: Mapped[Optional[str]] = mapped_column(Text)
+    current_step: Mapped[Optional[str]] = mapped_column(String(32))
+    worker: Mapped[Optional[str]] = mapped_column(String(128))
+    enqueued_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True))
+    run_after: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True))
+    started_at: Mapped[Optional[datetime.datetime]] = mapped_column(
+        DateTime(timezone=True)
+    )
+    finished_at: Mapped[Optional[datetime.datetime]] = mapped_column(
+        DateTime(timezone=True)
+    )
+
+
+class RuleErrorBackfillSegment(Base):
+    """Per-segment completion state of a named rule-error backfill run (resume support)."""
+
+    __tablename__ = "rule_error_backfill_segment"
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "run_name", "segment_id", name="rule_error_backfill_segment_pkey"
+        ),
+    )
+
+    run_name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    segment_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    status: Mapped[str] = mapped_column(String(16))
+    detail: Mapped[Optional[str]] = mapped_column(Text)
+    rule_errors_flagged: Mapped[int] = mapped_column(Integer, server_default=text("0"))
+    finished_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True))
+
+
 class PcsQualityShardCache(Base):
     """Per-season, per-discipline PCS marks (assembled into quality analysis on read)."""
 
@@ -249,6 +309,8 @@ class ElementDeviationRankingShardSummaryCache(Base):
     floor_sigma: Mapped[float] = mapped_column(Numeric(8, 4))
     data_fingerprint: Mapped[str] = mapped_column(String(64))
     summary_payload: Mapped[bytes] = mapped_column(LargeBinary)
+    # Panel control table, stored apart so ranking reads skip it (drill-down only).
+    control_payload: Mapped[Optional[bytes]] = mapped_column(LargeBinary)
     n_marks: Mapped[Optional[int]] = mapped_column(Integer)
     computed_at: Mapped[Optional[datetime.datetime]] = mapped_column(
         DateTime(True), server_default=text("now()")
@@ -276,6 +338,8 @@ class ElementDeviationRankingShardCache(Base):
     event_end_iso: Mapped[Optional[str]] = mapped_column(String(10))
     data_fingerprint: Mapped[str] = mapped_column(String(64))
     marks_payload: Mapped[bytes] = mapped_column(LargeBinary)
+    # ``mark_shard_index`` header (NULL for legacy pickled payloads).
+    judge_index: Mapped[Optional[bytes]] = mapped_column(LargeBinary)
     n_marks: Mapped[Optional[int]] = mapped_column(Integer)
     computed_at: Mapped[Optional[datetime.datetime]] = mapped_column(
         DateTime(True), server_default=text("now()")
@@ -358,6 +422,8 @@ class PcsDeviationRankingShardCache(Base):
     event_end_iso: Mapped[Optional[str]] = mapped_column(String(10))
     data_fingerprint: Mapped[str] = mapped_column(String(64))
     marks_payload: Mapped[bytes] = mapped_column(LargeBinary)
+    # ``mark_shard_index`` header (NULL for legacy pickled payloads).
+    judge_index: Mapped[Optional[bytes]] = mapped_column(LargeBinary)
     n_marks: Mapped[Optional[int]] = mapped_column(Integer)
     computed_at: Mapped[Optional[datetime.datetime]] = mapped_column(
         DateTime(True), server_default=text("now()")
@@ -597,11 +663,14 @@ class Skater(Base):
     __tablename__ = 'skater'
     __table_args__ = (
         PrimaryKeyConstraint('id', name='skater_pkey'),
+        Index('idx_skater_match_key', 'match_key'),
     )
 
     id: Mapped[int] = mapped_column(Integer, Identity(always=True, start=1, increment=1, minvalue=1, maxvalue=2147483647, cycle=False, cache=1), primary_key=True)
     name: Mapped[str] = mapped_column(String)
     club: Mapped[Optional[str]] = mapped_column(String)
+    # ``database_loader._normalize_skater_name_key(name)``; migration 014.
+    match_key: Mapped[Optional[str]] = mapped_column(Text)
 
     skater_segment: Mapped[List['SkaterSegment']] = relationship('SkaterSegment', back_populates='skater')
 
@@ -795,6 +864,36 @@ class SkaterSegment(Base):
     pcs_score_per_judge: Mapped[List['PcsScorePerJudge']] = relationship('PcsScorePerJudge', back_populates='skater_segment')
 
 
+class SegmentRule411Eligibility(Base):
+    """ISU Rule 411(b) entry / member checks per segment, written when results load."""
+
+    __tablename__ = "segment_rule411_eligibility"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["segment_id"],
+            ["segment.id"],
+            ondelete="CASCADE",
+            name="segment_rule411_eligibility_segment_id_fkey",
+        ),
+        PrimaryKeyConstraint("segment_id", name="segment_rule411_eligibility_pkey"),
+    )
+
+    segment_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    entry_count: Mapped[int] = mapped_column(Integer)
+    distinct_noc_count: Mapped[int] = mapped_column(Integer)
+    nocs_parsed: Mapped[int] = mapped_column(Integer)
+    discipline_category: Mapped[str] = mapped_column(String(16))
+    min_entries: Mapped[Optional[int]] = mapped_column(Integer)
+    meets_entry_minimum: Mapped[bool] = mapped_column(Boolean)
+    meets_member_minimum: Mapped[Optional[bool]] = mapped_column(Boolean)
+    eligible: Mapped[bool] = mapped_column(Boolean)
+    status: Mapped[str] = mapped_column(String(16))
+    detail: Mapped[Optional[str]] = mapped_column(Text)
+    computed_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP")
+    )
+
+
 class Element(Base):
     __tablename__ = 'element'
     __table_args__ = (
@@ -104,6 +104,7 @@ section = st.radio(
         "International requirement rules",
         "ISU seminar attendance",
         "Merge judges",
+        "Cache rebuild queue",
     ],
     horizontal=True,
     key="admin_main_section",
@@ -123,5 +124,7 @@ elif section == "International requirement rules":
     adm.render_international_requirement_rules()
 elif section == "ISU seminar attendance":
     adm.render_isu_official_seminars()
+elif section == "Cache rebuild queue":
+    adm.render_cache_rebuild_queue()
 else:
     adm.render_merge_judges()
@@ -298,10 +298,77 @@ def compute_pcs_deviation_data_fingerprint(
         segment_levels=segment_levels,
     )
     mark_count, max_mark_id, comp_count = session.execute(stmt).one()
+    return _mark_count_fingerprint(mark_count, max_mark_id, comp_count)
+
+
+def _mark_count_fingerprint(mark_count, max_mark_id, comp_count) -> str:
     payload = f"{int(mark_count or 0)}:{int(max_mark_id or 0)}:{int(comp_count or 0)}"
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
+def compute_pcs_deviation_shard_fingerprints(
+    session: Session,
+    analytics: JudgeAnalytics,
+    *,
+    season_years: Iterable[str],
+    discipline_type_ids: Iterable[int],
+    event_start_date: date | None = None,
+    event_end_date: date | None = None,
+    competition_scope: str = COMPETITION_SCOPE_ALL,
+    segment_levels: Optional[Iterable[str]] = None,
+) -> dict[tuple[str, int], str]:
+    """
+    ``compute_pcs_deviation_data_fingerprint`` for every (season, discipline) pair in one
+    grouped query; pairs without marks get the same checksum as a per-shard call.
+    """
+    years = sorted({str(y) for y in season_years})
+    disc_ids = sorted({int(d) for d in discipline_type_ids})
+    if not years or not disc_ids:
+        return {}
+    seg_discipline_ids = _segment_discipline_ids(analytics, disc_ids, competition_scope)
+    counts: dict[tuple[str, int], tuple] = {}
+    if seg_discipline_ids:
+        stmt = (
+            select(
+                Competition.year,
+                Segment.discipline_type_id,
+                func.count(PcsScorePerJudge.id),
+                func.coalesce(func.max(PcsScorePerJudge.id), 0),
+                func.count(func.distinct(Segment.competition_id)),
+            )
+            .select_from(PcsScorePerJudge)
+            .join(SkaterSegment, PcsScorePerJudge.skater_segment_id == SkaterSegment.id)
+            .join(Segment, SkaterSegment.segment_id == Segment.id)
+            .join(Competition, Segment.competition_id == Competition.id)
+            .where(Competition.year.in_(years))
+        )
+        stmt = _apply_scope_filters(
+            stmt,
+            analytics,
+            seg_discipline_ids=seg_discipline_ids,
+            start_season_year=None,
+            end_season_year=None,
+            effective_start=_effective_start(event_start_date),
+            event_end_date=event_end_date,
+            competition_scope=competition_scope,
+            segment_levels=segment_levels,
+        ).group_by(Competition.year, Segment.discipline_type_id)
+        counts = {
+            (str(year), int(dt_id)): (n, max_id, n_comp)
+            for year, dt_id, n, max_id, n_comp in session.execute(stmt).all()
+        }
+    empty = hashlib.sha256(b"empty").hexdigest()
+    return {
+        (year, dt_id): (
+            _mark_count_fingerprint(*counts.get((year, dt_id), (0, 0, 0)))
+            if dt_id in seg_discipline_ids
+            else empty
+        )
+        for year in years
+        for dt_id in disc_ids
+    }
+
+
 def attach_judge_identities_with_map(
     df: pd.DataFrame, id_map: pd.DataFrame
 ) -> pd.DataFrame:
@@ -27,6 +27,8 @@ from analytics import JudgeAnalytics
 from database import ensure_orm_tables
 from element_deviation_ranking import (
     ELEMENT_RANKING_LEVEL_FILTER_ALL,
+    fold_mergeable_judge_summaries,
+    memory_efficient_mode,
     merge_mergeable_judge_summaries,
 )
 from models import (
@@ -54,6 +56,7 @@ from pcs_deviation_analysis import (
     compute_errors,
     compute_mergeable_judge_summary_pcs,
     compute_pcs_deviation_data_fingerprint,
+    compute_pcs_deviation_shard_fingerprints,
     discipline_ids_for_pcs_deviation,
     finish_pcs_deviation_rankings_from_marks,
     fit_sigma_params_from_marks,
@@ -70,6 +73,12 @@ from pcs_deviation_analysis import (
     unpack_pcs_deviation_run_params,
     uses_separate_benchmark_pool,
 )
+from mark_shard_index import (
+    decode_judge_sorted_marks,
+    encode_judge_sorted_marks,
+    load_judge_slices,
+)
+from ranking_shard_pool import iter_shard_results, resolve_ranking_shard_workers
 
 _log = logging.getLogger(__name__)
 
@@ -145,6 +154,38 @@ def _shard_fingerprint(
     )
 
 
+def _shard_fingerprints(
+    session: Session, analytics: JudgeAnalytics, shards: list[PcsDeviationShard]
+) -> dict[PcsDeviationShard, str]:
+    """``_shard_fingerprint`` for many shards: one grouped query per shared filter set."""
+    from pcs_deviation_analysis import segment_levels_for_ranking_preset
+
+    groups: dict[tuple, list[PcsDeviationShard]] = {}
+    for shard in shards:
+        key = (
+            shard.competition_scope,
+            shard.event_start_iso,
+            shard.event_end_iso,
+            shard.segment_level_preset,
+        )
+        groups.setdefault(key, []).append(shard)
+    out: dict[PcsDeviationShard, str] = {}
+    for (scope, start_iso, end_iso, preset), members in groups.items():
+        by_pair = compute_pcs_deviation_shard_fingerprints(
+            session,
+            analytics,
+            season_years=[s.season_year for s in members],
+            discipline_type_ids=[s.discipline_type_id for s in members],
+            event_start_date=date.fromisoformat(start_iso) if start_iso else None,
+            event_end_date=date.fromisoformat(end_iso) if end_iso else None,
+            competition_scope=scope,
+            segment_levels=segment_levels_for_ranking_preset(preset),
+        )
+        for shard in members:
+            out[shard] = by_pair[(shard.season_year, shard.discipline_type_id)]
+    return out
+
+
 def _benchmark_pool_fingerprint(
     session: Session, analytics: JudgeAnalytics, scope: dict[str, Any]
 ) -> str:
@@ -156,7 +197,7 @@ def _benchmark_pool_fingerprint(
         fp_scope = {k: v for k, v in scope.items() if k != "segment_level_preset"}
         fp_scope["segment_levels"] = segment_levels_for_ranking_preset(preset)
         return compute_pcs_deviation_data_fingerprint(session, analytics, **fp_scope)
-    parts = sorted(_shard_fingerprint(session, analytics, s) for s in shards)
+    parts = sorted(_shard_fingerprints(session, analytics, shards).values())
     return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:64]
 
 
@@ -216,7 +257,10 @@ def _load_shard_row(
             session.expunge(row)
             return None
     try:
-        df = pickle.loads(row.marks_payload)
+        if row.judge_index is not None:
+            df = decode_judge_sorted_marks(row.marks_payload, row.judge_index)
+        else:
+            df = pickle.loads(row.marks_payload)
     except Exception:
         session.expunge(row)
         return None
@@ -235,7 +279,7 @@ def _save_shard_row(
 ) -> None:
     _require_postgres(session.get_bind())
     key = shard_cache_key(shard)
-    payload = pickle.dumps(marks, protocol=pickle.HIGHEST_PROTOCOL)
+    payload, judge_index = encode_judge_sorted_marks(marks)
     fingerprint = data_fingerprint or _shard_fingerprint(session, analytics, shard)
     now = datetime.now(timezone.utc)
     row = {
@@ -247,6 +291,7 @@ def _save_shard_row(
         "event_end_iso": shard.event_end_iso,
         "data_fingerprint": fingerprint,
         "marks_payload": payload,
+        "judge_index": judge_index,
         "n_marks": len(marks),
         "computed_at": now,
     }
@@ -317,7 +362,12 @@ def collect_marks_for_run(
     segment_level_preset: str | None = None,
     cache_only: bool = False,
     persist_shards: bool = False,
+    workers: int = 1,
 ) -> pd.DataFrame | None:
+    """
+    Marks for every shard in scope, from the shard cache or the database (``None`` on a
+    ``cache_only`` miss). ``workers`` > 1 loads shards in a process pool.
+    """
     session = analytics.session
     if persist_shards or not cache_only:
         ensure_pcs_deviation_cache_tables(session)
@@ -334,39 +384,57 @@ def collect_marks_for_run(
     if not shards:
         return pd.DataFrame()
 
-    id_map = load_judge_identity_map(analytics)
-    parts: list[pd.DataFrame] = []
-    for shard in shards:
-        marks = _load_shard_row(
-            session,
-            analytics,
-            shard,
-            validate_fingerprint=not cache_only,
-            id_map=id_map,
-        )
+    shared = {
+        "cache_only": cache_only,
+        "persist_shards": persist_shards,
+        "id_map": load_judge_identity_map(analytics),
+    }
+    by_shard: dict[PcsDeviationShard, pd.DataFrame] = {}
+    for shard, marks in iter_shard_results(
+        session, analytics, shards, _load_shard_marks, shared, workers=workers
+    ):
         if marks is None:
-            if cache_only:
-                return None
-            marks = _load_marks_from_db(
-                session, analytics, shard, id_map=id_map
-            )
-            if persist_shards:
-                fingerprint = _shard_fingerprint(session, analytics, shard)
-                _save_shard_row(
-                    session,
-                    analytics,
-                    shard,
-                    marks,
-                    data_fingerprint=fingerprint,
-                )
-        if not marks.empty:
-            parts.append(marks)
+            return None
+        by_shard[shard] = marks
 
+    parts = [by_shard[s] for s in shards if not by_shard[s].empty]
     if not parts:
         return pd.DataFrame()
     return pd.concat(parts, ignore_index=True)
 
 
+def _load_shard_marks(
+    session: Session,
+    analytics: JudgeAnalytics,
+    shard: PcsDeviationShard,
+    shared: dict[str, Any],
+) -> pd.DataFrame | None:
+    """Shard marks from the shard cache, else the database (``None``: cache-only miss)."""
+    cache_only = shared["cache_only"]
+    id_map = shared["id_map"]
+    marks = _load_shard_row(
+        session,
+        analytics,
+        shard,
+        validate_fingerprint=not cache_only,
+        id_map=id_map,
+    )
+    if marks is None:
+        if cache_only:
+            return None
+        marks = _load_marks_from_db(session, analytics, shard, id_map=id_map)
+        if shared["persist_shards"]:
+            fingerprint = _shard_fingerprint(session, analytics, shard)
+            _save_shard_row(
+                session,
+                analytics,
+                shard,
+                marks,
+                data_fingerprint=fingerprint,
+            )
+    return marks
+
+
 def collect_marks_for_judge_detail(
     analytics: JudgeAnalytics,
     judge_ids: Iterable[int],
@@ -382,38 +450,51 @@ def collect_marks_for_judge_detail(
     """
     PCS marks for one identity.
 
-    Prefer a single judge-scoped SQL load (fast for drill-down). Fall back to cached
-    shards only when SQL returns no rows but shard pickles exist.
+    Prefer the judge's slice of each cached shard (judge index; cost independent of
+    shard size), then a single judge-scoped SQL load. Fall back to scanning cached
+    shards only when SQL returns no rows but legacy shard pickles exist.
     """
     judge_id_set = {int(j) for j in judge_ids}
     if not judge_id_set:
         return pd.DataFrame()
 
-    sql_df = load_pcs_deviation_marks(
+    session = analytics.session
+    shards = iter_pcs_deviation_shards(
         analytics,
         start_season_year=start_season_year,
         end_season_year=end_season_year,
-        event_start_date=event_start_date,
-        event_end_date=event_end_date,
         discipline_type_ids=discipline_type_ids,
         competition_scope=competition_scope,
+        event_start_date=event_start_date,
+        event_end_date=event_end_date,
         segment_level_preset=segment_level_preset,
-        judge_ids=judge_id_set,
     )
-    if not sql_df.empty:
-        return normalize_pcs_deviation_shard_marks(sql_df, analytics)
+    sliced = load_judge_slices(
+        session,
+        PcsDeviationRankingShardCache,
+        [shard_cache_key(s) for s in shards],
+        judge_id_set,
+    )
+    if shards and sliced is not None:
+        sliced = [p for p in sliced if not p.empty]
+        if not sliced:
+            return pd.DataFrame()
+        return _normalize_shard_marks(pd.concat(sliced, ignore_index=True), analytics)
 
-    session = analytics.session
-    shards = iter_pcs_deviation_shards(
+    sql_df = load_pcs_deviation_marks(
         analytics,
         start_season_year=start_season_year,
         end_season_year=end_season_year,
-        discipline_type_ids=discipline_type_ids,
-        competition_scope=competition_scope,
         event_start_date=event_start_date,
         event_end_date=event_end_date,
+        discipline_type_ids=discipline_type_ids,
+        competition_scope=competition_scope,
         segment_level_preset=segment_level_preset,
+        judge_ids=judge_id_set,
     )
+    if not sql_df.empty:
+        return normalize_pcs_deviation_shard_marks(sql_df, analytics)
+
     if not shards:
         return pd.DataFrame()
 
@@ -529,6 +610,7 @@ def get_or_fit_benchmark_sigma_params(
     cache_only: bool = False,
     persist_shards: bool = True,
     persist_sigma: bool = True,
+    workers: int = 1,
 ) -> tuple[dict, pd.DataFrame | None, bool] | None:
     rp = unpack_pcs_deviation_run_params(run_params)
     bench_scope = benchmark_scope_kwargs_from_run_params(run_params)
@@ -545,6 +627,7 @@ def get_or_fit_benchmark_sigma_params(
                 **bench_scope,
                 cache_only=cache_only,
                 persist_shards=persist_shards and not cache_only,
+                workers=workers,
             )
             if sigma_ref is None:
                 return None
@@ -558,6 +641,7 @@ def get_or_fit_benchmark_sigma_params(
         **bench_scope,
         cache_only=False,
         persist_shards=persist_shards,
+        workers=workers,
     )
     if bench_marks is None or bench_marks.empty:
         return {}, pd.DataFrame() if bench_marks is not None else None, False
@@ -576,27 +660,10 @@ def get_or_fit_benchmark_sigma_params(
     return params, sigma_ref, False
 
 
-def _parse_shard_summary_row(
-    session: Session,
-    analytics: JudgeAnalytics,
-    shard: PcsDeviationShard,
-    row: PcsDeviationRankingShardSummaryCache,
-    *,
-    floor_sigma: float,
-    validate_fingerprint: bool,
-) -> dict[str, Any] | None:
-    if float(row.floor_sigma) != float(floor_sigma):
-        session.expunge(row)
-        return None
-    if validate_fingerprint:
-        expected = _shard_fingerprint(session, analytics, shard)
-        if row.data_fingerprint != expected:
-            session.expunge(row)
-            return None
+def _summary_row_payload(row) -> dict[str, Any] | None:
     try:
         payload = pickle.loads(row.summary_payload)
     except Exception:
-        session.expunge(row)
         return None
     if not isinstance(payload, dict):
         return None
@@ -611,6 +678,10 @@ def load_shard_summary_payloads_for_scope(
     validate_fingerprint: bool = False,
     require_all: bool = True,
 ) -> list[tuple[PcsDeviationShard, dict[str, Any]]] | None:
+    """
+    Batch-load shard summary payloads for a ranking scope (one query);
+    ``validate_fingerprint`` checks every shard against one grouped fingerprint query.
+    """
     rank_scope = ranking_scope_kwargs_from_run_params(run_params)
     rp = unpack_pcs_deviation_run_params(run_params)
     floor_sigma = float(rp[7])
@@ -627,40 +698,37 @@ def load_shard_summary_payloads_for_scope(
         for shard in shards
     ]
     cache_keys = [ck for _, ck in shard_entries]
-    rows = (
-        session.execute(
-            select(PcsDeviationRankingShardSummaryCache).where(
-                PcsDeviationRankingShardSummaryCache.cache_key.in_(cache_keys)
-            )
-        )
-        .scalars()
-        .all()
+    table = PcsDeviationRankingShardSummaryCache
+    rows = session.execute(
+        select(
+            table.cache_key,
+            table.floor_sigma,
+            table.data_fingerprint,
+            table.summary_payload,
+        ).where(table.cache_key.in_(cache_keys))
+    ).all()
+    by_cache_key = {
+        row.cache_key: row for row in rows if float(row.floor_sigma) == floor_sigma
+    }
+    if require_all and len(by_cache_key) != len(shard_entries):
+        return None
+    expected = (
+        _shard_fingerprints(session, analytics, shards) if validate_fingerprint else {}
     )
-    by_cache_key = {row.cache_key: row for row in rows}
 
     out: list[tuple[PcsDeviationShard, dict[str, Any]]] = []
     for shard, ck in shard_entries:
         row = by_cache_key.get(ck)
-        if row is None:
-            if require_all:
-                return None
-            continue
-        payload = _parse_shard_summary_row(
-            session,
-            analytics,
-            shard,
-            row,
-            floor_sigma=floor_sigma,
-            validate_fingerprint=validate_fingerprint,
-        )
+        payload = None
+        if row is not None and (
+            not validate_fingerprint or row.data_fingerprint == expected[shard]
+        ):
+            payload = _summary_row_payload(row)
         if payload is None:
             if require_all:
                 return None
             continue
         out.append((shard, payload))
-
-    if require_all and len(out) != len(shard_entries):
-        return None
     return out
 
 
@@ -709,6 +777,66 @@ def _save_shard_summary_row(
         write_session.close()
 
 
+def _summarize_shard(
+    session: Session,
+    analytics: JudgeAnalytics,
+    shard: PcsDeviationShard,
+    shared: dict[str, Any],
+) -> dict[str, Any] | None:
+    """
+    Annotate one shard's marks with σ̂ and compute its mergeable judge summary
+    (saved to the summary cache when ``shared["persist_summaries"]``).
+
+    ``None`` when the shard has no marks (or no cached marks with ``cache_only_marks``).
+    """
+    marks = _load_shard_row(session, analytics, shard, id_map=shared["id_map"])
+    if marks is None:
+        if shared.get("cache_only_marks"):
+            return None
+        marks = _load_marks_from_db(session, analytics, shard)
+    if marks.empty:
+        return None
+    work = annotate_normalized_marks_for_sigma_model(
+        compute_errors(marks),
+        shared["params"],
+        sigma_model=shared["sigma_model"],
+        floor_sigma=shared["floor_sigma"],
+    )
+    mergeable = compute_mergeable_judge_summary_pcs(work)
+    if shared.get("persist_summaries"):
+        _save_shard_summary_row(
+            session,
+            analytics,
+            shard,
+            sigma_key=shared["sigma_key"],
+            floor_sigma=shared["floor_sigma"],
+            mergeable_summary=mergeable,
+            n_marks=len(marks),
+        )
+    return {"mergeable_summary": mergeable, "n_marks": len(marks)}
+
+
+def _summary_shared(
+    analytics: JudgeAnalytics,
+    run_params: tuple,
+    params: dict,
+    *,
+    floor_sigma: float,
+    persist_summaries: bool,
+    cache_only_marks: bool = False,
+) -> dict[str, Any]:
+    """Inputs every ``_summarize_shard`` call shares (shipped once per pool worker)."""
+    return {
+        "params": params,
+        "sigma_model": sigma_model_from_run_params(run_params),
+        "floor_sigma": float(floor_sigma),
+        "sigma_key": benchmark_sigma_cache_key(run_params),
+        "id_map": load_judge_identity_map(analytics),
+        "persist_summaries": persist_summaries,
+        "cache_only_marks": cache_only_marks,
+    }
+
+
 def _persist_shard_summaries_for_scope(
     session: Session,
     analytics: JudgeAnalytics,
@@ -719,45 +847,127 @@ def _persist_shard_summaries_for_scope(
     floor_sigma: float,
     cache_only_marks: bool = False,
     skip_unchanged: bool = False,
+    workers: int = 1,
 ) -> tuple[int, int]:
     if not params:
         return 0, 0
     ensure_pcs_deviation_cache_tables(session)
-    sigma_key = benchmark_sigma_cache_key(run_params)
-    id_map = load_judge_identity_map(analytics)
-    written = 0
-    skipped = 0
-    for shard in iter_pcs_deviation_shards(analytics, **rank_scope):
-        if skip_unchanged and _shard_summary_cache_is_fresh(
-            session, analytics, shard, run_params, floor_sigma=floor_sigma
-        ):
-            skipped += 1
-            continue
-        marks = _load_shard_row(session, analytics, shard, id_map=id_map)
-        if marks is None:
-            if cache_only_marks:
-                continue
-            marks = _load_marks_from_db(session, analytics, shard)
-        if marks.empty:
-            continue
-        work = annotate_normalized_marks_for_sigma_model(
-            compute_errors(marks),
-            params,
-            sigma_model=sigma_model_from_run_params(run_params),
-            floor_sigma=floor_sigma,
+    shards = iter_pcs_deviation_shards(analytics, **rank_scope)
+    todo = [
+        shard
+        for shard in shards
+        if not (
+            skip_unchanged
+            and _shard_summary_cache_is_fresh(
+                session, analytics, shard, run_params, floor_sigma=floor_sigma
+            )
         )
-        mergeable = compute_mergeable_judge_summary_pcs(work)
-        _save_shard_summary_row(
+    ]
+    shared = _summary_shared(
+        analytics,
+        run_params,
+        params,
+        floor_sigma=floor_sigma,
+        persist_summaries=True,
+        cache_only_marks=cache_only_marks,
+    )
+    written = sum(
+        1
+        for _shard, summary in iter_shard_results(
+            session, analytics, todo, _summarize_shard, shared, workers=workers
+        )
+        if summary is not None
+    )
+    return written, len(shards) - len(todo)
+
+
+def _rank_shards_in_pool(
+    session: Session,
+    analytics: JudgeAnalytics,
+    run_params: tuple,
+    rank_scope: dict[str, Any],
+    *,
+    floor_sigma: float,
+    min_bin_count: int,
+    persist_shards: bool,
+    workers: int,
+) -> dict[str, Any] | None:
+    """
+    Resolve σ̂, then summarize every ranking shard in a process pool and merge the
+    mergeable judge summaries as they complete. ``None`` when no σ̂ could be fitted
+    (the serial path reports the empty / error result).
+
+    Like a summary-cache result there are no judge detail frames, so the result keeps
+    ``_from_summary_cache`` and drill-downs load detail on demand.
+    """
+    sigma_ref: pd.DataFrame | None = None
+    if uses_separate_benchmark_pool(run_params):
+        sigma_out = get_or_fit_benchmark_sigma_params(
             session,
             analytics,
-            shard,
-            sigma_key=sigma_key,
-            floor_sigma=floor_sigma,
-            mergeable_summary=mergeable,
-            n_marks=len(marks),
+            run_params,
+            persist_shards=persist_shards,
+            persist_sigma=persist_shards,
+            workers=workers,
         )
-        written += 1
-    return written, skipped
+        if sigma_out is None:
+            return None
+        params, sigma_ref, _from_sigma_cache = sigma_out
+    else:
+        params = _load_sigma_cache_row(session, analytics, run_params)
+        if params is None:
+            ranking_marks = collect_marks_for_run(
+                analytics,
+                **rank_scope,
+                persist_shards=persist_shards,
+                workers=workers,
+            )
+            params = fit_sigma_params_from_marks(
+                ranking_marks,
+                min_bin_count=int(min_bin_count),
+                sigma_model=sigma_model_from_run_params(run_params),
+                floor_sigma=float(floor_sigma),
+            )
+            if persist_shards and params:
+                _save_sigma_cache_row(
+                    session, analytics, run_params, params, n_marks=len(ranking_marks)
+                )
+            sigma_ref = ranking_marks
+    if not params:
+        return None
+
+    shared = _summary_shared(
+        analytics,
+        run_params,
+        params,
+        floor_sigma=floor_sigma,
+        persist_summaries=persist_shards,
+    )
+    total: pd.DataFrame | None = None
+    n_raw = 0
+    for _shard, summary in iter_shard_results(
+        session,
+        analytics,
+        iter_pcs_deviation_shards(analytics, **rank_scope),
+        _summarize_shard,
+        shared,
+        workers=workers,
+    ):
+        if summary is None:
+            continue
+        total = fold_mergeable_judge_summaries(total, summary["mergeable_summary"])
+        n_raw += summary["n_marks"]
+
+    return _ranking_result_from_summaries(
+        analytics,
+        run_params,
+        params,
+        merge_mergeable_judge_summaries([total]),
+        n_raw,
+        floor_sigma=floor_sigma,
+        min_bin_count=min_bin_count,
+        sigma_reference_df=sigma_ref,
+    )
 
 
 def _empty_ranking_error(message: str) -> dict[str, Any]:
@@ -809,7 +1019,30 @@ def _try_assemble_ranking_from_shard_summaries(
         mergeable_parts.append(mergeable)
         n_raw += int(mergeable["n_marks"].sum()) if not mergeable.empty else 0
 
-    judge_summary_all = merge_mergeable_judge_summaries(mergeable_parts)
+    return _ranking_result_from_summaries(
+        analytics,
+        run_params,
+        params,
+        merge_mergeable_judge_summaries(mergeable_parts),
+        n_raw,
+        floor_sigma=floor_sigma,
+        min_bin_count=min_bin_count,
+        sigma_reference_df=sigma_reference_df,
+    )
+
+
+def _ranking_result_from_summaries(
+    analytics: JudgeAnalytics,
+    run_params: tuple,
+    params: dict,
+    judge_summary_all: pd.DataFrame,
+    n_raw: int,
+    *,
+    floor_sigma: float,
+    min_bin_count: int,
+    sigma_reference_df: pd.DataFrame | None,
+) -> dict[str, Any]:
+    """Ranking result from merged shard summaries (no per-judge detail frames)."""
     if judge_summary_all.empty:
         return _empty_ranking_error("No PCS score rows found for the selected filters.")
 
@@ -870,6 +1103,7 @@ def run_pcs_deviation_ranking_pipeline(
     min_marks: int = 0,
     floor_sigma: float,
     min_bin_count: int,
+    include_judge_detail: bool | None = None,
     segment_level_preset: str | None = None,
     benchmark_start_season_year: str | None = None,
     benchmark_end_season_year: str | None = None,
@@ -878,7 +1112,16 @@ def run_pcs_deviation_ranking_pipeline(
     sigma_model: str = PCS_SIGMA_MODEL_DISCRETE,
     cache_only: bool = False,
     persist_shards: bool = True,
+    workers: int | None = None,
 ) -> dict[str, Any]:
+    """
+    PCS deviation ranking for a scope; σ̂ from the benchmark pool (cached when possible).
+
+    ``workers`` > 1 (``None``: ``RANKING_SHARD_WORKERS``; ``0``: all cores) loads shards
+    in a process pool. Without judge detail (``include_judge_detail=False``, or low-memory
+    mode) the workers also summarize their shards and the merged result has the same
+    shape as one assembled from the summary cache; with detail, marks are ranked here.
+    """
     bench_levels = (
         segment_level_preset
         if benchmark_segment_level_preset is _BENCHMARK_SEGMENT_LEVEL_UNSET
@@ -946,11 +1189,32 @@ def run_pcs_deviation_ranking_pipeline(
                     summary_result, int(min_marks)
                 )
 
+    n_workers = resolve_ranking_shard_workers(workers)
+    want_detail = (
+        include_judge_detail
+        if include_judge_detail is not None
+        else not memory_efficient_mode()
+    )
+    if n_workers > 1 and not cache_only and not want_detail:
+        pooled = _rank_shards_in_pool(
+            session,
+            analytics,
+            run_params,
+            rank_scope,
+            floor_sigma=floor_sigma,
+            min_bin_count=min_bin_count,
+            persist_shards=persist_shards,
+            workers=n_workers,
+        )
+        if pooled is not None:
+            return apply_min_marks_to_pcs_deviation_result(pooled, int(min_marks))
+
     ranking_marks = collect_marks_for_run(
         analytics,
         **rank_scope,
         cache_only=cache_only,
         persist_shards=persist_shards and not cache_only,
+        workers=n_workers,
     )
     if ranking_marks is None:
         return _empty_ranking_error("Missing or stale shard cache for ranking scope.")
@@ -964,6 +1228,7 @@ def run_pcs_deviation_ranking_pipeline(
             cache_only=cache_only,
             persist_shards=persist_shards,
             persist_sigma=persist_shards,
+            workers=n_workers,
         )
         if sigma_out is None:
             return _empty_ranking_error(
@@ -1227,7 +1492,13 @@ def precompute_pcs_deviation_shard_summaries(
     rank_scope: dict[str, Any] | None = None,
     summaries_only: bool = False,
     skip_unchanged: bool = False,
+    workers: int = 1,
 ) -> tuple[int, int]:
+    """
+    Warm per-shard judge summary rows for a benchmark σ̂ fit; ``(written, skipped)``.
+
+    ``workers`` > 1 summarizes shards in a process pool (see ``ranking_shard_pool``).
+    """
     sigma_out = get_or_fit_benchmark_sigma_params(
         session,
         analytics,
@@ -1252,6 +1523,7 @@ def precompute_pcs_deviation_shard_summaries(
         floor_sigma=float(rp[7]),
         cache_only_marks=summaries_only,
         skip_unchanged=skip_unchanged,
+        workers=workers,
     )
 
 
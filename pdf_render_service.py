@@ -0,0 +1,284 @@
+"""
+Shared headless-Chromium PDF renderer for classic IJS PDF-mode scrapes.
+
+One background thread owns an asyncio loop and a pyppeteer browser with a small pool of
+warm tabs. ``render()`` is thread-safe, so several ``scrape()`` calls (or batch loaders
+running many competitions) share the browser instead of launching Chromium each time.
+Each job has a timeout; a tab that times out or errors is replaced, and the browser is
+relaunched after ``recycle_after`` pages to bound Chromium memory growth.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import threading
+from typing import Any, Awaitable, Callable
+
+_LOG = logging.getLogger("ijs.scrape")
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_RECYCLE_AFTER = 200
+DEFAULT_JOB_TIMEOUT_S = 120.0
+# Navigation timeout handed to pyppeteer; the job timeout above also covers ``page.pdf``.
+_GOTO_TIMEOUT_MS = 90_000
+
+_LAUNCH_OPTIONS = {
+    "autoClose": False,
+    "handleSIGINT": False,
+    "handleSIGTERM": False,
+    "handleSIGHUP": False,
+}
+
+
+async def _launch_chromium() -> Any:
+    from pyppeteer import launch
+
+    return await launch(dict(_LAUNCH_OPTIONS))
+
+
+class PdfRenderService:
+    """
+    Pool of ``pool_size`` warm pyppeteer pages behind a thread-safe ``render(url)``.
+
+    ``launcher`` is an async callable returning a browser (``newPage()`` / ``close()``);
+    tests pass a fake. The browser starts lazily on the first job.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        recycle_after: int = DEFAULT_RECYCLE_AFTER,
+        job_timeout: float = DEFAULT_JOB_TIMEOUT_S,
+        launcher: Callable[[], Awaitable[Any]] = _launch_chromium,
+    ):
+        if pool_size < 1:
+            raise ValueError("pool_size must be >= 1")
+        self.pool_size = int(pool_size)
+        self.recycle_after = max(1, int(recycle_after))
+        self.job_timeout = float(job_timeout)
+        self._launcher = launcher
+
+        self._thread_lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+        # Loop-side state (only touched from the service thread).
+        self._browser = None
+        self._pages: asyncio.Queue | None = None
+        self._ready: asyncio.Event | None = None
+        self._start_lock: asyncio.Lock | None = None
+        self._rendered_since_launch = 0
+        self._recycling = False
+
+        self.browsers_launched = 0
+        self.pages_rendered = 0
+
+    # ── thread / loop lifecycle ────────────────────────────────────────────
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._thread_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def _run():
+                    asyncio.set_event_loop(loop)
+                    ready.set()
+                    loop.run_forever()
+
+                thread = threading.Thread(
+                    target=_run, name="pdf-render-service", daemon=True
+                )
+                thread.start()
+                ready.wait()
+                self._loop = loop
+                self._thread = thread
+            return self._loop
+
+    def close(self) -> None:
+        """Close the browser and stop the service thread (safe to call twice)."""
+        with self._thread_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=30)
+        except Exception as exc:
+            _LOG.debug("PDF render service shutdown: %s", exc)
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=10)
+        loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # ── public API ─────────────────────────────────────────────────────────
+
+    def render(self, url: str, *, timeout: float | None = None) -> bytes:
+        """Render ``url`` to A4 PDF bytes; raises ``TimeoutError`` past the job timeout."""
+        loop = self._ensure_loop()
+        job_timeout = self.job_timeout if timeout is None else float(timeout)
+        fut = asyncio.run_coroutine_threadsafe(self._render(url, job_timeout), loop)
+        # Waiting for a free tab is not part of the job timeout, so no outer limit here.
+        return fut.result()
+
+    def render_to_path(self, url: str, pdf_path: str, use_gcp: bool = False) -> None:
+        """Render ``url`` and write it locally or to GCS (same as ``generate_pdf``)."""
+        write_pdf_bytes(self.render(url), pdf_path, use_gcp=use_gcp)
+
+    # ── loop-side implementation ───────────────────────────────────────────
+
+    async def _ensure_started(self) -> None:
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+            self._ready = asyncio.Event()
+        async with self._start_lock:
+            # Mid-recycle ``_browser`` is briefly None; ``_recycle`` owns the relaunch.
+            if self._browser is None and not self._recycling:
+                await self._launch_with_pages()
+                self._ready.set()
+
+    async def _launch_with_pages(self) -> None:
+        browser = await self._launcher()
+        self.browsers_launched += 1
+        pages = []
+        try:
+            for _ in range(self.pool_size):
+                pages.append(await browser.newPage())
+        except BaseException:
+            # A short pool would block later jobs forever; drop the browser and let the
+            # next job launch a fresh one.
+            for page in pages:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+            try:
+                await browser.close()
+            except Exception as exc:
+                _LOG.debug("PDF render browser close: %s", exc)
+            self._browser = None
+            raise
+        self._browser = browser
+        self._rendered_since_launch = 0
+        self._pages = asyncio.Queue()
+        for page in pages:
+            self._pages.put_nowait(page)
+
+    async def _render(self, url: str, timeout: float) -> bytes:
+        while True:
+            # Jobs arriving mid-recycle wait here until the relaunched browser is ready.
+            await self._ensure_started()
+            await self._ready.wait()
+            # A failed relaunch leaves no browser; the next pass launches a new one.
+            if self._browser is None:
+                continue
+            pages = self._pages
+            page = await pages.get()
+            if not self._recycling:
+                break
+            # Recycle started while we queued for a tab: hand it to the drain. ``_ready``
+            # is clear for the whole recycle, so the next pass blocks instead of spinning.
+            pages.put_nowait(page)
+        healthy = False
+        try:
+            data = await asyncio.wait_for(self._page_to_pdf(page, url), timeout)
+            healthy = True
+            return data
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"PDF render exceeded {timeout:.0f}s: {url}") from None
+        finally:
+            await self._release(pages, page, healthy)
+
+    @staticmethod
+    async def _page_to_pdf(page, url: str) -> bytes:
+        # domcontentloaded is enough for a PDF snapshot of the protocol pages.
+        await page.goto(
+            url, {"waitUntil": "domcontentloaded", "timeout": _GOTO_TIMEOUT_MS}
+        )
+        return await page.pdf({"format": "A4"})
+
+    async def _release(self, pages: asyncio.Queue, page, healthy: bool) -> None:
+        self.pages_rendered += 1
+        self._rendered_since_launch += 1
+        if not healthy:
+            # A tab stuck mid-navigation is not safe to reuse.
+            try:
+                await page.close()
+            except Exception:
+                pass
+            try:
+                page = await self._browser.newPage()
+            except Exception as exc:
+                _LOG.warning("PDF render tab replacement failed (%s); relaunching browser", exc)
+                self._rendered_since_launch = self.recycle_after
+        pages.put_nowait(page)
+        if self._rendered_since_launch >= self.recycle_after and not self._recycling:
+            self._start_recycle()
+
+    def _start_recycle(self) -> None:
+        # Both flags flip before any await so no job sees ``_recycling`` with ``_ready`` set.
+        self._recycling = True
+        self._ready.clear()
+        asyncio.ensure_future(self._recycle())
+
+    async def _drain_and_close(self) -> None:
+        # Wait for in-flight jobs to hand back every tab before closing the browser.
+        for _ in range(self.pool_size):
+            await self._pages.get()
+        try:
+            await self._browser.close()
+        except Exception as exc:
+            _LOG.debug("PDF render browser close: %s", exc)
+        self._browser = None
+
+    async def _recycle(self) -> None:
+        try:
+            await self._drain_and_close()
+            await self._launch_with_pages()
+        except Exception as exc:
+            _LOG.error("PDF render browser relaunch failed: %s", exc)
+            self._browser = None
+        finally:
+            self._recycling = False
+            self._ready.set()
+
+    async def _shutdown(self) -> None:
+        if self._recycling:
+            await self._ready.wait()
+        if self._browser is None or self._pages is None:
+            return
+        await self._drain_and_close()
+
+
+def write_pdf_bytes(pdf_data: bytes, pdf_path: str, use_gcp: bool = False) -> None:
+    if use_gcp:
+        from gcp_interactions_helper import write_file_to_gcp
+
+        write_file_to_gcp(pdf_data, pdf_path)
+    else:
+        with open(pdf_path, "wb") as f:
+            f.write(pdf_data)
+
+
+_shared_service: PdfRenderService | None = None
+_shared_lock = threading.Lock()
+
+
+def get_pdf_render_service() -> PdfRenderService:
+    """Process-wide service reused by every PDF-mode ``scrape()``; closed at exit."""
+    global _shared_service
+    with _shared_lock:
+        if _shared_service is None:
+            _shared_service = PdfRenderService()
+            atexit.register(_shared_service.close)
+        return _shared_service
@@ -0,0 +1,121 @@
+"""
+Fan ranking shards (season × discipline) out to worker processes.
+
+Used by ``element_ranking_cache`` and ``pcs_deviation_cache``: mark loading and, once σ̂
+is known, per-shard annotation + mergeable judge summaries are independent per shard.
+Each worker opens its own ``database`` session on the parent's URL and receives the shared
+inputs (σ̂ params, run params, judge identity map) once when it starts, not per task.
+Results are yielded as they complete so callers can merge summaries incrementally.
+
+Worker processes are spawned, not forked (the Streamlit server is multithreaded).
+"""
+
+from __future__ import annotations
+
+import importlib
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Iterator, Sequence, TypeVar
+
+from sqlalchemy.orm import Session
+
+ShardT = TypeVar("ShardT")
+
+# ``None`` passed to the pipelines → this env var, else serial (1). ``0`` → all cores.
+RANKING_SHARD_WORKERS_ENV = "RANKING_SHARD_WORKERS"
+# Parent-side cap on queued + running shards, per worker.
+_IN_FLIGHT_PER_WORKER = 2
+
+# Worker-process state set by ``_init_worker``.
+_WORKER: dict[str, Any] | None = None
+
+
+def resolve_ranking_shard_workers(workers: int | None) -> int:
+    """``workers`` (``0`` = CPU count), else ``RANKING_SHARD_WORKERS``, else 1."""
+    if workers is None:
+        raw = os.environ.get(RANKING_SHARD_WORKERS_ENV, "").strip()
+        try:
+            workers = int(raw) if raw else 1
+        except ValueError:
+            workers = 1
+    if int(workers) <= 0:
+        return max(1, os.cpu_count() or 1)
+    return int(workers)
+
+
+def _bind_url(session: Session) -> str:
+    return session.get_bind().url.render_as_string(hide_password=False)
+
+
+def _init_worker(database_url: str, module_name: str, shared: dict[str, Any]) -> None:
+    global _WORKER
+    from analytics import JudgeAnalytics
+    from database import bind_database_url, get_db_session
+
+    # The parent's resolved URL, with the app's engine settings (pool, recycle, timeout).
+    os.environ["DATABASE_URL"] = database_url
+    bind_database_url(database_url, "ranking shard pool parent")
+    session = get_db_session()
+    _WORKER = {
+        "module": importlib.import_module(module_name),
+        "session": session,
+        "analytics": JudgeAnalytics(session),
+        "shared": shared,
+    }
+
+
+def _run_in_worker(func_name: str, shard):
+    assert _WORKER is not None, "worker not initialized"
+    session = _WORKER["session"]
+    try:
+        func = getattr(_WORKER["module"], func_name)
+        return shard, func(session, _WORKER["analytics"], shard, _WORKER["shared"])
+    finally:
+        # End the read transaction so a long-lived worker does not pin a snapshot.
+        session.rollback()
+
+
+def iter_shard_results(
+    session: Session,
+    analytics,
+    shards: Sequence[ShardT],
+    func: Callable[..., Any],
+    shared: dict[str, Any],
+    *,
+    workers: int,
+) -> Iterator[tuple[ShardT, Any]]:
+    """
+    Yield ``(shard, func(session, analytics, shard, shared))`` for every shard.
+
+    ``func`` must be a module-level function. With ``workers`` > 1 shards run in a
+    spawned process pool (in completion order); otherwise in this process, in order.
+    """
+    n_workers = min(max(1, int(workers)), len(shards))
+    if n_workers <= 1:
+        for shard in shards:
+            yield shard, func(session, analytics, shard, shared)
+        return
+
+    pool = ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(_bind_url(session), func.__module__, shared),
+    )
+    try:
+        pending = set()
+        for shard in shards:
+            pending.add(pool.submit(_run_in_worker, func.__name__, shard))
+            if len(pending) >= n_workers * _IN_FLIGHT_PER_WORKER:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    yield fut.result()
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                yield fut.result()
+    except BaseException:
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown(wait=True)
@@ -0,0 +1,241 @@
+"""
+Re-apply element GOE-range and PCS fall-cap rule errors from stored marks (no protocols).
+
+Everything the rules need is already loaded: ``element.name`` / ``element.notes``, each
+judge's GOE in ``element_score_per_judge`` and PCS in ``pcs_score_per_judge``, and the
+competition dates / season code. After a change in ``rule_errors_policy``,
+``judgingParsing.compute_element_max_goe`` or ``pcs_fall_rule_errors``, this module
+re-evaluates a batch of segments with a handful of bulk reads, computes the rules once
+per distinct element marking / note / fall count, and writes only the ``is_rule_error``
+flags that change.
+
+Segments without any stored protocol metadata (no ``notes`` and no ``max_goe_allowed``
+on any element) were loaded before info codes were persisted; they are left untouched,
+since only a protocol re-fetch (``scripts/backfill_element_rule_errors.py``) can
+recover their falls and edge calls.
+
+    python scripts/recompute_rule_errors.py --dry-run
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import select, update
+
+from judgingParsing import compute_element_max_goe
+from models import (
+    Competition,
+    Element,
+    ElementScorePerJudge,
+    PcsScorePerJudge,
+    Segment,
+    SkaterSegment,
+)
+from pcs_fall_rule_errors import falls_from_element_notes, max_pcs_for_fall_count
+from rule_errors_policy import (
+    PCS_FALL_RULE_DISCIPLINE_TYPE_IDS,
+    segment_supports_element_rule_errors,
+    segment_supports_pcs_fall_rule_errors,
+    should_flag_pcs_fall_rule_errors,
+    should_flag_rule_errors,
+)
+
+_UPDATE_CHUNK = 5000
+
+RECOMPUTE_COUNT_KEYS = (
+    "segments",
+    "skipped_no_metadata",
+    "element_rule_errors",
+    "element_flags_set",
+    "element_flags_cleared",
+    "pcs_rule_errors",
+    "pcs_flags_set",
+    "pcs_flags_cleared",
+)
+
+
+def _frame(session, stmt, columns: list[str]) -> pd.DataFrame:
+    return pd.DataFrame.from_records(session.execute(stmt).all(), columns=columns)
+
+
+def _segment_policy_frame(session, segment_ids: list[int]) -> pd.DataFrame:
+    """One row per segment: whether element / PCS fall rules apply."""
+    seg = _frame(
+        session,
+        select(
+            Segment.id,
+            Segment.name,
+            Segment.discipline_type_id,
+            Competition.start_date,
+            Competition.end_date,
+            Competition.year,
+        )
+        .join(Competition, Competition.id == Segment.competition_id)
+        .where(Segment.id.in_(segment_ids)),
+        ["segment_id", "segment_name", "discipline_type_id", "start_date", "end_date", "year"],
+    )
+    names = seg["segment_name"].fillna("").astype(str)
+    seg["element_rules"] = [
+        should_flag_rule_errors(start, end) and segment_supports_element_rule_errors(name)
+        for start, end, name in zip(seg["start_date"], seg["end_date"], names)
+    ]
+    seg["pcs_rules"] = [
+        should_flag_pcs_fall_rule_errors(year, start, end)
+        and (
+            (pd.notna(dt_id) and int(dt_id) in PCS_FALL_RULE_DISCIPLINE_TYPE_IDS)
+            or segment_supports_pcs_fall_rule_errors(name)
+        )
+        for year, start, end, dt_id, name in zip(
+            seg["year"], seg["start_date"], seg["end_date"], seg["discipline_type_id"], names
+        )
+    ]
+    seg["segment_name"] = names
+    return seg[["segment_id", "segment_name", "element_rules", "pcs_rules"]]
+
+
+def _element_max_goe(elements: pd.DataFrame) -> pd.Series:
+    """``compute_element_max_goe`` once per distinct (element name, notes, segment name)."""
+    keys = list(
+        zip(
+            elements["name"].astype(str),
+            [None if pd.isna(n) else str(n) for n in elements["notes"]],
+            elements["segment_name"],
+        )
+    )
+    max_goe = {key: compute_element_max_goe(*key) for key in set(keys)}
+    return pd.Series([max_goe[key] for key in keys], index=elements.index, dtype=float)
+
+
+def _program_max_pcs(elements: pd.DataFrame) -> pd.Series:
+    """Fall-cap PCS maximum per ``skater_segment_id`` (NaN when there is no cap)."""
+    notes = elements["notes"]
+    distinct = notes.dropna().unique()
+    falls_by_note = {n: falls_from_element_notes(str(n)) for n in distinct}
+    falls = notes.map(falls_by_note).fillna(0).astype(int)
+    program_falls = falls.groupby(elements["skater_segment_id"]).sum()
+    caps = {int(n): max_pcs_for_fall_count(int(n)) for n in program_falls.unique()}
+    return program_falls.map(lambda n: np.nan if caps[int(n)] is None else float(caps[int(n)]))
+
+
+def _ids_to_update(current: pd.Series, desired: pd.Series, ids: pd.Series) -> tuple[list, list]:
+    current = current.fillna(False).astype(bool)
+    to_set = ids[desired & ~current]
+    to_clear = ids[~desired & current]
+    return [int(i) for i in to_set], [int(i) for i in to_clear]
+
+
+def _write_flags(session, model, set_ids: list[int], clear_ids: list[int]) -> None:
+    for ids, value in ((set_ids, True), (clear_ids, False)):
+        for start in range(0, len(ids), _UPDATE_CHUNK):
+            session.execute(
+                update(model)
+                .where(model.id.in_(ids[start : start + _UPDATE_CHUNK]))
+                .values(is_rule_error=value)
+                .execution_options(synchronize_session=False)
+            )
+
+
+def recompute_segment_rule_errors(
+    session,
+    segment_ids: Iterable[int],
+    *,
+    dry_run: bool = False,
+) -> dict[str, int]:
+    """
+    Re-evaluate element GOE-range and PCS fall-cap rule errors for ``segment_ids`` from
+    stored elements and marks and update ``is_rule_error`` where it changes (no commit).
+
+    Returns counts keyed by ``RECOMPUTE_COUNT_KEYS``: rule errors found, flags set and
+    cleared, and segments skipped because no protocol metadata was stored.
+    """
+    ids = sorted({int(s) for s in segment_ids})
+    out = dict.fromkeys(RECOMPUTE_COUNT_KEYS, 0)
+    if not ids:
+        return out
+
+    seg = _segment_policy_frame(session, ids)
+    elements = _frame(
+        session,
+        select(
+            Element.id,
+            Element.skater_segment_id,
+            SkaterSegment.segment_id,
+            Element.name,
+            Element.notes,
+            Element.max_goe_allowed,
+        )
+        .join(SkaterSegment, SkaterSegment.id == Element.skater_segment_id)
+        .where(SkaterSegment.segment_id.in_(ids)),
+        ["element_id", "skater_segment_id", "segment_id", "name", "notes", "max_goe_allowed"],
+    )
+    has_metadata = (
+        (elements["notes"].notna() | elements["max_goe_allowed"].notna())
+        .groupby(elements["segment_id"])
+        .any()
+    )
+    seg = seg[seg["segment_id"].map(has_metadata).fillna(False).astype(bool)]
+    out["segments"] = len(seg)
+    out["skipped_no_metadata"] = len(ids) - len(seg)
+    if seg.empty:
+        return out
+    kept = [int(s) for s in seg["segment_id"]]
+    elements = elements[elements["segment_id"].isin(kept)].merge(seg, on="segment_id")
+
+    marks = _frame(
+        session,
+        select(
+            ElementScorePerJudge.id,
+            ElementScorePerJudge.element_id,
+            ElementScorePerJudge.judge_score,
+            ElementScorePerJudge.is_rule_error,
+        )
+        .join(Element, Element.id == ElementScorePerJudge.element_id)
+        .join(SkaterSegment, SkaterSegment.id == Element.skater_segment_id)
+        .where(SkaterSegment.segment_id.in_(kept)),
+        ["id", "element_id", "judge_score", "is_rule_error"],
+    )
+    if not marks.empty:
+        elements = elements.assign(max_goe=_element_max_goe(elements))
+        marks = marks.merge(
+            elements[["element_id", "max_goe", "element_rules"]], on="element_id", how="left"
+        )
+        score = pd.to_numeric(marks["judge_score"], errors="coerce").astype(float)
+        desired = (
+            marks["element_rules"].fillna(False).astype(bool)
+            & (score > marks["max_goe"]).fillna(False)
+        )
+        set_ids, clear_ids = _ids_to_update(marks["is_rule_error"], desired, marks["id"])
+        out["element_rule_errors"] = int(desired.sum())
+        out["element_flags_set"] = len(set_ids)
+        out["element_flags_cleared"] = len(clear_ids)
+        if not dry_run:
+            _write_flags(session, ElementScorePerJudge, set_ids, clear_ids)
+
+    pcs = _frame(
+        session,
+        select(
+            PcsScorePerJudge.id,
+            PcsScorePerJudge.skater_segment_id,
+            SkaterSegment.segment_id,
+            PcsScorePerJudge.judge_score,
+            PcsScorePerJudge.is_rule_error,
+        )
+        .join(SkaterSegment, SkaterSegment.id == PcsScorePerJudge.skater_segment_id)
+        .where(SkaterSegment.segment_id.in_(kept)),
+        ["id", "skater_segment_id", "segment_id", "judge_score", "is_rule_error"],
+    )
+    if not pcs.empty:
+        max_pcs = pcs["skater_segment_id"].map(_program_max_pcs(elements))
+        pcs_rules = pcs["segment_id"].map(seg.set_index("segment_id")["pcs_rules"])
+        score = pd.to_numeric(pcs["judge_score"], errors="coerce").astype(float)
+        desired = pcs_rules.fillna(False).astype(bool) & (score > max_pcs).fillna(False)
+        set_ids, clear_ids = _ids_to_update(pcs["is_rule_error"], desired, pcs["id"])
+        out["pcs_rule_errors"] = int(desired.sum())
+        out["pcs_flags_set"] = len(set_ids)
+        out["pcs_flags_cleared"] = len(clear_ids)
+        if not dry_run:
+            _write_flags(session, PcsScorePerJudge, set_ids, clear_ids)
+    return out
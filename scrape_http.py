@@ -0,0 +1,243 @@
+"""
+Shared HTTP client for results scraping and competition discovery.
+
+``scrape_http_session()`` is used by ``downloadResults``, ``scripts/discover_usfs_ijs_competitions``
+and ``scripts/load_isu_figure_skating_results``. It is a ``requests.Session`` with:
+
+* one pooled keep-alive adapter for http and https;
+* conditional GETs for recently fetched pages (``ETag`` / ``Last-Modified``; a ``304``
+  returns the cached response);
+* retries with jittered exponential backoff on connection errors, 429 and 5xx, honouring
+  ``Retry-After`` up to ``backoff_max`` (a longer wait returns the response instead);
+* a per-host concurrency limit that grows while responses are fast and clean and halves
+  on throttling or errors, so threaded probing runs as fast as the host allows.
+
+HTTP/2 is not offered: ``requests`` / urllib3 speak HTTP/1.1 only.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Callable
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.sessions import merge_setting
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/107.0.0.0 Safari/537.36"
+)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class HostLimiter:
+    """
+    Adaptive concurrency limit for one host (additive increase, multiplicative decrease).
+
+    A clean response faster than ``target_latency`` raises the limit by ``1 / limit``
+    (about +1 per full window); a slower one lowers it by the same step; a throttled or
+    failed request halves it. ``min_interval`` spaces request starts as a politeness floor.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int = 2,
+        maximum: int = 16,
+        min_interval: float = 0.0,
+        target_latency: float = 1.5,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.limit = float(max(1, min(initial, maximum)))
+        self.maximum = max(1, int(maximum))
+        self.min_interval = max(0.0, float(min_interval))
+        self.target_latency = float(target_latency)
+        self.in_flight = 0
+        self._next_start = 0.0
+        self._sleep = sleep
+        self._clock = clock
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+            now = self._clock()
+            start = max(now, self._next_start)
+            self._next_start = start + self.min_interval
+        if start > now:
+            self._sleep(start - now)
+
+    def release(self, *, latency: float | None, ok: bool) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            step = 1.0 / self.limit
+            if not ok:
+                self.limit = max(1.0, self.limit / 2)
+            elif latency is not None and latency <= self.target_latency:
+                self.limit = min(float(self.maximum), self.limit + step)
+            else:
+                self.limit = max(1.0, self.limit - step)
+            self._cond.notify_all()
+
+    def pause(self, seconds: float) -> None:
+        """Hold new request starts for ``seconds`` (``Retry-After`` / 429)."""
+        with self._cond:
+            self._next_start = max(self._next_start, self._clock() + seconds)
+
+
+def _retry_after_seconds(response: requests.Response) -> float | None:
+    value = (response.headers.get("Retry-After") or "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class ScrapeHttpSession(requests.Session):
+    """``requests.Session`` with per-host limits, retries and conditional GETs (see module)."""
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = 32,
+        retries: int = 3,
+        backoff: float = 0.5,
+        backoff_max: float = 30.0,
+        max_host_concurrency: int = 8,
+        min_interval: float = 0.0,
+        target_latency: float = 1.5,
+        conditional_cache_size: int = 256,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        self.headers.update({"User-Agent": USER_AGENT})
+        self.retries = max(0, int(retries))
+        self.backoff = float(backoff)
+        self.backoff_max = float(backoff_max)
+        self.max_host_concurrency = max_host_concurrency
+        self.min_interval = min_interval
+        self.target_latency = target_latency
+        self.conditional_cache_size = max(0, int(conditional_cache_size))
+        self._sleep = sleep
+        self._clock = clock
+        self._limiters: dict[str, HostLimiter] = {}
+        self._validated: OrderedDict[str, requests.Response] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def limiter(self, host: str) -> HostLimiter:
+        with self._lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = self._limiters[host] = HostLimiter(
+                    maximum=self.max_host_concurrency,
+                    min_interval=self.min_interval,
+                    target_latency=self.target_latency,
+                    sleep=self._sleep,
+                    clock=self._clock,
+                )
+            return limiter
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Full jitter: uniform in ``[0, min(backoff_max, backoff * 2**attempt)]``."""
+        return random.uniform(0.0, min(self.backoff_max, self.backoff * 2**attempt))
+
+    def _cache_key(self, url: str, params) -> str:
+        """Request URL with the merged query string, as ``requests`` will send it."""
+        prepared = requests.PreparedRequest()
+        prepared.prepare_url(url, merge_setting(params, self.params))
+        return prepared.url
+
+    def _cached(self, url: str) -> requests.Response | None:
+        with self._lock:
+            cached = self._validated.get(url)
+            if cached is not None:
+                self._validated.move_to_end(url)
+            return cached
+
+    def _remember(self, url: str, response: requests.Response) -> None:
+        if not (response.headers.get("ETag") or response.headers.get("Last-Modified")):
+            return
+        with self._lock:
+            self._validated[url] = response
+            self._validated.move_to_end(url)
+            while len(self._validated) > self.conditional_cache_size:
+                self._validated.popitem(last=False)
+
+    def request(self, method, url, **kwargs) -> requests.Response:
+        limiter = self.limiter(urlsplit(url).netloc.lower())
+        headers = dict(kwargs.pop("headers", None) or {})
+        cached = cache_key = None
+        conditional = (
+            method.upper() == "GET"
+            and self.conditional_cache_size
+            and not kwargs.get("stream")
+        )
+        if conditional:
+            cache_key = self._cache_key(url, kwargs.get("params"))
+            cached = self._cached(cache_key)
+            if cached is not None:
+                if cached.headers.get("ETag"):
+                    headers.setdefault("If-None-Match", cached.headers["ETag"])
+                if cached.headers.get("Last-Modified"):
+                    headers.setdefault("If-Modified-Since", cached.headers["Last-Modified"])
+
+        attempt = 0
+        while True:
+            limiter.acquire()
+            started = self._clock()
+            try:
+                response = super().request(method, url, headers=headers, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                limiter.release(latency=None, ok=False)
+                if attempt >= self.retries:
+                    raise
+                self._sleep(self._backoff_delay(attempt))
+                attempt += 1
+                continue
+            throttled = response.status_code in RETRY_STATUSES
+            limiter.release(latency=self._clock() - started, ok=not throttled)
+            delay = None
+            if throttled and attempt < self.retries:
+                delay = _retry_after_seconds(response)
+                if delay is None:
+                    delay = self._backoff_delay(attempt)
+            # A ``Retry-After`` past ``backoff_max`` is returned, not waited out.
+            if delay is not None and delay <= self.backoff_max:
+                response.close()
+                if response.status_code == 429:
+                    # Every caller on this host waits, not only this retry.
+                    limiter.pause(delay)
+                else:
+                    self._sleep(delay)
+                attempt += 1
+                continue
+            if response.status_code == 304 and cached is not None:
+                return cached
+            if conditional and response.status_code == 200:
+                self._remember(cache_key, response)
+            return response
+
+
+def scrape_http_session(**kwargs) -> ScrapeHttpSession:
+    """Session for many IJS / ISU fetches; keyword arguments go to ``ScrapeHttpSession``."""
+    return ScrapeHttpSession(**kwargs)
@@ -18,9 +18,14 @@ Chunked full reprocess (100 segments per batch):
   python scripts/backfill_element_rule_errors.py --scope all --offset 0 --limit 100
   python scripts/backfill_element_rule_errors.py --scope all --offset 100 --limit 100
 
+Resumable parallel run (one competition per worker process, all cores; segments
+already ``done``/``skipped`` for the named run are not refetched on re-run):
+  python scripts/backfill_element_rule_errors.py --scope all --run full-2026 --workers 0
+
 Apply migrations first:
   psql "$DATABASE_URL" -f scripts/migrations/005_element_notes.sql
   psql "$DATABASE_URL" -f scripts/migrations/006_element_max_goe_allowed.sql
+  psql "$DATABASE_URL" -f scripts/migrations/013_rule_error_backfill_segment.sql
 
 ``--scope international`` (default) limits to ISU/international competition types.
 ``--scope all`` includes every singles/pairs segment with a results URL.
@@ -29,9 +34,14 @@ Apply migrations first:
 from __future__ import annotations
 
 import argparse
+import multiprocessing
+import os
 import sys
 import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
 
 _ROOT = Path(__file__).resolve().parents[1]
@@ -39,9 +49,15 @@ if str(_ROOT) not in sys.path:
     sys.path.insert(0, str(_ROOT))
 
 from bs4 import BeautifulSoup
+from sqlalchemy import exists
 
-from database import ensure_database_for_streamlit, get_database_url, get_db_session
-from database_loader import DatabaseLoader
+from database import (
+    ensure_database_for_streamlit,
+    ensure_orm_tables,
+    get_database_url,
+    get_db_session,
+)
+from database_loader import DatabaseLoader, SegmentScoreMaps
 from downloadResults import (
     _iter_fsm_index_panel_rows,
     _scrape_http_session,
@@ -65,7 +81,7 @@ from judgingParsing import (
     find_segment_match_key,
     segment_name_match_key,
 )
-from models import Competition, Segment
+from models import Competition, RuleErrorBackfillSegment, Segment
 from officials_competition_types import OFFICIALS_COMPETITION_TYPE_IDS_INTERNATIONAL
 from pcs_fall_rule_errors import detect_pcs_fall_rule_errors
 from rule_errors_policy import (
@@ -381,9 +397,7 @@ def backfill_one_segment(
     dry_run: bool,
     pdf_dir: Path,
     http_session,
-    score_maps: (
-        tuple[dict[str, int], dict[int, int], dict[tuple[int, str], int]] | None
-    ) = None,
+    score_maps: SegmentScoreMaps | None = None,
     apply_rule_errors: bool | None = None,
 ) -> dict:
     out = {
@@ -538,6 +552,14 @@ def _build_segment_query(session, args):
         q = q.filter(Segment.id == args.segment_id)
     if args.year is not None:
         q = q.filter(Competition.year == str(args.year))
+    if args.run:
+        q = q.filter(
+            ~exists().where(
+                RuleErrorBackfillSegment.run_name == args.run,
+                RuleErrorBackfillSegment.segment_id == Segment.id,
+                RuleErrorBackfillSegment.status.in_(_RUN_FINISHED_STATUSES),
+            )
+        )
     return q.order_by(Competition.id, Segment.id)
 
 
@@ -548,10 +570,17 @@ def _chunk_hint(args, total: int, processed: int) -> None:
     if next_offset >= total:
         print("No further chunks remain.", flush=True)
         return
-    cmd = (
-        f"python scripts/backfill_element_rule_errors.py "
-        f"--scope {args.scope} --offset {next_offset} --limit {args.limit}"
-    )
+    if args.run:
+        # Finished segments drop out of the query, so a named run always restarts at 0.
+        cmd = (
+            f"python scripts/backfill_element_rule_errors.py "
+            f"--scope {args.scope} --run {args.run} --limit {args.limit}"
+        )
+    else:
+        cmd = (
+            f"python scripts/backfill_element_rule_errors.py "
+            f"--scope {args.scope} --offset {next_offset} --limit {args.limit}"
+        )
     if args.year is not None:
         cmd += f" --year {args.year}"
     if args.dry_run:
@@ -559,6 +588,354 @@ def _chunk_hint(args, total: int, processed: int) -> None:
     print(f"Next chunk: {cmd}", flush=True)
 
 
+# ``rule_error_backfill_segment.status`` values a resumed run does not redo.
+_RUN_FINISHED_STATUSES = ("done", "skipped")
+DEFAULT_BATCH_SEGMENTS = 25
+
+
+@dataclass(frozen=True)
+class _SegmentOutcome:
+    segment_id: int
+    segment_name: str
+    status: str  # "done", "skipped" or "error"
+    reason: str | None = None
+    result: dict | None = None
+
+
+def _record_run_state(session, run_name: str, outcome: _SegmentOutcome) -> None:
+    """Upsert this segment's state; committed with the segment's rule-error writes."""
+    session.merge(
+        RuleErrorBackfillSegment(
+            run_name=run_name,
+            segment_id=outcome.segment_id,
+            status=outcome.status,
+            detail=outcome.reason,
+            rule_errors_flagged=int((outcome.result or {}).get("rule_errors_flagged") or 0),
+            finished_at=datetime.now(timezone.utc),
+        )
+    )
+
+
+def _competition_outcomes(
+    loader: DatabaseLoader,
+    competition: Competition,
+    segments: list[Segment],
+    *,
+    http_session,
+    pdf_dir: Path,
+    dry_run: bool,
+) -> Iterator[_SegmentOutcome]:
+    """Fetch the competition index once, then backfill each segment (no commits)."""
+    comp_id = competition.id
+    stored_url = (competition.results_url or "").strip()
+    if not stored_url:
+        reason = "missing results_url"
+        print(f"Skip competition {comp_id} ({competition.name!r}): {reason}", flush=True)
+        for segment in segments:
+            yield _SegmentOutcome(segment.id, segment.name, "skipped", reason)
+        return
+
+    join_base = scrape_join_base(stored_url).rstrip("/")
+    index_html, index_url = _load_index_html(stored_url, join_base, http_session)
+    if not index_html:
+        reason = (
+            f"failed to fetch index "
+            f"({', '.join(_index_fetch_candidates(stored_url, join_base))})"
+        )
+        print(f"Skip competition {comp_id}: {reason}", flush=True)
+        for segment in segments:
+            yield _SegmentOutcome(segment.id, segment.name, "error", reason)
+        return
+
+    score_rows = _load_score_rows(stored_url, join_base, index_html, http_session)
+    by_db_name, by_match_key = _build_segment_link_lookups(score_rows)
+    n_html = sum(1 for r in score_rows if r.get("parse_mode") == "html")
+    n_pdf = sum(1 for r in score_rows if r.get("parse_mode") == "fsm_pdf")
+    print(
+        f"Competition {comp_id} ({competition.name!r}): "
+        f"{len(segments)} segment(s), {len(by_db_name)} protocol link(s) "
+        f"({n_html} HTML, {n_pdf} PDF) via {index_url}",
+        flush=True,
+    )
+
+    comp_score_maps = loader.segment_element_score_maps_for_competition(comp_id)
+    comp_apply_rule_errors = should_flag_rule_errors(
+        competition.start_date, competition.end_date
+    )
+    for segment in segments:
+        link, fuzzy_key = _resolve_segment_link(segment.name, by_db_name, by_match_key)
+        if not link:
+            keys = sorted(by_match_key)
+            reason = (
+                f"no protocol link (match key "
+                f"{segment_name_match_key(segment.name)!r}; "
+                f"index keys: {keys})"
+            )
+            print(f"  [{segment.id}] {segment.name!r}: {reason}", flush=True)
+            yield _SegmentOutcome(segment.id, segment.name, "skipped", reason)
+            continue
+
+        if fuzzy_key is not None:
+            print(
+                f"  [{segment.id}] {segment.name!r}: fuzzy-matched index "
+                f"key {fuzzy_key!r}",
+                flush=True,
+            )
+        elif link["db_name"] != segment.name:
+            print(
+                f"  [{segment.id}] {segment.name!r}: matched index "
+                f"{link['cover_label']!r} → {link['db_name']!r}",
+                flush=True,
+            )
+
+        result = backfill_one_segment(
+            loader,
+            segment=segment,
+            competition=competition,
+            scores_url=link["scores_url"],
+            parse_mode=link.get("parse_mode") or "fsm_pdf",
+            panel_judges=link.get("judges"),
+            dry_run=dry_run,
+            pdf_dir=pdf_dir,
+            http_session=http_session,
+            score_maps=comp_score_maps.get(segment.id),
+            apply_rule_errors=comp_apply_rule_errors,
+        )
+        if result.get("error"):
+            print(f"  [{segment.id}] {segment.name!r}: {result['error']}", flush=True)
+            yield _SegmentOutcome(segment.id, segment.name, "error", result["error"])
+        elif result.get("skipped"):
+            reason = str(result["skipped"])
+            print(f"  [{segment.id}] {segment.name!r}: skipped ({reason})", flush=True)
+            yield _SegmentOutcome(segment.id, segment.name, "skipped", reason)
+        else:
+            line = (
+                f"  [{segment.id}] {segment.name!r}: "
+                f"{result['parsed_rule_errors']} parsed, "
+                f"{result['rule_errors_flagged']} flagged, "
+                f"{result['metadata_updated']} element metadata updated"
+            )
+            if result.get("rule_errors_legacy_skipped"):
+                line += " (pre-2018-19: rule errors skipped)"
+            elif result.get("unresolved_rule_errors"):
+                line += f" ({len(result['unresolved_rule_errors'])} unresolved)"
+            print(line, flush=True)
+            yield _SegmentOutcome(segment.id, segment.name, "done", result=result)
+
+
+def backfill_competition(
+    loader: DatabaseLoader,
+    competition: Competition,
+    segments: list[Segment],
+    *,
+    http_session,
+    pdf_dir: Path,
+    dry_run: bool,
+    run_name: str | None = None,
+    batch_segments: int = DEFAULT_BATCH_SEGMENTS,
+) -> list[_SegmentOutcome]:
+    """
+    Backfill one competition's segments; commits every ``batch_segments`` segments.
+
+    With ``run_name``, each segment's state row is written in the same transaction as
+    its rule-error updates, so an interrupted run resumes after the last commit.
+    """
+    outcomes: list[_SegmentOutcome] = []
+    uncommitted = 0
+    for outcome in _competition_outcomes(
+        loader,
+        competition,
+        segments,
+        http_session=http_session,
+        pdf_dir=pdf_dir,
+        dry_run=dry_run,
+    ):
+        outcomes.append(outcome)
+        if dry_run:
+            continue
+        if run_name:
+            _record_run_state(loader.session, run_name, outcome)
+        if run_name or outcome.status == "done":
+            uncommitted += 1
+        if uncommitted >= max(1, batch_segments):
+            loader.commit()
+            uncommitted = 0
+    if uncommitted:
+        loader.commit()
+    return outcomes
+
+
+# Worker-process state set by ``_init_worker``: one DB session and HTTP session each.
+_WORKER: dict | None = None
+
+
+def _init_worker(database_url: str) -> None:
+    global _WORKER
+    os.environ["DATABASE_URL"] = database_url
+    ensure_database_for_streamlit()
+    session = get_db_session()
+    _WORKER = {
+        "session": session,
+        "loader": DatabaseLoader(session, defer_commits=True),
+        "http_session": _scrape_http_session(),
+    }
+
+
+def _backfill_competition_in_worker(
+    competition_id: int,
+    segment_ids: list[int],
+    dry_run: bool,
+    run_name: str | None,
+    batch_segments: int,
+) -> tuple[int, str, list[_SegmentOutcome]]:
+    assert _WORKER is not None, "worker not initialized"
+    session = _WORKER["session"]
+    try:
+        competition = session.get(Competition, competition_id)
+        segments = (
+            session.query(Segment)
+            .filter(Segment.id.in_(segment_ids))
+            .order_by(Segment.id)
+            .all()
+        )
+        with tempfile.TemporaryDirectory(prefix="rule_error_backfill_") as tmp:
+            outcomes = backfill_competition(
+                _WORKER["loader"],
+                competition,
+                segments,
+                http_session=_WORKER["http_session"],
+                pdf_dir=Path(tmp),
+                dry_run=dry_run,
+                run_name=run_name,
+                batch_segments=batch_segments,
+            )
+        return competition_id, competition.name, outcomes
+    except BaseException:
+        session.rollback()
+        raise
+    finally:
+        # Drop identity-map state between competitions.
+        session.expunge_all()
+
+
+def _resolve_workers(requested: int) -> int:
+    if requested <= 0:
+        return max(1, os.cpu_count() or 1)
+    return requested
+
+
+def _tally_outcomes(
+    competition_id: int,
+    competition_name: str,
+    outcomes: list[_SegmentOutcome],
+    *,
+    totals: dict[str, int],
+    issues: list[_BackfillIssue],
+    unresolved_rows: list[_UnresolvedRuleError],
+) -> None:
+    for outcome in outcomes:
+        if outcome.status != "done":
+            _record_issue(
+                issues,
+                competition_id=competition_id,
+                competition_name=competition_name,
+                kind="error" if outcome.status == "error" else "skipped",
+                reason=str(outcome.reason),
+                segment_id=outcome.segment_id,
+                segment_name=outcome.segment_name,
+            )
+            totals["errors" if outcome.status == "error" else "skipped"] += 1
+            continue
+        result = outcome.result or {}
+        totals["flagged"] += int(result["rule_errors_flagged"])
+        totals["metadata"] += int(result["metadata_updated"])
+        totals["parsed_errors"] += int(result["parsed_rule_errors"])
+        if result.get("rule_errors_legacy_skipped"):
+            totals["legacy_skipped"] += 1
+        for row in result.get("unresolved_rule_errors") or []:
+            unresolved_rows.append(
+                _UnresolvedRuleError(
+                    competition_id=competition_id,
+                    competition_name=competition_name,
+                    segment_id=outcome.segment_id,
+                    segment_name=outcome.segment_name,
+                    skater=str(row.get("skater", "")),
+                    element=str(row.get("element", "")),
+                    judge=str(row.get("judge", "")),
+                    reason=str(row.get("reason", "")),
+                )
+            )
+        totals["unresolved"] += len(result.get("unresolved_rule_errors") or [])
+
+
+def _run_serial(
+    loader: DatabaseLoader,
+    by_competition: dict[int, tuple[Competition, list[Segment]]],
+    args,
+    on_competition,
+) -> None:
+    http_session = _scrape_http_session()
+    with tempfile.TemporaryDirectory(prefix="rule_error_backfill_") as tmp:
+        for comp_id, (competition, segments) in sorted(by_competition.items()):
+            outcomes = backfill_competition(
+                loader,
+                competition,
+                segments,
+                http_session=http_session,
+                pdf_dir=Path(tmp),
+                dry_run=args.dry_run,
+                run_name=args.run,
+                batch_segments=args.batch_segments,
+            )
+            on_competition(comp_id, competition.name, outcomes)
+
+
+def _run_parallel(
+    by_competition: dict[int, tuple[Competition, list[Segment]]],
+    args,
+    n_workers: int,
+    on_competition,
+) -> None:
+    """One task per competition (index fetched once); largest competitions first."""
+    order = sorted(
+        by_competition.items(), key=lambda item: (-len(item[1][1]), item[0])
+    )
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(get_database_url(),),
+    ) as pool:
+        futures = {
+            pool.submit(
+                _backfill_competition_in_worker,
+                comp_id,
+                [segment.id for segment in segments],
+                args.dry_run,
+                args.run,
+                args.batch_segments,
+            ): (comp_id, competition, segments)
+            for comp_id, (competition, segments) in order
+        }
+        for fut in as_completed(futures):
+            comp_id, competition, segments = futures[fut]
+            try:
+                result = fut.result()
+            except Exception as exc:
+                # One bad competition must not abort the run: count its segments as errors.
+                reason = f"worker failed: {exc!r}"
+                print(f"Competition {comp_id} ({competition.name!r}): {reason}", flush=True)
+                result = (
+                    comp_id,
+                    competition.name,
+                    [
+                        _SegmentOutcome(segment.id, segment.name, "error", reason)
+                        for segment in segments
+                    ],
+                )
+            on_competition(*result)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--dry-run", action="store_true")
@@ -592,10 +969,33 @@ def main() -> int:
         default=None,
         help="Max segments to process in this chunk (after offset).",
     )
+    parser.add_argument(
+        "--run",
+        default=None,
+        help=(
+            "Name a resumable run: per-segment state is stored in "
+            "rule_error_backfill_segment and finished segments are skipped on re-run."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes (one competition at a time each); 0 = all cores.",
+    )
+    parser.add_argument(
+        "--batch-segments",
+        type=int,
+        default=DEFAULT_BATCH_SEGMENTS,
+        help="Segments per commit (default %(default)s).",
+    )
     args = parser.parse_args()
     if args.competition_id is not None and args.competition_ids_csv:
         print("Use only one of --competition-id and --competition-ids-csv.", file=sys.stderr)
         return 2
+    if args.run and args.dry_run:
+        print("--run records progress; it cannot be combined with --dry-run.", file=sys.stderr)
+        return 2
 
     ensure_database_for_streamlit()
     db_url = get_database_url()
@@ -604,9 +1004,11 @@ def main() -> int:
 
     session = get_db_session()
     loader = DatabaseLoader(session, defer_commits=True)
-    http_session = _scrape_http_session()
     exit_code = 0
     try:
+        if args.run:
+            ensure_orm_tables(session, RuleErrorBackfillSegment.__table__)
+            session.commit()
         base_q = _build_segment_query(session, args)
         total_matching = base_q.count()
         q = base_q
@@ -618,15 +1020,18 @@ def main() -> int:
         if not rows:
             print(
                 f"No matching segments for scope={args.scope!r} "
-                f"(offset={args.offset}, limit={args.limit}, total={total_matching}).",
+                f"(offset={args.offset}, limit={args.limit}, total={total_matching}"
+                f"{f', run={args.run!r}' if args.run else ''}).",
                 flush=True,
             )
             return 0
 
         chunk_end = args.offset + len(rows)
+        n_workers = min(_resolve_workers(args.workers), len({c.id for _, c in rows}))
         print(
             f"Chunk: segments {args.offset + 1}-{chunk_end} of {total_matching} "
-            f"(scope={args.scope}, limit={args.limit})",
+            f"(scope={args.scope}, limit={args.limit}, workers={n_workers}"
+            f"{f', run={args.run!r}' if args.run else ''})",
             flush=True,
         )
 
@@ -648,208 +1053,22 @@ def main() -> int:
             "skipped": 0,
             "errors": 0,
         }
-        chunk_processed = 0
 
-        with tempfile.TemporaryDirectory(prefix="rule_error_backfill_") as tmp:
-            pdf_dir = Path(tmp)
-            for comp_id, (competition, segments) in sorted(by_competition.items()):
-                stored_url = (competition.results_url or "").strip()
-                if not stored_url:
-                    reason = "missing results_url"
-                    print(
-                        f"Skip competition {comp_id} ({competition.name!r}): {reason}",
-                        flush=True,
-                    )
-                    for segment in segments:
-                        _record_issue(
-                            issues,
-                            competition_id=comp_id,
-                            competition_name=competition.name,
-                            kind="skipped",
-                            reason=reason,
-                            segment_id=segment.id,
-                            segment_name=segment.name,
-                        )
-                    totals["skipped"] += len(segments)
-                    continue
-
-                join_base = scrape_join_base(stored_url).rstrip("/")
-                index_html, index_url = _load_index_html(
-                    stored_url, join_base, http_session
-                )
-                if not index_html:
-                    reason = (
-                        f"failed to fetch index "
-                        f"({', '.join(_index_fetch_candidates(stored_url, join_base))})"
-                    )
-                    print(
-                        f"Skip competition {comp_id}: {reason}",
-                        flush=True,
-                    )
-                    for segment in segments:
-                        _record_issue(
-                            issues,
-                            competition_id=comp_id,
-                            competition_name=competition.name,
-                            kind="error",
-                            reason=reason,
-                            segment_id=segment.id,
-                            segment_name=segment.name,
-                        )
-                    totals["errors"] += len(segments)
-                    continue
-
-                score_rows = _load_score_rows(
-                    stored_url, join_base, index_html, http_session
-                )
-                by_db_name, by_match_key = _build_segment_link_lookups(score_rows)
-                n_html = sum(1 for r in score_rows if r.get("parse_mode") == "html")
-                n_pdf = sum(1 for r in score_rows if r.get("parse_mode") == "fsm_pdf")
-
-                print(
-                    f"Competition {comp_id} ({competition.name!r}): "
-                    f"{len(segments)} segment(s), {len(by_db_name)} protocol link(s) "
-                    f"({n_html} HTML, {n_pdf} PDF) via {index_url}",
-                    flush=True,
-                )
+        def _on_competition(comp_id: int, comp_name: str, outcomes) -> None:
+            totals["segments"] += len(outcomes)
+            _tally_outcomes(
+                comp_id,
+                comp_name,
+                outcomes,
+                totals=totals,
+                issues=issues,
+                unresolved_rows=unresolved_rows,
+            )
 
-                comp_score_maps = loader.segment_element_score_maps_for_competition(
-                    comp_id
-                )
-                comp_apply_rule_errors = should_flag_rule_errors(
-                    competition.start_date, competition.end_date
-                )
-                comp_dirty = False
-                for segment in segments:
-                    if args.limit is not None and chunk_processed >= args.limit:
-                        break
-                    totals["segments"] += 1
-                    chunk_processed += 1
-                    link, fuzzy_key = _resolve_segment_link(
-                        segment.name, by_db_name, by_match_key
-                    )
-                    if not link:
-                        keys = sorted(by_match_key)
-                        reason = (
-                            f"no protocol link (match key "
-                            f"{segment_name_match_key(segment.name)!r}; "
-                            f"index keys: {keys})"
-                        )
-                        print(
-                            f"  [{segment.id}] {segment.name!r}: {reason}",
-                            flush=True,
-                        )
-                        _record_issue(
-                            issues,
-                            competition_id=comp_id,
-                            competition_name=competition.name,
-                            kind="skipped",
-                            reason=reason,
-                            segment_id=segment.id,
-                            segment_name=segment.name,
-                        )
-                        totals["skipped"] += 1
-                        continue
-
-                    if fuzzy_key is not None:
-                        print(
-                            f"  [{segment.id}] {segment.name!r}: fuzzy-matched index "
-                            f"key {fuzzy_key!r}",
-                            flush=True,
-                        )
-                    elif link["db_name"] != segment.name:
-                        print(
-                            f"  [{segment.id}] {segment.name!r}: matched index "
-                            f"{link['cover_label']!r} → {link['db_name']!r}",
-                            flush=True,
-                        )
-
-                    result = backfill_one_segment(
-                        loader,
-                        segment=segment,
-                        competition=competition,
-                        scores_url=link["scores_url"],
-                        parse_mode=link.get("parse_mode") or "fsm_pdf",
-                        panel_judges=link.get("judges"),
-                        dry_run=args.dry_run,
-                        pdf_dir=pdf_dir,
-                        http_session=http_session,
-                        score_maps=comp_score_maps.get(segment.id),
-                        apply_rule_errors=comp_apply_rule_errors,
-                    )
-                    if result.get("error"):
-                        print(
-                            f"  [{segment.id}] {segment.name!r}: {result['error']}",
-                            flush=True,
-                        )
-                        _record_issue(
-                            issues,
-                            competition_id=comp_id,
-                            competition_name=competition.name,
-                            kind="error",
-                            reason=result["error"],
-                            segment_id=segment.id,
-                            segment_name=segment.name,
-                        )
-                        totals["errors"] += 1
-                    elif result.get("skipped"):
-                        reason = str(result["skipped"])
-                        print(
-                            f"  [{segment.id}] {segment.name!r}: skipped ({reason})",
-                            flush=True,
-                        )
-                        _record_issue(
-                            issues,
-                            competition_id=comp_id,
-                            competition_name=competition.name,
-                            kind="skipped",
-                            reason=reason,
-                            segment_id=segment.id,
-                            segment_name=segment.name,
-                        )
-                        totals["skipped"] += 1
-                    else:
-                        comp_dirty = True
-                        totals["flagged"] += int(result["rule_errors_flagged"])
-                        totals["metadata"] += int(result["metadata_updated"])
-                        totals["parsed_errors"] += int(result["parsed_rule_errors"])
-                        if result.get("rule_errors_legacy_skipped"):
-                            totals["legacy_skipped"] += 1
-                        for row in result.get("unresolved_rule_errors") or []:
-                            unresolved_rows.append(
-                                _UnresolvedRuleError(
-                                    competition_id=comp_id,
-                                    competition_name=competition.name,
-                                    segment_id=segment.id,
-                                    segment_name=segment.name,
-                                    skater=str(row.get("skater", "")),
-                                    element=str(row.get("element", "")),
-                                    judge=str(row.get("judge", "")),
-                                    reason=str(row.get("reason", "")),
-                                )
-                            )
-                        totals["unresolved"] += len(
-                            result.get("unresolved_rule_errors") or []
-                        )
-                        line = (
-                            f"  [{segment.id}] {segment.name!r}: "
-                            f"{result['parsed_rule_errors']} parsed, "
-                            f"{result['rule_errors_flagged']} flagged, "
-                            f"{result['metadata_updated']} element metadata updated"
-                        )
-                        if result.get("rule_errors_legacy_skipped"):
-                            line += " (pre-2018-19: rule errors skipped)"
-                        elif result.get("unresolved_rule_errors"):
-                            line += (
-                                f" ({len(result['unresolved_rule_errors'])} unresolved)"
-                            )
-                        print(line, flush=True)
-
-                if comp_dirty and not args.dry_run:
-                    loader.commit()
-
-                if args.limit is not None and chunk_processed >= args.limit:
-                    break
+        if n_workers > 1:
+            _run_parallel(by_competition, args, n_workers, _on_competition)
+        else:
+            _run_serial(loader, by_competition, args, _on_competition)
 
         mode = "dry-run" if args.dry_run else "applied"
         print(
@@ -864,7 +1083,7 @@ def main() -> int:
         )
         _print_issue_summary(issues)
         _print_unresolved_rule_errors(unresolved_rows)
-        _chunk_hint(args, total_matching, chunk_processed)
+        _chunk_hint(args, total_matching, len(rows))
         exit_code = 1 if totals["errors"] > 0 else 0
     finally:
         session.close()
@@ -2,6 +2,10 @@
 """
 Backfill ``public.segment.level`` and ``level_source`` for existing rows.
 
+Loads the segments in scope in one query, classifies them with
+``segment_level.classify_segment_levels_frame`` (once per distinct name / competition /
+discipline key) and writes only changed rows with ``update_segment_levels``.
+
   python scripts/backfill_segment_level.py
   python scripts/backfill_segment_level.py --dry-run
   python scripts/backfill_segment_level.py --competition-id 42
@@ -19,7 +23,8 @@ _ROOT = Path(__file__).resolve().parents[1]
 if str(_ROOT) not in sys.path:
     sys.path.insert(0, str(_ROOT))
 
-from sqlalchemy import or_
+import pandas as pd
+from sqlalchemy import or_, select
 
 from database import ensure_database_for_streamlit, get_database_url, get_db_session
 from models import Competition, Segment
@@ -27,10 +32,46 @@ from segment_level import (
     LEVEL_UNSPECIFIED,
     SOURCE_COMPETITION_NAME,
     SOURCE_DEFAULT_INTERNATIONAL,
-    classify_segment_level_for_row,
+    classify_segment_levels_frame,
+    update_segment_levels,
 )
 
-_BATCH_COMMIT = 500
+_BATCH_UPDATE = 5000
+
+
+def _load_segments(session, args) -> pd.DataFrame:
+    """One row per segment in scope with its competition context and stored level."""
+    stmt = select(
+        Segment.id,
+        Segment.name,
+        Competition.name,
+        Competition.international,
+        Segment.discipline_type_id,
+        Segment.level,
+        Segment.level_source,
+    ).join(Competition, Segment.competition_id == Competition.id)
+    if args.competition_id is not None:
+        stmt = stmt.where(Segment.competition_id == args.competition_id)
+    if args.only_unspecified:
+        stmt = stmt.where(
+            or_(
+                Segment.level.is_(None),
+                Segment.level == "",
+                Segment.level == LEVEL_UNSPECIFIED,
+            )
+        )
+    return pd.DataFrame.from_records(
+        session.execute(stmt).all(),
+        columns=[
+            "segment_id",
+            "segment_name",
+            "competition_name",
+            "international",
+            "discipline_type_id",
+            "stored_level",
+            "stored_level_source",
+        ],
+    )
 
 
 def main() -> None:
@@ -40,8 +81,8 @@ def main() -> None:
     parser.add_argument(
         "--batch-size",
         type=int,
-        default=_BATCH_COMMIT,
-        help=f"Commit every N changed rows (default {_BATCH_COMMIT}).",
+        default=_BATCH_UPDATE,
+        help=f"Segment ids per UPDATE statement (default {_BATCH_UPDATE}).",
     )
     parser.add_argument(
         "--only-unspecified",
@@ -57,65 +98,35 @@ def main() -> None:
 
     session = get_db_session()
     try:
-        q = session.query(Segment, Competition).join(
-            Competition, Segment.competition_id == Competition.id
-        )
-        if args.competition_id is not None:
-            q = q.filter(Segment.competition_id == args.competition_id)
-        if args.only_unspecified:
-            q = q.filter(
-                or_(
-                    Segment.level.is_(None),
-                    Segment.level == "",
-                    Segment.level == LEVEL_UNSPECIFIED,
-                )
-            )
-
         scope = "segments"
         if args.only_unspecified:
             scope = "segments with unspecified level"
         if args.competition_id is not None:
             scope = f"{scope} for competition_id={args.competition_id}"
         print(f"Loading {scope}…", flush=True)
-        rows = q.all()
-        print(f"Loaded {len(rows)} segment row(s).", flush=True)
-
-        n = 0
-        fallback = 0
-        pending = 0
-        for i, (seg, comp) in enumerate(rows, start=1):
-            result = classify_segment_level_for_row(
-                seg.name,
-                comp.name,
-                comp.international,
-                discipline_type_id=seg.discipline_type_id,
-            )
-            if result.source in (SOURCE_COMPETITION_NAME, SOURCE_DEFAULT_INTERNATIONAL):
-                fallback += 1
-            if seg.level == result.level and seg.level_source == result.source:
-                continue
-            n += 1
-            if not args.dry_run:
-                seg.level = result.level
-                seg.level_source = result.source
-                pending += 1
-                if pending >= args.batch_size:
-                    print(f"  committing {pending} change(s)…", flush=True)
-                    session.commit()
-                    pending = 0
-
-            if i % 5000 == 0:
-                print(f"  processed {i}/{len(rows)}…", flush=True)
+        segments = _load_segments(session, args)
+        print(f"Loaded {len(segments)} segment row(s).", flush=True)
+
+        classified = classify_segment_levels_frame(segments)
+        fallback = int(
+            classified["level_source"]
+            .isin((SOURCE_COMPETITION_NAME, SOURCE_DEFAULT_INTERNATIONAL))
+            .sum()
+        )
+        changed = classified[
+            (classified["level"] != classified["stored_level"])
+            | (classified["level_source"] != classified["stored_level_source"])
+        ]
 
         if args.dry_run:
             print(
-                f"Would update {n} segment(s); {fallback} use competition/default inference.",
+                f"Would update {len(changed)} segment(s); "
+                f"{fallback} use competition/default inference.",
                 flush=True,
             )
         else:
-            if pending:
-                print(f"  committing final {pending} change(s)…", flush=True)
-                session.commit()
+            n = update_segment_levels(session, changed, chunk_size=max(1, args.batch_size))
+            session.commit()
             print(
                 f"Updated {n} segment(s); {fallback} use competition/default inference.",
                 flush=True,
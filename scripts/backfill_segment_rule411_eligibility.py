@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Backfill ``public.segment_rule411_eligibility`` (ISU Rule 411 entry / member checks).
+
+New loads write the row with the segment's scores; run this once after applying
+``scripts/migrations/012_segment_rule411_eligibility.sql`` for segments loaded earlier,
+or with ``--recompute`` after changing the rule in ``segment_rule411.py``.
+
+  python scripts/backfill_segment_rule411_eligibility.py
+  python scripts/backfill_segment_rule411_eligibility.py --competition-id 42
+  python scripts/backfill_segment_rule411_eligibility.py --recompute
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from database import ensure_database_for_streamlit, get_database_url, get_db_session
+from models import Segment
+from segment_rule411 import (
+    refresh_segment_rule411_eligibility,
+    segment_ids_missing_rule411_eligibility,
+    segment_rule411_table_exists,
+)
+
+_BATCH_COMMIT = 500
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--competition-id",
+        type=int,
+        action="append",
+        help="Only segments of these public.competition ids (repeatable).",
+    )
+    parser.add_argument(
+        "--recompute",
+        action="store_true",
+        help="Rewrite every selected segment, not only those without a stored row.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=_BATCH_COMMIT,
+        help=f"Segments per query / commit (default {_BATCH_COMMIT}).",
+    )
+    args = parser.parse_args()
+
+    ensure_database_for_streamlit()
+    db_url = get_database_url()
+    host_hint = db_url.split("@")[-1].split("/")[0] if "@" in db_url else "(local)"
+    print(f"Database host: {host_hint}", flush=True)
+
+    batch_size = max(1, args.batch_size)
+    session = get_db_session()
+    try:
+        if not segment_rule411_table_exists(session):
+            print(
+                "segment_rule411_eligibility is missing; apply "
+                "scripts/migrations/012_segment_rule411_eligibility.sql first.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+        if args.recompute:
+            q = session.query(Segment.id).order_by(Segment.id)
+            if args.competition_id:
+                q = q.filter(Segment.competition_id.in_(args.competition_id))
+            segment_ids = [int(r[0]) for r in q.all()]
+        else:
+            segment_ids = segment_ids_missing_rule411_eligibility(
+                session, competition_ids=args.competition_id
+            )
+        print(f"{len(segment_ids)} segment(s) to evaluate", flush=True)
+
+        written = 0
+        for start in range(0, len(segment_ids), batch_size):
+            chunk = segment_ids[start : start + batch_size]
+            written += refresh_segment_rule411_eligibility(session, chunk)
+            session.commit()
+            print(f"  {written} / {len(segment_ids)}", flush=True)
+        print(f"Done: {written} row(s) written.", flush=True)
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -34,12 +34,13 @@ import argparse
 import csv
 import os
 import sys
-import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from typing import Iterable, Iterator
 
 import requests
 from bs4 import BeautifulSoup
-from requests.adapters import HTTPAdapter
 
 _REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if _REPO_ROOT not in sys.path:
@@ -47,6 +48,7 @@ if _REPO_ROOT not in sys.path:
 
 from ijs_index_parse import ijs_index_start_end_and_location  # noqa: E402
 from ijs_results_urls import results_url_dedupe_key  # noqa: E402
+from scrape_http import scrape_http_session  # noqa: E402
 
 
 def _load_existing_competition_base_urls() -> set[str]:
@@ -91,19 +93,14 @@ def _load_existing_competition_base_urls() -> set[str]:
 BASE = "https://ijs.usfigureskating.org/leaderboard/results"
 
 
-def _session() -> requests.Session:
-    s = requests.Session()
-    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=0)
-    s.mount("https://", adapter)
-    s.headers.update(
-        {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/107.0.0.0 Safari/537.36"
-            )
-        }
+def _session(*, workers: int = 8, min_interval: float = 0.0) -> requests.Session:
+    """Shared scrape session; the per-host limit adapts up to ``workers`` concurrent probes."""
+    return scrape_http_session(
+        pool_size=max(8, workers),
+        max_host_concurrency=workers,
+        min_interval=min_interval,
+        conditional_cache_size=0,
     )
-    return s
 
 
 def _looks_like_ijs_index(soup: BeautifulSoup) -> bool:
@@ -156,6 +153,31 @@ def probe_url(
     return 200, r.text
 
 
+def _probe_in_order(
+    session: requests.Session,
+    targets: Iterable[tuple[str, int, str, bool]],
+    timeout: float,
+    workers: int,
+) -> Iterator[tuple[tuple[str, int, str, bool], int | None, str | None]]:
+    """
+    Yield ``(target, status, body)`` for ``(year, id, url, skip)`` targets in input order.
+
+    Up to ``workers`` probes run ahead of the consumer; skipped targets are not fetched
+    and yield ``(target, None, None)``.
+    """
+    window: deque = deque()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for target in targets:
+            fut = None if target[3] else pool.submit(probe_url, session, target[2], timeout)
+            window.append((target, fut))
+            while len(window) > workers:
+                done, fut = window.popleft()
+                yield (done, *fut.result()) if fut is not None else (done, None, None)
+        while window:
+            done, fut = window.popleft()
+            yield (done, *fut.result()) if fut is not None else (done, None, None)
+
+
 def parse_args(argv: list[str] | None) -> argparse.Namespace:
     p = argparse.ArgumentParser(description=__doc__)
     p.add_argument(
@@ -167,7 +189,21 @@ def parse_args(argv: list[str] | None) -> argparse.Namespace:
     p.add_argument("--start-id", type=int, required=True)
     p.add_argument("--end-id", type=int, required=True)
     p.add_argument("--step", type=int, default=1, help="ID step (default: 1)")
-    p.add_argument("--delay", type=float, default=0.75, help="Seconds between requests")
+    p.add_argument(
+        "--delay",
+        type=float,
+        default=0.0,
+        help=(
+            "Minimum seconds between request starts to the host (default: 0; "
+            "concurrency already backs off on throttling or slow responses)"
+        ),
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Maximum concurrent probes (default: 8); the per-host limit adapts below this",
+    )
     p.add_argument("--timeout", type=float, default=30.0)
     p.add_argument(
         "--output",
@@ -198,7 +234,7 @@ def parse_args(argv: list[str] | None) -> argparse.Namespace:
         help=(
             "Do not HTTP-probe or write CSV rows for URLs whose base path already exists in "
             "``public.competition.results_url``. Requires DATABASE_URL (uses SQLAlchemy). "
-            "Skips do not count toward --delay sleep."
+            "Skips do not count toward --delay spacing."
         ),
     )
     p.add_argument(
@@ -220,6 +256,9 @@ def main(argv: list[str] | None = None) -> int:
     if args.progress_every < 1:
         print("progress-every must be >= 1", file=sys.stderr)
         return 2
+    if args.workers < 1:
+        print("workers must be >= 1", file=sys.stderr)
+        return 2
 
     years = [y.strip() for y in args.years.split(",") if y.strip()]
     if not years:
@@ -254,7 +293,7 @@ def main(argv: list[str] | None = None) -> int:
             file=sys.stderr,
         )
 
-    sess = _session()
+    sess = _session(workers=args.workers, min_interval=args.delay)
     row_count = 0
     skipped_in_db = 0
 
@@ -267,92 +306,94 @@ def main(argv: list[str] | None = None) -> int:
         writer.writeheader()
         out_f.flush()
 
-        for year in years:
-            cid = args.start_id
-            while cid <= args.end_id:
-                url = f"{BASE}/{year}/{cid}/index.asp"
-
-                if args.skip_if_in_database and results_url_dedupe_key(url) in existing_urls:
-                    skipped_in_db += 1
-                    probe_num += 1
-                    if (
-                        not args.quiet
-                        and (
-                            probe_num % args.progress_every == 0
-                            or probe_num == total_probes
-                        )
-                    ):
-                        print(
-                            f"[{probe_num}/{total_probes}] year={year} id={cid} in_db_skip",
-                            file=sys.stderr,
-                            flush=True,
-                        )
-                    cid += args.step
-                    continue
-
-                status, body = probe_url(sess, url, args.timeout)
-                if args.log_requests:
-                    if status is None:
-                        line = f"GET {url} -> failed (no response)"
-                    else:
-                        line = f"GET {url} -> HTTP {status}"
-                    print(line, file=sys.stderr, flush=True)
-                fetched = datetime.now(timezone.utc).isoformat(timespec="seconds")
-
-                err = ""
-                if status is None:
-                    err = "request_failed"
-                elif status != 200:
-                    err = f"http_{status}"
-
-                parsed: dict[str, str] = {}
-                hit = False
-                if body:
-                    soup = BeautifulSoup(body, "html.parser")
-                    if _looks_like_ijs_index(soup):
-                        hit = True
-                        parsed = _parse_index_row(body, url)
-
-                if hit or args.include_misses:
-                    writer.writerow(
-                        {
-                            "year": year,
-                            "competition_id": cid,
-                            "url": url,
-                            "http_status": status if status is not None else "",
-                            "competition_name": parsed.get("competition_name", ""),
-                            "start_date": parsed.get("start_date", ""),
-                            "end_date": parsed.get("end_date", ""),
-                            "location": parsed.get("location", ""),
-                            "fetched_at_utc": fetched,
-                            "probe_error": err,
-                        }
+        def targets():
+            for year in years:
+                for cid in range(args.start_id, args.end_id + 1, args.step):
+                    url = f"{BASE}/{year}/{cid}/index.asp"
+                    skip = (
+                        args.skip_if_in_database
+                        and results_url_dedupe_key(url) in existing_urls
                     )
-                    out_f.flush()
-                    row_count += 1
+                    yield year, cid, url, skip
 
+        for (year, cid, url, skip), status, body in _probe_in_order(
+            sess, targets(), args.timeout, args.workers
+        ):
+            if skip:
+                skipped_in_db += 1
                 probe_num += 1
                 if (
                     not args.quiet
-                    and (probe_num % args.progress_every == 0 or probe_num == total_probes)
+                    and (
+                        probe_num % args.progress_every == 0
+                        or probe_num == total_probes
+                    )
                 ):
-                    if hit:
-                        tag = "hit"
-                    elif err:
-                        tag = err
-                    else:
-                        tag = "miss"
-                    name_hint = (parsed.get("competition_name") or "")[:50]
-                    extra = f" | {name_hint}" if name_hint else ""
                     print(
-                        f"[{probe_num}/{total_probes}] year={year} id={cid} {tag}{extra}",
+                        f"[{probe_num}/{total_probes}] year={year} id={cid} in_db_skip",
                         file=sys.stderr,
                         flush=True,
                     )
+                continue
 
-                if args.delay > 0:
-                    time.sleep(args.delay)
-                cid += args.step
+            if args.log_requests:
+                if status is None:
+                    line = f"GET {url} -> failed (no response)"
+                else:
+                    line = f"GET {url} -> HTTP {status}"
+                print(line, file=sys.stderr, flush=True)
+            fetched = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+            err = ""
+            if status is None:
+                err = "request_failed"
+            elif status != 200:
+                err = f"http_{status}"
+
+            parsed: dict[str, str] = {}
+            hit = False
+            if body:
+                soup = BeautifulSoup(body, "html.parser")
+                if _looks_like_ijs_index(soup):
+                    hit = True
+                    parsed = _parse_index_row(body, url)
+
+            if hit or args.include_misses:
+                writer.writerow(
+                    {
+                        "year": year,
+                        "competition_id": cid,
+                        "url": url,
+                        "http_status": status if status is not None else "",
+                        "competition_name": parsed.get("competition_name", ""),
+                        "start_date": parsed.get("start_date", ""),
+                        "end_date": parsed.get("end_date", ""),
+                        "location": parsed.get("location", ""),
+                        "fetched_at_utc": fetched,
+                        "probe_error": err,
+                    }
+                )
+                out_f.flush()
+                row_count += 1
+
+            probe_num += 1
+            if (
+                not args.quiet
+                and (probe_num % args.progress_every == 0 or probe_num == total_probes)
+            ):
+                if hit:
+                    tag = "hit"
+                elif err:
+                    tag = err
+                else:
+                    tag = "miss"
+                name_hint = (parsed.get("competition_name") or "")[:50]
+                extra = f" | {name_hint}" if name_hint else ""
+                print(
+                    f"[{probe_num}/{total_probes}] year={year} id={cid} {tag}{extra}",
+                    file=sys.stderr,
+                    flush=True,
+                )
 
     print(
         f"Wrote {row_count} row(s) to {args.output}"
@@ -132,6 +132,7 @@ def cmd_clear(engine: Engine, judge_id: int) -> None:
         if r.rowcount == 0:
             print(f"No link row for judge_id={judge_id}.")
             return
+        jol_core.bump_link_table_version(conn)
     print(f"OK: removed link row for judge {judge_id} (judge is unmapped again).")
 
 
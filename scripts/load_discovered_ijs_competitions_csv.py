@@ -457,6 +457,7 @@ def main(argv: list[str] | None = None) -> int:
     http_session = download_results._scrape_http_session()
     db_session = get_db_session()
     database_loader = DatabaseLoader(db_session, defer_commits=True)
+    database_loader.warm_dimension_caches()
 
     ok = 0
     errors: list[tuple[str, str]] = []
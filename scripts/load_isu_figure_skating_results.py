@@ -29,7 +29,6 @@ import argparse
 import csv
 import os
 import sys
-import time
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from typing import Iterable, TextIO
@@ -37,7 +36,6 @@ from urllib.parse import urljoin
 
 import requests
 from bs4 import BeautifulSoup
-from requests.adapters import HTTPAdapter
 
 _REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if _REPO_ROOT not in sys.path:
@@ -48,6 +46,7 @@ from officials_competition_types import (  # noqa: E402
     OFFICIALS_COMPETITION_TYPE_ID_ISU_CHAMPIONSHIP,
     OFFICIALS_COMPETITION_TYPE_ID_ISU_COMPETITION,
 )
+from scrape_http import scrape_http_session  # noqa: E402
 
 
 ISU_API_BASE = "https://api.isu-skating.com/api"
@@ -133,20 +132,9 @@ class ResultRow:
         }
 
 
-def _session() -> requests.Session:
-    s = requests.Session()
-    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
-    s.mount("https://", adapter)
-    s.mount("http://", adapter)
-    s.headers.update(
-        {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/107.0.0.0 Safari/537.36"
-            )
-        }
-    )
-    return s
+def _session(*, min_interval: float = 0.0) -> requests.Session:
+    """Shared scrape session; ``min_interval`` spaces request starts per host (``--delay``)."""
+    return scrape_http_session(pool_size=16, min_interval=min_interval)
 
 
 def _utc_now() -> str:
@@ -523,7 +511,6 @@ def collect_result_rows(
     year: int | None,
     pagesize: int,
     timeout: float,
-    delay: float,
     limit: int | None,
     start_offset: int,
     quiet: bool,
@@ -603,8 +590,6 @@ def collect_result_rows(
                             fetched_at_utc=fetched_at,
                         )
                     )
-                    if delay:
-                        time.sleep(delay)
     return rows
 
 
@@ -808,7 +793,8 @@ def load_rows(
     configure_scrape_logging(quiet=quiet, verbose=verbose, log_file=log_file)
     db_session = get_db_session()
     db_loader = DatabaseLoader(db_session, defer_commits=True)
-    http_session = _session()
+    db_loader.warm_dimension_caches()
+    http_session = _session(min_interval=delay)
     loaded = 0
     try:
         for row in planned:
@@ -888,8 +874,6 @@ def load_rows(
                         f"FAILED load: {row.event_name}: {exc}",
                         file=sys.stderr,
                     )
-            if delay:
-                time.sleep(delay)
     finally:
         http_session.close()
         db_session.close()
@@ -938,7 +922,12 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     )
     p.add_argument("--pagesize", type=int, default=200)
     p.add_argument("--timeout", type=float, default=30.0)
-    p.add_argument("--delay", type=float, default=0.1, help="Delay between event detail fetches.")
+    p.add_argument(
+        "--delay",
+        type=float,
+        default=0.1,
+        help="Minimum seconds between request starts to one host.",
+    )
     p.add_argument("--limit", type=int, default=None, help="Limit rows for testing.")
     p.add_argument("--start-offset", type=int, default=0)
     p.add_argument(
@@ -1012,7 +1001,7 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv)
-    session = _session()
+    session = _session(min_interval=args.delay)
     try:
         seasons = parse_seasons_arg(args.seasons, session, args.timeout, args.year)
         disciplines = parse_disciplines_arg(args.disciplines)
@@ -1025,7 +1014,6 @@ def main(argv: list[str] | None = None) -> int:
             year=args.year,
             pagesize=args.pagesize,
             timeout=args.timeout,
-            delay=args.delay,
             limit=args.limit,
             start_offset=args.start_offset,
             quiet=args.quiet,
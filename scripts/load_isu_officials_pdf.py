@@ -767,6 +767,11 @@ def load_rows(
     rows: list[IsuOfficialRow], *, dry_run: bool, engine: Engine | None = None
 ) -> int:
     import judge_official_link_core as core
+    from activityAnalysis.query_cache import (
+        TABLE_ISU_OFFICIAL,
+        TABLE_SEGMENT_OFFICIAL,
+        bump_table_versions,
+    )
 
     if dry_run:
         for row in rows:
@@ -897,6 +902,8 @@ def load_rows(
                     },
                 )
             count += 1
+        # Merging duplicates also repoints ``segment_official.isu_official_id``.
+        bump_table_versions(conn, (TABLE_ISU_OFFICIAL, TABLE_SEGMENT_OFFICIAL))
     return count
 
 
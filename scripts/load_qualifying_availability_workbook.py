@@ -68,7 +68,10 @@ def main() -> None:
     parser.add_argument(
         "--dry-run",
         action="store_true",
-        help="Do not commit (session rolls back on exit)",
+        help=(
+            "Do not commit (session rolls back on exit); the summary's diff counts "
+            "inserts / updates / unchanged / deletes against the stored form"
+        ),
     )
     args = parser.parse_args()
 
@@ -0,0 +1,26 @@
+-- Durable queue of "competition changed" events for the analytics cache rebuild worker
+-- (cache_rebuild_queue.py, scripts/run_cache_rebuild_worker.py).
+
+CREATE TABLE IF NOT EXISTS cache_rebuild_job (
+    id SERIAL PRIMARY KEY,
+    competition_id INTEGER NOT NULL,
+    status VARCHAR(16) NOT NULL DEFAULT 'queued',
+    events INTEGER NOT NULL DEFAULT 1,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    reason TEXT,
+    last_error TEXT,
+    current_step VARCHAR(32),
+    worker VARCHAR(128),
+    enqueued_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    run_after TIMESTAMPTZ NOT NULL DEFAULT now(),
+    started_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ
+);
+
+-- At most one queued job per competition: repeat loads coalesce into it.
+CREATE UNIQUE INDEX IF NOT EXISTS uq_cache_rebuild_job_queued_competition
+    ON cache_rebuild_job (competition_id)
+    WHERE status = 'queued';
+
+CREATE INDEX IF NOT EXISTS idx_cache_rebuild_job_status_run_after
+    ON cache_rebuild_job (status, run_after);
@@ -0,0 +1,23 @@
+-- ISU Rule 411(b) eligibility per segment (segment_rule411.py), written by the protocol
+-- loader when a segment's results are stored. International panels join it instead of
+-- re-parsing skater names on every read.
+--
+--   python scripts/backfill_segment_rule411_eligibility.py   # segments loaded earlier
+
+CREATE TABLE IF NOT EXISTS segment_rule411_eligibility (
+    segment_id INTEGER NOT NULL,
+    entry_count INTEGER NOT NULL,
+    distinct_noc_count INTEGER NOT NULL,
+    nocs_parsed INTEGER NOT NULL,
+    discipline_category VARCHAR(16) NOT NULL,
+    min_entries INTEGER,
+    meets_entry_minimum BOOLEAN NOT NULL,
+    meets_member_minimum BOOLEAN,
+    eligible BOOLEAN NOT NULL,
+    status VARCHAR(16) NOT NULL,
+    detail TEXT,
+    computed_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT segment_rule411_eligibility_pkey PRIMARY KEY (segment_id),
+    CONSTRAINT segment_rule411_eligibility_segment_id_fkey
+        FOREIGN KEY (segment_id) REFERENCES segment (id) ON DELETE CASCADE
+);
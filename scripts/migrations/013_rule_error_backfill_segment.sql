@@ -0,0 +1,14 @@
+-- Per-segment completion state for resumable rule-error backfills
+-- (scripts/backfill_element_rule_errors.py --run NAME). Rows are written in the same
+-- transaction as the segment's rule-error updates; re-running a run skips segments
+-- already marked done or skipped and retries errors.
+
+CREATE TABLE IF NOT EXISTS rule_error_backfill_segment (
+    run_name VARCHAR(64) NOT NULL,
+    segment_id INTEGER NOT NULL,
+    status VARCHAR(16) NOT NULL,
+    detail TEXT,
+    rule_errors_flagged INTEGER NOT NULL DEFAULT 0,
+    finished_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    CONSTRAINT rule_error_backfill_segment_pkey PRIMARY KEY (run_name, segment_id)
+);
@@ -0,0 +1,37 @@
+-- Stored, indexed name match keys for judge / skater lookups in DatabaseLoader
+-- (previously ``lower(regexp_replace(trim(name), ...)) = :k``, a full table scan per lookup).
+--
+--   judge.match_key  = database_loader.judge_person_match_key(name)
+--   skater.match_key = database_loader._normalize_skater_name_key(name)
+--
+-- The loader writes both keys on insert; the UPDATEs below backfill existing rows with the
+-- same normalization in SQL.
+
+ALTER TABLE judge ADD COLUMN IF NOT EXISTS match_key TEXT;
+ALTER TABLE skater ADD COLUMN IF NOT EXISTS match_key TEXT;
+
+UPDATE judge
+SET match_key = lower(
+    btrim(
+        regexp_replace(
+            regexp_replace(btrim(name), '\s+', ' ', 'g'),
+            '^(Mr\.?|Ms\.?)\s*', '', 'i'
+        )
+    )
+)
+WHERE match_key IS NULL;
+
+UPDATE skater
+SET match_key = btrim(
+    regexp_replace(
+        regexp_replace(lower(btrim(normalize(name, NFKC))), '[-_/.,;:''"`]+', ' ', 'g'),
+        '\s+', ' ', 'g'
+    )
+)
+WHERE match_key IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_judge_match_key ON judge (match_key);
+CREATE INDEX IF NOT EXISTS idx_skater_match_key ON skater (match_key);
+
+COMMENT ON COLUMN judge.match_key IS 'Case/whitespace-normalized name (honorific stripped) for dedup lookups';
+COMMENT ON COLUMN skater.match_key IS 'NFKC/case/punctuation-normalized name for protocol skater lookups';
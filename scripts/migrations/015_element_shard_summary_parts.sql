@@ -0,0 +1,11 @@
+-- Split the element shard summary payload: ``summary_payload`` keeps the mergeable judge
+-- summary the ranking table needs; the panel control table (``control_by_element``,
+-- only needed for per-judge drill-down) moves to its own column so ranking reads do not
+-- fetch or unpickle it.
+--
+-- Rows written before this migration keep the control table inside ``summary_payload``
+-- and have ``control_payload`` NULL; drill-down falls back to mark shards for those until
+-- ``precompute_element_ranking_cache.py --summaries`` rewrites them.
+
+ALTER TABLE element_deviation_ranking_shard_summary_cache
+    ADD COLUMN IF NOT EXISTS control_payload BYTEA;
@@ -0,0 +1,15 @@
+-- Judge drill-down index for cached mark shards (``mark_shard_index.py``).
+--
+-- New shard rows store marks sorted by judge_id as fixed-width column buffers in
+-- ``marks_payload``; ``judge_index`` holds the column layout and each judge's row range,
+-- so a judge breakdown reads only that judge's byte ranges from each shard.
+--
+-- Rows written before this migration keep a pickled DataFrame and ``judge_index`` NULL;
+-- drill-down falls back to a judge-filtered SQL load for them until the shards are
+-- precomputed again.
+
+ALTER TABLE element_deviation_ranking_shard_cache
+    ADD COLUMN IF NOT EXISTS judge_index BYTEA;
+
+ALTER TABLE pcs_deviation_ranking_shard_cache
+    ADD COLUMN IF NOT EXISTS judge_index BYTEA;
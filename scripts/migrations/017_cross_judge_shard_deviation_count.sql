@@ -0,0 +1,11 @@
+-- Non-NULL deviation counts on cross-judge shards (``cross_judge_cache.py``).
+--
+-- Season averages divide ``*_sum_deviation`` by these counts so they match ``AVG(deviation)``
+-- over the marks, which skips NULL deviations. Rows written before this migration keep
+-- NULL counts and are averaged over ``*_total`` until the shards are precomputed again.
+
+ALTER TABLE cross_judge_competition_shard
+    ADD COLUMN IF NOT EXISTS pcs_deviation_count INTEGER;
+
+ALTER TABLE cross_judge_competition_shard
+    ADD COLUMN IF NOT EXISTS elem_deviation_count INTEGER;
@@ -13,6 +13,7 @@ Example::
     python scripts/precompute_element_ranking_cache.py --scope qualifying --season 2425
     python scripts/precompute_element_ranking_cache.py --all-scopes --sigma-benchmark
     python scripts/precompute_element_ranking_cache.py --all-scopes --sigma-benchmark --summaries
+    python scripts/precompute_element_ranking_cache.py --all-scopes --sigma-benchmark --summaries --workers 0
     python scripts/precompute_element_ranking_cache.py --all-scopes --all-segment-levels --sigma-benchmark --summaries
     python scripts/precompute_element_ranking_cache.py --segment-levels junior_senior novice_junior_senior
     python scripts/precompute_element_ranking_cache.py --scope international --segment-levels junior_senior --skip-unchanged
@@ -48,6 +49,7 @@ from officials_competition_types import (
     ALL_COMPETITION_SCOPES,
     COMPETITION_SCOPE_ALL,
 )
+from ranking_shard_pool import resolve_ranking_shard_workers
 
 
 def _season_years_for_run(
@@ -90,6 +92,7 @@ def _precompute_scope(
     warm_summaries: bool,
     skip_unchanged: bool,
     summaries_only: bool,
+    workers: int = 1,
 ) -> tuple[int, int, str | None, int]:
     """Warm shards (and optional σ̂ / summary rows) for one competition scope."""
     level_label = ELEMENT_RANKING_LEVEL_FILTER_LABELS.get(
@@ -129,6 +132,7 @@ def _precompute_scope(
                     analytics,
                     run_params,
                     summaries_only=True,
+                    workers=workers,
                 )
                 if n_summaries:
                     sigma_key = "cached"
@@ -146,7 +150,7 @@ def _precompute_scope(
                 print("  σ̂ benchmark cache: skipped (no marks)", file=sys.stderr)
             if warm_summaries and sigma_key:
                 n_summaries = precompute_element_ranking_shard_summaries(
-                    session, analytics, run_params
+                    session, analytics, run_params, workers=workers
                 )
                 print(f"  summary shard rows written: {n_summaries}")
     return written, skipped, sigma_key, n_summaries
@@ -226,6 +230,15 @@ def main(argv: list[str] | None = None) -> int:
             "reload mark shards from the database."
         ),
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Worker processes for per-shard summary rows "
+            "(default 1; 0 = all cores)."
+        ),
+    )
     args = parser.parse_args(argv)
 
     scopes = list(ALL_COMPETITION_SCOPES) if args.all_scopes else [args.scope]
@@ -286,6 +299,7 @@ def main(argv: list[str] | None = None) -> int:
                     warm_summaries=warm_summaries,
                     skip_unchanged=args.skip_unchanged,
                     summaries_only=args.summaries_only,
+                    workers=resolve_ranking_shard_workers(args.workers),
                 )
                 total_shards += written
                 total_skipped += skipped
@@ -13,6 +13,7 @@ Example::
     python scripts/precompute_pcs_deviation_cache.py --all-scopes --sigma-benchmark --summaries
     python scripts/precompute_pcs_deviation_cache.py --all-scopes --sigma-benchmark --summaries --sigma-model quadratic
     python scripts/precompute_pcs_deviation_cache.py --all-scopes --sigma-benchmark --summaries --skip-unchanged
+    python scripts/precompute_pcs_deviation_cache.py --all-scopes --sigma-benchmark --summaries --workers 0
     python scripts/precompute_pcs_deviation_cache.py --all-scopes --all-segment-levels --sigma-benchmark --summaries
 """
 
@@ -49,6 +50,7 @@ from pcs_deviation_cache import (
     precompute_pcs_deviation_sigma,
 )
 from officials_competition_types import COMPETITION_SCOPE_ALL
+from ranking_shard_pool import resolve_ranking_shard_workers
 
 
 def _season_years_for_run(
@@ -92,6 +94,7 @@ def _precompute_scope(
     warm_summaries: bool,
     skip_unchanged: bool,
     summaries_only: bool,
+    workers: int = 1,
 ) -> tuple[int, int, str | None, int, int, bool]:
     level_label = ELEMENT_RANKING_LEVEL_FILTER_LABELS.get(
         segment_level_preset or ELEMENT_RANKING_LEVEL_FILTER_ALL,
@@ -135,6 +138,7 @@ def _precompute_scope(
                     run_params,
                     summaries_only=True,
                     skip_unchanged=skip_unchanged,
+                    workers=workers,
                 )
                 if n_summaries or summaries_skipped:
                     sigma_key = "cached"
@@ -168,6 +172,7 @@ def _precompute_scope(
                     analytics,
                     run_params,
                     skip_unchanged=skip_unchanged,
+                    workers=workers,
                 )
                 print(f"  summary shard rows written: {n_summaries}")
                 if summaries_skipped:
@@ -248,6 +253,15 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Rebuild summary cache from existing mark shards only.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Worker processes for per-shard summary rows "
+            "(default 1; 0 = all cores)."
+        ),
+    )
     args = parser.parse_args(argv)
 
     scopes = list(PCS_DEVIATION_COMPETITION_SCOPES) if args.all_scopes else [args.scope]
@@ -317,6 +331,7 @@ def main(argv: list[str] | None = None) -> int:
                     warm_summaries=warm_summaries,
                     skip_unchanged=args.skip_unchanged,
                     summaries_only=args.summaries_only,
+                    workers=resolve_ranking_shard_workers(args.workers),
                 )
                 total_shards += written
                 total_skipped += skipped
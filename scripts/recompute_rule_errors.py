@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Recompute element GOE-range and PCS fall-cap rule errors from stored marks (no network).
+
+Use after changing ``rule_errors_policy``, ``judgingParsing.compute_element_max_goe`` or
+``pcs_fall_rule_errors``. Reads ``element.notes`` / marks already in the database
+(``rule_error_recompute.py``) and only rewrites ``is_rule_error`` flags that change.
+Segments loaded before element notes were stored are skipped; refetch those with
+``scripts/backfill_element_rule_errors.py``.
+
+  python scripts/recompute_rule_errors.py --dry-run
+  python scripts/recompute_rule_errors.py --year 2526
+  python scripts/recompute_rule_errors.py --competition-id 42
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from database import ensure_database_for_streamlit, get_database_url, get_db_session
+from models import Competition, Segment
+from rule_error_recompute import RECOMPUTE_COUNT_KEYS, recompute_segment_rule_errors
+
+_BATCH_SEGMENTS = 500
+
+
+def _segment_ids(session, args) -> list[int]:
+    q = session.query(Segment.id).join(Competition, Competition.id == Segment.competition_id)
+    if args.competition_id:
+        q = q.filter(Competition.id.in_(args.competition_id))
+    if args.segment_id is not None:
+        q = q.filter(Segment.id == args.segment_id)
+    if args.year is not None:
+        q = q.filter(Competition.year == str(args.year))
+    return [int(r[0]) for r in q.order_by(Segment.id).all()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument(
+        "--competition-id",
+        type=int,
+        action="append",
+        help="Only segments of these public.competition ids (repeatable).",
+    )
+    parser.add_argument("--segment-id", type=int, default=None)
+    parser.add_argument("--year", default=None, help="Filter by competition.year (e.g. 2526).")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=_BATCH_SEGMENTS,
+        help=f"Segments per read / commit (default {_BATCH_SEGMENTS}).",
+    )
+    args = parser.parse_args()
+
+    ensure_database_for_streamlit()
+    db_url = get_database_url()
+    host_hint = db_url.split("@")[-1].split("/")[0] if "@" in db_url else "(local)"
+    print(f"Database host: {host_hint}", flush=True)
+
+    batch_size = max(1, args.batch_size)
+    session = get_db_session()
+    try:
+        segment_ids = _segment_ids(session, args)
+        print(f"{len(segment_ids)} segment(s) in scope", flush=True)
+        totals = dict.fromkeys(RECOMPUTE_COUNT_KEYS, 0)
+        started = time.monotonic()
+        for start in range(0, len(segment_ids), batch_size):
+            chunk = segment_ids[start : start + batch_size]
+            counts = recompute_segment_rule_errors(session, chunk, dry_run=args.dry_run)
+            if args.dry_run:
+                session.rollback()
+            else:
+                session.commit()
+            for key, value in counts.items():
+                totals[key] += value
+            done = start + len(chunk)
+            rate = done / max(time.monotonic() - started, 1e-9) * 60
+            print(
+                f"  {done} / {len(segment_ids)} segment(s) ({rate:,.0f}/min): "
+                f"element +{totals['element_flags_set']} -{totals['element_flags_cleared']}, "
+                f"PCS +{totals['pcs_flags_set']} -{totals['pcs_flags_cleared']}",
+                flush=True,
+            )
+        mode = "dry-run" if args.dry_run else "applied"
+        print(
+            f"Done ({mode}): {totals['segments']} segment(s) evaluated, "
+            f"{totals['skipped_no_metadata']} skipped (no stored element notes); "
+            f"{totals['element_rule_errors']} element rule error(s) "
+            f"({totals['element_flags_set']} set, {totals['element_flags_cleared']} cleared), "
+            f"{totals['pcs_rule_errors']} PCS fall rule error(s) "
+            f"({totals['pcs_flags_set']} set, {totals['pcs_flags_cleared']} cleared)",
+            flush=True,
+        )
+    finally:
+        session.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Rebuild ``officials_analysis.official_activity_fact`` (activity tracker fact table).
+
+Loaders keep the table current per competition; run this after edits that bypass them
+(judge ↔ official link changes, hand-edited assignments) or to verify a full rebuild.
+Apply ``activityAnalysis/migrations/040_official_activity_fact.sql`` first on PostgreSQL.
+
+    export DATABASE_URL='postgresql://...'
+    python scripts/refresh_official_activity_fact.py
+    python scripts/refresh_official_activity_fact.py --source segment --competition-id 812
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from sqlalchemy.orm import Session
+
+from activityAnalysis.load_activity_data import activity_database_is_postgresql, get_engine
+from activityAnalysis.official_activity_fact import (
+    ACTIVITY_SOURCE_ASSIGNMENT,
+    ACTIVITY_SOURCE_SEGMENT,
+    refresh_assignment_facts,
+    refresh_segment_facts,
+)
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Rebuild the activity tracker's official_activity_fact table."
+    )
+    parser.add_argument(
+        "--source",
+        choices=("all", ACTIVITY_SOURCE_ASSIGNMENT, ACTIVITY_SOURCE_SEGMENT),
+        default="all",
+        help="Which fact rows to rebuild (default: all).",
+    )
+    parser.add_argument(
+        "--competition-id",
+        type=int,
+        action="append",
+        help=(
+            "Only these competitions (repeatable): officials_analysis.competition ids for "
+            "assignment rows, public.competition ids for segment rows."
+        ),
+    )
+    args = parser.parse_args()
+
+    if args.competition_id and args.source == "all":
+        print("--competition-id needs --source assignment or segment", file=sys.stderr)
+        sys.exit(2)
+
+    with Session(get_engine()) as session:
+        if args.source in ("all", ACTIVITY_SOURCE_ASSIGNMENT):
+            n = refresh_assignment_facts(session, args.competition_id)
+            print(f"assignment: {n} row(s)")
+        if args.source in ("all", ACTIVITY_SOURCE_SEGMENT):
+            if not activity_database_is_postgresql():
+                print("segment: skipped (protocol tables need PostgreSQL)")
+            else:
+                n = refresh_segment_facts(session, args.competition_id)
+                print(f"segment: {n} row(s)")
+        session.commit()
+
+
+if __name__ == "__main__":
+    main()
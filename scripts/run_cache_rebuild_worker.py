@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Drain the analytics cache rebuild queue (``cache_rebuild_job``).
+
+Competition loads enqueue a job per changed competition; this worker rebuilds cross-judge
+shards, judge excess rows, element / PCS mark shards, σ̂, summaries and the activity
+tracker's protocol-panel facts for each one.
+Run it next to the app (it polls) or from cron with ``--once``.
+
+Example::
+
+    python scripts/run_cache_rebuild_worker.py
+    python scripts/run_cache_rebuild_worker.py --once
+    python scripts/run_cache_rebuild_worker.py --all-scopes --poll-interval 30
+    python scripts/run_cache_rebuild_worker.py --enqueue 42 --once
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+_REPO = Path(__file__).resolve().parents[1]
+if str(_REPO) not in sys.path:
+    sys.path.insert(0, str(_REPO))
+
+from cache_rebuild_queue import (
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_POLL_INTERVAL_S,
+    DEFAULT_REBUILD_SCOPES,
+    DEFAULT_STALE_AFTER_S,
+    enqueue_competition_rebuild,
+    run_worker,
+)
+from database import get_db_session
+from officials_competition_types import ALL_COMPETITION_SCOPES
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Analytics cache rebuild worker")
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Exit when no job is due instead of polling.",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL_S,
+        help=f"Seconds between polls when idle (default: {DEFAULT_POLL_INTERVAL_S:g}).",
+    )
+    parser.add_argument(
+        "--all-scopes",
+        action="store_true",
+        help=(
+            "Warm mark shards / σ̂ / summaries for every competition scope "
+            f"(default: {', '.join(DEFAULT_REBUILD_SCOPES)})."
+        ),
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=DEFAULT_MAX_ATTEMPTS,
+        help=f"Attempts before a job is marked failed (default: {DEFAULT_MAX_ATTEMPTS}).",
+    )
+    parser.add_argument(
+        "--stale-after",
+        type=float,
+        default=DEFAULT_STALE_AFTER_S,
+        help="Requeue running jobs older than this many seconds (dead worker).",
+    )
+    parser.add_argument(
+        "--enqueue",
+        type=int,
+        action="append",
+        metavar="COMPETITION_ID",
+        help="Queue these competition ids before draining (repeatable).",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+
+    if args.enqueue:
+        with get_db_session() as session:
+            for cid in args.enqueue:
+                enqueue_competition_rebuild(session, cid, reason="run_cache_rebuild_worker --enqueue")
+            session.commit()
+        print(f"Queued {len(args.enqueue)} competition(s).")
+
+    scopes = ALL_COMPETITION_SCOPES if args.all_scopes else DEFAULT_REBUILD_SCOPES
+    n = run_worker(
+        get_db_session,
+        once=args.once,
+        poll_interval_s=args.poll_interval,
+        scopes=scopes,
+        max_attempts=args.max_attempts,
+        stale_after_s=args.stale_after,
+    )
+    print(f"Processed {n} job(s).")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -10,6 +10,10 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
+
+import pandas as pd
+
 # Standard labels stored on ``public.segment.level``.
 LEVEL_SENIOR = "Senior"
 LEVEL_JUNIOR = "Junior"
@@ -84,6 +88,7 @@ def normalize_segment_name(s: str | None) -> str:
     return t.strip("_")
 
 
+@lru_cache(maxsize=None)
 def _segment_level_token_pattern(token: str) -> re.Pattern[str]:
     """
     Match a level token in a normalized segment name (underscore-delimited).
@@ -94,6 +99,7 @@ def _segment_level_token_pattern(token: str) -> re.Pattern[str]:
     return re.compile(rf"(?:^|_){body}(?:_|$)")
 
 
+@lru_cache(maxsize=None)
 def _segment_level_embedded_pattern(token: str) -> re.Pattern[str]:
     """Match level tokens glued after event numbers (e.g. ``151BRONZE_SOLO_…``)."""
     body = re.escape(token.upper().replace(" ", "_"))
@@ -112,38 +118,61 @@ _OPEN_COMPOUND = re.compile(
 )
 
 
-def _segment_token_rules() -> list[tuple[re.Pattern[str], str]]:
-    """Ordered longest-/most-specific-first."""
-    return [
-        (_segment_level_token_pattern("INTERMEDIATE NOVICE"), LEVEL_INTERMEDIATE_NOVICE),
-        (_segment_level_token_pattern("ADVANCED NOVICE"), LEVEL_ADVANCED_NOVICE),
-        (_segment_level_token_pattern("BASIC NOVICE"), LEVEL_BASIC_NOVICE),
-        (_segment_level_token_pattern("EXCEL PRELIMINARY PLUS"), LEVEL_EXCEL_PRELIMINARY_PLUS),
-        (_segment_level_token_pattern("EXCEL PRE JUVENILE PLUS"), LEVEL_EXCEL_PRE_JUVENILE_PLUS),
-        (_segment_level_token_pattern("EXCEL PRELIMINARY"), LEVEL_EXCEL_PRELIMINARY),
-        (_segment_level_token_pattern("EXCEL INTERMEDIATE"), LEVEL_EXCEL_INTERMEDIATE),
-        (_segment_level_token_pattern("EXCEL NOVICE"), LEVEL_EXCEL_NOVICE),
-        (_segment_level_token_pattern("EXCEL JUVENILE"), LEVEL_EXCEL_JUVENILE),
-        (_segment_level_token_pattern("EXCEL JUNIOR"), LEVEL_EXCEL_JUNIOR),
-        (_segment_level_token_pattern("EXCEL SENIOR"), LEVEL_EXCEL_SENIOR),
-        (_segment_level_token_pattern("OPEN COLLEGIATE"), LEVEL_OPEN_COLLEGIATE),
-        (_segment_level_token_pattern("OPEN ADULT"), LEVEL_OPEN_ADULT),
-        (_segment_level_token_pattern("OPEN MASTERS"), LEVEL_OPEN_MASTERS),
-        (_segment_level_token_pattern("OPEN JUVENILE"), LEVEL_OPEN_JUVENILE),
-        (_segment_level_token_pattern("MIXED AGE"), LEVEL_MIXED_AGE),
-        (_segment_level_token_pattern("NO TEST"), LEVEL_NO_TEST),
-        (_segment_level_token_pattern("COLLEGIATE"), LEVEL_COLLEGIATE),
-        (_segment_level_token_pattern("PRE PRELIMINARY"), LEVEL_PRE_PRELIMINARY),
-        (_segment_level_token_pattern("PRELIMINARY"), LEVEL_PRELIMINARY),
-        (_segment_level_token_pattern("PRE JUVENILE"), LEVEL_PRE_JUVENILE),
-        (_segment_level_token_pattern("INTERMEDIATE"), LEVEL_INTERMEDIATE),
-        (_segment_level_token_pattern("MASTERS"), LEVEL_MASTERS),
-        (_segment_level_token_pattern("ADULT"), LEVEL_ADULT),
-        (_segment_level_token_pattern("SENIOR"), LEVEL_SENIOR),
-        (_segment_level_token_pattern("JUNIOR"), LEVEL_JUNIOR),
-        (_segment_level_token_pattern("JUVENILE"), LEVEL_JUVENILE),
-        (_segment_level_token_pattern("NOVICE"), LEVEL_NOVICE),
-    ]
+# Ordered longest-/most-specific-first: the first rule whose token appears wins.
+_SEGMENT_TOKEN_RULES: tuple[tuple[str, str], ...] = (
+    ("INTERMEDIATE NOVICE", LEVEL_INTERMEDIATE_NOVICE),
+    ("ADVANCED NOVICE", LEVEL_ADVANCED_NOVICE),
+    ("BASIC NOVICE", LEVEL_BASIC_NOVICE),
+    ("EXCEL PRELIMINARY PLUS", LEVEL_EXCEL_PRELIMINARY_PLUS),
+    ("EXCEL PRE JUVENILE PLUS", LEVEL_EXCEL_PRE_JUVENILE_PLUS),
+    ("EXCEL PRELIMINARY", LEVEL_EXCEL_PRELIMINARY),
+    ("EXCEL INTERMEDIATE", LEVEL_EXCEL_INTERMEDIATE),
+    ("EXCEL NOVICE", LEVEL_EXCEL_NOVICE),
+    ("EXCEL JUVENILE", LEVEL_EXCEL_JUVENILE),
+    ("EXCEL JUNIOR", LEVEL_EXCEL_JUNIOR),
+    ("EXCEL SENIOR", LEVEL_EXCEL_SENIOR),
+    ("OPEN COLLEGIATE", LEVEL_OPEN_COLLEGIATE),
+    ("OPEN ADULT", LEVEL_OPEN_ADULT),
+    ("OPEN MASTERS", LEVEL_OPEN_MASTERS),
+    ("OPEN JUVENILE", LEVEL_OPEN_JUVENILE),
+    ("MIXED AGE", LEVEL_MIXED_AGE),
+    ("NO TEST", LEVEL_NO_TEST),
+    ("COLLEGIATE", LEVEL_COLLEGIATE),
+    ("PRE PRELIMINARY", LEVEL_PRE_PRELIMINARY),
+    ("PRELIMINARY", LEVEL_PRELIMINARY),
+    ("PRE JUVENILE", LEVEL_PRE_JUVENILE),
+    ("INTERMEDIATE", LEVEL_INTERMEDIATE),
+    ("MASTERS", LEVEL_MASTERS),
+    ("ADULT", LEVEL_ADULT),
+    ("SENIOR", LEVEL_SENIOR),
+    ("JUNIOR", LEVEL_JUNIOR),
+    ("JUVENILE", LEVEL_JUVENILE),
+    ("NOVICE", LEVEL_NOVICE),
+)
+
+
+def _compile_segment_token_matcher(rules: tuple[tuple[str, str], ...]) -> re.Pattern[str]:
+    """
+    All token rules in one pattern: a zero-width lookahead tried at every position, one
+    named group per rule. At a given start, alternation order picks the earliest rule.
+    """
+    body = "|".join(
+        f"(?P<r{i}>{re.escape(token.upper().replace(' ', '_'))})"
+        for i, (token, _) in enumerate(rules)
+    )
+    return re.compile(rf"(?=(?:^|_)(?:{body})(?:_|$))")
+
+
+_SEGMENT_TOKEN_MATCHER = _compile_segment_token_matcher(_SEGMENT_TOKEN_RULES)
+
+
+def _segment_token_rule_level(segment_norm: str) -> str | None:
+    """Label of the earliest rule in ``_SEGMENT_TOKEN_RULES`` found in ``segment_norm``."""
+    best = min(
+        (int(m.lastgroup[1:]) for m in _SEGMENT_TOKEN_MATCHER.finditer(segment_norm)),
+        default=None,
+    )
+    return None if best is None else _SEGMENT_TOKEN_RULES[best][1]
 
 
 # Abbreviations / typos / multi-token Excel levels (checked before catch-all).
@@ -198,6 +227,7 @@ _COMPETITION_SENIOR = re.compile(
     r"\bISU\s+GRAND\s+PRIX\b|\bINTERNATIONAL\s+CHALLENGE\s+CUP\b",
     re.I,
 )
+_COMPETITION_OLYMPIC = re.compile(r"\bOWG\b|\bOLYMPIC\b", re.I)
 _TEAM_EVENT_SEGMENT = _segment_level_token_pattern("TEAM EVENT")
 
 # US Championships (and similar) segment names: ``CHAMPIONSHIP_PAIRS_FREE_SKATING``, etc.
@@ -207,6 +237,7 @@ _US_CHAMPIONSHIP_SEGMENT = re.compile(
 
 # Synchro / domestic program labels (checked before generic tokens).
 _ELITE_LEVEL_SEGMENT = re.compile(r"(?:^|_)ELITE_\d+(?:_|$)")
+_ASPIRE_SEGMENT = _segment_level_token_pattern("ASPIRE")
 _UNIFIED_PROGRAM_RULES: list[tuple[re.Pattern[str], str]] = [
     (re.compile(r"SPECIAL_OLYMPICS"), LEVEL_UNIFIED),
     (re.compile(r"SKATE_UNITED"), LEVEL_UNIFIED),
@@ -223,6 +254,7 @@ _DANCE_CONTEXT = re.compile(
     r"(?:^|_)SOLO_DANCE(?:_|$)|(?:^|_)SOLO(?:_|$)|"
     r"PARTNERED_PATTERN_DANCE|(?:^|_)PATTERN_DANCE(?:_|$)|(?:^|_)ICE_DANCE(?:_|$)"
 )
+_COMPETITION_SOLO_DANCE = re.compile(r"SOLO\s+DANCE|SOLO\s+ICE\s+DANCE|SHADOW\s+DANCE")
 _DANCE_AND_THEATRE_LEVEL_TOKENS: list[tuple[str, str]] = [
     ("INTERNATIONAL", LEVEL_INTERNATIONAL),
     ("OPEN", LEVEL_OPEN_LEVEL),
@@ -233,6 +265,9 @@ _DANCE_AND_THEATRE_LEVEL_TOKENS: list[tuple[str, str]] = [
     ("SILVER", LEVEL_SILVER),
     ("GOLD", LEVEL_GOLD),
 ]
+_THEATRE_LEVEL_TOKENS: list[tuple[str, str]] = [
+    (t, l) for t, l in _DANCE_AND_THEATRE_LEVEL_TOKENS if t != "INTERNATIONAL"
+]
 
 
 def _context_level_from_tokens(
@@ -283,7 +318,7 @@ def _is_ice_or_solo_dance_context(
         return True
     comp = (competition_name or "").upper()
     return bool(
-        re.search(r"SOLO\s+DANCE|SOLO\s+ICE\s+DANCE|SHADOW\s+DANCE", comp)
+        _COMPETITION_SOLO_DANCE.search(comp)
         or "SOLO_DANCE" in normalize_segment_name(competition_name)
     )
 
@@ -317,10 +352,7 @@ def _theatre_on_ice_segment_level(
     """
     if not _is_theatre_on_ice_context(segment_norm, competition_name):
         return None
-    return _context_level_from_tokens(
-        segment_norm,
-        [(t, l) for t, l in _DANCE_AND_THEATRE_LEVEL_TOKENS if t != "INTERNATIONAL"],
-    )
+    return _context_level_from_tokens(segment_norm, _THEATRE_LEVEL_TOKENS)
 
 
 def _lts_segment_level(segment_norm: str, competition_name: str = "") -> str | None:
@@ -346,7 +378,7 @@ def _domestic_program_segment_level(segment_norm: str) -> str | None:
     """Aspire, Unified (incl. Skate United / Special Olympics), Elite N → Senior."""
     if _ELITE_LEVEL_SEGMENT.search(segment_norm):
         return LEVEL_SENIOR
-    if _segment_level_token_pattern("ASPIRE").search(segment_norm):
+    if _ASPIRE_SEGMENT.search(segment_norm):
         return LEVEL_ASPIRE
     for pattern, label in _UNIFIED_PROGRAM_RULES:
         if pattern.search(segment_norm):
@@ -385,9 +417,9 @@ def _level_from_segment_tokens(
     program = _domestic_program_segment_level(segment_norm)
     if program:
         return program
-    for pattern, label in _segment_token_rules():
-        if pattern.search(segment_norm):
-            return label
+    token = _segment_token_rule_level(segment_norm)
+    if token:
+        return token
     excel = _excel_special_level(segment_norm)
     if excel:
         return excel
@@ -404,7 +436,7 @@ def _international_competition_fallback(
     if _TEAM_EVENT_SEGMENT.search(segment_norm):
         if _COMPETITION_JUNIOR.search(comp):
             return SegmentLevelResult(LEVEL_JUNIOR, SOURCE_COMPETITION_NAME)
-        if _COMPETITION_SENIOR.search(comp) or re.search(r"\bOWG\b|\bOLYMPIC\b", comp, re.I):
+        if _COMPETITION_SENIOR.search(comp) or _COMPETITION_OLYMPIC.search(comp):
             return SegmentLevelResult(LEVEL_SENIOR, SOURCE_COMPETITION_NAME)
     if _COMPETITION_JUNIOR.search(comp):
         return SegmentLevelResult(LEVEL_JUNIOR, SOURCE_COMPETITION_NAME)
@@ -413,19 +445,26 @@ def _international_competition_fallback(
     return None
 
 
-def classify_segment_level(
-    segment_name: str,
-    *,
-    competition_name: str = "",
-    international: bool = False,
-    discipline_type_id: int | None = None,
-) -> SegmentLevelResult:
-    """
-    Return a standardized level label and how it was inferred.
+# Distinct (normalized segment, competition, international, discipline) keys seen per process.
+_CLASSIFY_CACHE_SIZE = 65536
 
-    Explicit tokens in ``segment_name`` always win over competition-name inference.
-    """
-    segment_norm = normalize_segment_name(segment_name)
+# Rows per ``UPDATE segment … WHERE id IN (…)`` in ``update_segment_levels``.
+_LEVEL_UPDATE_CHUNK = 5000
+
+
+def _discipline_key(discipline_type_id) -> int | None:
+    if discipline_type_id is None or pd.isna(discipline_type_id):
+        return None
+    return int(discipline_type_id)
+
+
+@lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)
+def _classify_normalized(
+    segment_norm: str,
+    competition_name: str,
+    international: bool,
+    discipline_type_id: int | None,
+) -> SegmentLevelResult:
     if not segment_norm:
         return SegmentLevelResult(LEVEL_UNSPECIFIED, SOURCE_UNSPECIFIED)
 
@@ -450,6 +489,28 @@ def classify_segment_level(
     return SegmentLevelResult(LEVEL_UNSPECIFIED, SOURCE_UNSPECIFIED)
 
 
+def classify_segment_level(
+    segment_name: str,
+    *,
+    competition_name: str = "",
+    international: bool = False,
+    discipline_type_id: int | None = None,
+) -> SegmentLevelResult:
+    """
+    Return a standardized level label and how it was inferred.
+
+    Explicit tokens in ``segment_name`` always win over competition-name inference.
+    Results are memoized on (normalized segment name, competition name, international,
+    discipline type id).
+    """
+    return _classify_normalized(
+        normalize_segment_name(segment_name),
+        competition_name or "",
+        bool(international),
+        _discipline_key(discipline_type_id),
+    )
+
+
 def classify_segment_level_for_row(
     segment_name: str,
     competition_name: str,
@@ -464,3 +525,69 @@ def classify_segment_level_for_row(
         international=bool(international),
         discipline_type_id=discipline_type_id,
     )
+
+
+def classify_segment_levels_frame(segments: pd.DataFrame) -> pd.DataFrame:
+    """
+    Classify every row of ``segments`` (``segment_name``, ``competition_name``,
+    ``international`` and optionally ``discipline_type_id``), once per distinct key.
+
+    Returns a copy with ``level`` and ``level_source`` columns added.
+    """
+    out = segments.copy()
+    n = len(out)
+    disciplines = (
+        out["discipline_type_id"].tolist() if "discipline_type_id" in out else [None] * n
+    )
+    keys = list(
+        zip(
+            [normalize_segment_name(s) for s in out["segment_name"].fillna("").astype(str)],
+            out["competition_name"].fillna("").astype(str).tolist(),
+            out["international"].fillna(False).astype(bool).tolist(),
+            [_discipline_key(d) for d in disciplines],
+        )
+    )
+    results = {key: _classify_normalized(*key) for key in set(keys)}
+    out["level"] = pd.Series([results[k].level for k in keys], index=out.index, dtype=object)
+    out["level_source"] = pd.Series(
+        [results[k].source for k in keys], index=out.index, dtype=object
+    )
+    return out
+
+
+def update_segment_levels(
+    session,
+    classified: pd.DataFrame,
+    *,
+    chunk_size: int = _LEVEL_UPDATE_CHUNK,
+) -> int:
+    """
+    Write ``level`` / ``level_source`` from ``classify_segment_levels_frame`` output
+    (needs ``segment_id``) with one ``UPDATE segment … WHERE id IN (…)`` per distinct
+    (level, source) pair and id chunk, skipping rows that already match. No commit;
+    returns the number of rows changed.
+    """
+    from sqlalchemy import or_, update
+
+    from models import Segment
+
+    if classified.empty:
+        return 0
+    changed = 0
+    for (level, source), group in classified.groupby(["level", "level_source"], sort=False):
+        ids = sorted({int(i) for i in group["segment_id"]})
+        for start in range(0, len(ids), max(1, chunk_size)):
+            result = session.execute(
+                update(Segment)
+                .where(Segment.id.in_(ids[start : start + chunk_size]))
+                .where(
+                    or_(
+                        Segment.level.is_distinct_from(level),
+                        Segment.level_source.is_distinct_from(source),
+                    )
+                )
+                .values(level=level, level_source=source)
+                .execution_options(synchronize_session=False)
+            )
+            changed += int(result.rowcount or 0)
+    return changed
@@ -127,6 +127,7 @@ def backfill_one_competition(
         )
         return out
 
+    rows_by_segment: dict[int, list] = {}
     for href, cover_label in pairs:
         seg_url = f"{base_url}/{href}"
         seg_html = get_page_contents(seg_url)
@@ -157,12 +158,12 @@ def backfill_one_competition(
                 f"(normalized {db_segment_name!r}, from {href})"
             )
             continue
-        if dry_run:
-            out["updated"] += 1
-            continue
-        loader.replace_segment_officials(segment.id, rows)
+        rows_by_segment[segment.id] = rows
         out["updated"] += 1
 
+    # One resolve pass and one upsert for the competition's panels.
+    if rows_by_segment and not dry_run:
+        loader.replace_competition_segment_officials(rows_by_segment)
     return out
 
 
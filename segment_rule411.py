@@ -0,0 +1,412 @@
+"""
+ISU Rule 411(b) entry / ISU Member checks per ``public.segment``, persisted at load time.
+
+The rule evaluation (NOC parsing from skater names, discipline category, entry and member
+minimums) lives here so the protocol loader can store one
+``public.segment_rule411_eligibility`` row per segment when its results are written.
+Skater entries never change once a segment is loaded, so panel reads join that table
+instead of re-parsing skater names (``activityAnalysis/international_segment_eligibility.py``
+falls back to computing segments that have no stored row yet).
+
+    python scripts/backfill_segment_rule411_eligibility.py   # existing segments
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, Literal
+
+from sqlalchemy import bindparam, delete, insert, text
+
+from cache_rebuild_queue import bump_protocol_table_versions
+from models import SegmentRule411Eligibility
+
+# ``public.discipline_type.id`` on IJS segments.
+SEGMENT_DISCIPLINE_TYPE_SINGLES = 1
+SEGMENT_DISCIPLINE_TYPE_PAIRS = 2
+SEGMENT_DISCIPLINE_TYPE_ICE_DANCE = 3
+SEGMENT_DISCIPLINE_TYPE_SYNCHRONIZED = 5
+
+DisciplineCategory = Literal["singles", "pairs", "dance", "synchronized", "other"]
+
+RULE411_MIN_ENTRIES: dict[DisciplineCategory, int | None] = {
+    "singles": 6,
+    "pairs": 4,
+    "dance": 4,
+    "synchronized": None,
+    "other": None,
+}
+RULE411_MIN_ISU_MEMBERS = 2
+
+_NOC_TOKEN_RE = re.compile(r"^[A-Z]{3}$")
+# False positives such as "THE" are rare on ISU results; keep a small denylist.
+_NOC_DENYLIST = frozenset({"THE", "AND", "FOR"})
+
+
+@dataclass(frozen=True)
+class SegmentRule411Stats:
+    segment_id: int
+    entry_count: int
+    distinct_noc_count: int
+    nocs_parsed_from_entries: int
+    discipline_category: DisciplineCategory
+    min_entries_required: int | None
+    meets_entry_minimum: bool
+    meets_member_minimum: bool | None
+    eligible: bool
+    status_label: str
+    detail: str
+
+
+def extract_noc_from_skater_name(name: str) -> str | None:
+    """Return a three-letter NOC suffix from an ISU-style skater name, if present."""
+    text = (name or "").strip()
+    if not text:
+        return None
+    token = text.split()[-1].upper()
+    if _NOC_TOKEN_RE.fullmatch(token) and token not in _NOC_DENYLIST:
+        return token
+    return None
+
+
+def discipline_category_from_segment(
+    *,
+    segment_discipline: Any = None,
+    segment_discipline_type_id: Any = None,
+) -> DisciplineCategory:
+    try:
+        dt_id = int(segment_discipline_type_id)
+    except (TypeError, ValueError):
+        dt_id = None
+
+    if dt_id == SEGMENT_DISCIPLINE_TYPE_SINGLES:
+        return "singles"
+    if dt_id == SEGMENT_DISCIPLINE_TYPE_PAIRS:
+        return "pairs"
+    if dt_id == SEGMENT_DISCIPLINE_TYPE_ICE_DANCE:
+        return "dance"
+    if dt_id == SEGMENT_DISCIPLINE_TYPE_SYNCHRONIZED:
+        return "synchronized"
+
+    label = str(segment_discipline or "").strip().lower()
+    if "single" in label:
+        return "singles"
+    if "pair" in label:
+        return "pairs"
+    if "dance" in label:
+        return "dance"
+    if "synch" in label:
+        return "synchronized"
+    return "other"
+
+
+def min_entries_for_discipline(category: DisciplineCategory) -> int | None:
+    return RULE411_MIN_ENTRIES.get(category)
+
+
+_HAND_ENTERED_SEGMENT_DETAIL = (
+    "Hand-entered segment (no skater results loaded); counts for international service"
+)
+
+
+def _hand_entered_segment_rule411_stats(
+    discipline_category: DisciplineCategory,
+    *,
+    segment_id: int = -1,
+) -> SegmentRule411Stats:
+    """Segments with zero entries are manually tracked; pass Rule 411."""
+    return SegmentRule411Stats(
+        segment_id=segment_id,
+        entry_count=0,
+        distinct_noc_count=0,
+        nocs_parsed_from_entries=0,
+        discipline_category=discipline_category,
+        min_entries_required=min_entries_for_discipline(discipline_category),
+        meets_entry_minimum=True,
+        meets_member_minimum=None,
+        eligible=True,
+        status_label="Yes",
+        detail=_HAND_ENTERED_SEGMENT_DETAIL,
+    )
+
+
+def _evaluate_synchronized_rule411(
+    *,
+    entry_count: int,
+    distinct_noc_count: int,
+    nocs_parsed_from_entries: int,
+) -> SegmentRule411Stats:
+    """Synchronized: two ISU Member countries only (no team-count minimum)."""
+    if entry_count == 0:
+        return _hand_entered_segment_rule411_stats("synchronized")
+    if nocs_parsed_from_entries == 0:
+        return SegmentRule411Stats(
+            segment_id=-1,
+            entry_count=entry_count,
+            distinct_noc_count=distinct_noc_count,
+            nocs_parsed_from_entries=nocs_parsed_from_entries,
+            discipline_category="synchronized",
+            min_entries_required=None,
+            meets_entry_minimum=True,
+            meets_member_minimum=None,
+            eligible=True,
+            status_label="Unverified nations",
+            detail=(
+                f"{entry_count} teams; need {RULE411_MIN_ISU_MEMBERS} ISU Members — "
+                "member count not verified from team names"
+            ),
+        )
+    meets_members = distinct_noc_count >= RULE411_MIN_ISU_MEMBERS
+    if meets_members:
+        return SegmentRule411Stats(
+            segment_id=-1,
+            entry_count=entry_count,
+            distinct_noc_count=distinct_noc_count,
+            nocs_parsed_from_entries=nocs_parsed_from_entries,
+            discipline_category="synchronized",
+            min_entries_required=None,
+            meets_entry_minimum=True,
+            meets_member_minimum=True,
+            eligible=True,
+            status_label="Yes",
+            detail=(
+                f"{entry_count} teams, {distinct_noc_count} ISU Members "
+                f"(need {RULE411_MIN_ISU_MEMBERS} Members)"
+            ),
+        )
+    return SegmentRule411Stats(
+        segment_id=-1,
+        entry_count=entry_count,
+        distinct_noc_count=distinct_noc_count,
+        nocs_parsed_from_entries=nocs_parsed_from_entries,
+        discipline_category="synchronized",
+        min_entries_required=None,
+        meets_entry_minimum=True,
+        meets_member_minimum=False,
+        eligible=False,
+        status_label="No",
+        detail=(
+            f"{distinct_noc_count}/{RULE411_MIN_ISU_MEMBERS} ISU Members "
+            f"({entry_count} teams)"
+        ),
+    )
+
+
+def evaluate_segment_rule411(
+    *,
+    entry_count: int,
+    distinct_noc_count: int,
+    nocs_parsed_from_entries: int,
+    discipline_category: DisciplineCategory,
+) -> SegmentRule411Stats:
+    if entry_count == 0:
+        return _hand_entered_segment_rule411_stats(discipline_category)
+    if discipline_category == "synchronized":
+        return _evaluate_synchronized_rule411(
+            entry_count=entry_count,
+            distinct_noc_count=distinct_noc_count,
+            nocs_parsed_from_entries=nocs_parsed_from_entries,
+        )
+
+    min_entries = min_entries_for_discipline(discipline_category)
+    meets_entries = min_entries is None or entry_count >= min_entries
+
+    meets_members: bool | None
+    if min_entries is None:
+        meets_members = None
+    elif nocs_parsed_from_entries == 0:
+        meets_members = None
+    else:
+        meets_members = distinct_noc_count >= RULE411_MIN_ISU_MEMBERS
+
+    if min_entries is None:
+        eligible = True
+        status = "N/A (discipline)"
+        detail = "Rule 411 entry minimums apply to Singles, Pairs, and Ice Dance."
+    elif not meets_entries:
+        eligible = False
+        status = "No"
+        detail = (
+            f"{entry_count}/{min_entries} entries "
+            f"({discipline_category.replace('_', ' ')})"
+        )
+    elif meets_members is False:
+        eligible = False
+        status = "No"
+        detail = (
+            f"{distinct_noc_count}/{RULE411_MIN_ISU_MEMBERS} ISU Members "
+            f"({entry_count} entries)"
+        )
+    elif meets_members is None:
+        eligible = True
+        status = "Unverified nations"
+        detail = (
+            f"{entry_count} entries (need {min_entries}); "
+            "ISU Member count not verified from skater names"
+        )
+    else:
+        eligible = True
+        status = "Yes"
+        detail = (
+            f"{entry_count} entries, {distinct_noc_count} ISU Members "
+            f"(need {min_entries} entries, {RULE411_MIN_ISU_MEMBERS} Members)"
+        )
+
+    return SegmentRule411Stats(
+        segment_id=-1,
+        entry_count=entry_count,
+        distinct_noc_count=distinct_noc_count,
+        nocs_parsed_from_entries=nocs_parsed_from_entries,
+        discipline_category=discipline_category,
+        min_entries_required=min_entries,
+        meets_entry_minimum=meets_entries,
+        meets_member_minimum=meets_members,
+        eligible=eligible,
+        status_label=status,
+        detail=detail,
+    )
+
+
+def segment_rule411_record(
+    segment_id: int,
+    skater_names: Iterable[str],
+    *,
+    segment_discipline: Any = None,
+    segment_discipline_type_id: Any = None,
+) -> dict[str, Any]:
+    """``segment_rule411_eligibility`` column values for one segment's entries."""
+    names = [str(n or "") for n in skater_names]
+    nocs = [n for n in (extract_noc_from_skater_name(nm) for nm in names) if n]
+    category = discipline_category_from_segment(
+        segment_discipline=segment_discipline,
+        segment_discipline_type_id=segment_discipline_type_id,
+    )
+    stats = evaluate_segment_rule411(
+        entry_count=len(names),
+        distinct_noc_count=len(set(nocs)),
+        nocs_parsed_from_entries=len(nocs),
+        discipline_category=category,
+    )
+    return {
+        "segment_id": int(segment_id),
+        "entry_count": stats.entry_count,
+        "distinct_noc_count": stats.distinct_noc_count,
+        "nocs_parsed": stats.nocs_parsed_from_entries,
+        "discipline_category": stats.discipline_category,
+        "min_entries": stats.min_entries_required,
+        "meets_entry_minimum": stats.meets_entry_minimum,
+        "meets_member_minimum": stats.meets_member_minimum,
+        "eligible": stats.eligible,
+        "status": stats.status_label,
+        "detail": stats.detail,
+    }
+
+
+def segment_rule411_records(session, segment_ids: Iterable[int]) -> list[dict[str, Any]]:
+    """Evaluate Rule 411 for ``segment_ids`` from ``skater_segment`` (two queries)."""
+    ids = sorted({int(x) for x in segment_ids if x is not None})
+    if not ids:
+        return []
+    segments = session.execute(
+        text(
+            """
+            SELECT s.id AS segment_id,
+                   s.discipline_type_id,
+                   dt.name AS segment_discipline
+            FROM segment s
+            LEFT JOIN discipline_type dt ON dt.id = s.discipline_type_id
+            WHERE s.id IN :segment_ids
+            """
+        ).bindparams(bindparam("segment_ids", expanding=True)),
+        {"segment_ids": ids},
+    ).mappings().all()
+    entries = session.execute(
+        text(
+            """
+            SELECT ss.segment_id, sk.name AS skater_name
+            FROM skater_segment ss
+            INNER JOIN skater sk ON sk.id = ss.skater_id
+            WHERE ss.segment_id IN :segment_ids
+            """
+        ).bindparams(bindparam("segment_ids", expanding=True)),
+        {"segment_ids": ids},
+    ).all()
+    names_by_segment: dict[int, list[str]] = {}
+    for segment_id, skater_name in entries:
+        names_by_segment.setdefault(int(segment_id), []).append(str(skater_name or ""))
+    return [
+        segment_rule411_record(
+            int(seg["segment_id"]),
+            names_by_segment.get(int(seg["segment_id"]), []),
+            segment_discipline=seg["segment_discipline"],
+            segment_discipline_type_id=seg["discipline_type_id"],
+        )
+        for seg in segments
+    ]
+
+
+def refresh_segment_rule411_eligibility(session, segment_ids: Iterable[int]) -> int:
+    """
+    Replace stored Rule 411 rows for ``segment_ids``. Returns rows written.
+    Flushes but does not commit.
+    """
+    ids = sorted({int(x) for x in segment_ids if x is not None})
+    if not ids:
+        return 0
+    session.flush()
+    records = segment_rule411_records(session, ids)
+    session.execute(
+        delete(SegmentRule411Eligibility).where(SegmentRule411Eligibility.segment_id.in_(ids))
+    )
+    if records:
+        session.execute(insert(SegmentRule411Eligibility), records)
+    bump_protocol_table_versions(session)
+    return len(records)
+
+
+def segment_ids_missing_rule411_eligibility(
+    session,
+    *,
+    competition_ids: Iterable[int] | None = None,
+    limit: int | None = None,
+) -> list[int]:
+    """Segments without a stored row (backfill work list), lowest id first."""
+    sql = """
+        SELECT s.id
+        FROM segment s
+        WHERE NOT EXISTS (
+            SELECT 1 FROM segment_rule411_eligibility r WHERE r.segment_id = s.id
+        )
+    """
+    params: dict[str, Any] = {}
+    stmt_binds = []
+    if competition_ids is not None:
+        sql += " AND s.competition_id IN :competition_ids"
+        params["competition_ids"] = sorted({int(c) for c in competition_ids})
+        stmt_binds.append(bindparam("competition_ids", expanding=True))
+    sql += " ORDER BY s.id"
+    if limit is not None:
+        sql += " LIMIT :limit"
+        params["limit"] = int(limit)
+    stmt = text(sql).bindparams(*stmt_binds)
+    return [int(r[0]) for r in session.execute(stmt, params).all()]
+
+
+def segment_rule411_table_exists(session) -> bool:
+    """True once ``scripts/migrations/012_segment_rule411_eligibility.sql`` has run."""
+    try:
+        row = session.execute(
+            text(
+                """
+                SELECT 1
+                FROM information_schema.tables
+                WHERE table_schema = 'public'
+                  AND table_name = 'segment_rule411_eligibility'
+                LIMIT 1
+                """
+            )
+        ).first()
+    except Exception:
+        return False
+    return row is not None
@@ -0,0 +1,62 @@
+"""Cold-start guard: the landing page path must not import other pages' heavy modules."""
+
+import json
+import os
+import subprocess
+import sys
+
+import analysis_pages
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Generous wall-clock budget for a fresh interpreter (streamlit + pandas + SQLAlchemy models).
+_COLD_IMPORT_BUDGET_S = 10.0
+
+_HEAVY_MODULES = (
+    "scipy",
+    "element_deviation_ranking",
+    "element_deviation_ranking_job",
+    "element_ranking_cache",
+    "pcs_deviation_analysis",
+    "pcs_quality_analysis",
+    "admin_sections",
+    "analysis_pages.element_ranking",
+    "analysis_pages.cross_judge",
+)
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import app_query_params, analytics_connection
+import analysis_pages, analysis_pages.common, analysis_pages.individual_judge
+elapsed = time.perf_counter() - t0
+print(json.dumps({"elapsed": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+"""
+
+
+def test_landing_page_import_stays_light():
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE % (_HEAVY_MODULES,)],
+        cwd=_REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    probe = json.loads(out.stdout.strip().splitlines()[-1])
+    assert probe["loaded"] == []
+    assert probe["elapsed"] < _COLD_IMPORT_BUDGET_S
+
+
+def test_every_registered_page_resolves_to_a_render_function():
+    import ast
+
+    for label, (module_name, func_name) in analysis_pages.PAGE_MODULES.items():
+        path = os.path.join(_REPO_ROOT, *module_name.split(".")) + ".py"
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+        names = {n.name for n in tree.body if isinstance(n, ast.FunctionDef)}
+        assert func_name in names, label
+
+
+def test_render_page_unknown_label():
+    assert analysis_pages.render_page("No such page") is False
@@ -0,0 +1,140 @@
+"""Set-based assignment import: plan / diff / apply against SQLite."""
+
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("DATABASE_URL", "sqlite:////tmp/activity_tracker_tests.db")
+
+import activityAnalysis.load_activity_data as lad
+from activityAnalysis.assignment_import import import_assignments, plan_assignment_import
+from activityAnalysis.officials_analysis_models import (
+    AppointmentTypes,
+    Assignment,
+    Base,
+    Competition,
+    CompetitionType,
+    Disciplines,
+    OfficialActivityFact,
+    Officials,
+)
+
+JUDGE = 1
+
+
+@pytest.fixture
+def session(tmp_path):
+    eng = create_engine(
+        f"sqlite:///{tmp_path / 'activity.db'}",
+        execution_options={"schema_translate_map": {"officials_analysis": None}},
+    )
+    Base.metadata.create_all(eng)
+    with Session(eng) as s:
+        s.add_all([
+            AppointmentTypes(id=JUDGE, name="Competition Judge"),
+            Disciplines(id=1, name="Singles"),
+            CompetitionType(id=1, name="Eastern Sectional"),
+            CompetitionType(id=4, name="US Championships"),
+            Officials(id=10, full_name="Ann A"),
+            Officials(id=11, full_name="Ben B"),
+            Competition(id=1, name="US Championships", year=2023, competition_type_id=4),
+        ])
+        s.flush()
+        s.add(Assignment(id=1, competition_id=1, official_id=10, discipline_id=1,
+                         appointment_type_id=JUDGE, chief=False, lower_levels_only=False))
+        s.commit()
+        yield s
+    eng.dispose()
+
+
+def _pending(rows):
+    return pd.DataFrame(
+        rows,
+        columns=[
+            "year", "competition_name", "competition_type_id", "official_id",
+            "discipline_id", "appointment_type_id", "chief", "lower_levels_only",
+        ],
+    )
+
+
+def test_plan_classifies_rows_and_dry_run_writes_nothing(session):
+    pending = _pending([
+        (2023, "US Championships", 4, 10, 1, JUDGE, True, False),   # chief flag changed
+        (2023, "US Championships", 4, 11, 1, JUDGE, False, False),  # new assignment
+        (2024, "US Championships", 4, 10, 1, JUDGE, False, False),  # new competition
+        (2024, "US Championships", 4, 10, 1, JUDGE, True, False),   # repeat key: first wins
+    ])
+    plan = import_assignments(session, pending, dry_run=True)
+    assert plan.counts() == {"insert": 2, "update": 1, "unchanged": 0, "new_competitions": 1}
+    assert plan.changes()["official_id"].tolist() == [10, 11, 10]
+    assert session.scalars(select(Assignment.id)).all() == [1]
+    assert session.scalars(select(Competition.id)).all() == [1]
+
+
+def test_apply_inserts_updates_and_refreshes_facts(session):
+    pending = _pending([
+        (2023, "US Championships", 4, 10, 1, JUDGE, True, False),
+        (2024, "US Championships", 4, 11, 1, JUDGE, False, True),
+    ])
+    import_assignments(session, pending)
+    session.commit()
+    rows = session.execute(
+        select(Competition.year, Assignment.official_id, Assignment.chief,
+               Assignment.lower_levels_only)
+        .join(Competition, Competition.id == Assignment.competition_id)
+        .order_by(Competition.year, Assignment.official_id)
+    ).all()
+    assert rows == [(2023, 10, True, False), (2024, 11, False, True)]
+    facts = session.scalars(select(OfficialActivityFact.competition_id)).all()
+    assert len(facts) == 2
+
+    again = plan_assignment_import(session, pending)
+    assert again.counts() == {"insert": 0, "update": 0, "unchanged": 2, "new_competitions": 0}
+
+
+def test_sectionals_match_existing_competition_by_type_and_year(session):
+    session.add(Competition(id=2, name="Eastern Sectionals", year=2024, competition_type_id=1))
+    session.commit()
+    pending = _pending([
+        (2024, "Eastern Sectional Singles", 1, 10, 1, JUDGE, False, False),
+        (2025, "Eastern Sectional Singles", 1, 10, 1, JUDGE, False, False),
+        (2025, "Eastern Sectional Pairs", 1, 11, 1, JUDGE, False, False),
+    ])
+    plan = plan_assignment_import(session, pending, match_competitions_by_type_and_year=True)
+    assert plan.rows["competition_id"].tolist()[0] == 2
+    assert plan.counts()["new_competitions"] == 1
+    import_assignments(session, pending, match_competitions_by_type_and_year=True)
+    session.commit()
+    by_year = dict(
+        session.execute(
+            select(Competition.year, Competition.name).where(Competition.competition_type_id == 1)
+        ).all()
+    )
+    assert by_year == {2024: "Eastern Sectionals", 2025: "Eastern Sectional Singles"}
+
+
+def test_insert_assignments_drops_unmatched_and_unmapped_rows(session, monkeypatch, capsys):
+    monkeypatch.setattr(lad, "retired_official_names", lambda: frozenset({"Old Official"}))
+    event_df = pd.DataFrame({
+        "Person": ["Ann A", "Ben B", "Nobody", "Old Official"],
+        "Position": ["Judge", "Mystery", "Judge", "Judge"],
+        "Year": [2023, 2023, 2023, 2023],
+        "CompetitionName": ["US Championships"] * 4,
+        "CompetitionType": [4, 4, 4, 4],
+        "Discipline": [1, None, 1, 1],
+        "Appointment_Type_Id": [JUDGE, None, JUDGE, JUDGE],
+        "Chief": [False, False, False, False],
+        "Lower_Levels_Only": [False, False, False, False],
+    })
+    plan = lad.insert_assignments(session, event_df, {"Ann A": 10, "Ben B": 11})
+    out = capsys.readouterr().out
+    assert "Missing official: Nobody" in out
+    assert "Old Official" not in out
+    assert "Missing mapping" in out
+    assert plan.counts() == {"insert": 0, "update": 0, "unchanged": 1, "new_competitions": 0}
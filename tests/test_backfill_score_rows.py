@@ -1,6 +1,7 @@
 import importlib.util
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
 _ROOT = Path(__file__).resolve().parents[1]
 _spec = importlib.util.spec_from_file_location(
@@ -40,3 +41,112 @@ def test_merge_score_rows_keeps_pdf_when_html_missing():
     merged = _mod._merge_score_rows_prefer_html([], [pdf_row])
     assert len(merged) == 1
     assert merged[0]["parse_mode"] == "fsm_pdf"
+
+
+def _run_state_session(tmp_path):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from models import Competition, RuleErrorBackfillSegment, Segment
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'backfill.db'}")
+    for model in (Competition, Segment, RuleErrorBackfillSegment):
+        model.__table__.create(engine)
+    session = Session(engine)
+    session.add(Competition(id=1, name="Comp", year="2526", results_url="https://x.test/"))
+    session.add_all(
+        Segment(id=seg_id, name=f"S{seg_id}", competition_id=1, discipline_type_id=1)
+        for seg_id in (1, 2, 3)
+    )
+    session.commit()
+    return session
+
+
+class _Loader:
+    def __init__(self, session):
+        self.session = session
+        self.commits = 0
+
+    def commit(self):
+        self.session.commit()
+        self.commits += 1
+
+
+def test_backfill_competition_records_run_state_in_batches(tmp_path, monkeypatch):
+    from models import Competition, RuleErrorBackfillSegment, Segment
+
+    session = _run_state_session(tmp_path)
+    statuses = {1: "done", 2: "skipped", 3: "error"}
+
+    def fake_outcomes(loader, competition, segments, **_kwargs):
+        for seg in segments:
+            result = {"rule_errors_flagged": 4} if statuses[seg.id] == "done" else None
+            yield _mod._SegmentOutcome(seg.id, seg.name, statuses[seg.id], "why", result)
+
+    monkeypatch.setattr(_mod, "_competition_outcomes", fake_outcomes)
+    loader = _Loader(session)
+    outcomes = _mod.backfill_competition(
+        loader,
+        session.get(Competition, 1),
+        session.query(Segment).order_by(Segment.id).all(),
+        http_session=None,
+        pdf_dir=tmp_path,
+        dry_run=False,
+        run_name="r1",
+        batch_segments=2,
+    )
+    assert [o.status for o in outcomes] == ["done", "skipped", "error"]
+    assert loader.commits == 2
+    rows = session.query(RuleErrorBackfillSegment).order_by(RuleErrorBackfillSegment.segment_id)
+    assert [(r.segment_id, r.status, r.rule_errors_flagged) for r in rows] == [
+        (1, "done", 4),
+        (2, "skipped", 0),
+        (3, "error", 0),
+    ]
+
+    # A resumed run only revisits the failed segment; other run names see everything.
+    args = SimpleNamespace(
+        scope="all", competition_ids_csv=None, competition_id=None,
+        segment_id=None, year=None, run="r1",
+    )
+    assert [seg.id for seg, _ in _mod._build_segment_query(session, args)] == [3]
+    args.run = "r2"
+    assert [seg.id for seg, _ in _mod._build_segment_query(session, args)] == [1, 2, 3]
+    session.close()
+
+
+def test_parallel_run_counts_a_failed_worker_and_keeps_going(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    def fake_worker(comp_id, segment_ids, *_args):
+        if comp_id == 2:
+            raise RuntimeError("index parse blew up")
+        return comp_id, f"C{comp_id}", [
+            _mod._SegmentOutcome(sid, f"S{sid}", "done", result={}) for sid in segment_ids
+        ]
+
+    class _Pool(ThreadPoolExecutor):
+        def __init__(self, max_workers, **_spawn_kwargs):
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(_mod, "ProcessPoolExecutor", _Pool)
+    monkeypatch.setattr(_mod, "_backfill_competition_in_worker", fake_worker)
+    monkeypatch.setattr(_mod, "get_database_url", lambda: "sqlite://")
+
+    def seg(sid):
+        return SimpleNamespace(id=sid, name=f"S{sid}")
+
+    by_competition = {
+        1: (SimpleNamespace(id=1, name="C1"), [seg(1)]),
+        2: (SimpleNamespace(id=2, name="C2"), [seg(2), seg(3)]),
+        3: (SimpleNamespace(id=3, name="C3"), [seg(4)]),
+    }
+    seen = {}
+    args = SimpleNamespace(dry_run=True, run=None, batch_segments=10)
+    _mod._run_parallel(
+        by_competition, args, 2, lambda cid, _name, outcomes: seen.setdefault(cid, outcomes)
+    )
+    assert sorted(seen) == [1, 2, 3]
+    assert [(o.segment_id, o.status) for o in seen[2]] == [(2, "error"), (3, "error")]
+    assert "index parse blew up" in seen[2][0].reason
+    assert [o.status for o in seen[3]] == ["done"]
@@ -0,0 +1,156 @@
+"""Cache rebuild queue: coalescing, claiming, retry/backoff and the worker loop (SQLite)."""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+
+import cache_rebuild_queue as crq
+from models import CacheRebuildJob, Competition
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'queue.db'}")
+    Competition.__table__.create(engine)
+    CacheRebuildJob.__table__.create(engine)
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    with factory() as s:
+        s.add_all([
+            Competition(id=1, name="Regionals", year="2425", results_url="r"),
+            Competition(id=2, name="Sectionals", year="2425", results_url="s"),
+        ])
+        s.commit()
+    yield factory
+    engine.dispose()
+
+
+def _jobs(factory):
+    with factory() as s:
+        return s.query(CacheRebuildJob).order_by(CacheRebuildJob.id).all()
+
+
+def test_repeat_events_coalesce_into_one_queued_job(session_factory):
+    with session_factory() as s:
+        a = crq.enqueue_competition_rebuild(s, 1, reason="load 1")
+        b = crq.enqueue_competition_rebuild(s, 1, reason="load 2")
+        c = crq.enqueue_competition_rebuild(s, 2)
+        s.commit()
+    assert a == b != c
+    jobs = _jobs(session_factory)
+    assert [(j.competition_id, j.events, j.reason) for j in jobs] == [(1, 2, "load 2"), (2, 1, None)]
+
+
+def test_event_during_running_job_queues_a_follow_up(session_factory):
+    with session_factory() as s:
+        crq.enqueue_competition_rebuild(s, 1)
+        s.commit()
+        job = crq.claim_next_job(s, "w1")
+        s.commit()
+        crq.enqueue_competition_rebuild(s, 1)
+        s.commit()
+        # The follow-up waits until the running rebuild of the same competition finishes.
+        assert crq.claim_next_job(s, "w2") is None
+        crq.complete_job(s, job.id)
+        s.commit()
+        follow_up = crq.claim_next_job(s, "w2")
+    assert follow_up is not None and follow_up.id != job.id
+
+
+def test_worker_runs_steps_in_order_and_marks_done(session_factory):
+    calls = []
+
+    def _step(name):
+        return name, lambda session, analytics, cid, season, scopes: calls.append((name, cid, season, scopes))
+
+    steps = [_step(n) for n, _ in crq.REBUILD_STEPS]
+
+    def _rebuild(session, competition_id, *, scopes, on_step):
+        for name, fn in steps:
+            on_step(name)
+            fn(session, None, competition_id, "2425", tuple(scopes))
+
+    with session_factory() as s:
+        crq.enqueue_competition_rebuild(s, 1)
+        crq.enqueue_competition_rebuild(s, 2)
+        s.commit()
+    n = crq.run_worker(session_factory, worker_id="w", once=True, rebuild=_rebuild)
+    assert n == 2
+    assert [c[0] for c in calls[:6]] == [
+        "invalidate",
+        "cross_judge_shards",
+        "judge_excess",
+        "mark_shards",
+        "sigma",
+        "summaries",
+    ]
+    assert {c[1] for c in calls} == {1, 2}
+    assert [j.status for j in _jobs(session_factory)] == [crq.JOB_DONE, crq.JOB_DONE]
+
+
+def test_failed_job_retries_with_backoff_then_fails(session_factory):
+    attempts = []
+
+    def _boom(session, competition_id, *, scopes, on_step):
+        on_step("cross_judge_shards")
+        attempts.append(competition_id)
+        raise RuntimeError("db went away")
+
+    with session_factory() as s:
+        crq.enqueue_competition_rebuild(s, 1)
+        s.commit()
+
+    job = crq.run_one_job(session_factory, worker_id="w", rebuild=_boom, max_attempts=2, backoff_s=30)
+    assert job.status == crq.JOB_QUEUED
+    assert "db went away" in job.last_error
+    assert job.run_after - job.started_at >= timedelta(seconds=29)
+    # Not due yet.
+    assert crq.run_one_job(session_factory, worker_id="w", rebuild=_boom) is None
+
+    with session_factory() as s:
+        s.execute(update(CacheRebuildJob).values(run_after=job.started_at))
+        s.commit()
+    job = crq.run_one_job(session_factory, worker_id="w", rebuild=_boom, max_attempts=2)
+    assert job.status == crq.JOB_FAILED
+    assert job.attempts == 2
+    assert attempts == [1, 1]
+
+    with session_factory() as s:
+        assert crq.retry_failed_jobs(s) == 1
+        s.commit()
+        assert crq.queue_status_counts(s) == {crq.JOB_QUEUED: 1}
+
+
+def test_stale_running_job_is_requeued(session_factory):
+    with session_factory() as s:
+        crq.enqueue_competition_rebuild(s, 1)
+        s.commit()
+        job = crq.claim_next_job(s, "dead-worker")
+        crq.set_job_step(s, job.id, "mark_shards")
+        s.commit()
+        assert crq.requeue_stale_jobs(s, stale_after_s=3600) == 0
+        assert crq.requeue_stale_jobs(s, stale_after_s=-1) == 1
+        s.commit()
+        s.refresh(job)
+    assert job.status == crq.JOB_QUEUED
+    assert "mark_shards" in job.last_error
+
+
+def test_failed_retry_folds_into_newer_queued_job(session_factory):
+    def _boom(session, competition_id, *, scopes, on_step):
+        with session_factory() as other:
+            crq.enqueue_competition_rebuild(other, competition_id, reason="reloaded")
+            other.commit()
+        raise RuntimeError("boom")
+
+    with session_factory() as s:
+        crq.enqueue_competition_rebuild(s, 1)
+        s.commit()
+    job = crq.run_one_job(session_factory, worker_id="w", rebuild=_boom)
+    assert job.status == crq.JOB_SUPERSEDED
+    rows = crq.recent_jobs(session_factory())
+    assert [(r["status"], r["competition"]) for r in rows] == [
+        (crq.JOB_QUEUED, "Regionals (2425)"),
+        (crq.JOB_SUPERSEDED, "Regionals (2425)"),
+    ]
@@ -0,0 +1,56 @@
+"""Competition edits rebuild the activity tracker's protocol facts when copied columns change."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import database_loader
+from database_loader import DatabaseLoader
+from models import Competition
+
+_URL = "https://ijs.usfigureskating.org/leaderboard/results/2025/34240/index.asp"
+
+
+@pytest.fixture
+def loader(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'scores.db'}")
+    Competition.__table__.create(engine)
+    with Session(engine) as s:
+        s.add(Competition(id=1, name="Sectionals", year="2526", results_url=_URL,
+                          qualifying=True, nqs=False, international=False,
+                          officials_analysis_competition_type_id=5))
+        s.commit()
+        loader = DatabaseLoader(s)
+        loader.refreshes = []
+
+        def refresh(session, competition_ids):
+            # What the fact SQL would read from ``public.competition`` in this transaction.
+            for cid in competition_ids:
+                row = session.connection().exec_driver_sql(
+                    "SELECT id, officials_analysis_competition_type_id, qualifying "
+                    "FROM competition WHERE id = ?", (cid,)
+                ).one()
+                loader.refreshes.append(tuple(row))
+
+        monkeypatch.setattr(database_loader, "refresh_protocol_activity_facts", refresh)
+        yield loader
+    engine.dispose()
+
+
+def _update(loader, **kwargs):
+    loader.updateCompetition(_URL, "Reno, NV", None, None, **kwargs)
+
+
+def test_type_or_flag_edit_refreshes_facts_with_new_values(loader):
+    _update(loader, officials_analysis_competition_type_id=4,
+            update_officials_competition_type=True)
+    assert loader.refreshes == [(1, 4, 1)]
+    _update(loader, qualifying=False)
+    assert loader.refreshes[-1] == (1, 4, 0)
+
+
+def test_edit_without_fact_changes_skips_refresh(loader):
+    _update(loader, name="Sectionals 2025", qualifying=True,
+            officials_analysis_competition_type_id=5, update_officials_competition_type=True)
+    _update(loader)
+    assert loader.refreshes == []
@@ -0,0 +1,78 @@
+"""Competition discipline flags: set-based repair and incremental upkeep on insert_segment."""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from database_loader import DatabaseLoader
+from models import Competition, DisciplineType, Segment
+
+_FLAGS = ("singles", "pairs", "dance", "synchronized")
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'scores.db'}")
+    for model in (Competition, DisciplineType, Segment):
+        model.__table__.create(engine)
+    with Session(engine) as s:
+        s.add_all([
+            DisciplineType(id=1, name="Singles"),
+            DisciplineType(id=2, name="Pairs"),
+            DisciplineType(id=3, name="Solo Dance"),
+            DisciplineType(id=4, name="Synchronized"),
+            DisciplineType(id=5, name="Showcase"),
+        ])
+        s.add_all(Competition(id=cid, name=f"C{cid}", year="2526", results_url=f"u{cid}") for cid in (1, 2, 3))
+        s.commit()
+        yield s
+    engine.dispose()
+
+
+def _flags(session, competition_id):
+    comp = session.get(Competition, competition_id)
+    return {flag for flag in _FLAGS if getattr(comp, flag)}
+
+
+def test_refresh_all_is_one_update_and_reports_changed_rows(session):
+    session.add_all([
+        Segment(id=1, name="a", competition_id=1, discipline_type_id=1),
+        Segment(id=2, name="b", competition_id=1, discipline_type_id=3),
+        Segment(id=3, name="c", competition_id=2, discipline_type_id=5),
+    ])
+    session.get(Competition, 3).pairs = True  # stale: no segments
+    session.commit()
+
+    statements = []
+    listen = lambda *_a, **_k: statements.append(1)  # noqa: E731
+    event.listen(session.get_bind(), "before_cursor_execute", listen)
+    loader = DatabaseLoader(session)
+    assert loader.refresh_all_competition_discipline_flags() == 2
+    event.remove(session.get_bind(), "before_cursor_execute", listen)
+    assert len(statements) == 1
+
+    assert _flags(session, 1) == {"singles", "dance"}
+    assert _flags(session, 2) == set()
+    assert _flags(session, 3) == set()
+    assert loader.refresh_all_competition_discipline_flags() == 0
+    session.get(Competition, 2).singles = True
+    session.get(Competition, 3).singles = True
+    session.commit()
+    assert loader.refresh_all_competition_discipline_flags([2]) == 1
+    assert _flags(session, 3) == {"singles"}
+
+
+def test_insert_segment_maintains_flags(session):
+    loader = DatabaseLoader(session)
+    loader.insert_segment("Junior Women Short Program", 1)
+    loader.insert_segment("Senior Pairs Free Skate", 1)
+    assert _flags(session, 1) == {"singles", "pairs"}
+    assert _flags(session, 2) == set()
+
+    # Re-classifying an existing segment can turn a flag off again.
+    seg = session.query(Segment).filter_by(name="Senior Pairs Free Skate").one()
+    seg.discipline_type_id = 4
+    session.get(Competition, 1).synchronized = True
+    session.commit()
+    loader.insert_segment("Senior Pairs Free Skate", 1)
+    assert _flags(session, 1) == {"singles", "pairs"}
@@ -0,0 +1,137 @@
+"""Cross-judge heatmaps: vectorized shard assembly matches the mark scan per identity."""
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import Session
+
+from analytics import JudgeAnalytics
+from cross_judge_cache import build_cross_judge_shards_for_competition
+from models import (
+    Competition,
+    CrossJudgeCompetitionShard,
+    DisciplineType,
+    Element,
+    ElementScorePerJudge,
+    PcsScorePerJudge,
+    Segment,
+    SkaterSegment,
+)
+
+_TABLES = (
+    Competition,
+    DisciplineType,
+    Segment,
+    SkaterSegment,
+    Element,
+    PcsScorePerJudge,
+    ElementScorePerJudge,
+    CrossJudgeCompetitionShard,
+)
+# Judges 1 and 2 are one identity; judge 4 has no label and is left out.
+_LABELS = {1: "alpha", 2: "alpha", 3: "Beta", 5: "gamma"}
+_EXCESS = {1: 2, 2: 1, 3: 0, 4: 7}
+_EXCESS_BY_COMP = {(1, 1): 2, (2, 2): 1, (3, 2): 4, (4, 1): 7}
+_METRICS = (
+    "throwout_rate",
+    "anomaly_rate",
+    "rule_error_rate",
+    "rule_errors",
+    "excess_anomalies",
+    "avg_deviation",
+)
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'scores.db'}")
+    for model in _TABLES:
+        model.__table__.create(engine)
+    with Session(engine) as s:
+        s.add_all([
+            DisciplineType(id=1, name="Singles"),
+            Competition(id=1, name="A", year="2324", results_url="a"),
+            Competition(id=2, name="B", year="2425", results_url="b"),
+        ])
+        ss_id = score_id = 0
+        for seg_id, comp_id in ((1, 1), (2, 2)):
+            s.add(Segment(id=seg_id, name=f"S{seg_id}", competition_id=comp_id,
+                          discipline_type_id=1))
+            for _ in range(3):
+                ss_id += 1
+                s.add(SkaterSegment(id=ss_id, skater_id=ss_id, segment_id=seg_id))
+                s.add(Element(id=ss_id, skater_segment_id=ss_id, name="3T",
+                              element_type="jump"))
+                for judge_id in (1, 2, 3, 4):
+                    score_id += 1
+                    s.add(PcsScorePerJudge(
+                        id=score_id, skater_segment_id=ss_id, pcs_type_id=1,
+                        judge_id=judge_id, judge_score=5, panel_average=5,
+                        deviation=round(0.6 * judge_id - 0.4 * ss_id, 2),
+                        thrown_out=judge_id == 4, is_rule_error=ss_id % 2 == 0,
+                    ))
+                    if judge_id == 2 and comp_id == 2:
+                        continue
+                    score_id += 1
+                    s.add(ElementScorePerJudge(
+                        id=score_id, element_id=ss_id, judge_id=judge_id, judge_score=1,
+                        panel_average=0, deviation=1.25 * judge_id - 0.5 * ss_id,
+                        thrown_out=ss_id == 3, is_rule_error=judge_id == 3,
+                    ))
+        s.commit()
+        yield s
+    engine.dispose()
+
+
+@pytest.fixture
+def analytics(session, monkeypatch):
+    analytics = JudgeAnalytics(session)
+    monkeypatch.setattr(analytics, "get_judge_id_to_identity_label", lambda: dict(_LABELS))
+    monkeypatch.setattr(
+        analytics,
+        "_calculate_all_judge_excess_anomalies",
+        lambda *, by_competition, **_: dict(_EXCESS_BY_COMP if by_competition else _EXCESS),
+    )
+    return analytics
+
+
+def _from_marks_then_shards(session, fetch):
+    from_marks = fetch()
+    for comp_id in (1, 2):
+        build_cross_judge_shards_for_competition(session, comp_id)
+    session.commit()
+    from_shards = fetch()
+    session.execute(delete(CrossJudgeCompetitionShard))
+    session.commit()
+    return from_marks, from_shards
+
+
+@pytest.mark.parametrize("score_type", ["both", "pcs", "element"])
+def test_heatmaps_match_mark_scan(session, analytics, score_type):
+    for metric in _METRICS:
+        overview = _from_marks_then_shards(
+            session,
+            lambda: analytics.get_judge_performance_heatmap_data(metric, score_type),
+        )
+        by_comp = _from_marks_then_shards(
+            session,
+            lambda: analytics.get_judge_competition_heatmap_data(metric, score_type),
+        )
+        # The mark scan reports per-type counts only for the selected score type.
+        cols = ["judge_name", "metric_value", "total_scores"]
+        if score_type == "both":
+            cols += ["pcs_scores", "element_scores"]
+        from_marks, from_shards = overview
+        assert not from_marks.empty
+        pd.testing.assert_frame_equal(from_shards[cols], from_marks[cols], check_dtype=False)
+        from_marks, from_shards = by_comp
+        pd.testing.assert_frame_equal(from_shards, from_marks, check_dtype=False)
+
+
+def test_pooled_excess_counts_labelled_judges(session, analytics):
+    for comp_id in (1, 2):
+        build_cross_judge_shards_for_competition(session, comp_id)
+    session.commit()
+    pooled = analytics.get_pooled_cross_judge_metrics("both")
+    assert pooled["total_excess_anomalies"] == 3
+    assert pooled["total_scores"] == 24 + 21
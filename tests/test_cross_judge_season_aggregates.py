@@ -0,0 +1,147 @@
+"""Judge × season aggregates for temporal trends: shard roll-up matches the mark scan."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from analytics import JudgeAnalytics
+from cross_judge_cache import build_cross_judge_shards_for_competition
+from models import (
+    Competition,
+    CrossJudgeCompetitionShard,
+    DisciplineType,
+    Element,
+    ElementScorePerJudge,
+    PcsScorePerJudge,
+    Segment,
+    SkaterSegment,
+)
+from officials_competition_types import (
+    COMPETITION_SCOPE_ALL,
+    COMPETITION_SCOPE_NQS,
+    OFFICIALS_COMPETITION_TYPE_ID_NQS,
+)
+
+_TABLES = (
+    Competition,
+    DisciplineType,
+    Segment,
+    SkaterSegment,
+    Element,
+    PcsScorePerJudge,
+    ElementScorePerJudge,
+    CrossJudgeCompetitionShard,
+)
+
+
+@pytest.fixture
+def session(tmp_path, monkeypatch):
+    # Allow NULL deviations so the averages can be checked against ``AVG(deviation)``.
+    for model in (PcsScorePerJudge, ElementScorePerJudge):
+        monkeypatch.setattr(model.__table__.c.deviation, "nullable", True)
+    engine = create_engine(f"sqlite:///{tmp_path / 'scores.db'}")
+    for model in _TABLES:
+        model.__table__.create(engine)
+    with Session(engine) as s:
+        s.add_all([
+            DisciplineType(id=1, name="Singles"),
+            DisciplineType(id=2, name="Solo Dance"),
+            Competition(id=1, name="NQS A", year="2324", results_url="a",
+                        officials_analysis_competition_type_id=OFFICIALS_COMPETITION_TYPE_ID_NQS),
+            Competition(id=2, name="NQS B", year="2324", results_url="b",
+                        officials_analysis_competition_type_id=OFFICIALS_COMPETITION_TYPE_ID_NQS),
+            Competition(id=3, name="Club", year="2425", results_url="c"),
+        ])
+        ss_id = elem_id = score_id = 0
+        for seg_id, (comp_id, disc) in enumerate([(1, 1), (1, 2), (2, 1), (3, 1)], start=1):
+            s.add(Segment(id=seg_id, name=f"S{seg_id}", competition_id=comp_id,
+                          discipline_type_id=disc))
+            for _ in range(2):
+                ss_id += 1
+                s.add(SkaterSegment(id=ss_id, skater_id=ss_id, segment_id=seg_id))
+                for judge_id in (1, 2, 3):
+                    score_id += 1
+                    dev = round(0.35 * judge_id - 0.2 * ss_id, 2)
+                    s.add(PcsScorePerJudge(
+                        id=score_id, skater_segment_id=ss_id, pcs_type_id=1, judge_id=judge_id,
+                        judge_score=5, panel_average=5, deviation=dev,
+                        thrown_out=judge_id == 3, is_rule_error=ss_id % 3 == 0,
+                    ))
+                elem_id += 1
+                s.add(Element(id=elem_id, skater_segment_id=ss_id, name="3T",
+                              element_type="jump"))
+                for judge_id in (1, 2):
+                    score_id += 1
+                    s.add(ElementScorePerJudge(
+                        id=score_id, element_id=elem_id, judge_id=judge_id, judge_score=1,
+                        panel_average=0, deviation=2.25 * judge_id - ss_id * 0.5,
+                        thrown_out=False, is_rule_error=judge_id == 2,
+                    ))
+        s.commit()
+        yield s
+    engine.dispose()
+
+
+def _assert_maps_match(got: dict, expected: dict) -> None:
+    assert got.keys() == expected.keys()
+    for key, parts in expected.items():
+        for kind in ("pcs", "elem"):
+            if parts[kind] is None:
+                assert got[key][kind] is None
+                continue
+            assert got[key][kind][:4] == tuple(int(v) for v in parts[kind][:4])
+            if parts[kind][4] is None:
+                assert got[key][kind][4] is None
+            else:
+                assert got[key][kind][4] == pytest.approx(float(parts[kind][4]))
+
+
+@pytest.mark.parametrize("scope", [COMPETITION_SCOPE_ALL, COMPETITION_SCOPE_NQS])
+@pytest.mark.parametrize("judge_ids", [None, {1, 3}])
+def test_shard_rollup_matches_mark_aggregates(session, scope, judge_ids):
+    analytics = JudgeAnalytics(session)
+    from_marks = analytics._yearly_pcs_elem_combined_map(scope, judge_ids)
+    assert from_marks
+
+    for comp_id in (1, 2, 3):
+        build_cross_judge_shards_for_competition(session, comp_id)
+    session.commit()
+    _assert_maps_match(analytics._yearly_pcs_elem_combined_map(scope, judge_ids), from_marks)
+
+
+def test_competitions_without_shards_fall_back_to_marks(session):
+    # NULL deviations count as marks but not toward the average.
+    session.add_all([
+        PcsScorePerJudge(id=1001, skater_segment_id=1, pcs_type_id=2, judge_id=1,
+                         judge_score=5, panel_average=5, deviation=None,
+                         thrown_out=False, is_rule_error=False),
+        ElementScorePerJudge(id=1002, element_id=7, judge_id=3, judge_score=1,
+                             panel_average=0, deviation=None,
+                             thrown_out=False, is_rule_error=False),
+    ])
+    session.commit()
+    analytics = JudgeAnalytics(session)
+    from_marks = analytics._yearly_pcs_elem_combined_map(COMPETITION_SCOPE_ALL)
+
+    # Competition 3 has no shards yet; its 2425 season comes from the mark tables.
+    for comp_id in (1, 2):
+        build_cross_judge_shards_for_competition(session, comp_id)
+    session.commit()
+    _assert_maps_match(analytics._yearly_pcs_elem_combined_map(COMPETITION_SCOPE_ALL), from_marks)
+    assert from_marks[(3, "2425")]["elem"] == (1, 0, 0, 0, None)
+
+
+def test_identity_group_ranking_sums_member_rows(session):
+    for comp_id in (1, 2, 3):
+        build_cross_judge_shards_for_competition(session, comp_id)
+    session.commit()
+    analytics = JudgeAnalytics(session)
+    combined = analytics._yearly_pcs_elem_combined_map(COMPETITION_SCOPE_ALL, {1, 2})
+    rows = analytics._temporal_rows_for_judge_id_set(
+        {1, 2}, combined, "rule_error_rate", "element", 1, "Merged"
+    )
+    # Judge 2 flags every element rule error; judge 1 none.
+    assert [(r["time_period"], r["metric_value"], r["element_scores"]) for r in rows] == [
+        ("2324", 50.0, 12),
+        ("2425", 50.0, 4),
+    ]
@@ -170,3 +170,70 @@ def test_precompute_shard_summaries_summaries_only_uses_cached_sigma():
     )
     persist.assert_called_once()
     assert persist.call_args.kwargs["cache_only_marks"] is True
+
+
+def _run_pipeline_with_workers(include_judge_detail):
+    analytics = MagicMock()
+    analytics.get_discipline_types.return_value = [(1, "Singles")]
+    analytics.get_element_types.return_value = []
+    mergeable = pd.DataFrame(
+        {
+            "judge_name": ["A", "B"],
+            "n_marks": [3, 4],
+            "sum_m2": [1.0, 8.0],
+            "sum_error": [0.5, 0.5],
+            "sum_abs_error": [1.0, 1.0],
+            "sum_sigma": [0.25, 0.25],
+            "sum_abs_m": [2.0, 2.0],
+        }
+    )
+    summary = {
+        "mergeable_summary": mergeable,
+        "control_by_element": pd.DataFrame(),
+        "n_marks": 7,
+    }
+    serial = {"marking": pd.DataFrame(), "error": None, "judge_element_detail": "detail"}
+    marks = pd.DataFrame({"element_id": [1]})
+    with (
+        patch("element_ranking_cache.ensure_element_ranking_cache_tables"),
+        patch("element_ranking_cache.iter_element_ranking_shards", return_value=["shard"]),
+        patch(
+            "element_ranking_cache.iter_shard_results", return_value=[("shard", summary)]
+        ) as pool,
+        patch("element_ranking_cache.collect_marks_for_run", return_value=marks) as collect,
+        patch("element_ranking_cache._load_sigma_cache_row", return_value={"bucket": 1.0}),
+        patch(
+            "element_ranking_cache.finish_element_deviation_rankings_from_marks",
+            return_value=serial,
+        ) as finish,
+    ):
+        from element_ranking_cache import run_element_deviation_ranking_pipeline
+
+        result = run_element_deviation_ranking_pipeline(
+            analytics,
+            competition_scope="all",
+            floor_sigma=0.1,
+            min_bin_count=5,
+            include_judge_detail=include_judge_detail,
+            persist_shards=False,
+            workers=2,
+        )
+    return result, pool, collect, finish
+
+
+def test_pipeline_with_workers_ranks_serially_when_judge_detail_is_requested():
+    result, pool, collect, finish = _run_pipeline_with_workers(True)
+    pool.assert_not_called()
+    assert collect.call_args.kwargs["workers"] == 2
+    assert finish.call_args.kwargs["include_judge_detail"] is True
+    assert result["judge_element_detail"] == "detail"
+
+
+def test_pipeline_with_workers_keeps_summary_flag_without_judge_detail():
+    result, pool, collect, finish = _run_pipeline_with_workers(False)
+    assert pool.call_args.kwargs["workers"] == 2
+    collect.assert_not_called()
+    finish.assert_not_called()
+    assert result["error"] is None
+    assert result["_from_summary_cache"] is True
+    assert set(result["judge_summary_all"]["judge_name"]) == {"A", "B"}
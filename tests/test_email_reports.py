@@ -0,0 +1,190 @@
+"""Batch report helpers and pooled SMTP sending against a local SMTP stand-in."""
+
+import email
+import email.policy
+import smtplib
+import socketserver
+import threading
+
+import pandas as pd
+import pytest
+
+from email_reports import (
+    SmtpReportSender,
+    build_report_message,
+    segment_stats_from_marks,
+    send_report_email,
+)
+
+
+class _SmtpStandIn(socketserver.ThreadingTCPServer):
+    """Tiny SMTP server: records messages, can drop the connection after N messages."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, drop_after=None, reject_first_rcpt_with=None):
+        super().__init__(("127.0.0.1", 0), _SmtpHandler)
+        self.messages = []
+        self.connections = 0
+        self.drop_after = drop_after
+        self.reject_first_rcpt_with = reject_first_rcpt_with
+        self.lock = threading.Lock()
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    def _reply(self, line):
+        self.wfile.write((line + "\r\n").encode())
+
+    def handle(self):
+        srv = self.server
+        with srv.lock:
+            srv.connections += 1
+        sent_here = 0
+        self._reply("220 stand-in ready")
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+            cmd = raw.decode().strip()
+            verb = cmd.split(" ", 1)[0].upper()
+            if verb in ("EHLO", "HELO"):
+                self._reply("250 stand-in")
+            elif verb == "MAIL":
+                if srv.drop_after is not None and sent_here >= srv.drop_after:
+                    return  # close the socket mid-session
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                with srv.lock:
+                    code = srv.reject_first_rcpt_with
+                    srv.reject_first_rcpt_with = None
+                self._reply(f"{code} try later" if code else "250 OK")
+            elif verb == "DATA":
+                self._reply("354 go ahead")
+                lines = []
+                while True:
+                    line = self.rfile.readline()
+                    if line in (b".\r\n", b""):
+                        break
+                    lines.append(line)
+                with srv.lock:
+                    srv.messages.append(b"".join(lines))
+                sent_here += 1
+                self._reply("250 queued")
+            elif verb == "RSET" or verb == "NOOP":
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 bye")
+                return
+            else:
+                self._reply("502 not implemented")
+
+
+@pytest.fixture
+def smtp_stand_in():
+    servers = []
+
+    def _start(**kwargs):
+        srv = _SmtpStandIn(**kwargs)
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        servers.append(srv)
+        return srv
+
+    yield _start
+    for srv in servers:
+        srv.shutdown()
+        srv.server_close()
+
+
+def _cfg(srv):
+    return {
+        "host": "127.0.0.1",
+        "port": srv.server_address[1],
+        "user": "reports@example.com",
+        "password": "",
+        "from_name": "Officials",
+        "starttls": False,
+    }
+
+
+def _msg(cfg, name="Zoë Judge"):
+    return build_report_message(cfg, "judge@example.com", name, "Sectionals 2025", b"<html></html>")
+
+
+def test_sender_reuses_one_connection(smtp_stand_in):
+    srv = smtp_stand_in()
+    cfg = _cfg(srv)
+    with SmtpReportSender(cfg, min_interval=0) as sender:
+        for i in range(5):
+            sender.send(_msg(cfg, f"Judge {i}"))
+    assert len(srv.messages) == 5
+    assert srv.connections == 1
+    parsed = email.message_from_bytes(srv.messages[0], policy=email.policy.default)
+    assert parsed["Subject"] == "Judge Performance Report - Sectionals 2025"
+
+
+def test_sender_reconnects_after_disconnect(smtp_stand_in):
+    srv = smtp_stand_in(drop_after=2)
+    cfg = _cfg(srv)
+    with SmtpReportSender(cfg, min_interval=0, backoff=0) as sender:
+        for i in range(5):
+            sender.send(_msg(cfg, f"Judge {i}"))
+    assert len(srv.messages) == 5
+    assert srv.connections == 3
+
+
+def test_sender_retries_transient_4xx(smtp_stand_in):
+    srv = smtp_stand_in(reject_first_rcpt_with=451)
+    cfg = _cfg(srv)
+    with SmtpReportSender(cfg, min_interval=0, backoff=0) as sender:
+        sender.send(_msg(cfg))
+    assert len(srv.messages) == 1
+
+
+def test_sender_does_not_retry_permanent_5xx(smtp_stand_in):
+    srv = smtp_stand_in(reject_first_rcpt_with=550)
+    cfg = _cfg(srv)
+    with SmtpReportSender(cfg, min_interval=0, backoff=0) as sender:
+        with pytest.raises(smtplib.SMTPRecipientsRefused):
+            sender.send(_msg(cfg))
+    assert srv.messages == []
+
+
+def test_sender_rate_limits_between_messages(smtp_stand_in):
+    srv = smtp_stand_in()
+    cfg = _cfg(srv)
+    sleeps = []
+    with SmtpReportSender(cfg, min_interval=2.0, sleep=sleeps.append, clock=lambda: 100.0) as sender:
+        sender.send(_msg(cfg))
+        sender.send(_msg(cfg))
+    assert sleeps == [2.0]
+
+
+def test_send_report_email_one_shot(smtp_stand_in):
+    srv = smtp_stand_in()
+    send_report_email(_cfg(srv), "judge@example.com", "A Judge", "Regionals", b"<p>x</p>")
+    assert len(srv.messages) == 1
+
+
+def test_segment_stats_from_marks_counts_per_segment():
+    base = {"competition_name": "Regionals", "year": "2025", "segment_name": "SP", "discipline_name": "Women"}
+    pcs = pd.DataFrame([
+        {**base, "segment_id": 1, "anomaly": True, "is_rule_error": True},
+        {**base, "segment_id": 1, "anomaly": True, "is_rule_error": False},
+        {**base, "segment_id": 1, "anomaly": False, "is_rule_error": False},
+    ])
+    elem = pd.DataFrame([
+        {**base, "segment_id": 2, "segment_name": "FS", "anomaly": True, "is_rule_error": False},
+        {**base, "segment_id": 1, "anomaly": False, "is_rule_error": False},
+    ])
+    out = segment_stats_from_marks(pcs, elem, {1: 12, 2: 10}).set_index("segment_id")
+    assert out.loc[1, "skater_count"] == 12
+    assert out.loc[1, "pcs_anomalies"] == 2
+    assert out.loc[1, "pcs_rule_errors"] == 1
+    assert out.loc[1, "element_anomalies"] == 0
+    assert out.loc[2, "total_anomalies"] == 1
+    assert out.loc[2, "competition_year"] == "2025"
+
+
+def test_segment_stats_from_marks_empty():
+    assert segment_stats_from_marks(pd.DataFrame(), pd.DataFrame(), {}).empty
@@ -317,6 +317,32 @@ def test_activity_detail_groups_panel_by_official(monkeypatch):
     assert detail.iloc[0]["competition_id"] == 10
 
 
+def test_rule411_table_probe_caches_only_a_positive_answer(monkeypatch):
+    now = [100.0]
+    answers = [False, True]
+    probes = []
+
+    def exists(_session):
+        probes.append(now[0])
+        return answers.pop(0)
+
+    monkeypatch.setattr(iod, "segment_rule411_table_exists", exists)
+    monkeypatch.setattr(iod, "Session", MagicMock())
+    monkeypatch.setattr(iod.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(iod, "_rule411_table_ready", False)
+    monkeypatch.setattr(iod, "_rule411_table_checked_at", None)
+
+    assert iod._segment_rule411_table_ready() is False
+    now[0] += 10
+    assert iod._segment_rule411_table_ready() is False
+    now[0] += iod._RULE411_TABLE_RECHECK_SEC
+    # Migration applied since the first probe: picked up without a restart, then kept.
+    assert iod._segment_rule411_table_ready() is True
+    now[0] += 10_000
+    assert iod._segment_rule411_table_ready() is True
+    assert probes == [100.0, 100.0 + 10 + iod._RULE411_TABLE_RECHECK_SEC]
+
+
 if __name__ == "__main__":
     test_national_segment_appointment_type_mapping()
     test_summarize_international_activity_counts()
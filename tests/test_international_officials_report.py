@@ -306,6 +306,82 @@ def test_build_bulk_appointment_reports_zip(monkeypatch):
         assert zf.read(names[0]) == b"%PDF-bulk"
 
 
+class _UnseekableSink(io.RawIOBase):
+    """Write-only stream without ``seek``/``tell`` (like an HTTP response body)."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.data += b
+        return len(b)
+
+
+def _bulk_summary(n: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "official_id": i,
+                "appointment_type_id": 10,
+                "discipline_id": 3,
+                "official_name": f"Official {i}",
+                "appointment_type": "Judge",
+                "discipline": "Singles",
+            }
+            for i in range(1, n + 1)
+        ]
+    )
+
+
+def _patch_bulk_render(monkeypatch):
+    import activityAnalysis.international_officials_report as report_mod
+
+    def fake_context(row, **kwargs):
+        return _minimal_context(
+            official_id=int(row["official_id"]), official_name=row["official_name"]
+        )
+
+    monkeypatch.setattr(report_mod, "build_appointment_detail_context", fake_context)
+    monkeypatch.setattr(
+        report_mod,
+        "build_appointment_detail_pdf",
+        lambda ctx: f"%PDF {ctx.official_id}".encode(),
+    )
+
+
+@pytest.mark.filterwarnings("ignore:This process.*fork:DeprecationWarning")
+@pytest.mark.parametrize("workers", [1, 3])
+def test_write_bulk_reports_zip_streams_with_progress(monkeypatch, workers):
+    from activityAnalysis.international_officials_bulk_reports import (
+        write_bulk_appointment_reports_zip,
+    )
+
+    _patch_bulk_render(monkeypatch)
+    sink = _UnseekableSink()
+    seen = []
+    n = write_bulk_appointment_reports_zip(
+        _bulk_summary(7),
+        sink,
+        listing_season_code=2526,
+        report_season_codes=[2425],
+        active_only=True,
+        panel_bulk=pd.DataFrame({"official_id": [1, 2]}),
+        workers=workers,
+        progress=lambda done, total, name: seen.append((done, total)),
+        # fork keeps the monkeypatched renderers in the workers.
+        mp_context="fork",
+    )
+    assert n == 7
+    assert seen == [(i, 7) for i in range(1, 8)]
+    with zipfile.ZipFile(io.BytesIO(bytes(sink.data))) as zf:
+        # Summary order, whichever worker finishes first.
+        assert zf.namelist() == [f"Official_{i}_Judge_Singles.pdf" for i in range(1, 8)]
+        assert zf.read("Official_4_Judge_Singles.pdf") == b"%PDF 4"
+
+
 def test_build_appointment_detail_pdf_requires_fpdf(monkeypatch):
     import activityAnalysis.international_officials_report as report_mod
 
@@ -39,6 +39,7 @@ sys.modules["activityAnalysis.international_officials_data"] = _mock_iod
 sys.modules["international_officials_data"] = _mock_iod
 
 import pandas as pd
+import pytest
 
 from activityAnalysis import international_requirements as ir
 
@@ -1334,6 +1335,240 @@ def test_judge_referee_at_event_seminar_not_in_four_season_in_person_branch():
     assert "0/1" in detail_promote
 
 
+def _parity_panel() -> pd.DataFrame:
+    import random
+
+    rng = random.Random(7)
+    competitions = {}
+    names = ["World Championships", "Olympic Winter Games", "Grand Prix", "Sectionals"]
+    for cid in range(1, 15):
+        competitions[cid] = {
+            "competition_id": cid,
+            "competition_year": rng.choice([2324, 2425, 2526, 2526, "2526 ", "bad", None]),
+            "competition_name": rng.choice(names),
+            "competition_type_id": rng.choice([15, 16, 17, 17, 4, 12]),
+            "competition_qualifying": rng.choice([True, False]),
+        }
+    rows = []
+    for _ in range(220):
+        comp = competitions[rng.randint(1, 14)]
+        rows.append(
+            {
+                "official_id": rng.choice([1, 2, 3]),
+                "national_appointment_type_id": rng.choice([1, 4, 8, 9, 11]),
+                "segment_discipline_type_id": rng.choice([1, 2, 3, 5]),
+                "segment_level": rng.choice(["Junior", "Senior", "Senior", "Novice"]),
+                "rule411_eligible": rng.random() > 0.2,
+                **comp,
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def _parity_rules() -> pd.DataFrame:
+    def rule(rule_set_id, purpose, atid, window, metric, min_value=1, sort=1, **kw):
+        row = {
+            "rule_set_id": rule_set_id,
+            "isu_rule_ref": f"41{rule_set_id}",
+            "purpose": purpose,
+            "label": f"Rule set {rule_set_id}",
+            "appointment_type_id": atid,
+            "directory_level_id": None,
+            "discipline_id": None,
+            "listing_tier": "international",
+            "season_window": window,
+            "sport": "figure",
+            "rule_id": rule_set_id * 10 + sort,
+            "metric": metric,
+            "min_value": min_value,
+            "role_appointment_type_ids": None,
+            "competition_type_ids": None,
+            "segment_levels": None,
+            "require_championship_or_olympic": False,
+            "include_qualifying_national": False,
+            "metric_config": None,
+            "display_label": metric,
+            "rule_sort_order": sort,
+        }
+        row.update(kw)
+        return row
+
+    alternatives = {
+        "alternatives": [
+            {
+                "label": "Referee",
+                "role_ids": [4],
+                "requirements": [
+                    {"scope": "international_all", "min": 2},
+                    {"scope": "isu_championship", "min": 1},
+                ],
+            },
+            {
+                "label": "Mixed",
+                "role_ids": [1, 4],
+                "requirements": [
+                    {"scope": "international_competition", "min": 1},
+                    {"scope": "national_qualifying", "min": 1},
+                ],
+            },
+        ]
+    }
+    judge_promote = {
+        "min_competitions": 2,
+        "required": [
+            {"kind": "segment_level", "level": "Senior", "min_competitions": 1},
+            {"kind": "segment_discipline_type_id", "discipline_type_id": 2},
+            {"kind": "scope", "scope": "isu_event", "last_season_only": True},
+        ],
+    }
+    return pd.DataFrame(
+        [
+            rule(1, "maintain", 12, 2, "judge_competitions", 2, 1,
+                 include_qualifying_national=True),
+            rule(1, "maintain", 12, 2, "judge_championship_or_olympic", 1, 2),
+            rule(1, "maintain", 12, 2, "seminar_count", 1, 3,
+                 metric_config={"in_person": True, "season_window": 4}),
+            rule(2, "maintain", 13, 3, "competition_alternatives", 1, 1,
+                 metric_config=alternatives),
+            rule(2, "maintain", 13, 3, "referee_competitions", 3, 2,
+                 segment_levels=["Senior"], competition_type_ids=[15, 16]),
+            rule(3, "maintain", 15, 3, "combined_roles_competitions", 2, 1),
+            rule(4, "promote", 12, 3, "judge_promote_isu", 1, 1,
+                 metric_config=judge_promote, include_qualifying_national=True),
+            rule(5, "promote", 15, 2, "tc_ts_promote_isu", 1, 1,
+                 metric_config={"min_competitions": 2, "min_international_competition": 1}),
+            rule(6, "promote", 13, 3, "referee_competitions", 1, 1,
+                 directory_level_id=17),
+        ]
+    )
+
+
+def _parity_context(ir, summary: pd.DataFrame, panel: pd.DataFrame) -> "ir.RequirementSummaryContext":
+    rules = _parity_rules()
+    seminars = pd.DataFrame(
+        [
+            {
+                "official_id": 1,
+                "appointment_type_id": 12,
+                "discipline_id": 9,
+                "season_code": 2526,
+                "in_person": True,
+            }
+        ]
+    )
+    contexts = {
+        (int(r.official_id), int(r.appointment_type_id), 9): {
+            "level_id": None if r.official_id == 2 else ir.DIRECTORY_LEVEL_ID_INTERNATIONAL
+        }
+        for r in summary.itertuples()
+    }
+    return ir.RequirementSummaryContext(
+        listing_season_code=2627,
+        rules_df=rules,
+        maintain_rules=rules.loc[rules["purpose"] == "maintain"],
+        promote_rules=rules.loc[rules["purpose"] == "promote"],
+        appointment_rows_by_official={},
+        appointment_contexts=contexts,
+        isu_listing_keys=set(),
+        international_level_id=ir.DIRECTORY_LEVEL_ID_INTERNATIONAL,
+        isu_level_id=ir.DIRECTORY_LEVEL_ID_ISU_CHAMPIONSHIP,
+        panel=panel,
+        panel_by_official={int(o): g for o, g in panel.groupby("official_id", sort=False)},
+        seminars=seminars,
+        seminars_by_key={(1, 12, 9): seminars},
+    )
+
+
+@pytest.fixture
+def real_requirement_modules(monkeypatch):
+    """
+    Unmocked ``international_officials_data`` with fresh ``international_requirements`` /
+    ``_compiled`` bound to it, so both evaluators use the real appointment filters.
+    """
+    import importlib
+
+    import activityAnalysis
+
+    names = (
+        "load_activity_data",
+        "international_officials_data",
+        "international_requirements",
+        "international_requirements_compiled",
+    )
+    for name in names:
+        monkeypatch.setattr(
+            activityAnalysis, name, getattr(activityAnalysis, name, None), raising=False
+        )
+        for key in (f"activityAnalysis.{name}", name):
+            monkeypatch.delitem(sys.modules, key, raising=False)
+    modules = {name: importlib.import_module(f"activityAnalysis.{name}") for name in names}
+    for name in names:
+        monkeypatch.setitem(sys.modules, name, modules[name])
+    return modules
+
+
+def test_compiled_appointment_masks_match_filter_panel_for_appointment(real_requirement_modules):
+    filter_panel_for_appointment = real_requirement_modules[
+        "international_officials_data"
+    ].filter_panel_for_appointment
+    CompiledPanel = real_requirement_modules["international_requirements_compiled"].CompiledPanel
+
+    panel = _parity_panel()
+    compiled = CompiledPanel(panel)
+    matched = 0
+    for official_id in (1, 2, 3, 4):
+        for atid in (12, 13, 14, 15, 16, 99):
+            # Directory disciplines that resolve without the database (not Synchro).
+            for discipline_id in (None, 1, 4, 7, 8, 9):
+                for role_ids in (None, (1, 4), (11,)):
+                    expected = filter_panel_for_appointment(
+                        panel,
+                        official_id=official_id,
+                        intl_appointment_type_id=atid,
+                        directory_discipline_id=discipline_id,
+                        national_role_ids=role_ids,
+                    )
+                    key = compiled.appointment_key(role_ids, atid, discipline_id)
+                    mask = compiled._appointment_mask(key) & (compiled._official == official_id)
+                    assert list(panel.index[mask]) == list(expected.index), (
+                        official_id, atid, discipline_id, role_ids
+                    )
+                    matched += not expected.empty
+    assert matched > 50
+
+
+def test_compiled_summary_matches_per_appointment_evaluator(monkeypatch, real_requirement_modules):
+    ir = real_requirement_modules["international_requirements"]
+    irc = real_requirement_modules["international_requirements_compiled"]
+
+    # Both evaluators only count protocol rows on PostgreSQL; the panel is in memory.
+    for module in (ir, irc):
+        monkeypatch.setattr(module, "activity_database_is_postgresql", lambda: True)
+
+    summary = pd.DataFrame(
+        [
+            {"official_id": oid, "appointment_type_id": atid, "discipline_id": 9,
+             "appointment_level": "International", "appointment_level_id": 17}
+            for oid in (1, 2, 3)
+            for atid in (12, 13, 15, 16)
+        ]
+    )
+    panel = _parity_panel()
+    compiled = ir.evaluate_requirements_summary_df(
+        summary, summary_ctx=_parity_context(ir, summary, panel), listing_season_code=2627
+    )
+    reference = ir.evaluate_requirements_summary_df(
+        summary,
+        summary_ctx=_parity_context(ir, summary, panel),
+        listing_season_code=2627,
+        compiled=False,
+    )
+    pd.testing.assert_frame_equal(compiled, reference)
+    assert {"Yes", "No"} <= set(reference["maintain"])
+    assert {"Yes", "No", "N/A"} <= set(reference["promote"])
+    assert {"Yes", "No"} <= set(reference["seminar_maintain"])
+
+
 if __name__ == "__main__":
     test_isu_season_codes_preceding_july1()
     test_listing_calendar_year()
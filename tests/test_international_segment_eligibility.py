@@ -7,6 +7,8 @@ import sys
 from pathlib import Path
 
 import pandas as pd
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 os.environ.setdefault("DATABASE_URL", "sqlite:////tmp/international_segment_eligibility_tests.db")
@@ -17,7 +19,19 @@ from activityAnalysis.international_segment_eligibility import (
     evaluate_segment_rule411,
     extract_noc_from_skater_name,
     filter_panel_to_rule411_eligible,
+)
+from models import (
+    Competition,
+    DisciplineType,
+    Segment,
+    SegmentRule411Eligibility,
+    Skater,
+    SkaterSegment,
+)
+from segment_rule411 import (
     min_entries_for_discipline,
+    refresh_segment_rule411_eligibility,
+    segment_ids_missing_rule411_eligibility,
 )
 
 
@@ -148,3 +162,102 @@ def test_filter_panel_to_rule411_eligible():
     assert "rule411_status" in enriched.columns
     filtered = filter_panel_to_rule411_eligible(panel)
     assert len(filtered.loc[filtered["competition_type_id"] == 4]) == 1
+
+
+def _protocol_session(tmp_path) -> Session:
+    engine = create_engine(f"sqlite:///{tmp_path / 'protocol.db'}")
+    for model in (
+        Competition,
+        DisciplineType,
+        Segment,
+        Skater,
+        SkaterSegment,
+        SegmentRule411Eligibility,
+    ):
+        model.__table__.create(engine)
+    session = Session(engine)
+    session.add_all([
+        Competition(id=1, name="Challenger", year="2024-25", results_url="https://example.test/"),
+        DisciplineType(id=1, name="Singles"),
+        DisciplineType(id=5, name="Synchronized"),
+        Segment(id=10, name="Senior Men SP", competition_id=1, discipline_type_id=1),
+        Segment(id=11, name="Senior Synchro SP", competition_id=1, discipline_type_id=5),
+        Segment(id=12, name="Junior Women SP", competition_id=1, discipline_type_id=1),
+    ])
+    names = ["A USA", "B CAN", "C JPN", "D USA", "E FRA", "F ITA", "Team USA", "Team FIN"]
+    session.add_all(Skater(id=i, name=n) for i, n in enumerate(names, start=1))
+    session.add_all(
+        [SkaterSegment(segment_id=10, skater_id=i) for i in range(1, 7)]
+        + [SkaterSegment(segment_id=11, skater_id=i) for i in (7, 8)]
+    )
+    session.commit()
+    return session
+
+
+def test_refresh_segment_rule411_eligibility_stores_rows(tmp_path):
+    session = _protocol_session(tmp_path)
+    assert segment_ids_missing_rule411_eligibility(session) == [10, 11, 12]
+    assert refresh_segment_rule411_eligibility(session, [10, 11, 12]) == 3
+    session.commit()
+    rows = {
+        r.segment_id: r
+        for r in session.execute(select(SegmentRule411Eligibility)).scalars()
+    }
+    assert (rows[10].entry_count, rows[10].distinct_noc_count, rows[10].eligible) == (6, 5, True)
+    assert rows[10].discipline_category == "singles"
+    assert rows[11].discipline_category == "synchronized"
+    assert rows[11].eligible is True
+    # No entries: hand-entered segment, passes.
+    assert (rows[12].entry_count, rows[12].eligible) == (0, True)
+    assert segment_ids_missing_rule411_eligibility(session, competition_ids=[1]) == []
+
+    session.add(SkaterSegment(segment_id=12, skater_id=1))
+    session.flush()
+    assert refresh_segment_rule411_eligibility(session, [12]) == 1
+    stored = session.get(SegmentRule411Eligibility, 12)
+    session.refresh(stored)
+    assert (stored.entry_count, stored.eligible) == (1, False)
+    session.close()
+
+
+def test_enrich_keeps_stored_rule411_and_fills_missing_rows(monkeypatch):
+    import activityAnalysis.international_segment_eligibility as ise
+
+    loaded: list[list[int]] = []
+
+    def fake_stats(segment_ids):
+        loaded.append(list(segment_ids))
+        return pd.DataFrame(
+            [
+                {
+                    "segment_id": 3,
+                    "rule411_entry_count": 2,
+                    "rule411_distinct_noc_count": 2,
+                    "rule411_nocs_parsed": 2,
+                }
+            ]
+        )
+
+    monkeypatch.setattr(ise, "load_segment_rule411_stats", fake_stats)
+    panel = pd.DataFrame(
+        [
+            # Stored (joined) row: kept as is.
+            {"competition_type_id": 17, "segment_id": 1, "segment_discipline_type_id": 1,
+             "rule411_eligible": False, "rule411_entry_count": 5,
+             "rule411_distinct_noc_count": 4, "rule411_status": "No", "rule411_detail": "x"},
+            # National: outside the join, defaults.
+            {"competition_type_id": 4, "segment_id": 2, "segment_discipline_type_id": 1,
+             "rule411_eligible": None, "rule411_entry_count": None,
+             "rule411_distinct_noc_count": None, "rule411_status": None, "rule411_detail": None},
+            # International without a stored row: evaluated live.
+            {"competition_type_id": 16, "segment_id": 3, "segment_discipline_type_id": 1,
+             "rule411_eligible": None, "rule411_entry_count": None,
+             "rule411_distinct_noc_count": None, "rule411_status": None, "rule411_detail": None},
+        ]
+    )
+    out = enrich_panel_with_rule411_eligibility(panel)
+    assert loaded == [[3]]
+    assert out["rule411_eligible"].tolist() == [False, True, False]
+    assert out["rule411_status"].tolist()[:2] == ["No", "N/A"]
+    assert out.loc[2, "rule411_entry_count"] == 2
+    assert filter_panel_to_rule411_eligible(panel)["segment_id"].tolist() == [2]
@@ -6,3 +6,49 @@ def test_normalize_name_choices_reuses_normalize_name():
     norm = normalize_name_choices(choices)
     assert norm[1] == normalize_name("Chris  Buchanan")
     assert norm[2] == "pat smith"
+
+
+from judge_official_link_core import FuzzyNameMatcher, name_block_tokens, suggest_matches
+
+_ROSTER = {
+    1: "Agita Abele",
+    2: "Susan Lynch",
+    3: "Susan Lynx",
+    4: "Chris Buchanan",
+    5: "Pat Smith",
+    6: "Patricia Smith-Jones",
+}
+
+
+def test_name_block_tokens_split_hyphen_and_skip_digits():
+    assert name_block_tokens("patricia smith-jones [12345]") == {"patricia", "smith", "jones"}
+
+
+def test_best_matches_parity_with_suggest_matches():
+    names = ["Ms. Agita ABELE", "Lynch Susan", "Chris Buchanon", "Pat Smith", "Nobody Here", ""]
+    matcher = FuzzyNameMatcher(_ROSTER)
+    for use_blocking in (True, False):
+        bulk = matcher.best_matches(names, top=3, min_score=50, use_blocking=use_blocking)
+        for name, got in zip(names, bulk):
+            want = suggest_matches(name, _ROSTER, top=3, min_score=50)
+            if use_blocking and name == "Nobody Here":
+                assert got == []  # no shared token: never scored
+            else:
+                assert got == want
+
+
+def test_confident_ids_applies_score_and_margin():
+    matcher = FuzzyNameMatcher(_ROSTER)
+    ids = matcher.confident_ids(
+        ["Agita Abele", "Susan Lync", "Chris Buchanon", "Unknown Person"],
+        min_score=88,
+        accept_score=92,
+        min_margin=3,
+    )
+    assert ids == [1, 2, 4, None]
+    # Lynch (95.2) vs Lynx (90.0): a wider margin requirement rejects the pick.
+    assert matcher.confident_ids(["Susan Lync"], min_score=88, min_margin=6) == [None]
+
+
+def test_confident_ids_empty_roster():
+    assert FuzzyNameMatcher({}).confident_ids(["Pat Smith"], min_score=80) == [None]
@@ -0,0 +1,110 @@
+"""DatabaseLoader dimension caches: bulk warm-up, indexed match keys, transaction safety."""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from database_loader import DatabaseLoader
+from models import Competition, DisciplineType, ElementType, Judge, PcsType, Segment, Skater
+
+_TABLES = (Competition, DisciplineType, ElementType, PcsType, Judge, Skater, Segment)
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'scores.db'}")
+    for model in _TABLES:
+        model.__table__.create(engine)
+    with Session(engine) as s:
+        s.add_all([
+            DisciplineType(id=1, name="Singles"),
+            ElementType(id=1, name="Jump"),
+            PcsType(id=1, name="Composition"),
+            Judge(id=7, name="Karen Wolanchuk", match_key="karen wolanchuk"),
+            Skater(id=3, name="Anna SMITH", match_key="anna smith"),
+            Competition(id=1, name="C1", year="2526", results_url="u1"),
+            Segment(id=5, name="Junior Women Short Program", competition_id=1,
+                    discipline_type_id=1),
+        ])
+        s.commit()
+        yield s
+    engine.dispose()
+
+
+class _StatementCounter:
+    def __init__(self, session):
+        self.engine = session.get_bind()
+        self.count = 0
+
+    def _on_execute(self, *_args, **_kwargs):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *_exc):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+def test_warm_caches_resolve_known_names_without_queries(session):
+    loader = DatabaseLoader(session, defer_commits=True)
+    loader.warm_dimension_caches()
+    loader.get_segment_id("Junior Women Short Program", 1)
+    with _StatementCounter(session) as counter:
+        assert loader.insert_judge("Ms. KAREN  wolanchuk") == 7
+        assert loader.insert_skater("Anna Smith") == 3
+        assert loader.insert_element_type("Jump") == 1
+        assert loader.insert_pcs_type("Composition") == 1
+        assert loader.insert_discipline_type("Senior Ladies Free Skate") == 1
+        assert loader.get_segment_id("Junior Women Short Program", 1) == 5
+        assert loader.get_segment_id("Missing", 1) is None
+    assert counter.count == 0
+
+
+def test_new_rows_store_match_keys_and_are_cached(session):
+    loader = DatabaseLoader(session, defer_commits=True)
+    judge_id = loader.insert_judge("Mr. John  Doe")
+    skater_ids = loader._ensure_skaters_by_name(["Jane O'Brien", "jane o brien"])
+    assert len(set(skater_ids.values())) == 1
+    loader.commit()
+    assert session.get(Judge, judge_id).match_key == "john doe"
+    assert session.get(Skater, skater_ids["Jane O'Brien"]).match_key == "jane o brien"
+    with _StatementCounter(session) as counter:
+        assert loader.insert_judge("john doe") == judge_id
+        assert loader.insert_skater("JANE O'BRIEN") == skater_ids["Jane O'Brien"]
+    assert counter.count == 0
+
+
+def test_rollback_drops_ids_inserted_in_the_transaction(session):
+    loader = DatabaseLoader(session, defer_commits=True)
+    loader.insert_segment("Senior Men Free Skate", 1)
+    loader.insert_skater("New Skater")
+    session.rollback()
+
+    skater_id = loader.insert_skater("New Skater")
+    segment_id = loader.insert_segment("Senior Men Free Skate", 1)
+    loader.commit()
+    assert session.get(Skater, skater_id).name == "New Skater"
+    assert session.get(Segment, segment_id).competition_id == 1
+    assert session.query(Segment).filter_by(competition_id=1).count() == 2
+
+
+def test_loaders_on_one_session_share_the_module_listeners(session):
+    import gc
+
+    instance_listeners = len(session.dispatch.after_commit), len(session.dispatch.after_rollback)
+    loaders = [DatabaseLoader(session, defer_commits=True) for _ in range(5)]
+    assert (
+        len(session.dispatch.after_commit),
+        len(session.dispatch.after_rollback),
+    ) == instance_listeners
+    del loaders
+    gc.collect()
+    assert len(session.info["dimension_cache_loaders"]) == 0
+
+    loader = DatabaseLoader(session, defer_commits=True)
+    skater_id = loader.insert_skater("Committed Skater")
+    loader.commit()
+    session.rollback()
+    assert loader.insert_skater("Committed Skater") == skater_id
@@ -0,0 +1,92 @@
+"""Judge-sorted mark shards: full decode round-trips and judge slices match a filter."""
+
+import pickle
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from mark_shard_index import (
+    decode_judge_sorted_marks,
+    encode_judge_sorted_marks,
+    load_judge_slices,
+)
+from models import PcsDeviationRankingShardCache
+
+
+def _marks(seed: int, n: int = 40) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "judge_id": rng.integers(1, 8, n).astype(np.int32),
+            "judge_name": "ignored",
+            "skater_segment_id": rng.integers(100, 200, n),
+            "component": rng.choice(["CO", "PR", "SK"], n).astype(object),
+            "judge_score": rng.normal(7, 1, n).astype(np.float32),
+            "control_score": rng.normal(7, 1, n),
+        }
+    )
+
+
+def _sorted(df: pd.DataFrame) -> pd.DataFrame:
+    return (
+        df.drop(columns=["judge_name"], errors="ignore")
+        .sort_values(["judge_id", "skater_segment_id", "component", "judge_score"])
+        .reset_index(drop=True)
+    )
+
+
+def test_round_trip_preserves_rows_and_dtypes():
+    marks = _marks(1)
+    payload, index = encode_judge_sorted_marks(marks)
+    decoded = decode_judge_sorted_marks(payload, index)
+    assert decoded["judge_id"].is_monotonic_increasing
+    assert decoded["judge_score"].dtype == np.float32
+    pd.testing.assert_frame_equal(_sorted(decoded), _sorted(marks))
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'shards.db'}")
+    PcsDeviationRankingShardCache.__table__.create(engine)
+    with Session(engine) as s:
+        yield s
+    engine.dispose()
+
+
+def _add_shard(session, key: str, marks: pd.DataFrame, *, indexed: bool = True) -> None:
+    if indexed:
+        payload, index = encode_judge_sorted_marks(marks)
+    else:
+        payload, index = pickle.dumps(marks), None
+    session.add(PcsDeviationRankingShardCache(
+        shard_key=key, season_year="2425", discipline_type_id=1, competition_scope="all",
+        data_fingerprint="", marks_payload=payload, judge_index=index, n_marks=len(marks),
+        computed_at=datetime.now(timezone.utc),
+    ))
+    session.commit()
+
+
+def test_judge_slices_match_filtered_shards(session):
+    shards = {"a": _marks(2), "b": _marks(3), "c": _marks(4)}
+    for key, marks in shards.items():
+        _add_shard(session, key, marks)
+
+    judge_ids = {2, 5, 99}
+    parts = load_judge_slices(session, PcsDeviationRankingShardCache, list(shards), judge_ids)
+    expected = pd.concat(
+        [m[m["judge_id"].isin(judge_ids)] for m in shards.values()], ignore_index=True
+    )
+    pd.testing.assert_frame_equal(_sorted(pd.concat(parts)), _sorted(expected))
+    assert load_judge_slices(session, PcsDeviationRankingShardCache, ["a"], {99}) == []
+
+
+def test_judge_slices_need_every_shard_indexed(session):
+    _add_shard(session, "a", _marks(5))
+    _add_shard(session, "legacy", _marks(6), indexed=False)
+    model = PcsDeviationRankingShardCache
+    assert load_judge_slices(session, model, ["a", "legacy"], {1}) is None
+    assert load_judge_slices(session, model, ["a", "missing"], {1}) is None
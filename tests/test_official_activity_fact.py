@@ -0,0 +1,137 @@
+"""Activity tracker fact table: assignment refresh and the reports that read it (SQLite)."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("DATABASE_URL", "sqlite:////tmp/activity_tracker_tests.db")
+
+import activityAnalysis.load_activity_data as lad
+from activityAnalysis.official_activity_fact import (
+    ACTIVITY_SOURCE_ASSIGNMENT,
+    panel_role_sql_predicate,
+    refresh_assignment_facts,
+)
+from activityAnalysis.officials_analysis_models import (
+    AppointmentTypes,
+    Assignment,
+    Base,
+    Competition,
+    CompetitionType,
+    Disciplines,
+    OfficialActivityFact,
+    Officials,
+)
+
+JUDGE, REFEREE = 1, 2
+CHAMPS = 4
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    eng = create_engine(
+        f"sqlite:///{tmp_path / 'activity.db'}",
+        execution_options={"schema_translate_map": {"officials_analysis": None}},
+    )
+    Base.metadata.create_all(eng)
+    with Session(eng) as s:
+        s.add_all([
+            AppointmentTypes(id=JUDGE, name="Competition Judge"),
+            AppointmentTypes(id=REFEREE, name="Referee"),
+            Disciplines(id=2, name="Synchronized"),
+            CompetitionType(id=CHAMPS, name="US Championships"),
+            CompetitionType(id=5, name="Eastern Synchro Sectional"),
+            Officials(id=10, full_name="Ann A", region="Eastern"),
+            Officials(id=11, full_name="Ben B", region="Pacific Coast"),
+            Competition(id=1, name="US Champs", year=2023, competition_type_id=CHAMPS),
+            Competition(id=2, name="US Champs", year=2024, competition_type_id=CHAMPS),
+            Competition(id=3, name="Eastern", year=2024, competition_type_id=5),
+        ])
+        s.flush()
+        s.add_all([
+            Assignment(id=1, competition_id=1, official_id=10, discipline_id=2,
+                       appointment_type_id=JUDGE, chief=False, lower_levels_only=True),
+            Assignment(id=2, competition_id=2, official_id=10, discipline_id=2,
+                       appointment_type_id=JUDGE, chief=True, lower_levels_only=False),
+            Assignment(id=3, competition_id=2, official_id=11, discipline_id=2,
+                       appointment_type_id=REFEREE, chief=False, lower_levels_only=False),
+            Assignment(id=4, competition_id=3, official_id=11, discipline_id=2,
+                       appointment_type_id=JUDGE, chief=False, lower_levels_only=False),
+        ])
+        s.commit()
+        assert refresh_assignment_facts(s) == 4
+        s.commit()
+    monkeypatch.setattr(lad, "engine", eng)
+    yield eng
+    eng.dispose()
+
+
+def _facts(eng):
+    with Session(eng) as s:
+        return s.execute(
+            select(
+                OfficialActivityFact.official_id,
+                OfficialActivityFact.competition_id,
+                OfficialActivityFact.appointment_type_id,
+                OfficialActivityFact.year,
+                OfficialActivityFact.chief,
+            )
+            .where(OfficialActivityFact.source == ACTIVITY_SOURCE_ASSIGNMENT)
+            .order_by(OfficialActivityFact.competition_id, OfficialActivityFact.official_id)
+        ).all()
+
+
+def test_refresh_copies_competition_type_and_year(engine):
+    assert _facts(engine) == [
+        (10, 1, JUDGE, 2023, False),
+        (10, 2, JUDGE, 2024, True),
+        (11, 2, REFEREE, 2024, False),
+        (11, 3, JUDGE, 2024, False),
+    ]
+
+
+def test_incremental_refresh_only_touches_listed_competitions(engine):
+    with Session(engine) as s:
+        s.get(Assignment, 3).chief = True
+        s.delete(s.get(Assignment, 4))
+        s.flush()
+        assert refresh_assignment_facts(s, [2]) == 2
+        s.commit()
+    # Competition 3 keeps its stale row until it is refreshed itself.
+    assert (11, 2, REFEREE, 2024, True) in _facts(engine)
+    assert (11, 3, JUDGE, 2024, False) in _facts(engine)
+    with Session(engine) as s:
+        refresh_assignment_facts(s, [3])
+        s.commit()
+    assert [f[1] for f in _facts(engine)] == [1, 2, 2]
+
+
+def test_activity_helpers_read_the_fact_table(engine):
+    years = lad.get_assignment_years(2, JUDGE, CHAMPS)
+    assert sorted(map(tuple, years.values.tolist())) == [(10, 2023), (10, 2024)]
+    years = lad.get_assignment_years(2, JUDGE, CHAMPS, include_lower_levels=False)
+    assert years.values.tolist() == [[10, 2024]]
+    assert lad.get_chief_years([10, 11], 2, JUDGE, CHAMPS).values.tolist() == [[10, 2024]]
+    lower = lad.get_years_all_lower_level_only_in_role([10], 2, JUDGE, CHAMPS)
+    assert lower.to_dict("records") == [{"official_id": 10, "year": 2023}]
+    other = lad.get_any_role_years([11], [CHAMPS, 5])
+    assert sorted(other["role"]) == ["Competition Judge", "Referee"]
+    counts = lad.get_assigned_competition_counts([CHAMPS])
+    assert counts[["official_id", "competitions_assigned", "most_recent_year"]].values.tolist() == [
+        [10, 2, 2024],
+        [11, 1, 2024],
+    ]
+
+
+def test_panel_role_predicates():
+    assert panel_role_sql_predicate("judge") == "LOWER(BTRIM(so.role)) LIKE 'judge%'"
+    assert lad._nqs_panel_role_sql_predicate_all() == panel_role_sql_predicate("all")
+    with pytest.raises(ValueError):
+        lad._nqs_panel_role_sql_predicate("all")
+    with pytest.raises(ValueError):
+        panel_role_sql_predicate("announcer")
@@ -182,3 +182,36 @@ def test_precompute_shards_passes_fingerprint_to_save():
     assert skipped == 0
     save_row.assert_called_once()
     assert save_row.call_args.kwargs["data_fingerprint"] == "fp-write"
+
+
+def test_pipeline_with_workers_ranks_serially_for_judge_detail():
+    analytics = MagicMock()
+    marks = pd.DataFrame({"judge_name": ["A"]})
+    with (
+        patch("pcs_deviation_cache.ensure_pcs_deviation_cache_tables"),
+        patch("pcs_deviation_cache._rank_shards_in_pool") as pool,
+        patch("pcs_deviation_cache.collect_marks_for_run", return_value=marks) as collect,
+        patch("pcs_deviation_cache._load_sigma_cache_row", return_value={"bucket": 1.0}),
+        patch(
+            "pcs_deviation_cache.finish_pcs_deviation_rankings_from_marks",
+            return_value={"error": None, "judge_component_detail": "detail"},
+        ),
+        patch(
+            "pcs_deviation_cache.apply_min_marks_to_pcs_deviation_result",
+            side_effect=lambda result, _min_marks: result,
+        ),
+    ):
+        from pcs_deviation_cache import run_pcs_deviation_ranking_pipeline
+
+        result = run_pcs_deviation_ranking_pipeline(
+            analytics,
+            competition_scope="all",
+            floor_sigma=0.1,
+            min_bin_count=5,
+            include_judge_detail=True,
+            persist_shards=False,
+            workers=2,
+        )
+    pool.assert_not_called()
+    assert collect.call_args.kwargs["workers"] == 2
+    assert result["judge_component_detail"] == "detail"
@@ -0,0 +1,148 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pdf_render_service import PdfRenderService
+
+
+class _FakePage:
+    def __init__(self, browser, n):
+        self.browser = browser
+        self.n = n
+        self.closed = False
+        self.renders = 0
+
+    async def goto(self, url, options):
+        if "slow" in url:
+            await asyncio.sleep(5)
+        if "boom" in url:
+            raise RuntimeError("navigation failed")
+        self.url = url
+
+    async def pdf(self, options):
+        self.renders += 1
+        return f"%PDF {self.url} b{self.browser.n} p{self.n}".encode()
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self, n, delay=0.0, fail_page=None):
+        self.n = n
+        self.delay = delay
+        self.fail_page = fail_page
+        self.pages = []
+        self.closed = False
+
+    async def newPage(self):
+        if len(self.pages) == self.fail_page:
+            raise RuntimeError("target closed")
+        page = _FakePage(self, len(self.pages))
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        await asyncio.sleep(self.delay)
+        self.closed = True
+
+
+class _Launcher:
+    """``delay`` slows launch and close so jobs can arrive mid-recycle."""
+
+    def __init__(self, delay=0.0, fail_page_in_first=None):
+        self.browsers = []
+        self.delay = delay
+        self.fail_page_in_first = fail_page_in_first
+        self.lock = threading.Lock()
+
+    async def __call__(self):
+        await asyncio.sleep(self.delay)
+        with self.lock:
+            fail_page = None if self.browsers else self.fail_page_in_first
+            browser = _FakeBrowser(len(self.browsers), self.delay, fail_page)
+            self.browsers.append(browser)
+        return browser
+
+
+def test_concurrent_jobs_share_one_browser_and_reuse_tabs():
+    launcher = _Launcher()
+    with PdfRenderService(pool_size=2, recycle_after=1000, launcher=launcher) as svc:
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            out = list(pool.map(svc.render, [f"http://x/{i}" for i in range(20)]))
+    assert len(launcher.browsers) == 1
+    assert [o.split()[1] for o in (b.decode() for b in out)] == [f"http://x/{i}" for i in range(20)]
+    browser = launcher.browsers[0]
+    assert len(browser.pages) == 2
+    assert sum(p.renders for p in browser.pages) == 20
+    assert browser.closed
+
+
+def test_job_timeout_replaces_tab():
+    launcher = _Launcher()
+    with PdfRenderService(pool_size=1, launcher=launcher) as svc:
+        with pytest.raises(TimeoutError):
+            svc.render("http://x/slow", timeout=0.05)
+        assert svc.render("http://x/ok").startswith(b"%PDF http://x/ok")
+    pages = launcher.browsers[0].pages
+    assert pages[0].closed
+    assert len(pages) == 2
+
+
+def test_failed_job_raises_and_service_keeps_working():
+    launcher = _Launcher()
+    with PdfRenderService(pool_size=1, launcher=launcher) as svc:
+        with pytest.raises(RuntimeError):
+            svc.render("http://x/boom")
+        assert svc.render("http://x/ok")
+    assert len(launcher.browsers) == 1
+
+
+def test_browser_recycled_after_n_pages():
+    launcher = _Launcher()
+    with PdfRenderService(pool_size=2, recycle_after=3, launcher=launcher) as svc:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(svc.render, [f"http://x/{i}" for i in range(10)]))
+        assert svc.pages_rendered == 10
+    assert len(launcher.browsers) == 4
+    assert all(b.closed for b in launcher.browsers)
+    assert all(sum(p.renders for p in b.pages) <= 3 for b in launcher.browsers)
+
+
+def test_jobs_arriving_mid_recycle_wait_for_the_relaunch():
+    launcher = _Launcher(delay=0.02)
+    with PdfRenderService(pool_size=1, recycle_after=1, launcher=launcher) as svc:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futs = []
+            for i in range(8):
+                futs.append(pool.submit(svc.render, f"http://x/{i}"))
+                time.sleep(0.007)
+            out = [f.result() for f in futs]
+    assert [o.split()[1] for o in (b.decode() for b in out)] == [f"http://x/{i}" for i in range(8)]
+    # The first launch plus one relaunch per page; none launched by a waiting job.
+    assert len(launcher.browsers) == 9
+    assert all(b.closed for b in launcher.browsers)
+
+
+def test_failed_tab_creation_closes_the_browser_and_relaunches():
+    launcher = _Launcher(fail_page_in_first=2)
+    with PdfRenderService(pool_size=3, launcher=launcher) as svc:
+        with pytest.raises(RuntimeError, match="target closed"):
+            svc.render("http://x/0")
+        # The next job gets a full pool from a fresh browser instead of blocking.
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            out = list(pool.map(svc.render, [f"http://x/{i}" for i in range(6)]))
+    assert len(out) == 6
+    first, second = launcher.browsers
+    assert first.closed and all(p.closed for p in first.pages)
+    assert len(second.pages) == 3 and second.closed
+
+
+def test_browser_starts_lazily():
+    launcher = _Launcher()
+    svc = PdfRenderService(launcher=launcher)
+    svc.close()
+    assert launcher.browsers == []
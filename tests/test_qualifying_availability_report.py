@@ -0,0 +1,156 @@
+"""Qualifying availability report: one bulk appointment load for every criterion."""
+
+import datetime
+import os
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("DATABASE_URL", "sqlite:////tmp/activity_tracker_tests.db")
+
+# Another module may have installed a mock load_activity_data during collection.
+if isinstance(sys.modules.get("activityAnalysis.load_activity_data"), MagicMock):
+    for _name in (
+        "activityAnalysis.load_activity_data",
+        "load_activity_data",
+        "activityAnalysis.qualifying_form_store",
+    ):
+        sys.modules.pop(_name, None)
+
+from activityAnalysis.officials_analysis_models import (
+    AppointmentTypes,
+    Appointments,
+    Base,
+    Disciplines,
+    Levels,
+    Officials,
+    QualifyingAvailabilityCompetition,
+    QualifyingAvailabilityForm,
+    QualifyingCompetitionCriteria,
+    QualifyingOfficialCompetitionAvailability,
+    QualifyingOfficialFormResponse,
+)
+from activityAnalysis.qualifying_form_store import build_qualifying_availability_report
+
+JUDGE, REFEREE, TS = 1, 4, 9
+SINGLES, DANCE, SINGLES_PAIRS = 1, 3, 9
+NATIONAL = 7
+CRITERIA = [(JUDGE, SINGLES_PAIRS, None), (REFEREE, SINGLES_PAIRS, NATIONAL), (TS, DANCE, None)]
+
+
+@pytest.fixture
+def engine(tmp_path):
+    eng = create_engine(
+        f"sqlite:///{tmp_path / 'activity.db'}",
+        execution_options={"schema_translate_map": {"officials_analysis": None}},
+    )
+    Base.metadata.create_all(eng)
+    complete = {"Status": "Complete"}
+    with Session(eng) as s:
+        s.add_all([
+            AppointmentTypes(id=JUDGE, name="Competition Judge"),
+            AppointmentTypes(id=REFEREE, name="Referee"),
+            AppointmentTypes(id=TS, name="Technical Specialist"),
+            Disciplines(id=SINGLES, name="Singles"),
+            Disciplines(id=DANCE, name="Dance"),
+            Disciplines(id=SINGLES_PAIRS, name="Singles/Pairs"),
+            Levels(id=NATIONAL, name="National"),
+            Officials(id=10, full_name="Ann A", mbr_number="100"),
+            Officials(id=11, full_name="Ben B", mbr_number="101"),
+            Officials(id=12, full_name="Cy C", mbr_number="102"),
+            Officials(id=13, full_name="Di D", mbr_number="103"),
+            QualifyingAvailabilityForm(id=1, label="2027 qualifying"),
+        ])
+        s.flush()
+        s.add(QualifyingAvailabilityCompetition(
+            id=1, form_id=1, prompt_key="p1", title="Sectionals", sort_order=1
+        ))
+        s.flush()
+        s.add_all(
+            QualifyingCompetitionCriteria(
+                competition_id=1, appointment_type_id=at, discipline_id=d, level_id=lvl
+            )
+            for at, d, lvl in CRITERIA
+        )
+        s.add_all([
+            # Ann matches two criteria and must appear once.
+            Appointments(id=1, official_id=10, appointment_type_id=JUDGE,
+                         discipline_id=SINGLES, active=True,
+                         appointed_date=datetime.date(2015, 1, 1)),
+            Appointments(id=2, official_id=10, appointment_type_id=REFEREE,
+                         discipline_id=SINGLES_PAIRS, level_id=NATIONAL, active=True),
+            Appointments(id=3, official_id=11, appointment_type_id=TS,
+                         discipline_id=DANCE, active=True),
+            # Wrong level for the referee criterion.
+            Appointments(id=4, official_id=12, appointment_type_id=REFEREE,
+                         discipline_id=SINGLES_PAIRS, active=True),
+            Appointments(id=5, official_id=13, appointment_type_id=JUDGE,
+                         discipline_id=SINGLES_PAIRS, active=False),
+        ])
+        for oid in (10, 11, 12):
+            s.add(QualifyingOfficialFormResponse(
+                form_id=1, official_id=oid, member_number=str(90 + oid), response_json=complete
+            ))
+        s.add_all([
+            QualifyingOfficialCompetitionAvailability(
+                form_id=1, official_id=10, competition_id=1, availability_code="available"
+            ),
+            QualifyingOfficialCompetitionAvailability(
+                form_id=1, official_id=11, competition_id=1, availability_code="not_available"
+            ),
+            QualifyingOfficialCompetitionAvailability(
+                form_id=1, official_id=12, competition_id=1, availability_code="available"
+            ),
+        ])
+        s.commit()
+    yield eng
+    eng.dispose()
+
+
+def test_report_merges_criteria_into_one_row_per_official(engine):
+    df, meta = build_qualifying_availability_report(
+        1,
+        1,
+        criteria_filters=CRITERIA,
+        in_role_appointment_type_id=JUDGE,
+        in_role_discipline_id=SINGLES,
+        include_available=True,
+        include_unavailable=True,
+        engine=engine,
+    )
+    assert meta["criteria_configured"] and meta["show_in_role_columns"]
+    assert df["Name"].tolist() == ["Ann A", "Ben B"]
+    assert df["Status"].tolist() == ["Available", "Unavailable"]
+    assert df.loc[0, "Directory appointments"] == (
+        "Competition Judge (Singles); Referee (Singles/Pairs) — National"
+    )
+    assert df.loc[0, "Appointment year"] == 2015
+    assert df.loc[1, "Directory appointments"] == "Technical Specialist (Dance)"
+
+
+def test_report_query_count_does_not_grow_with_criteria(engine):
+    def run(criteria):
+        statements = []
+
+        def count(*_args, **_kwargs):
+            statements.append(1)
+
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            df, _ = build_qualifying_availability_report(
+                1, 1, criteria_filters=criteria, include_unavailable=True, engine=engine
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+        return df, len(statements)
+
+    one, one_queries = run(CRITERIA[:1])
+    every, every_queries = run(CRITERIA)
+    assert one["official_id"].tolist() == [10]
+    assert every["official_id"].tolist() == [10, 11]
+    assert one_queries == every_queries
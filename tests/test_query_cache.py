@@ -0,0 +1,191 @@
+"""Shared query cache: keys, read-only results, per-table versions, byte budget."""
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("DATABASE_URL", "sqlite:////tmp/activity_tracker_tests.db")
+
+from activityAnalysis.officials_analysis_models import Base, TableVersion
+from activityAnalysis.query_cache import (
+    TABLE_ASSIGNMENT,
+    TABLE_OFFICIALS,
+    QueryCache,
+    bump_table_versions,
+    cached_query,
+    read_table_versions,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _engine(tmp_path, *, with_version_table=True):
+    eng = create_engine(
+        f"sqlite:///{tmp_path / 'activity.db'}",
+        execution_options={"schema_translate_map": {"officials_analysis": None}},
+    )
+    if with_version_table:
+        Base.metadata.create_all(eng, tables=[TableVersion.__table__])
+    return eng
+
+
+def test_normalized_arguments_share_one_entry():
+    cache = QueryCache(budget_bytes=1 << 20, version_reader=lambda: {})
+    calls = []
+
+    @cached_query([TABLE_ASSIGNMENT], cache=cache)
+    def load(ids, discipline_id=None, active_only=True):
+        calls.append(ids)
+        return len(ids)
+
+    assert load([1, 2], 3) == 2
+    assert load((1, 2), discipline_id=np.int64(3)) == 2
+    assert load(ids=[1, 2], discipline_id=3.0, active_only=True) == 2
+    assert load([1, 2], None) == 2
+    assert len(calls) == 2
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 2
+
+
+def test_frames_are_shared_read_only():
+    cache = QueryCache(budget_bytes=1 << 20, version_reader=lambda: {})
+    calls = []
+
+    @cached_query([TABLE_OFFICIALS], cache=cache)
+    def load():
+        calls.append(1)
+        return pd.DataFrame({"official_id": [1, 2], "name": ["A", "B"]}), [2024]
+
+    df, seasons = load()
+    with pytest.raises(ValueError, match="read-only"):
+        df.loc[0, "official_id"] = 9
+    df["extra"] = 1
+    df["name"] = df["name"].str.lower()
+    df.rename(columns={"official_id": "id"}, inplace=True)
+    seasons.append(2025)
+
+    again, seasons_again = load()
+    assert list(again.columns) == ["official_id", "name"]
+    assert again["official_id"].tolist() == [1, 2]
+    assert seasons_again == [2024]
+    assert len(calls) == 1
+
+
+def test_nested_frames_and_lists_are_shared_read_only():
+    cache = QueryCache(budget_bytes=1 << 20, version_reader=lambda: {})
+
+    @cached_query([TABLE_OFFICIALS], cache=cache)
+    def load():
+        frame = pd.DataFrame({"official_id": [1, 2]})
+        return {"panel": frame, "parts": [frame.copy(), {"seasons": [2024]}]}
+
+    first = load()
+    for df in (first["panel"], first["parts"][0]):
+        with pytest.raises(ValueError, match="read-only"):
+            df.loc[0, "official_id"] = 9
+        df.rename(columns={"official_id": "id"}, inplace=True)
+    first["parts"][1]["seasons"].append(2025)
+    first["parts"].append("extra")
+    first["new"] = 1
+
+    again = load()
+    assert set(again) == {"panel", "parts"}
+    assert list(again["panel"].columns) == ["official_id"]
+    assert list(again["parts"][0].columns) == ["official_id"]
+    assert again["parts"][1] == {"seasons": [2024]}
+    assert len(again["parts"]) == 2
+
+
+def test_bump_invalidates_only_dependent_entries(tmp_path):
+    eng = _engine(tmp_path)
+    clock = _Clock()
+    cache = QueryCache(
+        budget_bytes=1 << 20, version_reader=lambda: read_table_versions(eng), clock=clock
+    )
+    calls = {"assignments": 0, "officials": 0}
+
+    @cached_query([TABLE_ASSIGNMENT], cache=cache)
+    def assignments():
+        calls["assignments"] += 1
+        return calls["assignments"]
+
+    @cached_query([TABLE_OFFICIALS], cache=cache)
+    def officials():
+        calls["officials"] += 1
+        return calls["officials"]
+
+    assert (assignments(), officials()) == (1, 1)
+    with Session(eng) as s:
+        assert bump_table_versions(s, [TABLE_ASSIGNMENT])
+        assert bump_table_versions(s, [TABLE_ASSIGNMENT])
+        s.commit()
+    assert read_table_versions(eng) == {TABLE_ASSIGNMENT: 2}
+
+    # Versions are polled; within the poll window the old entry is still served.
+    assert assignments() == 1
+    clock.now += 5
+    assert (assignments(), officials()) == (2, 1)
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_missing_version_table_falls_back_to_ttl(tmp_path):
+    eng = _engine(tmp_path, with_version_table=False)
+    clock = _Clock()
+    cache = QueryCache(
+        budget_bytes=1 << 20,
+        version_reader=lambda: read_table_versions(eng),
+        fallback_ttl_sec=60,
+        clock=clock,
+    )
+    calls = []
+
+    @cached_query([TABLE_OFFICIALS], cache=cache)
+    def load():
+        calls.append(1)
+        return len(calls)
+
+    with Session(eng) as s:
+        assert bump_table_versions(s, [TABLE_OFFICIALS]) is False
+    assert load() == 1
+    clock.now += 30
+    assert load() == 1
+    clock.now += 60
+    assert load() == 2
+    assert cache.stats()["versions_tracked"] is False
+
+
+def test_byte_budget_evicts_least_recently_used():
+    frame_bytes = int(
+        pd.DataFrame({"x": np.arange(1000, dtype="int64")}).memory_usage(deep=True).sum()
+    )
+    cache = QueryCache(budget_bytes=frame_bytes * 4 + 100, version_reader=lambda: {})
+    calls = []
+
+    @cached_query([TABLE_OFFICIALS], cache=cache)
+    def load(n, rows=1000):
+        calls.append(n)
+        return pd.DataFrame({"x": np.arange(rows, dtype="int64")})
+
+    for n in range(5):
+        load(n)
+    load(4)
+    assert cache.stats()["evictions"] == 1
+    load(0)
+    assert calls == [0, 1, 2, 3, 4, 0]
+    assert cache.stats()["bytes"] <= cache.budget_bytes
+
+    load(99, rows=2000)
+    load(99, rows=2000)
+    assert cache.stats()["oversize"] == 2
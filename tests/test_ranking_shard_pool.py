@@ -0,0 +1,86 @@
+"""Ranking shard pool: per-shard work in spawned workers, merged summaries as they arrive."""
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from element_deviation_ranking import (
+    fold_mergeable_judge_summaries,
+    merge_mergeable_judge_summaries,
+)
+from models import DisciplineType
+from ranking_shard_pool import iter_shard_results, resolve_ranking_shard_workers
+
+
+def _count_disciplines_times(session, analytics, shard, shared):
+    """Module-level so spawned workers can import it."""
+    n = session.execute(select(func.count()).select_from(DisciplineType)).scalar_one()
+    assert analytics.session is session
+    return shard * shared["factor"] + n
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+    DisciplineType.__table__.create(engine)
+    with Session(engine) as s:
+        s.add_all([DisciplineType(id=1, name="Singles"), DisciplineType(id=2, name="Pairs")])
+        s.commit()
+        yield s
+    engine.dispose()
+
+
+def test_pool_results_match_serial(session):
+    from analytics import JudgeAnalytics
+
+    analytics = JudgeAnalytics(session)
+    shards = list(range(6))
+    shared = {"factor": 10}
+    serial = list(
+        iter_shard_results(
+            session, analytics, shards, _count_disciplines_times, shared, workers=1
+        )
+    )
+    assert serial == [(s, s * 10 + 2) for s in shards]
+    pooled = iter_shard_results(
+        session, analytics, shards, _count_disciplines_times, shared, workers=2
+    )
+    assert sorted(pooled) == serial
+
+
+def test_resolve_workers(monkeypatch):
+    monkeypatch.delenv("RANKING_SHARD_WORKERS", raising=False)
+    assert resolve_ranking_shard_workers(None) == 1
+    assert resolve_ranking_shard_workers(3) == 3
+    assert resolve_ranking_shard_workers(0) >= 1
+    monkeypatch.setenv("RANKING_SHARD_WORKERS", "4")
+    assert resolve_ranking_shard_workers(None) == 4
+
+
+def test_fold_matches_merge_of_all_parts():
+    def part(names, n, m2):
+        return pd.DataFrame(
+            {
+                "judge_name": names,
+                "n_marks": n,
+                "sum_m2": m2,
+                "sum_error": [0.5] * len(names),
+                "sum_abs_error": [1.0] * len(names),
+                "sum_sigma": [0.25] * len(names),
+                "sum_abs_m": [2.0] * len(names),
+            }
+        )
+
+    parts = [
+        part(["A", "B"], [3, 4], [1.0, 8.0]),
+        part(["B", "C"], [2, 5], [2.0, 0.5]),
+        part([], [], []),
+        part(["A"], [1], [4.0]),
+    ]
+    total = None
+    for p in parts:
+        total = fold_mergeable_judge_summaries(total, p)
+    folded = merge_mergeable_judge_summaries([total])
+    expected = merge_mergeable_judge_summaries(parts)
+    pd.testing.assert_frame_equal(folded, expected)
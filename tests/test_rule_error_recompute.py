@@ -0,0 +1,146 @@
+"""DB-native rule-error recomputation matches the protocol detectors on stored marks."""
+
+import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from judgingParsing import detect_element_rule_errors
+from models import (
+    Competition,
+    Element,
+    ElementScorePerJudge,
+    PcsScorePerJudge,
+    Segment,
+    SkaterSegment,
+)
+from pcs_fall_rule_errors import detect_pcs_fall_rule_errors
+from rule_error_recompute import recompute_segment_rule_errors
+
+_TABLES = (Competition, Segment, SkaterSegment, Element, ElementScorePerJudge, PcsScorePerJudge)
+SEGMENT = "Junior_Women_Short_Program"
+# Skater → [(element, notes, GOE per judge)]; PCS marks per judge.
+ELEMENTS = {
+    "A": [("3Lz<", None, [3, 4]), ("2A", "F", [-3, -2]), ("3F+COMBO", None, [-5, 1])],
+    "B": [("3T", "Fx", [-5, -5]), ("CCoSp4", None, [5, 4])],
+}
+PCS = {"A": [9.5, 9.75], "B": [8.75, 9.0]}
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'scores.db'}")
+    for model in _TABLES:
+        model.__table__.create(engine)
+    with Session(engine) as s:
+        s.add_all([
+            Competition(id=1, name="Now", year="2526", results_url="a",
+                        start_date=datetime.date(2025, 9, 1)),
+            Competition(id=2, name="Legacy", year="1718", results_url="b",
+                        start_date=datetime.date(2017, 9, 1)),
+            Competition(id=3, name="Loaded early", year="2526", results_url="c",
+                        start_date=datetime.date(2025, 9, 1)),
+        ])
+        # Segment 1: current season; 2: pre-2018; 3: loaded before notes were stored.
+        ids = {"elem": 0, "mark": 0}
+        for seg_id in (1, 2, 3):
+            s.add(Segment(id=seg_id, name=SEGMENT, competition_id=seg_id, discipline_type_id=1))
+            for n, skater in enumerate(ELEMENTS, start=1):
+                ss_id = seg_id * 10 + n
+                s.add(SkaterSegment(id=ss_id, skater_id=n, segment_id=seg_id))
+                for name, notes, goes in ELEMENTS[skater]:
+                    ids["elem"] += 1
+                    s.add(Element(id=ids["elem"], skater_segment_id=ss_id, name=name,
+                                  element_type="x", notes=notes if seg_id != 3 else None,
+                                  max_goe_allowed=Decimal(-3) if seg_id != 3 else None))
+                    for judge_id, goe in enumerate(goes, start=1):
+                        ids["mark"] += 1
+                        s.add(ElementScorePerJudge(
+                            id=ids["mark"], element_id=ids["elem"], judge_id=judge_id,
+                            judge_score=goe, panel_average=0, deviation=0, thrown_out=False,
+                            is_rule_error=seg_id != 1,
+                        ))
+                for judge_id, score in enumerate(PCS[skater], start=1):
+                    ids["mark"] += 1
+                    s.add(PcsScorePerJudge(
+                        id=ids["mark"], skater_segment_id=ss_id, pcs_type_id=1,
+                        judge_id=judge_id, judge_score=score, panel_average=score,
+                        deviation=0, thrown_out=False, is_rule_error=seg_id != 1,
+                    ))
+        s.commit()
+        yield s
+    engine.dispose()
+
+
+def _protocol_expectations():
+    judges = ["J1", "J2"]
+    elements_per_skater = {
+        skater: [{"Element": name, "Notes": notes, "Scores": goes} for name, notes, goes in rows]
+        for skater, rows in ELEMENTS.items()
+    }
+    pcs_per_skater = {
+        skater: [{"Component": "Composition", "Scores": scores}] for skater, scores in PCS.items()
+    }
+    element_errors = detect_element_rule_errors(
+        elements_per_skater, judges, SEGMENT, competition_start_date=datetime.date(2025, 9, 1)
+    )
+    pcs_errors = detect_pcs_fall_rule_errors(
+        elements_per_skater, pcs_per_skater, judges, SEGMENT, competition_year="2526"
+    )
+    return (
+        {(e["Skater"], e["Element"], e["Judge Number"]) for e in element_errors},
+        {(e["Skater"], e["Judge Number"]) for e in pcs_errors},
+    )
+
+
+def _flagged(session, segment_id):
+    skater_by_ss = {segment_id * 10 + n: skater for n, skater in enumerate(ELEMENTS, start=1)}
+    elems = {
+        (skater_by_ss[e.skater_segment_id], e.name, m.judge_id)
+        for m, e in session.query(ElementScorePerJudge, Element)
+        .join(Element, Element.id == ElementScorePerJudge.element_id)
+        .filter(Element.skater_segment_id.in_(skater_by_ss), ElementScorePerJudge.is_rule_error)
+    }
+    pcs = {
+        (skater_by_ss[p.skater_segment_id], p.judge_id)
+        for p in session.query(PcsScorePerJudge).filter(
+            PcsScorePerJudge.skater_segment_id.in_(skater_by_ss), PcsScorePerJudge.is_rule_error
+        )
+    }
+    return elems, pcs
+
+
+def test_recompute_matches_protocol_detection(session):
+    expected_elements, expected_pcs = _protocol_expectations()
+    assert expected_elements and expected_pcs
+
+    dry = recompute_segment_rule_errors(session, [1, 2, 3], dry_run=True)
+    assert _flagged(session, 1) == (set(), set())
+
+    counts = recompute_segment_rule_errors(session, [1, 2, 3])
+    session.commit()
+    assert counts == dry
+    assert _flagged(session, 1) == (expected_elements, expected_pcs)
+    # Pre-2018-19 flags are cleared; the segment without stored notes is left alone.
+    assert _flagged(session, 2) == (set(), set())
+    assert len(_flagged(session, 3)[0]) == 10
+    assert counts["skipped_no_metadata"] == 1 and counts["segments"] == 2
+    assert counts["element_flags_set"] == len(expected_elements)
+    assert counts["element_flags_cleared"] == 10
+
+
+def test_second_pass_writes_nothing(session):
+    recompute_segment_rule_errors(session, [1, 2, 3])
+    session.commit()
+    statements = []
+
+    def count(_conn, _cursor, statement, *_args):
+        statements.append(statement.split()[0].upper())
+
+    event.listen(session.get_bind(), "before_cursor_execute", count)
+    counts = recompute_segment_rule_errors(session, [1, 2, 3])
+    event.remove(session.get_bind(), "before_cursor_execute", count)
+    assert counts["element_flags_set"] == counts["pcs_flags_cleared"] == 0
+    assert "UPDATE" not in statements
@@ -0,0 +1,129 @@
+"""Shared scrape session: retries with backoff, conditional GETs, adaptive host limits."""
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from scrape_http import HostLimiter, scrape_http_session
+
+
+class _ScriptedAdapter(BaseAdapter):
+    """Replays ``(status, headers, body)`` tuples or exceptions; records request headers."""
+
+    def __init__(self, script):
+        super().__init__()
+        self.script = list(script)
+        self.sent = []
+
+    def send(self, request, **_kwargs):
+        self.sent.append(dict(request.headers))
+        step = self.script.pop(0)
+        if isinstance(step, Exception):
+            raise step
+        status, headers, body = step
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response._content = body
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def _session(script, **kwargs):
+    sleeps = []
+    # Fake time only advances through the session's sleeps.
+    session = scrape_http_session(sleep=sleeps.append, clock=lambda: sum(sleeps), **kwargs)
+    adapter = _ScriptedAdapter(script)
+    session.mount("https://", adapter)
+    return session, adapter, sleeps
+
+
+def test_retries_throttling_and_connection_errors():
+    session, adapter, sleeps = _session(
+        [
+            requests.ConnectionError("reset"),
+            (429, {"Retry-After": "3"}, b""),
+            (503, {}, b""),
+            (200, {}, b"ok"),
+        ],
+        backoff=0.5,
+    )
+    response = session.get("https://ijs.example/index.asp")
+    assert response.status_code == 200 and response.text == "ok"
+    assert len(adapter.sent) == 4
+    # Backoff after the reset and the 503; the 429 pauses the host for Retry-After.
+    assert len(sleeps) == 3
+    assert 0 <= sleeps[0] <= 0.5 and sleeps[1] == 3.0 and 0 <= sleeps[2] <= 2.0
+
+
+def test_long_retry_after_returns_the_response_without_pausing_the_host():
+    session, adapter, sleeps = _session(
+        [(429, {"Retry-After": "7200"}, b""), (503, {"Retry-After": "600"}, b"")],
+        backoff_max=30.0,
+    )
+    assert session.get("https://ijs.example/a").status_code == 429
+    assert session.get("https://ijs.example/b").status_code == 503
+    assert sleeps == [] and adapter.script == []
+
+
+def test_gives_up_after_retry_budget():
+    session, adapter, _ = _session([(502, {}, b"")] * 2, retries=1)
+    assert session.get("https://ijs.example/a").status_code == 502
+    session, adapter, _ = _session([requests.Timeout()] * 2, retries=1)
+    with pytest.raises(requests.Timeout):
+        session.get("https://ijs.example/a")
+    assert adapter.script == []
+
+
+def test_not_modified_reuses_cached_response():
+    session, adapter, _ = _session(
+        [(200, {"ETag": '"v1"'}, b"page"), (304, {}, b""), (200, {}, b"fresh")]
+    )
+    first = session.get("https://ijs.example/index.asp")
+    again = session.get("https://ijs.example/index.asp")
+    assert again is first and again.text == "page"
+    assert adapter.sent[1]["If-None-Match"] == '"v1"'
+    assert session.get("https://ijs.example/other.asp").text == "fresh"
+    assert "If-None-Match" not in adapter.sent[2]
+
+
+def test_conditional_cache_is_keyed_on_query_string():
+    session, adapter, _ = _session(
+        [(200, {"ETag": '"p1"'}, b"page 1"), (200, {"ETag": '"p2"'}, b"page 2"), (304, {}, b"")]
+    )
+    assert session.get("https://isu.example/events", params={"page": 1}).text == "page 1"
+    assert session.get("https://isu.example/events", params={"page": 2}).text == "page 2"
+    assert "If-None-Match" not in adapter.sent[1]
+    assert session.get("https://isu.example/events?page=1").text == "page 1"
+    assert adapter.sent[2]["If-None-Match"] == '"p1"'
+
+
+def test_host_limiter_grows_when_fast_and_halves_on_errors():
+    limiter = HostLimiter(initial=2, maximum=4, target_latency=1.0, sleep=lambda _s: None)
+    for _ in range(20):
+        limiter.acquire()
+        limiter.release(latency=0.1, ok=True)
+    assert limiter.limit == 4
+    limiter.acquire()
+    limiter.release(latency=None, ok=False)
+    assert limiter.limit == 2
+    limiter.acquire()
+    limiter.release(latency=5.0, ok=True)
+    assert limiter.limit == 1.5
+
+
+def test_host_limiter_spaces_request_starts():
+    now = [10.0]
+    sleeps = []
+    limiter = HostLimiter(min_interval=0.5, sleep=sleeps.append, clock=lambda: now[0])
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(latency=0.1, ok=True)
+    assert sleeps == [0.5, 1.0]
+    limiter.pause(4.0)
+    limiter.acquire()
+    assert sleeps[-1] == 4.0
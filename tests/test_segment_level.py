@@ -321,3 +321,59 @@ def test_excel_levels_do_not_match_plain_tokens():
     assert _level_from_segment_tokens(normalize_segment_name("Junior_Free")) == LEVEL_JUNIOR
     assert _level_from_segment_tokens(normalize_segment_name("Excel_Senior_Free")) == "Excel Senior"
     assert _level_from_segment_tokens(normalize_segment_name("Senior_Men_Free")) == LEVEL_SENIOR
+
+
+def test_combined_token_matcher_prefers_rule_order_over_position():
+    from segment_level import _level_from_segment_tokens
+
+    assert _level_from_segment_tokens("NOVICE_GIRLS_INTERMEDIATE_NOVICE") == "Intermediate Novice"
+    assert _level_from_segment_tokens("JUNIOR_GIRLS_EXCEL_JUNIOR") == "Excel Junior"
+    assert _level_from_segment_tokens("SENIOR_MASTERS_FREE") == "Masters"
+
+
+def test_classify_frame_matches_rows_and_updates_changed_levels(tmp_path):
+    import pandas as pd
+    from sqlalchemy import create_engine, select
+    from sqlalchemy.orm import Session
+
+    from models import Competition, Segment
+    from segment_level import classify_segment_levels_frame, update_segment_levels
+
+    rows = [
+        (1, "Junior_Men_Short_Program", "Club Open", False, None),
+        (2, "Men_Short_Program", "ISU Grand Prix", True, 1),
+        (3, "Bronze_Solo_Pattern_Dance", "", False, 4),
+        (4, "Men_Short_Program", "Junior Grand Prix", True, 1),
+    ]
+    engine = create_engine(f"sqlite:///{tmp_path / 'levels.db'}")
+    Competition.__table__.create(engine)
+    Segment.__table__.create(engine)
+    with Session(engine) as s:
+        for seg_id, name, comp, intl, _ in rows:
+            s.add(Competition(id=seg_id, name=comp, year="2526", results_url=str(seg_id),
+                              international=intl))
+            s.add(Segment(id=seg_id, name=name, competition_id=seg_id, level=LEVEL_JUNIOR,
+                          level_source=SOURCE_SEGMENT_TOKEN))
+        s.commit()
+
+        frame = classify_segment_levels_frame(pd.DataFrame(
+            rows,
+            columns=["segment_id", "segment_name", "competition_name", "international",
+                     "discipline_type_id"],
+        ))
+        expected = [
+            classify_segment_level(name, competition_name=comp, international=intl,
+                                   discipline_type_id=disc)
+            for _, name, comp, intl, disc in rows
+        ]
+        assert frame["level"].tolist() == [r.level for r in expected]
+        assert frame["level_source"].tolist() == [r.source for r in expected]
+
+        # Segment 1 already stores Junior / segment_token.
+        assert update_segment_levels(s, frame, chunk_size=1) == 3
+        s.commit()
+        stored = s.execute(select(Segment.id, Segment.level, Segment.level_source)
+                           .order_by(Segment.id)).all()
+        assert [(lvl, src) for _, lvl, src in stored] == [(r.level, r.source) for r in expected]
+        assert update_segment_levels(s, frame) == 0
+    engine.dispose()
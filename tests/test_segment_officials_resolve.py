@@ -0,0 +1,185 @@
+"""Segment officials: names resolve once per loader; one delete and one upsert per write."""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import Session
+
+from database_loader import DatabaseLoader
+from models import SegmentOfficial
+
+
+class _FakeSession:
+    def execute(self, *_args, **_kwargs):
+        raise AssertionError("roster lookups are stubbed")
+
+
+def _loader(monkeypatch, calls):
+    loader = DatabaseLoader(_FakeSession())
+
+    def lookup(step, found):
+        def run(keys):
+            calls.append((step, sorted(keys)))
+            return {k: v for k, v in found.items() if k in keys}
+        return run
+
+    for attr, found in {
+        "_official_ids_by_judge_id": {1: 100},
+        "_official_ids_by_name_alias": {"bea black": 200},
+        "_official_ids_by_exact_directory_name": {"bea black": 999, "cy cole": 300},
+        "_isu_official_ids_by_judge_id": {4: 400},
+        "_isu_official_ids_by_name_alias": {},
+        "_isu_official_ids_by_exact_name": {"dee dunn": 500, "cy cole": 998},
+    }.items():
+        monkeypatch.setattr(loader, attr, lookup(attr, found))
+    monkeypatch.setattr(loader, "_official_directory_matcher", lambda: None)
+    monkeypatch.setattr(loader, "_isu_official_matcher", lambda: None)
+    monkeypatch.setattr(loader, "_isu_official_schema_ready", lambda: True)
+    return loader
+
+
+def test_resolution_order_and_batching(monkeypatch):
+    calls = []
+    loader = _loader(monkeypatch, calls)
+    names = ["Al Adams", "Bea Black", "Cy Cole", "Ed Eng", "Dee Dunn", "Bea Black"]
+    loader._resolve_official_ids(names, [1, 2, 3, 4, 5, 2])
+
+    assert loader._official_ids_by_name == {
+        "Al Adams": (100, None),
+        "Bea Black": (200, None),
+        "Cy Cole": (300, None),
+        "Ed Eng": (None, 400),
+        "Dee Dunn": (None, 500),
+    }
+    # Each step only sees names the earlier steps left unmatched.
+    assert calls == [
+        ("_official_ids_by_judge_id", [1, 2, 3, 4, 5]),
+        ("_official_ids_by_name_alias", ["bea black", "cy cole", "dee dunn", "ed eng"]),
+        ("_official_ids_by_exact_directory_name", ["cy cole", "dee dunn", "ed eng"]),
+        ("_isu_official_ids_by_judge_id", [4, 5]),
+        ("_isu_official_ids_by_name_alias", ["dee dunn"]),
+        ("_isu_official_ids_by_exact_name", ["dee dunn"]),
+    ]
+
+
+def test_names_resolve_once_per_loader(monkeypatch):
+    calls = []
+    loader = _loader(monkeypatch, calls)
+    loader._resolve_official_ids(["Al Adams"], [1])
+    n_calls = len(calls)
+    loader._resolve_official_ids(["Al Adams"], [1])
+    assert len(calls) == n_calls
+
+
+@pytest.fixture
+def db_loader(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'officials.db'}")
+    SegmentOfficial.__table__.create(engine)
+    with Session(engine) as s:
+        # No (competition_id, name) unique here, to cover duplicate names in older data.
+        s.execute(text(
+            "CREATE TABLE segment (id INTEGER PRIMARY KEY, name TEXT, competition_id INTEGER)"
+        ))
+        s.execute(text(
+            "INSERT INTO segment VALUES "
+            "(1, 'Free', 1), (3, 'Short', 1), (2, 'Short', 1), (4, 'Pattern', 1)"
+        ))
+        s.commit()
+        loader = DatabaseLoader(s)
+        monkeypatch.setattr(
+            loader, "_ensure_judges_by_name", lambda names: {n: i for i, n in enumerate(names)}
+        )
+
+        def resolve(names, _judge_ids):
+            # ``official_id`` = name length, so written rows are easy to check.
+            for n in names:
+                loader._official_ids_by_name.setdefault(n, (len(n), None))
+
+        monkeypatch.setattr(loader, "_resolve_official_ids", resolve)
+        upserts = []
+        monkeypatch.setattr(
+            loader,
+            "_pg_bulk_upsert",
+            lambda table, rows, constraint, **kw: upserts.append((table, rows, constraint)),
+        )
+        loader.upserts = upserts
+        yield loader
+    engine.dispose()
+
+
+def _add_official(session, seg_id, role, name):
+    session.add(SegmentOfficial(
+        segment_id=seg_id, role=role, official_name=name,
+        created_at=datetime.now(timezone.utc),
+    ))
+    session.commit()
+
+
+def test_replace_deletes_only_given_segments_then_upserts_once(db_loader):
+    session = db_loader.session
+    _add_official(session, 1, "Judge 1", "Old One")
+    _add_official(session, 2, "Judge 1", "Old Two")
+    written = db_loader.replace_competition_segment_officials({
+        1: [{"name": "Al Adams", "role": "Judge 1"}, {"name": "Bea Black", "role": "Referee"}],
+        3: [],
+    })
+    assert written == 2
+    remaining = session.execute(select(SegmentOfficial.segment_id)).scalars().all()
+    assert remaining == [2]
+    assert len(db_loader.upserts) == 1
+    table, rows, constraint = db_loader.upserts[0]
+    assert table is SegmentOfficial and constraint == "segment_official_segment_role_uniq"
+    assert [(r["segment_id"], r["role"], r["official_name"], r["official_id"]) for r in rows] == [
+        (1, "Judge 1", "Al Adams", 8),
+        (1, "Referee", "Bea Black", 9),
+    ]
+
+
+def test_replace_keeps_last_row_for_repeated_role(db_loader):
+    db_loader.replace_segment_officials(2, [
+        {"name": "Al Adams", "role": "Judge 1"},
+        {"name": "Cy Cole", "role": "Judge 1"},
+    ])
+    (_table, rows, _constraint), = db_loader.upserts
+    assert [(r["role"], r["official_name"]) for r in rows] == [("Judge 1", "Cy Cole")]
+
+
+def test_replace_invalidates_cached_protocol_reads(db_loader, monkeypatch):
+    import database_loader
+
+    bumps = []
+    monkeypatch.setattr(database_loader, "bump_protocol_table_versions", bumps.append)
+    db_loader.replace_segment_officials(2, [{"name": "Al Adams", "role": "Judge 1"}])
+    assert bumps == [db_loader.session]
+
+
+def test_replace_refreshes_activity_facts_for_touched_competitions(db_loader, monkeypatch):
+    import database_loader
+
+    session = db_loader.session
+    session.execute(text("INSERT INTO segment VALUES (5, 'Free', 2), (6, 'Free', 3)"))
+    session.commit()
+    refreshes = []
+    monkeypatch.setattr(
+        database_loader,
+        "refresh_protocol_activity_facts",
+        lambda s, competition_ids: refreshes.append((s, sorted(competition_ids))),
+    )
+    panel = [{"name": "Al Adams", "role": "Judge 1"}]
+    db_loader.replace_competition_segment_officials({1: panel, 2: panel, 5: panel, 6: []})
+    assert refreshes == [(session, [1, 2])]
+
+
+def test_ensure_if_empty_skips_filled_segments_and_prefers_lowest_id(db_loader, monkeypatch):
+    _add_official(db_loader.session, 1, "Judge 1", "Old One")
+    calls = []
+    monkeypatch.setattr(
+        db_loader, "replace_competition_segment_officials", lambda todo: calls.append(todo)
+    )
+    panel = [{"name": "Al Adams", "role": "Judge 1"}]
+    loaded = db_loader.ensure_competition_segment_officials_if_empty(
+        1, {"Free": panel, "Short": panel, "Missing": panel, "Pattern": []}
+    )
+    assert loaded == 1
+    assert calls == [{2: panel}]
@@ -0,0 +1,160 @@
+"""Shard summary cache: batched fingerprints and separately loadable payload parts."""
+
+import pickle
+from datetime import date, datetime, timezone
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import element_ranking_cache
+from analytics import JudgeAnalytics
+from element_deviation_ranking import (
+    ElementRankingShard,
+    compute_element_ranking_data_fingerprint,
+    compute_element_ranking_shard_fingerprints,
+)
+from element_ranking_cache import (
+    SUMMARY_PART_CONTROL,
+    SUMMARY_PART_JUDGE,
+    benchmark_sigma_cache_key,
+    load_shard_summary_payloads_for_scope,
+    shard_cache_key,
+    shard_summary_cache_key,
+)
+from models import (
+    Competition,
+    DisciplineType,
+    Element,
+    ElementDeviationRankingShardSummaryCache,
+    ElementScorePerJudge,
+    PcsScorePerJudge,
+    Segment,
+    SkaterSegment,
+)
+from pcs_deviation_analysis import (
+    compute_pcs_deviation_data_fingerprint,
+    compute_pcs_deviation_shard_fingerprints,
+)
+
+_TABLES = (
+    Competition,
+    DisciplineType,
+    Segment,
+    SkaterSegment,
+    Element,
+    ElementScorePerJudge,
+    PcsScorePerJudge,
+    ElementDeviationRankingShardSummaryCache,
+)
+_RUN_PARAMS = ("2324", "2425", None, "all", None, None, 0, 0.1, 5)
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'scores.db'}")
+    for model in _TABLES:
+        model.__table__.create(engine)
+    with Session(engine) as s:
+        s.add_all([
+            DisciplineType(id=1, name="Singles"),
+            DisciplineType(id=2, name="Pairs"),
+            Competition(id=1, name="A", year="2324", results_url="a",
+                        start_date=date(2023, 10, 1)),
+            Competition(id=2, name="B", year="2425", results_url="b",
+                        start_date=date(2024, 10, 1)),
+        ])
+        score_id = 0
+        for seg_id, (comp_id, disc) in enumerate([(1, 1), (1, 2), (2, 1)], start=1):
+            s.add(Segment(id=seg_id, name=f"S{seg_id}", competition_id=comp_id,
+                          discipline_type_id=disc))
+            s.add(SkaterSegment(id=seg_id, skater_id=seg_id, segment_id=seg_id))
+            s.add(Element(id=seg_id, skater_segment_id=seg_id, name="3T",
+                          element_type="jump"))
+            for judge_id in range(1, seg_id + 2):
+                score_id += 1
+                s.add(ElementScorePerJudge(
+                    id=score_id, element_id=seg_id, judge_id=judge_id, judge_score=1,
+                    panel_average=1, deviation=0, thrown_out=False,
+                ))
+                s.add(PcsScorePerJudge(
+                    id=score_id, skater_segment_id=seg_id, pcs_type_id=1,
+                    judge_id=judge_id, judge_score=5, panel_average=5, deviation=0,
+                    thrown_out=False,
+                ))
+        s.commit()
+        yield s
+    engine.dispose()
+
+
+def test_batched_fingerprints_match_per_shard(session):
+    analytics = JudgeAnalytics(session)
+    years, discs = ["2324", "2425", "2526"], [1, 2]
+    elem = compute_element_ranking_shard_fingerprints(
+        session, analytics, season_years=years, discipline_type_ids=discs
+    )
+    pcs = compute_pcs_deviation_shard_fingerprints(
+        session, analytics, season_years=years, discipline_type_ids=discs
+    )
+    assert set(elem) == set(pcs) == {(y, d) for y in years for d in discs}
+    for year, dt_id in elem:
+        scope = {
+            "start_season_year": year,
+            "end_season_year": year,
+            "discipline_type_ids": [dt_id],
+        }
+        assert elem[(year, dt_id)] == compute_element_ranking_data_fingerprint(
+            session, analytics, **scope
+        )
+        assert pcs[(year, dt_id)] == compute_pcs_deviation_data_fingerprint(
+            session, analytics, **scope
+        )
+    assert elem[("2324", 1)] != elem[("2425", 1)]
+
+
+def test_summary_parts_load_separately(session, monkeypatch):
+    shards = [
+        ElementRankingShard(season_year=y, discipline_type_id=1, competition_scope="all")
+        for y in ("2324", "2425")
+    ]
+    monkeypatch.setattr(
+        element_ranking_cache, "iter_element_ranking_shards", lambda *a, **k: shards
+    )
+    sigma_key = benchmark_sigma_cache_key(_RUN_PARAMS)
+    judge = pd.DataFrame({"judge_name": ["J"], "n_marks": [3]})
+    control = pd.DataFrame({"element_id": [1], "control_score": [1.0]})
+    for i, shard in enumerate(shards):
+        session.add(ElementDeviationRankingShardSummaryCache(
+            cache_key=shard_summary_cache_key(shard_cache_key(shard), sigma_key, 0.1),
+            shard_key=shard_cache_key(shard),
+            sigma_key=sigma_key,
+            floor_sigma=0.1,
+            data_fingerprint="stale" if i else "",
+            summary_payload=pickle.dumps({SUMMARY_PART_JUDGE: judge}),
+            control_payload=pickle.dumps(control) if i else None,
+            computed_at=datetime.now(timezone.utc),
+        ))
+    session.commit()
+    analytics = JudgeAnalytics(session)
+
+    loaded = load_shard_summary_payloads_for_scope(
+        session, analytics, _RUN_PARAMS, parts=(SUMMARY_PART_JUDGE,)
+    )
+    assert [set(p) for _, p in loaded] == [{SUMMARY_PART_JUDGE}] * 2
+    pd.testing.assert_frame_equal(loaded[0][1][SUMMARY_PART_JUDGE], judge)
+
+    # The first row predates the control column: incomplete for a full load.
+    assert load_shard_summary_payloads_for_scope(
+        session, analytics, _RUN_PARAMS, parts=(SUMMARY_PART_CONTROL,)
+    ) is None
+    partial = load_shard_summary_payloads_for_scope(
+        session, analytics, _RUN_PARAMS, parts=(SUMMARY_PART_CONTROL,), require_all=False
+    )
+    assert [s for s, _ in partial] == shards[1:]
+
+    # Stored fingerprints do not match the marks: validation drops every row.
+    assert load_shard_summary_payloads_for_scope(
+        session, analytics, _RUN_PARAMS, validate_fingerprint=True, require_all=False,
+        parts=(SUMMARY_PART_JUDGE,),
+    ) == []
@@ -1,5 +1,7 @@
 from database_loader import (
+    CompetitionScoreMaps,
     _resolve_skater_dict_key,
+    _skater_match_key_index,
     _skater_names_equivalent,
 )
 
@@ -16,3 +18,31 @@ def test_resolve_skater_dict_key():
     skater_dict = {"Rory BEIRNE": 42, "Alex Smith": 7}
     assert _resolve_skater_dict_key(skater_dict, "Rory Beirne") == "Rory BEIRNE"
     assert _resolve_skater_dict_key(skater_dict, "Unknown Skater") is None
+
+
+def test_match_key_index_keeps_first_equivalent_name():
+    skater_dict = {"SMITH Alex": 1, "Alex Smith": 2, "Rory Beirne": 3}
+    keys = _skater_match_key_index(skater_dict)
+    assert _resolve_skater_dict_key(skater_dict, "alex-smith", keys) == "SMITH Alex"
+    assert _resolve_skater_dict_key(skater_dict, "Alex Smith", keys) == "Alex Smith"
+    assert _resolve_skater_dict_key(skater_dict, "", keys) is None
+
+
+def test_competition_score_maps_split_rows_by_segment():
+    rows = [
+        (10, "Rory BEIRNE", 42, 100, "3A", 1000),
+        (10, "Rory BEIRNE", 42, 100, "3Lz", 1001),
+        (11, "Rory BEIRNE", 42, 200, "3A", 2000),
+        (11, "Alex Smith", 7, 201, "2A", 2001),
+    ]
+    maps = CompetitionScoreMaps(rows)
+    assert sorted(maps) == [10, 11]
+    free = maps[11]
+    assert free.ss_map == {42: 200, 7: 201}
+    assert free.elem_id_by_pair == {(200, "3A"): 2000, (201, "2A"): 2001}
+    assert _resolve_skater_dict_key(free.skater_dict, "Smith Alex", free.skater_keys) == (
+        "Alex Smith"
+    )
+    assert maps.get(10).elem_id_by_pair[(100, "3Lz")] == 1001
+    assert maps.get(12) is None
+    assert maps[11] is free